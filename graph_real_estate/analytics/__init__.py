@@ -0,0 +1,15 @@
+"""Graph analytics jobs that materialize derived scores on nodes"""
+
+from graph_real_estate.analytics.centrality import (
+    GraphCentralityJob,
+    CentralityResult,
+    centrality_score,
+    GRAPH_METRICS_QUERY,
+)
+
+__all__ = [
+    "GraphCentralityJob",
+    "CentralityResult",
+    "centrality_score",
+    "GRAPH_METRICS_QUERY",
+]
@@ -0,0 +1,298 @@
+"""Materialized graph centrality scores for properties
+
+Hybrid search boosts properties that are well connected in the graph. The
+connection counts come from multi-hop expansions (shared neighborhood,
+shared features, NEAR_BY) that are expensive for popular neighborhoods and
+features, so this job computes them once and stores them on the Property
+node together with the combined centrality_score:
+
+    p.neighborhood_connections, p.feature_connections, p.feature_count,
+    p.proximity_connections, p.centrality_score, p.centrality_updated_at
+
+A full run scores every property. refresh() rescores only what a change can
+affect: the changed properties, every property in the neighborhoods and
+features they touch, and their NEAR_BY neighbours.
+
+A full run also stores the graph revision it scored on the (:GraphMetadata)
+node as centrality_revision. Every graph write (squack_pipeline_v2's Neo4j
+writer, the relationship builder) bumps the revision, so compute_if_stale()
+recomputes the scores only when the graph changed since the last full run.
+"""
+
+import logging
+import time
+from typing import List, Dict, Any, Optional, Iterable, Set, Tuple
+from pydantic import BaseModel, Field
+
+from graph_real_estate.core.query_executor import QueryExecutor
+
+
+# Connection counts for a batch of properties. Each expansion is aggregated
+# before the next one starts, so the OPTIONAL MATCHes do not multiply.
+GRAPH_METRICS_QUERY = """
+UNWIND $listing_ids AS listing_id
+MATCH (p:Property {listing_id: listing_id})
+OPTIONAL MATCH (p)-[:IN_NEIGHBORHOOD]->(:Neighborhood)<-[:IN_NEIGHBORHOOD]-(neighbor:Property)
+WITH listing_id, p, COUNT(DISTINCT neighbor) as neighborhood_connections
+OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f:Feature)<-[:HAS_FEATURE]-(featured:Property)
+WITH listing_id, p, neighborhood_connections,
+     COUNT(DISTINCT featured) as feature_connections,
+     COUNT(DISTINCT f) as feature_count
+OPTIONAL MATCH (p)-[:NEAR_BY]-(nearby:Property)
+RETURN listing_id,
+       neighborhood_connections,
+       feature_connections,
+       feature_count,
+       COUNT(DISTINCT nearby) as proximity_connections
+"""
+
+# Graph revision, and the revision the stored scores were computed on
+CENTRALITY_REVISION_QUERY = """
+OPTIONAL MATCH (m:GraphMetadata {key: 'graph'})
+RETURN m.revision as revision, m.centrality_revision as centrality_revision
+"""
+
+MARK_CENTRALITY_REVISION_QUERY = """
+MATCH (m:GraphMetadata {key: 'graph'})
+SET m.centrality_revision = $revision
+"""
+
+METRIC_FIELDS = (
+    'neighborhood_connections',
+    'feature_connections',
+    'feature_count',
+    'proximity_connections'
+)
+
+
+def centrality_score(metrics: Dict[str, Any]) -> float:
+    """
+    Combined centrality score from connection counts
+
+    Args:
+        metrics: Row with the METRIC_FIELDS counts
+
+    Returns:
+        Score between 0 and 1
+    """
+    neighborhood_score = min(metrics['neighborhood_connections'] / 50, 1.0)
+    feature_conn_score = min(metrics['feature_connections'] / 20, 1.0)
+    feature_count_score = min(metrics['feature_count'] / 15, 1.0)
+    proximity_score = min(metrics['proximity_connections'] / 30, 1.0)
+
+    # Weighted combination (redistributed weights after removing similarity)
+    centrality = (
+        neighborhood_score * 0.25 +
+        feature_conn_score * 0.25 +
+        feature_count_score * 0.25 +
+        proximity_score * 0.25
+    )
+    return min(centrality, 1.0)
+
+
+class CentralityResult(BaseModel):
+    """Result of a centrality computation"""
+
+    properties_scored: int = Field(default=0, ge=0, description="Properties written")
+    batches: int = Field(default=0, ge=0, description="Batches processed")
+    execution_time: float = Field(default=0.0, ge=0.0, description="Execution time in seconds")
+    incremental: bool = Field(default=False, description="Whether only affected properties were scored")
+
+
+class GraphCentralityJob:
+    """Compute and store centrality scores on Property nodes"""
+
+    INDEX_NAME = "property_centrality"
+
+    def __init__(self, query_executor: QueryExecutor, batch_size: int = 500):
+        """
+        Initialize centrality job with dependencies
+
+        Args:
+            query_executor: Query executor for database operations
+            batch_size: Properties scored per query
+        """
+        self.query_executor = query_executor
+        self.batch_size = batch_size
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def create_index(self) -> bool:
+        """
+        Create the index on Property.centrality_score
+
+        Returns:
+            True if successful
+        """
+        return self.query_executor.create_index(
+            self.INDEX_NAME,
+            f"CREATE INDEX {self.INDEX_NAME} IF NOT EXISTS FOR (p:Property) ON (p.centrality_score)"
+        )
+
+    def compute_all(self) -> CentralityResult:
+        """
+        Score every property and record the graph revision scored
+
+        Returns:
+            CentralityResult with counts and timing
+        """
+        # Read before scoring: a write during the run leaves the scores stale
+        revision = self._revisions()[0]
+        results = self.query_executor.execute_read(
+            "MATCH (p:Property) RETURN p.listing_id as listing_id"
+        )
+        listing_ids = [r['listing_id'] for r in results if r.get('listing_id')]
+        self.logger.info(f"Computing centrality for {len(listing_ids):,} properties")
+        result = self._score(listing_ids, incremental=False)
+        if revision is not None:
+            self.query_executor.execute_write(MARK_CENTRALITY_REVISION_QUERY, {'revision': revision})
+        return result
+
+    def is_current(self) -> bool:
+        """
+        Whether the stored scores were computed on the current graph revision
+
+        Returns:
+            False when the graph changed since the last full run, or was
+            never versioned
+        """
+        revision, centrality_revision = self._revisions()
+        return revision is not None and revision == centrality_revision
+
+    def compute_if_stale(self) -> Optional[CentralityResult]:
+        """
+        Score every property if the graph changed since the last full run
+
+        Returns:
+            CentralityResult, or None when the scores are current
+        """
+        if self.is_current():
+            self.logger.info("Centrality scores are current, skipping")
+            return None
+        return self.compute_all()
+
+    def _revisions(self) -> Tuple[Optional[str], Optional[str]]:
+        """Current graph revision and the revision the scores were computed on"""
+        rows = self.query_executor.execute_read(CENTRALITY_REVISION_QUERY)
+        if not rows:
+            return None, None
+        return rows[0].get('revision'), rows[0].get('centrality_revision')
+
+    def refresh(
+        self,
+        listing_ids: Optional[Iterable[str]] = None,
+        neighborhood_ids: Optional[Iterable[str]] = None,
+        feature_names: Optional[Iterable[str]] = None
+    ) -> CentralityResult:
+        """
+        Rescore the properties affected by a change
+
+        Pass the properties whose nodes or relationships changed, plus any
+        neighborhoods or features a property was removed from (the graph no
+        longer links them). Properties that were never scored are included.
+        Only the caller knows whether the change set is complete, so a
+        refresh does not mark the scores current.
+
+        Args:
+            listing_ids: Changed properties
+            neighborhood_ids: Neighborhoods whose membership changed
+            feature_names: Features whose property set changed
+
+        Returns:
+            CentralityResult with counts and timing
+        """
+        affected = self.affected_properties(listing_ids or [], neighborhood_ids or [], feature_names or [])
+        self.logger.info(f"Refreshing centrality for {len(affected):,} affected properties")
+        return self._score(sorted(affected), incremental=True)
+
+    def affected_properties(
+        self,
+        listing_ids: Iterable[str],
+        neighborhood_ids: Iterable[str],
+        feature_names: Iterable[str]
+    ) -> Set[str]:
+        """
+        Properties whose connection counts can change with the given changes
+
+        Args:
+            listing_ids: Changed properties
+            neighborhood_ids: Changed neighborhoods
+            feature_names: Changed features
+
+        Returns:
+            Listing ids to rescore
+        """
+        query = """
+        OPTIONAL MATCH (changed:Property)
+        WHERE changed.listing_id IN $listing_ids
+        OPTIONAL MATCH (changed)-[:IN_NEIGHBORHOOD]->(n:Neighborhood)
+        OPTIONAL MATCH (changed)-[:HAS_FEATURE]->(f:Feature)
+        OPTIONAL MATCH (changed)-[:NEAR_BY]-(nearby:Property)
+        WITH collect(DISTINCT n.neighborhood_id) + $neighborhood_ids as neighborhood_ids,
+             collect(DISTINCT f.name) + $feature_names as feature_names,
+             collect(DISTINCT nearby.listing_id) + $listing_ids as direct_ids
+        CALL {
+            WITH neighborhood_ids
+            MATCH (p:Property)-[:IN_NEIGHBORHOOD]->(n:Neighborhood)
+            WHERE n.neighborhood_id IN neighborhood_ids
+            RETURN collect(DISTINCT p.listing_id) as neighborhood_members
+        }
+        CALL {
+            WITH feature_names
+            MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
+            WHERE f.name IN feature_names
+            RETURN collect(DISTINCT p.listing_id) as feature_members
+        }
+        CALL {
+            MATCH (p:Property)
+            WHERE p.centrality_score IS NULL
+            RETURN collect(p.listing_id) as unscored
+        }
+        RETURN direct_ids + neighborhood_members + feature_members + unscored as listing_ids
+        """
+
+        result = self.query_executor.execute_read(query, {
+            'listing_ids': list(listing_ids),
+            'neighborhood_ids': list(neighborhood_ids),
+            'feature_names': list(feature_names)
+        })
+        if not result:
+            return set()
+        return {listing_id for listing_id in result[0]['listing_ids'] if listing_id}
+
+    def _score(self, listing_ids: List[str], incremental: bool) -> CentralityResult:
+        """Read connection counts and write scores batch by batch"""
+        start_time = time.time()
+        result = CentralityResult(incremental=incremental)
+
+        for start in range(0, len(listing_ids), self.batch_size):
+            batch = listing_ids[start:start + self.batch_size]
+            rows = self.query_executor.execute_read(GRAPH_METRICS_QUERY, {'listing_ids': batch})
+            scores = [
+                {
+                    'listing_id': row['listing_id'],
+                    **{field: row[field] for field in METRIC_FIELDS},
+                    'centrality_score': centrality_score(row)
+                }
+                for row in rows
+            ]
+            written = self.query_executor.execute_write("""
+                UNWIND $scores AS score
+                MATCH (p:Property {listing_id: score.listing_id})
+                SET p.neighborhood_connections = score.neighborhood_connections,
+                    p.feature_connections = score.feature_connections,
+                    p.feature_count = score.feature_count,
+                    p.proximity_connections = score.proximity_connections,
+                    p.centrality_score = score.centrality_score,
+                    p.centrality_updated_at = datetime()
+                RETURN count(p) as count
+            """, {'scores': scores})
+
+            result.properties_scored += written[0]['count'] if written else 0
+            result.batches += 1
+
+        result.execution_time = time.time() - start_time
+        self.logger.info(
+            f"Scored {result.properties_scored:,} properties in {result.batches} batches "
+            f"({result.execution_time:.2f}s)"
+        )
+        return result
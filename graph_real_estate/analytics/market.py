@@ -0,0 +1,770 @@
+"""Market-intelligence aggregates on Neo4j or DuckDB
+
+The market-intelligence demos compute price and feature aggregates with Cypher
+that rescans every Property and Feature node several times per query (feature
+premiums match all properties again for each feature, co-occurrence lift
+re-matches both features of every pair). The same facts live in the squack
+pipeline's gold tables, where they are plain GROUP BYs and joins.
+
+Each named query in MARKET_QUERIES has a Cypher form and a DuckDB SQL form that
+return the same columns, so a demo can print results without knowing the
+backend:
+
+    analytics = create_market_analytics('duckdb', driver, settings.market_analytics)
+    rows = analytics.run('feature_premiums')
+
+DuckDBMarketAnalytics reads gold_properties and gold_neighborhoods from the
+pipeline's DuckDB file (attached read-only) or from its gold Parquet export,
+loads them once into in-memory tables and answers every query from those.
+Results are cached per pipeline run: the cache version is the size and
+modification time of the source files, which every pipeline run rewrites.
+
+compare_latency() runs each query uncached on two backends and reports the
+best-of-N wall time side by side.
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+from neo4j import Driver
+from pydantic import BaseModel, Field
+
+from graph_real_estate.config.models import MarketAnalyticsConfig
+from graph_real_estate.queries.query_cache import QueryResultCache
+from graph_real_estate.utils.database import run_query
+
+
+AnalyticsBackend = Literal["neo4j", "duckdb"]
+
+PRICE_SEGMENT_SQL = """
+CASE
+    WHEN {price} > 8000000 THEN 'Ultra-Luxury'
+    WHEN {price} > 3000000 THEN 'Luxury'
+    WHEN {price} > 1500000 THEN 'Premium'
+    WHEN {price} > 800000 THEN 'Mid-Market'
+    ELSE 'Affordable'
+END"""
+
+
+class MarketQuery(BaseModel):
+    """One market-intelligence question answered by both backends"""
+
+    name: str = Field(..., description="Query name used by the demos")
+    description: str = Field(..., description="What the query answers")
+    cypher: str = Field(..., description="Query against the Neo4j graph")
+    sql: str = Field(..., description="Query against the gold tables loaded in DuckDB")
+
+
+MARKET_QUERIES: Dict[str, MarketQuery] = {q.name: q for q in [
+    MarketQuery(
+        name="city_overview",
+        description="Property counts and price range per city",
+        cypher="""
+        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+        WITH n.city as City,
+             count(DISTINCT n) as Neighborhoods,
+             count(p) as Properties,
+             avg(p.listing_price) as AvgPrice,
+             min(p.listing_price) as MinPrice,
+             max(p.listing_price) as MaxPrice,
+             collect(DISTINCT p.property_type) as PropertyTypes
+        RETURN City, Neighborhoods, Properties, AvgPrice, MinPrice, MaxPrice, PropertyTypes
+        ORDER BY Properties DESC
+        """,
+        sql="""
+        SELECT city as City,
+               count(DISTINCT neighborhood_id) as Neighborhoods,
+               count(*) as Properties,
+               avg(listing_price) as AvgPrice,
+               min(listing_price) as MinPrice,
+               max(listing_price) as MaxPrice,
+               coalesce(list(DISTINCT property_type) FILTER (WHERE property_type IS NOT NULL), []) as PropertyTypes
+        FROM located_properties
+        GROUP BY city
+        ORDER BY Properties DESC
+        """
+    ),
+    MarketQuery(
+        name="neighborhood_price_stats",
+        description="Price statistics of the neighborhoods with the most properties",
+        cypher="""
+        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+        WITH n, count(p) as property_count,
+             avg(p.listing_price) as avg_price,
+             min(p.listing_price) as min_price,
+             max(p.listing_price) as max_price
+        RETURN n.name as neighborhood,
+               n.city as city,
+               n.state as state,
+               property_count,
+               avg_price,
+               min_price,
+               max_price
+        ORDER BY property_count DESC
+        LIMIT 10
+        """,
+        sql="""
+        SELECT any_value(neighborhood) as neighborhood,
+               any_value(city) as city,
+               any_value(state) as state,
+               count(*) as property_count,
+               avg(listing_price) as avg_price,
+               min(listing_price) as min_price,
+               max(listing_price) as max_price
+        FROM located_properties
+        GROUP BY neighborhood_id
+        ORDER BY property_count DESC
+        LIMIT 10
+        """
+    ),
+    MarketQuery(
+        name="price_distribution",
+        description="Quartiles of the listing price over all properties",
+        cypher="""
+        MATCH (p:Property)
+        WITH p.listing_price as price
+        RETURN
+            count(*) as total_properties,
+            avg(price) as avg_price,
+            percentileCont(price, 0.25) as q1_price,
+            percentileCont(price, 0.5) as median_price,
+            percentileCont(price, 0.75) as q3_price,
+            min(price) as min_price,
+            max(price) as max_price
+        """,
+        sql="""
+        SELECT count(*) as total_properties,
+               avg(listing_price) as avg_price,
+               quantile_cont(listing_price, 0.25) as q1_price,
+               quantile_cont(listing_price, 0.5) as median_price,
+               quantile_cont(listing_price, 0.75) as q3_price,
+               min(listing_price) as min_price,
+               max(listing_price) as max_price
+        FROM properties
+        """
+    ),
+    MarketQuery(
+        name="neighborhood_segments",
+        description="Neighborhoods by average price with their market segment",
+        cypher="""
+        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+        WITH n,
+             count(p) as PropertyCount,
+             avg(p.listing_price) as AvgPrice,
+             avg(p.square_feet) as AvgSqft,
+             collect(DISTINCT p.property_type) as PropertyTypes
+        WHERE PropertyCount >= 5
+        WITH n, PropertyCount, AvgPrice, AvgSqft, PropertyTypes,
+             CASE
+                WHEN AvgPrice > 8000000 THEN 'Ultra-Luxury'
+                WHEN AvgPrice > 3000000 THEN 'Luxury'
+                WHEN AvgPrice > 1500000 THEN 'Premium'
+                WHEN AvgPrice > 800000 THEN 'Mid-Market'
+                ELSE 'Affordable'
+             END as MarketSegment
+        RETURN n.city as City, n.name as Neighborhood, MarketSegment,
+               PropertyCount, AvgPrice, AvgSqft, PropertyTypes,
+               n.lifestyle_tags as LifestyleTags
+        ORDER BY AvgPrice DESC
+        LIMIT 15
+        """,
+        sql=f"""
+        SELECT any_value(city) as City,
+               any_value(neighborhood) as Neighborhood,
+               {PRICE_SEGMENT_SQL.format(price='avg(listing_price)')} as MarketSegment,
+               count(*) as PropertyCount,
+               avg(listing_price) as AvgPrice,
+               avg(square_feet) as AvgSqft,
+               coalesce(list(DISTINCT property_type) FILTER (WHERE property_type IS NOT NULL), []) as PropertyTypes,
+               any_value(lifestyle_tags) as LifestyleTags
+        FROM located_properties
+        GROUP BY neighborhood_id
+        HAVING count(*) >= 5
+        ORDER BY AvgPrice DESC
+        LIMIT 15
+        """
+    ),
+    MarketQuery(
+        name="feature_premiums",
+        description="Average price with each feature against the price of properties without it",
+        cypher="""
+        MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
+        WITH f.name as Feature, f.category as Category,
+             count(p) as PropertyCount,
+             avg(p.listing_price) as AvgPriceWithFeature
+        WHERE PropertyCount >= 5
+
+        MATCH (p2:Property)
+        WHERE NOT (p2)-[:HAS_FEATURE]->(:Feature {name: Feature})
+        WITH Feature, Category, PropertyCount, AvgPriceWithFeature,
+             avg(p2.listing_price) as BaselinePrice, count(p2) as BaselineCount
+        WHERE BaselineCount >= 10
+
+        WITH *, (AvgPriceWithFeature - BaselinePrice) as PricePremium,
+             (AvgPriceWithFeature - BaselinePrice) / BaselinePrice * 100 as PremiumPercent
+
+        RETURN Feature, Category, PropertyCount,
+               AvgPriceWithFeature, BaselinePrice, PricePremium, PremiumPercent
+        ORDER BY PremiumPercent DESC
+        LIMIT 15
+        """,
+        # The baseline (properties without the feature) is the market total
+        # minus the feature's own sum and count, so nothing is rescanned
+        sql="""
+        WITH market AS (
+            SELECT count(*) as properties,
+                   sum(listing_price) as price_sum,
+                   count(listing_price) as priced
+            FROM properties
+        ),
+        with_feature AS (
+            SELECT f.feature,
+                   any_value(f.category) as category,
+                   count(*) as properties,
+                   sum(p.listing_price) as price_sum,
+                   count(p.listing_price) as priced
+            FROM property_features f
+            JOIN properties p USING (listing_id)
+            GROUP BY f.feature
+            HAVING count(*) >= 5
+        ),
+        premiums AS (
+            SELECT w.feature as Feature,
+                   w.category as Category,
+                   w.properties as PropertyCount,
+                   w.price_sum / nullif(w.priced, 0) as AvgPriceWithFeature,
+                   (m.price_sum - w.price_sum) / nullif(m.priced - w.priced, 0) as BaselinePrice
+            FROM with_feature w, market m
+            WHERE m.properties - w.properties >= 10
+        )
+        SELECT *,
+               AvgPriceWithFeature - BaselinePrice as PricePremium,
+               (AvgPriceWithFeature - BaselinePrice) / BaselinePrice * 100 as PremiumPercent
+        FROM premiums
+        ORDER BY PremiumPercent DESC NULLS LAST
+        LIMIT 15
+        """
+    ),
+    MarketQuery(
+        name="feature_cooccurrence",
+        description="Feature pairs that occur together more often than chance (lift > 1.5)",
+        cypher="""
+        MATCH (f1:Feature)<-[:HAS_FEATURE]-(p:Property)-[:HAS_FEATURE]->(f2:Feature)
+        WHERE f1.name < f2.name
+
+        WITH f1.name + " + " + f2.name as FeaturePair,
+             f1.category + " + " + f2.category as CategoryPair,
+             count(p) as CoOccurrenceCount,
+             avg(p.listing_price) as AvgPriceWithBoth,
+             collect(DISTINCT p.listing_id)[0..3] as SampleProperties
+        WHERE CoOccurrenceCount >= 5
+
+        MATCH (pf1:Property)-[:HAS_FEATURE]->(f1Feature:Feature {name: split(FeaturePair, " + ")[0]})
+        MATCH (pf2:Property)-[:HAS_FEATURE]->(f2Feature:Feature {name: split(FeaturePair, " + ")[1]})
+
+        WITH FeaturePair, CategoryPair, CoOccurrenceCount, AvgPriceWithBoth, SampleProperties,
+             count(DISTINCT pf1) as Feature1Count, count(DISTINCT pf2) as Feature2Count
+
+        MATCH (allProps:Property)
+        WITH FeaturePair, CategoryPair, CoOccurrenceCount, AvgPriceWithBoth, SampleProperties,
+             Feature1Count, Feature2Count, count(allProps) as TotalProperties
+
+        WITH *, (toFloat(CoOccurrenceCount) * TotalProperties) / (Feature1Count * Feature2Count) as Lift
+        WHERE Lift > 1.5
+
+        RETURN FeaturePair, CategoryPair, CoOccurrenceCount,
+               AvgPriceWithBoth, Lift, SampleProperties
+        ORDER BY Lift DESC
+        LIMIT 12
+        """,
+        sql="""
+        WITH feature_counts AS (
+            SELECT feature, count(*) as properties
+            FROM property_features
+            GROUP BY feature
+        ),
+        pairs AS (
+            SELECT f1.feature as feature1,
+                   f2.feature as feature2,
+                   any_value(f1.category) || ' + ' || any_value(f2.category) as CategoryPair,
+                   count(*) as CoOccurrenceCount,
+                   avg(p.listing_price) as AvgPriceWithBoth,
+                   list(p.listing_id ORDER BY p.listing_id)[1:3] as SampleProperties
+            FROM property_features f1
+            JOIN property_features f2 ON f1.listing_id = f2.listing_id AND f1.feature < f2.feature
+            JOIN properties p ON p.listing_id = f1.listing_id
+            GROUP BY f1.feature, f2.feature
+            HAVING count(*) >= 5
+        )
+        SELECT pairs.feature1 || ' + ' || pairs.feature2 as FeaturePair,
+               CategoryPair,
+               CoOccurrenceCount,
+               AvgPriceWithBoth,
+               CAST(CoOccurrenceCount AS DOUBLE) * (SELECT count(*) FROM properties)
+                   / (c1.properties * c2.properties) as Lift,
+               SampleProperties
+        FROM pairs
+        JOIN feature_counts c1 ON c1.feature = pairs.feature1
+        JOIN feature_counts c2 ON c2.feature = pairs.feature2
+        WHERE Lift > 1.5
+        ORDER BY Lift DESC
+        LIMIT 12
+        """
+    ),
+    MarketQuery(
+        name="undervalued_neighborhoods",
+        description="Neighborhoods with more features per property than their city at a lower price",
+        cypher="""
+        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+        WITH n, count(p) as PropertyCount,
+             avg(p.listing_price) as AvgPrice,
+             avg(size([(p)-[:HAS_FEATURE]->(:Feature) | 1])) as AvgFeaturesPerProperty
+        WHERE PropertyCount >= 5
+
+        MATCH (cityProps:Property)-[:IN_NEIGHBORHOOD]->(:Neighborhood {city: n.city})
+        WITH n, PropertyCount, AvgPrice, AvgFeaturesPerProperty,
+             avg(cityProps.listing_price) as CityAvgPrice,
+             avg(size([(cityProps)-[:HAS_FEATURE]->(:Feature) | 1])) as CityAvgFeatures
+
+        WITH *, (AvgPrice / CityAvgPrice) as PriceRatio,
+             (AvgFeaturesPerProperty / CityAvgFeatures) as FeatureRatio
+
+        WHERE FeatureRatio > 1.1 AND PriceRatio < 0.9
+
+        RETURN n.city as City, n.name as Neighborhood,
+               AvgPrice, PropertyCount, AvgFeaturesPerProperty,
+               PriceRatio, FeatureRatio,
+               n.lifestyle_tags as LifestyleTags
+        ORDER BY (FeatureRatio / PriceRatio) DESC
+        LIMIT 8
+        """,
+        sql="""
+        WITH per_neighborhood AS (
+            SELECT neighborhood_id,
+                   any_value(city) as city,
+                   any_value(neighborhood) as neighborhood,
+                   any_value(lifestyle_tags) as lifestyle_tags,
+                   count(*) as properties,
+                   avg(listing_price) as avg_price,
+                   avg(feature_count) as avg_features
+            FROM located_properties
+            GROUP BY neighborhood_id
+        ),
+        per_city AS (
+            SELECT city,
+                   avg(listing_price) as avg_price,
+                   avg(feature_count) as avg_features
+            FROM located_properties
+            GROUP BY city
+        ),
+        ratios AS (
+            SELECT n.city as City,
+                   n.neighborhood as Neighborhood,
+                   n.avg_price as AvgPrice,
+                   n.properties as PropertyCount,
+                   n.avg_features as AvgFeaturesPerProperty,
+                   n.avg_price / nullif(c.avg_price, 0) as PriceRatio,
+                   n.avg_features / nullif(c.avg_features, 0) as FeatureRatio,
+                   n.lifestyle_tags as LifestyleTags
+            FROM per_neighborhood n
+            JOIN per_city c ON c.city = n.city
+            WHERE n.properties >= 5
+        )
+        SELECT *
+        FROM ratios
+        WHERE FeatureRatio > 1.1 AND PriceRatio < 0.9
+        ORDER BY FeatureRatio / PriceRatio DESC
+        LIMIT 8
+        """
+    ),
+    MarketQuery(
+        name="price_anomalies",
+        description="Properties priced more than two standard deviations from their neighborhood",
+        cypher="""
+        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+        WITH n,
+             collect(p) as Properties,
+             avg(p.listing_price) as NeighborhoodAvg,
+             stdev(p.listing_price) as PriceStdDev
+        WHERE size(Properties) >= 5 AND PriceStdDev > 0
+
+        UNWIND Properties as prop
+        WITH prop, n, NeighborhoodAvg, PriceStdDev,
+             abs(prop.listing_price - NeighborhoodAvg) / PriceStdDev as ZScore
+        WHERE ZScore > 2.0
+
+        MATCH (prop)-[:IN_NEIGHBORHOOD]->(n:Neighborhood)
+        OPTIONAL MATCH (prop)-[:HAS_FEATURE]->(f:Feature)
+
+        RETURN prop.listing_id as PropertyID, prop.listing_price as Price,
+               NeighborhoodAvg, ZScore, n.city + ", " + n.name as Location,
+               collect(DISTINCT f.name)[0..5] as TopFeatures,
+               CASE WHEN prop.listing_price > NeighborhoodAvg THEN 'OVERPRICED' ELSE 'UNDERPRICED' END as Anomaly
+        ORDER BY ZScore DESC
+        LIMIT 10
+        """,
+        sql="""
+        WITH scored AS (
+            SELECT listing_id,
+                   listing_price,
+                   city,
+                   neighborhood,
+                   count(*) OVER w as neighborhood_properties,
+                   avg(listing_price) OVER w as NeighborhoodAvg,
+                   stddev_samp(listing_price) OVER w as PriceStdDev
+            FROM located_properties
+            WINDOW w AS (PARTITION BY neighborhood_id)
+        ),
+        anomalies AS (
+            SELECT *, abs(listing_price - NeighborhoodAvg) / PriceStdDev as ZScore
+            FROM scored
+            WHERE neighborhood_properties >= 5 AND PriceStdDev > 0
+        )
+        SELECT a.listing_id as PropertyID,
+               a.listing_price as Price,
+               a.NeighborhoodAvg,
+               a.ZScore,
+               a.city || ', ' || a.neighborhood as Location,
+               coalesce((
+                   SELECT list(f.feature ORDER BY f.feature)[1:5]
+                   FROM property_features f
+                   WHERE f.listing_id = a.listing_id
+               ), []) as TopFeatures,
+               CASE WHEN a.listing_price > a.NeighborhoodAvg THEN 'OVERPRICED' ELSE 'UNDERPRICED' END as Anomaly
+        FROM anomalies a
+        WHERE a.ZScore > 2.0
+        ORDER BY a.ZScore DESC
+        LIMIT 10
+        """
+    ),
+]}
+
+# Gold tables loaded into the in-memory DuckDB database. Prices and sizes are
+# cast to DOUBLE so aggregates match Neo4j floats instead of DECIMALs.
+LOAD_STATEMENTS = [
+    """
+    CREATE OR REPLACE TABLE properties AS
+    SELECT listing_id,
+           neighborhood_id,
+           property_type,
+           CAST(price AS DOUBLE) as listing_price,
+           CAST(square_feet AS DOUBLE) as square_feet,
+           features
+    FROM {properties}
+    WHERE listing_id IS NOT NULL
+    """,
+    """
+    CREATE OR REPLACE TABLE neighborhoods AS
+    SELECT neighborhood_id, name, city, state, lifestyle_tags
+    FROM {neighborhoods}
+    WHERE neighborhood_id IS NOT NULL
+    """,
+    # Same feature names and default category the graph builder writes to Neo4j
+    """
+    CREATE OR REPLACE TABLE property_features AS
+    SELECT DISTINCT listing_id, TRIM(feature) as feature, 'general' as category
+    FROM (SELECT listing_id, unnest(features) as feature FROM properties)
+    WHERE feature IS NOT NULL AND TRIM(feature) <> ''
+    """,
+    """
+    CREATE OR REPLACE TABLE located_properties AS
+    SELECT p.listing_id,
+           p.neighborhood_id,
+           p.property_type,
+           p.listing_price,
+           p.square_feet,
+           n.name as neighborhood,
+           n.city,
+           n.state,
+           n.lifestyle_tags,
+           coalesce(fc.feature_count, 0) as feature_count
+    FROM properties p
+    JOIN neighborhoods n USING (neighborhood_id)
+    LEFT JOIN (
+        SELECT listing_id, count(*) as feature_count
+        FROM property_features
+        GROUP BY listing_id
+    ) fc USING (listing_id)
+    """,
+]
+
+
+def _query(name: str) -> MarketQuery:
+    """Look up a market query by name"""
+    if name not in MARKET_QUERIES:
+        raise ValueError(f"Unknown market query '{name}'. Available: {', '.join(MARKET_QUERIES)}")
+    return MARKET_QUERIES[name]
+
+
+class MarketAnalytics(ABC):
+    """Runs named market queries on one backend"""
+
+    backend: str = ""
+
+    @abstractmethod
+    def run(self, name: str, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Rows of a market query
+
+        Args:
+            name: Key of MARKET_QUERIES
+            use_cache: Serve and store results through the backend's cache
+
+        Returns:
+            Result rows with the same columns on every backend
+        """
+        pass
+
+    def close(self):
+        """Release backend resources"""
+
+
+class Neo4jMarketAnalytics(MarketAnalytics):
+    """Market queries as Cypher against the graph"""
+
+    backend = "neo4j"
+
+    def __init__(self, driver: Driver, cache: Optional[QueryResultCache] = None):
+        """
+        Initialize the Neo4j backend
+
+        Args:
+            driver: Neo4j driver instance
+            cache: Optional graph-version result cache
+        """
+        self.driver = driver
+        self.cache = cache
+
+    def run(self, name: str, use_cache: bool = True) -> List[Dict[str, Any]]:
+        cypher = _query(name).cypher
+        if use_cache and self.cache is not None:
+            return self.cache.run_query(self.driver, cypher)
+        return run_query(self.driver, cypher)
+
+
+class DuckDBMarketAnalytics(MarketAnalytics):
+    """Market queries as DuckDB SQL over the squack gold tables"""
+
+    backend = "duckdb"
+
+    def __init__(self, config: Optional[MarketAnalyticsConfig] = None):
+        """
+        Initialize the DuckDB backend
+
+        Args:
+            config: Market analytics configuration (source paths and result cache)
+        """
+        self.config = config or MarketAnalyticsConfig()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.cache = QueryResultCache(self.config.cache)
+        self._conn = None
+        self._loaded_version: Optional[str] = None
+
+    def _source_files(self) -> List[Path]:
+        """Files the gold tables are read from"""
+        if self.config.parquet_dir:
+            gold = Path(self.config.parquet_dir) / "gold"
+            return [gold / "gold_properties.parquet", gold / "gold_neighborhoods.parquet"]
+        return [Path(self.config.duckdb_path)]
+
+    def source_version(self) -> str:
+        """
+        Version of the pipeline output the results belong to
+
+        Every pipeline run rewrites the DuckDB file and Parquet export, so
+        their sizes and modification times identify the run.
+
+        Returns:
+            Version string used as the result cache version
+        """
+        parts = []
+        for path in self._source_files():
+            if not path.exists():
+                raise FileNotFoundError(
+                    f"Gold data not found at {path}; run the squack pipeline first "
+                    f"or set market_analytics.duckdb_path / parquet_dir"
+                )
+            stat = path.stat()
+            parts.append(f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}")
+        return "duckdb:" + "|".join(parts)
+
+    def _load(self, version: str):
+        """(Re)load the gold tables when the pipeline output changed"""
+        if self._conn is not None and self._loaded_version == version:
+            return
+
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError("The DuckDB analytics backend requires duckdb (pip install duckdb)") from e
+
+        self.close()
+        start_time = time.perf_counter()
+        conn = duckdb.connect(":memory:")
+        if self.config.threads:
+            conn.execute(f"SET threads = {int(self.config.threads)}")
+
+        if self.config.parquet_dir:
+            properties, neighborhoods = (f"read_parquet({_sql_string(p)})" for p in self._source_files())
+        else:
+            conn.execute(f"ATTACH {_sql_string(self.config.duckdb_path)} AS gold (READ_ONLY)")
+            properties, neighborhoods = "gold.gold_properties", "gold.gold_neighborhoods"
+
+        for statement in LOAD_STATEMENTS:
+            conn.execute(statement.format(properties=properties, neighborhoods=neighborhoods))
+        if not self.config.parquet_dir:
+            conn.execute("DETACH gold")
+
+        self._conn = conn
+        self._loaded_version = version
+        self.logger.info(f"Loaded gold tables into DuckDB in {time.perf_counter() - start_time:.2f}s")
+
+    def run(self, name: str, use_cache: bool = True) -> List[Dict[str, Any]]:
+        sql = _query(name).sql
+        version = self.source_version()
+
+        key = self.cache.cache_key(sql, None, version)
+        if use_cache and self.config.cache.enabled:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        self._load(version)
+        cursor = self._conn.execute(sql)
+        columns = [column[0] for column in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+        if use_cache and self.config.cache.enabled:
+            self.cache.put(key, version, rows)
+        return rows
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._loaded_version = None
+
+
+def _sql_string(value: Any) -> str:
+    """Quote a value as a SQL string literal"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def create_market_analytics(
+    backend: AnalyticsBackend,
+    driver: Optional[Driver] = None,
+    config: Optional[MarketAnalyticsConfig] = None,
+    cache: Optional[QueryResultCache] = None
+) -> MarketAnalytics:
+    """
+    Market analytics for a backend name
+
+    Args:
+        backend: 'neo4j' or 'duckdb'
+        driver: Neo4j driver (required for the neo4j backend)
+        config: Market analytics configuration (duckdb backend)
+        cache: Graph-version result cache (neo4j backend)
+
+    Returns:
+        MarketAnalytics instance
+    """
+    if backend == "neo4j":
+        if driver is None:
+            raise ValueError("The neo4j analytics backend requires a driver")
+        return Neo4jMarketAnalytics(driver, cache)
+    if backend == "duckdb":
+        return DuckDBMarketAnalytics(config)
+    raise ValueError(f"Unknown analytics backend '{backend}'. Use 'neo4j' or 'duckdb'")
+
+
+class LatencyComparison(BaseModel):
+    """Uncached wall time of one market query on two backends"""
+
+    query: str = Field(..., description="Market query name")
+    baseline_backend: str = Field(..., description="Backend timed first")
+    candidate_backend: str = Field(..., description="Backend compared against the baseline")
+    baseline_seconds: float = Field(..., ge=0, description="Best wall time on the baseline backend")
+    candidate_seconds: float = Field(..., ge=0, description="Best wall time on the candidate backend")
+    baseline_rows: int = Field(..., ge=0, description="Rows returned by the baseline backend")
+    candidate_rows: int = Field(..., ge=0, description="Rows returned by the candidate backend")
+
+    @property
+    def speedup(self) -> float:
+        """Baseline time over candidate time"""
+        return self.baseline_seconds / self.candidate_seconds if self.candidate_seconds > 0 else float("inf")
+
+
+def _best_time(analytics: MarketAnalytics, name: str, repeats: int) -> Tuple[float, int]:
+    """Best uncached wall time of a query and its row count"""
+    best, rows = float("inf"), []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        rows = analytics.run(name, use_cache=False)
+        best = min(best, time.perf_counter() - start_time)
+    return best, len(rows)
+
+
+def compare_latency(
+    baseline: MarketAnalytics,
+    candidate: MarketAnalytics,
+    names: Optional[Sequence[str]] = None,
+    repeats: int = 3
+) -> List[LatencyComparison]:
+    """
+    Time market queries on two backends without their caches
+
+    Each backend answers every query once before timing, so one-off work
+    (loading the gold tables, Neo4j query planning) is not counted.
+
+    Args:
+        baseline: Backend timed first (usually Neo4j)
+        candidate: Backend compared against it (usually DuckDB)
+        names: Market queries to time (default: all)
+        repeats: Runs per query; the best time is reported
+
+    Returns:
+        One comparison per query
+    """
+    comparisons = []
+    for name in names or list(MARKET_QUERIES):
+        baseline.run(name, use_cache=False)
+        candidate.run(name, use_cache=False)
+        baseline_seconds, baseline_rows = _best_time(baseline, name, repeats)
+        candidate_seconds, candidate_rows = _best_time(candidate, name, repeats)
+        comparisons.append(LatencyComparison(
+            query=name,
+            baseline_backend=baseline.backend,
+            candidate_backend=candidate.backend,
+            baseline_seconds=baseline_seconds,
+            candidate_seconds=candidate_seconds,
+            baseline_rows=baseline_rows,
+            candidate_rows=candidate_rows
+        ))
+    return comparisons
+
+
+def format_latency_comparison(comparisons: List[LatencyComparison]) -> str:
+    """
+    Side-by-side latency table for demo and CLI output
+
+    Args:
+        comparisons: Results of compare_latency()
+
+    Returns:
+        Multi-line table
+    """
+    if not comparisons:
+        return "No queries compared"
+    baseline, candidate = comparisons[0].baseline_backend, comparisons[0].candidate_backend
+    lines = [
+        f"{'Query':<28} {baseline + ' ms':>12} {candidate + ' ms':>12} {'Speedup':>9} {'Rows':>11}",
+        "-" * 76
+    ]
+    for c in comparisons:
+        lines.append(
+            f"{c.query:<28} {c.baseline_seconds * 1000:>12.1f} {c.candidate_seconds * 1000:>12.1f} "
+            f"{c.speedup:>8.1f}x {f'{c.baseline_rows}/{c.candidate_rows}':>11}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,143 @@
+"""Proximity pairs from coordinates with grid bucketing
+
+Points are projected to kilometres and bucketed into grid cells one radius
+wide; only points in the same or adjacent cells are compared, so the work
+grows with local density instead of with the square of the point count.
+Exact haversine distances decide which candidates are kept.
+"""
+
+import math
+from typing import Iterator, Optional, Sequence, Tuple
+import numpy as np
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# Forward half of the 3x3 cell neighbourhood: each adjacent cell pair is visited once
+CELL_OFFSETS = ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def haversine_km(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distance between coordinate arrays.
+
+    Args:
+        lat1, lon1: First points in degrees
+        lat2, lon2: Second points in degrees
+
+    Returns:
+        Distances in kilometres
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(a) for a in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _cell_pair_chunks(sizes: np.ndarray, limit: int) -> Iterator[Tuple[int, int]]:
+    """Ranges of cell pairs whose candidate counts add up to at most limit (one pair minimum)"""
+    totals = np.cumsum(sizes)
+    start = 0
+    while start < len(sizes):
+        base = totals[start - 1] if start else 0
+        end = max(int(np.searchsorted(totals, base + limit, side='right')), start + 1)
+        yield start, end
+        start = end
+
+
+def _expand_cell_pairs(
+    a_start: np.ndarray,
+    a_count: np.ndarray,
+    b_start: np.ndarray,
+    b_count: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Every (a, b) combination of sorted positions for a set of cell pairs"""
+    sizes = a_count * b_count
+    pair = np.repeat(np.arange(len(sizes)), sizes)
+    local = np.arange(int(sizes.sum())) - (np.cumsum(sizes) - sizes)[pair]
+    return a_start[pair] + local // b_count[pair], b_start[pair] + local % b_count[pair]
+
+
+def proximity_pairs(
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    radius_km: float,
+    k_nearest: Optional[int] = None,
+    max_candidate_pairs: int = 2_000_000
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Point pairs within a radius, optionally limited to each point's k nearest.
+
+    A pair is kept when it is among the k nearest of either endpoint, so
+    every point keeps up to k neighbours and the relationship stays symmetric.
+
+    Args:
+        latitudes: Latitudes in degrees
+        longitudes: Longitudes in degrees
+        radius_km: Maximum distance
+        k_nearest: Neighbours kept per point (None keeps every pair in range)
+        max_candidate_pairs: Candidate pairs scored per chunk
+
+    Returns:
+        (i, j, distance_km) arrays with i < j, ordered by i then j
+    """
+    lat = np.asarray(latitudes, dtype=np.float64)
+    lon = np.asarray(longitudes, dtype=np.float64)
+    empty = (np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([], dtype=np.float64))
+    if len(lat) < 2:
+        return empty
+
+    # Project with the most poleward cosine so projected distances never exceed true ones
+    cos_min = max(float(np.cos(np.radians(np.abs(lat).max()))), 1e-6)
+    cx = np.floor(lon * KM_PER_DEGREE * cos_min / radius_km).astype(np.int64)
+    cy = np.floor(lat * KM_PER_DEGREE / radius_km).astype(np.int64)
+    cx -= cx.min()
+    cy -= cy.min()
+    width = int(cy.max()) + 3
+    keys = cx * width + cy + 1  # cy + 1 keeps the dy = -1 neighbour from wrapping into another column
+
+    order = np.argsort(keys, kind='stable')
+    cells, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+
+    found_i, found_j, found_d = [], [], []
+    for dx, dy in CELL_OFFSETS:
+        target = cells + dx * width + dy
+        pos = np.minimum(np.searchsorted(cells, target), len(cells) - 1)
+        a_cells = np.flatnonzero(cells[pos] == target)
+        if a_cells.size == 0:
+            continue
+        b_cells = pos[a_cells]
+        sizes = counts[a_cells] * counts[b_cells]
+
+        for start, end in _cell_pair_chunks(sizes, max_candidate_pairs):
+            a, b = _expand_cell_pairs(
+                starts[a_cells[start:end]], counts[a_cells[start:end]],
+                starts[b_cells[start:end]], counts[b_cells[start:end]]
+            )
+            if dx == 0 and dy == 0:
+                same_cell = a < b
+                a, b = a[same_cell], b[same_cell]
+            i, j = order[a], order[b]
+            distance = haversine_km(lat[i], lon[i], lat[j], lon[j])
+            in_range = distance <= radius_km
+            found_i.append(np.minimum(i, j)[in_range])
+            found_j.append(np.maximum(i, j)[in_range])
+            found_d.append(distance[in_range])
+
+    if not found_i:
+        return empty
+    i, j, distance = np.concatenate(found_i), np.concatenate(found_j), np.concatenate(found_d)
+
+    if k_nearest is not None and i.size:
+        # Rank each point's edges by distance and keep the pairs ranked < k for either end
+        edges = i.size
+        source = np.concatenate([i, j])
+        other = np.concatenate([j, i])
+        by_source = np.lexsort((other, np.concatenate([distance, distance]), source))
+        sorted_source = source[by_source]
+        rank = np.arange(by_source.size) - np.searchsorted(sorted_source, sorted_source)
+        keep = np.unique(by_source[rank < k_nearest] % edges)
+        i, j, distance = i[keep], j[keep], distance[keep]
+
+    ordered = np.lexsort((j, i))
+    return i[ordered], j[ordered], distance[ordered]
@@ -7,6 +7,8 @@ from .models import (
     EmbeddingConfig,
     VectorIndexConfig,
     SearchConfig,
+    QueryCacheConfig,
+    MarketAnalyticsConfig,
     VoyageModelConfig,
     OllamaModelConfig,
     OpenAIModelConfig,
@@ -25,6 +27,8 @@ __all__ = [
     'EmbeddingConfig',
     'VectorIndexConfig',
     'SearchConfig',
+    'QueryCacheConfig',
+    'MarketAnalyticsConfig',
     'VoyageModelConfig',
     'OllamaModelConfig',
     'OpenAIModelConfig',
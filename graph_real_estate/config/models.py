@@ -12,6 +12,9 @@ class DatabaseConfig(BaseModel):
     user: str = Field(default="neo4j", description="Database username")
     password: str = Field(default="password", description="Database password")
     database: str = Field(default="neo4j", description="Database name")
+    max_concurrent_queries: int = Field(
+        default=8, gt=0, description="Independent read queries run at once by demo and query runners"
+    )
     
     @field_validator('uri')
     @classmethod
@@ -79,6 +82,9 @@ class EmbeddingConfig(BaseModel):
     batch_size: int = Field(default=50, gt=0, description="Batch size for processing")
     max_retries: int = Field(default=3, ge=0, description="Maximum retry attempts")
     retry_delay: int = Field(default=2, ge=0, description="Delay between retries in seconds")
+    max_concurrency: int = Field(default=4, gt=0, description="Concurrent provider batch requests in bulk mode")
+    page_size: int = Field(default=1000, gt=0, description="Properties read from Neo4j per page in bulk mode")
+    write_batch_size: int = Field(default=500, gt=0, description="Embeddings written per UNWIND transaction")
     
     # Model-specific configurations
     voyage: Optional[VoyageModelConfig] = None
@@ -134,6 +140,15 @@ class VectorIndexConfig(BaseModel):
     node_label: str = Field(default="Property", description="Node label for indexing")
     embedding_property: str = Field(default="embedding", description="Property name for embeddings")
     source_property: str = Field(default="description", description="Source text property")
+    search_mode: Literal["exact", "ivf", "hnsw"] = Field(
+        default="exact",
+        description="In-memory search: exact matrix scan, IVF clusters, or HNSW graph (needs hnswlib)"
+    )
+    ivf_lists: Optional[int] = Field(default=None, gt=0, description="IVF clusters (default: sqrt of vector count)")
+    ivf_probes: int = Field(default=8, gt=0, description="IVF clusters scanned per query")
+    hnsw_m: int = Field(default=16, gt=0, description="HNSW links per node")
+    hnsw_ef_construction: int = Field(default=200, gt=0, description="HNSW build-time candidate list size")
+    hnsw_ef_search: int = Field(default=64, gt=0, description="HNSW query-time candidate list size")
 
 
 class SearchConfig(BaseModel):
@@ -158,6 +173,38 @@ class SearchConfig(BaseModel):
         return v
 
 
+class QueryCacheConfig(BaseModel):
+    """Result cache for read-only analytic queries"""
+    model_config = ConfigDict(frozen=True)
+    
+    enabled: bool = Field(default=True, description="Cache query results per graph version")
+    max_entries: int = Field(default=256, gt=0, description="Results kept in the in-memory LRU")
+    disk_path: Optional[str] = Field(default=None, description="SQLite file for results shared across runs")
+    version_check_interval: float = Field(
+        default=1.0, ge=0, description="Seconds a graph version read is reused before checking again"
+    )
+
+
+class MarketAnalyticsConfig(BaseModel):
+    """Backend for the market-intelligence demo aggregates"""
+    model_config = ConfigDict(frozen=True)
+    
+    backend: Literal["neo4j", "duckdb"] = Field(
+        default="neo4j", description="Answer market aggregates from the graph or the squack gold tables"
+    )
+    duckdb_path: str = Field(
+        default="squack_pipeline_v2/output/pipeline_v2.duckdb",
+        description="Squack pipeline DuckDB file holding gold_properties and gold_neighborhoods"
+    )
+    parquet_dir: Optional[str] = Field(
+        default=None, description="Squack Parquet export directory; read instead of duckdb_path when set"
+    )
+    threads: Optional[int] = Field(default=None, gt=0, description="DuckDB worker threads (default: all cores)")
+    cache: QueryCacheConfig = Field(
+        default_factory=QueryCacheConfig, description="Result cache, versioned by the pipeline run"
+    )
+
+
 class GraphRealEstateConfig(BaseModel):
     """Main configuration for graph_real_estate application"""
     model_config = ConfigDict(frozen=True)
@@ -167,6 +214,8 @@ class GraphRealEstateConfig(BaseModel):
     embedding: EmbeddingConfig = Field(default_factory=EmbeddingConfig)
     vector_index: VectorIndexConfig = Field(default_factory=VectorIndexConfig)
     search: SearchConfig = Field(default_factory=SearchConfig)
+    query_cache: QueryCacheConfig = Field(default_factory=QueryCacheConfig)
+    market_analytics: MarketAnalyticsConfig = Field(default_factory=MarketAnalyticsConfig)
     
     @classmethod
     def from_yaml(cls, config_path: Path) -> "GraphRealEstateConfig":
@@ -12,6 +12,8 @@ from graph_real_estate.config.models import (
     EmbeddingConfig,
     VectorIndexConfig,
     SearchConfig,
+    QueryCacheConfig,
+    MarketAnalyticsConfig,
     VoyageModelConfig,
     OllamaModelConfig,
     OpenAIModelConfig,
@@ -67,7 +69,8 @@ class Settings:
             uri=os.getenv('NEO4J_URI', 'bolt://localhost:7687'),
             user=os.getenv('NEO4J_USERNAME', 'neo4j'),
             password=os.getenv('NEO4J_PASSWORD', 'password'),
-            database=os.getenv('NEO4J_DATABASE', 'neo4j')
+            database=os.getenv('NEO4J_DATABASE', 'neo4j'),
+            max_concurrent_queries=int(os.getenv('NEO4J_MAX_CONCURRENT_QUERIES', '8'))
         )
         
         # API configuration
@@ -85,7 +88,10 @@ class Settings:
             'provider': provider,
             'batch_size': int(os.getenv('EMBEDDING_BATCH_SIZE', '50')),
             'max_retries': int(os.getenv('EMBEDDING_MAX_RETRIES', '3')),
-            'retry_delay': int(os.getenv('EMBEDDING_RETRY_DELAY', '2'))
+            'retry_delay': int(os.getenv('EMBEDDING_RETRY_DELAY', '2')),
+            'max_concurrency': int(os.getenv('EMBEDDING_MAX_CONCURRENCY', '4')),
+            'page_size': int(os.getenv('EMBEDDING_PAGE_SIZE', '1000')),
+            'write_batch_size': int(os.getenv('EMBEDDING_WRITE_BATCH_SIZE', '500'))
         }
         
         # Add provider-specific configuration
@@ -123,7 +129,8 @@ class Settings:
             similarity_function=os.getenv('VECTOR_SIMILARITY_FUNCTION', 'cosine'),
             node_label=os.getenv('VECTOR_NODE_LABEL', 'Property'),
             embedding_property=os.getenv('VECTOR_EMBEDDING_PROPERTY', 'embedding'),
-            source_property=os.getenv('VECTOR_SOURCE_PROPERTY', 'description')
+            source_property=os.getenv('VECTOR_SOURCE_PROPERTY', 'description'),
+            search_mode=os.getenv('VECTOR_SEARCH_MODE', 'exact')
         )
         
         # Search configuration
@@ -136,12 +143,28 @@ class Settings:
             min_similarity=float(os.getenv('SEARCH_MIN_SIMILARITY', '0.01'))
         )
         
+        # Query result cache configuration
+        query_cache = QueryCacheConfig(
+            enabled=os.getenv('QUERY_CACHE_ENABLED', 'true').lower() == 'true',
+            max_entries=int(os.getenv('QUERY_CACHE_MAX_ENTRIES', '256')),
+            disk_path=os.getenv('QUERY_CACHE_PATH')
+        )
+        
+        # Market analytics backend configuration
+        market_analytics = MarketAnalyticsConfig(
+            backend=os.getenv('MARKET_ANALYTICS_BACKEND', 'neo4j'),
+            duckdb_path=os.getenv('MARKET_ANALYTICS_DUCKDB_PATH', 'squack_pipeline_v2/output/pipeline_v2.duckdb'),
+            parquet_dir=os.getenv('MARKET_ANALYTICS_PARQUET_DIR')
+        )
+        
         return GraphRealEstateConfig(
             database=database,
             api=api,
             embedding=embedding,
             vector_index=vector_index,
-            search=search
+            search=search,
+            query_cache=query_cache,
+            market_analytics=market_analytics
         )
     
     @property
@@ -169,6 +192,16 @@ class Settings:
         """Get search configuration"""
         return self.config.search
     
+    @property
+    def query_cache(self) -> QueryCacheConfig:
+        """Get query cache configuration"""
+        return self.config.query_cache
+    
+    @property
+    def market_analytics(self) -> MarketAnalyticsConfig:
+        """Get market analytics configuration"""
+        return self.config.market_analytics
+    
     def reload(self) -> None:
         """Reload configuration from file"""
         self._config = None
@@ -0,0 +1,220 @@
+"""Async query executor for fanning out independent read queries
+
+Demo suites and reports run dozens of independent analytic queries. The
+blocking QueryExecutor keeps one connection busy at a time; this executor runs
+them on the async Neo4j driver, at most max_concurrency at once, and returns
+the results in the order the queries were given, so a batch takes roughly as
+long as its slowest query.
+
+AsyncQueryExecutor is for callers that already run an event loop.
+ConcurrentQueryExecutor is the blocking entry point used by the demo and query
+runners: each run_all() call opens an async driver, fans the batch out and
+closes the driver again.
+"""
+
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncManagedTransaction
+from neo4j.exceptions import Neo4jError, TransientError
+
+from graph_real_estate.config.models import DatabaseConfig
+
+
+# A query string, or a (query, params) pair
+QuerySpec = Union[str, Tuple[str, Optional[Dict[str, Any]]]]
+
+
+def normalize_queries(queries: Sequence[QuerySpec]) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    (query, params) pairs for a mix of query strings and pairs
+
+    Args:
+        queries: Query strings or (query, params) pairs
+
+    Returns:
+        List of (query, params) pairs
+    """
+    return [(spec, None) if isinstance(spec, str) else (spec[0], spec[1]) for spec in queries]
+
+
+class AsyncQueryExecutor:
+    """Executes queries on the async driver with retries and a concurrency limit"""
+
+    WRITE_KEYWORDS = ['CREATE', 'DELETE', 'SET', 'MERGE', 'REMOVE', 'DETACH', 'DROP']
+
+    def __init__(
+        self,
+        driver: AsyncDriver,
+        database: str = "neo4j",
+        max_retries: int = 3,
+        max_concurrency: int = 8
+    ):
+        """
+        Initialize async query executor
+
+        Args:
+            driver: Async Neo4j driver instance
+            database: Database name
+            max_retries: Maximum number of retries for transient errors
+            max_concurrency: Queries in flight at once in execute_many
+        """
+        self.driver = driver
+        self.database = database
+        self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def execute(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a query (auto-detects read vs write)
+
+        Args:
+            query: Cypher query string
+            params: Query parameters
+
+        Returns:
+            List of result records as dictionaries
+        """
+        if any(keyword in query.upper() for keyword in self.WRITE_KEYWORDS):
+            return await self.execute_write(query, params)
+        return await self.execute_read(query, params)
+
+    async def execute_read(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a read transaction
+
+        Args:
+            query: Cypher query string
+            params: Query parameters
+
+        Returns:
+            List of result records as dictionaries
+        """
+        return await self._execute_with_retry(query, params, write=False)
+
+    async def execute_write(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a write transaction
+
+        Args:
+            query: Cypher query string
+            params: Query parameters
+
+        Returns:
+            List of result records as dictionaries
+        """
+        return await self._execute_with_retry(query, params, write=True)
+
+    async def execute_many(
+        self,
+        queries: Sequence[QuerySpec],
+        return_exceptions: bool = False
+    ) -> List[Union[List[Dict[str, Any]], BaseException]]:
+        """
+        Execute independent queries concurrently
+
+        Args:
+            queries: Query strings or (query, params) pairs
+            return_exceptions: Return a failed query's exception in its slot
+                instead of raising it
+
+        Returns:
+            Results per query, in the order given
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(query: str, params: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.execute(query, params)
+
+        return await asyncio.gather(
+            *(run(query, params) for query, params in normalize_queries(queries)),
+            return_exceptions=return_exceptions
+        )
+
+    async def _execute_with_retry(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]],
+        write: bool
+    ) -> List[Dict[str, Any]]:
+        """Run one transaction, retrying transient errors with exponential backoff"""
+        async def work(tx: AsyncManagedTransaction) -> List[Dict[str, Any]]:
+            result = await tx.run(query, **(params or {}))
+            return [dict(record) async for record in result]
+
+        last_error = None
+
+        for attempt in range(self.max_retries):
+            try:
+                async with self.driver.session(database=self.database) as session:
+                    if write:
+                        return await session.execute_write(work)
+                    return await session.execute_read(work)
+
+            except TransientError as e:
+                last_error = e
+                wait_time = 2 ** attempt  # Exponential backoff
+                self.logger.warning(
+                    f"Transient error on attempt {attempt + 1}/{self.max_retries}: {e}. "
+                    f"Retrying in {wait_time} seconds..."
+                )
+                await asyncio.sleep(wait_time)
+
+            except Neo4jError as e:
+                self.logger.error(f"Neo4j error: {e}")
+                raise
+
+        self.logger.error(f"Failed after {self.max_retries} attempts")
+        raise last_error
+
+
+class ConcurrentQueryExecutor:
+    """Blocking facade that runs query batches on a short-lived async driver"""
+
+    def __init__(self, config: DatabaseConfig, max_retries: int = 3):
+        """
+        Initialize concurrent query executor
+
+        Args:
+            config: Database connection settings (max_concurrent_queries sets the limit)
+            max_retries: Maximum number of retries for transient errors
+        """
+        self.config = config
+        self.max_retries = max_retries
+
+    def run_all(
+        self,
+        queries: Sequence[QuerySpec],
+        return_exceptions: bool = False
+    ) -> List[Union[List[Dict[str, Any]], BaseException]]:
+        """
+        Execute independent queries concurrently and wait for all of them
+
+        Args:
+            queries: Query strings or (query, params) pairs
+            return_exceptions: Return a failed query's exception in its slot
+                instead of raising it
+
+        Returns:
+            Results per query, in the order given
+        """
+        if not queries:
+            return []
+        return asyncio.run(self._run_all(queries, return_exceptions))
+
+    async def _run_all(
+        self,
+        queries: Sequence[QuerySpec],
+        return_exceptions: bool
+    ) -> List[Union[List[Dict[str, Any]], BaseException]]:
+        """Open an async driver sized for the batch and fan the queries out"""
+        concurrency = self.config.max_concurrent_queries
+        async with AsyncGraphDatabase.driver(
+            self.config.uri,
+            auth=(self.config.user, self.config.password),
+            max_connection_pool_size=concurrency
+        ) as driver:
+            executor = AsyncQueryExecutor(driver, self.config.database, self.max_retries, concurrency)
+            return await executor.execute_many(queries, return_exceptions)
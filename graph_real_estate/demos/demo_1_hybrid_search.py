@@ -78,7 +78,7 @@ class AdvancedHybridSearchDemo:
         from vectors.vector_manager import PropertyVectorManager
         
         query_executor = QueryExecutor(self.driver)
-        vector_manager = PropertyVectorManager(self.driver, query_executor)
+        vector_manager = PropertyVectorManager(self.driver, query_executor, vector_config)
         
         self.search = HybridPropertySearch(query_executor, self.pipeline, vector_manager, search_config)
         
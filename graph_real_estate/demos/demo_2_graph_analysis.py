@@ -26,7 +26,7 @@ Graph Database Context:
 import sys
 import signal
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 import time
 from collections import defaultdict, Counter
 
@@ -38,13 +38,376 @@ if hasattr(signal, 'SIGPIPE'):
 sys.path.append(str(Path(__file__).parent.parent))
 
 from database import get_neo4j_driver, close_neo4j_driver, run_query
+from graph_real_estate.config import get_settings
+from graph_real_estate.core.async_query_executor import ConcurrentQueryExecutor
+from graph_real_estate.analytics.market import (
+    Neo4jMarketAnalytics,
+    DuckDBMarketAnalytics,
+    create_market_analytics,
+    compare_latency,
+    format_latency_comparison
+)
+
+# Market aggregates this demo reads through MarketAnalytics
+MARKET_QUERY_NAMES = ['neighborhood_price_stats', 'price_distribution']
+
+
+# Cypher queries of each demo section by result name. The queries of a
+# section are independent, so they are fetched in one concurrent batch.
+SECTION_QUERIES: Dict[str, Dict[str, str]] = {
+    'demo_1_property_relationships': {
+        # NEO4J CYPHER QUERY:
+        # Multi-stage query comparing luxury properties to total properties
+        # Stage 1: Find luxury properties (>$2M) and their neighborhoods
+        # Stage 2: Filter to neighborhoods with at least 3 luxury properties
+        # Stage 3: Find ALL properties in these neighborhoods
+        # Stage 4: Calculate luxury percentage as derived field
+        'luxury_areas': """
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+            WHERE p.listing_price > 2000000
+            WITH n, count(p) as luxury_count, avg(p.listing_price) as avg_luxury_price
+            WHERE luxury_count >= 3
+            MATCH (n)<-[:LOCATED_IN]-(all_props:Property)
+            WITH n, luxury_count, avg_luxury_price, count(all_props) as total_props
+            RETURN n.name as neighborhood,
+                   n.city as city,
+                   luxury_count,
+                   total_props,
+                   (luxury_count * 100.0 / total_props) as luxury_percentage,
+                   avg_luxury_price
+        
+            ORDER BY luxury_percentage DESC
+            LIMIT 5
+        """,
+    },
+    'demo_2_wikipedia_relationships': {
+        # NEO4J CYPHER QUERY:
+        # Knowledge graph integration with Wikipedia articles
+        # - collect() aggregates values into a list/array
+        # - [0..3] array slicing gets first 3 elements
+        # - Shows Neo4j's ability to integrate external knowledge
+        'wiki_neighborhoods': """
+            MATCH (w:WikipediaArticle)-[:DESCRIBES]->(n:Neighborhood)
+            WITH n, count(w) as article_count,
+                 collect(w.title)[0..3] as sample_articles
+            WHERE article_count > 0
+            MATCH (n)<-[:LOCATED_IN]-(p:Property)
+            WITH n, article_count, sample_articles,
+                 count(p) as property_count,
+                 avg(p.listing_price) as avg_price
+        
+            RETURN n.name as neighborhood,
+                   n.city as city,
+                   n.state as state,
+                   article_count,
+                   sample_articles,
+                   property_count,
+                   avg_price
+            ORDER BY article_count DESC
+            LIMIT 10
+        """,
+        'documented_areas': """
+            MATCH (w:WikipediaArticle)-[:DESCRIBES]->(n:Neighborhood)
+            WITH w, n, size(w.text) as article_length
+            WHERE article_length > 1000
+            WITH n, 
+                 count(w) as detailed_articles,
+                 avg(article_length) as avg_article_length,
+                 sum(article_length) as total_content_length
+            MATCH (n)<-[:LOCATED_IN]-(p:Property)
+            WITH n, detailed_articles, avg_article_length, total_content_length,
+                 count(p) as property_count,
+                 avg(p.listing_price) as avg_price
+            WHERE detailed_articles >= 2
+            RETURN n.name as neighborhood,
+                   n.city as city,
+                   detailed_articles,
+                   avg_article_length,
+                   total_content_length,
+                   property_count,
+                   avg_price
+            ORDER BY total_content_length DESC
+            LIMIT 5
+        """,
+    },
+    'demo_3_geographic_hierarchies': {
+        'hierarchy': """
+            MATCH (child)-[:PART_OF]->(parent)
+            RETURN child.name as child_name,
+                   labels(child)[0] as child_type,
+                   parent.name as parent_name,
+                   labels(parent)[0] as parent_type
+            ORDER BY parent_name, child_name
+            LIMIT 20
+        """,
+        'distribution': """
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+            WITH n.city as city, n.state as state,
+                 count(p) as property_count,
+                 avg(p.listing_price) as avg_price,
+                 min(p.listing_price) as min_price,
+                 max(p.listing_price) as max_price
+            RETURN city, state, property_count, avg_price, min_price, max_price
+            ORDER BY property_count DESC
+            LIMIT 10
+        """,
+        # NEO4J CYPHER QUERY:
+        # Bidirectional relationship analysis of connected neighborhoods
+        # - WHERE n1.name < n2.name prevents duplicate pairs (A->B and B->A)
+        # - Two separate MATCH clauses for parallel traversal
+        # - abs() function calculates absolute value for price differences
+        'proximity_analysis': """
+            MATCH (n1:Neighborhood)-[:NEAR]->(n2:Neighborhood)
+            WHERE n1.name < n2.name
+            MATCH (n1)<-[:LOCATED_IN]-(p1:Property)
+            MATCH (n2)<-[:LOCATED_IN]-(p2:Property)
+            WITH n1, n2, 
+                 avg(p1.listing_price) as avg_price1,
+                 avg(p2.listing_price) as avg_price2,
+                 count(p1) as properties1,
+                 count(p2) as properties2
+            RETURN n1.name as neighborhood1,
+                   n2.name as neighborhood2,
+                   n1.city as city,
+                   avg_price1,
+                   avg_price2,
+                   abs(avg_price1 - avg_price2) as price_difference,
+                   properties1,
+                   properties2
+        
+            ORDER BY price_difference DESC
+            LIMIT 5
+        """,
+        'cities': """
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)-[:IN_CITY]->(c:City)
+            WITH c.name as city,
+                 avg(p.listing_price) as avg_price,
+                 avg(p.price_per_sqft) as avg_price_per_sqft,
+                 count(p) as properties,
+                 count(DISTINCT n) as neighborhoods
+            RETURN city, avg_price, avg_price_per_sqft, properties, neighborhoods
+            ORDER BY avg_price DESC
+        """,
+    },
+    'demo_4_lifestyle_communities': {
+        # NEO4J CYPHER QUERY EXPLANATION:
+        # Array processing with UNWIND - expands arrays into individual rows.
+        # IS NOT NULL - checks for property existence
+        # collect(DISTINCT ...) - creates unique lists
+        'lifestyle_analysis': """
+            MATCH (n:Neighborhood)<-[:LOCATED_IN]-(p:Property)
+            WHERE n.lifestyle_tags IS NOT NULL
+            // Find neighborhoods with lifestyle_tags array property
+            -- IS NOT NULL checks property exists and has value
+        
+            UNWIND n.lifestyle_tags as lifestyle_tag
+            -- UNWIND expands array into rows (like Python's itertools.chain)
+            -- Each lifestyle tag becomes a separate row for processing
+        
+            WITH lifestyle_tag, 
+                 collect(DISTINCT n.city) as cities,
+                 count(DISTINCT n) as neighborhoods,
+                 count(p) as properties,
+                 avg(p.listing_price) as avg_price,
+                 avg(p.price_per_sqft) as avg_price_per_sqft
+            -- Group by lifestyle_tag after unwinding
+            -- collect(DISTINCT ...) creates array of unique values
+            -- count(DISTINCT ...) counts unique occurrences
+        
+            RETURN lifestyle_tag,
+                   cities,
+                   neighborhoods,
+                   properties,
+                   avg_price,
+                   avg_price_per_sqft
+            ORDER BY avg_price DESC
+        """,
+        # NEO4J CYPHER QUERY:
+        # Lifestyle compatibility analysis using list comprehension
+        # - Cartesian product creates all neighborhood pairs
+        # - List comprehension [var IN array WHERE condition] finds shared tags
+        # - size() function counts shared tags
+        # - Filters to pairs sharing at least 2 lifestyle tags
+        'compatibility': """
+            MATCH (n1:Neighborhood), (n2:Neighborhood)
+            WHERE n1.name < n2.name 
+              AND n1.lifestyle_tags IS NOT NULL 
+              AND n2.lifestyle_tags IS NOT NULL
+            WITH n1, n2,
+                 [tag IN n1.lifestyle_tags WHERE tag IN n2.lifestyle_tags] as shared_tags,
+                 size([tag IN n1.lifestyle_tags WHERE tag IN n2.lifestyle_tags]) as shared_count
+            WHERE shared_count >= 2
+            MATCH (n1)<-[:LOCATED_IN]-(p1:Property)
+            MATCH (n2)<-[:LOCATED_IN]-(p2:Property)
+            WITH n1, n2, shared_tags, shared_count,
+                 avg(p1.listing_price) as avg_price1,
+                 avg(p2.listing_price) as avg_price2
+            RETURN n1.name as neighborhood1,
+                   n1.city as city1,
+                   n2.name as neighborhood2,
+                   n2.city as city2,
+                   shared_tags,
+                   shared_count,
+                   avg_price1,
+                   avg_price2
+            ORDER BY shared_count DESC, abs(avg_price1 - avg_price2)
+            LIMIT 5
+        """,
+        'correlations': """
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)-[:HAS_FEATURE]->(f:Feature)
+            WHERE n.lifestyle_tags IS NOT NULL
+            UNWIND n.lifestyle_tags as lifestyle
+            WITH lifestyle, f.category as feature_category, count(p) as correlation_count
+            WHERE correlation_count >= 5
+            RETURN lifestyle, feature_category, correlation_count
+            ORDER BY lifestyle, correlation_count DESC
+        """,
+    },
+    'demo_5_investment_patterns': {
+        # NEO4J CYPHER QUERY:
+        # Investment opportunity analysis through multi-stage processing
+        # Stage 1: Calculate neighborhood average prices
+        # Stage 2: Find properties 15% below neighborhood average
+        # Stage 3: Validate with similar property relationships (sim.score > 0.8)
+        # Stage 4: Filter to properties with 3+ similar matches
+        # Stage 5: Collect features and calculate potential upside
+        'opportunities': """
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+            WITH n, avg(p.listing_price) as neighborhood_avg
+            MATCH (target:Property)-[:LOCATED_IN]->(n)
+            WHERE target.listing_price < neighborhood_avg * 0.85
+            MATCH (target)-[sim:SIMILAR_TO]->(similar:Property)
+            WHERE sim.score > 0.8
+            WITH target, n, neighborhood_avg, count(similar) as high_similarity_count,
+                 avg(sim.score) as avg_similarity_score
+            WHERE high_similarity_count >= 3
+            MATCH (target)-[:HAS_FEATURE]->(f:Feature)
+            RETURN target.listing_id as property_id,
+                   target.listing_price as price,
+                   neighborhood_avg,
+                   (neighborhood_avg - target.listing_price) as potential_upside,
+                   n.name as neighborhood,
+                   high_similarity_count,
+                   avg_similarity_score,
+                   collect(DISTINCT f.name)[0..5] as key_features
+            ORDER BY potential_upside DESC
+            LIMIT 3
+        """,
+        'hubs': """
+            MATCH (hub:Property)-[sim:SIMILAR_TO]->(connected:Property)
+            WITH hub, count(connected) as connectivity, avg(sim.score) as avg_sim_score
+            WHERE connectivity >= 8
+            MATCH (hub)-[:LOCATED_IN]->(n:Neighborhood)-[:IN_CITY]->(c:City)
+            OPTIONAL MATCH (hub)-[:HAS_FEATURE]->(f:Feature {category: 'Recreation'})
+            OPTIONAL MATCH (hub)-[:HAS_FEATURE]->(f2:Feature {category: 'View'})
+            WITH hub, n, c, connectivity, avg_sim_score,
+                 count(DISTINCT f) as recreation_features,
+                 count(DISTINCT f2) as view_features
+            RETURN hub.listing_id as property_id,
+                   hub.listing_price as price,
+                   n.name as neighborhood,
+                   c.name as city,
+                   connectivity,
+                   avg_sim_score,
+                   recreation_features,
+                   view_features,
+                   hub.price_per_sqft as price_per_sqft
+            ORDER BY connectivity DESC, avg_sim_score DESC
+            LIMIT 3
+        """,
+        'arbitrage': """
+            MATCH (p1:Property)-[:LOCATED_IN]->(n1:Neighborhood)-[:IN_CITY]->(c:City),
+                  (p2:Property)-[:LOCATED_IN]->(n2:Neighborhood)-[:IN_CITY]->(c)
+            WHERE n1.name <> n2.name
+            WITH n1, n2, c, avg(p1.listing_price) as avg_price1, avg(p2.listing_price) as avg_price2
+            WHERE abs(avg_price1 - avg_price2) > 500000
+            RETURN n1.name as neighborhood1, n2.name as neighborhood2,
+                   avg_price1, avg_price2,
+                   abs(avg_price1 - avg_price2) as price_gap,
+                   c.name as city
+            ORDER BY price_gap DESC
+            LIMIT 3
+        """,
+    },
+    'demo_6_complex_graph_traversals': {
+        # NEO4J CYPHER QUERY:
+        # Variable-length path patterns for feature chains
+        # - [:RELATIONSHIP*min..max] defines variable length paths
+        # - path = ... binds entire path to a variable
+        # - nodes(path) extracts all nodes from path
+        # - length(path) returns number of relationships
+        # - List comprehension filters Feature nodes from path
+        'chains': """
+            MATCH path = (start:Property)-[:HAS_FEATURE*2..6]-(end:Property)
+            WHERE start.listing_id < end.listing_id
+            AND start <> end
+            WITH start, end, length(path) as chain_length,
+                 [n IN nodes(path) WHERE n:Feature | n.name] as features
+            WHERE size(features) >= 2
+            MATCH (start)-[:LOCATED_IN]->(n1:Neighborhood)
+            MATCH (end)-[:LOCATED_IN]->(n2:Neighborhood)
+            RETURN start.listing_id as start_property,
+                   end.listing_id as end_property,
+                   start.listing_price as start_price,
+                   end.listing_price as end_price,
+                   n1.name as start_neighborhood,
+                   n2.name as end_neighborhood,
+                   chain_length,
+                   features[0..3] as connecting_features
+            ORDER BY chain_length ASC
+            LIMIT 3
+        """,
+        # NEO4J CYPHER QUERY:
+        # Feature influence analysis using negative patterns
+        # - IN operator tests list membership for luxury features
+        # - Shared neighborhood traversal pattern
+        # - NOT (...) pattern checks for absence of relationship
+        # - Finds properties WITHOUT luxury features in same neighborhood
+        'propagation': """
+            MATCH (premium:Property)-[:HAS_FEATURE]->(luxury:Feature)
+            WHERE luxury.name IN ['Wine cellar', 'Home theater', 'Elevator', 'Pool/spa']
+            MATCH (premium)-[:LOCATED_IN]->(n:Neighborhood)<-[:LOCATED_IN]-(influenced:Property)
+            WHERE NOT (influenced)-[:HAS_FEATURE]->(luxury)
+              AND premium <> influenced
+            MATCH (influenced)-[:LOCATED_IN]->(n:Neighborhood)
+            WITH luxury.name as luxury_feature,
+                 count(DISTINCT influenced) as influenced_count,
+                 avg(influenced.listing_price) as avg_influenced_price,
+                 collect(DISTINCT n.name)[0..3] as influenced_neighborhoods
+            WHERE influenced_count >= 3
+            RETURN luxury_feature,
+                   influenced_count,
+                   avg_influenced_price,
+                   influenced_neighborhoods
+            ORDER BY influenced_count DESC
+        """,
+        'bridges': """
+            MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
+            WITH p, collect(DISTINCT f.category) as categories
+            WHERE size(categories) >= 5
+            MATCH (p)-[:LOCATED_IN]->(n:Neighborhood)
+            RETURN p.listing_id as property_id,
+                   p.listing_price as listing_price,
+                   n.name as neighborhood,
+                   categories,
+                   size(categories) as category_count
+            ORDER BY category_count DESC
+            LIMIT 3
+        """,
+    },
+}
 
 
 class GraphRelationshipAnalysisDemo:
     """Comprehensive demonstration of graph relationship analysis capabilities"""
     
-    def __init__(self):
-        """Initialize the demo with database connection"""
+    def __init__(self, analytics_backend: Optional[str] = None):
+        """Initialize the demo with database connection
+        
+        Args:
+            analytics_backend: 'neo4j' or 'duckdb' for the market aggregates
+                (default: market_analytics.backend setting)
+        """
         print("Initializing Graph Relationship Analysis Demo...")
         
         print("\n🚀 NEO4J FEATURES DEMONSTRATED:")
@@ -59,26 +422,48 @@ class GraphRelationshipAnalysisDemo:
         
         self.driver = get_neo4j_driver()
         
+        # Independent queries run concurrently on the async driver
+        self.concurrent = ConcurrentQueryExecutor(get_settings().database)
+        
+        # Price aggregates come from Neo4j or the DuckDB gold tables
+        self.market_config = get_settings().market_analytics
+        backend = analytics_backend or self.market_config.backend
+        self.analytics = create_market_analytics(backend, self.driver, self.market_config)
+        print(f"Market aggregates backend: {backend}")
+        
         # Verify database state
-        node_count = self._get_node_count()
-        relationship_count = self._get_relationship_count()
+        node_count, relationship_count = self._get_graph_counts()
         
         print(f"Connected to graph database:")
         print(f"   {node_count:,} nodes across 7 types")
         print(f"   {relationship_count:,} relationships across 8 types")
         print(f"   Ready for advanced graph analysis")
     
-    def _get_node_count(self) -> int:
-        """Get total node count"""
-        result = run_query(self.driver, "MATCH (n) RETURN count(n) as count")
-        return result[0]['count'] if result else 0
+    def _get_graph_counts(self) -> Tuple[int, int]:
+        """Get total node and relationship counts"""
+        nodes, relationships = self.concurrent.run_all([
+            "MATCH (n) RETURN count(n) as count",
+            "MATCH ()-[r]->() RETURN count(r) as count"
+        ])
+        return (
+            nodes[0]['count'] if nodes else 0,
+            relationships[0]['count'] if relationships else 0
+        )
     
-    def _get_relationship_count(self) -> int:
-        """Get total relationship count"""
-        result = run_query(self.driver, "MATCH ()-[r]->() RETURN count(r) as count")
-        return result[0]['count'] if result else 0
+    def fetch_sections(self, sections: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run the queries of demo sections in one concurrent batch
+        
+        Args:
+            sections: Section method names (keys of SECTION_QUERIES)
+            
+        Returns:
+            Result rows by query name
+        """
+        queries = {name: query for section in sections for name, query in SECTION_QUERIES[section].items()}
+        return dict(zip(queries, self.concurrent.run_all(list(queries.values()))))
     
-    def demo_1_property_relationships(self):
+    def demo_1_property_relationships(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Demo 1: Property location relationships and neighborhood analysis"""
         print("\n" + "="*80 + "\n")
         print("DEMO 2A: PROPERTY LOCATION RELATIONSHIPS")
@@ -97,25 +482,7 @@ class GraphRelationshipAnalysisDemo:
         # - Groups by neighborhood and calculates statistics
         # - ORDER BY sorts results by property count (descending)
         # - LIMIT restricts output to top 10 results
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WITH n, count(p) as property_count,
-             avg(p.listing_price) as avg_price,
-             min(p.listing_price) as min_price,
-             max(p.listing_price) as max_price
-        
-        RETURN n.name as neighborhood,
-               n.city as city,
-               n.state as state,
-               property_count,
-               avg_price,
-               min_price,
-               max_price
-        ORDER BY property_count DESC
-        LIMIT 10
-        """
-        
-        neighborhoods = run_query(self.driver, query)
+        neighborhoods = self.analytics.run('neighborhood_price_stats')
         for i, hood in enumerate(neighborhoods, 1):
             print(f"\n{i}. {hood['neighborhood']}, {hood['city']}, {hood['state']}")
             print(f"   Properties: {hood['property_count']}")
@@ -134,20 +501,7 @@ class GraphRelationshipAnalysisDemo:
         # - percentileCont() calculates continuous percentiles (Q1, median, Q3)
         # - Useful for understanding price distribution
         # - Returns comprehensive statistical summary
-        query = """
-        MATCH (p:Property)
-        WITH p.listing_price as price
-        RETURN 
-            count(*) as total_properties,
-            avg(price) as avg_price,
-            percentileCont(price, 0.25) as q1_price,
-            percentileCont(price, 0.5) as median_price,
-            percentileCont(price, 0.75) as q3_price,
-            min(price) as min_price,
-            max(price) as max_price
-        """
-        
-        price_stats = run_query(self.driver, query)
+        price_stats = self.analytics.run('price_distribution')
         if price_stats and len(price_stats) > 0:
             stats = price_stats[0]
             print(f"   Total properties: {stats['total_properties']:,}")
@@ -166,38 +520,14 @@ class GraphRelationshipAnalysisDemo:
         print("\n\nHIGH-VALUE PROPERTY CLUSTERS:")
         print("   Neighborhoods with highest concentration of luxury properties (>$2M)")
         
-        # NEO4J CYPHER QUERY:
-        # Multi-stage query comparing luxury properties to total properties
-        # Stage 1: Find luxury properties (>$2M) and their neighborhoods
-        # Stage 2: Filter to neighborhoods with at least 3 luxury properties
-        # Stage 3: Find ALL properties in these neighborhoods
-        # Stage 4: Calculate luxury percentage as derived field
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WHERE p.listing_price > 2000000
-        WITH n, count(p) as luxury_count, avg(p.listing_price) as avg_luxury_price
-        WHERE luxury_count >= 3
-        MATCH (n)<-[:LOCATED_IN]-(all_props:Property)
-        WITH n, luxury_count, avg_luxury_price, count(all_props) as total_props
-        RETURN n.name as neighborhood,
-               n.city as city,
-               luxury_count,
-               total_props,
-               (luxury_count * 100.0 / total_props) as luxury_percentage,
-               avg_luxury_price
-        
-        ORDER BY luxury_percentage DESC
-        LIMIT 5
-        """
-        
-        luxury_areas = run_query(self.driver, query)
+        luxury_areas = fetched['luxury_areas']
         for area in luxury_areas:
             print(f"\n{area['neighborhood']}, {area['city']}")
             print(f"   Luxury properties: {area['luxury_count']} of {area['total_props']} ({area['luxury_percentage']:.1f}%)")
             avg_luxury_price = area.get('avg_luxury_price') or 0
             print(f"   Average luxury price: ${avg_luxury_price:,.0f}")
     
-    def demo_2_wikipedia_relationships(self):
+    def demo_2_wikipedia_relationships(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Demo 2: Wikipedia article relationships and location descriptions"""
         print("\n" + "="*80 + "\n")
         print("DEMO 2B: WIKIPEDIA ARTICLE RELATIONSHIPS")
@@ -208,33 +538,7 @@ class GraphRelationshipAnalysisDemo:
         print("\nWIKIPEDIA-NEIGHBORHOOD RELATIONSHIPS:")
         print("   Wikipedia articles that provide detailed descriptions of neighborhoods")
         
-        # NEO4J CYPHER QUERY:
-        # Knowledge graph integration with Wikipedia articles
-        # - collect() aggregates values into a list/array
-        # - [0..3] array slicing gets first 3 elements
-        # - Shows Neo4j's ability to integrate external knowledge
-        query = """
-        MATCH (w:WikipediaArticle)-[:DESCRIBES]->(n:Neighborhood)
-        WITH n, count(w) as article_count,
-             collect(w.title)[0..3] as sample_articles
-        WHERE article_count > 0
-        MATCH (n)<-[:LOCATED_IN]-(p:Property)
-        WITH n, article_count, sample_articles,
-             count(p) as property_count,
-             avg(p.listing_price) as avg_price
-        
-        RETURN n.name as neighborhood,
-               n.city as city,
-               n.state as state,
-               article_count,
-               sample_articles,
-               property_count,
-               avg_price
-        ORDER BY article_count DESC
-        LIMIT 10
-        """
-        
-        wiki_neighborhoods = run_query(self.driver, query)
+        wiki_neighborhoods = fetched['wiki_neighborhoods']
         for wiki in wiki_neighborhoods:
             print(f"\n{wiki['neighborhood']}, {wiki['city']}, {wiki['state']}")
             print(f"   Wikipedia articles: {wiki['article_count']}")
@@ -246,31 +550,7 @@ class GraphRelationshipAnalysisDemo:
         print("\n\nMOST DOCUMENTED LOCATIONS:")
         print("   Areas with the richest Wikipedia content coverage")
         
-        query = """
-        MATCH (w:WikipediaArticle)-[:DESCRIBES]->(n:Neighborhood)
-        WITH w, n, size(w.text) as article_length
-        WHERE article_length > 1000
-        WITH n, 
-             count(w) as detailed_articles,
-             avg(article_length) as avg_article_length,
-             sum(article_length) as total_content_length
-        MATCH (n)<-[:LOCATED_IN]-(p:Property)
-        WITH n, detailed_articles, avg_article_length, total_content_length,
-             count(p) as property_count,
-             avg(p.listing_price) as avg_price
-        WHERE detailed_articles >= 2
-        RETURN n.name as neighborhood,
-               n.city as city,
-               detailed_articles,
-               avg_article_length,
-               total_content_length,
-               property_count,
-               avg_price
-        ORDER BY total_content_length DESC
-        LIMIT 5
-        """
-        
-        documented_areas = run_query(self.driver, query)
+        documented_areas = fetched['documented_areas']
         for area in documented_areas:
             print(f"\n{area['neighborhood']}, {area['city']}")
             print(f"   Detailed articles: {area['detailed_articles']}")
@@ -280,7 +560,7 @@ class GraphRelationshipAnalysisDemo:
             print(f"   Avg article length: {avg_article_length:,.0f} characters")
             print(f"   Properties: {area['property_count']} (avg: ${avg_price:,.0f})")
     
-    def demo_3_geographic_hierarchies(self):
+    def demo_3_geographic_hierarchies(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Demo 3: Geographic relationship hierarchies using PART_OF relationships"""
         print("\n" + "="*80 + "\n")
         print("DEMO 2C: GEOGRAPHIC RELATIONSHIP HIERARCHIES")
@@ -291,17 +571,7 @@ class GraphRelationshipAnalysisDemo:
         print("\nGEOGRAPHIC PART_OF RELATIONSHIPS:")
         print("   Analyzing hierarchical geographic relationships")
         
-        query = """
-        MATCH (child)-[:PART_OF]->(parent)
-        RETURN child.name as child_name,
-               labels(child)[0] as child_type,
-               parent.name as parent_name,
-               labels(parent)[0] as parent_type
-        ORDER BY parent_name, child_name
-        LIMIT 20
-        """
-        
-        hierarchy = run_query(self.driver, query)
+        hierarchy = fetched['hierarchy']
         current_parent = None
         
         for rel in hierarchy:
@@ -315,19 +585,7 @@ class GraphRelationshipAnalysisDemo:
         print("\n\nPROPERTY DISTRIBUTION BY LOCATION:")
         print("   Properties distributed across geographic regions")
         
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WITH n.city as city, n.state as state,
-             count(p) as property_count,
-             avg(p.listing_price) as avg_price,
-             min(p.listing_price) as min_price,
-             max(p.listing_price) as max_price
-        RETURN city, state, property_count, avg_price, min_price, max_price
-        ORDER BY property_count DESC
-        LIMIT 10
-        """
-        
-        distribution = run_query(self.driver, query)
+        distribution = fetched['distribution']
         for area in distribution:
             print(f"\n{area['city']}, {area['state']}")
             print(f"   Properties: {area['property_count']}")
@@ -341,35 +599,7 @@ class GraphRelationshipAnalysisDemo:
         print("\n\n NEIGHBORHOOD PROXIMITY NETWORKS:")
         print("   Analyzing 200 NEAR relationships between neighborhoods")
         
-        # NEO4J CYPHER QUERY:
-        # Bidirectional relationship analysis of connected neighborhoods
-        # - WHERE n1.name < n2.name prevents duplicate pairs (A->B and B->A)
-        # - Two separate MATCH clauses for parallel traversal
-        # - abs() function calculates absolute value for price differences
-        query = """
-        MATCH (n1:Neighborhood)-[:NEAR]->(n2:Neighborhood)
-        WHERE n1.name < n2.name
-        MATCH (n1)<-[:LOCATED_IN]-(p1:Property)
-        MATCH (n2)<-[:LOCATED_IN]-(p2:Property)
-        WITH n1, n2, 
-             avg(p1.listing_price) as avg_price1,
-             avg(p2.listing_price) as avg_price2,
-             count(p1) as properties1,
-             count(p2) as properties2
-        RETURN n1.name as neighborhood1,
-               n2.name as neighborhood2,
-               n1.city as city,
-               avg_price1,
-               avg_price2,
-               abs(avg_price1 - avg_price2) as price_difference,
-               properties1,
-               properties2
-        
-        ORDER BY price_difference DESC
-        LIMIT 5
-        """
-        
-        proximity_analysis = run_query(self.driver, query)
+        proximity_analysis = fetched['proximity_analysis']
         print("\n   Neighboring areas with largest price differences:")
         for prox in proximity_analysis:
             print(f"   {prox['neighborhood1']} <-> {prox['neighborhood2']} ({prox['city']})")
@@ -382,9 +612,9 @@ class GraphRelationshipAnalysisDemo:
         
         # Cross-city comparison through graph traversal
         print("\n\nCROSS-CITY MARKET COMPARISON:")
-        self._analyze_cross_city_patterns()
+        self._analyze_cross_city_patterns(fetched)
     
-    def demo_4_lifestyle_communities(self):
+    def demo_4_lifestyle_communities(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Demo 4: Neighborhood lifestyle analysis and community insights"""
         print("\n" + "="*80 + "\n")
         print("DEMO 2D: LIFESTYLE COMMUNITIES & SOCIAL PATTERNS")
@@ -394,40 +624,7 @@ class GraphRelationshipAnalysisDemo:
         # Lifestyle tag distribution and property characteristics
         print("\nLIFESTYLE TAG ANALYSIS:")
         
-        # NEO4J CYPHER QUERY EXPLANATION:
-        # Array processing with UNWIND - expands arrays into individual rows.
-        # IS NOT NULL - checks for property existence
-        # collect(DISTINCT ...) - creates unique lists
-        query = """
-        MATCH (n:Neighborhood)<-[:LOCATED_IN]-(p:Property)
-        WHERE n.lifestyle_tags IS NOT NULL
-        // Find neighborhoods with lifestyle_tags array property
-        -- IS NOT NULL checks property exists and has value
-        
-        UNWIND n.lifestyle_tags as lifestyle_tag
-        -- UNWIND expands array into rows (like Python's itertools.chain)
-        -- Each lifestyle tag becomes a separate row for processing
-        
-        WITH lifestyle_tag, 
-             collect(DISTINCT n.city) as cities,
-             count(DISTINCT n) as neighborhoods,
-             count(p) as properties,
-             avg(p.listing_price) as avg_price,
-             avg(p.price_per_sqft) as avg_price_per_sqft
-        -- Group by lifestyle_tag after unwinding
-        -- collect(DISTINCT ...) creates array of unique values
-        -- count(DISTINCT ...) counts unique occurrences
-        
-        RETURN lifestyle_tag,
-               cities,
-               neighborhoods,
-               properties,
-               avg_price,
-               avg_price_per_sqft
-        ORDER BY avg_price DESC
-        """
-        
-        lifestyle_analysis = run_query(self.driver, query)
+        lifestyle_analysis = fetched['lifestyle_analysis']
         for lifestyle in lifestyle_analysis:
             print(f"\n{lifestyle['lifestyle_tag'].upper()}")
             print(f"   Cities: {', '.join(lifestyle['cities'])}")
@@ -441,39 +638,7 @@ class GraphRelationshipAnalysisDemo:
         print("\n\n LIFESTYLE COMPATIBILITY MATRIX:")
         print("   Neighborhoods sharing multiple lifestyle characteristics")
         
-        # NEO4J CYPHER QUERY:
-        # Lifestyle compatibility analysis using list comprehension
-        # - Cartesian product creates all neighborhood pairs
-        # - List comprehension [var IN array WHERE condition] finds shared tags
-        # - size() function counts shared tags
-        # - Filters to pairs sharing at least 2 lifestyle tags
-        query = """
-        MATCH (n1:Neighborhood), (n2:Neighborhood)
-        WHERE n1.name < n2.name 
-          AND n1.lifestyle_tags IS NOT NULL 
-          AND n2.lifestyle_tags IS NOT NULL
-        WITH n1, n2,
-             [tag IN n1.lifestyle_tags WHERE tag IN n2.lifestyle_tags] as shared_tags,
-             size([tag IN n1.lifestyle_tags WHERE tag IN n2.lifestyle_tags]) as shared_count
-        WHERE shared_count >= 2
-        MATCH (n1)<-[:LOCATED_IN]-(p1:Property)
-        MATCH (n2)<-[:LOCATED_IN]-(p2:Property)
-        WITH n1, n2, shared_tags, shared_count,
-             avg(p1.listing_price) as avg_price1,
-             avg(p2.listing_price) as avg_price2
-        RETURN n1.name as neighborhood1,
-               n1.city as city1,
-               n2.name as neighborhood2,
-               n2.city as city2,
-               shared_tags,
-               shared_count,
-               avg_price1,
-               avg_price2
-        ORDER BY shared_count DESC, abs(avg_price1 - avg_price2)
-        LIMIT 5
-        """
-        
-        compatibility = run_query(self.driver, query)
+        compatibility = fetched['compatibility']
         for comp in compatibility:
             print(f"\n{comp['neighborhood1']} ({comp['city1']}) <-> {comp['neighborhood2']} ({comp['city2']})")
             print(f"   Shared lifestyle: {', '.join(comp['shared_tags'])}")
@@ -483,9 +648,9 @@ class GraphRelationshipAnalysisDemo:
         
         # Feature-lifestyle correlation
         print("\n\nLIFESTYLE-FEATURE CORRELATION:")
-        self._analyze_lifestyle_feature_correlation()
+        self._analyze_lifestyle_feature_correlation(fetched)
     
-    def demo_5_investment_patterns(self):
+    def demo_5_investment_patterns(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Demo 5: Investment opportunity discovery through relationship patterns"""
         print("\n" + "="*80 + "\n")
         print("DEMO 2E: INVESTMENT PATTERN DISCOVERY")
@@ -496,37 +661,7 @@ class GraphRelationshipAnalysisDemo:
         print("\nUNDERVALUED OPPORTUNITIES:")
         print("   Properties priced below neighborhood average with high similarity scores")
         
-        # NEO4J CYPHER QUERY:
-        # Investment opportunity analysis through multi-stage processing
-        # Stage 1: Calculate neighborhood average prices
-        # Stage 2: Find properties 15% below neighborhood average
-        # Stage 3: Validate with similar property relationships (sim.score > 0.8)
-        # Stage 4: Filter to properties with 3+ similar matches
-        # Stage 5: Collect features and calculate potential upside
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WITH n, avg(p.listing_price) as neighborhood_avg
-        MATCH (target:Property)-[:LOCATED_IN]->(n)
-        WHERE target.listing_price < neighborhood_avg * 0.85
-        MATCH (target)-[sim:SIMILAR_TO]->(similar:Property)
-        WHERE sim.score > 0.8
-        WITH target, n, neighborhood_avg, count(similar) as high_similarity_count,
-             avg(sim.score) as avg_similarity_score
-        WHERE high_similarity_count >= 3
-        MATCH (target)-[:HAS_FEATURE]->(f:Feature)
-        RETURN target.listing_id as property_id,
-               target.listing_price as price,
-               neighborhood_avg,
-               (neighborhood_avg - target.listing_price) as potential_upside,
-               n.name as neighborhood,
-               high_similarity_count,
-               avg_similarity_score,
-               collect(DISTINCT f.name)[0..5] as key_features
-        ORDER BY potential_upside DESC
-        LIMIT 3
-        """
-        
-        opportunities = run_query(self.driver, query)
+        opportunities = fetched['opportunities']
         for opp in opportunities:
             print(f"\n{opp['property_id']}")
             listing_price = opp.get('listing_price') or 0
@@ -543,30 +678,7 @@ class GraphRelationshipAnalysisDemo:
         print("\n\nINVESTMENT HUBS:")
         print("   Properties with exceptional connectivity indicating market influence")
         
-        query = """
-        MATCH (hub:Property)-[sim:SIMILAR_TO]->(connected:Property)
-        WITH hub, count(connected) as connectivity, avg(sim.score) as avg_sim_score
-        WHERE connectivity >= 8
-        MATCH (hub)-[:LOCATED_IN]->(n:Neighborhood)-[:IN_CITY]->(c:City)
-        OPTIONAL MATCH (hub)-[:HAS_FEATURE]->(f:Feature {category: 'Recreation'})
-        OPTIONAL MATCH (hub)-[:HAS_FEATURE]->(f2:Feature {category: 'View'})
-        WITH hub, n, c, connectivity, avg_sim_score,
-             count(DISTINCT f) as recreation_features,
-             count(DISTINCT f2) as view_features
-        RETURN hub.listing_id as property_id,
-               hub.listing_price as price,
-               n.name as neighborhood,
-               c.name as city,
-               connectivity,
-               avg_sim_score,
-               recreation_features,
-               view_features,
-               hub.price_per_sqft as price_per_sqft
-        ORDER BY connectivity DESC, avg_sim_score DESC
-        LIMIT 3
-        """
-        
-        hubs = run_query(self.driver, query)
+        hubs = fetched['hubs']
         for hub in hubs:
             print(f"\n{hub['property_id']} (Investment Hub)")
             listing_price = hub.get('listing_price') or 0
@@ -579,9 +691,9 @@ class GraphRelationshipAnalysisDemo:
         
         # Market segment arbitrage opportunities
         print("\n\nMARKET SEGMENT ARBITRAGE:")
-        self._analyze_market_arbitrage_opportunities()
+        self._analyze_market_arbitrage_opportunities(fetched)
     
-    def demo_6_complex_graph_traversals(self):
+    def demo_6_complex_graph_traversals(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Demo 6: Complex multi-hop graph traversals"""
         print("\n" + "="*80 + "\n")
         print("DEMO 2F: COMPLEX MULTI-HOP GRAPH TRAVERSALS")
@@ -592,35 +704,7 @@ class GraphRelationshipAnalysisDemo:
         print("\nFEATURE CONNECTION CHAINS:")
         print("   Properties connected through shared feature paths")
         
-        # NEO4J CYPHER QUERY:
-        # Variable-length path patterns for feature chains
-        # - [:RELATIONSHIP*min..max] defines variable length paths
-        # - path = ... binds entire path to a variable
-        # - nodes(path) extracts all nodes from path
-        # - length(path) returns number of relationships
-        # - List comprehension filters Feature nodes from path
-        query = """
-        MATCH path = (start:Property)-[:HAS_FEATURE*2..6]-(end:Property)
-        WHERE start.listing_id < end.listing_id
-        AND start <> end
-        WITH start, end, length(path) as chain_length,
-             [n IN nodes(path) WHERE n:Feature | n.name] as features
-        WHERE size(features) >= 2
-        MATCH (start)-[:LOCATED_IN]->(n1:Neighborhood)
-        MATCH (end)-[:LOCATED_IN]->(n2:Neighborhood)
-        RETURN start.listing_id as start_property,
-               end.listing_id as end_property,
-               start.listing_price as start_price,
-               end.listing_price as end_price,
-               n1.name as start_neighborhood,
-               n2.name as end_neighborhood,
-               chain_length,
-               features[0..3] as connecting_features
-        ORDER BY chain_length ASC
-        LIMIT 3
-        """
-        
-        chains = run_query(self.driver, query)
+        chains = fetched['chains']
         for chain in chains:
             print(f"\nFeature Chain (length {chain['chain_length']}):")
             start_price = chain.get('start_price') or 0
@@ -633,32 +717,7 @@ class GraphRelationshipAnalysisDemo:
         print("\n\nFEATURE INFLUENCE PROPAGATION:")
         print("   How premium features influence connected properties")
         
-        # NEO4J CYPHER QUERY:
-        # Feature influence analysis using negative patterns
-        # - IN operator tests list membership for luxury features
-        # - Shared neighborhood traversal pattern
-        # - NOT (...) pattern checks for absence of relationship
-        # - Finds properties WITHOUT luxury features in same neighborhood
-        query = """
-        MATCH (premium:Property)-[:HAS_FEATURE]->(luxury:Feature)
-        WHERE luxury.name IN ['Wine cellar', 'Home theater', 'Elevator', 'Pool/spa']
-        MATCH (premium)-[:LOCATED_IN]->(n:Neighborhood)<-[:LOCATED_IN]-(influenced:Property)
-        WHERE NOT (influenced)-[:HAS_FEATURE]->(luxury)
-          AND premium <> influenced
-        MATCH (influenced)-[:LOCATED_IN]->(n:Neighborhood)
-        WITH luxury.name as luxury_feature,
-             count(DISTINCT influenced) as influenced_count,
-             avg(influenced.listing_price) as avg_influenced_price,
-             collect(DISTINCT n.name)[0..3] as influenced_neighborhoods
-        WHERE influenced_count >= 3
-        RETURN luxury_feature,
-               influenced_count,
-               avg_influenced_price,
-               influenced_neighborhoods
-        ORDER BY influenced_count DESC
-        """
-        
-        propagation = run_query(self.driver, query)
+        propagation = fetched['propagation']
         for prop in propagation:
             print(f"\n{prop['luxury_feature']} influence:")
             print(f"   Influences {prop['influenced_count']} similar properties")
@@ -668,7 +727,7 @@ class GraphRelationshipAnalysisDemo:
         
         # Cross-category feature bridges
         print("\n\nCROSS-CATEGORY FEATURE BRIDGES:")
-        self._analyze_feature_category_bridges()
+        self._analyze_feature_category_bridges(fetched)
     
     def _analyze_similarity_network(self, property_id: str) -> str:
         """Analyze the feature network for a specific property"""
@@ -751,20 +810,9 @@ class GraphRelationshipAnalysisDemo:
             avg_with_feature = inf.get('avg_with_feature') or 0
             print(f"      Avg price: ${avg_with_feature:,.0f} ({inf['properties_with_feature']} properties)")
     
-    def _analyze_cross_city_patterns(self):
+    def _analyze_cross_city_patterns(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Analyze patterns across cities"""
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)-[:IN_CITY]->(c:City)
-        WITH c.name as city,
-             avg(p.listing_price) as avg_price,
-             avg(p.price_per_sqft) as avg_price_per_sqft,
-             count(p) as properties,
-             count(DISTINCT n) as neighborhoods
-        RETURN city, avg_price, avg_price_per_sqft, properties, neighborhoods
-        ORDER BY avg_price DESC
-        """
-        
-        cities = run_query(self.driver, query)
+        cities = fetched['cities']
         print("   Cross-city market comparison:")
         for city in cities:
             avg_price = city.get('avg_price') or 0
@@ -772,19 +820,9 @@ class GraphRelationshipAnalysisDemo:
             print(f"   {city['city']}: ${avg_price:,.0f} avg (${avg_price_per_sqft:.0f}/sqft)")
             print(f"      {city['properties']} properties across {city['neighborhoods']} neighborhoods")
     
-    def _analyze_lifestyle_feature_correlation(self):
+    def _analyze_lifestyle_feature_correlation(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Analyze correlation between lifestyle tags and features"""
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)-[:HAS_FEATURE]->(f:Feature)
-        WHERE n.lifestyle_tags IS NOT NULL
-        UNWIND n.lifestyle_tags as lifestyle
-        WITH lifestyle, f.category as feature_category, count(p) as correlation_count
-        WHERE correlation_count >= 5
-        RETURN lifestyle, feature_category, correlation_count
-        ORDER BY lifestyle, correlation_count DESC
-        """
-        
-        correlations = run_query(self.driver, query)
+        correlations = fetched['correlations']
         lifestyle_groups = defaultdict(list)
         for corr in correlations:
             lifestyle_groups[corr['lifestyle']].append(f"{corr['feature_category']} ({corr['correlation_count']})")
@@ -792,23 +830,9 @@ class GraphRelationshipAnalysisDemo:
         for lifestyle, features in lifestyle_groups.items():
             print(f"   {lifestyle}: {', '.join(features[:3])}")
     
-    def _analyze_market_arbitrage_opportunities(self):
+    def _analyze_market_arbitrage_opportunities(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Analyze market arbitrage opportunities"""
-        query = """
-        MATCH (p1:Property)-[:LOCATED_IN]->(n1:Neighborhood)-[:IN_CITY]->(c:City),
-              (p2:Property)-[:LOCATED_IN]->(n2:Neighborhood)-[:IN_CITY]->(c)
-        WHERE n1.name <> n2.name
-        WITH n1, n2, c, avg(p1.listing_price) as avg_price1, avg(p2.listing_price) as avg_price2
-        WHERE abs(avg_price1 - avg_price2) > 500000
-        RETURN n1.name as neighborhood1, n2.name as neighborhood2,
-               avg_price1, avg_price2,
-               abs(avg_price1 - avg_price2) as price_gap,
-               c.name as city
-        ORDER BY price_gap DESC
-        LIMIT 3
-        """
-        
-        arbitrage = run_query(self.driver, query)
+        arbitrage = fetched['arbitrage']
         print("   Largest intra-city price gaps:")
         for arb in arbitrage:
             print(f"   {arb['neighborhood1']} vs {arb['neighborhood2']} ({arb['city']})")
@@ -818,23 +842,9 @@ class GraphRelationshipAnalysisDemo:
             print(f"      ${avg_price1:,.0f} vs ${avg_price2:,.0f}")
             print(f"      Gap: ${price_gap:,.0f}")
     
-    def _analyze_feature_category_bridges(self):
+    def _analyze_feature_category_bridges(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Analyze properties that bridge different feature categories"""
-        query = """
-        MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
-        WITH p, collect(DISTINCT f.category) as categories
-        WHERE size(categories) >= 5
-        MATCH (p)-[:LOCATED_IN]->(n:Neighborhood)
-        RETURN p.listing_id as property_id,
-               p.listing_price as listing_price,
-               n.name as neighborhood,
-               categories,
-               size(categories) as category_count
-        ORDER BY category_count DESC
-        LIMIT 3
-        """
-        
-        bridges = run_query(self.driver, query)
+        bridges = fetched['bridges']
         print("   Properties bridging multiple feature categories:")
         for bridge in bridges:
             listing_price = bridge.get('listing_price') or 0
@@ -852,18 +862,24 @@ class GraphRelationshipAnalysisDemo:
         # Show actual relationship statistics
         print("Relationship Statistics:")
         relationships = ["LOCATED_IN", "PART_OF", "DESCRIBES"]
-        for rel_type in relationships:
-            query = f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count"
-            result = run_query(self.driver, query)
+        results = self.concurrent.run_all([
+            f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count" for rel_type in relationships
+        ])
+        for rel_type, result in zip(relationships, results):
             count = result[0]['count'] if result and len(result) > 0 else 0
             print(f"  {rel_type}: {count}")
         print()
         
         try:
-            # Run all demo sections
-            self.demo_1_property_relationships()
-            self.demo_2_wikipedia_relationships()
-            self.demo_3_geographic_hierarchies()
+            # Fetch every section's queries up front, then print the sections
+            sections = [
+                self.demo_1_property_relationships,
+                self.demo_2_wikipedia_relationships,
+                self.demo_3_geographic_hierarchies
+            ]
+            fetched = self.fetch_sections([section.__name__ for section in sections])
+            for section in sections:
+                section(fetched)
             
             # Summary
             print("\n" + "" + "="*80)
@@ -888,18 +904,37 @@ class GraphRelationshipAnalysisDemo:
             import traceback
             traceback.print_exc()
     
+    def compare_backends(self):
+        """Print uncached Neo4j vs DuckDB latency for this demo's market aggregates"""
+        print("\n" + "="*80)
+        print("MARKET AGGREGATES: NEO4J VS DUCKDB LATENCY (uncached, best of 3)")
+        print("="*82)
+        neo4j, duckdb = Neo4jMarketAnalytics(self.driver), DuckDBMarketAnalytics(self.market_config)
+        try:
+            print(format_latency_comparison(compare_latency(neo4j, duckdb, MARKET_QUERY_NAMES)))
+        finally:
+            duckdb.close()
+    
     def close(self):
         """Clean up resources"""
+        self.analytics.close()
         if self.driver:
             close_neo4j_driver()
 
 
-def main():
-    """Main function to run the graph relationship analysis demo"""
+def main(analytics_backend: Optional[str] = None, compare_backends: bool = False):
+    """Main function to run the graph relationship analysis demo
+    
+    Args:
+        analytics_backend: 'neo4j' or 'duckdb' for the market aggregates
+        compare_backends: Print Neo4j vs DuckDB latency for the market aggregates
+    """
     demo = None
     try:
-        demo = GraphRelationshipAnalysisDemo()
+        demo = GraphRelationshipAnalysisDemo(analytics_backend)
         demo.run_complete_demo()
+        if compare_backends:
+            demo.compare_backends()
     except KeyboardInterrupt:
         print("\n\nDemo interrupted by user")
     except Exception as e:
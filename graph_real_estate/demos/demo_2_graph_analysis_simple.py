@@ -29,6 +29,8 @@ import numpy as np
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.database import get_neo4j_driver, close_neo4j_driver, run_query
+from graph_real_estate.config import get_settings
+from graph_real_estate.core.async_query_executor import ConcurrentQueryExecutor
 
 
 class GraphAnalysisDemo:
@@ -52,6 +54,9 @@ class GraphAnalysisDemo:
         
         self.driver = get_neo4j_driver()
         
+        # Independent queries of a section run concurrently on the async driver
+        self.concurrent = ConcurrentQueryExecutor(get_settings().database)
+        
         # Check database statistics
         self._show_database_stats()
     
@@ -59,32 +64,38 @@ class GraphAnalysisDemo:
         """Show database statistics"""
         print("\nDatabase Statistics:")
         
-        # Count nodes
         node_types = ['Property', 'Neighborhood', 'Feature', 'City', 'County']
-        for node_type in node_types:
-            query = f"MATCH (n:{node_type}) RETURN count(n) as count"
-            result = run_query(self.driver, query)
+        rel_types = ['LOCATED_IN', 'HAS_FEATURE', 'IN_CITY', 'IN_COUNTY', 'NEAR']
+        embedding_query = """
+        MATCH (p:Property)
+        RETURN count(p) as total,
+               count(CASE WHEN p.embedding IS NOT NULL THEN 1 END) as with_embeddings
+        """
+        
+        # Node counts, relationship counts and embedding coverage in one batch
+        results = self.concurrent.run_all(
+            [f"MATCH (n:{node_type}) RETURN count(n) as count" for node_type in node_types]
+            + [f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count" for rel_type in rel_types]
+            + [embedding_query]
+        )
+        node_results = results[:len(node_types)]
+        rel_results = results[len(node_types):-1]
+        
+        # Count nodes
+        for node_type, result in zip(node_types, node_results):
             if result:
                 print(f"  {node_type}: {result[0]['count']}")
         
         # Count relationships
         print("\nRelationships:")
-        rel_types = ['LOCATED_IN', 'HAS_FEATURE', 'IN_CITY', 'IN_COUNTY', 'NEAR']
-        for rel_type in rel_types:
-            query = f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count"
-            result = run_query(self.driver, query)
+        for rel_type, result in zip(rel_types, rel_results):
             if result:
                 count = result[0]['count']
                 if count > 0:
                     print(f"  {rel_type}: {count}")
         
         # Check embeddings
-        query = """
-        MATCH (p:Property)
-        RETURN count(p) as total,
-               count(CASE WHEN p.embedding IS NOT NULL THEN 1 END) as with_embeddings
-        """
-        result = run_query(self.driver, query)
+        result = results[-1]
         if result:
             total = result[0]['total']
             with_emb = result[0]['with_embeddings']
@@ -210,7 +221,7 @@ class GraphAnalysisDemo:
         print("=" * 80)
         
         # Popular features
-        query = """
+        popular_query = """
         MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
         RETURN f.name as feature,
                f.category as category,
@@ -219,17 +230,8 @@ class GraphAnalysisDemo:
         LIMIT 10
         """
         
-        results = run_query(self.driver, query)
-        
-        if results:
-            print("\nTop 10 Most Common Features:")
-            for i, feat in enumerate(results, 1):
-                print(f"{i:2}. {feat.get('feature', 'Unknown')}: {feat.get('property_count', 0)} properties")
-                if feat.get('category'):
-                    print(f"     Category: {feat['category']}")
-        
         # Feature co-occurrence
-        query = """
+        cooccurrence_query = """
         MATCH (f1:Feature)<-[:HAS_FEATURE]-(p:Property)-[:HAS_FEATURE]->(f2:Feature)
         WHERE f1.name < f2.name
         WITH f1.name as feature1, f2.name as feature2, count(p) as cooccurrence
@@ -239,11 +241,18 @@ class GraphAnalysisDemo:
         LIMIT 10
         """
         
-        results = run_query(self.driver, query)
+        results, cooccurrence = self.concurrent.run_all([popular_query, cooccurrence_query])
         
         if results:
+            print("\nTop 10 Most Common Features:")
+            for i, feat in enumerate(results, 1):
+                print(f"{i:2}. {feat.get('feature', 'Unknown')}: {feat.get('property_count', 0)} properties")
+                if feat.get('category'):
+                    print(f"     Category: {feat['category']}")
+        
+        if cooccurrence:
             print("\n\nFeature Co-occurrence (appears together):")
-            for i, pair in enumerate(results, 1):
+            for i, pair in enumerate(cooccurrence, 1):
                 print(f"{i:2}. {pair.get('feature1', 'N/A')} + {pair.get('feature2', 'N/A')}: {pair.get('cooccurrence', 0)} properties")
     
     def demo_neighborhood_proximity(self):
@@ -21,7 +21,7 @@ that would be extremely difficult with traditional relational databases.
 import sys
 import signal
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 import json
 
 # Handle broken pipe errors gracefully when piping output
@@ -32,16 +32,338 @@ if hasattr(signal, 'SIGPIPE'):
 sys.path.append(str(Path(__file__).parent))
 
 from database import get_neo4j_driver
-from database.neo4j_client import run_query
 from vectors import PropertyEmbeddingPipeline, HybridPropertySearch
 from vectors.config_loader import get_embedding_config, get_vector_index_config, get_search_config
+from graph_real_estate.config import get_settings
+from graph_real_estate.core.async_query_executor import ConcurrentQueryExecutor
+from graph_real_estate.analytics.market import (
+    MarketAnalytics,
+    Neo4jMarketAnalytics,
+    DuckDBMarketAnalytics,
+    create_market_analytics,
+    compare_latency,
+    format_latency_comparison
+)
+
+# Market aggregates this demo reads through MarketAnalytics
+MARKET_QUERY_NAMES = [
+    'city_overview',
+    'neighborhood_segments',
+    'feature_premiums',
+    'price_anomalies',
+    'undervalued_neighborhoods',
+    'feature_cooccurrence'
+]
+
+
+# Cypher queries of each analysis section by result name. They do not
+# depend on each other, so all of them are fetched in one concurrent batch.
+SECTION_QUERIES: Dict[str, Dict[str, str]] = {
+    'geographic_market_analysis': {
+        # NEO4J CYPHER QUERY: Cross-Neighborhood Arbitrage Analysis
+        # - Cartesian product for pairwise neighborhood comparison
+        # - Calculates price per sqft differences between neighborhoods
+        # - WITH * passes all previous variables forward
+        # - Filters to significant price differences (>30%)
+        'geographic_arbitrage_analysis': """
+            MATCH (p1:Property)-[:LOCATED_IN]->(n1:Neighborhood),
+                  (p2:Property)-[:LOCATED_IN]->(n2:Neighborhood)
+            WHERE n1 <> n2 AND n1.city = n2.city AND p1.square_feet > 0 AND p2.square_feet > 0
+            WITH n1.name as Neighborhood1, n2.name as Neighborhood2, n1.city as City,
+                 avg(p1.listing_price / p1.square_feet) as PricePerSqft1,
+                 avg(p2.listing_price / p2.square_feet) as PricePerSqft2,
+                 count(p1) as Properties1, count(p2) as Properties2
+            WHERE Properties1 >= 3 AND Properties2 >= 3
+            WITH *, abs(PricePerSqft1 - PricePerSqft2) as PriceDelta,
+                 (PricePerSqft1 - PricePerSqft2) / ((PricePerSqft1 + PricePerSqft2) / 2) * 100 as PercentDiff
+            WHERE abs(PercentDiff) > 30
+            RETURN City, Neighborhood1, Neighborhood2, 
+                   PricePerSqft1, PricePerSqft2, PercentDiff as ArbitragePercent
+            ORDER BY abs(PercentDiff) DESC
+            LIMIT 10
+        """,
+    },
+    'price_prediction_analysis': {
+        'property_type_market_analysis': """
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+            WITH p.property_type as PropertyType, n.city as City,
+                 count(p) as Count,
+                 avg(p.listing_price) as AvgPrice,
+                 min(p.listing_price) as MinPrice,
+                 max(p.listing_price) as MaxPrice,
+                 avg(p.listing_price / CASE WHEN p.square_feet > 0 THEN p.square_feet ELSE 1 END) as PricePerSqft
+            WHERE Count >= 3
+            RETURN PropertyType, City, Count, AvgPrice, MinPrice, MaxPrice, PricePerSqft
+            ORDER BY PropertyType, AvgPrice DESC
+        """,
+    },
+    'investment_opportunity_analysis': {
+        'emerging_market_indicators': """
+            // Find areas with diverse property types and growing feature adoption
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+            OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f:Feature)
+        
+            WITH n,
+                 count(DISTINCT p) as PropertyCount,
+                 count(DISTINCT p.property_type) as PropertyTypeDiversity,
+                 count(DISTINCT f.category) as FeatureCategoryDiversity,
+                 avg(p.listing_price) as AvgPrice,
+                 collect(DISTINCT p.property_type) as PropertyTypes
+            WHERE PropertyCount >= 5
+        
+            // Calculate diversity score
+            WITH *, (PropertyTypeDiversity * FeatureCategoryDiversity) as DiversityScore
+        
+            RETURN n.city as City, n.name as Neighborhood,
+                   PropertyCount, AvgPrice, DiversityScore,
+                   PropertyTypeDiversity, FeatureCategoryDiversity,
+                   PropertyTypes, n.lifestyle_tags as LifestyleTags
+            ORDER BY DiversityScore DESC
+            LIMIT 10
+        """,
+    },
+    'lifestyle_market_segmentation': {
+        # NEO4J CYPHER QUERY: Array Processing with UNWIND
+        # - UNWIND converts lifestyle_tags array into individual rows
+        # - Each tag becomes a separate row for processing
+        # - collect() re-aggregates data after UNWIND
+        'lifestyle_preference_markets': """
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+            WHERE n.lifestyle_tags IS NOT NULL
+            UNWIND n.lifestyle_tags as LifestyleTag
+        
+            MATCH (p)-[:IN_NEIGHBORHOOD]->(n:Neighborhood)
+        
+            WITH LifestyleTag, n.city as City,
+                 count(DISTINCT p) as PropertyCount,
+                 avg(p.listing_price) as AvgPrice,
+                 count(DISTINCT n) as NeighborhoodCount,
+                 collect(DISTINCT n.name)[0..3] as SampleNeighborhoods
+            WHERE PropertyCount >= 5
+        
+            RETURN LifestyleTag, City, PropertyCount, AvgPrice, 
+                   NeighborhoodCount, SampleNeighborhoods
+            ORDER BY LifestyleTag, AvgPrice DESC
+        """,
+        'lifestyle_feature_correlation_matrix': """
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+            WHERE n.lifestyle_tags IS NOT NULL
+            UNWIND n.lifestyle_tags as LifestyleTag
+        
+            MATCH (p)-[:HAS_FEATURE]->(f:Feature)
+            WITH LifestyleTag, f.name as Feature, f.category as Category,
+                 count(p) as PropertyCount,
+                 avg(p.listing_price) as AvgPrice
+            WHERE PropertyCount >= 3
+        
+            // Calculate correlation strength
+            MATCH (allProps:Property)-[:HAS_FEATURE]->(f2:Feature {name: Feature})
+            WITH LifestyleTag, Feature, Category, PropertyCount, AvgPrice,
+                 count(allProps) as TotalWithFeature
+        
+            MATCH (lifestyleProps:Property)-[:LOCATED_IN]->(ln:Neighborhood)
+            WHERE LifestyleTag IN ln.lifestyle_tags
+            WITH LifestyleTag, Feature, Category, PropertyCount, AvgPrice,
+                 TotalWithFeature, count(lifestyleProps) as TotalLifestyleProps
+        
+            WITH *, (toFloat(PropertyCount) / TotalLifestyleProps) as LifestyleAdoption,
+                 (toFloat(PropertyCount) / TotalWithFeature) as FeatureConcentration
+            WHERE LifestyleAdoption > 0.3 AND FeatureConcentration > 0.2
+        
+            RETURN LifestyleTag, Feature, Category, 
+                   LifestyleAdoption, FeatureConcentration, AvgPrice
+            ORDER BY LifestyleAdoption DESC
+            LIMIT 20
+        """,
+        'market_size_by_lifestyle_segment': """
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+            WHERE n.lifestyle_tags IS NOT NULL
+        
+            WITH n.city as City, n.lifestyle_tags as LifestyleTags,
+                 count(p) as PropertyCount,
+                 avg(p.listing_price) as AvgPrice,
+                 sum(p.listing_price) as TotalMarketValue
+        
+            UNWIND LifestyleTags as Tag
+            WITH City, Tag, 
+                 sum(PropertyCount) as TotalProperties,
+                 avg(AvgPrice) as MarketAvgPrice,
+                 sum(TotalMarketValue) as MarketValue
+        
+            RETURN Tag as LifestyleSegment, City,
+                   TotalProperties, MarketAvgPrice, MarketValue,
+                   MarketValue / 1000000 as MarketValueMillion
+            ORDER BY MarketValue DESC
+            LIMIT 15
+        """,
+    },
+    'feature_impact_analysis': {
+        'feature_category_performance_analysis': """
+            MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
+            WITH f.category as Category,
+                 count(DISTINCT p) as PropertyCount,
+                 avg(p.listing_price) as AvgPrice,
+                 collect(DISTINCT f.name) as Features
+            WHERE PropertyCount >= 10
+        
+            // Compare to properties without features in this category
+            MATCH (p2:Property)
+            WHERE NOT (p2)-[:HAS_FEATURE]->(:Feature {category: Category})
+            WITH Category, PropertyCount, AvgPrice, Features,
+                 avg(p2.listing_price) as BaselinePrice, count(p2) as BaselineCount
+            WHERE BaselineCount >= 20
+        
+            WITH *, (AvgPrice - BaselinePrice) as CategoryPremium,
+                 (AvgPrice - BaselinePrice) / BaselinePrice * 100 as PremiumPercent
+        
+            RETURN Category, PropertyCount, AvgPrice, BaselinePrice,
+                   CategoryPremium, PremiumPercent, size(Features) as FeatureVariety
+            ORDER BY PremiumPercent DESC
+        """,
+        'feature_rarity_exclusivity_analysis': """
+            MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
+            WITH f.name as Feature, f.category as Category,
+                 count(p) as PropertyCount,
+                 avg(p.listing_price) as AvgPrice,
+                 max(p.listing_price) as MaxPrice
+        
+            MATCH (allProps:Property)
+            WITH Feature, Category, PropertyCount, AvgPrice, MaxPrice,
+                 count(allProps) as TotalProperties
+        
+            WITH *, (toFloat(PropertyCount) / TotalProperties) as RarityScore,
+                 CASE 
+                    WHEN PropertyCount <= 3 THEN 'Ultra-Rare'
+                    WHEN PropertyCount <= 10 THEN 'Rare' 
+                    WHEN PropertyCount <= 25 THEN 'Uncommon'
+                    ELSE 'Common'
+                 END as RarityLevel
+            WHERE PropertyCount <= 25  // Focus on rare features
+        
+            RETURN Feature, Category, PropertyCount, RarityLevel,
+                   RarityScore, AvgPrice, MaxPrice
+            ORDER BY RarityScore ASC, AvgPrice DESC
+        """,
+    },
+    'competitive_market_intelligence': {
+        # NEO4J CYPHER QUERY: Competitive Clustering Analysis
+        # Two-stage aggregation to find competitive property clusters:
+        # Stage 1: Count shared features between property pairs
+        # Stage 2: Analyze competitive network for each property
+        # Properties with many competitors form competitive clusters
+        'competitive_property_clusters': """
+            MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)<-[:HAS_FEATURE]-(similar:Property)
+            WHERE p <> similar
+        
+            WITH p, similar, count(DISTINCT f) as SharedFeatures
+            WHERE SharedFeatures >= 5
+        
+            WITH p, count(DISTINCT similar) as CompetitorCount,
+                 avg(SharedFeatures) as AvgSharedFeatures,
+                 collect(DISTINCT similar.listing_id)[0..5] as CompetingProperties
+            WHERE CompetitorCount >= 3
+        
+            MATCH (p)-[:IN_NEIGHBORHOOD]->(n:Neighborhood)
+            OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f:Feature)
+        
+            RETURN p.listing_id as PropertyID, p.listing_price as Price,
+                   n.city + ", " + n.name as Location,
+                   CompetitorCount, AvgSharedFeatures,
+                   CompetingProperties, collect(DISTINCT f.name)[0..5] as TopFeatures
+            ORDER BY CompetitorCount DESC, AvgSharedFeatures DESC
+            LIMIT 10
+        """,
+        'market_positioning_analysis': """
+            // Analyze positioning within price bands and feature categories
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+            OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f:Feature)
+        
+            WITH p, n,
+                 collect(DISTINCT f.category) as FeatureCategories,
+                 size([(p)-[:HAS_FEATURE]->(:Feature) | 1]) as FeatureCount,
+                 CASE 
+                    WHEN p.listing_price > 8000000 THEN 'Ultra-Luxury'
+                    WHEN p.listing_price > 3000000 THEN 'Luxury'
+                    WHEN p.listing_price > 1500000 THEN 'Premium'
+                    WHEN p.listing_price > 800000 THEN 'Mid-Market'
+                    ELSE 'Affordable'
+                 END as PriceBand
+        
+            // Count competitive density in same price band and neighborhood
+            MATCH (comp:Property)-[:IN_NEIGHBORHOOD]->(n)
+            WHERE comp <> p AND 
+                  CASE 
+                    WHEN p.listing_price > 8000000 THEN comp.listing_price > 8000000
+                    WHEN p.listing_price > 3000000 THEN comp.listing_price > 3000000 AND comp.listing_price <= 8000000
+                    WHEN p.listing_price > 1500000 THEN comp.listing_price > 1500000 AND comp.listing_price <= 3000000
+                    WHEN p.listing_price > 800000 THEN comp.listing_price > 800000 AND comp.listing_price <= 1500000
+                    ELSE comp.listing_price <= 800000
+                  END
+        
+            WITH p, n, FeatureCategories, FeatureCount, PriceBand,
+                 count(comp) as DirectCompetitors
+        
+            // Analyze feature differentiation through shared features
+            OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f2:Feature)<-[:HAS_FEATURE]-(similar:Property)
+            WHERE similar <> p
+        
+            WITH p, n, FeatureCategories, FeatureCount, PriceBand, DirectCompetitors,
+                 count(DISTINCT similar) as PropertiesWithSharedFeatures
+        
+            RETURN p.listing_id as PropertyID, p.listing_price as Price,
+                   n.city as City, n.name as Neighborhood, PriceBand,
+                   FeatureCount, FeatureCategories, DirectCompetitors,
+                   PropertiesWithSharedFeatures
+            ORDER BY DirectCompetitors DESC, FeatureCount DESC
+            LIMIT 15
+        """,
+        'market_gap_analysis': """
+            // Find underserved market segments
+            MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+            OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f:Feature)
+        
+            WITH n.city as City, p.property_type as PropertyType,
+                 CASE 
+                    WHEN p.listing_price > 5000000 THEN 'Ultra-Luxury'
+                    WHEN p.listing_price > 2000000 THEN 'Luxury'
+                    WHEN p.listing_price > 1000000 THEN 'Premium'
+                    WHEN p.listing_price > 500000 THEN 'Mid-Market'
+                    ELSE 'Affordable'
+                 END as PriceBand,
+                 collect(DISTINCT f.category) as FeatureCategories,
+                 count(p) as PropertyCount
+        
+            WITH City, PropertyType, PriceBand, 
+                 size(collect(DISTINCT FeatureCategories)) as FeatureCategoryVariety,
+                 PropertyCount
+            WHERE PropertyCount > 0
+        
+            // Identify gaps (low supply in certain segments)
+            WITH City, PropertyType, 
+                 collect({band: PriceBand, count: PropertyCount, variety: FeatureCategoryVariety}) as PriceBandData
+        
+            UNWIND PriceBandData as bandData
+            WITH City, PropertyType, bandData.band as PriceBand, 
+                 bandData.count as Count, bandData.variety as Variety
+            WHERE Count <= 3  // Low competition segments
+        
+            RETURN City, PropertyType, PriceBand, Count as Supply, Variety as FeatureVariety,
+                   CASE WHEN Count <= 1 THEN 'MAJOR GAP' WHEN Count <= 3 THEN 'OPPORTUNITY' ELSE 'COMPETITIVE' END as MarketStatus
+            ORDER BY Count ASC, Variety DESC
+            LIMIT 15
+        """,
+    },
+}
 
 
 class MarketIntelligenceAnalyzer:
     """Advanced market intelligence using graph relationships and vector embeddings"""
     
-    def __init__(self, driver):
+    def __init__(self, driver, analytics: Optional[MarketAnalytics] = None):
         self.driver = driver
+        self.concurrent = ConcurrentQueryExecutor(get_settings().database)
+        # Price and feature aggregates come from Neo4j or the DuckDB gold tables
+        self.analytics = analytics or Neo4jMarketAnalytics(driver)
         
         # Initialize search capabilities
         try:
@@ -71,6 +393,18 @@ class MarketIntelligenceAnalyzer:
             print(f"Vector search not available: {e}")
             self.embeddings_available = False
 
+    def fetch_sections(self, sections: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Run the queries of analysis sections in one concurrent batch
+        
+        Args:
+            sections: Section method names (keys of SECTION_QUERIES)
+            
+        Returns:
+            Result rows by query name
+        """
+        queries = {name: query for section in sections for name, query in SECTION_QUERIES[section].items()}
+        return dict(zip(queries, self.concurrent.run_all(list(queries.values()))))
+
     def print_section_header(self, title: str, description: str = ""):
         """Print formatted section header"""
         print(f"\n{'='*80}")
@@ -86,7 +420,7 @@ class MarketIntelligenceAnalyzer:
 
     # ===== SECTION 1: GEOGRAPHIC MARKET ANALYSIS =====
     
-    def geographic_market_analysis(self):
+    def geographic_market_analysis(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Comprehensive geographic market analysis with graph intelligence"""
         self.print_section_header(
             "Geographic Market Analysis",
@@ -99,19 +433,7 @@ class MarketIntelligenceAnalyzer:
         # - Aggregation with DISTINCT counting and collect() function
         # - Groups properties by city and calculates statistics
         # - collect(DISTINCT ...) creates array of unique property types
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WITH n.city as City, 
-             count(DISTINCT n) as Neighborhoods,
-             count(p) as Properties,
-             avg(p.listing_price) as AvgPrice,
-             min(p.listing_price) as MinPrice,
-             max(p.listing_price) as MaxPrice,
-             collect(DISTINCT p.property_type) as PropertyTypes
-        RETURN City, Neighborhoods, Properties, AvgPrice, MinPrice, MaxPrice, PropertyTypes
-        ORDER BY Properties DESC
-        """
-        results = run_query(self.driver, query)
+        results = self.analytics.run('city_overview')
         
         for r in results:
             print(f"{r['City']}")
@@ -130,29 +452,7 @@ class MarketIntelligenceAnalyzer:
         # - Groups neighborhoods into market segments based on avg price
         # - First aggregation calculates neighborhood metrics
         # - Second WITH adds market segment classification
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WITH n,
-             count(p) as PropertyCount,
-             avg(p.listing_price) as AvgPrice,
-             avg(p.square_feet) as AvgSqft,
-             collect(DISTINCT p.property_type) as PropertyTypes
-        WHERE PropertyCount >= 5
-        WITH n, PropertyCount, AvgPrice, AvgSqft, PropertyTypes,
-             CASE
-                WHEN AvgPrice > 8000000 THEN 'Ultra-Luxury'
-                WHEN AvgPrice > 3000000 THEN 'Luxury' 
-                WHEN AvgPrice > 1500000 THEN 'Premium'
-                WHEN AvgPrice > 800000 THEN 'Mid-Market'
-                ELSE 'Affordable'
-             END as MarketSegment
-        RETURN n.city as City, n.name as Neighborhood, MarketSegment,
-               PropertyCount, AvgPrice, AvgSqft, PropertyTypes,
-               n.lifestyle_tags as LifestyleTags
-        ORDER BY AvgPrice DESC
-        LIMIT 15
-        """
-        results = run_query(self.driver, query)
+        results = self.analytics.run('neighborhood_segments')
         
         for r in results:
             print(f"{r['Neighborhood']}, {r['City']} [{r['MarketSegment']}]")
@@ -165,29 +465,7 @@ class MarketIntelligenceAnalyzer:
 
         # Geographic arbitrage opportunities
         self.print_subsection("Geographic Arbitrage Analysis")
-        # NEO4J CYPHER QUERY: Cross-Neighborhood Arbitrage Analysis
-        # - Cartesian product for pairwise neighborhood comparison
-        # - Calculates price per sqft differences between neighborhoods
-        # - WITH * passes all previous variables forward
-        # - Filters to significant price differences (>30%)
-        query = """
-        MATCH (p1:Property)-[:LOCATED_IN]->(n1:Neighborhood),
-              (p2:Property)-[:LOCATED_IN]->(n2:Neighborhood)
-        WHERE n1 <> n2 AND n1.city = n2.city AND p1.square_feet > 0 AND p2.square_feet > 0
-        WITH n1.name as Neighborhood1, n2.name as Neighborhood2, n1.city as City,
-             avg(p1.listing_price / p1.square_feet) as PricePerSqft1,
-             avg(p2.listing_price / p2.square_feet) as PricePerSqft2,
-             count(p1) as Properties1, count(p2) as Properties2
-        WHERE Properties1 >= 3 AND Properties2 >= 3
-        WITH *, abs(PricePerSqft1 - PricePerSqft2) as PriceDelta,
-             (PricePerSqft1 - PricePerSqft2) / ((PricePerSqft1 + PricePerSqft2) / 2) * 100 as PercentDiff
-        WHERE abs(PercentDiff) > 30
-        RETURN City, Neighborhood1, Neighborhood2, 
-               PricePerSqft1, PricePerSqft2, PercentDiff as ArbitragePercent
-        ORDER BY abs(PercentDiff) DESC
-        LIMIT 10
-        """
-        results = run_query(self.driver, query)
+        results = fetched['geographic_arbitrage_analysis']
         
         print("Top Geographic Arbitrage Opportunities:")
         for r in results:
@@ -201,7 +479,7 @@ class MarketIntelligenceAnalyzer:
 
     # ===== SECTION 2: PRICE PREDICTION & TRENDS =====
     
-    def price_prediction_analysis(self):
+    def price_prediction_analysis(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Advanced price prediction using feature correlations and graph patterns"""
         self.print_section_header(
             "Price Prediction & Trends Analysis", 
@@ -216,29 +494,7 @@ class MarketIntelligenceAnalyzer:
         # Stage 2: Find properties WITHOUT feature using NOT pattern
         # Stage 3: Calculate baseline price from properties without feature
         # Stage 4: Calculate premium percentage feature adds to value
-        query = """
-        MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
-        WITH f.name as Feature, f.category as Category,
-             count(p) as PropertyCount,
-             avg(p.listing_price) as AvgPriceWithFeature,
-             collect(p.listing_price) as Prices
-        WHERE PropertyCount >= 5
-        
-        MATCH (p2:Property)
-        WHERE NOT (p2)-[:HAS_FEATURE]->(:Feature {name: Feature})
-        WITH Feature, Category, PropertyCount, AvgPriceWithFeature, Prices,
-             avg(p2.listing_price) as BaselinePrice, count(p2) as BaselineCount
-        WHERE BaselineCount >= 10
-        
-        WITH *, (AvgPriceWithFeature - BaselinePrice) as PricePremium,
-             (AvgPriceWithFeature - BaselinePrice) / BaselinePrice * 100 as PremiumPercent
-        
-        RETURN Feature, Category, PropertyCount, 
-               AvgPriceWithFeature, BaselinePrice, PricePremium, PremiumPercent
-        ORDER BY PremiumPercent DESC
-        LIMIT 15
-        """
-        results = run_query(self.driver, query)
+        results = self.analytics.run('feature_premiums')
         
         print("Top Value-Adding Features:")
         for r in results:
@@ -255,19 +511,7 @@ class MarketIntelligenceAnalyzer:
 
         # Property type pricing intelligence
         self.print_subsection("Property Type Market Analysis")
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WITH p.property_type as PropertyType, n.city as City,
-             count(p) as Count,
-             avg(p.listing_price) as AvgPrice,
-             min(p.listing_price) as MinPrice,
-             max(p.listing_price) as MaxPrice,
-             avg(p.listing_price / CASE WHEN p.square_feet > 0 THEN p.square_feet ELSE 1 END) as PricePerSqft
-        WHERE Count >= 3
-        RETURN PropertyType, City, Count, AvgPrice, MinPrice, MaxPrice, PricePerSqft
-        ORDER BY PropertyType, AvgPrice DESC
-        """
-        results = run_query(self.driver, query)
+        results = fetched['property_type_market_analysis']
         
         current_type = None
         for r in results:
@@ -290,30 +534,7 @@ class MarketIntelligenceAnalyzer:
         # - UNWIND expands array back into rows
         # - Z-score calculation identifies outliers (>2 std dev)
         # - OPTIONAL MATCH handles properties without features
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WITH n, 
-             collect(p) as Properties,
-             avg(p.listing_price) as NeighborhoodAvg,
-             stdev(p.listing_price) as PriceStdDev
-        WHERE size(Properties) >= 5 AND PriceStdDev > 0
-        
-        UNWIND Properties as prop
-        WITH prop, n, NeighborhoodAvg, PriceStdDev,
-             abs(prop.listing_price - NeighborhoodAvg) / PriceStdDev as ZScore
-        WHERE ZScore > 2.0
-        
-        MATCH (prop)-[:IN_NEIGHBORHOOD]->(n:Neighborhood)
-        OPTIONAL MATCH (prop)-[:HAS_FEATURE]->(f:Feature)
-        
-        RETURN prop.listing_id as PropertyID, prop.listing_price as Price,
-               NeighborhoodAvg, ZScore, n.city + ", " + n.name as Location,
-               collect(DISTINCT f.name)[0..5] as TopFeatures,
-               CASE WHEN prop.listing_price > NeighborhoodAvg THEN 'OVERPRICED' ELSE 'UNDERPRICED' END as Anomaly
-        ORDER BY ZScore DESC
-        LIMIT 10
-        """
-        results = run_query(self.driver, query)
+        results = self.analytics.run('price_anomalies')
         
         print("Price Anomalies (Statistical Outliers):")
         for r in results:
@@ -327,7 +548,7 @@ class MarketIntelligenceAnalyzer:
 
     # ===== SECTION 3: INVESTMENT OPPORTUNITY DISCOVERY =====
     
-    def investment_opportunity_analysis(self):
+    def investment_opportunity_analysis(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Discover investment opportunities using graph-based market intelligence"""
         self.print_section_header(
             "Investment Opportunity Discovery",
@@ -336,34 +557,7 @@ class MarketIntelligenceAnalyzer:
         
         # Undervalued market segments
         self.print_subsection("Undervalued Market Segments")
-        query = """
-        // Simplified approach: Find neighborhoods with above-average features but below-average prices
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WITH n, count(p) as PropertyCount,
-             avg(p.listing_price) as AvgPrice,
-             avg(size([(p)-[:HAS_FEATURE]->(:Feature) | 1])) as AvgFeaturesPerProperty
-        WHERE PropertyCount >= 5
-        
-        // Get city averages for comparison
-        MATCH (cityProps:Property)-[:IN_NEIGHBORHOOD]->(:Neighborhood {city: n.city})
-        WITH n, PropertyCount, AvgPrice, AvgFeaturesPerProperty,
-             avg(cityProps.listing_price) as CityAvgPrice,
-             avg(size([(cityProps)-[:HAS_FEATURE]->(:Feature) | 1])) as CityAvgFeatures
-        
-        WITH *, (AvgPrice / CityAvgPrice) as PriceRatio,
-             (AvgFeaturesPerProperty / CityAvgFeatures) as FeatureRatio
-        
-        // Find undervalued: above-average features, below-average price
-        WHERE FeatureRatio > 1.1 AND PriceRatio < 0.9
-        
-        RETURN n.city as City, n.name as Neighborhood,
-               AvgPrice, PropertyCount, AvgFeaturesPerProperty,
-               PriceRatio, FeatureRatio,
-               n.lifestyle_tags as LifestyleTags
-        ORDER BY (FeatureRatio / PriceRatio) DESC
-        LIMIT 8
-        """
-        results = run_query(self.driver, query)
+        results = self.analytics.run('undervalued_neighborhoods')
         
         print("Undervalued Neighborhoods (High Features, Lower Prices):")
         for r in results:
@@ -377,30 +571,7 @@ class MarketIntelligenceAnalyzer:
 
         # Emerging market indicators
         self.print_subsection("Emerging Market Indicators")
-        query = """
-        // Find areas with diverse property types and growing feature adoption
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f:Feature)
-        
-        WITH n,
-             count(DISTINCT p) as PropertyCount,
-             count(DISTINCT p.property_type) as PropertyTypeDiversity,
-             count(DISTINCT f.category) as FeatureCategoryDiversity,
-             avg(p.listing_price) as AvgPrice,
-             collect(DISTINCT p.property_type) as PropertyTypes
-        WHERE PropertyCount >= 5
-        
-        // Calculate diversity score
-        WITH *, (PropertyTypeDiversity * FeatureCategoryDiversity) as DiversityScore
-        
-        RETURN n.city as City, n.name as Neighborhood,
-               PropertyCount, AvgPrice, DiversityScore,
-               PropertyTypeDiversity, FeatureCategoryDiversity,
-               PropertyTypes, n.lifestyle_tags as LifestyleTags
-        ORDER BY DiversityScore DESC
-        LIMIT 10
-        """
-        results = run_query(self.driver, query)
+        results = fetched['emerging_market_indicators']
         
         print("Emerging Markets (High Diversity & Growth Potential):")
         for r in results:
@@ -444,7 +615,7 @@ class MarketIntelligenceAnalyzer:
 
     # ===== SECTION 4: LIFESTYLE MARKET SEGMENTATION =====
     
-    def lifestyle_market_segmentation(self):
+    def lifestyle_market_segmentation(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Analyze market segments based on lifestyle preferences and demographics"""
         self.print_section_header(
             "Lifestyle Market Segmentation",
@@ -453,29 +624,7 @@ class MarketIntelligenceAnalyzer:
         
         # Lifestyle tag market analysis
         self.print_subsection("Lifestyle Preference Markets")
-        # NEO4J CYPHER QUERY: Array Processing with UNWIND
-        # - UNWIND converts lifestyle_tags array into individual rows
-        # - Each tag becomes a separate row for processing
-        # - collect() re-aggregates data after UNWIND
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WHERE n.lifestyle_tags IS NOT NULL
-        UNWIND n.lifestyle_tags as LifestyleTag
-        
-        MATCH (p)-[:IN_NEIGHBORHOOD]->(n:Neighborhood)
-        
-        WITH LifestyleTag, n.city as City,
-             count(DISTINCT p) as PropertyCount,
-             avg(p.listing_price) as AvgPrice,
-             count(DISTINCT n) as NeighborhoodCount,
-             collect(DISTINCT n.name)[0..3] as SampleNeighborhoods
-        WHERE PropertyCount >= 5
-        
-        RETURN LifestyleTag, City, PropertyCount, AvgPrice, 
-               NeighborhoodCount, SampleNeighborhoods
-        ORDER BY LifestyleTag, AvgPrice DESC
-        """
-        results = run_query(self.driver, query)
+        results = fetched['lifestyle_preference_markets']
         
         current_lifestyle = None
         for r in results:
@@ -489,37 +638,7 @@ class MarketIntelligenceAnalyzer:
 
         # Lifestyle-feature correlation analysis
         self.print_subsection("Lifestyle-Feature Correlation Matrix")
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WHERE n.lifestyle_tags IS NOT NULL
-        UNWIND n.lifestyle_tags as LifestyleTag
-        
-        MATCH (p)-[:HAS_FEATURE]->(f:Feature)
-        WITH LifestyleTag, f.name as Feature, f.category as Category,
-             count(p) as PropertyCount,
-             avg(p.listing_price) as AvgPrice
-        WHERE PropertyCount >= 3
-        
-        // Calculate correlation strength
-        MATCH (allProps:Property)-[:HAS_FEATURE]->(f2:Feature {name: Feature})
-        WITH LifestyleTag, Feature, Category, PropertyCount, AvgPrice,
-             count(allProps) as TotalWithFeature
-        
-        MATCH (lifestyleProps:Property)-[:LOCATED_IN]->(ln:Neighborhood)
-        WHERE LifestyleTag IN ln.lifestyle_tags
-        WITH LifestyleTag, Feature, Category, PropertyCount, AvgPrice,
-             TotalWithFeature, count(lifestyleProps) as TotalLifestyleProps
-        
-        WITH *, (toFloat(PropertyCount) / TotalLifestyleProps) as LifestyleAdoption,
-             (toFloat(PropertyCount) / TotalWithFeature) as FeatureConcentration
-        WHERE LifestyleAdoption > 0.3 AND FeatureConcentration > 0.2
-        
-        RETURN LifestyleTag, Feature, Category, 
-               LifestyleAdoption, FeatureConcentration, AvgPrice
-        ORDER BY LifestyleAdoption DESC
-        LIMIT 20
-        """
-        results = run_query(self.driver, query)
+        results = fetched['lifestyle_feature_correlation_matrix']
         
         print("Strong Lifestyle-Feature Correlations:")
         for r in results:
@@ -533,28 +652,7 @@ class MarketIntelligenceAnalyzer:
 
         # Demographic market sizing
         self.print_subsection("Market Size by Lifestyle Segment")
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WHERE n.lifestyle_tags IS NOT NULL
-        
-        WITH n.city as City, n.lifestyle_tags as LifestyleTags,
-             count(p) as PropertyCount,
-             avg(p.listing_price) as AvgPrice,
-             sum(p.listing_price) as TotalMarketValue
-        
-        UNWIND LifestyleTags as Tag
-        WITH City, Tag, 
-             sum(PropertyCount) as TotalProperties,
-             avg(AvgPrice) as MarketAvgPrice,
-             sum(TotalMarketValue) as MarketValue
-        
-        RETURN Tag as LifestyleSegment, City,
-               TotalProperties, MarketAvgPrice, MarketValue,
-               MarketValue / 1000000 as MarketValueMillion
-        ORDER BY MarketValue DESC
-        LIMIT 15
-        """
-        results = run_query(self.driver, query)
+        results = fetched['market_size_by_lifestyle_segment']
         
         print("Market Size by Lifestyle Segment:")
         for r in results:
@@ -566,7 +664,7 @@ class MarketIntelligenceAnalyzer:
 
     # ===== SECTION 5: FEATURE IMPACT ANALYSIS =====
     
-    def feature_impact_analysis(self):
+    def feature_impact_analysis(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Deep analysis of feature impacts on pricing and market dynamics"""
         self.print_section_header(
             "Feature Impact Analysis",
@@ -575,29 +673,7 @@ class MarketIntelligenceAnalyzer:
         
         # Feature category performance analysis
         self.print_subsection("Feature Category Performance Analysis")
-        query = """
-        MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
-        WITH f.category as Category,
-             count(DISTINCT p) as PropertyCount,
-             avg(p.listing_price) as AvgPrice,
-             collect(DISTINCT f.name) as Features
-        WHERE PropertyCount >= 10
-        
-        // Compare to properties without features in this category
-        MATCH (p2:Property)
-        WHERE NOT (p2)-[:HAS_FEATURE]->(:Feature {category: Category})
-        WITH Category, PropertyCount, AvgPrice, Features,
-             avg(p2.listing_price) as BaselinePrice, count(p2) as BaselineCount
-        WHERE BaselineCount >= 20
-        
-        WITH *, (AvgPrice - BaselinePrice) as CategoryPremium,
-             (AvgPrice - BaselinePrice) / BaselinePrice * 100 as PremiumPercent
-        
-        RETURN Category, PropertyCount, AvgPrice, BaselinePrice,
-               CategoryPremium, PremiumPercent, size(Features) as FeatureVariety
-        ORDER BY PremiumPercent DESC
-        """
-        results = run_query(self.driver, query)
+        results = fetched['feature_category_performance_analysis']
         
         print("Feature Category Market Impact:")
         for r in results:
@@ -620,36 +696,7 @@ class MarketIntelligenceAnalyzer:
         # - split() function extracts feature names from pair string
         # - toFloat() ensures decimal division
         # - Lift > 1 indicates positive correlation
-        query = """
-        MATCH (f1:Feature)<-[:HAS_FEATURE]-(p:Property)-[:HAS_FEATURE]->(f2:Feature)
-        WHERE f1.name < f2.name
-        
-        WITH f1.name + " + " + f2.name as FeaturePair,
-             f1.category + " + " + f2.category as CategoryPair,
-             count(p) as CoOccurrenceCount,
-             avg(p.listing_price) as AvgPriceWithBoth,
-             collect(DISTINCT p.listing_id)[0..3] as SampleProperties
-        WHERE CoOccurrenceCount >= 5
-        
-        MATCH (pf1:Property)-[:HAS_FEATURE]->(f1Feature:Feature {name: split(FeaturePair, " + ")[0]})
-        MATCH (pf2:Property)-[:HAS_FEATURE]->(f2Feature:Feature {name: split(FeaturePair, " + ")[1]})
-        
-        WITH FeaturePair, CategoryPair, CoOccurrenceCount, AvgPriceWithBoth, SampleProperties,
-             count(DISTINCT pf1) as Feature1Count, count(DISTINCT pf2) as Feature2Count
-        
-        MATCH (allProps:Property)
-        WITH FeaturePair, CategoryPair, CoOccurrenceCount, AvgPriceWithBoth, SampleProperties,
-             Feature1Count, Feature2Count, count(allProps) as TotalProperties
-        
-        WITH *, (toFloat(CoOccurrenceCount) * TotalProperties) / (Feature1Count * Feature2Count) as Lift
-        WHERE Lift > 1.5
-        
-        RETURN FeaturePair, CategoryPair, CoOccurrenceCount, 
-               AvgPriceWithBoth, Lift, SampleProperties
-        ORDER BY Lift DESC
-        LIMIT 12
-        """
-        results = run_query(self.driver, query)
+        results = self.analytics.run('feature_cooccurrence')
         
         print("Strong Feature Co-occurrence Patterns:")
         for r in results:
@@ -663,31 +710,7 @@ class MarketIntelligenceAnalyzer:
 
         # Feature rarity and exclusivity analysis
         self.print_subsection("Feature Rarity & Exclusivity Analysis")
-        query = """
-        MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
-        WITH f.name as Feature, f.category as Category,
-             count(p) as PropertyCount,
-             avg(p.listing_price) as AvgPrice,
-             max(p.listing_price) as MaxPrice
-        
-        MATCH (allProps:Property)
-        WITH Feature, Category, PropertyCount, AvgPrice, MaxPrice,
-             count(allProps) as TotalProperties
-        
-        WITH *, (toFloat(PropertyCount) / TotalProperties) as RarityScore,
-             CASE 
-                WHEN PropertyCount <= 3 THEN 'Ultra-Rare'
-                WHEN PropertyCount <= 10 THEN 'Rare' 
-                WHEN PropertyCount <= 25 THEN 'Uncommon'
-                ELSE 'Common'
-             END as RarityLevel
-        WHERE PropertyCount <= 25  // Focus on rare features
-        
-        RETURN Feature, Category, PropertyCount, RarityLevel,
-               RarityScore, AvgPrice, MaxPrice
-        ORDER BY RarityScore ASC, AvgPrice DESC
-        """
-        results = run_query(self.driver, query)
+        results = fetched['feature_rarity_exclusivity_analysis']
         
         print("Rare & Exclusive Features:")
         for r in results:
@@ -700,7 +723,7 @@ class MarketIntelligenceAnalyzer:
 
     # ===== SECTION 6: COMPETITIVE MARKET INTELLIGENCE =====
     
-    def competitive_market_intelligence(self):
+    def competitive_market_intelligence(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Advanced competitive analysis using graph relationships and similarity networks"""
         self.print_section_header(
             "Competitive Market Intelligence",
@@ -709,34 +732,7 @@ class MarketIntelligenceAnalyzer:
         
         # Competitive clustering analysis based on shared features
         self.print_subsection("Competitive Property Clusters")
-        # NEO4J CYPHER QUERY: Competitive Clustering Analysis
-        # Two-stage aggregation to find competitive property clusters:
-        # Stage 1: Count shared features between property pairs
-        # Stage 2: Analyze competitive network for each property
-        # Properties with many competitors form competitive clusters
-        query = """
-        MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)<-[:HAS_FEATURE]-(similar:Property)
-        WHERE p <> similar
-        
-        WITH p, similar, count(DISTINCT f) as SharedFeatures
-        WHERE SharedFeatures >= 5
-        
-        WITH p, count(DISTINCT similar) as CompetitorCount,
-             avg(SharedFeatures) as AvgSharedFeatures,
-             collect(DISTINCT similar.listing_id)[0..5] as CompetingProperties
-        WHERE CompetitorCount >= 3
-        
-        MATCH (p)-[:IN_NEIGHBORHOOD]->(n:Neighborhood)
-        OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f:Feature)
-        
-        RETURN p.listing_id as PropertyID, p.listing_price as Price,
-               n.city + ", " + n.name as Location,
-               CompetitorCount, AvgSharedFeatures,
-               CompetingProperties, collect(DISTINCT f.name)[0..5] as TopFeatures
-        ORDER BY CompetitorCount DESC, AvgSharedFeatures DESC
-        LIMIT 10
-        """
-        results = run_query(self.driver, query)
+        results = fetched['competitive_property_clusters']
         
         print("Highly Competitive Property Clusters:")
         for r in results:
@@ -751,51 +747,7 @@ class MarketIntelligenceAnalyzer:
 
         # Market positioning analysis
         self.print_subsection("Market Positioning Analysis")
-        query = """
-        // Analyze positioning within price bands and feature categories
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f:Feature)
-        
-        WITH p, n,
-             collect(DISTINCT f.category) as FeatureCategories,
-             size([(p)-[:HAS_FEATURE]->(:Feature) | 1]) as FeatureCount,
-             CASE 
-                WHEN p.listing_price > 8000000 THEN 'Ultra-Luxury'
-                WHEN p.listing_price > 3000000 THEN 'Luxury'
-                WHEN p.listing_price > 1500000 THEN 'Premium'
-                WHEN p.listing_price > 800000 THEN 'Mid-Market'
-                ELSE 'Affordable'
-             END as PriceBand
-        
-        // Count competitive density in same price band and neighborhood
-        MATCH (comp:Property)-[:IN_NEIGHBORHOOD]->(n)
-        WHERE comp <> p AND 
-              CASE 
-                WHEN p.listing_price > 8000000 THEN comp.listing_price > 8000000
-                WHEN p.listing_price > 3000000 THEN comp.listing_price > 3000000 AND comp.listing_price <= 8000000
-                WHEN p.listing_price > 1500000 THEN comp.listing_price > 1500000 AND comp.listing_price <= 3000000
-                WHEN p.listing_price > 800000 THEN comp.listing_price > 800000 AND comp.listing_price <= 1500000
-                ELSE comp.listing_price <= 800000
-              END
-        
-        WITH p, n, FeatureCategories, FeatureCount, PriceBand,
-             count(comp) as DirectCompetitors
-        
-        // Analyze feature differentiation through shared features
-        OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f2:Feature)<-[:HAS_FEATURE]-(similar:Property)
-        WHERE similar <> p
-        
-        WITH p, n, FeatureCategories, FeatureCount, PriceBand, DirectCompetitors,
-             count(DISTINCT similar) as PropertiesWithSharedFeatures
-        
-        RETURN p.listing_id as PropertyID, p.listing_price as Price,
-               n.city as City, n.name as Neighborhood, PriceBand,
-               FeatureCount, FeatureCategories, DirectCompetitors,
-               PropertiesWithSharedFeatures
-        ORDER BY DirectCompetitors DESC, FeatureCount DESC
-        LIMIT 15
-        """
-        results = run_query(self.driver, query)
+        results = fetched['market_positioning_analysis']
         
         print("Market Positioning Intelligence:")
         for r in results:
@@ -810,42 +762,7 @@ class MarketIntelligenceAnalyzer:
 
         # Competitive gap analysis
         self.print_subsection("Market Gap Analysis")
-        query = """
-        // Find underserved market segments
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f:Feature)
-        
-        WITH n.city as City, p.property_type as PropertyType,
-             CASE 
-                WHEN p.listing_price > 5000000 THEN 'Ultra-Luxury'
-                WHEN p.listing_price > 2000000 THEN 'Luxury'
-                WHEN p.listing_price > 1000000 THEN 'Premium'
-                WHEN p.listing_price > 500000 THEN 'Mid-Market'
-                ELSE 'Affordable'
-             END as PriceBand,
-             collect(DISTINCT f.category) as FeatureCategories,
-             count(p) as PropertyCount
-        
-        WITH City, PropertyType, PriceBand, 
-             size(collect(DISTINCT FeatureCategories)) as FeatureCategoryVariety,
-             PropertyCount
-        WHERE PropertyCount > 0
-        
-        // Identify gaps (low supply in certain segments)
-        WITH City, PropertyType, 
-             collect({band: PriceBand, count: PropertyCount, variety: FeatureCategoryVariety}) as PriceBandData
-        
-        UNWIND PriceBandData as bandData
-        WITH City, PropertyType, bandData.band as PriceBand, 
-             bandData.count as Count, bandData.variety as Variety
-        WHERE Count <= 3  // Low competition segments
-        
-        RETURN City, PropertyType, PriceBand, Count as Supply, Variety as FeatureVariety,
-               CASE WHEN Count <= 1 THEN 'MAJOR GAP' WHEN Count <= 3 THEN 'OPPORTUNITY' ELSE 'COMPETITIVE' END as MarketStatus
-        ORDER BY Count ASC, Variety DESC
-        LIMIT 15
-        """
-        results = run_query(self.driver, query)
+        results = fetched['market_gap_analysis']
         
         print("Market Gap Opportunities:")
         for r in results:
@@ -855,8 +772,14 @@ class MarketIntelligenceAnalyzer:
             print(f"   Current Supply: {r['Supply']} properties | Feature Variety: {r['FeatureVariety']}")
 
 
-def run_complete_market_intelligence_demo():
-    """Run the complete market intelligence demonstration"""
+def run_complete_market_intelligence_demo(analytics_backend: Optional[str] = None, compare_backends: bool = False):
+    """Run the complete market intelligence demonstration
+    
+    Args:
+        analytics_backend: 'neo4j' or 'duckdb' for the market aggregates
+            (default: market_analytics.backend setting)
+        compare_backends: Print Neo4j vs DuckDB latency for the market aggregates
+    """
     print("ADVANCED MARKET INTELLIGENCE DEMO")
     print("="*80)
     print("Showcasing sophisticated real estate market analysis using Neo4j graph")
@@ -875,18 +798,38 @@ def run_complete_market_intelligence_demo():
     print("   • Market Segmentation - Dynamic categorization using graph properties")
     
     driver = None
+    analytics = None
     try:
         driver = get_neo4j_driver()
-        analyzer = MarketIntelligenceAnalyzer(driver)
+        config = get_settings().market_analytics
+        backend = analytics_backend or config.backend
+        analytics = create_market_analytics(backend, driver, config)
+        print(f"\nMarket aggregates backend: {backend}")
+        analyzer = MarketIntelligenceAnalyzer(driver, analytics)
         
         # Run all analysis sections (with proper output handling for pipes)
         try:
-            analyzer.geographic_market_analysis()
-            analyzer.price_prediction_analysis()
-            analyzer.investment_opportunity_analysis()
-            analyzer.lifestyle_market_segmentation()
-            analyzer.feature_impact_analysis()
-            analyzer.competitive_market_intelligence()
+            sections = [
+                analyzer.geographic_market_analysis,
+                analyzer.price_prediction_analysis,
+                analyzer.investment_opportunity_analysis,
+                analyzer.lifestyle_market_segmentation,
+                analyzer.feature_impact_analysis,
+                analyzer.competitive_market_intelligence
+            ]
+            fetched = analyzer.fetch_sections([section.__name__ for section in sections])
+            for section in sections:
+                section(fetched)
+            
+            if compare_backends:
+                print(f"\n{'='*80}")
+                print("MARKET AGGREGATES: NEO4J VS DUCKDB LATENCY (uncached, best of 3)")
+                print("="*80)
+                neo4j, duckdb = Neo4jMarketAnalytics(driver), DuckDBMarketAnalytics(config)
+                try:
+                    print(format_latency_comparison(compare_latency(neo4j, duckdb, MARKET_QUERY_NAMES)))
+                finally:
+                    duckdb.close()
         except BrokenPipeError:
             # Handle gracefully when output is piped to head/less/etc
             import sys
@@ -916,6 +859,8 @@ def run_complete_market_intelligence_demo():
         import traceback
         traceback.print_exc()
     finally:
+        if analytics:
+            analytics.close()
         if driver:
             driver.close()
 
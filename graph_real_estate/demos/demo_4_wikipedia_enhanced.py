@@ -26,6 +26,80 @@ from typing import Dict, List, Any, Optional
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.database import get_neo4j_driver, close_neo4j_driver, run_query
+from graph_real_estate.config import get_settings
+from graph_real_estate.core.async_query_executor import ConcurrentQueryExecutor
+
+
+# The three sections are independent, so their queries are fetched in one batch
+BASIC_ENHANCEMENT_QUERY = """
+    MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+    WHERE n.wikipedia_page_id IS NOT NULL
+    OPTIONAL MATCH (w:Wikipedia {wikipedia_id: n.wikipedia_page_id})
+    WITH p, n, w
+    WHERE w IS NOT NULL
+    RETURN 
+        p.listing_id as listing_id,
+        p.street_address as address,
+        p.listing_price as price,
+        p.bedrooms as bedrooms,
+        p.bathrooms as bathrooms,
+        p.square_feet as sqft,
+        n.name as neighborhood,
+        n.city as city,
+        w.title as wiki_title,
+        w.extract as wiki_extract
+    ORDER BY p.listing_price DESC
+    LIMIT 5
+"""
+
+NEIGHBORHOOD_CONTEXT_QUERY = """
+    MATCH (n:Neighborhood)
+    WHERE n.wikipedia_page_id IS NOT NULL
+    OPTIONAL MATCH (w:Wikipedia {wikipedia_id: n.wikipedia_page_id})
+    OPTIONAL MATCH (p:Property)-[:LOCATED_IN]->(n)
+    WITH n, w, count(p) as property_count, avg(p.listing_price) as avg_price
+    WHERE w IS NOT NULL
+    RETURN 
+        n.name as neighborhood,
+        n.city as city,
+        n.state as state,
+        property_count,
+        avg_price,
+        w.title as wiki_title,
+        w.url as wiki_url,
+        w.categories as wiki_categories
+    ORDER BY property_count DESC
+    LIMIT 5
+"""
+
+LOCATION_INTELLIGENCE_QUERY = """
+    MATCH (n:Neighborhood)
+    WHERE n.wikipedia_page_id IS NOT NULL
+    OPTIONAL MATCH (w:Wikipedia {wikipedia_id: n.wikipedia_page_id})
+    OPTIONAL MATCH (p:Property)-[:LOCATED_IN]->(n)
+    WITH n, w, 
+         count(p) as property_count,
+         avg(p.listing_price) as avg_price,
+         min(p.listing_price) as min_price,
+         max(p.listing_price) as max_price
+    WHERE w IS NOT NULL AND property_count > 0
+    RETURN 
+        n.name as neighborhood,
+        n.city as city,
+        property_count,
+        avg_price,
+        min_price,
+        max_price,
+        w.title as wiki_title,
+        CASE 
+            WHEN w.extract CONTAINS 'historic' THEN 'Historic'
+            WHEN w.extract CONTAINS 'residential' THEN 'Residential'
+            WHEN w.extract CONTAINS 'commercial' THEN 'Mixed-Use'
+            ELSE 'Standard'
+        END as area_type
+    ORDER BY avg_price DESC
+    LIMIT 5
+"""
 
 
 class WikipediaEnhancedDemo:
@@ -49,6 +123,7 @@ class WikipediaEnhancedDemo:
         print("   • Conditional Logic - CASE statements for categorization")
         
         self.driver = get_neo4j_driver()
+        self.concurrent = ConcurrentQueryExecutor(get_settings().database)
         
         # Check if Wikipedia data exists
         query = "MATCH (w:Wikipedia) RETURN count(w) as count"
@@ -64,42 +139,24 @@ class WikipediaEnhancedDemo:
     def run_demo(self):
         """Run the complete Wikipedia enhancement demonstration"""
         try:
-            self.demo_basic_enhancement()
-            self.demo_neighborhood_context()
-            self.demo_location_intelligence()
+            basic, context, intelligence = self.concurrent.run_all([
+                BASIC_ENHANCEMENT_QUERY,
+                NEIGHBORHOOD_CONTEXT_QUERY,
+                LOCATION_INTELLIGENCE_QUERY
+            ])
+            self.demo_basic_enhancement(basic)
+            self.demo_neighborhood_context(context)
+            self.demo_location_intelligence(intelligence)
         except Exception as e:
             print(f"\n❌ Error running demo: {e}")
     
-    def demo_basic_enhancement(self):
+    def demo_basic_enhancement(self, results: List[Dict[str, Any]]):
         """Show properties with Wikipedia-enhanced neighborhoods"""
         print("\n" + "=" * 80)
         print("SECTION 1: BASIC WIKIPEDIA ENHANCEMENT")
         print("=" * 80)
         print("Properties in neighborhoods with Wikipedia articles")
         
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        WHERE n.wikipedia_page_id IS NOT NULL
-        OPTIONAL MATCH (w:Wikipedia {wikipedia_id: n.wikipedia_page_id})
-        WITH p, n, w
-        WHERE w IS NOT NULL
-        RETURN 
-            p.listing_id as listing_id,
-            p.street_address as address,
-            p.listing_price as price,
-            p.bedrooms as bedrooms,
-            p.bathrooms as bathrooms,
-            p.square_feet as sqft,
-            n.name as neighborhood,
-            n.city as city,
-            w.title as wiki_title,
-            w.extract as wiki_extract
-        ORDER BY p.listing_price DESC
-        LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        
         if not results:
             print("\n⚠️  No properties found with Wikipedia-enhanced neighborhoods")
             return
@@ -121,35 +178,13 @@ class WikipediaEnhancedDemo:
                     print(f"   {extract}")
             print("\n" + "-" * 60)
     
-    def demo_neighborhood_context(self):
+    def demo_neighborhood_context(self, results: List[Dict[str, Any]]):
         """Show neighborhoods with their Wikipedia context"""
         print("\n" + "=" * 80)
         print("SECTION 2: NEIGHBORHOOD WIKIPEDIA CONTEXT")
         print("=" * 80)
         print("Neighborhoods enriched with Wikipedia articles")
         
-        query = """
-        MATCH (n:Neighborhood)
-        WHERE n.wikipedia_page_id IS NOT NULL
-        OPTIONAL MATCH (w:Wikipedia {wikipedia_id: n.wikipedia_page_id})
-        OPTIONAL MATCH (p:Property)-[:LOCATED_IN]->(n)
-        WITH n, w, count(p) as property_count, avg(p.listing_price) as avg_price
-        WHERE w IS NOT NULL
-        RETURN 
-            n.name as neighborhood,
-            n.city as city,
-            n.state as state,
-            property_count,
-            avg_price,
-            w.title as wiki_title,
-            w.url as wiki_url,
-            w.categories as wiki_categories
-        ORDER BY property_count DESC
-        LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        
         if not results:
             print("\n⚠️  No neighborhoods found with Wikipedia articles")
             return
@@ -173,44 +208,13 @@ class WikipediaEnhancedDemo:
                         print(f"   📂 Categories: {', '.join(categories)}")
             print("\n" + "-" * 60)
     
-    def demo_location_intelligence(self):
+    def demo_location_intelligence(self, results: List[Dict[str, Any]]):
         """Show location intelligence from Wikipedia data"""
         print("\n" + "=" * 80)
         print("SECTION 3: LOCATION INTELLIGENCE")
         print("=" * 80)
         print("Market insights enriched with Wikipedia context")
         
-        query = """
-        MATCH (n:Neighborhood)
-        WHERE n.wikipedia_page_id IS NOT NULL
-        OPTIONAL MATCH (w:Wikipedia {wikipedia_id: n.wikipedia_page_id})
-        OPTIONAL MATCH (p:Property)-[:LOCATED_IN]->(n)
-        WITH n, w, 
-             count(p) as property_count,
-             avg(p.listing_price) as avg_price,
-             min(p.listing_price) as min_price,
-             max(p.listing_price) as max_price
-        WHERE w IS NOT NULL AND property_count > 0
-        RETURN 
-            n.name as neighborhood,
-            n.city as city,
-            property_count,
-            avg_price,
-            min_price,
-            max_price,
-            w.title as wiki_title,
-            CASE 
-                WHEN w.extract CONTAINS 'historic' THEN 'Historic'
-                WHEN w.extract CONTAINS 'residential' THEN 'Residential'
-                WHEN w.extract CONTAINS 'commercial' THEN 'Mixed-Use'
-                ELSE 'Standard'
-            END as area_type
-        ORDER BY avg_price DESC
-        LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        
         if not results:
             print("\n⚠️  No location intelligence data available")
             return
@@ -33,9 +33,10 @@ if hasattr(signal, 'SIGPIPE'):
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from database import get_neo4j_driver
-from database.neo4j_client import run_query
 from vectors import PropertyEmbeddingPipeline
 from vectors.config_loader import get_embedding_config, get_vector_index_config
+from graph_real_estate.config import get_settings
+from graph_real_estate.core.async_query_executor import ConcurrentQueryExecutor
 
 
 class PureVectorSearchDemo:
@@ -43,6 +44,7 @@ class PureVectorSearchDemo:
     
     def __init__(self, driver):
         self.driver = driver
+        self.concurrent = ConcurrentQueryExecutor(get_settings().database)
         
         # Initialize embedding pipeline with constructor injection
         try:
@@ -450,7 +452,15 @@ class PureVectorSearchDemo:
         LIMIT 5
         """
         
-        sample_properties = run_query(self.driver, sample_query)
+        stats_query = """
+        MATCH (p:Property)
+        WHERE p.embedding IS NOT NULL
+        RETURN count(p) as properties_with_embeddings,
+               avg(size(p.embedding)) as avg_embedding_dimension
+        """
+        
+        # Cluster anchors and global statistics are fetched together
+        sample_properties, stats = self.concurrent.run_all([sample_query, stats_query])
         
         for prop in sample_properties[:3]:
             listing_price = prop.get('listing_price', 0) or 0
@@ -487,14 +497,6 @@ class PureVectorSearchDemo:
         # Analyze global embedding statistics
         print("\n\nGlobal Embedding Space Statistics:")
         
-        stats_query = """
-        MATCH (p:Property)
-        WHERE p.embedding IS NOT NULL
-        RETURN count(p) as properties_with_embeddings,
-               avg(size(p.embedding)) as avg_embedding_dimension
-        """
-        
-        stats = run_query(self.driver, stats_query)
         if stats:
             stat = stats[0]
             print(f"   Properties with embeddings: {stat['properties_with_embeddings']}")
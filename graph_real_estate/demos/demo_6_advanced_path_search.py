@@ -40,79 +40,15 @@ if hasattr(signal, 'SIGPIPE'):
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from database import get_neo4j_driver, close_neo4j_driver, run_query
+from database import get_neo4j_driver, close_neo4j_driver
+from graph_real_estate.config import get_settings
+from graph_real_estate.core.async_query_executor import ConcurrentQueryExecutor
 
 
-class AdvancedPathSearchDemo:
-    """Demonstration of advanced path-based and constraint search capabilities"""
-    
-    def __init__(self):
-        """Initialize the demo with database connection"""
-        print("Initializing Advanced Path-Based Search Demo...")
-        
-        print("\n🚀 NEO4J FEATURES DEMONSTRATED:")
-        print("   • Shortest Path Algorithms - shortestPath() for finding connections")
-        print("   • Variable-Length Patterns - [:HAS_FEATURE*..10] for flexible traversal")
-        print("   • Path Functions - nodes(), relationships() for path analysis")
-        print("   • Community Detection - Finding clusters through shared features")
-        print("   • Constraint-Based Search - Complex WHERE clauses for filtering")
-        print("   • Exclusion Patterns - NOT EXISTS for avoiding unwanted features")
-        print("   • Cross-Neighborhood Analysis - Finding properties across boundaries")
-        print("   • Feature-Based Paths - Traversing through shared feature nodes\n")
-        
-        self.driver = get_neo4j_driver()
-        
-    def print_section_header(self, title: str, description: str = ""):
-        """Print formatted section header"""
-        print(f"\n{'='*80}")
-        print(f"  {title}")
-        if description:
-            print(f"  {description}")
-        print('='*80)
-    
-    def format_price(self, price: float) -> str:
-        """Format price with currency symbol"""
-        if price is None:
-            return "$0"
-        if price >= 1_000_000:
-            return f"${price/1_000_000:.2f}M"
-        elif price >= 1_000:
-            return f"${price/1_000:.0f}K"
-        else:
-            return f"${price:.0f}"
-    
-    def run_all_demos(self):
-        """Run all demonstration queries"""
-        demos = [
-            ("CONSTRAINT-BASED SEARCH", "Properties matching complex requirements", 
-             self.demo_constraint_based_search),
-            ("EXCLUSION SEARCH", "Finding properties while avoiding certain features", 
-             self.demo_exclusion_search),
-            ("MULTI-HOP PATH SEARCH", "Properties connected through feature chains", 
-             self.demo_multi_hop_paths),
-            ("BOOLEAN LOGIC SEARCH", "Complex AND/OR/NOT combinations", 
-             self.demo_boolean_logic_search),
-            ("SHORTEST PATH ANALYSIS", "Finding connections between properties", 
-             self.demo_shortest_paths),
-            ("COMMUNITY DETECTION", "Identifying property clusters and groups", 
-             self.demo_community_detection),
-            ("RECOMMENDATION CHAINS", "Property suggestions through shared attributes", 
-             self.demo_recommendation_chains),
-        ]
-        
-        for title, desc, demo_func in demos:
-            self.print_section_header(title, desc)
-            demo_func()
-            time.sleep(0.5)  # Brief pause between sections
-    
-    def demo_constraint_based_search(self):
-        """Demonstrate constraint-based property search with must-have and nice-to-have features"""
-        
-        print("\n1. STRICT CONSTRAINT SEARCH")
-        print("   Finding properties with ALL must-have features...")
-        
-        # Must have: View, Parking, AND Modern Kitchen
-        query = """
+# Every section query is independent, so all of them are fetched in one batch
+PATH_SEARCH_QUERIES: Dict[str, str] = {
+    # Must have: View, Parking, AND Modern Kitchen
+    'strict_constraint_search': """
         MATCH (p:Property)
         WHERE EXISTS {
             MATCH (p)-[:HAS_FEATURE]->(:Feature {name: 'Ocean View'})
@@ -136,21 +72,9 @@ class AdvancedPathSearchDemo:
             SIZE(all_features) as total_features
         ORDER BY p.listing_price DESC
         LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        if results:
-            print(f"\n   Found {len(results)} properties with ALL must-have features:")
-            for r in results:
-                print(f"   • {r['id']}: {self.format_price(r['price'])} in {r['neighborhood']}")
-                print(f"     {r['beds']}BR/{r['baths']}BA | {r['total_features']} features")
-                print(f"     Features: {', '.join(r['top_features'][:3])}...")
-        
-        print("\n2. WEIGHTED CONSTRAINT SEARCH")
-        print("   Scoring properties by must-have vs nice-to-have features...")
-        
-        # Score based on feature importance
-        query = """
+    """,
+    # Score based on feature importance
+    'weighted_constraint_search': """
         MATCH (p:Property)
         OPTIONAL MATCH (p)-[:HAS_FEATURE]->(must:Feature)
         WHERE must.name IN ['Ocean View', 'Modern Kitchen', 'Parking Garage']
@@ -173,23 +97,8 @@ class AdvancedPathSearchDemo:
             score
         ORDER BY score DESC, p.listing_price ASC
         LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        if results:
-            print(f"\n   Top properties by weighted constraints:")
-            for r in results:
-                print(f"   • {r['id']}: Score {r['score']} | {self.format_price(r['price'])}")
-                print(f"     Must-haves: {r['must_have_count']}/3 | Nice-to-haves: {r['nice_to_have_count']}/3")
-                print(f"     Location: {r['neighborhood']}")
-    
-    def demo_exclusion_search(self):
-        """Demonstrate exclusion-based searches"""
-        
-        print("\n1. AVOIDING UNWANTED FEATURES")
-        print("   Finding family-friendly properties (no party features)...")
-        
-        query = """
+    """,
+    'avoiding_unwanted_features': """
         MATCH (p:Property)
         WHERE p.bedrooms >= 3
         AND NOT EXISTS {
@@ -212,20 +121,8 @@ class AdvancedPathSearchDemo:
             features[0..5] as sample_features
         ORDER BY p.bedrooms DESC, p.listing_price ASC
         LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        if results:
-            print(f"\n   Found family-friendly properties without party features:")
-            for r in results:
-                print(f"   • {r['id']}: {r['beds']}BR | {self.format_price(r['price'])}")
-                print(f"     Location: {r['neighborhood']}")
-                print(f"     Features: {', '.join(r['sample_features'][:3])}...")
-        
-        print("\n2. AVOIDING SPECIFIC NEIGHBORHOODS")
-        print("   Finding properties outside of expensive areas...")
-        
-        query = """
+    """,
+    'avoiding_specific_neighborhoods': """
         MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
         WHERE NOT n.name IN ['Sf-PacificHeights', 'Sf-Presidio', 'Sf-NobHill']
         WITH n, AVG(p.listing_price) as avg_price, COUNT(p) as count
@@ -237,22 +134,8 @@ class AdvancedPathSearchDemo:
             avg_price
         ORDER BY avg_price ASC
         LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        if results:
-            print(f"\n   More affordable neighborhoods:")
-            for r in results:
-                print(f"   • {r['neighborhood']}: {r['properties']} properties")
-                print(f"     Average: {self.format_price(r['avg_price'])}")
-    
-    def demo_multi_hop_paths(self):
-        """Demonstrate multi-hop relationship path searches"""
-        
-        print("\n1. PROPERTIES CONNECTED THROUGH SHARED FEATURES")
-        print("   Finding properties with 3+ features in common...")
-        
-        query = """
+    """,
+    'properties_connected_through_shared_features': """
         MATCH (p1:Property)-[:HAS_FEATURE]->(f:Feature)<-[:HAS_FEATURE]-(p2:Property)
         WHERE p1.listing_id < p2.listing_id
         WITH p1, p2, COLLECT(DISTINCT f.name) as shared_features
@@ -269,21 +152,8 @@ class AdvancedPathSearchDemo:
             ABS(p1.price - p2.price) as price_diff
         ORDER BY common_features DESC, price_diff ASC
         LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        if results:
-            print(f"\n   Property pairs with strong feature overlap:")
-            for r in results:
-                print(f"   • {r['prop1']} ↔ {r['prop2']}: {r['common_features']} shared features")
-                print(f"     Locations: {r['hood1']} ↔ {r['hood2']}")
-                print(f"     Price difference: {self.format_price(r['price_diff'])}")
-                print(f"     Shared: {', '.join(r['sample_features'])}...")
-        
-        print("\n2. NEIGHBORHOOD CONNECTIVITY PATHS")
-        print("   Finding properties in well-connected neighborhoods...")
-        
-        query = """
+    """,
+    'neighborhood_connectivity_paths': """
         MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
         OPTIONAL MATCH (n)-[:NEAR]-(connected:Neighborhood)
         WITH p, n, COUNT(DISTINCT connected) as connections
@@ -298,23 +168,8 @@ class AdvancedPathSearchDemo:
             p.price as price
         ORDER BY connections DESC, feature_count DESC
         LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        if results:
-            print(f"\n   Properties in well-connected areas:")
-            for r in results:
-                print(f"   • {r['id']}: {r['neighborhood']}")
-                print(f"     Connected to {r['nearby_neighborhoods']} neighborhoods")
-                print(f"     {r['feature_count']} features | {self.format_price(r['price'])}")
-    
-    def demo_boolean_logic_search(self):
-        """Demonstrate complex boolean logic searches"""
-        
-        print("\n1. COMPLEX AND/OR COMBINATIONS")
-        print("   (Ocean View OR Bay View) AND (Modern Kitchen OR Updated) AND NOT Condo...")
-        
-        query = """
+    """,
+    'complex_and_or_combinations': """
         MATCH (p:Property)
         WHERE p.property_type <> 'Condo'
         AND EXISTS {
@@ -337,20 +192,8 @@ class AdvancedPathSearchDemo:
             views
         ORDER BY p.listing_price DESC
         LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        if results:
-            print(f"\n   Properties matching complex criteria:")
-            for r in results:
-                print(f"   • {r['id']}: {r['type']} | {self.format_price(r['price'])}")
-                print(f"     Location: {r['neighborhood']}")
-                print(f"     Views: {', '.join(r['views']) if r['views'] else 'N/A'}")
-        
-        print("\n2. NESTED BOOLEAN LOGIC")
-        print("   ((Luxury AND Downtown) OR (Affordable AND Family)) properties...")
-        
-        query = """
+    """,
+    'nested_boolean_logic': """
         MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
         WHERE (
             // Luxury Downtown option
@@ -380,27 +223,9 @@ class AdvancedPathSearchDemo:
             p.bedrooms as beds
         ORDER BY category, p.listing_price DESC
         LIMIT 6
-        """
-        
-        results = run_query(self.driver, query)
-        if results:
-            print(f"\n   Properties in two distinct categories:")
-            current_category = None
-            for r in results:
-                if current_category != r['category']:
-                    current_category = r['category']
-                    print(f"\n   {current_category}:")
-                print(f"   • {r['id']}: {r['beds']}BR | {self.format_price(r['price'])}")
-                print(f"     Location: {r['neighborhood']}")
-    
-    def demo_shortest_paths(self):
-        """Demonstrate shortest path analysis between properties"""
-        
-        print("\n1. SHORTEST PATH THROUGH SIMILARITIES")
-        print("   Finding connection paths between dissimilar properties...")
-        
-        # First, get two very different properties
-        query = """
+    """,
+    # First, get two very different properties
+    'shortest_path_through_similarities': """
         MATCH (luxury:Property)
         WHERE luxury.price > 3000000
         WITH luxury
@@ -424,24 +249,8 @@ class AdvancedPathSearchDemo:
             property_chain,
             price_chain
         LIMIT 1
-        """
-        
-        results = run_query(self.driver, query)
-        if results and len(results) > 0:
-            r = results[0]
-            print(f"\n   Path from luxury to affordable property:")
-            print(f"   Start: {r['luxury_id']} ({self.format_price(r['luxury_price'])})")
-            print(f"   End: {r['affordable_id']} ({self.format_price(r['affordable_price'])})")
-            print(f"   Hops: {r['hops']}")
-            if r['property_chain']:
-                print(f"   Path: {' → '.join(r['property_chain'][:5])}")
-        else:
-            print("   No path found between luxury and affordable properties")
-        
-        print("\n2. FEATURE-BASED SHORTEST PATHS")
-        print("   Properties connected through feature chains...")
-        
-        query = """
+    """,
+    'feature_based_shortest_paths': """
         MATCH (p1:Property {listing_id: 'SF-100'})
         MATCH (p2:Property {listing_id: 'SF-200'})
         OPTIONAL MATCH path = shortestPath((p1)-[:HAS_FEATURE|SIMILAR_TO*..6]-(p2))
@@ -457,25 +266,8 @@ class AdvancedPathSearchDemo:
             SIZE(features) as features_in_path,
             features[0..3] as sample_features
         LIMIT 1
-        """
-        
-        results = run_query(self.driver, query)
-        if results and len(results) > 0:
-            r = results[0]
-            print(f"\n   Feature connection path:")
-            print(f"   {r['start']} → {r['end']}")
-            print(f"   Path length: {r['path_length']} hops")
-            print(f"   Properties: {r['properties_in_path']}, Features: {r['features_in_path']}")
-            if r['sample_features']:
-                print(f"   Via features: {', '.join(r['sample_features'])}...")
-    
-    def demo_community_detection(self):
-        """Demonstrate community detection and clustering"""
-        
-        print("\n1. SIMILARITY-BASED COMMUNITIES")
-        print("   Identifying tightly connected property clusters...")
-        
-        query = """
+    """,
+    'similarity_based_communities': """
         // Find property clusters through shared features
         MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)<-[:HAS_FEATURE]-(other:Property)
         WHERE p <> other
@@ -494,21 +286,8 @@ class AdvancedPathSearchDemo:
             connected_to
         ORDER BY connections DESC, avg_shared_features DESC
         LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        if results:
-            print(f"\n   Properties at the center of similarity clusters:")
-            for r in results:
-                print(f"   • {r['id']}: Hub with {r['connections']} connections")
-                print(f"     Location: {r['neighborhood']}")
-                print(f"     Avg shared features: {r['avg_shared']:.1f}")
-                print(f"     Connected to: {', '.join(r['connected_to'])}...")
-        
-        print("\n2. FEATURE-BASED COMMUNITIES")
-        print("   Properties forming communities through shared features...")
-        
-        query = """
+    """,
+    'feature_based_communities': """
         MATCH (p1:Property)-[:HAS_FEATURE]->(f:Feature)<-[:HAS_FEATURE]-(p2:Property)
         WHERE f.category IN ['Luxury', 'View']
         WITH f, COLLECT(DISTINCT p1) as properties
@@ -526,23 +305,8 @@ class AdvancedPathSearchDemo:
             sample_properties
         ORDER BY property_count DESC
         LIMIT 5
-        """
-        
-        results = run_query(self.driver, query)
-        if results:
-            print(f"\n   Feature communities (properties sharing luxury/view features):")
-            for r in results:
-                print(f"   • '{r['feature']}': {r['property_count']} properties")
-                print(f"     Avg price: {self.format_price(r['avg_price'])}")
-                print(f"     Members: {', '.join(r['sample_properties'][:3])}...")
-    
-    def demo_recommendation_chains(self):
-        """Demonstrate recommendation chains through properties"""
-        
-        print("\n1. UPGRADE PATH RECOMMENDATIONS")
-        print("   Finding property upgrade paths based on features...")
-        
-        query = """
+    """,
+    'upgrade_path_recommendations': """
         MATCH (start:Property)
         WHERE start.price < 1000000
         MATCH (start)-[:HAS_FEATURE]->(f1:Feature)
@@ -568,23 +332,8 @@ class AdvancedPathSearchDemo:
             new_in_end
         ORDER BY start.price ASC
         LIMIT 3
-        """
-        
-        results = run_query(self.driver, query)
-        if results:
-            print(f"\n   Property upgrade paths:")
-            for i, r in enumerate(results, 1):
-                print(f"\n   Path {i}:")
-                print(f"   • Start: {r['starter_home']} ({self.format_price(r['starter_price'])})")
-                print(f"   • Step 1: {r['upgrade_1']} ({self.format_price(r['mid_price'])})")
-                print(f"     Shares: {', '.join(r['shared_with_mid'][:2]) if r['shared_with_mid'] else 'N/A'}")
-                print(f"   • Step 2: {r['upgrade_2']} ({self.format_price(r['end_price'])})")
-                print(f"     Adds: {', '.join(r['new_in_end'][:2]) if r['new_in_end'] else 'N/A'}")
-        
-        print("\n2. LATERAL MOVE RECOMMENDATIONS")
-        print("   Finding similar properties in different neighborhoods...")
-        
-        query = """
+    """,
+    'lateral_move_recommendations': """
         MATCH (source:Property)-[:LOCATED_IN]->(n1:Neighborhood)
         WHERE source.listing_id IN ['SF-100', 'SF-101', 'SF-102']
         MATCH (source)-[sim:SIMILAR_TO]-(target:Property)-[:LOCATED_IN]->(n2:Neighborhood)
@@ -601,9 +350,259 @@ class AdvancedPathSearchDemo:
              })[0..2] as recommendations
         RETURN source_id, source_hood, recommendations
         LIMIT 3
-        """
+    """,
+}
+
+
+class AdvancedPathSearchDemo:
+    """Demonstration of advanced path-based and constraint search capabilities"""
+    
+    def __init__(self):
+        """Initialize the demo with database connection"""
+        print("Initializing Advanced Path-Based Search Demo...")
+        
+        print("\n🚀 NEO4J FEATURES DEMONSTRATED:")
+        print("   • Shortest Path Algorithms - shortestPath() for finding connections")
+        print("   • Variable-Length Patterns - [:HAS_FEATURE*..10] for flexible traversal")
+        print("   • Path Functions - nodes(), relationships() for path analysis")
+        print("   • Community Detection - Finding clusters through shared features")
+        print("   • Constraint-Based Search - Complex WHERE clauses for filtering")
+        print("   • Exclusion Patterns - NOT EXISTS for avoiding unwanted features")
+        print("   • Cross-Neighborhood Analysis - Finding properties across boundaries")
+        print("   • Feature-Based Paths - Traversing through shared feature nodes\n")
+        
+        self.driver = get_neo4j_driver()
+        self.concurrent = ConcurrentQueryExecutor(get_settings().database)
+        
+    def print_section_header(self, title: str, description: str = ""):
+        """Print formatted section header"""
+        print(f"\n{'='*80}")
+        print(f"  {title}")
+        if description:
+            print(f"  {description}")
+        print('='*80)
+    
+    def format_price(self, price: float) -> str:
+        """Format price with currency symbol"""
+        if price is None:
+            return "$0"
+        if price >= 1_000_000:
+            return f"${price/1_000_000:.2f}M"
+        elif price >= 1_000:
+            return f"${price/1_000:.0f}K"
+        else:
+            return f"${price:.0f}"
+    
+    def run_all_demos(self):
+        """Run all demonstration queries"""
+        demos = [
+            ("CONSTRAINT-BASED SEARCH", "Properties matching complex requirements", 
+             self.demo_constraint_based_search),
+            ("EXCLUSION SEARCH", "Finding properties while avoiding certain features", 
+             self.demo_exclusion_search),
+            ("MULTI-HOP PATH SEARCH", "Properties connected through feature chains", 
+             self.demo_multi_hop_paths),
+            ("BOOLEAN LOGIC SEARCH", "Complex AND/OR/NOT combinations", 
+             self.demo_boolean_logic_search),
+            ("SHORTEST PATH ANALYSIS", "Finding connections between properties", 
+             self.demo_shortest_paths),
+            ("COMMUNITY DETECTION", "Identifying property clusters and groups", 
+             self.demo_community_detection),
+            ("RECOMMENDATION CHAINS", "Property suggestions through shared attributes", 
+             self.demo_recommendation_chains),
+        ]
+        
+        fetched = dict(zip(
+            PATH_SEARCH_QUERIES,
+            self.concurrent.run_all(list(PATH_SEARCH_QUERIES.values()))
+        ))
+        
+        for title, desc, demo_func in demos:
+            self.print_section_header(title, desc)
+            demo_func(fetched)
+            time.sleep(0.5)  # Brief pause between sections
+    
+    def demo_constraint_based_search(self, fetched: Dict[str, List[Dict[str, Any]]]):
+        """Demonstrate constraint-based property search with must-have and nice-to-have features"""
+        
+        print("\n1. STRICT CONSTRAINT SEARCH")
+        print("   Finding properties with ALL must-have features...")
+        
+        results = fetched['strict_constraint_search']
+        if results:
+            print(f"\n   Found {len(results)} properties with ALL must-have features:")
+            for r in results:
+                print(f"   • {r['id']}: {self.format_price(r['price'])} in {r['neighborhood']}")
+                print(f"     {r['beds']}BR/{r['baths']}BA | {r['total_features']} features")
+                print(f"     Features: {', '.join(r['top_features'][:3])}...")
+        
+        print("\n2. WEIGHTED CONSTRAINT SEARCH")
+        print("   Scoring properties by must-have vs nice-to-have features...")
+        
+        results = fetched['weighted_constraint_search']
+        if results:
+            print(f"\n   Top properties by weighted constraints:")
+            for r in results:
+                print(f"   • {r['id']}: Score {r['score']} | {self.format_price(r['price'])}")
+                print(f"     Must-haves: {r['must_have_count']}/3 | Nice-to-haves: {r['nice_to_have_count']}/3")
+                print(f"     Location: {r['neighborhood']}")
+    
+    def demo_exclusion_search(self, fetched: Dict[str, List[Dict[str, Any]]]):
+        """Demonstrate exclusion-based searches"""
+        
+        print("\n1. AVOIDING UNWANTED FEATURES")
+        print("   Finding family-friendly properties (no party features)...")
+        
+        results = fetched['avoiding_unwanted_features']
+        if results:
+            print(f"\n   Found family-friendly properties without party features:")
+            for r in results:
+                print(f"   • {r['id']}: {r['beds']}BR | {self.format_price(r['price'])}")
+                print(f"     Location: {r['neighborhood']}")
+                print(f"     Features: {', '.join(r['sample_features'][:3])}...")
+        
+        print("\n2. AVOIDING SPECIFIC NEIGHBORHOODS")
+        print("   Finding properties outside of expensive areas...")
+        
+        results = fetched['avoiding_specific_neighborhoods']
+        if results:
+            print(f"\n   More affordable neighborhoods:")
+            for r in results:
+                print(f"   • {r['neighborhood']}: {r['properties']} properties")
+                print(f"     Average: {self.format_price(r['avg_price'])}")
+    
+    def demo_multi_hop_paths(self, fetched: Dict[str, List[Dict[str, Any]]]):
+        """Demonstrate multi-hop relationship path searches"""
+        
+        print("\n1. PROPERTIES CONNECTED THROUGH SHARED FEATURES")
+        print("   Finding properties with 3+ features in common...")
+        
+        results = fetched['properties_connected_through_shared_features']
+        if results:
+            print(f"\n   Property pairs with strong feature overlap:")
+            for r in results:
+                print(f"   • {r['prop1']} ↔ {r['prop2']}: {r['common_features']} shared features")
+                print(f"     Locations: {r['hood1']} ↔ {r['hood2']}")
+                print(f"     Price difference: {self.format_price(r['price_diff'])}")
+                print(f"     Shared: {', '.join(r['sample_features'])}...")
+        
+        print("\n2. NEIGHBORHOOD CONNECTIVITY PATHS")
+        print("   Finding properties in well-connected neighborhoods...")
+        
+        results = fetched['neighborhood_connectivity_paths']
+        if results:
+            print(f"\n   Properties in well-connected areas:")
+            for r in results:
+                print(f"   • {r['id']}: {r['neighborhood']}")
+                print(f"     Connected to {r['nearby_neighborhoods']} neighborhoods")
+                print(f"     {r['feature_count']} features | {self.format_price(r['price'])}")
+    
+    def demo_boolean_logic_search(self, fetched: Dict[str, List[Dict[str, Any]]]):
+        """Demonstrate complex boolean logic searches"""
+        
+        print("\n1. COMPLEX AND/OR COMBINATIONS")
+        print("   (Ocean View OR Bay View) AND (Modern Kitchen OR Updated) AND NOT Condo...")
+        
+        results = fetched['complex_and_or_combinations']
+        if results:
+            print(f"\n   Properties matching complex criteria:")
+            for r in results:
+                print(f"   • {r['id']}: {r['type']} | {self.format_price(r['price'])}")
+                print(f"     Location: {r['neighborhood']}")
+                print(f"     Views: {', '.join(r['views']) if r['views'] else 'N/A'}")
+        
+        print("\n2. NESTED BOOLEAN LOGIC")
+        print("   ((Luxury AND Downtown) OR (Affordable AND Family)) properties...")
+        
+        results = fetched['nested_boolean_logic']
+        if results:
+            print(f"\n   Properties in two distinct categories:")
+            current_category = None
+            for r in results:
+                if current_category != r['category']:
+                    current_category = r['category']
+                    print(f"\n   {current_category}:")
+                print(f"   • {r['id']}: {r['beds']}BR | {self.format_price(r['price'])}")
+                print(f"     Location: {r['neighborhood']}")
+    
+    def demo_shortest_paths(self, fetched: Dict[str, List[Dict[str, Any]]]):
+        """Demonstrate shortest path analysis between properties"""
+        
+        print("\n1. SHORTEST PATH THROUGH SIMILARITIES")
+        print("   Finding connection paths between dissimilar properties...")
+        
+        results = fetched['shortest_path_through_similarities']
+        if results and len(results) > 0:
+            r = results[0]
+            print(f"\n   Path from luxury to affordable property:")
+            print(f"   Start: {r['luxury_id']} ({self.format_price(r['luxury_price'])})")
+            print(f"   End: {r['affordable_id']} ({self.format_price(r['affordable_price'])})")
+            print(f"   Hops: {r['hops']}")
+            if r['property_chain']:
+                print(f"   Path: {' → '.join(r['property_chain'][:5])}")
+        else:
+            print("   No path found between luxury and affordable properties")
+        
+        print("\n2. FEATURE-BASED SHORTEST PATHS")
+        print("   Properties connected through feature chains...")
+        
+        results = fetched['feature_based_shortest_paths']
+        if results and len(results) > 0:
+            r = results[0]
+            print(f"\n   Feature connection path:")
+            print(f"   {r['start']} → {r['end']}")
+            print(f"   Path length: {r['path_length']} hops")
+            print(f"   Properties: {r['properties_in_path']}, Features: {r['features_in_path']}")
+            if r['sample_features']:
+                print(f"   Via features: {', '.join(r['sample_features'])}...")
+    
+    def demo_community_detection(self, fetched: Dict[str, List[Dict[str, Any]]]):
+        """Demonstrate community detection and clustering"""
+        
+        print("\n1. SIMILARITY-BASED COMMUNITIES")
+        print("   Identifying tightly connected property clusters...")
+        
+        results = fetched['similarity_based_communities']
+        if results:
+            print(f"\n   Properties at the center of similarity clusters:")
+            for r in results:
+                print(f"   • {r['id']}: Hub with {r['connections']} connections")
+                print(f"     Location: {r['neighborhood']}")
+                print(f"     Avg shared features: {r['avg_shared']:.1f}")
+                print(f"     Connected to: {', '.join(r['connected_to'])}...")
+        
+        print("\n2. FEATURE-BASED COMMUNITIES")
+        print("   Properties forming communities through shared features...")
+        
+        results = fetched['feature_based_communities']
+        if results:
+            print(f"\n   Feature communities (properties sharing luxury/view features):")
+            for r in results:
+                print(f"   • '{r['feature']}': {r['property_count']} properties")
+                print(f"     Avg price: {self.format_price(r['avg_price'])}")
+                print(f"     Members: {', '.join(r['sample_properties'][:3])}...")
+    
+    def demo_recommendation_chains(self, fetched: Dict[str, List[Dict[str, Any]]]):
+        """Demonstrate recommendation chains through properties"""
+        
+        print("\n1. UPGRADE PATH RECOMMENDATIONS")
+        print("   Finding property upgrade paths based on features...")
+        
+        results = fetched['upgrade_path_recommendations']
+        if results:
+            print(f"\n   Property upgrade paths:")
+            for i, r in enumerate(results, 1):
+                print(f"\n   Path {i}:")
+                print(f"   • Start: {r['starter_home']} ({self.format_price(r['starter_price'])})")
+                print(f"   • Step 1: {r['upgrade_1']} ({self.format_price(r['mid_price'])})")
+                print(f"     Shares: {', '.join(r['shared_with_mid'][:2]) if r['shared_with_mid'] else 'N/A'}")
+                print(f"   • Step 2: {r['upgrade_2']} ({self.format_price(r['end_price'])})")
+                print(f"     Adds: {', '.join(r['new_in_end'][:2]) if r['new_in_end'] else 'N/A'}")
+        
+        print("\n2. LATERAL MOVE RECOMMENDATIONS")
+        print("   Finding similar properties in different neighborhoods...")
         
-        results = run_query(self.driver, query)
+        results = fetched['lateral_move_recommendations']
         if results:
             print(f"\n   Lateral move recommendations (similar properties, different areas):")
             for r in results:
@@ -43,6 +43,19 @@ class PropertyResult(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+class SearchTimings(BaseModel):
+    """Per-search latency breakdown in milliseconds"""
+    embedding_ms: float = Field(0.0, description="Query embedding generation")
+    vector_search_ms: float = Field(0.0, description="Vector similarity search")
+    graph_metrics_ms: float = Field(0.0, description="Batched graph metrics query")
+    features_ms: float = Field(0.0, description="Batched features query")
+    similar_properties_ms: float = Field(0.0, description="Similar properties for all candidates")
+    scoring_ms: float = Field(0.0, description="Score combination and ranking")
+    total_ms: float = Field(0.0, description="Whole search")
+    candidates: int = Field(0, description="Vector hits enriched with graph data")
+    queries: int = Field(0, description="Neo4j queries issued")
+
+
 class SearchResult(BaseModel):
     """Hybrid search result with scoring"""
     listing_id: str = Field(..., description="Property listing ID")
@@ -60,6 +73,7 @@ class SearchResult(BaseModel):
     description: Optional[str] = Field(None, description="Property description")
     similar_properties: List[str] = Field(default_factory=list, description="Similar property IDs")
     features: List[str] = Field(default_factory=list, description="Property features")
+    timings: Optional[SearchTimings] = Field(None, description="Latency breakdown of the search")
 
 
 class NeighborhoodStats(BaseModel):
@@ -23,6 +23,7 @@ Commands:
   stats               Show database statistics
   test                Test database connection
   build-relationships Build all relationships in Neo4j
+  compute-centrality  Store graph centrality scores on Property nodes
   demo                Run demonstration queries
 
 Examples:
@@ -32,6 +33,8 @@ Examples:
   python main.py stats                   # Show current database statistics
   python main.py test                    # Test database connection
   python main.py build-relationships     # Build all relationships
+  python main.py compute-centrality      # Score all properties
+  python main.py compute-centrality --changed-properties P1 P2  # Rescore affected properties only
   python main.py demo --demo 1           # Run demo 1 (Basic Graph Queries)
   python main.py demo --demo 2 # Run demo 2 (Hybrid Search Simple)
   python main.py demo --demo 3 # Run demo 3 (Hybrid Search Advanced)
@@ -39,12 +42,14 @@ Examples:
   python main.py demo --demo 5 # Run demo 5 (Market Intelligence)
   python main.py demo --demo 6 # Run demo 6 (Wikipedia Enhanced)
   python main.py demo --demo 7 # Run demo 7 (Pure Vector Search)
+  python main.py demo --demo 3 --analytics-backend duckdb --compare-backends
         """
     )
     
     parser.add_argument(
         "action",
-        choices=["init", "clear", "stats", "stats-detailed", "test", "build-relationships", "demo", "sample-query"],
+        choices=["init", "clear", "stats", "stats-detailed", "test", "build-relationships",
+                 "compute-centrality", "demo", "sample-query"],
         help="Action to perform"
     )
     
@@ -61,6 +66,46 @@ Examples:
         help="Demo number to run (1-7, use with 'demo' action)"
     )
     
+    parser.add_argument(
+        "--changed-properties",
+        nargs="+",
+        metavar="LISTING_ID",
+        help="Properties whose nodes or relationships changed (use with 'compute-centrality')"
+    )
+    
+    parser.add_argument(
+        "--changed-neighborhoods",
+        nargs="+",
+        metavar="NEIGHBORHOOD_ID",
+        help="Neighborhoods whose membership changed (use with 'compute-centrality')"
+    )
+    
+    parser.add_argument(
+        "--changed-features",
+        nargs="+",
+        metavar="FEATURE",
+        help="Features whose property set changed (use with 'compute-centrality')"
+    )
+    
+    parser.add_argument(
+        "--no-query-cache",
+        action="store_true",
+        help="Run demo queries without the graph-version result cache (use with 'demo')"
+    )
+    
+    parser.add_argument(
+        "--analytics-backend",
+        choices=["neo4j", "duckdb"],
+        help="Backend for market-intelligence aggregates in demos 3 and 7 "
+             "(default: market_analytics.backend in config.yaml)"
+    )
+    
+    parser.add_argument(
+        "--compare-backends",
+        action="store_true",
+        help="Print Neo4j vs DuckDB latency for the market aggregates (use with 'demo')"
+    )
+    
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -163,6 +208,28 @@ def main():
             logger.info("✅ Relationship building completed successfully")
             sys.exit(0)
         
+        elif args.action == "compute-centrality":
+            # Materialize centrality scores used by hybrid search
+            from .analytics import GraphCentralityJob
+            from .core.query_executor import QueryExecutor
+            
+            job = GraphCentralityJob(QueryExecutor(initializer.driver))
+            job.create_index()
+            
+            if args.changed_properties or args.changed_neighborhoods or args.changed_features:
+                logger.info("Refreshing centrality for changed graph elements...")
+                result = job.refresh(
+                    listing_ids=args.changed_properties,
+                    neighborhood_ids=args.changed_neighborhoods,
+                    feature_names=args.changed_features
+                )
+            else:
+                logger.info("Computing centrality for all properties...")
+                result = job.compute_all()
+            
+            logger.info(f"✅ Scored {result.properties_scored:,} properties in {result.execution_time:.2f}s")
+            sys.exit(0)
+        
         elif args.action == "demo":
             # Run demo
             if not args.demo:
@@ -175,12 +242,26 @@ def main():
             # Create demo config with Pydantic validation
             demo_config = DemoConfig(
                 demo_number=args.demo,
-                verbose=args.verbose
+                verbose=args.verbose,
+                analytics_backend=args.analytics_backend,
+                compare_backends=args.compare_backends
             )
             
+            # Cache query results per graph version unless disabled
+            from .config import get_settings
+            from .queries.query_cache import QueryResultCache
+            from .core.async_query_executor import ConcurrentQueryExecutor
+            settings = get_settings()
+            cache = None
+            if settings.query_cache.enabled and not args.no_query_cache:
+                cache = QueryResultCache(settings.query_cache)
+            
+            # Independent demo queries run concurrently on the async driver
+            concurrent = ConcurrentQueryExecutor(settings.database)
+            
             # Run the demo
             from .utils.demo_runner import DemoRunner
-            demo_runner = DemoRunner(initializer.driver, demo_config)
+            demo_runner = DemoRunner(initializer.driver, demo_config, cache, concurrent)
             demo_runner.run_demo()
             
             logger.info(f"✅ Demo {args.demo} completed successfully")
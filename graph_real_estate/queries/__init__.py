@@ -1,5 +1,13 @@
 """Query module for real estate graph database"""
 from .query_library import QueryLibrary
 from .query_runner import QueryRunner
+from .query_cache import QueryResultCache, QueryCacheStats, get_graph_version, bump_graph_version
 
-__all__ = ['QueryLibrary', 'QueryRunner']
\ No newline at end of file
+__all__ = [
+    'QueryLibrary',
+    'QueryRunner',
+    'QueryResultCache',
+    'QueryCacheStats',
+    'get_graph_version',
+    'bump_graph_version',
+]
\ No newline at end of file
@@ -0,0 +1,319 @@
+"""Version-aware result cache for read-only graph queries
+
+The analytic queries in QueryLibrary and the demos aggregate over the whole
+graph, but the graph only changes when the pipeline or the relationship
+builder writes to it. Both bump a version counter on a single metadata node
+after every write:
+
+    (:GraphMetadata {key: 'graph'}) with version, revision, updated_at
+
+Results are cached per (query text, parameters, graph revision). The
+revision is a fresh UUID on every bump, so a cleared and reloaded database
+never reuses results cached for an earlier graph with the same counter.
+Without a metadata node the graph version is unknown and nothing is cached.
+
+Results live in an in-memory LRU and, when disk_path is set, in a SQLite
+file shared across runs. Entries for older revisions are dropped from the
+file when a newer revision is stored.
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, List, Dict, Any, Optional, Sequence, Tuple
+from neo4j import Driver
+from pydantic import BaseModel, Field
+
+from graph_real_estate.config.models import QueryCacheConfig
+from graph_real_estate.utils.database import run_query as run_uncached_query
+
+
+GRAPH_VERSION_QUERY = """
+MATCH (m:GraphMetadata {key: 'graph'})
+RETURN m.version as version, m.revision as revision
+"""
+
+BUMP_GRAPH_VERSION_QUERY = """
+MERGE (m:GraphMetadata {key: 'graph'})
+SET m.version = coalesce(m.version, 0) + 1,
+    m.revision = randomUUID(),
+    m.updated_at = datetime()
+RETURN m.version as version, m.revision as revision
+"""
+
+# Same heuristic as utils.database.run_query; writes are never cached
+WRITE_KEYWORDS = ('CREATE', 'DELETE', 'SET', 'MERGE', 'REMOVE', 'DETACH')
+
+
+def _format_version(record: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Cache key component for a graph version record"""
+    if not record or record.get('revision') is None:
+        return None
+    return f"{record['version']}-{record['revision']}"
+
+
+def get_graph_version(driver: Driver) -> Optional[str]:
+    """
+    Current graph version
+
+    Args:
+        driver: Neo4j driver instance
+
+    Returns:
+        Version string, or None when the graph has never been versioned
+    """
+    result = run_uncached_query(driver, GRAPH_VERSION_QUERY)
+    return _format_version(result[0] if result else None)
+
+
+def bump_graph_version(driver: Driver) -> Optional[str]:
+    """
+    Mark the graph as changed, invalidating cached query results
+
+    Args:
+        driver: Neo4j driver instance
+
+    Returns:
+        New version string
+    """
+    result = run_uncached_query(driver, BUMP_GRAPH_VERSION_QUERY)
+    return _format_version(result[0] if result else None)
+
+
+class QueryCacheStats(BaseModel):
+    """Hit/miss counters for a query result cache"""
+
+    hits: int = Field(default=0, ge=0, description="Results served from memory")
+    disk_hits: int = Field(default=0, ge=0, description="Results served from the disk store")
+    misses: int = Field(default=0, ge=0, description="Queries executed against Neo4j")
+    uncached: int = Field(default=0, ge=0, description="Queries run without a known graph version")
+    entries: int = Field(default=0, ge=0, description="Results held in memory")
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable lookups served from memory or disk"""
+        total = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / total if total > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line summary for demo and CLI output"""
+        return (
+            f"Query cache: {self.hit_rate:.0%} hit rate "
+            f"({self.hits} memory, {self.disk_hits} disk, {self.misses} misses, {self.entries} entries)"
+        )
+
+
+class QueryResultCache:
+    """LRU cache of query results keyed by query, parameters and graph version"""
+
+    def __init__(self, config: Optional[QueryCacheConfig] = None):
+        """
+        Initialize the cache
+
+        Args:
+            config: Query cache configuration
+        """
+        self.config = config or QueryCacheConfig()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._entries: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._version_checked_at: Optional[float] = None
+        self.stats = QueryCacheStats()
+        self._disk: Optional[sqlite3.Connection] = None
+        if self.config.disk_path:
+            self._open_disk(Path(self.config.disk_path))
+
+    def _open_disk(self, path: Path):
+        """Open (or create) the SQLite result store"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._disk = sqlite3.connect(str(path), check_same_thread=False)
+        self._disk.execute("""
+            CREATE TABLE IF NOT EXISTS query_results (
+                cache_key TEXT PRIMARY KEY,
+                graph_version TEXT NOT NULL,
+                results BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._disk.commit()
+
+    @staticmethod
+    def cache_key(query: str, params: Optional[Dict[str, Any]], graph_version: str) -> str:
+        """
+        Cache key for a query execution
+
+        Args:
+            query: Cypher query text
+            params: Query parameters
+            graph_version: Graph version the results belong to
+
+        Returns:
+            Hex digest identifying the results
+        """
+        payload = json.dumps(
+            {'query': query.strip(), 'params': params or {}, 'graph_version': graph_version},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def graph_version(self, driver: Driver) -> Optional[str]:
+        """
+        Current graph version, re-read at most every version_check_interval seconds
+
+        Args:
+            driver: Neo4j driver instance
+
+        Returns:
+            Version string, or None when the graph has never been versioned
+        """
+        now = time.monotonic()
+        if (
+            self._version_checked_at is None
+            or now - self._version_checked_at >= self.config.version_check_interval
+        ):
+            self._version = get_graph_version(driver)
+            self._version_checked_at = now
+        return self._version
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Cached results for a key, from memory or disk
+
+        Args:
+            key: Key from cache_key()
+
+        Returns:
+            Result rows, or None on a miss
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return self._entries[key]
+
+            if self._disk is not None:
+                row = self._disk.execute(
+                    "SELECT results FROM query_results WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    results = pickle.loads(row[0])
+                    self._remember(key, results)
+                    self.stats.disk_hits += 1
+                    return results
+
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, graph_version: str, results: List[Dict[str, Any]]):
+        """
+        Store results for a key
+
+        Args:
+            key: Key from cache_key()
+            graph_version: Graph version the results belong to
+            results: Result rows
+        """
+        with self._lock:
+            self._remember(key, results)
+            if self._disk is not None:
+                # Results for any other graph version can never be hit again
+                self._disk.execute("DELETE FROM query_results WHERE graph_version != ?", (graph_version,))
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO query_results VALUES (?, ?, ?, ?)",
+                    (key, graph_version, pickle.dumps(results), time.time())
+                )
+                self._disk.commit()
+
+    def _remember(self, key: str, results: List[Dict[str, Any]]):
+        """Insert into the in-memory LRU, evicting the oldest entries"""
+        self._entries[key] = results
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+        self.stats.entries = len(self._entries)
+
+    def run_query(self, driver: Driver, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a read query through the cache
+
+        Same signature as utils.database.run_query so callers can swap it in.
+
+        Args:
+            driver: Neo4j driver instance
+            query: Cypher query string
+            params: Optional query parameters
+
+        Returns:
+            List of result records as dictionaries
+        """
+        return self.run_queries(
+            driver,
+            [(query, params)],
+            lambda misses: [run_uncached_query(driver, q, p) for q, p in misses]
+        )[0]
+
+    def run_queries(
+        self,
+        driver: Driver,
+        queries: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        execute_many: Callable[[List[Tuple[str, Optional[Dict[str, Any]]]]], List[Any]]
+    ) -> List[Any]:
+        """
+        Execute a batch of queries through the cache
+
+        Cached results are served directly; the misses are handed to
+        execute_many in one call so they can run concurrently. A miss whose
+        result is an exception is returned as is and not cached.
+
+        Args:
+            driver: Neo4j driver instance (used to read the graph version)
+            queries: (query, params) pairs
+            execute_many: Runs (query, params) pairs, returning results in order
+
+        Returns:
+            Results per query, in the order given
+        """
+        results: List[Any] = [None] * len(queries)
+        pending = []
+        for i, (query, params) in enumerate(queries):
+            cacheable = self.config.enabled and not any(k in query.upper() for k in WRITE_KEYWORDS)
+            graph_version = self.graph_version(driver) if cacheable else None
+            if graph_version is None:
+                self.stats.uncached += 1
+                pending.append((i, None, None))
+                continue
+            key = self.cache_key(query, params, graph_version)
+            results[i] = self.get(key)
+            if results[i] is None:
+                pending.append((i, key, graph_version))
+
+        if pending:
+            fetched = execute_many([queries[i] for i, _, _ in pending])
+            for (i, key, graph_version), rows in zip(pending, fetched):
+                results[i] = rows
+                if key is not None and not isinstance(rows, BaseException):
+                    self.put(key, graph_version, rows)
+        return results
+
+    def clear(self):
+        """Drop all cached results from memory and disk"""
+        with self._lock:
+            self._entries.clear()
+            self.stats.entries = 0
+            if self._disk is not None:
+                self._disk.execute("DELETE FROM query_results")
+                self._disk.commit()
+
+    def close(self):
+        """Close the disk store"""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
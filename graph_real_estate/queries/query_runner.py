@@ -1,34 +1,72 @@
 """Query runner for executing and formatting graph queries"""
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 from neo4j import Driver
 from tabulate import tabulate
 from graph_real_estate.queries.query_library import QueryLibrary, Query
+from graph_real_estate.queries.query_cache import QueryResultCache
+from graph_real_estate.core.async_query_executor import ConcurrentQueryExecutor
 
 class QueryRunner:
     """Executes queries and formats results"""
     
-    def __init__(self, driver: Driver):
-        """Initialize with Neo4j driver"""
+    def __init__(
+        self,
+        driver: Driver,
+        cache: Optional[QueryResultCache] = None,
+        concurrent: Optional[ConcurrentQueryExecutor] = None
+    ):
+        """Initialize with Neo4j driver, an optional result cache and an optional concurrent executor"""
         self.driver = driver
         self.library = QueryLibrary()
+        self.cache = cache
+        self.concurrent = concurrent
     
-    def run_query(self, query: Query) -> List[Dict[str, Any]]:
-        """Execute a single query and return results"""
+    def run_query(self, query: Query, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Execute a single query and return results (cached per graph version)"""
+        if self.cache is not None:
+            return self.cache.run_query(self.driver, query.cypher, params)
         with self.driver.session() as session:
-            result = session.run(query.cypher)
+            result = session.run(query.cypher, **(params or {}))
             return [dict(record) for record in result]
     
+    def run_queries(self, queries: List[Query]) -> List[Union[List[Dict[str, Any]], Exception]]:
+        """
+        Execute independent queries, concurrently when a concurrent executor is set
+        
+        A failed query's exception is returned in its slot so the others still report.
+        """
+        specs = [(query.cypher, None) for query in queries]
+        if self.cache is not None:
+            return self.cache.run_queries(self.driver, specs, self._execute_many)
+        return self._execute_many(specs)
+    
+    def _execute_many(self, specs: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Any]:
+        """Run (query, params) pairs in order, fanned out over the async driver if available"""
+        if self.concurrent is not None:
+            return self.concurrent.run_all(specs, return_exceptions=True)
+        results = []
+        for cypher, params in specs:
+            try:
+                with self.driver.session() as session:
+                    results.append([dict(record) for record in session.run(cypher, **(params or {}))])
+            except Exception as e:
+                results.append(e)
+        return results
+    
+    def cache_summary(self) -> Optional[str]:
+        """Hit-rate summary of the result cache, if one is used"""
+        return self.cache.stats.summary() if self.cache is not None else None
+    
     def run_category(self, category: str) -> Dict[str, List[Dict[str, Any]]]:
         """Run all queries in a category"""
         queries = self.library.get_all_queries().get(category, [])
         results = {}
         
-        for query in queries:
-            try:
-                results[query.name] = self.run_query(query)
-            except Exception as e:
-                print(f"Error running {query.name}: {e}")
-                results[query.name] = []
+        for query, rows in zip(queries, self.run_queries(queries)):
+            if isinstance(rows, Exception):
+                print(f"Error running {query.name}: {rows}")
+                rows = []
+            results[query.name] = rows
         
         return results
     
@@ -78,20 +116,24 @@ class QueryRunner:
             ("advanced", "market_segments")
         ]
         
-        for category, query_name in demo_queries:
-            try:
-                query = self.library.get_query_by_name(query_name)
-                print(f"\n{query.description}")
-                print("-" * 60)
-                
-                results = self.run_query(query)
-                print(self.format_results(results, limit=5))
-                
-                if len(results) > 5:
-                    print(f"... and {len(results) - 5} more results")
-                    
-            except Exception as e:
-                print(f"Error running {query_name}: {e}")
+        queries = [self.library.get_query_by_name(query_name) for _, query_name in demo_queries]
+        
+        # Independent queries: fetch them together, then print in order
+        for query, results in zip(queries, self.run_queries(queries)):
+            print(f"\n{query.description}")
+            print("-" * 60)
+            
+            if isinstance(results, Exception):
+                print(f"Error running {query.name}: {results}")
+                continue
+            
+            print(self.format_results(results, limit=5))
+            
+            if len(results) > 5:
+                print(f"... and {len(results) - 5} more results")
+        
+        if self.cache is not None:
+            print(f"\n{self.cache_summary()}")
     
     def run_interactive(self):
         """Interactive query runner"""
@@ -149,6 +191,10 @@ class QueryRunner:
             else:
                 categories = self.library.get_all_queries()
             
+            # Every query in the report is independent: fetch them all at once
+            all_queries = [query for queries in categories.values() for query in queries]
+            all_results = iter(self.run_queries(all_queries))
+            
             for cat_name, queries in categories.items():
                 f.write(f"\nCATEGORY: {cat_name.upper()}\n")
                 f.write("-" * 40 + "\n")
@@ -157,14 +203,13 @@ class QueryRunner:
                     f.write(f"\n{query.name}: {query.description}\n")
                     f.write("-" * 40 + "\n")
                     
-                    try:
-                        results = self.run_query(query)
-                        if results:
-                            f.write(self.format_results(results, limit=20))
-                        else:
-                            f.write("No results found")
-                    except Exception as e:
-                        f.write(f"Error: {e}")
+                    results = next(all_results)
+                    if isinstance(results, Exception):
+                        f.write(f"Error: {results}")
+                    elif results:
+                        f.write(self.format_results(results, limit=20))
+                    else:
+                        f.write("No results found")
                     
                     f.write("\n\n")
             
@@ -11,9 +11,13 @@ from pydantic import BaseModel, Field, ConfigDict
 from neo4j import Driver
 
 from graph_real_estate.utils.database import run_query
+from graph_real_estate.queries.query_cache import bump_graph_version
+from graph_real_estate.analytics.centrality import GraphCentralityJob
+from graph_real_estate.core.query_executor import QueryExecutor
 from graph_real_estate.relationships.config import RelationshipConfig
 from graph_real_estate.relationships.geographic import GeographicRelationshipBuilder
 from graph_real_estate.relationships.classification import ClassificationRelationshipBuilder
+from graph_real_estate.relationships.proximity import ProximityRelationshipBuilder
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +39,7 @@ class RelationshipStats(BaseModel):
     
     # Graph module relationships
     near: int = Field(default=0, description="Neighborhoods <-> Neighborhoods")
+    near_by: int = Field(default=0, description="Properties <-> Properties within proximity radius")
     describes: int = Field(default=0, description="Wikipedia -> Neighborhoods")
     
     @property
@@ -55,6 +60,7 @@ class RelationshipOrchestrator:
     
     This class handles relationships not covered by the pipeline:
     - NEAR relationships between neighborhoods
+    - NEAR_BY relationships between nearby properties
     - Similarity relationships (if enabled)
     - Other complex graph analytics
     """
@@ -73,6 +79,7 @@ class RelationshipOrchestrator:
         # Initialize builders for complex relationships
         self.geographic_builder = GeographicRelationshipBuilder(driver, config)
         self.classification_builder = ClassificationRelationshipBuilder(driver, config)
+        self.proximity_builder = ProximityRelationshipBuilder(driver, self.config)
         
         self.stats = RelationshipStats()
     
@@ -90,18 +97,49 @@ class RelationshipOrchestrator:
         # First, get existing relationship counts from pipeline
         self._count_existing_relationships()
         
-        # Build NEAR relationships (requires geographic hierarchy)
+        # Build NEAR relationships from neighborhood coordinates
         logger.info("\n📍 Building NEAR relationships...")
         try:
-            self.stats.near = self.geographic_builder.create_near()
+            result = self.proximity_builder.create_near()
+            if result.success and result.count == 0:
+                # No neighborhood coordinates: link neighborhoods in the same city instead
+                logger.info("No coordinate-based NEAR pairs; falling back to same-city NEAR")
+                self.stats.near = self.geographic_builder.create_near()
+            else:
+                self.stats.near = result.count
             logger.info(f"✓ Created {self.stats.near:,} NEAR relationships")
         except Exception as e:
             logger.warning(f"NEAR relationships failed: {e}")
             self.stats.near = 0
         
+        # Build NEAR_BY relationships from property coordinates
+        logger.info("\n📍 Building NEAR_BY relationships...")
+        result = self.proximity_builder.create_near_by()
+        self.stats.near_by = result.count
+        if result.success:
+            logger.info(f"✓ Created {self.stats.near_by:,} NEAR_BY relationships")
+        else:
+            logger.warning(f"NEAR_BY relationships failed: {result.error_message}")
+        
         # Note: Similarity relationships removed - use embedding-based similarity instead
         # Note: DESCRIBES relationships removed - use neighborhood.wikipedia_page_id instead
         
+        # Invalidate cached query results for the previous graph
+        try:
+            version = bump_graph_version(self.driver)
+            logger.info(f"Graph version bumped to {version}")
+        except Exception as e:
+            logger.warning(f"Could not bump graph version: {e}")
+        
+        # Centrality counts NEAR_BY and pipeline relationships, so rescore
+        logger.info("\n📊 Refreshing centrality scores...")
+        try:
+            centrality = GraphCentralityJob(QueryExecutor(self.driver)).compute_if_stale()
+            if centrality:
+                logger.info(f"✓ Scored {centrality.properties_scored:,} properties")
+        except Exception as e:
+            logger.warning(f"Centrality refresh failed: {e}")
+        
         # Print summary
         self._print_summary()
         
@@ -149,6 +187,7 @@ class RelationshipOrchestrator:
         
         logger.info("\n🔗 Graph module relationships:")
         logger.info(f"  NEAR:           {self.stats.near:10,}")
+        logger.info(f"  NEAR_BY:        {self.stats.near_by:10,}")
         
         logger.info("-"*60)
         logger.info(f"  TOTAL:          {self.stats.total:10,}")
@@ -167,7 +206,7 @@ class RelationshipOrchestrator:
         self._count_existing_relationships()
         
         # Count graph module relationships
-        for field, rel_type in [('near', 'NEAR')]:
+        for field, rel_type in [('near', 'NEAR'), ('near_by', 'NEAR_BY')]:
             try:
                 query = f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count"
                 result = run_query(self.driver, query)
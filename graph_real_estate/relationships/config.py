@@ -2,7 +2,7 @@
 Configuration models for relationship building using Pydantic.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field, validator
 
 
@@ -44,6 +44,50 @@ class RelationshipBatchConfig(BaseModel):
     )
 
 
+class ProximityConfig(BaseModel):
+    """Configuration for coordinate-based NEAR and NEAR_BY relationships."""
+    
+    property_radius_km: float = Field(
+        default=1.0,
+        gt=0.0,
+        description="Maximum distance between properties linked by NEAR_BY"
+    )
+    
+    property_k_nearest: Optional[int] = Field(
+        default=10,
+        ge=1,
+        description="Keep only each property's k nearest neighbours within the radius (None keeps all)"
+    )
+    
+    neighborhood_radius_km: float = Field(
+        default=5.0,
+        gt=0.0,
+        description="Maximum distance between neighborhood centers linked by NEAR"
+    )
+    
+    neighborhood_k_nearest: Optional[int] = Field(
+        default=6,
+        ge=1,
+        description="Keep only each neighborhood's k nearest neighbours within the radius (None keeps all)"
+    )
+    
+    rows_per_transaction: int = Field(
+        default=1000,
+        ge=100,
+        le=10000,
+        description="Pairs committed per inner transaction (CALL ... IN TRANSACTIONS)"
+    )
+    
+    max_candidate_pairs: int = Field(
+        default=2_000_000,
+        ge=10_000,
+        description="Candidate pairs scored per NumPy chunk"
+    )
+    
+    class Config:
+        validate_assignment = True
+
+
 class RelationshipConfig(BaseModel):
     """Configuration for relationship building."""
     
@@ -82,6 +126,11 @@ class RelationshipConfig(BaseModel):
         description="Enable performance monitoring and timing"
     )
     
+    proximity: ProximityConfig = Field(
+        default_factory=ProximityConfig,
+        description="Coordinate-based proximity configuration"
+    )
+    
     @validator('price_ranges')
     def validate_price_ranges(cls, v):
         """Validate price ranges format."""
@@ -81,7 +81,9 @@ class GeographicRelationshipBuilder:
         Create NEAR relationships between Neighborhoods in the same city.
         
         This creates bidirectional NEAR relationships between neighborhoods
-        that share the same city through the geographic hierarchy.
+        that share the same city through the geographic hierarchy. Used as a
+        fallback when neighborhoods have no coordinates; see
+        ProximityRelationshipBuilder.create_near.
         
         Returns:
             Number of relationships created
@@ -0,0 +1,184 @@
+"""
+Coordinate-based proximity relationships for Neo4j.
+
+NEAR (Neighborhood <-> Neighborhood) and NEAR_BY (Property - Property) link
+nodes whose coordinates lie within a radius, optionally keeping only each
+node's k nearest neighbours. Candidate pairs come from the grid bucketing in
+analytics.proximity instead of a per-city cross product.
+
+Pairs are written with UNWIND ... CALL { ... } IN TRANSACTIONS, so every
+rows_per_transaction pairs commit on their own instead of in one giant MERGE.
+"""
+
+import logging
+import time
+from typing import List, Optional, Tuple
+from neo4j import Driver
+
+from graph_real_estate.analytics.proximity import proximity_pairs
+from graph_real_estate.utils.database import run_query
+from graph_real_estate.relationships.config import RelationshipConfig, RelationshipResult
+
+logger = logging.getLogger(__name__)
+
+# Pairs sent per UNWIND statement; each statement commits in rows_per_transaction batches
+PAIRS_PER_STATEMENT = 20_000
+
+
+class ProximityRelationshipBuilder:
+    """Builds NEAR and NEAR_BY relationships from node coordinates."""
+
+    def __init__(self, driver: Driver, config: Optional[RelationshipConfig] = None):
+        """
+        Initialize the proximity relationship builder.
+
+        Args:
+            driver: Neo4j driver instance
+            config: Relationship configuration
+        """
+        self.driver = driver
+        self.config = config or RelationshipConfig()
+
+    def create_near_by(self) -> RelationshipResult:
+        """
+        Create NEAR_BY relationships between properties within the configured radius.
+
+        One relationship per pair, carrying distance_km; queries match it undirected.
+
+        Returns:
+            RelationshipResult with the number of relationships created
+        """
+        proximity = self.config.proximity
+        return self._build(
+            "NEAR_BY", "Property", "listing_id",
+            proximity.property_radius_km, proximity.property_k_nearest,
+            bidirectional=False
+        )
+
+    def create_near(self) -> RelationshipResult:
+        """
+        Create NEAR relationships between neighborhoods whose centers are within the configured radius.
+
+        Relationships are created in both directions, carrying distance_km.
+
+        Returns:
+            RelationshipResult with the number of relationships created
+        """
+        proximity = self.config.proximity
+        return self._build(
+            "NEAR", "Neighborhood", "neighborhood_id",
+            proximity.neighborhood_radius_km, proximity.neighborhood_k_nearest,
+            bidirectional=True
+        )
+
+    def _build(
+        self,
+        relationship_type: str,
+        label: str,
+        id_property: str,
+        radius_km: float,
+        k_nearest: Optional[int],
+        bidirectional: bool
+    ) -> RelationshipResult:
+        """Replace a proximity relationship type from the current coordinates."""
+        start_time = time.time()
+
+        try:
+            ids, latitudes, longitudes = self._load_points(label, id_property)
+            if not ids:
+                logger.warning(f"No {label} nodes with coordinates; skipping {relationship_type}")
+                return RelationshipResult(
+                    relationship_type=relationship_type,
+                    count=0,
+                    execution_time=time.time() - start_time
+                )
+
+            i, j, distance = proximity_pairs(
+                latitudes, longitudes, radius_km, k_nearest,
+                self.config.proximity.max_candidate_pairs
+            )
+            pairs = [
+                {'a': ids[a], 'b': ids[b], 'distance_km': round(float(d), 4)}
+                for a, b, d in zip(i.tolist(), j.tolist(), distance.tolist())
+            ]
+
+            self._delete_existing(relationship_type, label)
+            self._write_pairs(relationship_type, label, id_property, pairs, bidirectional)
+            count = len(pairs) * (2 if bidirectional else 1)
+            execution_time = time.time() - start_time
+
+            if self.config.enable_performance_monitoring:
+                logger.info(
+                    f"✓ {relationship_type}: {count:,} relationships for {len(ids):,} {label} nodes "
+                    f"within {radius_km} km in {execution_time:.2f}s"
+                )
+
+            return RelationshipResult(
+                relationship_type=relationship_type,
+                count=count,
+                execution_time=execution_time
+            )
+
+        except Exception as e:
+            execution_time = time.time() - start_time
+            error_msg = f"Failed to create {relationship_type} relationships: {str(e)}"
+            logger.error(error_msg)
+
+            return RelationshipResult(
+                relationship_type=relationship_type,
+                count=0,
+                success=False,
+                error_message=error_msg,
+                execution_time=execution_time
+            )
+
+    def _load_points(self, label: str, id_property: str) -> Tuple[List, List[float], List[float]]:
+        """Ids and coordinates of every node of a label that has both coordinates."""
+        rows = run_query(self.driver, f"""
+        MATCH (n:{label})
+        WHERE n.latitude IS NOT NULL AND n.longitude IS NOT NULL
+        RETURN n.{id_property} as id, n.latitude as latitude, n.longitude as longitude
+        """)
+        rows = [r for r in rows if r['id'] is not None]
+        return (
+            [r['id'] for r in rows],
+            [float(r['latitude']) for r in rows],
+            [float(r['longitude']) for r in rows]
+        )
+
+    def _delete_existing(self, relationship_type: str, label: str):
+        """Drop existing relationships of the type in committed batches."""
+        rows = self.config.proximity.rows_per_transaction
+        with self.driver.session() as session:
+            session.run(f"""
+            MATCH (:{label})-[r:{relationship_type}]->(:{label})
+            CALL {{ WITH r DELETE r }} IN TRANSACTIONS OF {rows} ROWS
+            """).consume()
+
+    def _write_pairs(
+        self,
+        relationship_type: str,
+        label: str,
+        id_property: str,
+        pairs: List[dict],
+        bidirectional: bool
+    ):
+        """Write pairs with batched UNWIND ... CALL { ... } IN TRANSACTIONS."""
+        reverse = f"""
+            MERGE (b)-[back:{relationship_type}]->(a)
+            SET back.distance_km = pair.distance_km""" if bidirectional else ""
+        query = f"""
+        UNWIND $pairs AS pair
+        CALL {{
+            WITH pair
+            MATCH (a:{label} {{{id_property}: pair.a}})
+            MATCH (b:{label} {{{id_property}: pair.b}})
+            MERGE (a)-[r:{relationship_type}]->(b)
+            SET r.distance_km = pair.distance_km{reverse}
+        }} IN TRANSACTIONS OF {self.config.proximity.rows_per_transaction} ROWS
+        """
+
+        # CALL ... IN TRANSACTIONS needs an auto-commit transaction (session.run)
+        with self.driver.session() as session:
+            for start in range(0, len(pairs), PAIRS_PER_STATEMENT):
+                session.run(query, pairs=pairs[start:start + PAIRS_PER_STATEMENT]).consume()
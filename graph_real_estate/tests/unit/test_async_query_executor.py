@@ -0,0 +1,111 @@
+"""Unit tests for AsyncQueryExecutor and concurrent query runs with mocked dependencies"""
+
+import asyncio
+from unittest.mock import Mock, patch
+from neo4j.exceptions import TransientError
+
+from core.async_query_executor import AsyncQueryExecutor, ConcurrentQueryExecutor, normalize_queries
+from queries.query_library import Query
+from queries.query_runner import QueryRunner
+from queries.query_cache import QueryResultCache
+
+
+class FakeSession:
+    """Async session that raises queued failures, then returns one row"""
+
+    def __init__(self, failures):
+        self.failures = failures
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def execute_read(self, work):
+        if self.failures:
+            raise self.failures.pop(0)
+        return [{'ok': True}]
+
+
+class TestAsyncQueryExecutor:
+    """Test AsyncQueryExecutor with a patched execute"""
+
+    def test_normalize_queries(self):
+        """Test strings and (query, params) pairs are accepted"""
+        assert normalize_queries(["RETURN 1", ("RETURN $x", {'x': 2})]) == [
+            ("RETURN 1", None),
+            ("RETURN $x", {'x': 2})
+        ]
+
+    def test_execute_many_keeps_order_and_limit(self):
+        """Test results come back in query order with at most max_concurrency in flight"""
+        executor = AsyncQueryExecutor(Mock(), max_concurrency=2)
+        in_flight = {'now': 0, 'max': 0}
+
+        async def execute(query, params=None):
+            in_flight['now'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['now'])
+            # Later queries finish first
+            await asyncio.sleep(0.01 * (5 - int(query[-1])))
+            in_flight['now'] -= 1
+            return [{'query': query}]
+
+        executor.execute = execute
+        results = asyncio.run(executor.execute_many([f"RETURN {i}" for i in range(5)]))
+
+        assert [r[0]['query'] for r in results] == [f"RETURN {i}" for i in range(5)]
+        assert in_flight['max'] == 2
+
+    def test_execute_many_returns_exceptions_in_place(self):
+        """Test a failed query does not hide the other results"""
+        executor = AsyncQueryExecutor(Mock())
+
+        async def execute(query, params=None):
+            if query == "BAD":
+                raise ValueError("syntax error")
+            return [{'query': query}]
+
+        executor.execute = execute
+        results = asyncio.run(executor.execute_many(["RETURN 1", "BAD", "RETURN 2"], return_exceptions=True))
+
+        assert results[0] == [{'query': "RETURN 1"}]
+        assert isinstance(results[1], ValueError)
+        assert results[2] == [{'query': "RETURN 2"}]
+
+    def test_retry_on_transient_error(self):
+        """Test transient errors are retried with backoff"""
+        failures = [TransientError("Connection failed")]
+        driver = Mock()
+        driver.session.side_effect = lambda database: FakeSession(failures)
+        executor = AsyncQueryExecutor(driver, max_retries=3)
+
+        with patch('core.async_query_executor.asyncio.sleep') as sleep:
+            results = asyncio.run(executor.execute_read("RETURN 1"))
+
+        assert results == [{'ok': True}]
+        sleep.assert_called_once_with(1)
+
+
+class TestQueryRunnerConcurrency:
+    """Test QueryRunner batches with a mocked concurrent executor"""
+
+    def test_run_queries_fans_out_cache_misses(self):
+        """Test only cache misses reach the concurrent executor, in one batch"""
+        queries = [Query(name=f"q{i}", description="", cypher=f"RETURN {i}", category="basic") for i in range(3)]
+        concurrent = Mock(spec=ConcurrentQueryExecutor)
+        concurrent.run_all.side_effect = lambda specs, return_exceptions: [[{'cypher': q}] for q, _ in specs]
+        cache = QueryResultCache()
+
+        with patch.object(cache, 'graph_version', return_value='1-rev'):
+            runner = QueryRunner(Mock(), cache, concurrent)
+            first = runner.run_queries(queries[:2])
+            second = runner.run_queries(queries)
+
+        assert first == [[{'cypher': "RETURN 0"}], [{'cypher': "RETURN 1"}]]
+        assert second[2] == [{'cypher': "RETURN 2"}]
+        assert [call.args[0] for call in concurrent.run_all.call_args_list] == [
+            [("RETURN 0", None), ("RETURN 1", None)],
+            [("RETURN 2", None)]
+        ]
+        assert cache.stats.hits == 2
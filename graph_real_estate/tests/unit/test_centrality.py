@@ -0,0 +1,157 @@
+"""Unit tests for GraphCentralityJob with mocked dependencies"""
+
+import pytest
+from unittest.mock import Mock
+
+from analytics.centrality import (
+    GraphCentralityJob,
+    centrality_score,
+    GRAPH_METRICS_QUERY,
+    CENTRALITY_REVISION_QUERY,
+    MARK_CENTRALITY_REVISION_QUERY
+)
+from core.query_executor import QueryExecutor
+
+
+def metrics_row(listing_id, neighborhood=0, feature_connections=0, features=0, proximity=0):
+    """Connection counts as returned by GRAPH_METRICS_QUERY"""
+    return {
+        'listing_id': listing_id,
+        'neighborhood_connections': neighborhood,
+        'feature_connections': feature_connections,
+        'feature_count': features,
+        'proximity_connections': proximity
+    }
+
+
+class TestGraphCentralityJob:
+    """Test GraphCentralityJob with mocked dependencies"""
+    
+    @pytest.fixture
+    def mock_query_executor(self):
+        """Create mock query executor"""
+        mock = Mock(spec=QueryExecutor)
+        mock.execute_write.side_effect = lambda query, params: [{'count': len(params.get('scores', []))}]
+        return mock
+    
+    def test_centrality_score(self):
+        """Test score normalization and weighting"""
+        assert centrality_score(metrics_row('a')) == 0.0
+        assert centrality_score(metrics_row('a', 50, 20, 15, 30)) == 1.0
+        assert centrality_score(metrics_row('a', 100, 0, 0, 0)) == 0.25
+        assert centrality_score(metrics_row('a', 25, 10, 0, 0)) == pytest.approx(0.25)
+    
+    def test_compute_all_scores_in_batches(self, mock_query_executor):
+        """Test every property is read and written in batches"""
+        listing_ids = [f'prop{i}' for i in range(5)]
+        
+        def read(query, params=None):
+            if query == GRAPH_METRICS_QUERY:
+                return [metrics_row(i, neighborhood=50) for i in params['listing_ids']]
+            return [{'listing_id': i} for i in listing_ids]
+        
+        mock_query_executor.execute_read.side_effect = read
+        job = GraphCentralityJob(mock_query_executor, batch_size=2)
+        
+        result = job.compute_all()
+        
+        assert result.properties_scored == 5
+        assert result.batches == 3
+        assert not result.incremental
+        written = [
+            score
+            for call in mock_query_executor.execute_write.call_args_list
+            for score in call[0][1]['scores']
+        ]
+        assert [s['listing_id'] for s in written] == listing_ids
+        assert all(s['centrality_score'] == 0.25 for s in written)
+    
+    def test_refresh_scores_only_affected_properties(self, mock_query_executor):
+        """Test refresh rescores the properties returned by the affected-set query"""
+        def read(query, params=None):
+            if query == GRAPH_METRICS_QUERY:
+                return [metrics_row(i) for i in params['listing_ids']]
+            return [{'listing_ids': ['prop2', 'prop1', None, 'prop2']}]
+        
+        mock_query_executor.execute_read.side_effect = read
+        job = GraphCentralityJob(mock_query_executor)
+        
+        result = job.refresh(listing_ids=['prop1'], neighborhood_ids=['old_hood'])
+        
+        assert result.incremental
+        assert result.properties_scored == 2
+        affected_params = mock_query_executor.execute_read.call_args_list[0][0][1]
+        assert affected_params == {
+            'listing_ids': ['prop1'],
+            'neighborhood_ids': ['old_hood'],
+            'feature_names': []
+        }
+        metrics_params = mock_query_executor.execute_read.call_args_list[1][0][1]
+        assert metrics_params == {'listing_ids': ['prop1', 'prop2']}
+    
+    def test_refresh_with_nothing_affected(self, mock_query_executor):
+        """Test refresh without affected properties writes nothing"""
+        mock_query_executor.execute_read.return_value = [{'listing_ids': []}]
+        job = GraphCentralityJob(mock_query_executor)
+        
+        result = job.refresh()
+        
+        assert result.properties_scored == 0
+        mock_query_executor.execute_write.assert_not_called()
+    
+    def test_compute_all_records_scored_revision(self, mock_query_executor):
+        """Test a full run stores the graph revision it scored"""
+        def read(query, params=None):
+            if query == CENTRALITY_REVISION_QUERY:
+                return [{'revision': 'rev-2', 'centrality_revision': 'rev-1'}]
+            if query == GRAPH_METRICS_QUERY:
+                return [metrics_row(i) for i in params['listing_ids']]
+            return [{'listing_id': 'prop1'}]
+        
+        mock_query_executor.execute_read.side_effect = read
+        job = GraphCentralityJob(mock_query_executor)
+        
+        job.compute_all()
+        
+        mock_query_executor.execute_write.assert_called_with(
+            MARK_CENTRALITY_REVISION_QUERY, {'revision': 'rev-2'}
+        )
+    
+    def test_compute_if_stale_skips_current_scores(self, mock_query_executor):
+        """Test scores computed on the current revision are kept"""
+        mock_query_executor.execute_read.return_value = [
+            {'revision': 'rev-1', 'centrality_revision': 'rev-1'}
+        ]
+        job = GraphCentralityJob(mock_query_executor)
+        
+        assert job.is_current()
+        assert job.compute_if_stale() is None
+        mock_query_executor.execute_write.assert_not_called()
+    
+    def test_compute_if_stale_rescores_changed_graph(self, mock_query_executor):
+        """Test a new graph revision triggers a full run"""
+        def read(query, params=None):
+            if query == CENTRALITY_REVISION_QUERY:
+                return [{'revision': 'rev-2', 'centrality_revision': 'rev-1'}]
+            if query == GRAPH_METRICS_QUERY:
+                return [metrics_row(i) for i in params['listing_ids']]
+            return [{'listing_id': 'prop1'}, {'listing_id': 'prop2'}]
+        
+        mock_query_executor.execute_read.side_effect = read
+        job = GraphCentralityJob(mock_query_executor)
+        
+        assert not job.is_current()
+        result = job.compute_if_stale()
+        
+        assert result.properties_scored == 2
+        assert not result.incremental
+    
+    def test_create_index(self, mock_query_executor):
+        """Test the centrality index is created on Property.centrality_score"""
+        mock_query_executor.create_index.return_value = True
+        job = GraphCentralityJob(mock_query_executor)
+        
+        assert job.create_index()
+        name, query = mock_query_executor.create_index.call_args[0]
+        assert name == 'property_centrality'
+        assert 'p.centrality_score' in query
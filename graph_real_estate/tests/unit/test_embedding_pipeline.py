@@ -0,0 +1,103 @@
+"""Unit tests for PropertyEmbeddingPipeline bulk mode with mocked dependencies"""
+
+import pytest
+from unittest.mock import Mock, MagicMock
+
+from vectors.embedding_pipeline import PropertyEmbeddingPipeline
+from config.models import EmbeddingConfig, OllamaModelConfig
+
+
+class TestBulkEmbeddings:
+    """Test paging, unchanged-text skipping and UNWIND writes"""
+    
+    @pytest.fixture
+    def properties(self):
+        """Property rows as returned by the page query, in listing_id order"""
+        return [
+            {'listing_id': f'prop{i}', 'description': f'Home number {i}', 'city': 'San Francisco',
+             'bedrooms': 2, 'features': ['garage'], 'embedding_text_hash': None}
+            for i in range(5)
+        ]
+    
+    @pytest.fixture
+    def session(self, properties):
+        """Session serving keyset pages and recording UNWIND writes"""
+        session = Mock()
+        
+        def run(query, after, page_size):
+            return [dict(p) for p in properties if p['listing_id'] > after][:page_size]
+        
+        session.run.side_effect = run
+        session.written = []
+        
+        def execute_write(work, rows):
+            session.written.append(rows)
+            tx = Mock()
+            tx.run.return_value.single.return_value = {'count': len(rows)}
+            return work(tx, rows)
+        
+        session.execute_write.side_effect = execute_write
+        return session
+    
+    @pytest.fixture
+    def pipeline(self, session):
+        """Pipeline with a mocked driver and embedding model"""
+        driver = MagicMock()
+        driver.session.return_value.__enter__.return_value = session
+        config = EmbeddingConfig(
+            provider='ollama',
+            ollama=OllamaModelConfig(dimension=3),
+            batch_size=2,
+            max_concurrency=2,
+            page_size=2,
+            write_batch_size=3
+        )
+        pipeline = PropertyEmbeddingPipeline(driver, config)
+        pipeline.embed_model = Mock()
+        pipeline.embed_model.get_text_embeddings.side_effect = lambda texts: [[float(len(t)), 0.0, 1.0] for t in texts]
+        return pipeline
+    
+    def test_bulk_embeds_all_properties(self, pipeline, session):
+        """Test pages are embedded in provider batches and written with UNWIND"""
+        created = pipeline.generate_property_embeddings(bulk=True)
+        
+        assert created == 5
+        # 3 pages of at most 2 properties, the last one short
+        assert session.run.call_count == 3
+        assert [c.kwargs['after'] for c in session.run.call_args_list] == ['', 'prop1', 'prop3']
+        # Provider batches never exceed batch_size
+        for call in pipeline.embed_model.get_text_embeddings.call_args_list:
+            assert len(call[0][0]) <= 2
+        written = [row['listing_id'] for rows in session.written for row in rows]
+        assert written == [f'prop{i}' for i in range(5)]
+        assert all(row['text_hash'] for rows in session.written for row in rows)
+    
+    def test_bulk_skips_unchanged_text(self, pipeline, session, properties):
+        """Test properties whose text hash is stored are not re-embedded"""
+        text = pipeline._create_property_text(properties[1])
+        properties[1]['embedding_text_hash'] = pipeline._text_hash(text)
+        properties[3]['embedding_text_hash'] = 'stale'
+        
+        created = pipeline.generate_property_embeddings(bulk=True)
+        
+        assert created == 4
+        written = [row['listing_id'] for rows in session.written for row in rows]
+        assert 'prop1' not in written
+        assert 'prop3' in written
+        
+        session.written.clear()
+        assert pipeline.generate_property_embeddings(bulk=True, force=True) == 5
+    
+    def test_bulk_respects_limit(self, pipeline, session):
+        """Test the limit caps the properties read"""
+        created = pipeline.generate_property_embeddings(limit=3, bulk=True)
+        
+        assert created == 3
+        assert [c.kwargs['page_size'] for c in session.run.call_args_list] == [2, 1]
+    
+    def test_bulk_write_chunks(self, pipeline, session):
+        """Test writes are split into write_batch_size transactions"""
+        rows = [{'listing_id': f'p{i}', 'embedding': [0.0], 'text_hash': 'h'} for i in range(7)]
+        
+        assert pipeline._store_embeddings(rows) == 7
+        assert [len(chunk) for chunk in session.written] == [3, 3, 1]
@@ -20,6 +20,9 @@ class TestHybridPropertySearch:
         mock = Mock(spec=QueryExecutor)
         mock.execute_read.return_value = [
             {
+                'listing_id': 'prop1',
+                'features': ['fireplace', 'garage'],
+                'centrality_score': 0.5,
                 'similarity_connections': 5,
                 'neighborhood_connections': 25,
                 'feature_connections': 10,
@@ -67,6 +70,7 @@ class TestHybridPropertySearch:
                 'description': 'Cozy apartment'
             }
         ]
+        mock.similar_properties.return_value = {'prop1': ['prop2']}
         return mock
     
     @pytest.fixture
@@ -162,20 +166,22 @@ class TestHybridPropertySearch:
         assert score > 0.7  # Base combined score
         assert score <= 1.0  # Capped at 1.0
     
-    def test_get_similar_properties(self, hybrid_search, mock_query_executor):
-        """Test getting similar properties"""
-        mock_query_executor.execute_read.return_value = [
-            {'listing_id': 'prop2'},
-            {'listing_id': 'prop3'},
-            {'listing_id': 'prop4'}
-        ]
+    def test_get_similar_properties(self, hybrid_search, mock_vector_manager):
+        """Test similar properties come from the vector manager's batch lookup"""
+        mock_vector_manager.similar_properties.return_value = {
+            'prop1': ['prop2', 'prop3', 'prop4']
+        }
         
         similar = hybrid_search._get_similar_properties('prop1', limit=3)
         
-        assert len(similar) == 3
-        assert 'prop2' in similar
-        assert 'prop3' in similar
-        mock_query_executor.execute_read.assert_called()
+        assert similar == ['prop2', 'prop3', 'prop4']
+        mock_vector_manager.similar_properties.assert_called_once_with(['prop1'], limit=3, min_score=0.7)
+    
+    def test_get_similar_properties_none_found(self, hybrid_search, mock_vector_manager):
+        """Test a property without neighbours gets an empty list"""
+        mock_vector_manager.similar_properties.return_value = {}
+        
+        assert hybrid_search._get_similar_properties('prop1') == []
     
     def test_get_property_features(self, hybrid_search, mock_query_executor):
         """Test getting property features"""
@@ -205,4 +211,53 @@ class TestHybridPropertySearch:
         results = hybrid_search.search("house", use_graph_boost=False)
         
         # Combined score should equal vector score when boost is off
-        assert results[0].combined_score == results[0].vector_score
\ No newline at end of file
+        assert results[0].combined_score == results[0].vector_score
+    
+    def test_search_batches_enrichment(self, hybrid_search, mock_query_executor, mock_vector_manager):
+        """Test candidates are enriched with one query per concern"""
+        results = hybrid_search.search("house", top_k=2)
+        
+        # Materialized metrics, traversal for unscored prop2, and features,
+        # regardless of the number of candidates
+        params = [call[0][1] for call in mock_query_executor.execute_read.call_args_list]
+        assert params == [
+            {'listing_ids': ['prop1', 'prop2']},
+            {'listing_ids': ['prop2']},
+            {'listing_ids': ['prop1', 'prop2']}
+        ]
+        assert results[0].timings.queries == 3
+        mock_vector_manager.similar_properties.assert_called_once()
+        
+        prop1 = next(r for r in results if r.listing_id == 'prop1')
+        assert prop1.features == ['fireplace', 'garage']
+        assert prop1.similar_properties == ['prop2']
+        assert prop1.graph_score == 0.5
+        
+        prop2 = next(r for r in results if r.listing_id == 'prop2')
+        assert prop2.features == [] and prop2.graph_score == 0.0
+    
+    def test_search_reports_timings(self, hybrid_search):
+        """Test the latency breakdown is attached to results"""
+        results = hybrid_search.search("house")
+        
+        timings = results[0].timings
+        assert timings is hybrid_search.last_timings
+        assert timings.candidates == 2
+        assert timings.total_ms >= timings.vector_search_ms + timings.graph_metrics_ms
+    
+    def test_unscored_properties_fall_back_to_traversal(self, hybrid_search, mock_query_executor):
+        """Test properties without a materialized score are computed from the graph"""
+        mock_query_executor.execute_read.side_effect = [
+            [{'listing_id': 'prop1', 'centrality_score': 0.5, 'neighborhood_connections': 25,
+              'feature_connections': 10, 'feature_count': 8, 'proximity_connections': 15},
+             {'listing_id': 'prop2', 'centrality_score': None}],
+            [{'listing_id': 'prop2', 'neighborhood_connections': 50, 'feature_connections': 20,
+              'feature_count': 15, 'proximity_connections': 30}]
+        ]
+        
+        metrics = hybrid_search._get_graph_metrics_batch(['prop1', 'prop2'])
+        
+        assert metrics['prop1']['centrality_score'] == 0.5
+        assert metrics['prop2']['centrality_score'] == 1.0
+        fallback_params = mock_query_executor.execute_read.call_args_list[1][0][1]
+        assert fallback_params == {'listing_ids': ['prop2']}
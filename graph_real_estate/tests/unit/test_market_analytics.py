@@ -0,0 +1,188 @@
+"""Unit tests for the DuckDB and Neo4j market analytics backends"""
+
+import os
+import pytest
+from unittest.mock import Mock, patch
+
+duckdb = pytest.importorskip("duckdb")
+
+from analytics.market import (
+    MARKET_QUERIES,
+    DuckDBMarketAnalytics,
+    MarketAnalytics,
+    Neo4jMarketAnalytics,
+    compare_latency,
+    create_market_analytics,
+    format_latency_comparison
+)
+from graph_real_estate.config.models import MarketAnalyticsConfig
+
+
+def write_gold_tables(path):
+    """Pipeline DuckDB file with 24 properties in two neighborhoods"""
+    conn = duckdb.connect(str(path))
+    conn.execute("""
+        CREATE TABLE gold_neighborhoods AS
+        SELECT * FROM (VALUES
+            ('n1', 'Mission', 'San Francisco', 'CA', ['urban', 'walkable']),
+            ('n2', 'Sunset', 'San Francisco', 'CA', ['family'])
+        ) t(neighborhood_id, name, city, state, lifestyle_tags)
+    """)
+    conn.execute("""
+        CREATE TABLE gold_properties AS
+        SELECT 'p' || lpad(CAST(i AS VARCHAR), 2, '0') as listing_id,
+               CASE WHEN i <= 12 THEN 'n1' ELSE 'n2' END as neighborhood_id,
+               CASE WHEN i % 2 = 0 THEN 'condo' ELSE 'house' END as property_type,
+               CAST(CASE WHEN i = 24 THEN 9000000 ELSE 1000000 + i * 100000 END AS DECIMAL(12, 2)) as price,
+               1000 + i * 10 as square_feet,
+               CASE
+                   WHEN i <= 6 THEN [' Pool', 'Garage', 'View']
+                   WHEN i <= 9 THEN ['Garage']
+                   ELSE []
+               END as features
+        FROM range(1, 25) t(i)
+    """)
+    conn.close()
+
+
+@pytest.fixture
+def gold_db(tmp_path):
+    path = tmp_path / "pipeline.duckdb"
+    write_gold_tables(path)
+    return path
+
+
+@pytest.fixture
+def analytics(gold_db):
+    backend = DuckDBMarketAnalytics(MarketAnalyticsConfig(backend="duckdb", duckdb_path=str(gold_db)))
+    yield backend
+    backend.close()
+
+
+class TestDuckDBMarketAnalytics:
+    """Test the DuckDB backend against a small gold database"""
+
+    def test_every_query_runs(self, analytics):
+        """Test every market query has SQL that runs on the gold tables"""
+        for name in MARKET_QUERIES:
+            assert isinstance(analytics.run(name), list)
+
+    def test_feature_premiums(self, analytics):
+        """Test the baseline is the average price of properties without the feature"""
+        rows = {r['Feature']: r for r in analytics.run('feature_premiums')}
+
+        # Pool: p01-p06 vs the 18 others (p07-p23 and the 9M p24)
+        pool = rows['Pool']
+        assert pool['PropertyCount'] == 6
+        assert pool['AvgPriceWithFeature'] == pytest.approx(1_350_000)
+        assert pool['BaselinePrice'] == pytest.approx((17_000_000 + 100_000 * sum(range(7, 24)) + 9_000_000) / 18)
+        assert pool['PremiumPercent'] == pytest.approx(
+            (pool['AvgPriceWithFeature'] - pool['BaselinePrice']) / pool['BaselinePrice'] * 100
+        )
+        assert pool['Category'] == 'general'
+
+    def test_feature_cooccurrence_lift(self, analytics):
+        """Test lift compares pair support with the product of feature supports"""
+        rows = {r['FeaturePair']: r for r in analytics.run('feature_cooccurrence')}
+
+        # Pool and View always occur together: 6 * 24 / (6 * 6)
+        assert rows['Pool + View']['Lift'] == pytest.approx(4.0)
+        assert rows['Pool + View']['SampleProperties'] == ['p01', 'p02', 'p03']
+        # Garage is on 9 properties: 6 * 24 / (9 * 6)
+        assert rows['Garage + Pool']['Lift'] == pytest.approx(24 / 9)
+        assert rows['Garage + Pool']['CategoryPair'] == 'general + general'
+
+    def test_price_anomalies_and_segments(self, analytics):
+        """Test neighborhood statistics, segments and z-score outliers"""
+        anomalies = analytics.run('price_anomalies')
+        assert [r['PropertyID'] for r in anomalies] == ['p24']
+        assert anomalies[0]['Anomaly'] == 'OVERPRICED'
+        assert anomalies[0]['Location'] == 'San Francisco, Sunset'
+
+        segments = {r['Neighborhood']: r for r in analytics.run('neighborhood_segments')}
+        assert segments['Sunset']['MarketSegment'] == 'Luxury'
+        assert segments['Mission']['MarketSegment'] == 'Premium'
+        assert segments['Mission']['LifestyleTags'] == ['urban', 'walkable']
+        assert sorted(segments['Mission']['PropertyTypes']) == ['condo', 'house']
+
+    def test_undervalued_neighborhoods(self, analytics):
+        """Test neighborhoods with more features at a lower price than their city"""
+        rows = analytics.run('undervalued_neighborhoods')
+
+        assert [r['Neighborhood'] for r in rows] == ['Mission']
+        assert rows[0]['AvgFeaturesPerProperty'] == pytest.approx(1.75)
+        assert rows[0]['FeatureRatio'] == pytest.approx(2.0)
+
+    def test_results_cached_per_pipeline_run(self, analytics, gold_db):
+        """Test results are reused until the pipeline rewrites the gold data"""
+        first = analytics.run('city_overview')
+        assert analytics.run('city_overview') is first
+        assert analytics.cache.stats.hits == 1
+
+        # A new pipeline run rewrites the file
+        conn = duckdb.connect(str(gold_db))
+        conn.execute("DELETE FROM gold_properties WHERE listing_id = 'p24'")
+        conn.close()
+        stat = os.stat(gold_db)
+        os.utime(gold_db, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert analytics.run('city_overview')[0]['Properties'] == 23
+
+    def test_reads_parquet_export(self, gold_db, tmp_path):
+        """Test the gold Parquet export gives the same results as the DuckDB file"""
+        gold_dir = tmp_path / "parquet" / "gold"
+        gold_dir.mkdir(parents=True)
+        conn = duckdb.connect(str(gold_db))
+        for table in ("gold_properties", "gold_neighborhoods"):
+            conn.execute(f"COPY {table} TO '{gold_dir / table}.parquet' (FORMAT PARQUET)")
+        conn.close()
+
+        from_file = DuckDBMarketAnalytics(MarketAnalyticsConfig(duckdb_path=str(gold_db)))
+        from_parquet = DuckDBMarketAnalytics(MarketAnalyticsConfig(parquet_dir=str(tmp_path / "parquet")))
+        assert from_parquet.run('feature_premiums') == from_file.run('feature_premiums')
+
+    def test_missing_source(self, tmp_path):
+        """Test a missing pipeline output is reported"""
+        analytics = DuckDBMarketAnalytics(MarketAnalyticsConfig(duckdb_path=str(tmp_path / "missing.duckdb")))
+        with pytest.raises(FileNotFoundError):
+            analytics.run('city_overview')
+
+
+class TestBackendSelection:
+    """Test backend selection and latency comparison"""
+
+    def test_neo4j_backend_runs_cypher(self):
+        """Test the Neo4j backend runs the query's Cypher"""
+        driver = Mock()
+        with patch('analytics.market.run_query', return_value=[{'City': 'Oakland'}]) as run:
+            rows = create_market_analytics('neo4j', driver).run('city_overview')
+
+        assert rows == [{'City': 'Oakland'}]
+        run.assert_called_once_with(driver, MARKET_QUERIES['city_overview'].cypher)
+
+    def test_unknown_backend_and_query(self):
+        """Test unknown backend and query names are rejected"""
+        with pytest.raises(ValueError):
+            create_market_analytics('sqlite')
+        with pytest.raises(ValueError):
+            Neo4jMarketAnalytics(Mock()).run('missing')
+
+    def test_base_class_is_abstract(self):
+        """Test backends must implement run"""
+        with pytest.raises(TypeError):
+            MarketAnalytics()
+
+    def test_compare_latency(self):
+        """Test each backend runs every query uncached and is reported side by side"""
+        baseline, candidate = Mock(spec=MarketAnalytics), Mock(spec=MarketAnalytics)
+        baseline.backend, candidate.backend = 'neo4j', 'duckdb'
+        baseline.run.return_value = [{}, {}]
+        candidate.run.return_value = [{}, {}]
+
+        comparisons = compare_latency(baseline, candidate, ['city_overview'], repeats=2)
+
+        assert len(comparisons) == 1
+        assert comparisons[0].baseline_rows == comparisons[0].candidate_rows == 2
+        assert baseline.run.call_count == 3
+        assert all(call.kwargs == {'use_cache': False} for call in candidate.run.call_args_list)
+        assert 'city_overview' in format_latency_comparison(comparisons)
@@ -0,0 +1,58 @@
+"""Unit tests for grid-bucketed proximity pairs"""
+
+import numpy as np
+import pytest
+
+from analytics.proximity import proximity_pairs, haversine_km
+
+
+def brute_force_pairs(lat, lon, radius_km):
+    """All (i, j) pairs within radius_km by comparing every pair"""
+    i, j = np.triu_indices(len(lat), 1)
+    distance = haversine_km(lat[i], lon[i], lat[j], lon[j])
+    in_range = distance <= radius_km
+    return list(zip(i[in_range].tolist(), j[in_range].tolist()))
+
+
+class TestProximityPairs:
+    """Test proximity_pairs against brute force"""
+
+    @pytest.fixture
+    def points(self):
+        """Random points over a city-sized area"""
+        rng = np.random.default_rng(42)
+        return 37.7 + rng.random(400) * 0.2, -122.5 + rng.random(400) * 0.2
+
+    def test_matches_brute_force(self, points):
+        """Test grid bucketing finds exactly the pairs within the radius"""
+        lat, lon = points
+        i, j, distance = proximity_pairs(lat, lon, radius_km=1.0, max_candidate_pairs=10_000)
+
+        assert list(zip(i.tolist(), j.tolist())) == brute_force_pairs(lat, lon, 1.0)
+        assert np.all(distance <= 1.0)
+        assert np.all(i < j)
+
+    def test_k_nearest(self, points):
+        """Test each point keeps its k nearest and no pair exceeds the radius"""
+        lat, lon = points
+        all_i, all_j, _ = proximity_pairs(lat, lon, radius_km=1.0)
+        i, j, _ = proximity_pairs(lat, lon, radius_km=1.0, k_nearest=3)
+
+        kept = set(zip(i.tolist(), j.tolist()))
+        assert kept <= set(zip(all_i.tolist(), all_j.tolist()))
+        degree_all = np.bincount(np.concatenate([all_i, all_j]), minlength=len(lat))
+        degree = np.bincount(np.concatenate([i, j]), minlength=len(lat))
+        assert np.all(degree >= np.minimum(degree_all, 3))
+
+    def test_known_distances(self):
+        """Test a simple layout: only the close pair is linked"""
+        # Two points ~0.55 km apart and one ~11 km away
+        i, j, distance = proximity_pairs([40.0, 40.005, 40.1], [-111.0, -111.0, -111.0], radius_km=1.0)
+
+        assert i.tolist() == [0] and j.tolist() == [1]
+        assert distance[0] == pytest.approx(0.556, abs=0.01)
+
+    def test_too_few_points(self):
+        """Test fewer than two points yield no pairs"""
+        i, j, distance = proximity_pairs([40.0], [-111.0], radius_km=1.0)
+        assert i.size == 0 and j.size == 0 and distance.size == 0
@@ -0,0 +1,112 @@
+"""Unit tests for QueryResultCache with a mocked Neo4j query function"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from config.models import QueryCacheConfig
+from queries import query_cache
+from queries.query_cache import QueryResultCache, GRAPH_VERSION_QUERY
+
+
+class FakeGraph:
+    """Stands in for utils.database.run_query against a versioned graph"""
+
+    def __init__(self, revision='rev-1'):
+        self.revision = revision
+        self.executed = []
+
+    def run_query(self, driver, query, params=None):
+        if query == GRAPH_VERSION_QUERY:
+            return [{'version': 1, 'revision': self.revision}] if self.revision else []
+        self.executed.append((query, params))
+        return [{'query': query, 'params': params}]
+
+
+class TestQueryResultCache:
+    """Test QueryResultCache with a fake graph"""
+
+    @pytest.fixture
+    def graph(self):
+        """Patch the uncached query function with a fake graph"""
+        fake = FakeGraph()
+        with patch.object(query_cache, 'run_uncached_query', side_effect=fake.run_query):
+            yield fake
+
+    def test_repeated_query_is_served_from_memory(self, graph):
+        """Test the second execution of a query does not reach Neo4j"""
+        cache = QueryResultCache(QueryCacheConfig(version_check_interval=0))
+
+        first = cache.run_query(Mock(), "MATCH (p:Property) RETURN count(p)")
+        second = cache.run_query(Mock(), "MATCH (p:Property) RETURN count(p)")
+
+        assert first == second
+        assert len(graph.executed) == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_parameters_are_part_of_the_key(self, graph):
+        """Test different parameters are cached separately"""
+        cache = QueryResultCache()
+
+        cache.run_query(Mock(), "MATCH (p:Property {city: $city}) RETURN p", {'city': 'Park City'})
+        cache.run_query(Mock(), "MATCH (p:Property {city: $city}) RETURN p", {'city': 'Oakland'})
+
+        assert len(graph.executed) == 2
+        assert cache.stats.hits == 0
+
+    def test_version_bump_invalidates_results(self, graph):
+        """Test results cached for an older graph version are not reused"""
+        cache = QueryResultCache(QueryCacheConfig(version_check_interval=0))
+        query = "MATCH (n:Neighborhood) RETURN n.name"
+
+        cache.run_query(Mock(), query)
+        graph.revision = 'rev-2'
+        cache.run_query(Mock(), query)
+
+        assert len(graph.executed) == 2
+        assert cache.stats.misses == 2
+
+    def test_unversioned_graph_and_writes_are_not_cached(self, graph):
+        """Test queries bypass the cache without a graph version or when writing"""
+        cache = QueryResultCache(QueryCacheConfig(version_check_interval=0))
+
+        cache.run_query(Mock(), "MATCH (p:Property) SET p.seen = true")
+        cache.run_query(Mock(), "MATCH (p:Property) SET p.seen = true")
+        graph.revision = None
+        cache.run_query(Mock(), "MATCH (p:Property) RETURN p")
+        cache.run_query(Mock(), "MATCH (p:Property) RETURN p")
+
+        assert len(graph.executed) == 4
+        assert cache.stats.uncached == 4
+        assert cache.stats.entries == 0
+
+    def test_lru_eviction(self, graph):
+        """Test the least recently used result is evicted first"""
+        cache = QueryResultCache(QueryCacheConfig(max_entries=2))
+
+        cache.run_query(Mock(), "RETURN 1")
+        cache.run_query(Mock(), "RETURN 2")
+        cache.run_query(Mock(), "RETURN 1")
+        cache.run_query(Mock(), "RETURN 3")
+        cache.run_query(Mock(), "RETURN 1")
+        cache.run_query(Mock(), "RETURN 2")
+
+        assert [query for query, _ in graph.executed] == ["RETURN 1", "RETURN 2", "RETURN 3", "RETURN 2"]
+        assert cache.stats.entries == 2
+
+    def test_disk_store_survives_new_cache(self, graph, tmp_path):
+        """Test results written to disk are served to a later cache instance"""
+        config = QueryCacheConfig(disk_path=str(tmp_path / "query_cache.sqlite"))
+
+        first = QueryResultCache(config)
+        first.run_query(Mock(), "MATCH (f:Feature) RETURN f.name")
+        first.close()
+
+        second = QueryResultCache(config)
+        results = second.run_query(Mock(), "MATCH (f:Feature) RETURN f.name")
+
+        assert results == [{'query': "MATCH (f:Feature) RETURN f.name", 'params': None}]
+        assert len(graph.executed) == 1
+        assert second.stats.disk_hits == 1
+        assert "100% hit rate" in second.stats.summary()
@@ -0,0 +1,112 @@
+"""Unit tests for the in-memory PropertyVectorIndex"""
+
+import pytest
+import numpy as np
+
+from vectors.vector_index import PropertyVectorIndex
+from config.models import VectorIndexConfig
+
+
+def make_records(count: int, dimension: int = 16, seed: int = 0):
+    """Random property records with alternating cities"""
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(count, dimension))
+    return [
+        {
+            'listing_id': f'prop{i}',
+            'embedding': vectors[i].tolist(),
+            'city': 'San Francisco' if i % 2 == 0 else 'Park City',
+            'listing_price': 100000 * (i % 10 + 1),
+            'bedrooms': i % 5
+        }
+        for i in range(count)
+    ]
+
+
+def brute_force(records, query, top_k):
+    """Reference top-k by cosine similarity"""
+    matrix = np.array([r['embedding'] for r in records])
+    scores = matrix @ query / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query))
+    return [records[i]['listing_id'] for i in np.argsort(-scores)[:top_k]]
+
+
+class TestPropertyVectorIndex:
+    """Test exact/approximate search, filter masks and incremental updates"""
+    
+    @pytest.fixture
+    def records(self):
+        return make_records(500)
+    
+    def test_exact_search_matches_brute_force(self, records):
+        """Test exact mode returns the true top-k in order"""
+        index = PropertyVectorIndex()
+        index.build(records)
+        query = np.array(records[7]['embedding']) + 0.1
+        
+        results = index.search(query.tolist(), top_k=10)
+        
+        assert [index.ids[row] for row, _ in results] == brute_force(records, query, 10)
+        assert index.matrix.dtype == np.float32
+        assert index.matrix.flags['C_CONTIGUOUS']
+    
+    def test_filter_mask(self, records):
+        """Test filters restrict results and masks are cached"""
+        index = PropertyVectorIndex()
+        index.build(records)
+        filters = {'city': 'Park City', 'price_min': 300000, 'bedrooms_min': 2}
+        
+        results = index.search(records[0]['embedding'], top_k=20, min_score=-1.0, filters=filters)
+        
+        assert len(results) == 20
+        for row, _ in results:
+            assert index.metadata[row]['city'] == 'Park City'
+            assert index.metadata[row]['listing_price'] >= 300000
+            assert index.metadata[row]['bedrooms'] >= 2
+        assert index.filter_mask(filters) is index.filter_mask(dict(filters))
+    
+    def test_upsert_updates_and_appends(self, records):
+        """Test upsert replaces existing vectors and adds new rows"""
+        index = PropertyVectorIndex()
+        index.build(records)
+        target = [0.0] * 15 + [1.0]
+        
+        changed = index.upsert([
+            {'listing_id': 'prop3', 'embedding': target},
+            {'listing_id': 'new', 'embedding': [0.0] * 14 + [1.0, 1.0], 'city': 'Park City'}
+        ])
+        
+        assert changed == 2
+        assert len(index) == 501
+        results = index.search(target, top_k=2)
+        assert [index.ids[row] for row, _ in results] == ['prop3', 'new']
+        assert index.metadata[index.rows['prop3']]['city'] == 'Park City'
+        assert index.filter_mask({'city': 'Park City'}).sum() == 251
+    
+    def test_ivf_search_finds_nearest(self, records):
+        """Test IVF mode finds the query's own vector with full recall probing"""
+        index = PropertyVectorIndex(VectorIndexConfig(search_mode='ivf', ivf_lists=10, ivf_probes=3))
+        index.build(records)
+        
+        for i in (0, 42, 499):
+            row, score = index.search(records[i]['embedding'], top_k=1)[0]
+            assert index.ids[row] == f'prop{i}'
+            assert score == pytest.approx(1.0, abs=1e-5)
+        
+        index.upsert([{'listing_id': 'prop1', 'embedding': records[42]['embedding']}])
+        top = [index.ids[row] for row, _ in index.search(records[42]['embedding'], top_k=2)]
+        assert sorted(top) == ['prop1', 'prop42']
+    
+    def test_query_dimension_mismatch(self, records):
+        """Test a query of the wrong dimension is rejected"""
+        index = PropertyVectorIndex()
+        index.build(records)
+        
+        with pytest.raises(ValueError):
+            index.search([1.0, 0.0])
+    
+    def test_empty_index(self):
+        """Test searching an empty index returns nothing"""
+        index = PropertyVectorIndex()
+        index.build([])
+        
+        assert index.search([1.0, 0.0]) == []
@@ -76,8 +76,17 @@ class TestPropertyVectorManager:
         mock_query_executor.execute_read.assert_called_once()
     
     def test_vector_search_with_filters(self, vector_manager, mock_query_executor):
-        """Test vector search with filters"""
-        query_embedding = [0.1] * 384
+        """Test vector search with filters applied to the in-memory index"""
+        mock_query_executor.execute_read.return_value = [
+            {'listing_id': 'sf_small', 'embedding': [1.0, 0.0], 'city': 'San Francisco',
+             'listing_price': 450000, 'bedrooms': 1},
+            {'listing_id': 'sf_match', 'embedding': [0.9, 0.1], 'city': 'San Francisco',
+             'listing_price': 650000, 'bedrooms': 3},
+            {'listing_id': 'pc_match', 'embedding': [1.0, 0.0], 'city': 'Park City',
+             'listing_price': 650000, 'bedrooms': 3},
+            {'listing_id': 'sf_expensive', 'embedding': [1.0, 0.0], 'city': 'San Francisco',
+             'listing_price': 900000, 'bedrooms': 4}
+        ]
         filters = {
             'city': 'San Francisco',
             'price_min': 400000,
@@ -85,15 +94,68 @@ class TestPropertyVectorManager:
             'bedrooms_min': 2
         }
         
-        results = vector_manager.vector_search(query_embedding, filters=filters)
+        results = vector_manager.vector_search([1.0, 0.0], filters=filters)
         
-        # Check that filter parameters were included in query
-        call_args = mock_query_executor.execute_read.call_args
-        params = call_args[0][1]
-        assert params['city'] == 'San Francisco'
-        assert params['price_min'] == 400000
-        assert params['price_max'] == 700000
-        assert params['bedrooms_min'] == 2
+        assert [r['listing_id'] for r in results] == ['sf_match']
+        assert results[0]['listing_price'] == 650000
+    
+    def test_vector_search_loads_index_once(self, vector_manager, mock_query_executor):
+        """Test embeddings are read from Neo4j once and reused across searches"""
+        vector_manager.vector_search([0.15] * 384, top_k=1)
+        vector_manager.vector_search([0.25] * 384, top_k=1, filters={'city': 'San Francisco'})
+        
+        mock_query_executor.execute_read.assert_called_once()
+        assert len(vector_manager.index) == 2
+    
+    def test_store_embedding_updates_index(self, vector_manager, mock_query_executor):
+        """Test a stored embedding is searchable without reloading the index"""
+        vector_manager.load_index()
+        
+        vector_manager.store_embedding('prop2', [1.0] + [0.0] * 383, metadata={})
+        results = vector_manager.vector_search([1.0] + [0.0] * 383, top_k=1)
+        
+        assert results[0]['listing_id'] == 'prop2'
+        assert results[0]['score'] == pytest.approx(1.0)
+        mock_query_executor.execute_read.assert_called_once()
+    
+    def test_store_embedding_for_new_property_refreshes_index(self, vector_manager, mock_query_executor):
+        """Test a new property is read by id on the next search"""
+        vector_manager.load_index()
+        mock_query_executor.execute_write.return_value = [{'id': 'prop3'}]
+        
+        vector_manager.store_embedding('prop3', [1.0] + [0.0] * 383, metadata={})
+        mock_query_executor.execute_read.return_value = [
+            {'listing_id': 'prop3', 'embedding': [1.0] + [0.0] * 383, 'city': 'Park City'}
+        ]
+        results = vector_manager.vector_search([1.0] + [0.0] * 383, top_k=1)
+        
+        assert results[0]['listing_id'] == 'prop3'
+        assert results[0]['city'] == 'Park City'
+        params = mock_query_executor.execute_read.call_args[0][1]
+        assert params['listing_ids'] == ['prop3']
+    
+    def test_update_all_embeddings_uses_bulk_path(self, vector_manager):
+        """Test embeddings are regenerated through the bulk pipeline"""
+        pipeline = Mock()
+        pipeline.generate_property_embeddings.return_value = 2
+        
+        assert vector_manager.update_all_embeddings(pipeline) == 2
+        vector_manager.update_all_embeddings(pipeline, force=True)
+        
+        assert pipeline.generate_property_embeddings.call_args_list[0][1] == {'bulk': True, 'force': False}
+        assert pipeline.generate_property_embeddings.call_args_list[1][1] == {'bulk': True, 'force': True}
+    
+    def test_update_all_embeddings_refreshes_loaded_index(self, vector_manager, mock_query_executor):
+        """Test a loaded index picks up the embeddings written by the bulk run"""
+        vector_manager.load_index()
+        pipeline = Mock()
+        pipeline.generate_property_embeddings.return_value = 1
+        mock_query_executor.execute_read.return_value = [{'now': 'started'}]
+        
+        vector_manager.update_all_embeddings(pipeline)
+        
+        pipeline.generate_property_embeddings.assert_called_once_with(bulk=True, force=False)
+        assert mock_query_executor.execute_read.call_args_list[-1][0][1]['since'] == 'started'
     
     def test_vector_search_min_score(self, vector_manager, mock_query_executor):
         """Test vector search with minimum score threshold"""
@@ -113,6 +175,39 @@ class TestPropertyVectorManager:
         
         assert len(results) == 0
     
+    def test_similar_properties_batch(self, vector_manager, mock_query_executor):
+        """Test neighbours of several properties come from one index lookup"""
+        mock_query_executor.execute_read.side_effect = [
+            [],  # no precomputed SIMILAR_TO relationships
+            [
+                {'listing_id': 'a', 'embedding': [1.0, 0.0]},
+                {'listing_id': 'b', 'embedding': [0.9, 0.1]},
+                {'listing_id': 'c', 'embedding': [0.0, 1.0]}
+            ]
+        ]
+        
+        similar = vector_manager.similar_properties(['a', 'c', 'missing'], limit=1, min_score=0.5)
+        
+        assert similar == {'a': ['b'], 'c': [], 'missing': []}
+        assert mock_query_executor.execute_read.call_count == 2
+    
+    def test_similar_properties_precomputed(self, vector_manager, mock_query_executor):
+        """Test precomputed SIMILAR_TO neighbours are used without loading the index"""
+        mock_query_executor.execute_read.return_value = [
+            {'listing_id': 'a', 'similar': [
+                {'listing_id': 'b', 'score': 0.95},
+                {'listing_id': 'c', 'score': 0.9},
+                {'listing_id': 'd', 'score': 0.4}
+            ]},
+            {'listing_id': 'e', 'similar': [{'listing_id': 'a', 'score': 0.6}]}
+        ]
+        
+        similar = vector_manager.similar_properties(['a', 'e'], limit=5, min_score=0.5)
+        
+        assert similar == {'a': ['b', 'c'], 'e': ['a']}
+        mock_query_executor.execute_read.assert_called_once()
+        assert not vector_manager._index_loaded
+    
     def test_store_embedding(self, vector_manager, mock_query_executor):
         """Test storing an embedding"""
         success = vector_manager.store_embedding(
@@ -205,8 +300,9 @@ class TestPropertyVectorManager:
     
     def test_find_similar_properties(self, vector_manager, mock_query_executor):
         """Test finding similar properties"""
-        # First call gets the property's embedding
+        # No precomputed SIMILAR_TO, then the property's embedding
         mock_query_executor.execute_read.side_effect = [
+            [],  # precomputed_similar result
             [{'embedding': [0.1] * 384}],  # get_embedding result
             [  # vector_search results
                 {
@@ -45,6 +45,9 @@ class DemoDefinition(BaseModel):
     # For MODULE type demos
     file_name: Optional[str] = Field(None, description="Demo file name (for MODULE type)")
     entry_point: Optional[DemoEntryPoint] = Field(None, description="Entry point function name")
+    market_analytics: bool = Field(
+        False, description="Entry point takes analytics_backend and compare_backends keyword arguments"
+    )
     
     class Config:
         """Pydantic configuration"""
@@ -103,7 +106,8 @@ def create_demo_registry() -> DemoRegistry:
         description="Advanced market analytics and investment opportunities",
         demo_type=DemoType.MODULE,
         file_name="demo_3_market_intelligence.py",
-        entry_point=DemoEntryPoint.RUN_COMPLETE_MARKET_INTELLIGENCE_DEMO
+        entry_point=DemoEntryPoint.RUN_COMPLETE_MARKET_INTELLIGENCE_DEMO,
+        market_analytics=True
     ))
     
     # Demo 4: Wikipedia Enhanced
@@ -143,7 +147,8 @@ def create_demo_registry() -> DemoRegistry:
         description="Comprehensive demonstration of all graph capabilities",
         demo_type=DemoType.MODULE,
         file_name="demo_2_graph_analysis.py",
-        entry_point=DemoEntryPoint.MAIN
+        entry_point=DemoEntryPoint.MAIN,
+        market_analytics=True
     ))
     
     return registry
@@ -4,12 +4,14 @@ import sys
 import os
 import importlib.util
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from neo4j import Driver
 from pydantic import BaseModel, Field
 from graph_real_estate.utils.models import DemoConfig
 from graph_real_estate.utils.database import run_query
 from graph_real_estate.utils.demo_registry import DEMO_REGISTRY, DemoType, DemoEntryPoint
+from graph_real_estate.queries.query_cache import QueryResultCache
+from graph_real_estate.core.async_query_executor import ConcurrentQueryExecutor
 from graph_real_estate.demos.models import (
     RelationshipCount,
     GeographicHierarchy, 
@@ -36,16 +38,26 @@ class PropertySample(BaseModel):
 class DemoRunner:
     """Run demonstration scripts for the graph database"""
     
-    def __init__(self, driver: Driver, config: DemoConfig):
+    def __init__(
+        self,
+        driver: Driver,
+        config: DemoConfig,
+        cache: Optional[QueryResultCache] = None,
+        concurrent: Optional[ConcurrentQueryExecutor] = None
+    ):
         """
         Initialize demo runner
         
         Args:
             driver: Neo4j driver instance
             config: Demo configuration
+            cache: Optional result cache for the demo queries
+            concurrent: Optional executor that runs independent demo queries concurrently
         """
         self.driver = driver
         self.config = config
+        self.cache = cache
+        self.concurrent = concurrent
         self.demos_dir = Path(__file__).parent.parent / "demos"
     
     def run_demo(self) -> None:
@@ -61,7 +73,7 @@ class DemoRunner:
         
         if demo_def.demo_type == DemoType.SIMPLE:
             # Run simple demo queries for demo 1
-            simple_runner = SimpleDemoRunner(self.driver, self.config)
+            simple_runner = SimpleDemoRunner(self.driver, self.config, self.cache, self.concurrent)
             simple_runner.run_demo()
         elif demo_def.demo_type == DemoType.MODULE:
             # Run the demo from a module file
@@ -75,9 +87,21 @@ class DemoRunner:
                 raise FileNotFoundError(f"Demo file not found: {demo_path}")
             
             # Execute the demo module with the specified entry point
-            self._execute_demo_module(demo_path, demo_def.file_name, demo_def.entry_point)
+            entry_kwargs = {}
+            if demo_def.market_analytics:
+                entry_kwargs = {
+                    'analytics_backend': self.config.analytics_backend,
+                    'compare_backends': self.config.compare_backends
+                }
+            self._execute_demo_module(demo_path, demo_def.file_name, demo_def.entry_point, entry_kwargs)
     
-    def _execute_demo_module(self, demo_path: Path, demo_file: str, entry_point: str) -> None:
+    def _execute_demo_module(
+        self,
+        demo_path: Path,
+        demo_file: str,
+        entry_point: str,
+        entry_kwargs: Optional[Dict[str, Any]] = None
+    ) -> None:
         """
         Execute a demo module dynamically with type-safe entry point
         
@@ -85,6 +109,7 @@ class DemoRunner:
             demo_path: Path to the demo file
             demo_file: Name of the demo file
             entry_point: The entry point function name to call
+            entry_kwargs: Keyword arguments for the entry point
         """
         # Add the parent directory to sys.path temporarily
         parent_dir = str(demo_path.parent.parent)
@@ -108,7 +133,7 @@ class DemoRunner:
                 # entry_point is already a string value when use_enum_values=True
                 entry_func = getattr(demo_module, entry_point, None)
                 if entry_func and callable(entry_func):
-                    entry_func()
+                    entry_func(**(entry_kwargs or {}))
                 else:
                     raise AttributeError(
                         f"Demo module {demo_file} does not have callable function '{entry_point}'"
@@ -128,19 +153,112 @@ class DemoRunner:
                 sys.path.remove(parent_dir)
 
 
+ENTITY_LABELS = ['Property', 'Neighborhood', 'City', 'County', 'State', 'Feature', 'Wikipedia']
+RELATIONSHIP_TYPES = ['LOCATED_IN', 'IN_CITY', 'IN_COUNTY', 'HAS_FEATURE', 'NEAR', 'DESCRIBES']
+
+# Every query of the basic demo is independent, so they are fetched in one batch
+SIMPLE_DEMO_QUERIES: Dict[str, str] = {
+    'total_nodes': "MATCH (n) RETURN count(n) as count",
+    'total_relationships': "MATCH ()-[r]->() RETURN count(r) as count",
+    **{f'count_{label}': f"MATCH (n:{label}) RETURN count(n) as count" for label in ENTITY_LABELS},
+    'sample_properties': """
+        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
+        RETURN p.street_address, 
+               p.listing_price,
+               p.bedrooms,
+               p.bathrooms,
+               n.name as neighborhood_name,
+               p.city
+        LIMIT 3
+    """,
+    **{
+        f'count_{rel_type}': f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count"
+        for rel_type in RELATIONSHIP_TYPES
+    },
+    'geographic_hierarchy': """
+        MATCH (c:City)-[:IN_COUNTY]->(co:County)
+        OPTIONAL MATCH (c)<-[:IN_CITY]-(n:Neighborhood)
+        RETURN c.name as city, co.name as county, c.state as state, 
+               count(DISTINCT n) as neighborhoods
+        ORDER BY neighborhoods DESC
+        LIMIT 3
+    """,
+    'popular_features': """
+        MATCH (f:Feature)<-[:HAS_FEATURE]-(p:Property)
+        RETURN f.name as feature, count(p) as properties
+        ORDER BY properties DESC
+        LIMIT 5
+    """,
+    'price_by_city': """
+        MATCH (p:Property)
+        WHERE p.listing_price > 0
+        RETURN p.city as city,
+               count(p) as count,
+               avg(p.listing_price) as avg_price,
+               min(p.listing_price) as min_price,
+               max(p.listing_price) as max_price
+        ORDER BY avg_price DESC
+    """,
+    'property_types': """
+        MATCH (p:Property)
+        WHERE p.property_type IS NOT NULL
+        RETURN p.property_type as type, count(p) as count
+        ORDER BY count DESC
+        LIMIT 3
+    """,
+    'wikipedia_count': "MATCH (w:WikipediaArticle) RETURN count(w) as count",
+    'wikipedia_types': """
+        MATCH (w:WikipediaArticle)
+        WHERE w.content_category IS NOT NULL
+        RETURN w.content_category as type, count(w) as count
+        ORDER BY count DESC
+        LIMIT 3
+    """,
+    'wikipedia_neighborhoods': """
+        MATCH (n:Neighborhood)<-[:DESCRIBES]-(w:WikipediaArticle)
+        RETURN n.name as neighborhood, count(w) as articles
+        ORDER BY articles DESC
+        LIMIT 3
+    """,
+    'embedding_status': """
+        MATCH (p:Property)
+        RETURN count(p) as total_properties,
+               count(CASE WHEN p.embedding IS NOT NULL THEN 1 END) as properties_with_embeddings
+    """,
+    'most_features': """
+        MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
+        WITH p, count(f) as feature_count
+        WHERE feature_count >= 5
+        RETURN p.street as address, p.listing_price as price, feature_count
+        ORDER BY feature_count DESC
+        LIMIT 3
+    """,
+}
+
+
 class SimpleDemoRunner:
     """Simple demo runner for basic graph queries (Demo 1)"""
     
-    def __init__(self, driver: Driver, config: DemoConfig):
+    def __init__(
+        self,
+        driver: Driver,
+        config: DemoConfig,
+        cache: Optional[QueryResultCache] = None,
+        concurrent: Optional[ConcurrentQueryExecutor] = None
+    ):
         """
         Initialize simple demo runner
         
         Args:
             driver: Neo4j driver instance
             config: Demo configuration
+            cache: Optional result cache; queries run uncached without one
+            concurrent: Optional executor that runs the demo queries concurrently
         """
         self.driver = driver
         self.config = config
+        self.cache = cache
+        self.concurrent = concurrent
     
     def run_demo(self) -> None:
         """Run simple demo queries"""
@@ -158,28 +276,51 @@ class SimpleDemoRunner:
         print("   • Property Filtering - WHERE clauses on node properties")
         print("   • Graph Traversal - Multi-hop relationship navigation\n")
         
+        fetched = self._fetch_all()
+        
         # Run all 5 basic demos
-        self._demo_1_basic_search(run_query)
+        self._demo_1_basic_search(fetched)
         print("\n" + "-"*50 + "\n")
-        self._demo_2_relationships(run_query)
+        self._demo_2_relationships(fetched)
         print("\n" + "-"*50 + "\n")
-        self._demo_3_analytics(run_query)
+        self._demo_3_analytics(fetched)
         print("\n" + "-"*50 + "\n")
-        self._demo_4_wikipedia(run_query)
+        self._demo_4_wikipedia(fetched)
         print("\n" + "-"*50 + "\n")
-        self._demo_5_advanced(run_query)
+        self._demo_5_advanced(fetched)
+        
+        if self.cache is not None:
+            print(f"\n{self.cache.stats.summary()}")
     
-    def _demo_1_basic_search(self, run_query):
+    def _fetch_all(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run every demo query, through the cache and concurrently when configured
+        
+        Returns:
+            Result rows by SIMPLE_DEMO_QUERIES name
+        """
+        specs = [(query, None) for query in SIMPLE_DEMO_QUERIES.values()]
+        if self.cache is not None:
+            rows = self.cache.run_queries(self.driver, specs, self._execute_many)
+        else:
+            rows = self._execute_many(specs)
+        return dict(zip(SIMPLE_DEMO_QUERIES, rows))
+    
+    def _execute_many(self, specs: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """Run (query, params) pairs in order"""
+        if self.concurrent is not None:
+            return self.concurrent.run_all(specs)
+        return [run_query(self.driver, query, params) for query, params in specs]
+    
+    def _demo_1_basic_search(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Section 1: Basic graph search queries"""
         print("📊 SECTION 1: DATABASE OVERVIEW\n")
         
         # Total counts
-        query = "MATCH (n) RETURN count(n) as count"
-        result = run_query(self.driver, query)
+        result = fetched['total_nodes']
         total_nodes = result[0]['count'] if result else 0
         
-        query = "MATCH ()-[r]->() RETURN count(r) as count"
-        result = run_query(self.driver, query)
+        result = fetched['total_relationships']
         total_rels = result[0]['count'] if result else 0
         
         print(f"Total nodes: {total_nodes:,}")
@@ -187,26 +328,15 @@ class SimpleDemoRunner:
         
         # Node breakdown
         print("\nEntity Counts:")
-        for label in ['Property', 'Neighborhood', 'City', 'County', 'State', 'Feature', 'Wikipedia']:
-            query = f"MATCH (n:{label}) RETURN count(n) as count"
-            result = run_query(self.driver, query)
+        for label in ENTITY_LABELS:
+            result = fetched[f'count_{label}']
             count = result[0]['count'] if result else 0
             if count > 0:
                 print(f"  {label}: {count:,}")
         
         # Sample properties
         print("\nSample Properties:")
-        query = """
-        MATCH (p:Property)-[:LOCATED_IN]->(n:Neighborhood)
-        RETURN p.street_address, 
-               p.listing_price,
-               p.bedrooms,
-               p.bathrooms,
-               n.name as neighborhood_name,
-               p.city
-        LIMIT 3
-        """
-        results = run_query(self.driver, query)
+        results = fetched['sample_properties']
         
         # Convert to Pydantic models
         properties = []
@@ -230,17 +360,15 @@ class SimpleDemoRunner:
             print(f"   ${price:,.0f} | {bedrooms} bed, {bathrooms} bath")
             print(f"   {prop.neighborhood or 'N/A'}, {prop.city or 'N/A'}")
     
-    def _demo_2_relationships(self, run_query):
+    def _demo_2_relationships(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Section 2: Explore graph relationships"""
         print("📊 SECTION 2: GRAPH RELATIONSHIPS\n")
         
         # Count each relationship type
         print("Relationship Types:")
-        rel_types = ['LOCATED_IN', 'IN_CITY', 'IN_COUNTY', 'HAS_FEATURE', 'NEAR', 'DESCRIBES']
         relationship_counts = []
-        for rel_type in rel_types:
-            query = f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count"
-            result = run_query(self.driver, query)
+        for rel_type in RELATIONSHIP_TYPES:
+            result = fetched[f'count_{rel_type}']
             count = result[0]['count'] if result else 0
             if count > 0:
                 rel_count = RelationshipCount(relationship_type=rel_type, count=count)
@@ -248,15 +376,7 @@ class SimpleDemoRunner:
                 print(f"  {rel_count.relationship_type}: {rel_count.count:,}")
         
         print("\nGeographic Hierarchy:")
-        query = """
-        MATCH (c:City)-[:IN_COUNTY]->(co:County)
-        OPTIONAL MATCH (c)<-[:IN_CITY]-(n:Neighborhood)
-        RETURN c.name as city, co.name as county, c.state as state, 
-               count(DISTINCT n) as neighborhoods
-        ORDER BY neighborhoods DESC
-        LIMIT 3
-        """
-        results = run_query(self.driver, query)
+        results = fetched['geographic_hierarchy']
         hierarchies = []
         for row in results:
             hierarchy = GeographicHierarchy(
@@ -269,13 +389,7 @@ class SimpleDemoRunner:
             print(f"  {hierarchy.city}, {hierarchy.state} → {hierarchy.county} County ({hierarchy.neighborhoods} neighborhoods)")
         
         print("\nTop 5 Popular Features:")
-        query = """
-        MATCH (f:Feature)<-[:HAS_FEATURE]-(p:Property)
-        RETURN f.name as feature, count(p) as properties
-        ORDER BY properties DESC
-        LIMIT 5
-        """
-        results = run_query(self.driver, query)
+        results = fetched['popular_features']
         feature_counts = []
         for row in results:
             feature = FeatureCount(
@@ -285,22 +399,12 @@ class SimpleDemoRunner:
             feature_counts.append(feature)
             print(f"  {feature.feature}: {feature.properties} properties")
     
-    def _demo_3_analytics(self, run_query):
+    def _demo_3_analytics(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Section 3: Analytics queries"""
         print("📊 SECTION 3: ANALYTICS\n")
         
         print("Price Analysis by City:")
-        query = """
-        MATCH (p:Property)
-        WHERE p.listing_price > 0
-        RETURN p.city as city,
-               count(p) as count,
-               avg(p.listing_price) as avg_price,
-               min(p.listing_price) as min_price,
-               max(p.listing_price) as max_price
-        ORDER BY avg_price DESC
-        """
-        results = run_query(self.driver, query)
+        results = fetched['price_by_city']
         price_analyses = []
         for row in results[:3]:
             analysis = PriceAnalysis(
@@ -316,14 +420,7 @@ class SimpleDemoRunner:
             print(f"    Avg: ${analysis.avg_price:,.0f} (${analysis.min_price:,.0f} - ${analysis.max_price:,.0f})")
         
         print("\nProperty Types:")
-        query = """
-        MATCH (p:Property)
-        WHERE p.property_type IS NOT NULL
-        RETURN p.property_type as type, count(p) as count
-        ORDER BY count DESC
-        LIMIT 3
-        """
-        results = run_query(self.driver, query)
+        results = fetched['property_types']
         property_types = []
         for row in results:
             prop_type = PropertyType(
@@ -333,26 +430,18 @@ class SimpleDemoRunner:
             property_types.append(prop_type)
             print(f"  {prop_type.type}: {prop_type.count} properties")
     
-    def _demo_4_wikipedia(self, run_query):
+    def _demo_4_wikipedia(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Section 4: Wikipedia integration"""
         print("📊 SECTION 4: WIKIPEDIA INTEGRATION\n")
         
-        query = "MATCH (w:WikipediaArticle) RETURN count(w) as count"
-        result = run_query(self.driver, query)
+        result = fetched['wikipedia_count']
         wiki_count = result[0]['count'] if result else 0
         
         if wiki_count > 0:
             print(f"Total Wikipedia articles: {wiki_count}")
             
             print("\nWikipedia Article Types:")
-            query = """
-            MATCH (w:WikipediaArticle)
-            WHERE w.content_category IS NOT NULL
-            RETURN w.content_category as type, count(w) as count
-            ORDER BY count DESC
-            LIMIT 3
-            """
-            results = run_query(self.driver, query)
+            results = fetched['wikipedia_types']
             wiki_stats = []
             for row in results:
                 stat = WikipediaStats(
@@ -363,13 +452,7 @@ class SimpleDemoRunner:
                 print(f"  {stat.article_type}: {stat.count}")
             
             print("\nTop Neighborhoods with Wikipedia:")
-            query = """
-            MATCH (n:Neighborhood)<-[:DESCRIBES]-(w:WikipediaArticle)
-            RETURN n.name as neighborhood, count(w) as articles
-            ORDER BY articles DESC
-            LIMIT 3
-            """
-            results = run_query(self.driver, query)
+            results = fetched['wikipedia_neighborhoods']
             neighborhood_wikis = []
             for row in results:
                 n_wiki = NeighborhoodWikipedia(
@@ -381,17 +464,12 @@ class SimpleDemoRunner:
         else:
             print("No Wikipedia data found (requires full data pipeline)")
     
-    def _demo_5_advanced(self, run_query):
+    def _demo_5_advanced(self, fetched: Dict[str, List[Dict[str, Any]]]):
         """Section 5: Advanced analysis"""
         print("📊 SECTION 5: ADVANCED ANALYSIS\n")
         
         print("Property Embedding Status:")
-        query = """
-        MATCH (p:Property)
-        RETURN count(p) as total_properties,
-               count(CASE WHEN p.embedding IS NOT NULL THEN 1 END) as properties_with_embeddings
-        """
-        result = run_query(self.driver, query)
+        result = fetched['embedding_status']
         if result:
             total = result[0]['total_properties']
             with_embeddings = result[0]['properties_with_embeddings']
@@ -403,15 +481,7 @@ class SimpleDemoRunner:
             print("  No properties found")
         
         print("\nProperties with Most Features:")
-        query = """
-        MATCH (p:Property)-[:HAS_FEATURE]->(f:Feature)
-        WITH p, count(f) as feature_count
-        WHERE feature_count >= 5
-        RETURN p.street as address, p.listing_price as price, feature_count
-        ORDER BY feature_count DESC
-        LIMIT 3
-        """
-        results = run_query(self.driver, query)
+        results = fetched['most_features']
         property_features = []
         for row in results:
             prop_feat = PropertyFeatures(
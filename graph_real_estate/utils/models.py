@@ -1,6 +1,6 @@
 """Pydantic models for graph_real_estate module"""
 
-from typing import Optional, List
+from typing import Optional, List, Literal
 from pydantic import BaseModel, Field, validator
 
 
@@ -9,6 +9,10 @@ class DemoConfig(BaseModel):
     
     demo_number: int = Field(..., ge=1, le=7, description="Demo number to run (1-7)")
     verbose: bool = Field(default=False, description="Enable verbose output")
+    analytics_backend: Optional[Literal["neo4j", "duckdb"]] = Field(
+        default=None, description="Backend for market aggregates (default: market_analytics.backend setting)"
+    )
+    compare_backends: bool = Field(default=False, description="Print Neo4j vs DuckDB latency for market aggregates")
     
     @validator('demo_number')
     def validate_demo_number(cls, v):
@@ -8,7 +8,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from database import get_neo4j_driver, close_neo4j_driver
-from queries import QueryRunner, QueryLibrary
+from queries import QueryRunner, QueryLibrary, QueryResultCache
+from config import get_settings
+from core.async_query_executor import ConcurrentQueryExecutor
 
 def main():
     """Main function for query runner"""
@@ -40,6 +42,8 @@ Examples:
                        help="Export all query results to file")
     parser.add_argument("--output", type=str, default="query_results.txt",
                        help="Output file for export (default: query_results.txt)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Always run queries against Neo4j instead of the result cache")
     
     args = parser.parse_args()
     
@@ -58,7 +62,9 @@ Examples:
     
     # Initialize driver and runner
     driver = get_neo4j_driver()
-    runner = QueryRunner(driver)
+    settings = get_settings()
+    cache = QueryResultCache(settings.query_cache) if settings.query_cache.enabled and not args.no_cache else None
+    runner = QueryRunner(driver, cache, ConcurrentQueryExecutor(settings.database))
     
     try:
         if args.demo:
@@ -72,10 +78,12 @@ Examples:
             print("=" * 60)
             
             queries = QueryLibrary.get_all_queries().get(args.category, [])
-            for query in queries:
+            for query, results in zip(queries, runner.run_queries(queries)):
                 print(f"\n{query.description}")
                 print("-" * 40)
-                results = runner.run_query(query)
+                if isinstance(results, Exception):
+                    print(f"Error: {results}")
+                    continue
                 print(runner.format_results(results, limit=10))
                 if len(results) > 10:
                     print(f"... and {len(results) - 10} more results")
@@ -102,6 +110,9 @@ Examples:
         import traceback
         traceback.print_exc()
     finally:
+        if cache is not None:
+            print(f"\n{runner.cache_summary()}")
+            cache.close()
         close_neo4j_driver()
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Vector embeddings module for graph_real_estate"""
 from graph_real_estate.vectors.models import VectorIndexConfig, EmbeddingConfig, SearchConfig
+from graph_real_estate.vectors.vector_index import PropertyVectorIndex
 from graph_real_estate.vectors.vector_manager import PropertyVectorManager
 from graph_real_estate.vectors.embedding_pipeline import PropertyEmbeddingPipeline
 from graph_real_estate.vectors.hybrid_search import HybridPropertySearch, SearchResult
@@ -8,6 +9,7 @@ __all__ = [
     "VectorIndexConfig",
     "EmbeddingConfig", 
     "SearchConfig",
+    "PropertyVectorIndex",
     "PropertyVectorManager",
     "PropertyEmbeddingPipeline",
     "HybridPropertySearch",
@@ -45,15 +45,7 @@ def get_vector_index_config(config_path: Optional[str] = None) -> VectorIndexCon
     
     # Create a new config with updated dimensions if needed
     if config.vector_dimensions != embedding_config.get_dimensions():
-        from config.models import VectorIndexConfig as VIC
-        config = VIC(
-            index_name=config.index_name,
-            vector_dimensions=embedding_config.get_dimensions(),
-            similarity_function=config.similarity_function,
-            node_label=config.node_label,
-            embedding_property=config.embedding_property,
-            source_property=config.source_property
-        )
+        config = config.model_copy(update={'vector_dimensions': embedding_config.get_dimensions()})
     
     return config
 
@@ -1,8 +1,11 @@
 """Property embedding pipeline with constructor injection"""
 
+import hashlib
 import logging
 import os
-from typing import List, Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterator
 import requests
 import numpy as np
 from neo4j import Driver
@@ -91,6 +94,63 @@ class EmbeddingModel:
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
     
+    def get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for several texts with one provider request
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors in input order
+        """
+        if not texts:
+            return []
+        if self.provider in ("voyage", "openai"):
+            return self._get_batch_embeddings(texts)
+        elif self.provider == "ollama":
+            return self._get_ollama_embeddings(texts)
+        else:
+            raise ValueError(f"Unsupported provider: {self.provider}")
+    
+    def _get_batch_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings from the Voyage/OpenAI batch endpoint"""
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        data = {
+            "input": texts,
+            "model": self.model_name
+        }
+        
+        try:
+            response = requests.post(self.api_url, headers=headers, json=data)
+            response.raise_for_status()
+            result = response.json()
+            ordered = sorted(result["data"], key=lambda item: item["index"])
+            return [item["embedding"] for item in ordered]
+        except Exception as e:
+            self.logger.error(f"Failed to get {self.provider} batch embeddings: {e}")
+            raise
+    
+    def _get_ollama_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings from the Ollama batch endpoint (/api/embed)"""
+        data = {
+            "model": self.model_name,
+            "input": texts
+        }
+        
+        try:
+            response = requests.post(f"{self.base_url}/api/embed", json=data)
+            response.raise_for_status()
+            result = response.json()
+            return result["embeddings"]
+        except Exception as e:
+            self.logger.error(f"Failed to get Ollama batch embeddings: {e}")
+            raise
+    
     def _get_voyage_embedding(self, text: str) -> List[float]:
         """Get embedding from Voyage API"""
         headers = {
@@ -151,6 +211,27 @@ class EmbeddingModel:
     
 
 
+PROPERTY_TEXT_QUERY = """
+MATCH (p:Property)
+{page_filter}
+OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f:Feature)
+OPTIONAL MATCH (p)-[:IN_NEIGHBORHOOD]->(n:Neighborhood)
+RETURN p.listing_id as listing_id,
+       p.description as description,
+       p.street_address as street,
+       p.city as city,
+       p.bedrooms as bedrooms,
+       p.bathrooms as bathrooms,
+       p.square_feet as square_feet,
+       p.listing_price as price,
+       collect(DISTINCT f.name) as features,
+       n.name as neighborhood,
+       n.description as neighborhood_desc,
+       p.embedding_text_hash as embedding_text_hash
+{page_order}
+"""
+
+
 class PropertyEmbeddingPipeline:
     """Generate embeddings for properties with injected dependencies"""
     
@@ -172,35 +253,31 @@ class PropertyEmbeddingPipeline:
         self.properties_processed = 0
         self.embeddings_created = 0
     
-    def generate_property_embeddings(self, limit: Optional[int] = None) -> int:
+    def generate_property_embeddings(
+        self,
+        limit: Optional[int] = None,
+        bulk: bool = False,
+        force: bool = False
+    ) -> int:
         """
         Generate embeddings for all properties
         
         Args:
             limit: Optional limit on number of properties to process
+            bulk: Page through properties, embed with the provider's batch API
+                  and write with UNWIND (skips unchanged texts)
+            force: In bulk mode, re-embed properties whose text is unchanged
             
         Returns:
             Number of embeddings created
         """
+        if bulk:
+            return self.generate_property_embeddings_bulk(limit=limit, force=force)
+        
         self.logger.info(f"Generating property embeddings using {self.model_name}")
         
         # Get properties from database
-        query = """
-        MATCH (p:Property)
-        OPTIONAL MATCH (p)-[:HAS_FEATURE]->(f:Feature)
-        OPTIONAL MATCH (p)-[:IN_NEIGHBORHOOD]->(n:Neighborhood)
-        RETURN p.listing_id as listing_id,
-               p.description as description,
-               p.street_address as street,
-               p.city as city,
-               p.bedrooms as bedrooms,
-               p.bathrooms as bathrooms,
-               p.square_feet as square_feet,
-               p.listing_price as price,
-               collect(DISTINCT f.name) as features,
-               n.name as neighborhood,
-               n.description as neighborhood_desc
-        """
+        query = PROPERTY_TEXT_QUERY.format(page_filter="", page_order="")
         
         if limit:
             query += f" LIMIT {limit}"
@@ -230,6 +307,136 @@ class PropertyEmbeddingPipeline:
         
         return embeddings_created
     
+    def generate_property_embeddings_bulk(self, limit: Optional[int] = None, force: bool = False) -> int:
+        """
+        Generate embeddings page by page with batched provider requests and writes
+        
+        Properties are read in listing_id order, page_size at a time. Texts whose
+        hash matches p.embedding_text_hash are skipped, the rest are embedded in
+        batches of batch_size with up to max_concurrency requests in flight, and
+        vectors are written back write_batch_size rows per transaction.
+        
+        Args:
+            limit: Optional limit on number of properties to process
+            force: Re-embed properties whose text is unchanged
+            
+        Returns:
+            Number of embeddings created
+        """
+        config = self.embedding_config
+        self.logger.info(
+            f"Bulk generating property embeddings using {self.model_name} "
+            f"(batch {config.batch_size}, concurrency {config.max_concurrency})"
+        )
+        start_time = time.time()
+        embeddings_created = 0
+        skipped = 0
+        
+        with ThreadPoolExecutor(max_workers=config.max_concurrency) as executor:
+            for page in self._property_pages(limit):
+                pending = []
+                for record in page:
+                    text = self._create_property_text(record)
+                    text_hash = self._text_hash(text)
+                    if not force and record.get('embedding_text_hash') == text_hash:
+                        skipped += 1
+                        continue
+                    pending.append((record['listing_id'], text, text_hash))
+                
+                self.properties_processed += len(page)
+                if not pending:
+                    continue
+                
+                batches = [
+                    pending[i:i + config.batch_size]
+                    for i in range(0, len(pending), config.batch_size)
+                ]
+                embedded = executor.map(
+                    lambda batch: self._embed_with_retry([text for _, text, _ in batch]),
+                    batches
+                )
+                
+                rows = [
+                    {'listing_id': listing_id, 'embedding': embedding, 'text_hash': text_hash}
+                    for batch, embeddings in zip(batches, embedded)
+                    for (listing_id, _, text_hash), embedding in zip(batch, embeddings)
+                ]
+                embeddings_created += self._store_embeddings(rows)
+                
+                self.logger.info(
+                    f"Processed {self.properties_processed} properties "
+                    f"({embeddings_created} embedded, {skipped} unchanged)"
+                )
+        
+        self.embeddings_created = embeddings_created
+        self.logger.info(
+            f"Created {embeddings_created} property embeddings, skipped {skipped} unchanged "
+            f"in {time.time() - start_time:.1f}s"
+        )
+        return embeddings_created
+    
+    def _property_pages(self, limit: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Read properties in listing_id order, one page at a time"""
+        page_size = self.embedding_config.page_size
+        # Keyset pagination: the page is cut before the feature/neighborhood expansion
+        query = PROPERTY_TEXT_QUERY.format(
+            page_filter="WHERE p.listing_id > $after WITH p ORDER BY p.listing_id LIMIT $page_size",
+            page_order="ORDER BY listing_id"
+        )
+        after = ""
+        remaining = limit
+        
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            with self.driver.session() as session:
+                page = [dict(record) for record in session.run(query, after=after, page_size=size)]
+            if not page:
+                return
+            yield page
+            
+            after = page[-1]['listing_id']
+            if remaining is not None:
+                remaining -= len(page)
+            if len(page) < size:
+                return
+    
+    def _text_hash(self, text: str) -> str:
+        """Hash of the embedded text and model, stored to skip unchanged properties"""
+        return hashlib.sha256(f"{self.model_name}\n{text}".encode("utf-8")).hexdigest()
+    
+    def _embed_with_retry(self, texts: List[str]) -> List[List[float]]:
+        """One provider batch request, retried on failure"""
+        config = self.embedding_config
+        for attempt in range(config.max_retries + 1):
+            try:
+                return self.embed_model.get_text_embeddings(texts)
+            except Exception:
+                if attempt == config.max_retries:
+                    raise
+                time.sleep(config.retry_delay * (attempt + 1))
+    
+    def _store_embeddings(self, rows: List[Dict[str, Any]]) -> int:
+        """Write embeddings with UNWIND, write_batch_size rows per transaction"""
+        query = """
+        UNWIND $rows AS row
+        MATCH (p:Property {listing_id: row.listing_id})
+        SET p.embedding = row.embedding,
+            p.embedding_model = $model,
+            p.embedding_text_hash = row.text_hash,
+            p.embedding_created_at = datetime()
+        RETURN count(p) as count
+        """
+        
+        def write(tx, chunk):
+            return tx.run(query, rows=chunk, model=self.model_name).single()['count']
+        
+        written = 0
+        chunk_size = self.embedding_config.write_batch_size
+        with self.driver.session() as session:
+            for i in range(0, len(rows), chunk_size):
+                written += session.execute_write(write, rows[i:i + chunk_size])
+        return written
+    
     def _create_property_text(self, record: Dict[str, Any]) -> str:
         """Create text representation of property for embedding"""
         parts = []
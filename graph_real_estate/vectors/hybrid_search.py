@@ -1,13 +1,15 @@
 """Hybrid search with constructor injection"""
 
 import logging
+import time
 from typing import List, Dict, Any, Optional
 
+from graph_real_estate.analytics.centrality import GRAPH_METRICS_QUERY, METRIC_FIELDS, centrality_score
 from graph_real_estate.core.query_executor import QueryExecutor
 from graph_real_estate.core.config import SearchConfig
 from graph_real_estate.vectors.embedding_pipeline import PropertyEmbeddingPipeline
 from graph_real_estate.vectors.vector_manager import PropertyVectorManager
-from graph_real_estate.demos.models import SearchResult
+from graph_real_estate.demos.models import SearchResult, SearchTimings
 
 
 class HybridPropertySearch:
@@ -34,6 +36,7 @@ class HybridPropertySearch:
         self.vector_manager = vector_manager
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.last_timings: Optional[SearchTimings] = None
     
     def search(
         self,
@@ -57,9 +60,13 @@ class HybridPropertySearch:
         # Use defaults from config if not specified
         top_k = top_k or self.config.default_top_k
         use_graph_boost = use_graph_boost if use_graph_boost is not None else self.config.use_graph_boost
+        timings = SearchTimings()
+        self.last_timings = timings
+        search_start = step_start = time.perf_counter()
         
         # Generate query embedding
         query_embedding = self.embedding_pipeline.embed_model.get_text_embedding(query)
+        timings.embedding_ms, step_start = self._elapsed_ms(step_start)
         
         # Perform vector search
         vector_results = self.vector_manager.vector_search(
@@ -68,17 +75,33 @@ class HybridPropertySearch:
             min_score=self.config.min_similarity,
             filters=filters
         )
+        timings.vector_search_ms, step_start = self._elapsed_ms(step_start)
         
         if not vector_results:
+            timings.total_ms, _ = self._elapsed_ms(search_start)
             return []
         
-        # Enhance with graph data and calculate scores
+        # Enrich all candidates at once: one query per concern
+        candidates = vector_results[:top_k * 2]
+        listing_ids = [result['listing_id'] for result in candidates]
+        timings.candidates = len(listing_ids)
+        
+        graph_metrics_by_id = self._get_graph_metrics_batch(listing_ids, timings)
+        timings.graph_metrics_ms, step_start = self._elapsed_ms(step_start)
+        
+        features_by_id = self._get_property_features_batch(listing_ids)
+        timings.queries += 1
+        timings.features_ms, step_start = self._elapsed_ms(step_start)
+        
+        similar_by_id = self.vector_manager.similar_properties(listing_ids, limit=5, min_score=0.7)
+        timings.similar_properties_ms, step_start = self._elapsed_ms(step_start)
+        
+        # Calculate scores
         enhanced_results = []
-        for result in vector_results[:top_k * 2]:
-            # Get graph metrics
-            graph_metrics = self._get_graph_metrics(result['listing_id'])
+        for result in candidates:
+            listing_id = result['listing_id']
+            graph_metrics = graph_metrics_by_id.get(listing_id) or self._centrality_metrics(None)
             
-            # Calculate scores
             vector_score = result['score']
             graph_score = graph_metrics['centrality_score']
             
@@ -91,15 +114,9 @@ class HybridPropertySearch:
             else:
                 combined_score = vector_score
             
-            # Get similar properties
-            similar_properties = self._get_similar_properties(result['listing_id'], limit=5)
-            
-            # Get property features
-            features = self._get_property_features(result['listing_id'])
-            
             # Create search result
             enhanced_results.append(SearchResult(
-                listing_id=result['listing_id'],
+                listing_id=listing_id,
                 address=result.get('address'),
                 listing_price=result.get('listing_price', 0),
                 vector_score=vector_score,
@@ -111,13 +128,93 @@ class HybridPropertySearch:
                 bathrooms=result.get('bathrooms'),
                 square_feet=result.get('square_feet'),
                 description=result.get('description'),
-                similar_properties=similar_properties,
-                features=features
+                similar_properties=similar_by_id.get(listing_id, []),
+                features=features_by_id.get(listing_id, [])
             ))
         
         # Sort by combined score and return top_k
         enhanced_results.sort(key=lambda x: x.combined_score, reverse=True)
-        return enhanced_results[:top_k]
+        top_results = enhanced_results[:top_k]
+        timings.scoring_ms, _ = self._elapsed_ms(step_start)
+        timings.total_ms, _ = self._elapsed_ms(search_start)
+        
+        for result in top_results:
+            result.timings = timings
+        
+        self.logger.debug(
+            f"Search for {len(listing_ids)} candidates took {timings.total_ms:.1f}ms "
+            f"(vector {timings.vector_search_ms:.1f}ms, graph {timings.graph_metrics_ms:.1f}ms)"
+        )
+        return top_results
+    
+    @staticmethod
+    def _elapsed_ms(start: float):
+        """Milliseconds since start, and the new start time"""
+        now = time.perf_counter()
+        return (now - start) * 1000, now
+    
+    def _get_graph_metrics_batch(
+        self,
+        listing_ids: List[str],
+        timings: Optional[SearchTimings] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Graph metrics for several properties, read from the materialized scores"""
+        if not listing_ids:
+            return {}
+        
+        # Scores written by GraphCentralityJob
+        query = """
+        UNWIND $listing_ids AS listing_id
+        MATCH (p:Property {listing_id: listing_id})
+        RETURN listing_id,
+               p.neighborhood_connections as neighborhood_connections,
+               p.feature_connections as feature_connections,
+               p.feature_count as feature_count,
+               p.proximity_connections as proximity_connections,
+               p.centrality_score as centrality_score
+        """
+        
+        results = self.query_executor.execute_read(query, {'listing_ids': listing_ids})
+        if timings:
+            timings.queries += 1
+        
+        metrics = {}
+        for row in results or []:
+            if row.get('centrality_score') is not None:
+                metrics[row['listing_id']] = {
+                    'centrality_score': row['centrality_score'],
+                    **{field: row.get(field) or 0 for field in METRIC_FIELDS}
+                }
+        
+        # Properties not scored yet fall back to the graph traversal
+        unscored = [listing_id for listing_id in listing_ids if listing_id not in metrics]
+        if unscored:
+            results = self.query_executor.execute_read(GRAPH_METRICS_QUERY, {'listing_ids': unscored})
+            if timings:
+                timings.queries += 1
+            for row in results or []:
+                metrics.setdefault(row['listing_id'], self._centrality_metrics(row))
+        
+        return metrics
+    
+    def _get_property_features_batch(self, listing_ids: List[str]) -> Dict[str, List[str]]:
+        """Features of several properties in one query"""
+        if not listing_ids:
+            return {}
+        
+        query = """
+        UNWIND $listing_ids AS listing_id
+        MATCH (p:Property {listing_id: listing_id})-[:HAS_FEATURE]->(f:Feature)
+        WITH listing_id, f.name as feature
+        ORDER BY feature
+        RETURN listing_id, collect(feature) as features
+        """
+        
+        results = self.query_executor.execute_read(query, {'listing_ids': listing_ids})
+        return {
+            row['listing_id']: [feature for feature in row['features'] if feature]
+            for row in results or []
+        }
     
     def _get_graph_metrics(self, listing_id: str) -> Dict[str, Any]:
         """Calculate graph-based importance metrics for a property"""
@@ -135,7 +232,12 @@ class HybridPropertySearch:
         
         result = self.query_executor.execute_read(query, {'listing_id': listing_id})
         
-        if not result or len(result) == 0:
+        return self._centrality_metrics(result[0] if result else None)
+    
+    @staticmethod
+    def _centrality_metrics(data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Centrality score and connection counts from a graph metrics row"""
+        if not data:
             return {
                 'centrality_score': 0.0,
                 'neighborhood_connections': 0,
@@ -144,24 +246,8 @@ class HybridPropertySearch:
                 'proximity_connections': 0
             }
         
-        data = result[0]
-        
-        # Calculate centrality score based on connections
-        neighborhood_score = min(data['neighborhood_connections'] / 50, 1.0)
-        feature_conn_score = min(data['feature_connections'] / 20, 1.0)
-        feature_count_score = min(data['feature_count'] / 15, 1.0)
-        proximity_score = min(data['proximity_connections'] / 30, 1.0)
-        
-        # Weighted combination (redistributed weights after removing similarity)
-        centrality = (
-            neighborhood_score * 0.25 +
-            feature_conn_score * 0.25 +
-            feature_count_score * 0.25 +
-            proximity_score * 0.25
-        )
-        
         return {
-            'centrality_score': min(centrality, 1.0),
+            'centrality_score': centrality_score(data),
             'neighborhood_connections': data['neighborhood_connections'],
             'feature_connections': data['feature_connections'],
             'feature_count': data['feature_count'],
@@ -196,30 +282,8 @@ class HybridPropertySearch:
         return min(combined, 1.0)  # Cap at 1.0
     
     def _get_similar_properties(self, listing_id: str, limit: int = 5) -> List[str]:
-        """Get IDs of similar properties based on embeddings"""
-        # Get source property embedding
-        query = """
-        MATCH (p:Property {listing_id: $listing_id})
-        WHERE p.embedding IS NOT NULL
-        RETURN p.embedding as embedding
-        """
-        
-        result = self.query_executor.execute_read(query, {'listing_id': listing_id})
-        if not result or not result[0].get('embedding'):
-            return []
-        
-        source_embedding = result[0]['embedding']
-        
-        # Find similar properties using vector similarity
-        similar_results = self.vector_manager.vector_search(
-            source_embedding,
-            top_k=limit + 1,  # +1 because source will be included
-            min_score=0.7
-        )
-        
-        # Filter out the source property and return IDs
-        return [r['listing_id'] for r in similar_results 
-                if r.get('listing_id') and r['listing_id'] != listing_id][:limit]
+        """Get IDs of similar properties (precomputed SIMILAR_TO, else embeddings)"""
+        return self.vector_manager.similar_properties([listing_id], limit=limit, min_score=0.7).get(listing_id, [])
     
     def _get_property_features(self, listing_id: str) -> List[str]:
         """Get features of a property"""
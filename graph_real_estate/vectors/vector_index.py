@@ -0,0 +1,385 @@
+"""In-memory vector index for property similarity search
+
+Embeddings are held in one contiguous float32 matrix with L2-normalized rows,
+so cosine similarity for every property is a single matrix-vector product and
+top-k is an argpartition over the scores. Filter columns (city, price,
+bedrooms) are kept as arrays and filter masks are cached until the index
+changes.
+
+Search modes (VectorIndexConfig.search_mode):
+- exact: scan the whole matrix (default, deterministic)
+- ivf: k-means clusters over the rows; only the closest ivf_probes clusters
+  are scored
+- hnsw: hnswlib graph index (optional dependency, pip install hnswlib)
+"""
+
+import logging
+import math
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+
+from graph_real_estate.config.models import VectorIndexConfig
+
+
+class PropertyVectorIndex:
+    """Normalized embedding matrix with exact and approximate top-k search"""
+
+    METADATA_FIELDS = (
+        'address', 'city', 'neighborhood', 'listing_price',
+        'bedrooms', 'bathrooms', 'square_feet', 'description'
+    )
+    IVF_ITERATIONS = 10
+    IVF_TRAINING_ROWS_PER_LIST = 64
+    GATHER_FRACTION = 4
+
+    def __init__(self, config: Optional[VectorIndexConfig] = None):
+        """
+        Initialize an empty index
+
+        Args:
+            config: Vector index configuration (search mode and ANN parameters)
+        """
+        self.config = config or VectorIndexConfig()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._reset()
+
+    def _reset(self):
+        """Drop all vectors and derived structures"""
+        self.ids: List[str] = []
+        self.metadata: List[Dict[str, Any]] = []
+        self.rows: Dict[str, int] = {}
+        self.matrix = np.zeros((0, 0), dtype=np.float32)
+        self.cities = np.array([], dtype=object)
+        self.prices = np.array([], dtype=np.float64)
+        self.bedrooms = np.array([], dtype=np.float64)
+        self._mask_cache: Dict[Tuple, np.ndarray] = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments: Optional[np.ndarray] = None
+        self._hnsw = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dimension(self) -> int:
+        """Vector dimension (0 when empty)"""
+        return self.matrix.shape[1]
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """L2-normalize rows; zero rows stay zero"""
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+    @staticmethod
+    def _number(value: Any) -> float:
+        """Filter column value, NaN when missing"""
+        return float(value) if value is not None else math.nan
+
+    def build(self, records: List[Dict[str, Any]]):
+        """
+        Replace the index contents
+
+        Args:
+            records: Rows with listing_id, embedding and the metadata fields
+        """
+        self._reset()
+        records = [
+            r for r in records
+            if r.get('listing_id') and r.get('embedding') is not None and len(r['embedding'])
+        ]
+        if not records:
+            return
+
+        dimension = len(records[0]['embedding'])
+        kept = [r for r in records if len(r['embedding']) == dimension]
+        if len(kept) < len(records):
+            self.logger.warning(f"Skipped {len(records) - len(kept)} embeddings without dimension {dimension}")
+
+        self.ids = [r['listing_id'] for r in kept]
+        self.rows = {listing_id: row for row, listing_id in enumerate(self.ids)}
+        self.metadata = [{field: r.get(field) for field in self.METADATA_FIELDS} for r in kept]
+        self.matrix = np.ascontiguousarray(
+            self._normalize(np.array([r['embedding'] for r in kept], dtype=np.float32))
+        )
+        self.cities = np.array([m['city'] for m in self.metadata], dtype=object)
+        self.prices = np.array([self._number(m['listing_price']) for m in self.metadata])
+        self.bedrooms = np.array([self._number(m['bedrooms']) for m in self.metadata])
+        self._build_ann()
+
+        self.logger.info(f"Indexed {len(self.ids)} embeddings ({self.config.search_mode} search)")
+
+    def upsert(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Update rows in place and append new ones
+
+        Records without metadata fields keep the metadata already indexed.
+
+        Args:
+            records: Rows with listing_id and embedding
+
+        Returns:
+            Number of rows changed
+        """
+        if not self.ids:
+            self.build(records)
+            return len(self.ids)
+
+        updated_rows, new_records = [], []
+        for record in records:
+            embedding = record.get('embedding')
+            if embedding is None or len(embedding) != self.dimension:
+                continue
+            row = self.rows.get(record['listing_id'])
+            if row is None:
+                new_records.append(record)
+                continue
+            self.matrix[row] = self._normalize(np.asarray(embedding, dtype=np.float32))
+            for field in self.METADATA_FIELDS:
+                if field in record:
+                    self.metadata[row][field] = record[field]
+            self.cities[row] = self.metadata[row]['city']
+            self.prices[row] = self._number(self.metadata[row]['listing_price'])
+            self.bedrooms[row] = self._number(self.metadata[row]['bedrooms'])
+            updated_rows.append(row)
+
+        if new_records:
+            start = len(self.ids)
+            for offset, record in enumerate(new_records):
+                self.ids.append(record['listing_id'])
+                self.rows[record['listing_id']] = start + offset
+                self.metadata.append({field: record.get(field) for field in self.METADATA_FIELDS})
+            vectors = self._normalize(np.array([r['embedding'] for r in new_records], dtype=np.float32))
+            self.matrix = np.ascontiguousarray(np.vstack([self.matrix, vectors]))
+            new_metadata = self.metadata[start:]
+            self.cities = np.concatenate([self.cities, np.array([m['city'] for m in new_metadata], dtype=object)])
+            self.prices = np.concatenate([self.prices, [self._number(m['listing_price']) for m in new_metadata]])
+            self.bedrooms = np.concatenate([self.bedrooms, [self._number(m['bedrooms']) for m in new_metadata]])
+            updated_rows.extend(range(start, len(self.ids)))
+
+        if updated_rows:
+            self._mask_cache.clear()
+            self._update_ann(np.array(updated_rows))
+        return len(updated_rows)
+
+    def filter_mask(self, filters: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """
+        Boolean row mask for city/price/bedroom filters (cached per filter set)
+
+        Args:
+            filters: city, price_min, price_max, bedrooms_min
+
+        Returns:
+            Mask over rows, or None when no filter applies
+        """
+        if not filters:
+            return None
+        key = tuple(sorted(
+            (name, filters[name])
+            for name in ('city', 'price_min', 'price_max', 'bedrooms_min')
+            if name in filters
+        ))
+        if not key:
+            return None
+        if key in self._mask_cache:
+            return self._mask_cache[key]
+
+        mask = np.ones(len(self.ids), dtype=bool)
+        with np.errstate(invalid='ignore'):
+            if 'city' in filters:
+                mask &= self.cities == filters['city']
+            if 'price_min' in filters:
+                mask &= self.prices >= filters['price_min']
+            if 'price_max' in filters:
+                mask &= self.prices <= filters['price_max']
+            if 'bedrooms_min' in filters:
+                mask &= self.bedrooms >= filters['bedrooms_min']
+
+        self._mask_cache[key] = mask
+        return mask
+
+    def search(
+        self,
+        query_embedding: List[float],
+        top_k: int = 10,
+        min_score: float = 0.0,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Top-k rows by cosine similarity
+
+        Args:
+            query_embedding: Query vector
+            top_k: Number of results to return
+            min_score: Minimum similarity score
+            filters: Optional filters to apply
+
+        Returns:
+            (row, score) pairs, best first
+        """
+        if not self.ids or top_k <= 0:
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape != (self.dimension,):
+            raise ValueError(f"Query dimension {query.shape[0]} does not match index dimension {self.dimension}")
+        query = self._normalize(query)
+        mask = self.filter_mask(filters)
+
+        if self.config.search_mode == 'hnsw' and self._hnsw is not None:
+            rows, scores = self._search_hnsw(query, top_k, mask)
+        else:
+            candidates = self._ivf_candidates(query) if self.config.search_mode == 'ivf' else None
+            if mask is not None:
+                candidates = mask if candidates is None else candidates & mask
+            rows, scores = self._search_matrix(query, top_k, candidates)
+
+        scores = np.clip(scores, -1.0, 1.0)
+        return [(int(row), float(score)) for row, score in zip(rows, scores) if score >= min_score]
+
+    def similar_rows(
+        self,
+        rows: List[int],
+        top_k: int = 5,
+        min_score: float = 0.0
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Exact top-k neighbours of indexed rows, excluding each row itself
+
+        All rows are scored with one matrix product against the index.
+
+        Args:
+            rows: Index rows to find neighbours for
+            top_k: Neighbours per row
+            min_score: Minimum similarity score
+
+        Returns:
+            (row, score) pairs per input row, best first
+        """
+        if not rows or top_k <= 0:
+            return [[] for _ in rows]
+
+        scores = self.matrix[rows] @ self.matrix.T
+        scores[np.arange(len(rows)), rows] = -np.inf
+        k = min(top_k, len(self.ids) - 1)
+        if k <= 0:
+            return [[] for _ in rows]
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        neighbours = []
+        for i, candidates in enumerate(top):
+            candidate_scores = scores[i, candidates]
+            order = np.lexsort((candidates, -candidate_scores))
+            neighbours.append([
+                (int(candidates[j]), float(min(candidate_scores[j], 1.0)))
+                for j in order
+                if candidate_scores[j] >= min_score
+            ])
+        return neighbours
+
+    def _search_matrix(
+        self,
+        query: np.ndarray,
+        top_k: int,
+        candidates: Optional[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score candidate rows with one matrix-vector product"""
+        rows = np.flatnonzero(candidates) if candidates is not None else None
+        if rows is None:
+            scores = self.matrix @ query
+        elif rows.size == 0:
+            return rows, np.array([], dtype=np.float32)
+        elif rows.size * self.GATHER_FRACTION < len(self.ids):
+            # Few candidates: copying their rows is cheaper than a full scan
+            scores = self.matrix[rows] @ query
+        else:
+            scores = (self.matrix @ query)[rows]
+        k = min(top_k, scores.size)
+        top = np.argpartition(-scores, k - 1)[:k] if k < scores.size else np.arange(scores.size)
+        # Sort by score, then row, so ties come back in index order
+        top = top[np.lexsort((top, -scores[top]))]
+        return (rows[top] if rows is not None else top), scores[top]
+
+    def _build_ann(self):
+        """Build the approximate structure for the configured mode"""
+        if self.config.search_mode == 'ivf':
+            self._build_ivf()
+        elif self.config.search_mode == 'hnsw':
+            self._build_hnsw()
+
+    def _update_ann(self, rows: np.ndarray):
+        """Bring the approximate structure up to date for changed rows"""
+        if self.config.search_mode == 'ivf' and self._centroids is not None:
+            assignments = np.argmax(self.matrix[rows] @ self._centroids.T, axis=1)
+            if self._assignments.size < len(self.ids):
+                self._assignments = np.concatenate([
+                    self._assignments,
+                    np.zeros(len(self.ids) - self._assignments.size, dtype=self._assignments.dtype)
+                ])
+            self._assignments[rows] = assignments
+        elif self.config.search_mode == 'hnsw' and self._hnsw is not None:
+            if len(self.ids) > self._hnsw.get_max_elements():
+                self._hnsw.resize_index(max(len(self.ids), 2 * self._hnsw.get_max_elements()))
+            self._hnsw.add_items(self.matrix[rows], rows)
+
+    def _build_ivf(self):
+        """Spherical k-means over the normalized rows"""
+        count = len(self.ids)
+        lists = min(self.config.ivf_lists or max(1, int(math.sqrt(count))), count)
+        rng = np.random.default_rng(0)
+        # Centroids are trained on a sample; every row is assigned afterwards
+        sample_size = min(count, lists * self.IVF_TRAINING_ROWS_PER_LIST)
+        sample = self.matrix[np.sort(rng.choice(count, sample_size, replace=False))]
+        centroids = sample[rng.choice(sample_size, lists, replace=False)].copy()
+
+        for _ in range(self.IVF_ITERATIONS):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(assignments, kind='stable')
+            filled, starts = np.unique(assignments[order], return_index=True)
+            sums = np.add.reduceat(sample[order], starts, axis=0)
+            centroids[filled] = self._normalize(sums)
+
+        self._centroids = centroids
+        self._assignments = np.argmax(self.matrix @ centroids.T, axis=1)
+
+    def _ivf_candidates(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Rows in the clusters closest to the query"""
+        if self._centroids is None:
+            return None
+        probes = min(self.config.ivf_probes, len(self._centroids))
+        closest = np.argpartition(-(self._centroids @ query), probes - 1)[:probes]
+        return np.isin(self._assignments, closest)
+
+    def _build_hnsw(self):
+        """hnswlib inner-product index; falls back to exact search without hnswlib"""
+        try:
+            import hnswlib
+        except ImportError:
+            self.logger.warning("hnswlib not installed (pip install hnswlib); using exact search")
+            return
+
+        index = hnswlib.Index(space='ip', dim=self.dimension)
+        index.init_index(
+            max_elements=len(self.ids),
+            M=self.config.hnsw_m,
+            ef_construction=self.config.hnsw_ef_construction
+        )
+        index.add_items(self.matrix, np.arange(len(self.ids)))
+        index.set_ef(self.config.hnsw_ef_search)
+        self._hnsw = index
+
+    def _search_hnsw(
+        self,
+        query: np.ndarray,
+        top_k: int,
+        mask: Optional[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate top-k from the HNSW graph"""
+        allowed = int(mask.sum()) if mask is not None else len(self.ids)
+        k = min(top_k, allowed)
+        if k == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.float32)
+        self._hnsw.set_ef(max(self.config.hnsw_ef_search, k))
+        row_filter = (lambda row: bool(mask[row])) if mask is not None else None
+        labels, distances = self._hnsw.knn_query(query, k=k, filter=row_filter)
+        # hnswlib 'ip' distance is 1 - dot product
+        return labels[0], 1.0 - distances[0]
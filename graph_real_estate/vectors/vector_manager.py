@@ -1,27 +1,126 @@
 """Property vector manager with constructor injection"""
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 import numpy as np
 from neo4j import Driver
 
+from graph_real_estate.config.models import VectorIndexConfig
 from graph_real_estate.core.query_executor import QueryExecutor
+from graph_real_estate.vectors.vector_index import PropertyVectorIndex
+
+
+PROPERTY_VECTORS_QUERY = """
+MATCH (p:Property)
+WHERE p.embedding IS NOT NULL
+{condition}
+RETURN p.listing_id as listing_id,
+       p.embedding as embedding,
+       p.street_address as address,
+       p.city as city,
+       p.neighborhood_id as neighborhood,
+       p.listing_price as listing_price,
+       p.bedrooms as bedrooms,
+       p.bathrooms as bathrooms,
+       p.square_feet as square_feet,
+       p.description as description
+"""
+
+# Neighbours written by the pipeline's SIMILAR_TO job, best first. Properties
+# without SIMILAR_TO relationships are missing from the result.
+PRECOMPUTED_SIMILAR_QUERY = """
+UNWIND $listing_ids AS listing_id
+MATCH (p:Property {listing_id: listing_id})-[r:SIMILAR_TO]->(s:Property)
+WITH listing_id, r.score as score, s
+ORDER BY score DESC
+RETURN listing_id,
+       collect({
+           listing_id: s.listing_id,
+           score: score,
+           address: s.street_address,
+           city: s.city,
+           neighborhood: s.neighborhood_id,
+           listing_price: s.listing_price,
+           bedrooms: s.bedrooms,
+           bathrooms: s.bathrooms,
+           square_feet: s.square_feet,
+           description: s.description
+       }) as similar
+"""
 
 
 class PropertyVectorManager:
     """Manage property vectors with injected dependencies"""
     
-    def __init__(self, driver: Driver, query_executor: QueryExecutor):
+    def __init__(
+        self,
+        driver: Driver,
+        query_executor: QueryExecutor,
+        index_config: Optional[VectorIndexConfig] = None
+    ):
         """
         Initialize vector manager with dependencies
         
         Args:
             driver: Neo4j driver
             query_executor: Query executor for database operations
+            index_config: In-memory index configuration (exact search if not provided)
         """
         self.driver = driver
         self.query_executor = query_executor
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Embeddings are loaded from Neo4j once, on the first search
+        self.index = PropertyVectorIndex(index_config)
+        self._index_loaded = False
+        self._pending_ids: Set[str] = set()
+    
+    def load_index(self) -> int:
+        """
+        Load all property embeddings into the in-memory index
+        
+        Returns:
+            Number of indexed embeddings
+        """
+        records = self.query_executor.execute_read(PROPERTY_VECTORS_QUERY.format(condition=""))
+        self.index.build(records or [])
+        self._index_loaded = True
+        self._pending_ids.clear()
+        return len(self.index)
+    
+    def refresh_index(self, listing_ids: Optional[List[str]] = None, since: Any = None) -> int:
+        """
+        Re-read changed embeddings into the index
+        
+        Args:
+            listing_ids: Properties to re-read
+            since: Re-read embeddings written at or after this Neo4j datetime
+            
+        Returns:
+            Number of index rows changed
+        """
+        if not self._index_loaded:
+            return self.load_index()
+        
+        if listing_ids is not None:
+            condition, params = "AND p.listing_id IN $listing_ids", {'listing_ids': list(listing_ids)}
+        elif since is not None:
+            condition = "AND coalesce(p.embedding_updated_at, p.embedding_created_at) >= $since"
+            params = {'since': since}
+        else:
+            return self.load_index()
+        
+        records = self.query_executor.execute_read(PROPERTY_VECTORS_QUERY.format(condition=condition), params)
+        return self.index.upsert(records or [])
+    
+    def _ensure_index(self):
+        """Load the index on first use and pick up embeddings stored since"""
+        if not self._index_loaded:
+            self.load_index()
+        elif self._pending_ids:
+            pending = sorted(self._pending_ids)
+            self._pending_ids.clear()
+            self.refresh_index(listing_ids=pending)
     
     def vector_search(
         self, 
@@ -37,91 +136,89 @@ class PropertyVectorManager:
             query_embedding: Query vector
             top_k: Number of results to return
             min_score: Minimum similarity score
-            filters: Optional filters to apply
+            filters: Optional filters to apply (city, price_min, price_max, bedrooms_min)
             
         Returns:
             List of similar properties with scores
         """
         self.logger.debug(f"Performing vector search with top_k={top_k}, min_score={min_score}")
         
-        # Build filter clause if filters provided
-        filter_clause = ""
-        filter_params = {}
+        self._ensure_index()
         
-        if filters:
-            filter_conditions = []
-            
-            if 'city' in filters:
-                filter_conditions.append("p.city = $city")
-                filter_params['city'] = filters['city']
-            
-            if 'price_min' in filters:
-                filter_conditions.append("p.listing_price >= $price_min")
-                filter_params['price_min'] = filters['price_min']
-            
-            if 'price_max' in filters:
-                filter_conditions.append("p.listing_price <= $price_max")
-                filter_params['price_max'] = filters['price_max']
-            
-            if 'bedrooms_min' in filters:
-                filter_conditions.append("p.bedrooms >= $bedrooms_min")
-                filter_params['bedrooms_min'] = filters['bedrooms_min']
-            
-            if filter_conditions:
-                filter_clause = "AND " + " AND ".join(filter_conditions)
+        if not len(self.index):
+            self.logger.warning("No properties with embeddings found")
+            return []
         
-        # Get all property embeddings
-        query = f"""
-        MATCH (p:Property)
-        WHERE p.embedding IS NOT NULL
-        {filter_clause}
-        RETURN p.listing_id as listing_id,
-               p.embedding as embedding,
-               p.street_address as address,
-               p.city as city,
-               p.neighborhood_id as neighborhood,
-               p.listing_price as listing_price,
-               p.bedrooms as bedrooms,
-               p.bathrooms as bathrooms,
-               p.square_feet as square_feet,
-               p.description as description
+        return [
+            {'listing_id': self.index.ids[row], 'score': score, **self.index.metadata[row]}
+            for row, score in self.index.search(query_embedding, top_k, min_score, filters)
+        ]
+    
+    def precomputed_similar(
+        self,
+        listing_ids: List[str],
+        limit: int = 5,
+        min_score: float = 0.0
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
+        Similar properties from precomputed SIMILAR_TO relationships
         
-        results = self.query_executor.execute_read(query, filter_params)
+        Args:
+            listing_ids: Properties to find neighbours for
+            limit: Similar properties per listing
+            min_score: Minimum similarity score
+            
+        Returns:
+            Similar properties with scores per listing id, only for listings
+            that have SIMILAR_TO relationships
+        """
+        if not listing_ids:
+            return {}
         
-        if not results:
-            self.logger.warning("No properties with embeddings found")
-            return []
+        results = self.query_executor.execute_read(PRECOMPUTED_SIMILAR_QUERY, {'listing_ids': listing_ids})
+        return {
+            row['listing_id']: [s for s in row['similar'] if s['score'] >= min_score][:limit]
+            for row in results or []
+        }
+    
+    def similar_properties(
+        self,
+        listing_ids: List[str],
+        limit: int = 5,
+        min_score: float = 0.0
+    ) -> Dict[str, List[str]]:
+        """
+        Similar property ids for several properties at once
         
-        # Calculate similarities
-        query_vec = np.array(query_embedding)
-        similarities = []
+        Precomputed SIMILAR_TO relationships are used where they exist; only
+        the remaining listings are looked up in the vector index.
         
-        for record in results:
-            prop_vec = np.array(record['embedding'])
-            
-            # Cosine similarity
-            similarity = self._cosine_similarity(query_vec, prop_vec)
+        Args:
+            listing_ids: Properties to find neighbours for
+            limit: Similar properties per listing
+            min_score: Minimum similarity score
             
-            if similarity >= min_score:
-                similarities.append({
-                    'listing_id': record['listing_id'],
-                    'score': float(similarity),
-                    'address': record.get('address'),
-                    'city': record.get('city'),
-                    'neighborhood': record.get('neighborhood'),
-                    'listing_price': record.get('listing_price'),
-                    'bedrooms': record.get('bedrooms'),
-                    'bathrooms': record.get('bathrooms'),
-                    'square_feet': record.get('square_feet'),
-                    'description': record.get('description')
-                })
-        
-        # Sort by similarity score
-        similarities.sort(key=lambda x: x['score'], reverse=True)
-        
-        # Return top k results
-        return similarities[:top_k]
+        Returns:
+            Similar listing ids per listing id (empty without an embedding)
+        """
+        precomputed = self.precomputed_similar(listing_ids, limit, min_score)
+        similar = {
+            listing_id: [s['listing_id'] for s in precomputed.get(listing_id, [])]
+            for listing_id in listing_ids
+        }
+        
+        missing = [listing_id for listing_id in listing_ids if listing_id not in precomputed]
+        if not missing:
+            return similar
+        
+        self._ensure_index()
+        
+        indexed = [listing_id for listing_id in missing if listing_id in self.index.rows]
+        neighbours = self.index.similar_rows([self.index.rows[i] for i in indexed], limit, min_score)
+        
+        for listing_id, rows in zip(indexed, neighbours):
+            similar[listing_id] = [self.index.ids[row] for row, _ in rows]
+        return similar
     
     def store_embedding(
         self,
@@ -155,7 +252,17 @@ class PropertyVectorManager:
                 'metadata': metadata
             })
             
-            return len(result) > 0
+            if not result:
+                return False
+            
+            if self._index_loaded:
+                if node_id in self.index.rows:
+                    self.index.upsert([{'listing_id': node_id, 'embedding': embedding}])
+                else:
+                    # New row: its search metadata is read on the next search
+                    self._pending_ids.add(node_id)
+            
+            return True
             
         except Exception as e:
             self.logger.error(f"Failed to store embedding for {node_id}: {e}")
@@ -231,6 +338,9 @@ class PropertyVectorManager:
         """
         Find properties similar to a given property
         
+        Uses the precomputed SIMILAR_TO relationships when the property has
+        them, otherwise a vector search.
+        
         Args:
             listing_id: Property listing ID
             top_k: Number of similar properties to return
@@ -238,6 +348,10 @@ class PropertyVectorManager:
         Returns:
             List of similar properties
         """
+        precomputed = self.precomputed_similar([listing_id], limit=top_k)
+        if listing_id in precomputed:
+            return precomputed[listing_id]
+        
         # Get embedding for the property
         embedding = self.get_embedding(listing_id)
         
@@ -251,14 +365,24 @@ class PropertyVectorManager:
         # Filter out the property itself
         return [r for r in results if r['listing_id'] != listing_id][:top_k]
     
-    def update_all_embeddings(self, embedding_pipeline) -> int:
+    def update_all_embeddings(self, embedding_pipeline, force: bool = False) -> int:
         """
         Update embeddings for all properties
         
+        Uses the pipeline's bulk path: paged reads, batched provider calls
+        and UNWIND writes, skipping properties whose text is unchanged.
+        
         Args:
             embedding_pipeline: Pipeline to generate embeddings
+            force: Re-embed properties whose text is unchanged
             
         Returns:
             Number of embeddings updated
         """
-        return embedding_pipeline.generate_property_embeddings()
\ No newline at end of file
+        if not self._index_loaded:
+            return embedding_pipeline.generate_property_embeddings(bulk=True, force=force)
+        
+        started = self.query_executor.execute_read("RETURN datetime() as now")[0]['now']
+        updated = embedding_pipeline.generate_property_embeddings(bulk=True, force=force)
+        self.refresh_index(since=started)
+        return updated
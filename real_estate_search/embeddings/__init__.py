@@ -5,7 +5,12 @@ Provides query embedding generation capabilities for semantic search.
 """
 
 from .models import EmbeddingConfig, EmbeddingProvider
-from .service import QueryEmbeddingService
+from .service import (
+    QueryEmbeddingService,
+    get_shared_embedding_service,
+    close_shared_embedding_services
+)
+from .cache import QueryEmbeddingCache, QueryEmbeddingStats, normalize_query
 from .exceptions import (
     EmbeddingException,
     ConfigurationError,
@@ -20,6 +25,13 @@ __all__ = [
     
     # Service
     'QueryEmbeddingService',
+    'get_shared_embedding_service',
+    'close_shared_embedding_services',
+    
+    # Cache
+    'QueryEmbeddingCache',
+    'QueryEmbeddingStats',
+    'normalize_query',
     
     # Exceptions
     'EmbeddingException',
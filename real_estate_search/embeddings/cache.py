@@ -0,0 +1,197 @@
+"""
+Query embedding cache for real estate search.
+
+Search queries repeat a lot ("homes with a pool", "Homes with a pool ").
+Vectors are cached per (model, normalized query text) in a bounded in-memory
+LRU with an optional TTL and, when a disk path is configured, in a SQLite
+file so a restarted process starts warm.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize query text for cache lookups.
+
+    Case and runs of whitespace do not change what a query asks for.
+
+    Args:
+        query: Query text
+
+    Returns:
+        Lower-cased query with single spaces
+    """
+    return " ".join(query.casefold().split())
+
+
+class QueryEmbeddingStats(BaseModel):
+    """Cache counters and provider latency of a query embedding service."""
+
+    hits: int = Field(default=0, ge=0, description="Vectors served from memory")
+    disk_hits: int = Field(default=0, ge=0, description="Vectors served from the disk store")
+    misses: int = Field(default=0, ge=0, description="Queries sent to the provider")
+    entries: int = Field(default=0, ge=0, description="Vectors held in memory")
+    p50_ms: float = Field(default=0.0, ge=0, description="Median provider latency")
+    p95_ms: float = Field(default=0.0, ge=0, description="95th percentile provider latency")
+    p99_ms: float = Field(default=0.0, ge=0, description="99th percentile provider latency")
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from memory or disk."""
+        total = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / total if total > 0 else 0.0
+
+
+class QueryEmbeddingCache:
+    """
+    Thread-safe LRU/TTL cache of query vectors keyed by model and query text.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: Optional[float] = None,
+        disk_path: Optional[str] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Vectors kept in memory before evicting the least recently used
+            ttl_seconds: Drop vectors older than this (None keeps them until evicted)
+            disk_path: SQLite file persisting vectors across restarts
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[List[float], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._disk: Optional[sqlite3.Connection] = None
+        if disk_path:
+            self._open_disk(Path(disk_path))
+
+    def _open_disk(self, path: Path) -> None:
+        """Open (or create) the SQLite vector store."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._disk = sqlite3.connect(str(path), check_same_thread=False)
+        self._disk.execute("""
+            CREATE TABLE IF NOT EXISTS query_embeddings (
+                cache_key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._disk.commit()
+
+    @staticmethod
+    def cache_key(query: str, model: str) -> str:
+        """
+        Cache key for a query embedded with a model.
+
+        Args:
+            query: Query text (normalized here)
+            model: Model identifier
+
+        Returns:
+            Hex digest of model and normalized query
+        """
+        return hashlib.sha256(f"{model}\x00{normalize_query(query)}".encode("utf-8")).hexdigest()
+
+    def _expired(self, created_at: float) -> bool:
+        """Check an entry against the TTL."""
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    def get(self, query: str, model: str) -> Optional[List[float]]:
+        """
+        Look up a cached vector.
+
+        Args:
+            query: Query text
+            model: Model identifier
+
+        Returns:
+            Cached vector, or None on a miss
+        """
+        key = self.cache_key(query, model)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._expired(entry[1]):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+
+            if self._disk is not None:
+                row = self._disk.execute(
+                    "SELECT vector, created_at FROM query_embeddings WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row is not None and not self._expired(row[1]):
+                    vector = array("d", row[0]).tolist()
+                    self._store(key, vector, row[1])
+                    self.disk_hits += 1
+                    return vector
+
+            self.misses += 1
+            return None
+
+    def put(self, query: str, model: str, vector: List[float]) -> None:
+        """
+        Cache a vector.
+
+        Args:
+            query: Query text
+            model: Model identifier
+            vector: Embedding vector
+        """
+        key = self.cache_key(query, model)
+        created_at = time.time()
+        with self._lock:
+            self._store(key, vector, created_at)
+            if self._disk is not None:
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO query_embeddings VALUES (?, ?, ?)",
+                    (key, array("d", vector).tobytes(), created_at)
+                )
+                self._disk.commit()
+
+    def _store(self, key: str, vector: List[float], created_at: float) -> None:
+        """Insert into the in-memory LRU (caller holds the lock)."""
+        self._entries[key] = (vector, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Vectors held in memory."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached vectors, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            if self._disk is not None:
+                self._disk.execute("DELETE FROM query_embeddings")
+                self._disk.commit()
+
+    def close(self) -> None:
+        """Close the disk store."""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
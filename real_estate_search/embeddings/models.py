@@ -58,6 +58,29 @@ class EmbeddingConfig(BaseModel):
         description="Maximum retries for failed requests"
     )
     
+    # Query vector cache
+    cache_enabled: bool = Field(
+        default=True,
+        description="Cache query vectors by model and normalized query text"
+    )
+    
+    cache_max_entries: int = Field(
+        default=10_000,
+        ge=1,
+        description="Query vectors kept in memory (LRU eviction)"
+    )
+    
+    cache_ttl_seconds: Optional[float] = Field(
+        default=86_400.0,
+        gt=0,
+        description="Seconds a cached query vector stays valid (None = until evicted)"
+    )
+    
+    cache_disk_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file persisting query vectors across restarts"
+    )
+    
     
     def get_model_identifier(self) -> str:
         """Get a unique identifier for the model configuration."""
@@ -3,13 +3,20 @@ Query embedding service for real estate search.
 
 Generates embeddings for natural language queries using Voyage AI,
 matching the embeddings generated by data_pipeline for properties.
+
+The service is meant to live for the whole process: get_shared_embedding_service
+returns one instance per model, whose Voyage client (and its HTTP connections)
+is created once, and repeated queries are answered from QueryEmbeddingCache.
 """
 
 import logging
-from typing import List, Optional
-from pydantic import BaseModel, Field
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 import time
 
+from .cache import QueryEmbeddingCache, QueryEmbeddingStats
 from .models import EmbeddingConfig
 from .exceptions import (
     EmbeddingServiceError,
@@ -55,6 +62,9 @@ class QueryEmbeddingService(BaseModel):
     
     _embed_model: Optional[VoyageEmbedding] = None
     _initialized: bool = False
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _cache: Optional[QueryEmbeddingCache] = PrivateAttr(default=None)
+    _latencies_ms: Deque[float] = PrivateAttr(default_factory=lambda: deque(maxlen=1000))
     
     model_config = {
         "arbitrary_types_allowed": True
@@ -66,7 +76,8 @@ class QueryEmbeddingService(BaseModel):
         
         Creates the VoyageEmbedding instance for generating embeddings.
         This is done separately from __init__ to allow for lazy initialization
-        and better error handling.
+        and better error handling. Safe to call from several threads; only
+        the first call creates the client.
         
         Raises:
             ConfigurationError: If configuration is invalid
@@ -76,6 +87,13 @@ class QueryEmbeddingService(BaseModel):
             logger.debug("Embedding service already initialized")
             return
         
+        with self._lock:
+            if self._initialized:
+                return
+            self._initialize_model()
+    
+    def _initialize_model(self) -> None:
+        """Create the embedding model and query cache (caller holds the lock)."""
         # Validate API key is present
         if not self.config.api_key:
             raise ConfigurationError(
@@ -92,6 +110,13 @@ class QueryEmbeddingService(BaseModel):
                 model_name=self.config.model_name
             )
             
+            if self.config.cache_enabled and self._cache is None:
+                self._cache = QueryEmbeddingCache(
+                    max_entries=self.config.cache_max_entries,
+                    ttl_seconds=self.config.cache_ttl_seconds,
+                    disk_path=self.config.cache_disk_path
+                )
+            
             self._initialized = True
             logger.info(f"Successfully initialized embedding service with {self.config.model_name}")
             
@@ -129,6 +154,12 @@ class QueryEmbeddingService(BaseModel):
         # Clean the query
         query = query.strip()
         
+        if self._cache is not None:
+            cached = self._cache.get(query, self.config.model_name)
+            if cached is not None:
+                logger.debug(f"Query embedding cache hit for: '{query[:50]}'")
+                return cached
+        
         # Track timing
         start_time = time.time()
         
@@ -153,8 +184,12 @@ class QueryEmbeddingService(BaseModel):
                 )
             
             elapsed = (time.time() - start_time) * 1000  # Convert to milliseconds
+            self._latencies_ms.append(elapsed)
             logger.info(f"Generated embedding in {elapsed:.1f}ms for query: '{query[:50]}...'")
             
+            if self._cache is not None:
+                self._cache.put(query, self.config.model_name, embedding)
+            
             return embedding
             
         except Exception as e:
@@ -170,7 +205,8 @@ class QueryEmbeddingService(BaseModel):
         Generate embeddings for multiple queries.
         
         Batch processing for multiple queries. Useful for pre-computing embeddings
-        or processing multiple search queries efficiently.
+        or processing multiple search queries efficiently. Cached queries are
+        served from the cache; the rest are embedded in one provider call.
         
         Args:
             queries: List of natural language query texts
@@ -197,6 +233,17 @@ class QueryEmbeddingService(BaseModel):
                 "No valid queries provided"
             )
         
+        results: List[Optional[List[float]]] = [None] * len(cleaned_queries)
+        if self._cache is not None:
+            results = [self._cache.get(q, self.config.model_name) for q in cleaned_queries]
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        if not missing:
+            return results
+        
+        # Only the uncached queries go to the provider
+        all_queries = cleaned_queries
+        cleaned_queries = [all_queries[i] for i in missing]
+        
         start_time = time.time()
         
         try:
@@ -235,10 +282,16 @@ class QueryEmbeddingService(BaseModel):
             
             elapsed = (time.time() - start_time) * 1000
             avg_time = elapsed / len(cleaned_queries)
+            self._latencies_ms.append(elapsed)
             logger.info(f"Generated {len(embeddings)} embeddings in {elapsed:.1f}ms "
                        f"(avg {avg_time:.1f}ms per query)")
             
-            return embeddings
+            for i, embedding in zip(missing, embeddings):
+                results[i] = embedding
+                if self._cache is not None:
+                    self._cache.put(all_queries[i], self.config.model_name, embedding)
+            
+            return results
             
         except Exception as e:
             if isinstance(e, EmbeddingGenerationError):
@@ -252,17 +305,46 @@ class QueryEmbeddingService(BaseModel):
                 original_error=e
             )
     
+    def stats(self) -> QueryEmbeddingStats:
+        """
+        Cache hit counters and provider latency percentiles.
+        
+        Latencies cover the last 1000 provider calls.
+        
+        Returns:
+            Snapshot of the service statistics
+        """
+        latencies = sorted(self._latencies_ms)
+        
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+        
+        cache = self._cache
+        return QueryEmbeddingStats(
+            hits=cache.hits if cache else 0,
+            disk_hits=cache.disk_hits if cache else 0,
+            misses=cache.misses if cache else len(latencies),
+            entries=len(cache) if cache else 0,
+            p50_ms=percentile(0.50),
+            p95_ms=percentile(0.95),
+            p99_ms=percentile(0.99)
+        )
+    
     def close(self) -> None:
         """
         Clean up resources.
         
         Releases any resources held by the embedding service.
-        Safe to call multiple times.
+        Safe to call multiple times. Cached vectors stay available
+        when the service is initialized again.
         """
-        if self._embed_model:
-            logger.debug("Closing embedding service")
-            self._embed_model = None
-            self._initialized = False
+        with self._lock:
+            if self._embed_model:
+                logger.debug("Closing embedding service")
+                self._embed_model = None
+                self._initialized = False
     
     def __enter__(self):
         """Context manager entry."""
@@ -271,4 +353,44 @@ class QueryEmbeddingService(BaseModel):
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.close()
\ No newline at end of file
+        self.close()
+
+
+# Process-wide services by (service class, provider, model, dimension)
+_shared_services: Dict[Tuple[Any, ...], QueryEmbeddingService] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_embedding_service(
+    config: EmbeddingConfig,
+    service_class: type = QueryEmbeddingService
+) -> QueryEmbeddingService:
+    """
+    Get the long-lived embedding service for a configuration.
+    
+    Every caller with the same model shares one client and one query cache.
+    The service is created on first use and initialized lazily.
+    
+    Args:
+        config: Embedding configuration
+        service_class: Service class to instantiate on first use
+        
+    Returns:
+        Shared query embedding service
+    """
+    key = (service_class, config.provider, config.model_name, config.dimension)
+    with _shared_lock:
+        service = _shared_services.get(key)
+        if service is None:
+            service = service_class(config=config)
+            _shared_services[key] = service
+        return service
+
+
+def close_shared_embedding_services() -> None:
+    """Close and forget all shared embedding services (process shutdown, tests)."""
+    with _shared_lock:
+        services = list(_shared_services.values())
+        _shared_services.clear()
+    for service in services:
+        service.close()
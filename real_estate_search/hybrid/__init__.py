@@ -13,12 +13,14 @@ Components:
 - search_executor: Query execution with error handling
 - result_processor: Response processing and transformation
 - location: Location understanding and filtering
+- gazetteer: Known-place matching ahead of the DSPy location model
 - models: Pydantic data models
 """
 
 from .search_engine import HybridSearchEngine
-from .models import HybridSearchParams, HybridSearchResult, SearchResult, LocationIntent
-from .location import LocationUnderstandingModule, LocationFilterBuilder
+from .models import HybridSearchParams, HybridSearchRequest, HybridSearchResult, SearchResult, LocationIntent
+from .location import LocationUnderstandingModule, LocationFilterBuilder, LocationExtractionStats
+from .gazetteer import LocationGazetteer, get_default_gazetteer
 from .query_builder import RRFQueryBuilder
 from .search_executor import SearchExecutor
 from .result_processor import ResultProcessor
@@ -29,6 +31,7 @@ __all__ = [
     
     # Models
     'HybridSearchParams',
+    'HybridSearchRequest',
     'HybridSearchResult',
     'SearchResult',
     'LocationIntent',
@@ -36,6 +39,9 @@ __all__ = [
     # Components
     'LocationUnderstandingModule',
     'LocationFilterBuilder',
+    'LocationExtractionStats',
+    'LocationGazetteer',
+    'get_default_gazetteer',
     'RRFQueryBuilder',
     'SearchExecutor',
     'ResultProcessor'
@@ -0,0 +1,388 @@
+"""
+Gazetteer-based location extraction for hybrid search.
+
+First tier of location understanding: cities, states, neighborhoods and ZIP
+codes from real_estate_data/locations.json and the neighborhoods files are
+compiled into a token trie. Matching a query is a single left-to-right
+longest-match scan, so most queries get a LocationIntent in microseconds
+without a DSPy LLM round trip.
+
+The gazetteer only answers when it is sure. Queries with a doubtful match
+(a one-word place name that is also an ordinary word), conflicting places,
+or an unknown place after "in"/"near" are reported as not confident and go
+to the LLM.
+"""
+
+import json
+import logging
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from .models import LocationIntent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parents[2] / "real_estate_data"
+
+# Full state name -> abbreviation used in the property index
+STATE_ABBREVIATIONS: Dict[str, str] = {
+    "california": "CA",
+    "new york": "NY",
+    "texas": "TX",
+    "florida": "FL",
+    "washington": "WA",
+    "oregon": "OR",
+    "nevada": "NV",
+    "arizona": "AZ",
+    "utah": "UT",
+    "colorado": "CO",
+    "idaho": "ID",
+    "wyoming": "WY",
+    "montana": "MT"
+}
+
+# Words that introduce a place; dropped from the cleaned query with it
+LOCATION_PREPOSITIONS = frozenset({"in", "near", "around", "at", "within", "by"})
+
+# Words after a preposition that do not name a place ("in a quiet area",
+# "at least 3 bedrooms"); any other unknown word there may be one
+LOCATION_STOPWORDS = frozenset({
+    "a", "an", "the", "my", "our", "your", "this", "that", "these", "those",
+    "some", "any", "one", "least", "most", "walking", "driving", "town",
+    "city", "downtown", "area", "neighborhood", "good", "great", "excellent",
+    "move", "ready", "need", "mind"
+})
+
+# Articles dropped from the cleaned query when they lead into a place name
+LOCATION_ARTICLES = frozenset({"a", "an", "the"})
+
+# Matches of these kinds outrank others for the same words
+KIND_PRIORITY = ("neighborhood", "city", "state")
+
+TOKEN_PATTERN = re.compile(r"\w+")
+ZIP_PATTERN = re.compile(r"^\d{5}$")
+
+GAZETTEER_CONFIDENCE = 0.95
+
+
+class GazetteerEntry(BaseModel):
+    """A place name the gazetteer can match."""
+    kind: str = Field(..., description="neighborhood, city or state")
+    name: str = Field(..., description="Canonical name written to the LocationIntent")
+
+
+class GazetteerMatch(BaseModel):
+    """Place name found in a query."""
+    entry: GazetteerEntry = Field(..., description="Matched place")
+    start: int = Field(..., description="Character offset of the match")
+    end: int = Field(..., description="Character offset after the match")
+    certain: bool = Field(..., description="False for one-word names that may be ordinary words")
+
+
+class GazetteerResult(BaseModel):
+    """Outcome of gazetteer extraction."""
+    intent: LocationIntent = Field(..., description="Extracted location intent")
+    confident: bool = Field(..., description="Whether the LLM can be skipped")
+    matches: List[GazetteerMatch] = Field(default_factory=list, description="Place names found")
+
+
+def _tokens(text: str) -> List[str]:
+    """Lower-cased word tokens of a name or query."""
+    return [token.lower() for token in TOKEN_PATTERN.findall(text)]
+
+
+class LocationGazetteer:
+    """
+    Token trie over known place names.
+
+    Names are split into lower-cased word tokens, so punctuation and case
+    in queries ("St. George", "st george") do not matter.
+    """
+
+    _END = "$entries"
+
+    def __init__(self):
+        """Initialize an empty gazetteer."""
+        self._trie: Dict[str, dict] = {}
+        self._zip_codes: Dict[str, GazetteerEntry] = {}
+        self._state_abbreviations: Dict[str, str] = {}
+        self.size = 0
+
+    def add(self, kind: str, name: str) -> None:
+        """
+        Add a place name.
+
+        Args:
+            kind: neighborhood, city or state
+            name: Canonical place name
+        """
+        tokens = _tokens(name)
+        if not tokens:
+            return
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        entries = node.setdefault(self._END, [])
+        if not any(e.kind == kind for e in entries):
+            entries.append(GazetteerEntry(kind=kind, name=name))
+            self.size += 1
+
+    def add_zip_code(self, zip_code: str) -> None:
+        """Add a known ZIP code."""
+        if ZIP_PATTERN.match(zip_code):
+            self._zip_codes[zip_code] = GazetteerEntry(kind="zip_code", name=zip_code)
+
+    def add_state(self, state: str) -> None:
+        """Add a state given by full name or abbreviation."""
+        abbreviations = {abbr: name for name, abbr in STATE_ABBREVIATIONS.items()}
+        full_name = abbreviations.get(state.upper(), state).title()
+        self.add("state", full_name)
+        abbreviation = STATE_ABBREVIATIONS.get(full_name.lower())
+        if abbreviation:
+            self._state_abbreviations[abbreviation] = full_name
+
+    @classmethod
+    def from_files(cls, locations_file: Path, neighborhood_files: List[Path]) -> "LocationGazetteer":
+        """
+        Build the gazetteer from the real estate data files.
+
+        Args:
+            locations_file: locations.json with city/state/neighborhood/zip_code records
+            neighborhood_files: neighborhoods_*.json files
+
+        Returns:
+            Compiled gazetteer
+        """
+        gazetteer = cls()
+
+        if locations_file.exists():
+            with open(locations_file) as f:
+                for record in json.load(f):
+                    if record.get("state"):
+                        gazetteer.add_state(record["state"])
+                    if record.get("city"):
+                        gazetteer.add("city", record["city"])
+                    if record.get("neighborhood"):
+                        gazetteer.add("neighborhood", record["neighborhood"])
+                    if record.get("zip_code"):
+                        gazetteer.add_zip_code(str(record["zip_code"]))
+        else:
+            logger.warning(f"Locations file not found: {locations_file}")
+
+        for path in neighborhood_files:
+            with open(path) as f:
+                for record in json.load(f):
+                    if record.get("name"):
+                        gazetteer.add("neighborhood", record["name"])
+                    if record.get("city"):
+                        gazetteer.add("city", record["city"])
+                    if record.get("state"):
+                        gazetteer.add_state(record["state"])
+
+        logger.info(f"Location gazetteer compiled with {gazetteer.size} names and {len(gazetteer._zip_codes)} ZIP codes")
+        return gazetteer
+
+    def find(self, query: str) -> Tuple[List[GazetteerMatch], bool]:
+        """
+        Find place names in a query, longest match first.
+
+        Args:
+            query: Natural language search query
+
+        Returns:
+            Tuple of (matches, whether an unknown place looks mentioned)
+        """
+        words = list(TOKEN_PATTERN.finditer(query))
+        tokens = [w.group().lower() for w in words]
+        matches: List[GazetteerMatch] = []
+        unknown_place = False
+
+        i = 0
+        while i < len(words):
+            word = words[i].group()
+            after_preposition = i > 0 and tokens[i - 1] in LOCATION_PREPOSITIONS
+
+            if ZIP_PATTERN.match(word):
+                if word in self._zip_codes:
+                    matches.append(GazetteerMatch(
+                        entry=self._zip_codes[word], start=words[i].start(), end=words[i].end(), certain=True
+                    ))
+                else:
+                    unknown_place = True
+                i += 1
+                continue
+
+            if word.upper() in self._state_abbreviations:
+                # Upper-case anywhere; lower-case only right after a city,
+                # since "or", "co" and "id" are words too
+                follows_city = bool(matches) and matches[-1].entry.kind == "city" and not query[
+                    matches[-1].end:words[i].start()
+                ].strip(" ,")
+                ends_clause = i == len(words) - 1 or query[words[i].end():].lstrip().startswith(",")
+                if word.isupper() or (follows_city and ends_clause):
+                    matches.append(GazetteerMatch(
+                        entry=GazetteerEntry(kind="state", name=self._state_abbreviations[word.upper()]),
+                        start=words[i].start(), end=words[i].end(), certain=True
+                    ))
+                    i += 1
+                    continue
+                if follows_city:
+                    # "Oakland ca with a pool" or "Portland or Seattle"
+                    unknown_place = True
+                    i += 1
+                    continue
+
+            # Longest name starting at this token
+            node = self._trie
+            longest: Optional[Tuple[int, List[GazetteerEntry]]] = None
+            j = i
+            while j < len(tokens) and tokens[j] in node:
+                node = node[tokens[j]]
+                j += 1
+                if self._END in node:
+                    longest = (j, node[self._END])
+
+            if longest is None:
+                # Case says nothing here: "cabin in aspen" names a place too
+                if after_preposition and tokens[i] not in LOCATION_STOPWORDS and not word.isdigit():
+                    unknown_place = True
+                i += 1
+                continue
+
+            end, entries = longest
+            entry = min(entries, key=lambda e: KIND_PRIORITY.index(e.kind))
+            # One-word names ("Price", "Summit", "Garden") need a capital
+            # letter past the first word, or a preceding "in"/"near"
+            certain = (
+                end - i > 1
+                or entry.kind == "state"
+                or after_preposition
+                or (i > 0 and word[:1].isupper())
+            )
+            matches.append(GazetteerMatch(
+                entry=entry, start=words[i].start(), end=words[end - 1].end(), certain=certain
+            ))
+            i = end
+
+        return matches, unknown_place
+
+    def extract(self, query: str) -> GazetteerResult:
+        """
+        Extract location intent and a cleaned query.
+
+        Args:
+            query: Natural language search query
+
+        Returns:
+            GazetteerResult; confident is False when the LLM should decide
+        """
+        matches, unknown_place = self.find(query)
+
+        values: Dict[str, set] = {}
+        for match in matches:
+            if match.certain:
+                values.setdefault(match.entry.kind, set()).add(match.entry.name)
+
+        doubtful = any(not m.certain for m in matches)
+        conflicting = any(len(names) > 1 for names in values.values())
+        confident = not (doubtful or conflicting or unknown_place)
+
+        def value(kind: str) -> Optional[str]:
+            names = values.get(kind)
+            return next(iter(names)) if names and len(names) == 1 else None
+
+        has_location = bool(values)
+        intent = LocationIntent(
+            city=value("city"),
+            state=value("state"),
+            neighborhood=value("neighborhood"),
+            zip_code=value("zip_code"),
+            has_location=has_location,
+            cleaned_query=self._clean(query, [m for m in matches if m.certain]) if has_location else query,
+            confidence=GAZETTEER_CONFIDENCE if has_location else 0.0
+        )
+        return GazetteerResult(intent=intent, confident=confident, matches=matches)
+
+    @staticmethod
+    def _clean(query: str, matches: List[GazetteerMatch]) -> str:
+        """
+        Remove matched place names and the words leading into them.
+
+        A preposition before a name goes with it, together with any
+        articles and filler words between them ("in the", "near downtown");
+        without a preposition only a leading article is dropped.
+
+        Args:
+            query: Original query
+            matches: Matches to remove
+
+        Returns:
+            Cleaned query, or the original if nothing would be left
+        """
+        spans = sorted((m.start, m.end) for m in matches)
+        parts = []
+        position = 0
+        for start, end in spans:
+            parts.append(query[position:start])
+            position = end
+        parts.append(query[position:])
+
+        # Drop words and punctuation left dangling by the removed names
+        cleaned_parts = []
+        for index, part in enumerate(parts):
+            if index < len(parts) - 1:
+                part = LocationGazetteer._strip_lead_in(part)
+            cleaned_parts.append(part)
+        cleaned = " ".join(" ".join(cleaned_parts).split()).strip(" ,")
+        # "homes , " -> "homes"
+        cleaned = re.sub(r"\s+,", ",", cleaned).strip(" ,")
+        return cleaned or query
+
+    @staticmethod
+    def _strip_lead_in(text: str) -> str:
+        """
+        Remove the words leading into a place name from the end of text.
+
+        Args:
+            text: Query text just before a removed place name
+
+        Returns:
+            Text without its trailing preposition, articles and filler words
+        """
+        words = list(TOKEN_PATTERN.finditer(text))
+        run = len(words)
+        while run > 0 and words[run - 1].group().lower() in LOCATION_PREPOSITIONS | LOCATION_STOPWORDS:
+            run -= 1
+        lead_in = [w.group().lower() for w in words[run:]]
+
+        prepositions = [k for k, token in enumerate(lead_in) if token in LOCATION_PREPOSITIONS]
+        if prepositions:
+            cut = run + prepositions[-1]
+        else:
+            cut = len(words)
+            while cut > run and words[cut - 1].group().lower() in LOCATION_ARTICLES:
+                cut -= 1
+        if cut == len(words):
+            return text.rstrip(" ,")
+        return text[:words[cut].start()].rstrip(" ,")
+
+
+@lru_cache(maxsize=4)
+def get_default_gazetteer(data_dir: Path = DEFAULT_DATA_DIR) -> LocationGazetteer:
+    """
+    Gazetteer compiled once per process from a real estate data directory.
+
+    Args:
+        data_dir: Directory with locations.json and neighborhoods_*.json
+
+    Returns:
+        Shared gazetteer
+    """
+    return LocationGazetteer.from_files(
+        data_dir / "locations.json",
+        sorted(data_dir.glob("neighborhoods_*.json"))
+    )
@@ -1,16 +1,23 @@
 """
 Location understanding and filtering for hybrid search.
 
-Uses DSPy for natural language location extraction and provides
-Elasticsearch filter building capabilities.
+Extraction is tiered: a gazetteer of known places answers most queries
+without a model call, recent LLM answers are cached by query text, and the
+DSPy LLM call is only made for queries the gazetteer is unsure about. Also
+provides Elasticsearch filter building capabilities.
 """
 
 import dspy
 import logging
-from typing import Dict, Any, List
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 
 from real_estate_search.config import AppConfig
+from real_estate_search.embeddings.cache import normalize_query
+from .gazetteer import LocationGazetteer, STATE_ABBREVIATIONS, get_default_gazetteer
 from .models import LocationIntent
 
 logger = logging.getLogger(__name__)
@@ -110,27 +117,134 @@ class LocationExtractionSignature(dspy.Signature):
     )
 
 
+def _percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of latency samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class LocationTierStats(BaseModel):
+    """Hit count and latency of one location extraction tier."""
+    hits: int = Field(default=0, ge=0, description="Queries answered by this tier")
+    p50_ms: float = Field(default=0.0, ge=0, description="Median latency")
+    p99_ms: float = Field(default=0.0, ge=0, description="99th percentile latency")
+
+
+class LocationExtractionStats(BaseModel):
+    """Per-tier counters of a LocationUnderstandingModule."""
+    gazetteer: LocationTierStats = Field(default_factory=LocationTierStats, description="Gazetteer tier")
+    llm_cache: LocationTierStats = Field(default_factory=LocationTierStats, description="Cached LLM answers")
+    llm: LocationTierStats = Field(default_factory=LocationTierStats, description="DSPy LLM calls")
+
+    @property
+    def total(self) -> int:
+        """Queries answered by all tiers."""
+        return self.gazetteer.hits + self.llm_cache.hits + self.llm.hits
+
+    @property
+    def llm_rate(self) -> float:
+        """Fraction of queries that needed an LLM call."""
+        return self.llm.hits / self.total if self.total > 0 else 0.0
+
+
 class LocationUnderstandingModule(dspy.Module):
     """
     DSPy module for extracting location information from natural language queries.
     
-    Uses ChainOfThought reasoning to identify and extract location components
-    from real estate search queries.
+    Queries go through three tiers, cheapest first:
+    1. Gazetteer: known cities, states, neighborhoods and ZIP codes
+    2. LLM cache: earlier LLM answers for the same normalized query
+    3. DSPy Predict: only for queries the gazetteer is unsure about
     """
     
-    def __init__(self):
-        """Initialize the location understanding module."""
+    TIERS = ("gazetteer", "llm_cache", "llm")
+    
+    def __init__(self, gazetteer: Optional[LocationGazetteer] = None, llm_cache_size: int = 1024):
+        """
+        Initialize the location understanding module.
+        
+        Args:
+            gazetteer: Known places (defaults to the real_estate_data gazetteer)
+            llm_cache_size: LLM answers kept, least recently used evicted first
+        """
         super().__init__()
         ensure_dspy_initialized()
         
         # Try Predict instead of ChainOfThought for more direct extraction
         self.extract_location = dspy.Predict(LocationExtractionSignature)
-        logger.info("Initialized LocationUnderstandingModule with Predict")
+        self.gazetteer = gazetteer if gazetteer is not None else get_default_gazetteer()
+        self.llm_cache_size = llm_cache_size
+        self._llm_cache: "OrderedDict[str, LocationIntent]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._latencies_ms: Dict[str, Deque[float]] = {tier: deque(maxlen=1000) for tier in self.TIERS}
+        self._hits: Dict[str, int] = {tier: 0 for tier in self.TIERS}
+        logger.info(f"Initialized LocationUnderstandingModule with gazetteer ({self.gazetteer.size} names) and Predict")
     
     def forward(self, query: str) -> LocationIntent:
         """
         Extract location information from a natural language query.
         
+        Args:
+            query: Natural language search query
+            
+        Returns:
+            LocationIntent with extracted location information
+        """
+        start = time.perf_counter()
+        result = self.gazetteer.extract(query)
+        if result.confident:
+            self._record("gazetteer", start)
+            return result.intent
+        
+        key = normalize_query(query)
+        with self._lock:
+            cached = self._llm_cache.get(key)
+            if cached is not None:
+                self._llm_cache.move_to_end(key)
+        if cached is not None:
+            self._record("llm_cache", start)
+            return cached.model_copy()
+        
+        logger.debug(f"Gazetteer not confident for '{query}', asking the LLM")
+        location_intent = self._llm_extraction(query)
+        with self._lock:
+            self._llm_cache[key] = location_intent
+            while len(self._llm_cache) > self.llm_cache_size:
+                self._llm_cache.popitem(last=False)
+        self._record("llm", start)
+        return location_intent.model_copy()
+    
+    def _record(self, tier: str, start: float) -> None:
+        """Count a query against the tier that answered it."""
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._hits[tier] += 1
+            self._latencies_ms[tier].append(elapsed_ms)
+    
+    def stats(self) -> LocationExtractionStats:
+        """
+        Snapshot tier hit counts and latency percentiles.
+        
+        Returns:
+            LocationExtractionStats for this module
+        """
+        with self._lock:
+            tiers = {
+                tier: LocationTierStats(
+                    hits=self._hits[tier],
+                    p50_ms=_percentile(list(self._latencies_ms[tier]), 0.50),
+                    p99_ms=_percentile(list(self._latencies_ms[tier]), 0.99)
+                )
+                for tier in self.TIERS
+            }
+        return LocationExtractionStats(**tiers)
+    
+    def _llm_extraction(self, query: str) -> LocationIntent:
+        """
+        Extract location information with the DSPy LLM call.
+        
         Args:
             query: Natural language search query
             
@@ -186,25 +300,15 @@ class LocationUnderstandingModule(dspy.Module):
     
     def _rule_based_extraction(self, query: str) -> LocationIntent:
         """
-        Minimal rule-based backup - only as last resort, no hardcoded locations.
+        Rule-based extraction from the gazetteer alone, without the LLM.
         
         Args:
             query: Natural language search query
             
         Returns:
-            LocationIntent with minimal extraction
+            LocationIntent with places the gazetteer is certain about
         """
-        # Very minimal rule-based fallback - just return no location found
-        # Let DSPy handle all location extraction
-        return LocationIntent(
-            city=None,
-            state=None,
-            neighborhood=None,
-            zip_code=None,
-            has_location=False,
-            cleaned_query=query,
-            confidence=0.0
-        )
+        return self.gazetteer.extract(query).intent
     
     def __call__(self, query: str) -> LocationIntent:
         """
@@ -278,27 +382,11 @@ class LocationFilterBuilder:
         
         # State filter using address.state field
         if location_intent.state:
-            # Convert full state names to abbreviations for matching
-            state_abbreviations = {
-                "california": "CA",
-                "new york": "NY",
-                "texas": "TX",
-                "florida": "FL",
-                "washington": "WA",
-                "oregon": "OR",
-                "nevada": "NV",
-                "arizona": "AZ",
-                "utah": "UT",
-                "colorado": "CO",
-                "idaho": "ID",
-                "wyoming": "WY",
-                "montana": "MT"
-            }
-            
-            # Use abbreviation if available, otherwise use as-is
+            # Convert full state names to abbreviations for matching;
+            # use abbreviation if available, otherwise use as-is
             state_value = location_intent.state
-            if state_value.lower() in state_abbreviations:
-                state_value = state_abbreviations[state_value.lower()]
+            if state_value.lower() in STATE_ABBREVIATIONS:
+                state_value = STATE_ABBREVIATIONS[state_value.lower()]
                 logger.info(f"Converted state '{location_intent.state}' to abbreviation '{state_value}'")
             
             filters.append({
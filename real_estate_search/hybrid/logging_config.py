@@ -7,10 +7,14 @@ performance tracking, and debug capabilities.
 
 import logging
 import sys
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from pydantic import BaseModel, Field
 from enum import Enum
 
+if TYPE_CHECKING:
+    from real_estate_search.embeddings import QueryEmbeddingStats
+    from .location import LocationExtractionStats
+
 
 class LogLevel(str, Enum):
     """Supported log levels."""
@@ -217,6 +221,37 @@ class PerformanceLogger:
                 f"Time: {total_time_ms}ms"
             )
     
+    def log_embedding_performance(self, stats: "QueryEmbeddingStats") -> None:
+        """
+        Log query embedding cache and latency metrics.
+        
+        Args:
+            stats: Snapshot from QueryEmbeddingService.stats()
+        """
+        self.logger.info(
+            f"Embedding Performance - "
+            f"Cache hit rate: {stats.hit_rate:.0%} "
+            f"({stats.hits} memory, {stats.disk_hits} disk, {stats.misses} misses), "
+            f"Provider p50: {stats.p50_ms:.0f}ms, "
+            f"p95: {stats.p95_ms:.0f}ms, "
+            f"p99: {stats.p99_ms:.0f}ms"
+        )
+    
+    def log_location_performance(self, stats: "LocationExtractionStats") -> None:
+        """
+        Log location extraction tier hit counts and latency.
+        
+        Args:
+            stats: Snapshot from LocationUnderstandingModule.stats()
+        """
+        self.logger.info(
+            f"Location Performance - "
+            f"Gazetteer: {stats.gazetteer.hits} (p50 {stats.gazetteer.p50_ms:.2f}ms, p99 {stats.gazetteer.p99_ms:.2f}ms), "
+            f"LLM cache: {stats.llm_cache.hits} (p50 {stats.llm_cache.p50_ms:.2f}ms), "
+            f"LLM: {stats.llm.hits} (p50 {stats.llm.p50_ms:.0f}ms, p99 {stats.llm.p99_ms:.0f}ms), "
+            f"LLM rate: {stats.llm_rate:.0%}"
+        )
+    
     def log_cache_hit(self, cache_type: str, key: str) -> None:
         """
         Log cache hit event.
@@ -28,6 +28,14 @@ class HybridSearchParams(BaseModel):
     location_intent: Optional[LocationIntent] = Field(None, description="Extracted location information")
 
 
+class HybridSearchRequest(BaseModel):
+    """Per-request state of a location-aware search against a shared engine."""
+    query: str = Field(..., description="Natural language search query")
+    size: int = Field(10, ge=1, le=100, description="Number of results to return")
+    include_location_extraction: bool = Field(False, description="Include location extraction details in the response")
+    request_id: str = Field("unknown", description="Request identifier for logging")
+
+
 class SearchResult(BaseModel):
     """Individual search result with hybrid scoring."""
     listing_id: str = Field(..., description="Property listing ID")
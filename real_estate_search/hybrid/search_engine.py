@@ -10,7 +10,7 @@ from typing import Optional
 from elasticsearch import Elasticsearch
 
 from real_estate_search.config import AppConfig
-from real_estate_search.embeddings import QueryEmbeddingService
+from real_estate_search.embeddings import QueryEmbeddingService, get_shared_embedding_service
 from .models import HybridSearchParams, HybridSearchResult
 from .location import LocationUnderstandingModule
 from .query_builder import RRFQueryBuilder
@@ -30,6 +30,9 @@ class HybridSearchEngine:
     - Search execution (SearchExecutor)
     - Result processing (ResultProcessor)
     - Location understanding (LocationUnderstandingModule)
+    
+    An engine holds no per-request state, so one instance can be built at
+    startup and shared by concurrent requests.
     """
     
     def __init__(self, es_client: Elasticsearch, config: Optional[AppConfig] = None):
@@ -42,8 +45,9 @@ class HybridSearchEngine:
         """
         self.config = config or AppConfig.load()
         
-        # Initialize modular components
-        self.embedding_service = QueryEmbeddingService(config=self.config.embedding)
+        # Initialize modular components; the embedding service is shared
+        # process-wide so its client and query cache outlive this engine
+        self.embedding_service = get_shared_embedding_service(self.config.embedding, QueryEmbeddingService)
         self.location_module = LocationUnderstandingModule()
         self.query_builder = RRFQueryBuilder()
         self.search_executor = SearchExecutor(es_client=es_client)
@@ -144,6 +148,9 @@ class HybridSearchEngine:
         """
         Generate embedding vector for the search query.
         
+        The shared service is initialized on first use and kept open;
+        repeated queries are answered from its cache.
+        
         Args:
             query_for_search: Query text to embed
             original_query: Original query for logging
@@ -152,17 +159,15 @@ class HybridSearchEngine:
             Query embedding vector
         """
         self.embedding_service.initialize()
-        try:
-            query_vector = self.embedding_service.embed_query(query_for_search)
-            logger.info(
-                f"Generated embedding vector of dimension {len(query_vector)} "
-                f"for query: '{query_for_search}'"
-            )
-            if query_for_search != original_query:
-                logger.debug(f"Original query was: '{original_query}'")
-            return query_vector
-        finally:
-            self.embedding_service.close()
+        query_vector = self.embedding_service.embed_query(query_for_search)
+        logger.info(
+            f"Generated embedding vector of dimension {len(query_vector)} "
+            f"for query: '{query_for_search}'"
+        )
+        if query_for_search != original_query:
+            logger.debug(f"Original query was: '{original_query}'")
+        self.performance_logger.log_embedding_performance(self.embedding_service.stats())
+        return query_vector
     
     def search_with_location(self, query: str, size: int = 10) -> HybridSearchResult:
         """
@@ -180,9 +185,10 @@ class HybridSearchEngine:
         """
         logger.info(f"Starting location-aware search for: '{query}'")
         
-        # Extract location intent using DSPy module
+        # Extract location intent (gazetteer first, DSPy only when unsure)
         location_intent = self.location_module(query)
         self._log_location_extraction(location_intent)
+        self.performance_logger.log_location_performance(self.location_module.stats())
         
         # Build parameters and execute search
         params = HybridSearchParams(
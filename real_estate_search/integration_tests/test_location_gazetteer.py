@@ -0,0 +1,138 @@
+"""
+Tests for gazetteer-based location extraction and the tiered location module.
+
+The DSPy predictor is replaced by a stub, so no LLM is needed.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from real_estate_search.hybrid.gazetteer import LocationGazetteer, get_default_gazetteer
+from real_estate_search.hybrid.location import LocationUnderstandingModule
+
+
+@pytest.fixture
+def gazetteer():
+    """Small gazetteer with multi-word and ambiguous one-word names."""
+    gazetteer = LocationGazetteer()
+    gazetteer.add_state("CA")
+    gazetteer.add_state("Utah")
+    gazetteer.add("city", "San Francisco")
+    gazetteer.add("city", "Oakland")
+    gazetteer.add("city", "Park City")
+    gazetteer.add("city", "Summit")
+    gazetteer.add("neighborhood", "Mission District")
+    gazetteer.add_zip_code("94110")
+    return gazetteer
+
+
+class TestLocationGazetteer:
+    """Test matching, confidence and query cleaning."""
+
+    def test_multi_word_city_and_state(self, gazetteer):
+        """Longest names win and state abbreviations expand."""
+        result = gazetteer.extract("Condo in park city, UT")
+
+        assert result.confident
+        assert result.intent.city == "Park City"
+        assert result.intent.state == "Utah"
+        assert result.intent.cleaned_query == "Condo"
+
+    def test_neighborhood_and_zip(self, gazetteer):
+        """Neighborhoods and known ZIP codes are extracted."""
+        result = gazetteer.extract("3 bedroom home in Mission District 94110 with garden")
+
+        assert result.confident
+        assert result.intent.neighborhood == "Mission District"
+        assert result.intent.zip_code == "94110"
+        assert result.intent.cleaned_query == "3 bedroom home with garden"
+
+    def test_no_location(self, gazetteer):
+        """Queries without places are answered without the LLM."""
+        result = gazetteer.extract("modern kitchen with an open floor plan")
+
+        assert result.confident
+        assert not result.intent.has_location
+        assert result.intent.cleaned_query == "modern kitchen with an open floor plan"
+
+    @pytest.mark.parametrize("query", [
+        "summit views from the deck",         # one-word name used as a word
+        "house in San Francisco or Oakland",  # two cities
+        "cabin in Aspen",                     # place the gazetteer does not know
+        "cabin in aspen",                     # unknown place in lower case
+        "home in 90210",                      # unknown ZIP code
+    ])
+    def test_unsure_queries_defer_to_llm(self, gazetteer, query):
+        """Doubtful, conflicting or unknown places are not confident."""
+        assert not gazetteer.extract(query).confident
+
+    def test_lower_case_state_abbreviation_after_city(self, gazetteer):
+        """A trailing lower-case abbreviation right after a city is a state."""
+        result = gazetteer.extract("luxury condo in san francisco ca")
+
+        assert result.confident
+        assert result.intent.city == "San Francisco"
+        assert result.intent.state == "California"
+        assert result.intent.cleaned_query == "luxury condo"
+
+    def test_lower_case_state_abbreviation_mid_query_is_unsure(self, gazetteer):
+        """Elsewhere 'ca' and 'ut' may be words, so the LLM decides."""
+        result = gazetteer.extract("homes in Oakland ca with a pool")
+
+        assert not result.confident
+        assert result.intent.city == "Oakland"
+        assert result.intent.state is None
+
+    @pytest.mark.parametrize("query, cleaned", [
+        ("family home in the mission district", "family home"),
+        ("loft near downtown Oakland with views", "loft with views"),
+        ("the Mission District homes", "homes"),
+    ])
+    def test_lead_in_words_are_cleaned(self, gazetteer, query, cleaned):
+        """Prepositions, articles and filler before a place are removed."""
+        result = gazetteer.extract(query)
+
+        assert result.confident
+        assert result.intent.cleaned_query == cleaned
+
+    def test_default_gazetteer_loads_real_estate_data(self):
+        """The shared gazetteer is built from real_estate_data."""
+        default = get_default_gazetteer()
+
+        assert default is get_default_gazetteer()
+        assert default.extract("homes in San Francisco").intent.city == "San Francisco"
+
+
+class TestTieredLocationModule:
+    """Test tier routing and LLM answer caching."""
+
+    @pytest.fixture
+    def module(self, gazetteer):
+        """Module with a stubbed DSPy predictor."""
+        with patch("real_estate_search.hybrid.location.ensure_dspy_initialized"):
+            module = LocationUnderstandingModule(gazetteer=gazetteer)
+        module.extract_location = Mock(return_value=SimpleNamespace(
+            city="Aspen", state="Colorado", neighborhood="unknown", zip_code="unknown",
+            has_location=True, cleaned_query="cabin", confidence="0.9"
+        ))
+        return module
+
+    def test_gazetteer_tier_skips_llm(self, module):
+        """Confident gazetteer answers never reach the LLM."""
+        intent = module("loft in San Francisco")
+
+        assert intent.city == "San Francisco"
+        module.extract_location.assert_not_called()
+        assert module.stats().gazetteer.hits == 1
+
+    def test_llm_answers_are_cached(self, module):
+        """Unsure queries call the LLM once per normalized query."""
+        first = module("cabin in Aspen")
+        second = module("Cabin in  aspen")
+
+        assert first.city == second.city == "Aspen"
+        module.extract_location.assert_called_once_with(query_text="cabin in Aspen")
+        stats = module.stats()
+        assert (stats.llm.hits, stats.llm_cache.hits) == (1, 1)
+        assert stats.llm_rate == 0.5
@@ -20,6 +20,7 @@ from real_estate_search.hybrid import (
 )
 from real_estate_search.hybrid.location import LocationFilterBuilder
 from real_estate_search.config import AppConfig
+from real_estate_search.embeddings import QueryEmbeddingStats
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +101,7 @@ class TestLocationHybridIntegration:
             with patch('real_estate_search.hybrid.search_engine.AppConfig') as mock_config:
                 mock_embedding_instance = Mock()
                 mock_embedding_instance.embed_query.return_value = [0.1] * 1024
+                mock_embedding_instance.stats.return_value = QueryEmbeddingStats()
                 mock_embedding.return_value = mock_embedding_instance
                 
                 mock_config_inst = Mock()
@@ -137,6 +139,7 @@ class TestLocationHybridIntegration:
             # Mock embedding service
             mock_embedding_instance = Mock()
             mock_embedding_instance.embed_query.return_value = [0.1] * 1024
+            mock_embedding_instance.stats.return_value = QueryEmbeddingStats()
             mock_embedding.return_value = mock_embedding_instance
             
             # Mock location module to return Park City
@@ -178,6 +181,7 @@ class TestLocationHybridIntegration:
         with patch('real_estate_search.hybrid.search_engine.QueryEmbeddingService') as mock_embedding:
             mock_embedding_instance = Mock()
             mock_embedding_instance.embed_query.return_value = [0.1] * 1024
+            mock_embedding_instance.stats.return_value = QueryEmbeddingStats()
             mock_embedding.return_value = mock_embedding_instance
             
             engine = HybridSearchEngine(mock_es_client, mock_config)
@@ -220,6 +224,7 @@ class TestLocationHybridIntegration:
         with patch('real_estate_search.hybrid.search_engine.QueryEmbeddingService') as mock_embedding:
             mock_embedding_instance = Mock()
             mock_embedding_instance.embed_query.return_value = [0.1] * 1024
+            mock_embedding_instance.stats.return_value = QueryEmbeddingStats()
             mock_embedding.return_value = mock_embedding_instance
             
             engine = HybridSearchEngine(mock_es_client, mock_config)
@@ -295,6 +300,7 @@ class TestLocationHybridIntegration:
         with patch('real_estate_search.hybrid.search_engine.QueryEmbeddingService') as mock_embedding:
             mock_embedding_instance = Mock()
             mock_embedding_instance.embed_query.return_value = [0.1] * 1024
+            mock_embedding_instance.stats.return_value = QueryEmbeddingStats()
             mock_embedding.return_value = mock_embedding_instance
             
             engine = HybridSearchEngine(mock_es_client, mock_config)
@@ -0,0 +1,109 @@
+"""
+Tests for the query embedding cache and the shared embedding service.
+
+The Voyage client is replaced by a stub, so no API key is needed.
+"""
+
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from real_estate_search.embeddings import (
+    EmbeddingConfig,
+    QueryEmbeddingCache,
+    QueryEmbeddingService,
+    close_shared_embedding_services,
+    get_shared_embedding_service,
+    normalize_query
+)
+
+
+class TestQueryEmbeddingCache:
+    """Test LRU, TTL and disk persistence of query vectors."""
+
+    def test_normalized_queries_share_an_entry(self):
+        """Case and whitespace differences hit the same entry."""
+        cache = QueryEmbeddingCache()
+        cache.put("homes with a pool", "voyage-3", [0.1, 0.2])
+
+        assert normalize_query("  Homes  with a POOL ") == "homes with a pool"
+        assert cache.get("Homes with a pool ", "voyage-3") == [0.1, 0.2]
+        assert cache.get("homes with a pool", "voyage-3-lite") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_lru_eviction(self):
+        """The least recently used vector is evicted first."""
+        cache = QueryEmbeddingCache(max_entries=2)
+        cache.put("a", "m", [1.0])
+        cache.put("b", "m", [2.0])
+        cache.get("a", "m")
+        cache.put("c", "m", [3.0])
+
+        assert cache.get("b", "m") is None
+        assert cache.get("a", "m") == [1.0]
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self):
+        """Vectors older than the TTL are misses."""
+        cache = QueryEmbeddingCache(ttl_seconds=0.01)
+        cache.put("a", "m", [1.0])
+        time.sleep(0.02)
+
+        assert cache.get("a", "m") is None
+
+    def test_disk_store_survives_restart(self, tmp_path):
+        """A new cache on the same file starts warm."""
+        path = tmp_path / "query_embeddings.sqlite"
+        cache = QueryEmbeddingCache(disk_path=str(path))
+        cache.put("a", "m", [0.5, 0.25])
+        cache.close()
+
+        restarted = QueryEmbeddingCache(disk_path=str(path))
+        assert restarted.get("A", "m") == [0.5, 0.25]
+        assert restarted.disk_hits == 1
+
+
+class TestSharedEmbeddingService:
+    """Test the long-lived service with a stubbed Voyage client."""
+
+    @pytest.fixture
+    def voyage(self):
+        """Stub VoyageEmbedding returning a fixed vector."""
+        with patch("real_estate_search.embeddings.service.VoyageEmbedding") as voyage_class:
+            model = Mock()
+            model.get_text_embedding.return_value = [0.1] * 1024
+            model.get_text_embedding_batch.side_effect = lambda texts: [[0.2] * 1024 for _ in texts]
+            voyage_class.return_value = model
+            yield voyage_class
+        close_shared_embedding_services()
+
+    def test_service_is_shared_and_cached(self, voyage):
+        """One client per model; repeated queries skip the provider."""
+        config = EmbeddingConfig(api_key="test-key")
+        service = get_shared_embedding_service(config)
+        assert get_shared_embedding_service(EmbeddingConfig(api_key="test-key")) is service
+
+        service.initialize()
+        service.initialize()
+        service.embed_query("homes with a pool")
+        service.embed_query("Homes with a pool ")
+
+        assert voyage.call_count == 1
+        assert voyage.return_value.get_text_embedding.call_count == 1
+        stats = service.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+        assert stats.p50_ms >= 0
+
+    def test_batch_only_embeds_uncached_queries(self, voyage):
+        """Cached queries are filled in without going to the provider."""
+        service = QueryEmbeddingService(config=EmbeddingConfig(api_key="test-key"))
+        service.initialize()
+        service.embed_query("condo downtown")
+
+        vectors = service.batch_embed_queries(["condo downtown", "ranch with acreage"])
+
+        assert vectors[0] == [0.1] * 1024
+        assert vectors[1] == [0.2] * 1024
+        voyage.return_value.get_text_embedding_batch.assert_called_once_with(["ranch with acreage"])
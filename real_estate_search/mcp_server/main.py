@@ -13,24 +13,30 @@ if __name__ == "__main__" and __package__ is None:
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
     from real_estate_search.mcp_server.settings import MCPServerConfig
     from real_estate_search.mcp_server.services.elasticsearch_client import ElasticsearchClient
-    from real_estate_search.search_service.properties import PropertySearchService
-    from real_estate_search.search_service.wikipedia import WikipediaSearchService
-    from real_estate_search.search_service.neighborhoods import NeighborhoodSearchService
+    from real_estate_search.mcp_server.services.async_elasticsearch_client import AsyncElasticsearchClient
+    from real_estate_search.search_service.properties import PropertySearchService, AsyncPropertySearchService
+    from real_estate_search.search_service.wikipedia import WikipediaSearchService, AsyncWikipediaSearchService
+    from real_estate_search.search_service.neighborhoods import NeighborhoodSearchService, AsyncNeighborhoodSearchService
     from real_estate_search.mcp_server.services.health_check import HealthCheckService
     from real_estate_search.mcp_server.utils.logging import setup_logging, get_logger
+    from real_estate_search.mcp_server.utils.executor import configure_blocking_executor, shutdown_blocking_executor
     from real_estate_search.mcp_server.tool_registry import ToolRegistry
-    from real_estate_search.embeddings import QueryEmbeddingService
+    from real_estate_search.embeddings import QueryEmbeddingService, get_shared_embedding_service
+    from real_estate_search.hybrid import HybridSearchEngine
 else:
     # Running as module
     from .settings import MCPServerConfig
     from .services.elasticsearch_client import ElasticsearchClient
-    from ..search_service.properties import PropertySearchService
-    from ..search_service.wikipedia import WikipediaSearchService
-    from ..search_service.neighborhoods import NeighborhoodSearchService
+    from .services.async_elasticsearch_client import AsyncElasticsearchClient
+    from ..search_service.properties import PropertySearchService, AsyncPropertySearchService
+    from ..search_service.wikipedia import WikipediaSearchService, AsyncWikipediaSearchService
+    from ..search_service.neighborhoods import NeighborhoodSearchService, AsyncNeighborhoodSearchService
     from .services.health_check import HealthCheckService
     from .utils.logging import setup_logging, get_logger
+    from .utils.executor import configure_blocking_executor, shutdown_blocking_executor
     from .tool_registry import ToolRegistry
-    from ..embeddings import QueryEmbeddingService
+    from ..embeddings import QueryEmbeddingService, get_shared_embedding_service
+    from ..hybrid import HybridSearchEngine
 
 
 logger = get_logger(__name__)
@@ -57,11 +63,13 @@ class MCPServer:
         
         # Initialize services
         self.es_client: Optional[ElasticsearchClient] = None
+        self.async_es_client: Optional[AsyncElasticsearchClient] = None
         self.embedding_service: Optional[QueryEmbeddingService] = None
         self.property_search_service: Optional[PropertySearchService] = None
         self.wikipedia_search_service: Optional[WikipediaSearchService] = None
         self.neighborhood_search_service: Optional[NeighborhoodSearchService] = None
         self.health_check_service: Optional[HealthCheckService] = None
+        self.hybrid_search_engine: Optional[HybridSearchEngine] = None
         
         # Initialize FastMCP app
         self.app = FastMCP(self.config.server_name)
@@ -78,27 +86,42 @@ class MCPServer:
             self.es_client = ElasticsearchClient(self.config.elasticsearch)
             logger.info("Elasticsearch client initialized")
             
-            # Embedding service - use config directly from AppConfig
-            self.embedding_service = QueryEmbeddingService(config=self.config.embedding)
+            # Embedding service - shared with the hybrid search engine
+            self.embedding_service = get_shared_embedding_service(self.config.embedding, QueryEmbeddingService)
             self.embedding_service.initialize()  # Initialize the embedding model
             logger.info("Embedding service initialized")
             
-            # Search services - directly use search_service implementations
-            self.property_search_service = PropertySearchService(
-                es_client=self.es_client.client
+            # Async client for tool searches, so a slow query does not stall the event loop
+            self.async_es_client = AsyncElasticsearchClient(self.config.elasticsearch)
+            logger.info("Async Elasticsearch client initialized")
+            
+            # Remaining blocking work (DSPy, embeddings, hybrid search) runs on a bounded pool
+            configure_blocking_executor(self.config.max_blocking_workers)
+            
+            # Search services - async variants of the search_service implementations
+            self.property_search_service = AsyncPropertySearchService(
+                es_client=self.async_es_client.client,
+                embedding_service=self.embedding_service
             )
             logger.info("Property search service initialized")
             
-            self.wikipedia_search_service = WikipediaSearchService(
-                es_client=self.es_client.client
+            self.wikipedia_search_service = AsyncWikipediaSearchService(
+                es_client=self.async_es_client.client
             )
             logger.info("Wikipedia search service initialized")
             
-            self.neighborhood_search_service = NeighborhoodSearchService(
-                es_client=self.es_client.client
+            self.neighborhood_search_service = AsyncNeighborhoodSearchService(
+                es_client=self.async_es_client.client
             )
             logger.info("Neighborhood search service initialized")
             
+            # Hybrid search engine - built once and shared by all tool calls
+            self.hybrid_search_engine = HybridSearchEngine(
+                self.es_client.client,
+                self.config.config
+            )
+            logger.info("Hybrid search engine initialized")
+            
             # Health check service
             self.health_check_service = HealthCheckService(
                 self.config,
@@ -133,11 +156,13 @@ class MCPServer:
         return MCPContext({
             "config": self.config,
             "es_client": self.es_client,
+            "async_es_client": self.async_es_client,
             "embedding_service": self.embedding_service,
             "property_search_service": self.property_search_service,
             "wikipedia_search_service": self.wikipedia_search_service,
             "neighborhood_search_service": self.neighborhood_search_service,
-            "health_check_service": self.health_check_service
+            "health_check_service": self.health_check_service,
+            "hybrid_search_engine": self.hybrid_search_engine
         })
     
     def start(self, transport: str = None, host: str = None, port: int = None):
@@ -193,6 +218,9 @@ class MCPServer:
             # Close services
             if self.es_client:
                 self.es_client.close()
+            if self.async_es_client:
+                await self.async_es_client.close()
+            shutdown_blocking_executor()
             
             logger.info("MCP server stopped")
             
@@ -215,6 +243,7 @@ def print_available_tools():
     print("\n📦 Available MCP Tools:")
     print("  • search_properties_with_filters - Property search with explicit filters")
     print("  • search_properties - Natural language property search")
+    print("  • search_properties_batch - Run up to 50 property searches at once")
     print("  • get_property_details - Get property details by ID")
     print("  • get_rich_property_details - Get rich property listing with embedded data")
     print("  • search_wikipedia - Search Wikipedia content")
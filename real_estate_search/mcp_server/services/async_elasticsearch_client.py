@@ -0,0 +1,229 @@
+"""Async Elasticsearch client wrapper with connection pooling and retry logic."""
+
+import logging
+from typing import Dict, Any, Optional, List
+from elasticsearch import AsyncElasticsearch, exceptions as es_exceptions
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential,
+    retry_if_exception_type,
+    before_sleep_log
+)
+
+from ..settings import ElasticsearchConfig
+from .elasticsearch_client import build_client_kwargs
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncElasticsearchClient:
+    """AsyncElasticsearch client for MCP tools.
+
+    Mirrors the read paths of ElasticsearchClient; requests are awaited on
+    the event loop instead of blocking it. Indexing and index management
+    stay on the sync client.
+    """
+
+    def __init__(self, config: ElasticsearchConfig):
+        """Initialize async Elasticsearch client.
+
+        Args:
+            config: Elasticsearch configuration
+        """
+        self.config = config
+        self._client: Optional[AsyncElasticsearch] = None
+        self._initialize_client()
+
+    def _initialize_client(self):
+        """Initialize the AsyncElasticsearch client with proper configuration."""
+        try:
+            self._client = AsyncElasticsearch(**build_client_kwargs(self.config))
+            logger.info("Async Elasticsearch client initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize async Elasticsearch client: {e}")
+            raise
+
+    @property
+    def client(self) -> AsyncElasticsearch:
+        """Get the AsyncElasticsearch client instance."""
+        if self._client is None:
+            self._initialize_client()
+        return self._client
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((
+            es_exceptions.ConnectionError,
+            es_exceptions.ConnectionTimeout,
+            es_exceptions.TransportError
+        )),
+        before_sleep=before_sleep_log(logger, logging.WARNING)
+    )
+    async def search(
+        self,
+        index: str,
+        body: Dict[str, Any],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Execute a search query with retry logic.
+
+        Args:
+            index: Index name
+            body: Search query body
+            **kwargs: Additional search parameters
+
+        Returns:
+            Search response
+        """
+        try:
+            return await self.client.search(
+                index=index,
+                body=body,
+                **kwargs
+            )
+        except es_exceptions.NotFoundError:
+            logger.error(f"Index not found: {index}")
+            raise
+        except es_exceptions.RequestError as e:
+            logger.error(f"Invalid search request: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            raise
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((
+            es_exceptions.ConnectionError,
+            es_exceptions.ConnectionTimeout,
+            es_exceptions.TransportError
+        )),
+        before_sleep=before_sleep_log(logger, logging.WARNING)
+    )
+    async def multi_search(
+        self,
+        body: List[Dict[str, Any]],
+        index: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Execute multiple search queries in a single request.
+
+        Args:
+            body: Multi-search body
+            index: Optional index name
+            **kwargs: Additional parameters
+
+        Returns:
+            Multi-search response
+        """
+        try:
+            return await self.client.msearch(
+                body=body,
+                index=index,
+                **kwargs
+            )
+        except Exception as e:
+            logger.error(f"Multi-search failed: {e}")
+            raise
+
+    async def get_document(
+        self,
+        index: str,
+        doc_id: str,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """Get a document by ID.
+
+        Args:
+            index: Index name
+            doc_id: Document ID
+            **kwargs: Additional parameters
+
+        Returns:
+            Document or None if not found
+        """
+        try:
+            response = await self.client.get(
+                index=index,
+                id=doc_id,
+                **kwargs
+            )
+            return response["_source"]
+        except es_exceptions.NotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get document: {e}")
+            raise
+
+    async def count(
+        self,
+        index: str,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> int:
+        """Count documents matching a query.
+
+        Args:
+            index: Index name
+            body: Optional query body
+            **kwargs: Additional parameters
+
+        Returns:
+            Document count
+        """
+        try:
+            response = await self.client.count(
+                index=index,
+                body=body,
+                **kwargs
+            )
+            return response["count"]
+        except Exception as e:
+            logger.error(f"Failed to count documents: {e}")
+            raise
+
+    async def ping(self) -> bool:
+        """Check if Elasticsearch is reachable.
+
+        Returns:
+            True if reachable, False otherwise
+        """
+        try:
+            return await self.client.ping()
+        except Exception as e:
+            logger.error(f"Failed to ping Elasticsearch: {e}")
+            return False
+
+    async def index_exists(self, index: str) -> bool:
+        """Check if an index exists.
+
+        Args:
+            index: Index name
+
+        Returns:
+            True if exists, False otherwise
+        """
+        try:
+            return bool(await self.client.indices.exists(index=index))
+        except Exception as e:
+            logger.error(f"Failed to check index existence: {e}")
+            return False
+
+    async def close(self):
+        """Close the Elasticsearch client connection."""
+        if self._client:
+            await self._client.close()
+            self._client = None
+            logger.info("Async Elasticsearch client connection closed")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -19,6 +19,38 @@ from ..settings import ElasticsearchConfig
 logger = logging.getLogger(__name__)
 
 
+def build_client_kwargs(config: ElasticsearchConfig) -> Dict[str, Any]:
+    """Build Elasticsearch client arguments from configuration.
+    
+    Shared by the sync and async clients so both connect the same way.
+    
+    Args:
+        config: Elasticsearch configuration
+        
+    Returns:
+        Keyword arguments for Elasticsearch / AsyncElasticsearch
+    """
+    client_kwargs = {
+        "hosts": [config.url],
+        "verify_certs": config.verify_certs,
+        "request_timeout": config.request_timeout,
+        "retry_on_timeout": config.retry_on_timeout,
+        "max_retries": config.max_retries,
+    }
+    
+    # Add authentication if provided
+    if config.cloud_id:
+        client_kwargs["cloud_id"] = config.cloud_id
+        client_kwargs.pop("hosts")
+    
+    if config.api_key:
+        client_kwargs["api_key"] = config.api_key
+    elif config.username and config.password:
+        client_kwargs["basic_auth"] = (config.username, config.password)
+    
+    return client_kwargs
+
+
 class ElasticsearchClient:
     """Elasticsearch client with connection pooling and retry logic."""
     
@@ -34,23 +66,7 @@ class ElasticsearchClient:
     
     def _initialize_client(self):
         """Initialize the Elasticsearch client with proper configuration."""
-        client_kwargs = {
-            "hosts": [self.config.url],
-            "verify_certs": self.config.verify_certs,
-            "request_timeout": self.config.request_timeout,
-            "retry_on_timeout": self.config.retry_on_timeout,
-            "max_retries": self.config.max_retries,
-        }
-        
-        # Add authentication if provided
-        if self.config.cloud_id:
-            client_kwargs["cloud_id"] = self.config.cloud_id
-            client_kwargs.pop("hosts")
-        
-        if self.config.api_key:
-            client_kwargs["api_key"] = self.config.api_key
-        elif self.config.username and self.config.password:
-            client_kwargs["basic_auth"] = (self.config.username, self.config.password)
+        client_kwargs = build_client_kwargs(self.config)
         
         try:
             self._client = Elasticsearch(**client_kwargs)
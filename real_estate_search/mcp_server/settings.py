@@ -76,6 +76,11 @@ class MCPServerConfig(BaseSettings):
         default=False,
         description="Debug mode"
     )
+    max_blocking_workers: int = Field(
+        default=8,
+        ge=1,
+        description="Threads for blocking calls made from async tools (LLM, embeddings, hybrid search)"
+    )
     
     # Placeholder fields - will be loaded from AppConfig
     elasticsearch: ElasticsearchConfig = Field(default=None)
@@ -130,7 +135,8 @@ class MCPServerConfig(BaseSettings):
             server_name=yaml_data.get('server_name', 'real-estate-search-mcp'),
             server_version=yaml_data.get('server_version', '0.1.0'),
             transport=yaml_data.get('transport', {}),
-            debug=yaml_data.get('debug', False)
+            debug=yaml_data.get('debug', False),
+            max_blocking_workers=yaml_data.get('max_blocking_workers', 8)
         )
     
     @classmethod
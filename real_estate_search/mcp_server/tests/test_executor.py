@@ -0,0 +1,53 @@
+"""Tests for the blocking-call executor used by async MCP tools."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from real_estate_search.mcp_server.utils.executor import (
+    configure_blocking_executor,
+    run_blocking,
+    shutdown_blocking_executor,
+)
+
+
+@pytest.fixture(autouse=True)
+def executor():
+    """Give each test its own small executor."""
+    yield configure_blocking_executor(2)
+    shutdown_blocking_executor()
+
+
+@pytest.mark.asyncio
+async def test_sync_callable_runs_off_loop_thread():
+    """Sync callables run on a worker thread, not the event loop."""
+    loop_thread = threading.get_ident()
+    worker_thread = await run_blocking(threading.get_ident)
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_coroutine_function_is_awaited():
+    """Coroutine functions are awaited directly."""
+    async def add(a, b=0):
+        return a + b
+
+    assert await run_blocking(add, 2, b=3) == 5
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_does_not_stall_loop():
+    """A slow sync call leaves the loop free for other work."""
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(run_blocking(time.sleep, 0.1), ticker())
+
+    assert len(ticks) == 5
+    assert ticks[-1] - ticks[0] < 0.1
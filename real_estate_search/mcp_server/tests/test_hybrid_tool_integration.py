@@ -0,0 +1,64 @@
+"""
+Integration test for the hybrid search tool using the server's shared engine.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from real_estate_search.hybrid import HybridSearchEngine, HybridSearchResult, LocationIntent, SearchResult
+from real_estate_search.mcp_server.utils.context import ToolContext
+
+
+def _hybrid_result() -> HybridSearchResult:
+    """One-hit result with an extracted city."""
+    return HybridSearchResult(
+        query="condo in Park City",
+        total_hits=1,
+        execution_time_ms=12,
+        results=[
+            SearchResult(
+                listing_id="prop-1",
+                hybrid_score=0.03,
+                property_data={
+                    "listing_id": "prop-1",
+                    "property_type": "condo",
+                    "price": 750000,
+                    "address": {"city": "Park City", "state": "UT"}
+                }
+            )
+        ],
+        search_metadata={},
+        location_intent=LocationIntent(city="Park City", has_location=True, cleaned_query="condo", confidence=0.95)
+    )
+
+
+@pytest.mark.asyncio
+async def test_hybrid_tool_reuses_shared_engine():
+    """Every call uses the engine from the context; none are constructed."""
+    from real_estate_search.mcp_server.tools import hybrid_search_tool
+
+    engine = Mock(spec=HybridSearchEngine)
+    engine.search_with_location.return_value = _hybrid_result()
+    context = ToolContext(config=Mock(), hybrid_search_engine=engine)
+
+    with patch.object(hybrid_search_tool, "HybridSearchEngine") as engine_class:
+        first = await hybrid_search_tool.search_properties_hybrid(
+            context, query="condo in Park City", size=500, include_location_extraction=True
+        )
+        await hybrid_search_tool.search_properties_hybrid(context, query="condo in Park City")
+
+    engine_class.assert_not_called()
+    assert engine.search_with_location.call_count == 2
+    engine.search_with_location.assert_any_call(query="condo in Park City", size=100)
+    assert first["results"][0]["listing_id"] == "prop-1"
+    assert first["location_extraction"]["city"] == "Park City"
+
+
+@pytest.mark.asyncio
+async def test_hybrid_tool_without_engine_returns_error():
+    """A context without the shared engine reports an error."""
+    from real_estate_search.mcp_server.tools import hybrid_search_tool
+
+    result = await hybrid_search_tool.search_properties_hybrid(ToolContext(config=Mock()), query="condo")
+
+    assert result["error"]["error_type"] == "SEARCH_FAILED"
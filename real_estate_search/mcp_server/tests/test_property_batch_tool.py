@@ -0,0 +1,72 @@
+"""
+Integration test for the batch property search tool.
+"""
+
+import pytest
+from unittest.mock import Mock
+from real_estate_search.search_service.models import (
+    PropertySearchRequest,
+    PropertySearchResponse,
+    PropertyBatchSearchResponse,
+    SearchError
+)
+from real_estate_search.search_service.properties import PropertySearchService
+
+
+@pytest.mark.asyncio
+async def test_batch_tool_maps_results_in_order():
+    """Valid searches run as one batch; invalid ones get errors in place."""
+    from real_estate_search.mcp_server.tools import property_tools
+
+    mock_property_service = Mock(spec=PropertySearchService)
+    mock_property_service.search_batch.return_value = PropertyBatchSearchResponse(
+        results=[
+            PropertySearchResponse(results=[], total_hits=0, execution_time_ms=5),
+            SearchError(error_type="search_phase_execution_exception", message="bad query")
+        ],
+        total_requests=2,
+        failed_requests=1,
+        execution_time_ms=12
+    )
+
+    context = Mock()
+    context.get.return_value = mock_property_service
+
+    result = await property_tools.search_properties_batch(
+        context=context,
+        searches=[
+            {"query": "modern condo", "max_price": 900000},
+            {"query": "bad", "unknown_argument": True},
+            {"query": "family home", "size": 5, "semantic": True}
+        ]
+    )
+
+    mock_property_service.search_batch.assert_called_once()
+    requests = mock_property_service.search_batch.call_args[0][0]
+    assert all(isinstance(request, PropertySearchRequest) for request in requests)
+    assert [request.query for request in requests] == ["modern condo", "family home"]
+    assert [request.semantic for request in requests] == [False, True]
+
+    assert result["total_requests"] == 3
+    assert result["failed_requests"] == 2
+    assert result["results"][0]["total_hits"] == 0
+    assert result["results"][1]["error"]["error_type"] == "INVALID_REQUEST"
+    assert result["results"][2]["error"]["error_type"] == "search_phase_execution_exception"
+
+
+@pytest.mark.asyncio
+async def test_batch_tool_rejects_oversized_batches():
+    """Batches above the limit are rejected without searching."""
+    from real_estate_search.mcp_server.tools import property_tools
+
+    mock_property_service = Mock(spec=PropertySearchService)
+    context = Mock()
+    context.get.return_value = mock_property_service
+
+    result = await property_tools.search_properties_batch(
+        context=context,
+        searches=[{"query": "condo"}] * (property_tools.MAX_BATCH_SEARCHES + 1)
+    )
+
+    assert result["error"]["error_type"] == "SEARCH_FAILED"
+    mock_property_service.search_batch.assert_not_called()
@@ -75,6 +75,21 @@ class ToolRegistry:
                 search_type=search_type
             )
     
+        @self.app.tool(
+            name="search_properties_batch",
+            description="Run up to 50 property searches at once, e.g. to compare several areas or price ranges.",
+            tags={"property", "search", "batch", "real_estate"}
+        )
+        async def search_properties_batch(
+            searches: List[Dict[str, Any]]
+        ) -> Dict[str, Any]:
+            """Run several property searches in one call."""
+            context = ToolContext.from_server(server)
+            return await property_tools.search_properties_batch(
+                context,
+                searches=searches
+            )
+    
     def _register_property_detail_tools(self, server):
         """Register property detail tools."""
         
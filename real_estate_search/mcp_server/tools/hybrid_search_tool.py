@@ -2,9 +2,8 @@
 
 from typing import Dict, Any
 from fastmcp import Context
-from elasticsearch import Elasticsearch
 
-from ...hybrid import HybridSearchEngine
+from ...hybrid import HybridSearchEngine, HybridSearchRequest, HybridSearchResult
 from ...search_service.models import (
     PropertySearchResponse,
     PropertyResult,
@@ -12,6 +11,7 @@ from ...search_service.models import (
     SearchError
 )
 from ..utils.logging import get_request_logger
+from ..utils.executor import run_blocking
 
 
 async def search_properties_hybrid(
@@ -28,6 +28,9 @@ async def search_properties_hybrid(
     - Combine text and vector search with RRF
     - Apply location filters efficiently during search
     
+    The engine is built once by the server and shared through the context;
+    everything specific to this call lives in a HybridSearchRequest.
+    
     Args:
         query: Natural language search query
         size: Number of results to return (1-100, default 10)
@@ -42,88 +45,26 @@ async def search_properties_hybrid(
     logger.info(f"Natural language property search: {query}")
     
     try:
-        # Get Elasticsearch client from context - note: this is the ElasticsearchClient wrapper
-        es_client_wrapper = context.get("es_client")
-        if not es_client_wrapper:
-            raise ValueError("Elasticsearch client not available")
-        
-        # Get the actual Elasticsearch client from the wrapper
-        es_client: Elasticsearch = es_client_wrapper.client
-        
-        # Get config from context
-        config = context.get("config")
-        
-        # Initialize hybrid search engine (it will load its own AppConfig if config is None)
-        hybrid_engine = HybridSearchEngine(es_client, None)
-        
-        # Execute location-aware search
-        hybrid_result = hybrid_engine.search_with_location(
+        request = HybridSearchRequest(
             query=query,
-            size=min(size, 100)  # Cap at 100
+            size=max(1, min(size, 100)),  # Cap at 100
+            include_location_extraction=include_location_extraction,
+            request_id=request_id
         )
         
-        # Transform to PropertySearchResponse format
-        property_results = []
-        for search_result in hybrid_result.results:
-            # Extract property data
-            property_data = search_result.property_data
-            
-            # Build PropertyAddress
-            address_data = property_data.get("address", {})
-            address = PropertyAddress(
-                street=address_data.get("street", ""),
-                city=address_data.get("city", ""),
-                state=address_data.get("state", ""),
-                zip_code=address_data.get("zip_code", "")
-            )
-            
-            # Build PropertyResult
-            result = PropertyResult(
-                listing_id=property_data.get("listing_id", ""),
-                property_type=property_data.get("property_type", ""),
-                price=property_data.get("price", 0),
-                bedrooms=property_data.get("bedrooms", 0),
-                bathrooms=property_data.get("bathrooms", 0),
-                square_feet=property_data.get("square_feet", 0),
-                address=address,
-                description=property_data.get("description", ""),
-                features=property_data.get("features", []),
-                score=search_result.hybrid_score
-            )
-            
-            property_results.append(result)
+        # Shared engine built at server startup
+        hybrid_engine: HybridSearchEngine = context.get("hybrid_search_engine")
+        if not hybrid_engine:
+            raise ValueError("Hybrid search engine not available")
         
-        # Build response
-        response = PropertySearchResponse(
-            results=property_results,
-            total_hits=hybrid_result.total_hits,
-            execution_time_ms=hybrid_result.execution_time_ms
+        # Execute location-aware search; DSPy and embedding calls are blocking
+        hybrid_result = await run_blocking(
+            hybrid_engine.search_with_location,
+            query=request.query,
+            size=request.size
         )
         
-        # Convert to dict for MCP response
-        response_dict = response.model_dump()
-        
-        # Add location extraction metadata if requested
-        if include_location_extraction and hybrid_result.location_intent:
-            location_intent = hybrid_result.location_intent
-            response_dict["location_extraction"] = {
-                "extracted": location_intent.has_location,
-                "city": location_intent.city,
-                "state": location_intent.state,
-                "neighborhood": location_intent.neighborhood,
-                "zip_code": location_intent.zip_code,
-                "cleaned_query": location_intent.cleaned_query,
-                "confidence": location_intent.confidence
-            }
-        
-        # Add search metadata
-        response_dict["search_metadata"] = {
-            "search_type": "hybrid_with_location",
-            "rrf_used": True,
-            "location_extracted": hybrid_result.location_intent.has_location if hybrid_result.location_intent else False
-        }
-        
-        return response_dict
+        return build_hybrid_response(request, hybrid_result)
         
     except Exception as e:
         logger.error(f"Natural language property search failed: {e}")
@@ -133,4 +74,78 @@ async def search_properties_hybrid(
             message=str(e),
             details={"query": query, "search_type": "hybrid_with_location"}
         )
-        return {"error": error.model_dump()}
\ No newline at end of file
+        return {"error": error.model_dump()}
+
+
+def build_hybrid_response(request: HybridSearchRequest, hybrid_result: HybridSearchResult) -> Dict[str, Any]:
+    """Convert a hybrid search result into the MCP tool response.
+    
+    Args:
+        request: The request the result answers
+        hybrid_result: Result from HybridSearchEngine
+        
+    Returns:
+        PropertySearchResponse dict with search and optional location metadata
+    """
+    # Transform to PropertySearchResponse format
+    property_results = []
+    for search_result in hybrid_result.results:
+        # Extract property data
+        property_data = search_result.property_data
+        
+        # Build PropertyAddress
+        address_data = property_data.get("address", {})
+        address = PropertyAddress(
+            street=address_data.get("street", ""),
+            city=address_data.get("city", ""),
+            state=address_data.get("state", ""),
+            zip_code=address_data.get("zip_code", "")
+        )
+        
+        # Build PropertyResult
+        result = PropertyResult(
+            listing_id=property_data.get("listing_id", ""),
+            property_type=property_data.get("property_type", ""),
+            price=property_data.get("price", 0),
+            bedrooms=property_data.get("bedrooms", 0),
+            bathrooms=property_data.get("bathrooms", 0),
+            square_feet=property_data.get("square_feet", 0),
+            address=address,
+            description=property_data.get("description", ""),
+            features=property_data.get("features", []),
+            score=search_result.hybrid_score
+        )
+        
+        property_results.append(result)
+    
+    # Build response
+    response = PropertySearchResponse(
+        results=property_results,
+        total_hits=hybrid_result.total_hits,
+        execution_time_ms=hybrid_result.execution_time_ms
+    )
+    
+    # Convert to dict for MCP response
+    response_dict = response.model_dump()
+    
+    # Add location extraction metadata if requested
+    if request.include_location_extraction and hybrid_result.location_intent:
+        location_intent = hybrid_result.location_intent
+        response_dict["location_extraction"] = {
+            "extracted": location_intent.has_location,
+            "city": location_intent.city,
+            "state": location_intent.state,
+            "neighborhood": location_intent.neighborhood,
+            "zip_code": location_intent.zip_code,
+            "cleaned_query": location_intent.cleaned_query,
+            "confidence": location_intent.confidence
+        }
+    
+    # Add search metadata
+    response_dict["search_metadata"] = {
+        "search_type": "hybrid_with_location",
+        "rrf_used": True,
+        "location_extracted": hybrid_result.location_intent.has_location if hybrid_result.location_intent else False
+    }
+    
+    return response_dict
@@ -6,6 +6,7 @@ from fastmcp import Context
 from ...search_service.models import NeighborhoodSearchRequest
 from ...search_service.neighborhoods import NeighborhoodSearchService
 from ..utils.logging import get_request_logger
+from ..utils.executor import run_blocking
 
 
 async def search_neighborhoods(
@@ -58,7 +59,7 @@ async def search_neighborhoods(
         )
         
         # Execute search
-        response = neighborhood_search_service.search(request)
+        response = await run_blocking(neighborhood_search_service.search, request)
         
         # Return search_service response directly as dict
         return response.model_dump()
@@ -115,7 +116,7 @@ async def search_neighborhoods_by_location(
         )
         
         # Execute search
-        response = neighborhood_search_service.search(request)
+        response = await run_blocking(neighborhood_search_service.search, request)
         
         # Return search_service response directly as dict
         return response.model_dump()
@@ -6,9 +6,64 @@ from fastmcp import Context
 from ...search_service.models import PropertySearchRequest, PropertyFilter
 from ...search_service.properties import PropertySearchService
 from ..utils.logging import get_request_logger
+from ..utils.executor import run_blocking
 from ...indexer.enums import IndexName
 
 
+MAX_BATCH_SEARCHES = 50
+
+
+def build_property_search_request(
+    query: str,
+    property_type: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    min_bedrooms: Optional[int] = None,
+    max_bedrooms: Optional[int] = None,
+    city: Optional[str] = None,
+    state: Optional[str] = None,
+    size: int = 20,
+    semantic: bool = False
+) -> PropertySearchRequest:
+    """Build a property search request from tool arguments.
+    
+    Args:
+        query: Natural language property description
+        property_type: Filter by property type
+        min_price: Minimum price filter
+        max_price: Maximum price filter
+        min_bedrooms: Minimum number of bedrooms
+        max_bedrooms: Maximum number of bedrooms
+        city: Filter by city name
+        state: Filter by state (2-letter code)
+        size: Number of results to return (capped at 100)
+        semantic: Also match on the query embedding
+        
+    Returns:
+        Property search request
+    """
+    # Build filters if provided
+    filters = None
+    if any([property_type, min_price, max_price, min_bedrooms, max_bedrooms, city, state]):
+        filters = PropertyFilter(
+            property_type=property_type,
+            min_price=min_price,
+            max_price=max_price,
+            min_bedrooms=min_bedrooms,
+            max_bedrooms=max_bedrooms,
+            city=city,
+            state=state
+        )
+    
+    return PropertySearchRequest(
+        query=query,
+        filters=filters,
+        size=min(size, 100),  # Cap at 100
+        include_highlights=True,
+        semantic=semantic
+    )
+
+
 async def search_properties(
     context: Context,
     query: str,
@@ -53,29 +108,21 @@ async def search_properties(
         if not property_search_service:
             raise ValueError("Property search service not available")
         
-        # Build filters if provided
-        filters = None
-        if any([property_type, min_price, max_price, min_bedrooms, max_bedrooms, city, state]):
-            filters = PropertyFilter(
-                property_type=property_type,
-                min_price=min_price,
-                max_price=max_price,
-                min_bedrooms=min_bedrooms,
-                max_bedrooms=max_bedrooms,
-                city=city,
-                state=state
-            )
-        
         # Create search request
-        request = PropertySearchRequest(
+        request = build_property_search_request(
             query=query,
-            filters=filters,
-            size=min(size, 100),  # Cap at 100
-            include_highlights=True
+            property_type=property_type,
+            min_price=min_price,
+            max_price=max_price,
+            min_bedrooms=min_bedrooms,
+            max_bedrooms=max_bedrooms,
+            city=city,
+            state=state,
+            size=size
         )
         
         # Execute search
-        response = property_search_service.search(request)
+        response = await run_blocking(property_search_service.search, request)
         
         # Return search_service response directly as dict
         return response.model_dump()
@@ -92,6 +139,83 @@ async def search_properties(
         return {"error": error.model_dump()}
 
 
+async def search_properties_batch(
+    context: Context,
+    searches: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Run several property searches in one call.
+    
+    The searches are sent as multi-search requests, which is much faster
+    than calling search_properties once per query. Query texts of
+    searches with semantic=True are embedded together in one call.
+    
+    Args:
+        searches: Up to 50 searches, each a dict of search_properties
+            arguments (query, property_type, min_price, max_price,
+            min_bedrooms, max_bedrooms, city, state, size) plus an
+            optional semantic flag
+        
+    Returns:
+        One result or error per search, in the order given
+    """
+    # Get request ID safely without hasattr
+    request_id = getattr(context, 'request_id', "unknown")
+    logger = get_request_logger(request_id)
+    logger.info(f"Batch property search: {len(searches)} searches")
+    
+    try:
+        if len(searches) > MAX_BATCH_SEARCHES:
+            raise ValueError(f"At most {MAX_BATCH_SEARCHES} searches per batch, got {len(searches)}")
+        
+        # Get services from context
+        property_search_service: PropertySearchService = context.get("property_search_service")
+        if not property_search_service:
+            raise ValueError("Property search service not available")
+        
+        # Invalid searches get an error in their slot; the rest run as one batch
+        from ...search_service.models import SearchError
+        results: List[Optional[Dict[str, Any]]] = [None] * len(searches)
+        requests = []
+        positions = []
+        for position, search in enumerate(searches):
+            try:
+                requests.append(build_property_search_request(**search))
+                positions.append(position)
+            except Exception as e:
+                error = SearchError(
+                    error_type="INVALID_REQUEST",
+                    message=str(e),
+                    details={"search": search}
+                )
+                results[position] = {"error": error.model_dump()}
+        
+        batch_response = None
+        if requests:
+            batch_response = await run_blocking(property_search_service.search_batch, requests)
+            for position, result in zip(positions, batch_response.results):
+                if isinstance(result, SearchError):
+                    results[position] = {"error": result.model_dump()}
+                else:
+                    results[position] = result.model_dump()
+        
+        return {
+            "results": results,
+            "total_requests": len(searches),
+            "failed_requests": sum(1 for result in results if "error" in result),
+            "execution_time_ms": batch_response.execution_time_ms if batch_response else 0
+        }
+        
+    except Exception as e:
+        logger.error(f"Batch property search failed: {e}")
+        from ...search_service.models import SearchError
+        error = SearchError(
+            error_type="SEARCH_FAILED",
+            message=str(e),
+            details={"search_count": len(searches)}
+        )
+        return {"error": error.model_dump()}
+
+
 async def get_property_details(
     context: Context,
     listing_id: str
@@ -111,14 +235,15 @@ async def get_property_details(
     
     try:
         # Get services from context
-        es_client = context.get("es_client")
+        es_client = context.get("async_es_client") or context.get("es_client")
         config = context.get("config")
         
         if not es_client or not config:
             raise ValueError("Required services not available")
         
         # Get property document
-        property_doc = es_client.get_document(
+        property_doc = await run_blocking(
+            es_client.get_document,
             index=IndexName.PROPERTIES,
             doc_id=listing_id
         )
@@ -169,14 +294,15 @@ async def get_rich_property_details(
     
     try:
         # Get services from context
-        es_client = context.get("es_client")
+        es_client = context.get("async_es_client") or context.get("es_client")
         config = context.get("config")
         
         if not es_client or not config:
             raise ValueError("Required services not available")
         
         # Get property document
-        property_doc = es_client.get_document(
+        property_doc = await run_blocking(
+            es_client.get_document,
             index=IndexName.PROPERTIES,
             doc_id=listing_id
         )
@@ -196,7 +322,8 @@ async def get_rich_property_details(
         
         # Add neighborhood data if requested
         if include_neighborhood and property_doc.get("neighborhood_id"):
-            neighborhood_doc = es_client.get_document(
+            neighborhood_doc = await run_blocking(
+                es_client.get_document,
                 index=IndexName.NEIGHBORHOODS,
                 doc_id=property_doc["neighborhood_id"]
             )
@@ -207,18 +334,17 @@ async def get_rich_property_details(
         if include_wikipedia:
             # Get city from property for Wikipedia search
             city = property_doc.get("address", {}).get("city")
-            if city:
+            wiki_service = context.get("wikipedia_search_service")
+            if city and wiki_service:
                 # Search for related Wikipedia articles
-                from ...search_service.wikipedia import WikipediaSearchService
                 from ...search_service.models import WikipediaSearchRequest, WikipediaSearchType
                 
-                wiki_service = WikipediaSearchService(es_client.client)
                 wiki_request = WikipediaSearchRequest(
                     query=f"{city} {property_doc.get('neighborhood_name', '')}",
                     search_type=WikipediaSearchType.FULL_TEXT,
                     size=wikipedia_limit
                 )
-                wiki_response = wiki_service.search(wiki_request)
+                wiki_response = await run_blocking(wiki_service.search, wiki_request)
                 
                 if wiki_response.results:
                     wikipedia_articles = []
@@ -6,6 +6,7 @@ from fastmcp import Context
 from ...search_service.models import WikipediaSearchRequest, WikipediaSearchType
 from ...search_service.wikipedia import WikipediaSearchService
 from ..utils.logging import get_request_logger
+from ..utils.executor import run_blocking
 
 
 async def search_wikipedia(
@@ -66,7 +67,7 @@ async def search_wikipedia(
         )
         
         # Execute search
-        response = wikipedia_search_service.search(request)
+        response = await run_blocking(wikipedia_search_service.search, request)
         
         # Return search_service response directly as dict
         return response.model_dump()
@@ -100,14 +101,15 @@ async def get_wikipedia_article(
     
     try:
         # Get services from context
-        es_client = context.get("es_client")
+        es_client = context.get("async_es_client") or context.get("es_client")
         config = context.get("config")
         
         if not es_client or not config:
             raise ValueError("Required services not available")
         
         # Try to get from main Wikipedia index
-        article_doc = es_client.get_document(
+        article_doc = await run_blocking(
+            es_client.get_document,
             index="wikipedia",
             doc_id=page_id
         )
@@ -204,7 +206,7 @@ async def search_wikipedia_by_location(
         )
         
         # Execute search
-        response = wikipedia_search_service.search(request)
+        response = await run_blocking(wikipedia_search_service.search, request)
         
         # Format response focusing on location relevance
         articles = []
@@ -12,6 +12,7 @@ class ToolContext:
     # Services
     config: Any
     es_client: Optional[Any] = None
+    async_es_client: Optional[Any] = None
     embedding_service: Optional[Any] = None
     property_search_service: Optional[Any] = None
     wikipedia_search_service: Optional[Any] = None
@@ -43,6 +44,7 @@ class ToolContext:
         return {
             "config": self.config,
             "es_client": self.es_client,
+            "async_es_client": self.async_es_client,
             "embedding_service": self.embedding_service,
             "property_search_service": self.property_search_service,
             "wikipedia_search_service": self.wikipedia_search_service,
@@ -65,10 +67,11 @@ class ToolContext:
         return cls(
             config=server.config,
             es_client=server.es_client,
+            async_es_client=server.async_es_client,
             embedding_service=server.embedding_service,
             property_search_service=server.property_search_service,
             wikipedia_search_service=server.wikipedia_search_service,
             neighborhood_search_service=server.neighborhood_search_service,
             health_check_service=server.health_check_service,
-            hybrid_search_engine=None  # Not initialized by server, created on demand
+            hybrid_search_engine=server.hybrid_search_engine
         )
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""Bounded thread pool for blocking work called from async MCP tools."""
+
+import asyncio
+import functools
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def configure_blocking_executor(max_workers: int = DEFAULT_MAX_WORKERS) -> ThreadPoolExecutor:
+    """Create the process-wide executor for blocking calls.
+
+    Args:
+        max_workers: Blocking calls allowed to run at once; more wait in the queue
+
+    Returns:
+        The executor
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-blocking")
+        logger.info(f"Blocking executor configured with {max_workers} workers")
+        return _executor
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """Get the executor, creating a default one on first use.
+
+    Returns:
+        The process-wide executor
+    """
+    with _executor_lock:
+        executor = _executor
+    return executor or configure_blocking_executor()
+
+
+def shutdown_blocking_executor() -> None:
+    """Shut down the executor, waiting for running calls."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call a service method without blocking the event loop.
+
+    Coroutine functions (async services) are awaited directly. Anything
+    synchronous runs on the bounded executor, so one slow call only holds
+    a worker thread, not the whole server.
+
+    Args:
+        func: Service method to call
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        The method's result
+    """
+    if inspect.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_blocking_executor(), functools.partial(func, *args, **kwargs))
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+"""Benchmark search_properties_hybrid tool latency under concurrent clients.
+
+Compares the two ways the tool can get its HybridSearchEngine:
+
+- per_request: a new engine for every call (AppConfig.load(), embedding
+  service, DSPy module and builders each time), as the tool used to do
+- shared: the single engine MCPServer builds in _initialize_services
+
+Clients are coroutines on one event loop calling the tool the way FastMCP
+does. Needs Elasticsearch and the API keys the MCP server uses.
+
+Usage:
+    python -m real_estate_search.scripts.benchmark_hybrid_tool
+    python -m real_estate_search.scripts.benchmark_hybrid_tool --clients 16 --requests 400 --mode shared
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from real_estate_search.hybrid import HybridSearchEngine
+from real_estate_search.mcp_server.main import MCPServer
+from real_estate_search.mcp_server.tools.hybrid_search_tool import search_properties_hybrid
+from real_estate_search.mcp_server.utils.context import ToolContext
+
+
+DEFAULT_QUERIES = [
+    "modern home with a pool in San Francisco",
+    "family home near good schools in Oakland",
+    "condo with mountain views in Park City",
+    "3 bedroom house with a big backyard",
+    "luxury penthouse with city views",
+    "starter home under 800k in Salinas California",
+    "ski-in ski-out cabin in Utah",
+    "updated kitchen and hardwood floors",
+]
+
+
+class ToolLatencyReport(BaseModel):
+    """Latency of one benchmark mode."""
+    mode: str = Field(..., description="per_request or shared")
+    clients: int = Field(..., description="Concurrent clients")
+    requests: int = Field(..., description="Tool calls made")
+    errors: int = Field(0, description="Calls that returned an error")
+    p50_ms: float = Field(0.0, description="Median tool latency")
+    p99_ms: float = Field(0.0, description="99th percentile tool latency")
+    throughput: float = Field(0.0, description="Calls per second")
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of latency samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run_mode(
+    server: MCPServer,
+    mode: str,
+    queries: List[str],
+    clients: int,
+    requests: int
+) -> ToolLatencyReport:
+    """Run one mode with concurrent clients.
+
+    Args:
+        server: MCPServer with initialized services
+        mode: per_request or shared
+        queries: Queries cycled through by the clients
+        clients: Concurrent clients
+        requests: Total tool calls
+
+    Returns:
+        Latency report for the mode
+    """
+    pending = asyncio.Queue()
+    for i in range(requests):
+        pending.put_nowait(queries[i % len(queries)])
+
+    latencies_ms: List[float] = []
+    errors = 0
+
+    async def client():
+        nonlocal errors
+        while not pending.empty():
+            query = pending.get_nowait()
+            start = time.perf_counter()
+            context = ToolContext.from_server(server)
+            if mode == "per_request":
+                context.hybrid_search_engine = HybridSearchEngine(server.es_client.client, None)
+            result = await search_properties_hybrid(context, query=query, size=10)
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+            if "error" in result:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    return ToolLatencyReport(
+        mode=mode,
+        clients=clients,
+        requests=requests,
+        errors=errors,
+        p50_ms=percentile(latencies_ms, 0.50),
+        p99_ms=percentile(latencies_ms, 0.99),
+        throughput=requests / elapsed if elapsed > 0 else 0.0
+    )
+
+
+def format_reports(reports: List[ToolLatencyReport]) -> str:
+    """Format reports as a table."""
+    lines = [
+        f"{'mode':<12} {'clients':>7} {'requests':>8} {'errors':>6} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>7}",
+        "-" * 64
+    ]
+    for report in reports:
+        lines.append(
+            f"{report.mode:<12} {report.clients:>7} {report.requests:>8} {report.errors:>6} "
+            f"{report.p50_ms:>9.1f} {report.p99_ms:>9.1f} {report.throughput:>7.1f}"
+        )
+    return "\n".join(lines)
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the hybrid search MCP tool")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="Tool calls per mode")
+    parser.add_argument(
+        "--mode",
+        choices=["per_request", "shared", "both"],
+        default="both",
+        help="Engine lifetime to benchmark"
+    )
+    parser.add_argument("--config", type=Path, default=None, help="MCP server config file")
+    return parser.parse_args()
+
+
+def main(args: Optional[argparse.Namespace] = None) -> None:
+    """Run the benchmark and print the latency table."""
+    args = args or parse_arguments()
+    server = MCPServer(args.config)
+    server._initialize_services()
+
+    modes = ["per_request", "shared"] if args.mode == "both" else [args.mode]
+    reports = []
+    for mode in modes:
+        # One warm-up call so both modes start with a loaded gazetteer and client
+        asyncio.run(run_mode(server, mode, DEFAULT_QUERIES, 1, 1))
+        reports.append(asyncio.run(run_mode(server, mode, DEFAULT_QUERIES, args.clients, args.requests)))
+
+    print(format_reports(reports))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,14 @@ This module provides a clean service layer for searching properties,
 neighborhoods, and Wikipedia articles using Elasticsearch.
 """
 
-from .base import BaseSearchService
-from .properties import PropertySearchService
-from .wikipedia import WikipediaSearchService
-from .neighborhoods import NeighborhoodSearchService
+from .base import AsyncSearchMixin, BaseSearchService
+from .properties import AsyncPropertySearchService, PropertySearchService
+from .wikipedia import AsyncWikipediaSearchService, WikipediaSearchService
+from .neighborhoods import AsyncNeighborhoodSearchService, NeighborhoodSearchService
 from .models import (
     PropertySearchRequest,
     PropertySearchResponse,
+    PropertyBatchSearchResponse,
     PropertyFilter,
     PropertyType,
     GeoLocation,
@@ -31,8 +32,13 @@ __all__ = [
     'PropertySearchService',
     'WikipediaSearchService',
     'NeighborhoodSearchService',
+    'AsyncSearchMixin',
+    'AsyncPropertySearchService',
+    'AsyncWikipediaSearchService',
+    'AsyncNeighborhoodSearchService',
     'PropertySearchRequest',
     'PropertySearchResponse',
+    'PropertyBatchSearchResponse',
     'PropertyFilter',
     'PropertyType',
     'GeoLocation',
@@ -3,14 +3,17 @@ Base search service class for all entity-specific search services.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, Elasticsearch
 from elasticsearch.exceptions import TransportError
 from .models import SearchError
 
 logger = logging.getLogger(__name__)
 
+# Searches sent per _msearch request by multi_search_batched
+DEFAULT_MSEARCH_BATCH_SIZE = 25
+
 
 class BaseSearchService:
     """
@@ -63,19 +66,7 @@ class BaseSearchService:
                 from_=from_offset
             )
             
-            execution_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-            
-            # Create a new dict with the response body and add execution time
-            # ObjectApiResponse is immutable, so we need to create a new dict
-            response = dict(es_response.body)
-            response['execution_time_ms'] = execution_time_ms
-            
-            self.logger.debug(
-                f"Search executed on index '{index}' in {execution_time_ms}ms, "
-                f"found {response['hits']['total']['value']} results"
-            )
-            
-            return response
+            return self._timed_response(es_response, index, start_time)
             
         except TransportError as e:
             self.logger.error(f"Elasticsearch error during search: {str(e)}")
@@ -84,6 +75,32 @@ class BaseSearchService:
             self.logger.error(f"Unexpected error during search: {str(e)}")
             raise TransportError(f"Search failed: {str(e)}")
     
+    def _timed_response(self, es_response: Any, index: str, start_time: datetime) -> Dict[str, Any]:
+        """
+        Copy a search response and add its execution time.
+        
+        Args:
+            es_response: Elasticsearch response
+            index: Index that was searched
+            start_time: When the search was sent
+            
+        Returns:
+            Response dict with execution_time_ms
+        """
+        execution_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        
+        # Create a new dict with the response body and add execution time
+        # ObjectApiResponse is immutable, so we need to create a new dict
+        response = dict(es_response.body)
+        response['execution_time_ms'] = execution_time_ms
+        
+        self.logger.debug(
+            f"Search executed on index '{index}' in {execution_time_ms}ms, "
+            f"found {response['hits']['total']['value']} results"
+        )
+        
+        return response
+    
     def get_document(
         self,
         index: str,
@@ -128,10 +145,7 @@ class BaseSearchService:
             List of search responses
         """
         try:
-            body = []
-            for index, query in searches:
-                body.append({"index": index})
-                body.append(query)
+            body = self._msearch_body(searches)
             
             # msearch still uses body parameter
             response = self.es_client.msearch(body=body)
@@ -142,6 +156,85 @@ class BaseSearchService:
             self.logger.error(f"Multi-search failed: {str(e)}")
             raise TransportError(f"Multi-search failed: {str(e)}")
     
+    def multi_search_batched(
+        self,
+        searches: List[tuple[str, Dict[str, Any]]],
+        batch_size: int = DEFAULT_MSEARCH_BATCH_SIZE
+    ) -> List[Union[Dict[str, Any], SearchError]]:
+        """
+        Execute many searches as _msearch requests of at most batch_size.
+        
+        A failed search does not fail the batch: its slot holds a
+        SearchError, and a failed _msearch request fills every slot
+        of its chunk.
+        
+        Args:
+            searches: List of (index, query) tuples
+            batch_size: Maximum searches per _msearch request
+            
+        Returns:
+            One response or SearchError per search, in input order
+        """
+        results: List[Union[Dict[str, Any], SearchError]] = []
+        for start in range(0, len(searches), batch_size):
+            chunk = searches[start:start + batch_size]
+            try:
+                responses = self.multi_search(chunk)
+            except Exception as e:
+                error = self.handle_search_error(e, "Multi-search request failed")
+                results.extend([error] * len(chunk))
+                continue
+            results.extend(self._msearch_items(responses, len(chunk)))
+        return results
+    
+    def _msearch_items(
+        self,
+        responses: List[Dict[str, Any]],
+        expected: int
+    ) -> List[Union[Dict[str, Any], SearchError]]:
+        """
+        Split msearch responses into results and per-search errors.
+        
+        Args:
+            responses: The "responses" list of an msearch response
+            expected: Number of searches that were sent
+            
+        Returns:
+            One response or SearchError per search
+        """
+        items: List[Union[Dict[str, Any], SearchError]] = []
+        for position in range(expected):
+            response = responses[position] if position < len(responses) else None
+            if response is None:
+                items.append(SearchError(
+                    error_type="MissingResponse",
+                    message="Multi-search returned no response for this search"
+                ))
+            elif "error" in response:
+                error = response["error"]
+                if isinstance(error, dict):
+                    error_type = error.get("type", "SearchError")
+                    message = error.get("reason", str(error))
+                else:
+                    error_type, message = "SearchError", str(error)
+                items.append(SearchError(
+                    error_type=error_type,
+                    message=message,
+                    details={"status": response.get("status")}
+                ))
+            else:
+                items.append(response)
+        return items
+    
+    @staticmethod
+    def _msearch_body(searches: List[tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Interleave header and query lines for msearch."""
+        body = []
+        for index, query in searches:
+            body.append({"index": index})
+            body.append(query)
+        return body
+    
     def validate_index_exists(self, index: str) -> bool:
         """
         Check if an index exists.
@@ -217,4 +310,153 @@ class BaseSearchService:
         
         # Elasticsearch 7+ always returns total as dict with 'value' field
         # We directly access it without type checking
-        return total.get("value", 0) if total else 0
\ No newline at end of file
+        return total.get("value", 0) if total else 0
+
+
+class AsyncSearchMixin:
+    """
+    Async Elasticsearch I/O for search services.
+    
+    Mixed in ahead of a sync service (``class AsyncPropertySearchService(
+    AsyncSearchMixin, PropertySearchService)``) so query building and
+    response transformation are shared and only the calls that touch
+    Elasticsearch are awaited. The I/O methods keep their names, so
+    services override ``search`` and other I/O paths as coroutines.
+    """
+    
+    es_client: AsyncElasticsearch
+    
+    async def execute_search(
+        self,
+        index: str,
+        query: Dict[str, Any],
+        size: int = 10,
+        from_offset: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Execute a search query against Elasticsearch without blocking.
+        
+        Args:
+            index: Index name to search
+            query: Elasticsearch query DSL
+            size: Number of results to return
+            from_offset: Pagination offset
+            
+        Returns:
+            Raw Elasticsearch response
+            
+        Raises:
+            TransportError: If search fails
+        """
+        try:
+            start_time = datetime.now()
+            es_response = await self.es_client.search(
+                index=index,
+                **query,
+                size=size,
+                from_=from_offset
+            )
+            return self._timed_response(es_response, index, start_time)
+            
+        except TransportError as e:
+            self.logger.error(f"Elasticsearch error during search: {str(e)}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Unexpected error during search: {str(e)}")
+            raise TransportError(f"Search failed: {str(e)}")
+    
+    async def get_document(
+        self,
+        index: str,
+        doc_id: str,
+        source_fields: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a single document by ID without blocking.
+        
+        Args:
+            index: Index name
+            doc_id: Document ID
+            source_fields: Fields to include in response
+            
+        Returns:
+            Document source or None if not found
+        """
+        try:
+            params = {"index": index, "id": doc_id}
+            if source_fields:
+                params["_source"] = source_fields
+            
+            response = await self.es_client.get(**params)
+            return response.get("_source")
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to get document {doc_id} from {index}: {str(e)}")
+            return None
+    
+    async def multi_search(
+        self,
+        searches: List[tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute multiple searches in a single request without blocking.
+        
+        Args:
+            searches: List of (index, query) tuples
+            
+        Returns:
+            List of search responses
+        """
+        try:
+            response = await self.es_client.msearch(body=self._msearch_body(searches))
+            return response.get("responses", [])
+            
+        except Exception as e:
+            self.logger.error(f"Multi-search failed: {str(e)}")
+            raise TransportError(f"Multi-search failed: {str(e)}")
+    
+    async def multi_search_batched(
+        self,
+        searches: List[tuple[str, Dict[str, Any]]],
+        batch_size: int = DEFAULT_MSEARCH_BATCH_SIZE
+    ) -> List[Union[Dict[str, Any], SearchError]]:
+        """
+        Execute many searches as _msearch requests of at most batch_size.
+        
+        Chunks are sent one after another, as in the sync service, so a
+        large batch does not open a burst of concurrent requests.
+        
+        Args:
+            searches: List of (index, query) tuples
+            batch_size: Maximum searches per _msearch request
+            
+        Returns:
+            One response or SearchError per search, in input order
+        """
+        results: List[Union[Dict[str, Any], SearchError]] = []
+        for start in range(0, len(searches), batch_size):
+            chunk = searches[start:start + batch_size]
+            try:
+                responses = await self.multi_search(chunk)
+            except Exception as e:
+                error = self.handle_search_error(e, "Multi-search request failed")
+                results.extend([error] * len(chunk))
+                continue
+            results.extend(self._msearch_items(responses, len(chunk)))
+        return results
+    
+    async def validate_index_exists(self, index: str) -> bool:
+        """
+        Check if an index exists without blocking.
+        
+        Args:
+            index: Index name
+            
+        Returns:
+            True if index exists, False otherwise
+        """
+        try:
+            return bool(await self.es_client.indices.exists(index=index))
+        except Exception as e:
+            self.logger.error(f"Failed to check index existence: {str(e)}")
+            return False
@@ -2,7 +2,7 @@
 Pydantic models for search service requests and responses.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from pydantic import BaseModel, Field, ConfigDict
 from enum import Enum
 
@@ -63,6 +63,10 @@ class PropertySearchRequest(BaseModel):
     size: int = Field(default=10, ge=1, le=100, description="Number of results to return")
     from_offset: int = Field(default=0, ge=0, description="Pagination offset")
     include_highlights: bool = Field(default=False, description="Include highlighted snippets")
+    semantic: bool = Field(
+        default=False,
+        description="Also match on the query embedding (needs an embedding service)"
+    )
 
 
 class PropertyAddress(BaseModel):
@@ -111,6 +115,17 @@ class PropertySearchResponse(BaseModel):
     aggregations: Optional[PropertyAggregation] = Field(default=None, description="Aggregation results")
 
 
+class PropertyBatchSearchResponse(BaseModel):
+    """Response model for a batch of property searches."""
+    
+    results: List[Union[PropertySearchResponse, SearchError]] = Field(
+        description="One response or error per request, in request order"
+    )
+    total_requests: int = Field(description="Number of requests in the batch")
+    failed_requests: int = Field(description="Number of requests that returned an error")
+    execution_time_ms: int = Field(description="Batch execution time in milliseconds")
+
+
 class NeighborhoodSearchRequest(BaseModel):
     """Request model for neighborhood search."""
     
@@ -2,11 +2,12 @@
 Neighborhood search service implementation.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, Elasticsearch
 
-from .base import BaseSearchService
+from .base import AsyncSearchMixin, BaseSearchService
 from .models import (
     NeighborhoodSearchRequest,
     NeighborhoodSearchResponse,
@@ -277,10 +278,33 @@ class NeighborhoodSearchService(BaseSearchService):
         if not response.results:
             return response
         
-        # Get the first neighborhood for statistics
-        neighborhood = response.results[0]
+        try:
+            prop_response = self.es_client.search(
+                index=self.properties_index,
+                body=self._related_properties_query(response.results[0], request)
+            )
+            self._apply_related_properties(response, request, prop_response)
         
-        # Build property search query
+        except Exception as e:
+            logger.warning(f"Failed to get related property data: {str(e)}")
+        
+        return response
+    
+    def _related_properties_query(
+        self,
+        neighborhood: NeighborhoodResult,
+        request: NeighborhoodSearchRequest
+    ) -> Dict[str, Any]:
+        """
+        Build the property query for related properties and statistics.
+        
+        Args:
+            neighborhood: Neighborhood to find properties for
+            request: Original search request
+            
+        Returns:
+            Elasticsearch query body
+        """
         property_query = {
             "query": {
                 "bool": {
@@ -306,49 +330,54 @@ class NeighborhoodSearchService(BaseSearchService):
                 }
             }
         
-        try:
-            prop_response = self.es_client.search(
-                index=self.properties_index,
-                body=property_query
-            )
-            
-            # Add statistics if requested
-            if request.include_statistics and "aggregations" in prop_response:
-                aggs = prop_response["aggregations"]
-                
-                property_types = {}
-                if "property_types" in aggs and "buckets" in aggs["property_types"]:
-                    for bucket in aggs["property_types"]["buckets"]:
-                        property_types[bucket["key"]] = bucket["doc_count"]
-                
-                response.statistics = NeighborhoodStatistics(
-                    total_properties=int(aggs.get("total_properties", {}).get("value", 0)),
-                    avg_price=float(aggs.get("avg_price", {}).get("value", 0)),
-                    avg_bedrooms=float(aggs.get("avg_bedrooms", {}).get("value", 0)),
-                    avg_square_feet=float(aggs.get("avg_square_feet", {}).get("value", 0)),
-                    property_types=property_types
-                )
-            
-            # Add related properties if requested
-            if request.include_related_properties:
-                related_properties = []
-                for hit in prop_response.get("hits", {}).get("hits", []):
-                    source = hit["_source"]
-                    address = source.get("address", {})
-                    
-                    related_properties.append(RelatedProperty(
-                        listing_id=source.get("listing_id", ""),
-                        address=f"{address.get('street', '')}, {address.get('city', '')}",
-                        price=float(source.get("price", 0)),
-                        property_type=source.get("property_type", "")
-                    ))
-                
-                response.related_properties = related_properties
+        return property_query
+    
+    def _apply_related_properties(
+        self,
+        response: NeighborhoodSearchResponse,
+        request: NeighborhoodSearchRequest,
+        prop_response: Dict[str, Any]
+    ) -> None:
+        """
+        Set statistics and related properties from the property query response.
         
-        except Exception as e:
-            logger.warning(f"Failed to get related property data: {str(e)}")
+        Args:
+            response: Neighborhood response to update
+            request: Original search request
+            prop_response: Response to the related properties query
+        """
+        # Add statistics if requested
+        if request.include_statistics and "aggregations" in prop_response:
+            aggs = prop_response["aggregations"]
+            
+            property_types = {}
+            if "property_types" in aggs and "buckets" in aggs["property_types"]:
+                for bucket in aggs["property_types"]["buckets"]:
+                    property_types[bucket["key"]] = bucket["doc_count"]
+            
+            response.statistics = NeighborhoodStatistics(
+                total_properties=int(aggs.get("total_properties", {}).get("value", 0)),
+                avg_price=float(aggs.get("avg_price", {}).get("value", 0)),
+                avg_bedrooms=float(aggs.get("avg_bedrooms", {}).get("value", 0)),
+                avg_square_feet=float(aggs.get("avg_square_feet", {}).get("value", 0)),
+                property_types=property_types
+            )
         
-        return response
+        # Add related properties if requested
+        if request.include_related_properties:
+            related_properties = []
+            for hit in prop_response.get("hits", {}).get("hits", []):
+                source = hit["_source"]
+                address = source.get("address", {})
+                
+                related_properties.append(RelatedProperty(
+                    listing_id=source.get("listing_id", ""),
+                    address=f"{address.get('street', '')}, {address.get('city', '')}",
+                    price=float(source.get("price", 0)),
+                    property_type=source.get("property_type", "")
+                ))
+            
+            response.related_properties = related_properties
     
     def _add_related_wikipedia(
         self,
@@ -368,10 +397,29 @@ class NeighborhoodSearchService(BaseSearchService):
         if not response.results or not request.include_related_wikipedia:
             return response
         
-        neighborhood = response.results[0]
+        try:
+            wiki_response = self.es_client.search(
+                index=self.wikipedia_index,
+                body=self._related_wikipedia_query(response.results[0])
+            )
+            self._apply_related_wikipedia(response, wiki_response)
         
-        # Search for related Wikipedia articles
-        wiki_query = {
+        except Exception as e:
+            logger.warning(f"Failed to get related Wikipedia articles: {str(e)}")
+        
+        return response
+    
+    def _related_wikipedia_query(self, neighborhood: NeighborhoodResult) -> Dict[str, Any]:
+        """
+        Build the Wikipedia query for articles related to a neighborhood.
+        
+        Args:
+            neighborhood: Neighborhood to find articles for
+            
+        Returns:
+            Elasticsearch query body
+        """
+        return {
             "query": {
                 "bool": {
                     "must": [
@@ -386,30 +434,31 @@ class NeighborhoodSearchService(BaseSearchService):
             "size": 5,
             "_source": ["page_id", "title", "summary"]
         }
+    
+    def _apply_related_wikipedia(
+        self,
+        response: NeighborhoodSearchResponse,
+        wiki_response: Dict[str, Any]
+    ) -> None:
+        """
+        Set related Wikipedia articles from the Wikipedia query response.
         
-        try:
-            wiki_response = self.es_client.search(
-                index=self.wikipedia_index,
-                body=wiki_query
-            )
-            
-            related_wikipedia = []
-            for hit in wiki_response.get("hits", {}).get("hits", []):
-                source = hit["_source"]
-                
-                related_wikipedia.append(RelatedWikipediaArticle(
-                    page_id=source.get("page_id", ""),
-                    title=source.get("title", ""),
-                    summary=source.get("summary", "")[:200],
-                    relevance_score=hit.get("_score", 0)
-                ))
+        Args:
+            response: Neighborhood response to update
+            wiki_response: Response to the related Wikipedia query
+        """
+        related_wikipedia = []
+        for hit in wiki_response.get("hits", {}).get("hits", []):
+            source = hit["_source"]
             
-            response.related_wikipedia = related_wikipedia
-        
-        except Exception as e:
-            logger.warning(f"Failed to get related Wikipedia articles: {str(e)}")
-        
-        return response
+            related_wikipedia.append(RelatedWikipediaArticle(
+                page_id=source.get("page_id", ""),
+                title=source.get("title", ""),
+                summary=source.get("summary", "")[:200],
+                relevance_score=hit.get("_score", 0)
+            ))
+        
+        response.related_wikipedia = related_wikipedia
     
     def _extract_city(self, source: Dict[str, Any]) -> Optional[str]:
         """
@@ -446,4 +495,117 @@ class NeighborhoodSearchService(BaseSearchService):
         if any(term in content for term in ["California", "CA", "San Francisco Bay Area"]):
             return "California"
         
-        return None
\ No newline at end of file
+        return None
+
+
+class AsyncNeighborhoodSearchService(AsyncSearchMixin, NeighborhoodSearchService):
+    """
+    Neighborhood search service on the async Elasticsearch client.
+    
+    Builds the same queries and responses as NeighborhoodSearchService;
+    search methods are coroutines, and the related properties and
+    Wikipedia lookups run concurrently.
+    """
+    
+    def __init__(self, es_client: AsyncElasticsearch):
+        """
+        Initialize the async neighborhood search service.
+        
+        Args:
+            es_client: AsyncElasticsearch client instance
+        """
+        super().__init__(es_client)
+    
+    async def search(self, request: NeighborhoodSearchRequest) -> NeighborhoodSearchResponse:
+        """
+        Main search method for neighborhoods.
+        
+        Args:
+            request: Neighborhood search request
+            
+        Returns:
+            Neighborhood search response
+        """
+        try:
+            es_response = await self.execute_search(
+                index=self.wikipedia_index,
+                query=self._build_query(request),
+                size=request.size,
+                from_offset=0
+            )
+            
+            response = self._transform_response(es_response, request)
+            
+            lookups = []
+            if request.include_statistics or request.include_related_properties:
+                lookups.append(self._add_related_data(response, request))
+            if request.include_related_wikipedia:
+                lookups.append(self._add_related_wikipedia(response, request))
+            # Each lookup sets its own fields on the response
+            await asyncio.gather(*lookups)
+            
+            return response
+            
+        except Exception as e:
+            logger.error(f"Neighborhood search failed: {str(e)}")
+            raise
+    
+    async def _add_related_data(
+        self,
+        response: NeighborhoodSearchResponse,
+        request: NeighborhoodSearchRequest
+    ) -> NeighborhoodSearchResponse:
+        """
+        Add related property data and statistics to response.
+        
+        Args:
+            response: Base neighborhood response
+            request: Original search request
+            
+        Returns:
+            Response with added related data
+        """
+        if not response.results:
+            return response
+        
+        try:
+            prop_response = await self.es_client.search(
+                index=self.properties_index,
+                body=self._related_properties_query(response.results[0], request)
+            )
+            self._apply_related_properties(response, request, prop_response)
+        
+        except Exception as e:
+            logger.warning(f"Failed to get related property data: {str(e)}")
+        
+        return response
+    
+    async def _add_related_wikipedia(
+        self,
+        response: NeighborhoodSearchResponse,
+        request: NeighborhoodSearchRequest
+    ) -> NeighborhoodSearchResponse:
+        """
+        Add related Wikipedia articles to response.
+        
+        Args:
+            response: Base neighborhood response
+            request: Original search request
+            
+        Returns:
+            Response with added Wikipedia articles
+        """
+        if not response.results or not request.include_related_wikipedia:
+            return response
+        
+        try:
+            wiki_response = await self.es_client.search(
+                index=self.wikipedia_index,
+                body=self._related_wikipedia_query(response.results[0])
+            )
+            self._apply_related_wikipedia(response, wiki_response)
+        
+        except Exception as e:
+            logger.warning(f"Failed to get related Wikipedia articles: {str(e)}")
+        
+        return response
@@ -2,20 +2,27 @@
 Property search service implementation.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
-from elasticsearch import Elasticsearch
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union
+from elasticsearch import AsyncElasticsearch, Elasticsearch
 
-from .base import BaseSearchService
+from .base import DEFAULT_MSEARCH_BATCH_SIZE, AsyncSearchMixin, BaseSearchService
 from .models import (
     PropertySearchRequest,
     PropertySearchResponse,
+    PropertyBatchSearchResponse,
+    SearchError,
     PropertyResult,
     PropertyAddress,
     PropertyFilter,
     GeoLocation
 )
 
+if TYPE_CHECKING:
+    from ..embeddings import QueryEmbeddingService
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,15 +34,22 @@ class PropertySearchService(BaseSearchService):
     filtered search, geo-distance search, and semantic similarity search.
     """
     
-    def __init__(self, es_client: Elasticsearch):
+    def __init__(
+        self,
+        es_client: Elasticsearch,
+        embedding_service: Optional["QueryEmbeddingService"] = None
+    ):
         """
         Initialize the property search service.
         
         Args:
             es_client: Elasticsearch client instance
+            embedding_service: Initialized query embedding service; requests
+                with semantic=True also run a kNN search on the query embedding
         """
         super().__init__(es_client)
         self.index_name = "properties"
+        self.embedding_service = embedding_service
     
     def search(self, request: PropertySearchRequest) -> PropertySearchResponse:
         """
@@ -49,7 +63,10 @@ class PropertySearchService(BaseSearchService):
         """
         try:
             # Build query based on request parameters
-            query = self._build_query(request)
+            reference_embedding = None
+            if request.reference_property_id:
+                reference_embedding = self._get_reference_embedding(request.reference_property_id)
+            query = self._build_query(request, reference_embedding, self._get_query_embedding(request))
             
             # Execute search
             es_response = self.execute_search(
@@ -66,6 +83,38 @@ class PropertySearchService(BaseSearchService):
             logger.error(f"Property search failed: {str(e)}")
             raise
     
+    def search_batch(
+        self,
+        requests: List[PropertySearchRequest],
+        batch_size: int = DEFAULT_MSEARCH_BATCH_SIZE
+    ) -> PropertyBatchSearchResponse:
+        """
+        Run many property searches with one embedding call and few round trips.
+        
+        Query texts of semantic requests are embedded in a single provider
+        call, every query is built up front, and the searches go out as
+        _msearch requests of at most batch_size. A failing search yields a
+        SearchError in its slot without failing the rest of the batch.
+        
+        Args:
+            requests: Property search requests
+            batch_size: Maximum searches per _msearch request
+            
+        Returns:
+            Batch response with one result per request, in request order
+        """
+        start_time = datetime.now()
+        query_embeddings = self._embed_batch_queries(requests)
+        reference_embeddings = {
+            reference_id: self._get_reference_embedding(reference_id)
+            for reference_id in self._batch_reference_ids(requests)
+        }
+        results, searches, positions = self._plan_batch(
+            requests, query_embeddings, reference_embeddings
+        )
+        responses = self.multi_search_batched(searches, batch_size) if searches else []
+        return self._collect_batch(requests, results, positions, responses, start_time)
+    
     def search_text(self, query_text: str, size: int = 10) -> PropertySearchResponse:
         """
         Perform basic text search across property fields.
@@ -154,27 +203,192 @@ class PropertySearchService(BaseSearchService):
             Property search response
         """
         # Get reference property embedding
+        if not self._get_reference_embedding(reference_property_id):
+            raise ValueError(f"Reference property {reference_property_id} not found or has no embedding")
+        
+        request = PropertySearchRequest(
+            reference_property_id=reference_property_id,
+            size=size
+        )
+        return self.search(request)
+    
+    def _get_reference_embedding(self, reference_property_id: str) -> Optional[List[float]]:
+        """
+        Get the embedding of a reference property.
+        
+        Args:
+            reference_property_id: ID of reference property
+            
+        Returns:
+            Embedding vector, or None if missing
+        """
         ref_property = self.get_document(
             index=self.index_name,
             doc_id=reference_property_id,
             source_fields=["embedding"]
         )
+        return ref_property.get("embedding") if ref_property else None
+    
+    def _uses_query_embedding(self, request: PropertySearchRequest) -> bool:
+        """
+        Check whether a request's query text is embedded for kNN search.
         
-        if not ref_property or "embedding" not in ref_property:
-            raise ValueError(f"Reference property {reference_property_id} not found or has no embedding")
+        Args:
+            request: Property search request
+            
+        Returns:
+            True for semantic text queries when an embedding service is configured
+        """
+        if not request.semantic or self.embedding_service is None:
+            return False
+        if not request.query or not request.query.strip():
+            return False
+        # Similarity and geo searches build their own queries
+        return not request.reference_property_id and not (request.geo_location and request.geo_distance_km)
+    
+    def _get_query_embedding(self, request: PropertySearchRequest) -> Optional[List[float]]:
+        """
+        Embed a request's query text.
         
-        request = PropertySearchRequest(
-            reference_property_id=reference_property_id,
-            size=size
+        Args:
+            request: Property search request
+            
+        Returns:
+            Query embedding, or None if the request is not embedded or
+            embedding failed (the search then runs on text alone)
+        """
+        if not self._uses_query_embedding(request):
+            return None
+        try:
+            self.embedding_service.initialize()
+            return self.embedding_service.embed_query(request.query)
+        except Exception as e:
+            logger.warning(f"Query embedding failed, searching on text only: {str(e)}")
+            return None
+    
+    def _embed_batch_queries(self, requests: List[PropertySearchRequest]) -> Dict[int, List[float]]:
+        """
+        Embed the query texts of a batch in one provider call.
+        
+        Args:
+            requests: Property search requests
+            
+        Returns:
+            Embeddings by request position; empty if embedding failed, in
+            which case the searches run on text alone
+        """
+        positions = [i for i, request in enumerate(requests) if self._uses_query_embedding(request)]
+        if not positions:
+            return {}
+        try:
+            self.embedding_service.initialize()
+            vectors = self.embedding_service.batch_embed_queries(
+                [requests[i].query.strip() for i in positions]
+            )
+        except Exception as e:
+            logger.warning(f"Batch query embedding failed, searching on text only: {str(e)}")
+            return {}
+        return dict(zip(positions, vectors))
+    
+    @staticmethod
+    def _batch_reference_ids(requests: List[PropertySearchRequest]) -> List[str]:
+        """Distinct reference property IDs of a batch, in first-seen order."""
+        return list(dict.fromkeys(
+            request.reference_property_id for request in requests if request.reference_property_id
+        ))
+    
+    def _plan_batch(
+        self,
+        requests: List[PropertySearchRequest],
+        query_embeddings: Dict[int, List[float]],
+        reference_embeddings: Dict[str, Optional[List[float]]]
+    ) -> Tuple[List[Optional[Union[PropertySearchResponse, SearchError]]], List[tuple[str, Dict[str, Any]]], List[int]]:
+        """
+        Build the msearch queries of a batch.
+        
+        Args:
+            requests: Property search requests
+            query_embeddings: Query embeddings by request position
+            reference_embeddings: Embeddings by reference property ID
+            
+        Returns:
+            Result slots with build errors filled in, the (index, query)
+            searches to send, and the request position of each search
+        """
+        results: List[Optional[Union[PropertySearchResponse, SearchError]]] = [None] * len(requests)
+        searches: List[tuple[str, Dict[str, Any]]] = []
+        positions: List[int] = []
+        
+        for position, request in enumerate(requests):
+            try:
+                query = self._build_query(
+                    request,
+                    reference_embeddings.get(request.reference_property_id),
+                    query_embeddings.get(position)
+                )
+            except Exception as e:
+                results[position] = self.handle_search_error(e, "Failed to build search query")
+                continue
+            # msearch takes paging in the body rather than as parameters
+            query["size"] = request.size
+            query["from"] = request.from_offset
+            searches.append((self.index_name, query))
+            positions.append(position)
+        
+        return results, searches, positions
+    
+    def _collect_batch(
+        self,
+        requests: List[PropertySearchRequest],
+        results: List[Optional[Union[PropertySearchResponse, SearchError]]],
+        positions: List[int],
+        responses: List[Union[Dict[str, Any], SearchError]],
+        start_time: datetime
+    ) -> PropertyBatchSearchResponse:
+        """
+        Map msearch responses back onto their requests.
+        
+        Args:
+            requests: Property search requests
+            results: Result slots from _plan_batch
+            positions: Request position of each search sent
+            responses: One response or SearchError per search sent
+            start_time: When the batch started
+            
+        Returns:
+            Batch response in request order
+        """
+        for position, response in zip(positions, responses):
+            if isinstance(response, SearchError):
+                results[position] = response
+                continue
+            try:
+                es_response = dict(response)
+                es_response["execution_time_ms"] = es_response.get("took", 0)
+                results[position] = self._transform_response(es_response, requests[position])
+            except Exception as e:
+                results[position] = self.handle_search_error(e, "Failed to read search response")
+        
+        return PropertyBatchSearchResponse(
+            results=results,
+            total_requests=len(requests),
+            failed_requests=sum(1 for result in results if isinstance(result, SearchError)),
+            execution_time_ms=int((datetime.now() - start_time).total_seconds() * 1000)
         )
-        return self.search(request)
     
-    def _build_query(self, request: PropertySearchRequest) -> Dict[str, Any]:
+    def _build_query(
+        self,
+        request: PropertySearchRequest,
+        reference_embedding: Optional[List[float]] = None,
+        query_embedding: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
         """
         Build Elasticsearch query from request parameters.
         
         Args:
             request: Property search request
+            reference_embedding: Embedding of request.reference_property_id, if any
+            query_embedding: Embedding of request.query, if any
             
         Returns:
             Elasticsearch query DSL
@@ -183,16 +397,10 @@ class PropertySearchService(BaseSearchService):
         
         # Semantic similarity search
         if request.reference_property_id:
-            ref_property = self.get_document(
-                index=self.index_name,
-                doc_id=request.reference_property_id,
-                source_fields=["embedding"]
-            )
-            
-            if ref_property and "embedding" in ref_property:
+            if reference_embedding:
                 query["knn"] = {
                     "field": "embedding",
-                    "query_vector": ref_property["embedding"],
+                    "query_vector": reference_embedding,
                     "k": request.size + 1,
                     "num_candidates": 100
                 }
@@ -316,6 +524,18 @@ class PropertySearchService(BaseSearchService):
                     bool_query["bool"]["filter"] = filters
             
             query["query"] = bool_query
+            
+            # Score text and vector matches together
+            if query_embedding:
+                k = request.size + request.from_offset
+                query["knn"] = {
+                    "field": "embedding",
+                    "query_vector": query_embedding,
+                    "k": k,
+                    "num_candidates": max(100, k * 2)
+                }
+                if bool_query["bool"].get("filter"):
+                    query["knn"]["filter"] = bool_query["bool"]["filter"]
         
         # Default to match all
         else:
@@ -418,4 +638,127 @@ class PropertySearchService(BaseSearchService):
             total_hits=self.calculate_total_hits(es_response),
             execution_time_ms=es_response.get("execution_time_ms", 0),
             applied_filters=request.filters
-        )
\ No newline at end of file
+        )
+
+class AsyncPropertySearchService(AsyncSearchMixin, PropertySearchService):
+    """
+    Property search service on the async Elasticsearch client.
+    
+    Builds the same queries and responses as PropertySearchService;
+    search methods are coroutines.
+    """
+    
+    def __init__(
+        self,
+        es_client: AsyncElasticsearch,
+        embedding_service: Optional["QueryEmbeddingService"] = None
+    ):
+        """
+        Initialize the async property search service.
+        
+        Args:
+            es_client: AsyncElasticsearch client instance
+            embedding_service: Initialized query embedding service
+        """
+        super().__init__(es_client, embedding_service)
+    
+    async def search(self, request: PropertySearchRequest) -> PropertySearchResponse:
+        """
+        Main search method that routes to appropriate search type.
+        
+        Args:
+            request: Property search request
+            
+        Returns:
+            Property search response
+        """
+        try:
+            reference_embedding = None
+            if request.reference_property_id:
+                reference_embedding = await self._get_reference_embedding(request.reference_property_id)
+            query_embedding = None
+            if self._uses_query_embedding(request):
+                # Embedding providers are sync-only
+                query_embedding = await asyncio.to_thread(self._get_query_embedding, request)
+            query = self._build_query(request, reference_embedding, query_embedding)
+            
+            es_response = await self.execute_search(
+                index=self.index_name,
+                query=query,
+                size=request.size,
+                from_offset=request.from_offset
+            )
+            
+            return self._transform_response(es_response, request)
+            
+        except Exception as e:
+            logger.error(f"Property search failed: {str(e)}")
+            raise
+    
+    async def search_batch(
+        self,
+        requests: List[PropertySearchRequest],
+        batch_size: int = DEFAULT_MSEARCH_BATCH_SIZE
+    ) -> PropertyBatchSearchResponse:
+        """
+        Run many property searches with one embedding call and few round trips.
+        
+        Args:
+            requests: Property search requests
+            batch_size: Maximum searches per _msearch request
+            
+        Returns:
+            Batch response with one result per request, in request order
+        """
+        start_time = datetime.now()
+        query_embeddings = await asyncio.to_thread(self._embed_batch_queries, requests)
+        reference_ids = self._batch_reference_ids(requests)
+        reference_vectors = await asyncio.gather(
+            *(self._get_reference_embedding(reference_id) for reference_id in reference_ids)
+        )
+        results, searches, positions = self._plan_batch(
+            requests, query_embeddings, dict(zip(reference_ids, reference_vectors))
+        )
+        responses = await self.multi_search_batched(searches, batch_size) if searches else []
+        return self._collect_batch(requests, results, positions, responses, start_time)
+    
+    async def search_similar(
+        self,
+        reference_property_id: str,
+        size: int = 10
+    ) -> PropertySearchResponse:
+        """
+        Find properties similar to a reference property using embeddings.
+        
+        Args:
+            reference_property_id: ID of reference property
+            size: Number of similar properties to find
+            
+        Returns:
+            Property search response
+        """
+        if not await self._get_reference_embedding(reference_property_id):
+            raise ValueError(f"Reference property {reference_property_id} not found or has no embedding")
+        
+        request = PropertySearchRequest(
+            reference_property_id=reference_property_id,
+            size=size
+        )
+        return await self.search(request)
+    
+    async def _get_reference_embedding(self, reference_property_id: str) -> Optional[List[float]]:
+        """
+        Get the embedding of a reference property.
+        
+        Args:
+            reference_property_id: ID of reference property
+            
+        Returns:
+            Embedding vector, or None if missing
+        """
+        ref_property = await self.get_document(
+            index=self.index_name,
+            doc_id=reference_property_id,
+            source_fields=["embedding"]
+        )
+        return ref_property.get("embedding") if ref_property else None
@@ -0,0 +1,205 @@
+"""
+Tests for the async search services.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+from elasticsearch import AsyncElasticsearch
+
+from ..properties import AsyncPropertySearchService
+from ..wikipedia import AsyncWikipediaSearchService
+from ..neighborhoods import AsyncNeighborhoodSearchService
+from ..models import (
+    PropertySearchRequest,
+    PropertySearchResponse,
+    WikipediaSearchRequest,
+    WikipediaSearchResponse,
+    NeighborhoodSearchRequest,
+    NeighborhoodSearchResponse
+)
+
+
+def api_response(body):
+    """Wrap a body the way ObjectApiResponse exposes it."""
+    response = Mock()
+    response.body = body
+    return response
+
+
+@pytest.fixture
+def mock_es_client():
+    """Create a mock AsyncElasticsearch client."""
+    client = Mock(spec=AsyncElasticsearch)
+    client.search = AsyncMock()
+    client.get = AsyncMock()
+    client.msearch = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def property_hits():
+    """Sample property search body."""
+    return {
+        "hits": {
+            "total": {"value": 1},
+            "hits": [
+                {
+                    "_id": "prop-001",
+                    "_score": 0.95,
+                    "_source": {
+                        "listing_id": "prop-001",
+                        "property_type": "condo",
+                        "price": 350000,
+                        "bedrooms": 2,
+                        "bathrooms": 1,
+                        "square_feet": 1200,
+                        "address": {
+                            "street": "456 Oak Ave",
+                            "city": "San Francisco",
+                            "state": "CA",
+                            "zip_code": "94103"
+                        },
+                        "description": "Modern condo in downtown"
+                    }
+                }
+            ]
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_property_search_awaits_client(mock_es_client, property_hits):
+    """Property search awaits the async client and builds the sync response."""
+    mock_es_client.search.return_value = api_response(property_hits)
+    service = AsyncPropertySearchService(mock_es_client)
+
+    response = await service.search(PropertySearchRequest(query="modern condo", size=5))
+
+    assert isinstance(response, PropertySearchResponse)
+    assert response.total_hits == 1
+    assert response.results[0].listing_id == "prop-001"
+    mock_es_client.search.assert_awaited_once()
+    assert mock_es_client.search.call_args[1]["index"] == "properties"
+
+
+@pytest.mark.asyncio
+async def test_property_search_similar_fetches_embedding(mock_es_client, property_hits):
+    """Similar search awaits the reference document before searching."""
+    mock_es_client.get.return_value = {"_source": {"embedding": [0.1, 0.2, 0.3]}}
+    mock_es_client.search.return_value = api_response(property_hits)
+    service = AsyncPropertySearchService(mock_es_client)
+
+    response = await service.search_similar("prop-ref", size=3)
+
+    assert isinstance(response, PropertySearchResponse)
+    mock_es_client.get.assert_awaited()
+    query = mock_es_client.search.call_args[1]
+    assert query["knn"]["query_vector"] == [0.1, 0.2, 0.3]
+
+
+@pytest.mark.asyncio
+async def test_property_search_similar_missing_reference(mock_es_client):
+    """Similar search fails when the reference property has no embedding."""
+    mock_es_client.get.return_value = {"_source": {}}
+    service = AsyncPropertySearchService(mock_es_client)
+
+    with pytest.raises(ValueError):
+        await service.search_similar("prop-missing")
+    mock_es_client.search.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_wikipedia_search_awaits_client(mock_es_client):
+    """Wikipedia search awaits the async client."""
+    mock_es_client.search.return_value = api_response({
+        "hits": {
+            "total": {"value": 1},
+            "hits": [
+                {
+                    "_id": "page-001",
+                    "_score": 1.2,
+                    "_source": {
+                        "page_id": "page-001",
+                        "title": "Golden Gate Park",
+                        "url": "https://en.wikipedia.org/wiki/Golden_Gate_Park"
+                    }
+                }
+            ]
+        }
+    })
+    service = AsyncWikipediaSearchService(mock_es_client)
+
+    response = await service.search(WikipediaSearchRequest(query="park", size=5))
+
+    assert isinstance(response, WikipediaSearchResponse)
+    assert response.total_hits == 1
+    assert response.results[0].title == "Golden Gate Park"
+    mock_es_client.search.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_neighborhood_search_runs_related_lookups(mock_es_client):
+    """Related properties and Wikipedia lookups are both awaited."""
+    neighborhood_hits = api_response({
+        "hits": {
+            "total": {"value": 1},
+            "hits": [
+                {
+                    "_id": "page-001",
+                    "_score": 0.95,
+                    "_source": {
+                        "page_id": "page-001",
+                        "title": "Nob Hill, San Francisco",
+                        "summary": "Nob Hill is a neighborhood in San Francisco"
+                    }
+                }
+            ]
+        }
+    })
+    stats = {
+        "hits": {"total": {"value": 4}, "hits": []},
+        "aggregations": {
+            "total_properties": {"value": 4},
+            "avg_price": {"value": 900000},
+            "avg_bedrooms": {"value": 2},
+            "avg_square_feet": {"value": 1400},
+            "property_types": {"buckets": [{"key": "condo", "doc_count": 4}]}
+        }
+    }
+    related_wiki = {"hits": {"total": {"value": 0}, "hits": []}}
+
+    async def search(index, **kwargs):
+        if "body" not in kwargs:
+            return neighborhood_hits
+        return stats if index == "properties" else related_wiki
+
+    mock_es_client.search.side_effect = search
+    service = AsyncNeighborhoodSearchService(mock_es_client)
+
+    response = await service.search(NeighborhoodSearchRequest(
+        city="San Francisco",
+        include_statistics=True,
+        include_related_wikipedia=True
+    ))
+
+    assert isinstance(response, NeighborhoodSearchResponse)
+    assert response.statistics is not None
+    assert response.statistics.total_properties == 4
+    assert mock_es_client.search.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_multi_search_awaits_msearch(mock_es_client):
+    """Multi-search sends interleaved headers and returns the responses."""
+    mock_es_client.msearch.return_value = {"responses": [{"hits": {}}, {"hits": {}}]}
+    service = AsyncPropertySearchService(mock_es_client)
+
+    responses = await service.multi_search([
+        ("properties", {"query": {"match_all": {}}}),
+        ("wikipedia", {"query": {"match_all": {}}})
+    ])
+
+    assert len(responses) == 2
+    body = mock_es_client.msearch.call_args[1]["body"]
+    assert body[0] == {"index": "properties"}
+    assert body[2] == {"index": "wikipedia"}
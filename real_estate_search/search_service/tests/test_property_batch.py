@@ -0,0 +1,234 @@
+"""
+Tests for batch property search.
+"""
+
+import pytest
+from unittest.mock import Mock
+from elasticsearch import Elasticsearch
+
+from ..properties import PropertySearchService
+from ..models import (
+    PropertySearchRequest,
+    PropertySearchResponse,
+    PropertyBatchSearchResponse,
+    PropertyFilter,
+    SearchError
+)
+
+
+def hits_for(listing_id):
+    """An msearch item with one property hit."""
+    return {
+        "took": 7,
+        "hits": {
+            "total": {"value": 1},
+            "hits": [
+                {
+                    "_id": listing_id,
+                    "_score": 1.0,
+                    "_source": {
+                        "listing_id": listing_id,
+                        "property_type": "condo",
+                        "price": 500000,
+                        "bedrooms": 2,
+                        "bathrooms": 1,
+                        "square_feet": 900,
+                        "address": {
+                            "street": "1 Main St",
+                            "city": "San Francisco",
+                            "state": "CA",
+                            "zip_code": "94102"
+                        },
+                        "description": "Condo"
+                    }
+                }
+            ]
+        }
+    }
+
+
+class TestPropertySearchBatch:
+    """Test cases for PropertySearchService.search_batch."""
+
+    @pytest.fixture
+    def mock_es_client(self):
+        """Create a mock Elasticsearch client."""
+        return Mock(spec=Elasticsearch)
+
+    @pytest.fixture
+    def embedding_service(self):
+        """Embedding service returning one vector per query."""
+        service = Mock()
+        service.batch_embed_queries.side_effect = lambda queries: [[float(i)] * 3 for i in range(len(queries))]
+        return service
+
+    @pytest.fixture
+    def service(self, mock_es_client, embedding_service):
+        """Create a PropertySearchService with embeddings enabled."""
+        return PropertySearchService(mock_es_client, embedding_service=embedding_service)
+
+    def test_embeds_all_queries_in_one_call(self, service, mock_es_client, embedding_service):
+        """Query texts are embedded together and sent in one msearch."""
+        mock_es_client.msearch.return_value = {
+            "responses": [hits_for("a"), hits_for("b"), hits_for("c")]
+        }
+        requests = [
+            PropertySearchRequest(query="modern condo", semantic=True),
+            PropertySearchRequest(query="family home", filters=PropertyFilter(max_price=900000), semantic=True),
+            PropertySearchRequest(query="loft", size=3, from_offset=6, semantic=True)
+        ]
+
+        response = service.search_batch(requests)
+
+        assert isinstance(response, PropertyBatchSearchResponse)
+        embedding_service.batch_embed_queries.assert_called_once_with(
+            ["modern condo", "family home", "loft"]
+        )
+        embedding_service.embed_query.assert_not_called()
+        mock_es_client.msearch.assert_called_once()
+
+        body = mock_es_client.msearch.call_args[1]["body"]
+        assert len(body) == 6
+        assert body[1]["knn"]["query_vector"] == [0.0, 0.0, 0.0]
+        assert body[3]["knn"]["filter"] == body[3]["query"]["bool"]["filter"]
+        assert body[5]["size"] == 3
+        assert body[5]["from"] == 6
+
+        assert [r.results[0].listing_id for r in response.results] == ["a", "b", "c"]
+        assert response.results[0].execution_time_ms == 7
+        assert response.failed_requests == 0
+
+    def test_chunks_msearch_requests(self, service, mock_es_client):
+        """Batches larger than batch_size are split across msearch calls."""
+        mock_es_client.msearch.side_effect = lambda body: {
+            "responses": [hits_for(str(query["knn"]["query_vector"][0])) for query in body[1::2]]
+        }
+        requests = [PropertySearchRequest(query=f"query {i}", semantic=True) for i in range(5)]
+
+        response = service.search_batch(requests, batch_size=2)
+
+        assert mock_es_client.msearch.call_count == 3
+        assert len(response.results) == 5
+        assert all(isinstance(r, PropertySearchResponse) for r in response.results)
+
+    def test_per_item_errors_keep_order(self, service, mock_es_client):
+        """A failed search yields a SearchError in its own slot."""
+        mock_es_client.msearch.return_value = {
+            "responses": [
+                hits_for("a"),
+                {"status": 400, "error": {"type": "search_phase_execution_exception", "reason": "bad query"}},
+                hits_for("c")
+            ]
+        }
+        requests = [PropertySearchRequest(query=q) for q in ("one", "two", "three")]
+
+        response = service.search_batch(requests)
+
+        assert isinstance(response.results[0], PropertySearchResponse)
+        assert isinstance(response.results[1], SearchError)
+        assert response.results[1].error_type == "search_phase_execution_exception"
+        assert response.results[1].details == {"status": 400}
+        assert response.results[2].results[0].listing_id == "c"
+        assert response.failed_requests == 1
+
+    def test_failed_chunk_only_fails_its_searches(self, service, mock_es_client):
+        """A failed msearch request fails its own chunk, not the batch."""
+        mock_es_client.msearch.side_effect = [
+            {"responses": [hits_for("a"), hits_for("b")]},
+            ConnectionError("node down")
+        ]
+        requests = [PropertySearchRequest(query=f"query {i}") for i in range(4)]
+
+        response = service.search_batch(requests, batch_size=2)
+
+        assert [isinstance(r, SearchError) for r in response.results] == [False, False, True, True]
+        assert response.failed_requests == 2
+
+    def test_embedding_failure_falls_back_to_text(self, service, mock_es_client, embedding_service):
+        """Semantic searches run as text-only queries when embedding fails."""
+        embedding_service.batch_embed_queries.side_effect = RuntimeError("provider unavailable")
+        mock_es_client.msearch.return_value = {"responses": [hits_for("a"), hits_for("b")]}
+        requests = [
+            PropertySearchRequest(query="modern condo", semantic=True),
+            PropertySearchRequest(filters=PropertyFilter(min_bedrooms=2))
+        ]
+
+        response = service.search_batch(requests)
+
+        assert all(isinstance(r, PropertySearchResponse) for r in response.results)
+        assert response.failed_requests == 0
+        body = mock_es_client.msearch.call_args[1]["body"]
+        assert len(body) == 4
+        assert "knn" not in body[1]
+        assert body[1]["query"]
+
+    def test_requests_are_text_only_by_default(self, service, mock_es_client, embedding_service):
+        """Only requests that opt in with semantic=True are embedded."""
+        mock_es_client.msearch.return_value = {"responses": [hits_for("a")]}
+
+        service.search_batch([PropertySearchRequest(query="condo")])
+
+        embedding_service.batch_embed_queries.assert_not_called()
+        body = mock_es_client.msearch.call_args[1]["body"]
+        assert "knn" not in body[1]
+
+    def test_without_embedding_service(self, mock_es_client):
+        """Without an embedding service the batch runs text queries only."""
+        mock_es_client.msearch.return_value = {"responses": [hits_for("a")]}
+        service = PropertySearchService(mock_es_client)
+
+        response = service.search_batch([PropertySearchRequest(query="condo")])
+
+        body = mock_es_client.msearch.call_args[1]["body"]
+        assert "knn" not in body[1]
+        assert response.results[0].total_hits == 1
+
+
+class TestPropertySearchEmbedding:
+    """Test cases for query embeddings in single property searches."""
+
+    @pytest.fixture
+    def mock_es_client(self):
+        """Create a mock Elasticsearch client returning one hit."""
+        client = Mock(spec=Elasticsearch)
+        client.search.return_value = Mock(body=hits_for("a"))
+        return client
+
+    @pytest.fixture
+    def embedding_service(self):
+        """Embedding service returning a fixed vector."""
+        service = Mock()
+        service.embed_query.return_value = [0.5, 0.5, 0.5]
+        return service
+
+    @pytest.fixture
+    def service(self, mock_es_client, embedding_service):
+        """Create a PropertySearchService with embeddings enabled."""
+        return PropertySearchService(mock_es_client, embedding_service=embedding_service)
+
+    def test_search_is_text_only_by_default(self, service, mock_es_client, embedding_service):
+        """A configured embedding service does not change plain searches."""
+        response = service.search(PropertySearchRequest(query="modern condo"))
+
+        embedding_service.embed_query.assert_not_called()
+        assert "knn" not in mock_es_client.search.call_args[1]
+        assert response.results[0].listing_id == "a"
+
+    def test_semantic_search_adds_knn(self, service, mock_es_client, embedding_service):
+        """semantic=True adds a kNN clause on the query embedding."""
+        service.search(PropertySearchRequest(query="modern condo", semantic=True))
+
+        embedding_service.embed_query.assert_called_once_with("modern condo")
+        body = mock_es_client.search.call_args[1]
+        assert body["knn"]["query_vector"] == [0.5, 0.5, 0.5]
+
+    def test_embedding_failure_falls_back_to_text(self, service, mock_es_client, embedding_service):
+        """A failing embedding provider does not fail the search."""
+        embedding_service.embed_query.side_effect = RuntimeError("provider unavailable")
+
+        response = service.search(PropertySearchRequest(query="modern condo", semantic=True))
+
+        body = mock_es_client.search.call_args[1]
+        assert "knn" not in body
+        assert body["query"]
+        assert response.total_hits == 1
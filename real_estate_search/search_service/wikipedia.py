@@ -4,9 +4,9 @@ Wikipedia search service implementation.
 
 import logging
 from typing import Dict, Any, List, Optional
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, Elasticsearch
 
-from .base import BaseSearchService
+from .base import AsyncSearchMixin, BaseSearchService
 from .models import (
     WikipediaSearchRequest,
     WikipediaSearchResponse,
@@ -349,4 +349,49 @@ class WikipediaSearchService(BaseSearchService):
             execution_time_ms=es_response.get("execution_time_ms", 0),
             search_type=request.search_type,
             applied_categories=request.categories
-        )
\ No newline at end of file
+        )
+
+
+class AsyncWikipediaSearchService(AsyncSearchMixin, WikipediaSearchService):
+    """
+    Wikipedia search service on the async Elasticsearch client.
+    
+    Builds the same queries and responses as WikipediaSearchService;
+    search methods are coroutines.
+    """
+    
+    def __init__(self, es_client: AsyncElasticsearch):
+        """
+        Initialize the async Wikipedia search service.
+        
+        Args:
+            es_client: AsyncElasticsearch client instance
+        """
+        super().__init__(es_client)
+    
+    async def search(self, request: WikipediaSearchRequest) -> WikipediaSearchResponse:
+        """
+        Main search method that routes to appropriate search type.
+        
+        Args:
+            request: Wikipedia search request
+            
+        Returns:
+            Wikipedia search response
+        """
+        try:
+            index = self._get_index_for_search_type(request.search_type)
+            query = self._build_query(request)
+            
+            es_response = await self.execute_search(
+                index=index,
+                query=query,
+                size=request.size,
+                from_offset=request.from_offset
+            )
+            
+            return self._transform_response(es_response, request)
+            
+        except Exception as e:
+            logger.error(f"Wikipedia search failed: {str(e)}")
+            raise
@@ -21,6 +21,7 @@ import logging
 import sys
 import time
 from pathlib import Path
+from squack_pipeline_v2.core.profiling import RunProfile, compare_profiles
 from squack_pipeline_v2.core.settings import PipelineSettings
 from squack_pipeline_v2.orchestration.pipeline import PipelineOrchestrator
 
@@ -41,6 +42,10 @@ Examples:
   %(prog)s                     # Run full pipeline
   %(prog)s --sample-size 100   # Test with 100 records
   %(prog)s --elasticsearch     # Export to Elasticsearch
+  %(prog)s --no-embedding-cache  # Re-embed every text
+  %(prog)s --incremental       # Only process records changed since the last run
+  %(prog)s --profile --profile-baseline output/profiles/profile_<id>.json
+                               # Profile stages and compare with an earlier run
         """
     )
     
@@ -70,6 +75,25 @@ Examples:
         help="Skip Gold layer (use existing gold tables)"
     )
     
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Keep the database and only process records changed since the last run"
+    )
+    
+    # Profiling
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record per-stage SQL plans, memory and throughput and write a run report"
+    )
+    
+    parser.add_argument(
+        "--profile-baseline",
+        type=Path,
+        help="Earlier profile JSON to compare this run against (implies --profile)"
+    )
+    
     # Output options
     parser.add_argument(
         "--no-parquet",
@@ -83,6 +107,19 @@ Examples:
         help="Export to Elasticsearch"
     )
     
+    # Embedding cache
+    parser.add_argument(
+        "--no-embedding-cache",
+        action="store_true",
+        help="Bypass the persistent embedding cache (embed every text)"
+    )
+    
+    parser.add_argument(
+        "--prune-embedding-cache",
+        action="store_true",
+        help="Apply LRU/age eviction to the embedding cache and exit"
+    )
+    
     # Configuration
     parser.add_argument(
         "--config",
@@ -222,6 +259,12 @@ def main() -> int:
             overrides["data"] = {"sample_size": args.sample_size}
         
         settings = PipelineSettings.load(config_path=args.config, **overrides)
+        if args.no_embedding_cache:
+            settings.embedding.cache.enabled = False
+        if args.incremental:
+            settings.processing.incremental = True
+        if args.profile or args.profile_baseline:
+            settings.processing.profile = True
     except Exception as e:
         print(f"Error loading config from {args.config}: {e}")
         return 1
@@ -245,8 +288,14 @@ def main() -> int:
             show_statistics(orchestrator)
             return 0
         
-        # Always clean database for simple demo
-        clean_database_file(settings)
+        if args.prune_embedding_cache:
+            removed = orchestrator.prune_embedding_cache()
+            print(f"Pruned {removed} embedding cache entries")
+            return 0
+        
+        # Clean database for a fresh start; incremental runs diff against it
+        if not settings.processing.incremental:
+            clean_database_file(settings)
         
         # Start timing
         start_time = time.time()
@@ -257,26 +306,24 @@ def main() -> int:
         print(f"Config: {args.config}")
         print(f"Sample size: {args.sample_size or settings.data.sample_size or 'full data'}")
         print(f"Embeddings: enabled")
+        print(f"Embedding cache: {'enabled' if settings.embedding.cache.enabled else 'disabled'}")
+        print(f"Mode: {'incremental' if settings.processing.incremental else 'full rebuild'}")
+        print(f"Profiling: {'enabled' if settings.processing.profile else 'disabled'}")
         print(f"Parquet export: {'enabled' if not args.no_parquet and settings.output.parquet_enabled else 'disabled'}")
         print(f"Elasticsearch: {'enabled' if args.elasticsearch or settings.output.elasticsearch_enabled else 'disabled'}")
         print("=" * 60 + "\n")
         
-        # Run pipeline stages
-        
-        # Bronze layer
-        if not args.skip_bronze:
-            print("Running Bronze layer...")
-            orchestrator.run_bronze_layer(settings.data.sample_size)
-        
-        # Silver layer
-        if not args.skip_silver:
-            print("Running Silver layer...")
-            orchestrator.run_silver_layer()
-        
-        # Gold layer
-        if not args.skip_gold:
-            print("Running Gold layer...")
-            orchestrator.run_gold_layer()
+        # Bronze, Silver and Gold run as one task graph; --skip-* flags
+        # drop that layer's tasks from it
+        skip_layers = [
+            layer
+            for layer, skip in (("bronze", args.skip_bronze), ("silver", args.skip_silver), ("gold", args.skip_gold))
+            if skip
+        ]
+        layers = [layer for layer in ("bronze", "silver", "gold") if layer not in skip_layers]
+        if layers:
+            print(f"Running {', '.join(layer.title() for layer in layers)} layers...")
+            orchestrator.run_medallion_layers(settings.data.sample_size, skip_layers=skip_layers)
         
         # Embeddings are generated in Silver layer (following medallion architecture)
         
@@ -298,6 +345,17 @@ def main() -> int:
                 write_neo4j=write_neo4j
             )
         
+        # Everything succeeded - move the change baseline forward
+        orchestrator.commit_changes()
+        
+        # Profiling report, optionally diffed against an earlier run
+        profile = orchestrator.write_profile()
+        if profile is not None and args.profile_baseline:
+            regressions = compare_profiles(RunProfile.load(args.profile_baseline), profile)
+            print(f"\nProfile regressions vs {args.profile_baseline}: {len(regressions) or 'none'}")
+            for regression in regressions:
+                print(f"  {regression}")
+        
         # Calculate total elapsed time
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -323,6 +381,12 @@ def main() -> int:
         else:
             print(f"Total time: {seconds:.2f}s")
         print(f"Raw seconds: {elapsed_time:.3f}")
+        if orchestrator.embedding_cache is not None:
+            cache_stats = orchestrator.embedding_cache.get_stats()
+            print(
+                f"Embedding cache: {cache_stats.hits:,} hits, {cache_stats.misses:,} misses "
+                f"({cache_stats.hit_rate:.1%} hit rate, {cache_stats.entries:,} entries)"
+            )
         print("=" * 60)
         
         return 0
@@ -0,0 +1,27 @@
+"""Synthetic-scale benchmarks for SQUACK Pipeline V2."""
+
+from squack_pipeline_v2.benchmarks.data_generator import (
+    SCALES,
+    SyntheticDataGenerator,
+    SyntheticDataset,
+    parse_scale,
+)
+from squack_pipeline_v2.benchmarks.harness import (
+    BenchmarkConfig,
+    BenchmarkResult,
+    BenchmarkRunner,
+    format_profile_table,
+    format_scaling_table,
+)
+
+__all__ = [
+    "SCALES",
+    "SyntheticDataGenerator",
+    "SyntheticDataset",
+    "parse_scale",
+    "BenchmarkConfig",
+    "BenchmarkResult",
+    "BenchmarkRunner",
+    "format_profile_table",
+    "format_scaling_table",
+]
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""Run the synthetic-scale benchmarks.
+
+Usage:
+    python -m squack_pipeline_v2.benchmarks --scale 10k
+    python -m squack_pipeline_v2.benchmarks --scale 10k --scale 100k --baseline-dir path/to/reports
+
+Exits with status 2 when a stage is slower than the baseline by more than
+the threshold, so the command can gate CI.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from squack_pipeline_v2.benchmarks.data_generator import parse_scale
+from squack_pipeline_v2.benchmarks.harness import (
+    BenchmarkConfig,
+    BenchmarkRunner,
+    format_profile_table,
+    format_scaling_table,
+)
+from squack_pipeline_v2.core.connection import DuckDBConnectionManager
+from squack_pipeline_v2.core.settings import PipelineSettings
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="SQUACK Pipeline V2 - synthetic-scale benchmarks",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --scale 10k                      # One scale, Parquet (+ ES/Neo4j if reachable)
+  %(prog)s --scale 10k --scale 100k         # Scaling table across sizes
+  %(prog)s --scale 10k --baseline-dir old/  # Fail on >20%% slower stages
+        """
+    )
+
+    parser.add_argument(
+        "--scale",
+        action="append",
+        help="Scale to run: 10k, 100k, 1m or a property count (repeatable, default 10k)"
+    )
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        default=Path("squack_pipeline_v2/output/benchmarks"),
+        help="Directory for synthetic data, DuckDB file and reports"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic data seed")
+    parser.add_argument(
+        "--entities",
+        nargs="+",
+        default=["property", "neighborhood", "wikipedia", "location"],
+        help="Entities to run (the graph builder needs all four)"
+    )
+    parser.add_argument(
+        "--elasticsearch",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Index to Elasticsearch (default: when reachable)"
+    )
+    parser.add_argument(
+        "--neo4j",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Write to Neo4j (default: when reachable)"
+    )
+    parser.add_argument("--baseline-dir", type=Path, help="Reports directory of an earlier benchmark run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown per stage (0.2 = 20%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="Ignore slowdowns shorter than this")
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=Path("squack_pipeline_v2/config.yaml"),
+        help="Base pipeline configuration"
+    )
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point.
+
+    Returns:
+        Exit code (0 success, 1 failure, 2 regression)
+    """
+    args = parse_arguments()
+    scales = [(label.lower(), parse_scale(label)) for label in (args.scale or ["10k"])]
+
+    settings = PipelineSettings.load(config_path=args.config)
+    args.work_dir.mkdir(parents=True, exist_ok=True)
+    database_file = args.work_dir / "benchmark.duckdb"
+    database_file.unlink(missing_ok=True)
+    settings.duckdb.database_file = str(database_file)
+    DuckDBConnectionManager(settings.duckdb)
+
+    runner = BenchmarkRunner(
+        BenchmarkConfig(
+            work_dir=args.work_dir,
+            seed=args.seed,
+            entities=args.entities,
+            elasticsearch=args.elasticsearch,
+            neo4j=args.neo4j,
+            baseline_dir=args.baseline_dir,
+            threshold=args.threshold,
+            min_seconds=args.min_seconds
+        ),
+        settings
+    )
+
+    results = []
+    try:
+        for label, scale in scales:
+            results.append(runner.run(label, scale))
+    except Exception as e:
+        print(f"Benchmark failed: {e}")
+        return 1
+
+    regressions = 0
+    for result in results:
+        print(f"\n## Benchmark {result.label} ({result.dataset.counts})\n")
+        print(format_profile_table(result.profile))
+        print(f"\nReports: {', '.join(str(path) for path in result.report_files)}")
+        for regression in result.regressions:
+            print(f"REGRESSION {result.label}: {regression}")
+        regressions += len(result.regressions)
+
+    if len(results) > 1:
+        print("\n## Scaling\n")
+        print(format_scaling_table(results))
+
+    return 2 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
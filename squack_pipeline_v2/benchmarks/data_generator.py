@@ -0,0 +1,549 @@
+"""Synthetic source data for scale benchmarks.
+
+SYNTHETIC DATA ARCHITECTURE:
+============================
+
+The real source files hold a few hundred properties. To see how Bronze,
+Silver, Gold, GoldGraphBuilder and the writers scale, SyntheticDataGenerator
+writes the same four sources at any size, in the exact schemas the Bronze
+ingesters read:
+
+- properties JSON: listing with address, coordinates, property_details,
+  features, price_history and (for some listings) the enriched market fields
+- neighborhoods JSON: characteristics, demographics, amenities and
+  wikipedia_correlations pointing at generated articles
+- locations JSON: state, county, city and neighborhood hierarchy rows
+- Wikipedia SQLite: articles and page_summaries tables as built by
+  wiki_crawl and wiki_summary
+
+Row counts are derived from the property count (one neighborhood per 200
+properties, one article per 20). Output is fully determined by the seed, so
+two runs at the same scale benchmark identical data.
+
+JSON files are streamed record by record and SQLite rows are inserted in
+batches, so generating 1M properties does not hold them all in memory.
+"""
+
+import json
+import random
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from pydantic import BaseModel, Field
+
+from squack_pipeline_v2.core.logging import PipelineLogger
+from squack_pipeline_v2.core.settings import PipelineSettings
+
+
+# Named benchmark scales (property count)
+SCALES: Dict[str, int] = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+# City, county, state, ZIP prefix, latitude, longitude
+CITIES: List[Tuple[str, str, str, str, float, float]] = [
+    ("San Francisco", "San Francisco", "CA", "941", 37.7749, -122.4194),
+    ("Oakland", "Alameda", "CA", "946", 37.8044, -122.2712),
+    ("San Jose", "Santa Clara", "CA", "951", 37.3382, -121.8863),
+    ("Salinas", "Monterey", "CA", "939", 36.6777, -121.6555),
+    ("Park City", "Summit", "UT", "840", 40.6461, -111.4980),
+    ("Heber City", "Wasatch", "UT", "840", 40.5070, -111.4132),
+]
+
+PROPERTY_TYPES = ["single-family", "condo", "townhome", "multi-family"]
+
+FEATURES = [
+    "Hardwood floors", "Updated kitchen", "City views", "Garden", "Fireplace",
+    "Community pool", "Gym", "Storage", "Solar panels", "EV charging",
+    "Walk-in closet", "Deck", "Mountain views", "Smart home", "Wine cellar",
+    "Home office", "Central AC", "Bay views", "Rooftop terrace", "Ski storage",
+]
+
+STREETS = [
+    "Oak", "Pine", "Maple", "Cedar", "Elm", "Market", "Mission", "Valencia",
+    "Telegraph", "Park", "Main", "Summit", "Ridge", "Lake", "Hillside", "Union",
+]
+STREET_TYPES = ["Street", "Avenue", "Court", "Lane", "Way", "Boulevard"]
+
+NEIGHBORHOOD_WORDS = [
+    "Heights", "Hill", "Park", "Village", "Gardens", "Terrace", "Valley",
+    "Commons", "District", "Point", "Square", "Grove",
+]
+NEIGHBORHOOD_PREFIXES = [
+    "North", "South", "East", "West", "Old", "Upper", "Lower", "Mission",
+    "Cedar", "Golden", "Silver", "Lake", "Canyon", "Harbor", "Sunset", "Bay",
+]
+
+AMENITIES = [
+    "Farmers market", "Dog park", "Coffee shops", "Playgrounds", "Bike paths",
+    "Public library", "Hiking trails", "Fine dining", "Art galleries", "Ski lift",
+]
+LIFESTYLE_TAGS = [
+    "family-friendly", "walkable", "urban", "quiet", "historic", "luxury",
+    "outdoors", "nightlife", "ski-in/ski-out", "views",
+]
+
+DESCRIPTION_OPENERS = [
+    "Stunning", "Charming", "Beautifully updated", "Spacious", "Light-filled",
+    "Modern", "Classic", "Rare", "Move-in ready", "Elegant",
+]
+DESCRIPTION_CLOSERS = [
+    "Close to shops, dining and transit.",
+    "Steps from parks and top-rated schools.",
+    "Priced to sell in today's market.",
+    "A must-see for discerning buyers.",
+    "Perfect for entertaining year round.",
+]
+
+
+class SyntheticDataset(BaseModel):
+    """Files written by SyntheticDataGenerator."""
+
+    scale: int = Field(ge=1, description="Number of properties")
+    seed: int = Field(description="Random seed")
+    properties_file: Path = Field(description="Properties JSON")
+    neighborhoods_file: Path = Field(description="Neighborhoods JSON")
+    locations_file: Path = Field(description="Locations JSON")
+    wikipedia_db: Path = Field(description="Wikipedia SQLite database")
+    counts: Dict[str, int] = Field(default_factory=dict, description="Records per entity")
+
+    def apply_to(self, settings: PipelineSettings) -> PipelineSettings:
+        """Point the pipeline's data sources at this dataset.
+
+        Args:
+            settings: Settings to update in place
+
+        Returns:
+            The updated settings
+        """
+        settings.data_sources.properties_files = [str(self.properties_file)]
+        settings.data_sources.neighborhoods_files = [str(self.neighborhoods_file)]
+        settings.data_sources.locations_file = str(self.locations_file)
+        settings.data_sources.wikipedia_db_path = str(self.wikipedia_db)
+        return settings
+
+
+def parse_scale(scale: str) -> int:
+    """Property count for a named scale (10k, 100k, 1m) or a plain number.
+
+    Args:
+        scale: Scale name or integer string
+
+    Returns:
+        Number of properties
+    """
+    key = scale.strip().lower()
+    if key in SCALES:
+        return SCALES[key]
+    try:
+        count = int(key.replace("_", ""))
+    except ValueError:
+        raise ValueError(f"Unknown scale: {scale} (use {', '.join(SCALES)} or a number)")
+    if count < 1:
+        raise ValueError(f"Scale must be positive: {scale}")
+    return count
+
+
+class SyntheticDataGenerator:
+    """Writes deterministic synthetic source files at a given scale."""
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, output_dir: Path, scale: int, seed: int = 42):
+        """Initialize generator.
+
+        Args:
+            output_dir: Directory for the generated files
+            scale: Number of properties
+            seed: Random seed
+        """
+        self.output_dir = Path(output_dir)
+        self.scale = scale
+        self.seed = seed
+        self.neighborhood_count = max(5, scale // 200)
+        self.article_count = max(10, scale // 20)
+        self.logger = PipelineLogger.get_logger(self.__class__.__name__)
+
+    def generate(self, reuse: bool = True) -> SyntheticDataset:
+        """Write all source files, or reuse matching files from an earlier call.
+
+        Args:
+            reuse: Keep existing files generated with the same scale and seed
+
+        Returns:
+            Dataset description
+        """
+        dataset = SyntheticDataset(
+            scale=self.scale,
+            seed=self.seed,
+            properties_file=self.output_dir / "properties.json",
+            neighborhoods_file=self.output_dir / "neighborhoods.json",
+            locations_file=self.output_dir / "locations.json",
+            wikipedia_db=self.output_dir / "wikipedia.db",
+        )
+
+        manifest_path = self.output_dir / self.MANIFEST
+        if reuse and manifest_path.exists():
+            existing = SyntheticDataset.model_validate_json(manifest_path.read_text())
+            if (existing.scale, existing.seed) == (self.scale, self.seed):
+                self.logger.info(f"Reusing synthetic data in {self.output_dir}")
+                return existing
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        rng = random.Random(self.seed)
+
+        neighborhoods = [self._neighborhood(rng, i) for i in range(self.neighborhood_count)]
+        counts = {
+            "property": self._write_json(
+                dataset.properties_file,
+                (self._property(rng, i, neighborhoods) for i in range(self.scale))
+            ),
+            "neighborhood": self._write_json(dataset.neighborhoods_file, iter(neighborhoods)),
+            "location": self._write_json(dataset.locations_file, self._locations(neighborhoods)),
+            "wikipedia": self._write_wikipedia(dataset.wikipedia_db, rng, neighborhoods),
+        }
+        dataset = dataset.model_copy(update={"counts": counts})
+
+        manifest_path.write_text(dataset.model_dump_json(indent=2))
+        self.logger.info(f"Generated synthetic data in {self.output_dir}: {counts}")
+        return dataset
+
+    @staticmethod
+    def _write_json(path: Path, records: Iterator[Dict[str, Any]]) -> int:
+        """Stream records into a JSON array file.
+
+        Returns:
+            Number of records written
+        """
+        count = 0
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[")
+            for record in records:
+                f.write(",\n" if count else "\n")
+                f.write(json.dumps(record))
+                count += 1
+            f.write("\n]\n")
+        return count
+
+    def _page_id(self, index: int) -> int:
+        """Wikipedia page id of the index-th generated article."""
+        return 10_000_000 + index
+
+    @staticmethod
+    def _zip_code(index: int) -> str:
+        """ZIP code of the index-th generated neighborhood."""
+        zip_prefix = CITIES[index % len(CITIES)][3]
+        return f"{zip_prefix}{index % 100:02d}"
+
+    def _neighborhood(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        """One neighborhood record."""
+        city, county, state, zip_prefix, lat, lon = CITIES[index % len(CITIES)]
+        name = f"{rng.choice(NEIGHBORHOOD_PREFIXES)} {rng.choice(NEIGHBORHOOD_WORDS)} {index}"
+        city_code = "".join(word[0] for word in city.lower().split())
+        primary = self._page_id(index % self.article_count)
+        related = [self._page_id(rng.randrange(self.article_count)) for _ in range(2)]
+
+        return {
+            "neighborhood_id": f"{city_code}-syn-{index:06d}",
+            "name": name,
+            "city": city,
+            "county": county,
+            "state": state,
+            "coordinates": {
+                "latitude": round(lat + rng.uniform(-0.08, 0.08), 4),
+                "longitude": round(lon + rng.uniform(-0.08, 0.08), 4),
+            },
+            "description": (
+                f"{name} is a {rng.choice(['vibrant', 'quiet', 'historic', 'growing'])} "
+                f"neighborhood in {city} known for {rng.choice(AMENITIES).lower()} and "
+                f"{rng.choice(AMENITIES).lower()}. Residents enjoy "
+                f"{rng.choice(LIFESTYLE_TAGS)} living close to {rng.choice(AMENITIES).lower()}."
+            ),
+            "characteristics": {
+                "walkability_score": rng.randint(3, 10),
+                "transit_score": rng.randint(2, 10),
+                "school_rating": rng.randint(4, 10),
+                "safety_rating": rng.randint(4, 10),
+                "nightlife_score": rng.randint(1, 10),
+                "family_friendly_score": rng.randint(3, 10),
+            },
+            "amenities": rng.sample(AMENITIES, 4),
+            "lifestyle_tags": rng.sample(LIFESTYLE_TAGS, 3),
+            "median_home_price": rng.randrange(600_000, 4_000_000, 10_000),
+            "price_trend": rng.choice(["rising", "stable", "declining"]),
+            "demographics": {
+                "primary_age_group": rng.choice(["25-40", "30-50", "35-60", "45-65"]),
+                "vibe": rng.choice(["urban professional", "family suburban", "mountain resort"]),
+                "population": rng.randint(2_000, 60_000),
+                "median_household_income": rng.randrange(60_000, 250_000, 1_000),
+            },
+            "wikipedia_correlations": {
+                "primary_wiki_article": {
+                    "page_id": primary,
+                    "title": f"Synthetic article {primary}",
+                    "url": f"https://en.wikipedia.org/wiki/Synthetic_{primary}",
+                    "confidence": round(rng.uniform(0.8, 0.99), 2),
+                },
+                "related_wiki_articles": [
+                    {
+                        "page_id": page_id,
+                        "title": f"Synthetic article {page_id}",
+                        "url": f"https://en.wikipedia.org/wiki/Synthetic_{page_id}",
+                        "relationship": rng.choice(["park", "landmark", "reference"]),
+                        "confidence": round(rng.uniform(0.6, 0.9), 2),
+                    }
+                    for page_id in related
+                ],
+                "parent_geography": {
+                    "city_wiki": {"page_id": 49728, "title": city},
+                    "state_wiki": {"page_id": 5407, "title": state},
+                },
+                "generated_by": "synthetic_data_generator",
+                "generated_at": "2025-01-01T00:00:00Z",
+                "source": "synthetic",
+            },
+        }
+
+    def _property(
+        self,
+        rng: random.Random,
+        index: int,
+        neighborhoods: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """One property listing."""
+        neighborhood_index = rng.randrange(len(neighborhoods))
+        neighborhood = neighborhoods[neighborhood_index]
+        listing_id = f"syn-prop-{index:07d}"
+        property_type = rng.choice(PROPERTY_TYPES)
+        bedrooms = rng.randint(1, 6)
+        square_feet = rng.randint(500, 900) + bedrooms * rng.randint(250, 600)
+        price_per_sqft = rng.randint(250, 1_500)
+        listing_price = square_feet * price_per_sqft
+        listing_date = date(2025, 1, 1) + timedelta(days=rng.randrange(240))
+        features = rng.sample(FEATURES, rng.randint(3, 8))
+
+        record: Dict[str, Any] = {
+            "listing_id": listing_id,
+            "neighborhood_id": neighborhood["neighborhood_id"],
+            "address": {
+                "street": f"{rng.randint(1, 9999)} {rng.choice(STREETS)} {rng.choice(STREET_TYPES)}",
+                "city": neighborhood["city"],
+                "county": neighborhood["county"],
+                "state": neighborhood["state"],
+                "zip": self._zip_code(neighborhood_index),
+            },
+            "coordinates": {
+                "latitude": round(neighborhood["coordinates"]["latitude"] + rng.uniform(-0.01, 0.01), 5),
+                "longitude": round(neighborhood["coordinates"]["longitude"] + rng.uniform(-0.01, 0.01), 5),
+            },
+            "property_details": {
+                "square_feet": square_feet,
+                "bedrooms": bedrooms,
+                "bathrooms": rng.choice([1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0]),
+                "property_type": property_type,
+                "year_built": rng.randint(1900, 2024),
+                "lot_size": round(rng.uniform(0.02, 1.5), 2),
+                "stories": rng.randint(1, 3),
+                "garage_spaces": rng.randint(0, 3),
+            },
+            "listing_price": listing_price,
+            "price_per_sqft": price_per_sqft,
+            "description": (
+                f"{rng.choice(DESCRIPTION_OPENERS)} {bedrooms}-bedroom {property_type} in "
+                f"{neighborhood['name']} with {features[0].lower()} and {features[1].lower()}. "
+                f"{rng.choice(DESCRIPTION_CLOSERS)}"
+            ),
+            "features": features,
+            "listing_date": listing_date.isoformat(),
+            "days_on_market": rng.randint(1, 120),
+            "virtual_tour_url": f"https://example.com/tours/{listing_id}",
+            "images": [f"https://example.com/images/{listing_id}-{n}.jpg" for n in range(1, rng.randint(2, 5))],
+            "price_history": [
+                {"date": listing_date.isoformat(), "price": listing_price, "event": "listed"}
+            ],
+            "buyer_demographics": None,
+            "buyer_persona": None,
+            "future_enhancements": None,
+            "market_trends": None,
+            "nearby_amenities": None,
+            "viewing_statistics": None,
+        }
+
+        # About 40% of the real listings carry the enriched market fields
+        if rng.random() < 0.4:
+            record.update(self._market_fields(rng))
+        return record
+
+    @staticmethod
+    def _market_fields(rng: random.Random) -> Dict[str, Any]:
+        """Enriched buyer and market fields of a listing."""
+        return {
+            "buyer_demographics": {
+                "local_buyers_pct": round(rng.random(), 3),
+                "cash_buyers_pct": round(rng.random() * 0.5, 3),
+                "first_time_buyers_pct": round(rng.random() * 0.3, 3),
+            },
+            "buyer_persona": {
+                "profile": rng.choice(["first_time_buyer", "investor", "family", "international_buyer"]),
+                "interests": rng.sample(["luxury", "walkability", "schools", "investment_potential", "views"], 2),
+                "age_range": rng.choice(["25-40", "35-55", "45-65"]),
+                "motivation": rng.choice(["investment", "primary_residence", "vacation"]),
+            },
+            "future_enhancements": {
+                "comparables": "To be implemented",
+                "agent_info": "To be implemented",
+                "property_insights": "To be implemented",
+            },
+            "market_trends": {
+                "appreciation_rate": round(rng.uniform(-0.02, 0.08), 3),
+                "seasonality_factor": rng.choice(["year_round", "summer_peak", "winter_peak"]),
+                "price_per_sqft_trend": rng.choice(["rising", "stable", "declining"]),
+                "inventory_level": rng.choice(["low", "moderate", "high"]),
+                "average_dom": rng.randint(10, 90),
+            },
+            "nearby_amenities": [
+                {
+                    "type": rng.choice(["park", "school", "shopping", "transit"]),
+                    "name": rng.choice(AMENITIES),
+                    "distance_miles": round(rng.uniform(0.1, 2.0), 1),
+                    "rating": rng.randint(5, 10),
+                    "walking_time_mins": rng.randint(2, 40),
+                }
+                for _ in range(3)
+            ],
+            "viewing_statistics": {
+                "total_views": rng.randint(50, 3_000),
+                "saved_count": rng.randint(0, 200),
+                "inquiry_count": rng.randint(0, 30),
+                "showing_requests": rng.randint(0, 20),
+            },
+        }
+
+    def _locations(self, neighborhoods: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """State, county, city and neighborhood location rows."""
+        seen = set()
+        for city, county, state, zip_prefix, _, _ in CITIES:
+            for row in (
+                {"state": state, "zip_code": f"{zip_prefix}00"},
+                {"county": county, "state": state, "zip_code": f"{zip_prefix}00"},
+                {"city": city, "county": county, "state": state, "zip_code": f"{zip_prefix}00"},
+            ):
+                key = tuple(sorted(row.items()))
+                if key not in seen:
+                    seen.add(key)
+                    yield row
+
+        for index, neighborhood in enumerate(neighborhoods):
+            yield {
+                "neighborhood": neighborhood["name"],
+                "city": neighborhood["city"],
+                "county": neighborhood["county"],
+                "state": neighborhood["state"],
+                "zip_code": self._zip_code(index),
+            }
+
+    def _write_wikipedia(
+        self,
+        path: Path,
+        rng: random.Random,
+        neighborhoods: List[Dict[str, Any]],
+        batch_size: int = 10_000
+    ) -> int:
+        """Write the articles and page_summaries tables.
+
+        Returns:
+            Number of articles written
+        """
+        path.unlink(missing_ok=True)
+        with sqlite3.connect(path) as conn:
+            conn.execute("""
+                CREATE TABLE articles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    pageid INTEGER NOT NULL,
+                    location_id INTEGER NOT NULL,
+                    title TEXT NOT NULL,
+                    url TEXT,
+                    extract TEXT,
+                    categories TEXT,
+                    latitude REAL,
+                    longitude REAL,
+                    relevance_score REAL,
+                    depth INTEGER,
+                    crawled_at TIMESTAMP,
+                    html_file TEXT,
+                    file_hash TEXT,
+                    image_url TEXT,
+                    links_count INTEGER,
+                    infobox_data TEXT,
+                    UNIQUE(pageid, location_id)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE page_summaries (
+                    page_id INTEGER PRIMARY KEY,
+                    article_id INTEGER,
+                    title TEXT,
+                    short_summary TEXT NOT NULL,
+                    long_summary TEXT NOT NULL,
+                    key_topics TEXT,
+                    best_city TEXT,
+                    best_county TEXT,
+                    best_state TEXT,
+                    overall_confidence REAL,
+                    processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            articles: List[Tuple] = []
+            summaries: List[Tuple] = []
+            for index in range(self.article_count):
+                page_id = self._page_id(index)
+                neighborhood = neighborhoods[index % len(neighborhoods)]
+                title = f"Synthetic article {page_id}"
+                topic = rng.choice(["history", "parks", "architecture", "culture", "transportation"])
+                summary = (
+                    f"{title} covers the {topic} of {neighborhood['name']} in {neighborhood['city']}, "
+                    f"{neighborhood['state']}. " + " ".join(
+                        f"The area is known for {rng.choice(AMENITIES).lower()}."
+                        for _ in range(rng.randint(3, 8))
+                    )
+                )
+                articles.append((
+                    index + 1, page_id, index % len(CITIES) + 1, title,
+                    f"https://en.wikipedia.org/wiki/Synthetic_{page_id}",
+                    summary[:200],
+                    json.dumps([topic, neighborhood["city"]]),
+                    neighborhood["coordinates"]["latitude"],
+                    neighborhood["coordinates"]["longitude"],
+                    round(rng.uniform(0.3, 1.0), 3),
+                    rng.randint(0, 3),
+                    "2025-01-01 00:00:00",
+                    f"pages/{page_id}.html",
+                    f"{rng.getrandbits(64):016x}",
+                    None,
+                    rng.randint(10, 500),
+                    None,
+                ))
+                summaries.append((
+                    page_id, index + 1, title, summary[:160], summary, json.dumps([topic]),
+                    neighborhood["city"], neighborhood["county"], neighborhood["state"],
+                    round(rng.uniform(0.5, 1.0), 2), "2025-01-01 00:00:00",
+                ))
+
+                if len(articles) >= batch_size:
+                    self._insert_wikipedia(conn, articles, summaries)
+            self._insert_wikipedia(conn, articles, summaries)
+
+        return self.article_count
+
+    @staticmethod
+    def _insert_wikipedia(conn: sqlite3.Connection, articles: List[Tuple], summaries: List[Tuple]) -> None:
+        """Insert and clear buffered article and summary rows."""
+        conn.executemany(f"INSERT INTO articles VALUES ({', '.join('?' * 17)})", articles)
+        conn.executemany(f"INSERT INTO page_summaries VALUES ({', '.join('?' * 11)})", summaries)
+        articles.clear()
+        summaries.clear()
@@ -0,0 +1,260 @@
+"""Scale benchmark harness.
+
+BENCHMARK ARCHITECTURE:
+=======================
+
+BenchmarkRunner runs the real pipeline against synthetic data
+(data_generator.py) with the offline hash embedding provider, so a run
+measures DuckDB and the writers rather than an embedding API:
+
+1. Generate (or reuse) the synthetic sources for the scale
+2. Run the Bronze/Silver/Gold task graph
+3. Build the graph tables (GoldGraphBuilder)
+4. Run the writers: Parquet always, Elasticsearch and Neo4j when a local
+   instance answers (or when forced on)
+
+Profiling (core/profiling.py) is switched on for the run, so every task,
+builder step and writer is recorded with time, SQL/embedding split, peak
+RSS, DuckDB memory, rows/sec and bytes written. Each scale's report is saved
+as profile_benchmark_<scale>.json/.parquet plus a Markdown table. With a
+baseline directory the report is compared stage by stage and any stage
+slower than the threshold is listed as a regression.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from squack_pipeline_v2.benchmarks.data_generator import SyntheticDataGenerator, SyntheticDataset
+from squack_pipeline_v2.core.connection import DuckDBConnectionManager
+from squack_pipeline_v2.core.logging import PipelineLogger
+from squack_pipeline_v2.core.profiling import RunProfile, compare_profiles, set_profiler
+from squack_pipeline_v2.core.settings import PipelineSettings
+from squack_pipeline_v2.core.table_names import ENTITY_TYPES
+
+
+class BenchmarkConfig(BaseModel):
+    """Benchmark run configuration."""
+
+    work_dir: Path = Field(default=Path("squack_pipeline_v2/output/benchmarks"), description="Data and report directory")
+    seed: int = Field(default=42, description="Synthetic data seed")
+    entities: List[str] = Field(
+        default_factory=lambda: ["property", "neighborhood", "wikipedia", "location"],
+        description="Entities to run; the graph builder needs all four"
+    )
+    elasticsearch: Optional[bool] = Field(default=None, description="Index to Elasticsearch (None = if reachable)")
+    neo4j: Optional[bool] = Field(default=None, description="Write to Neo4j (None = if reachable)")
+    baseline_dir: Optional[Path] = Field(default=None, description="Directory with earlier benchmark reports")
+    threshold: float = Field(default=0.2, ge=0, description="Allowed relative slowdown per stage")
+    min_seconds: float = Field(default=0.5, ge=0, description="Ignore slowdowns below this many seconds")
+
+
+class BenchmarkResult(BaseModel):
+    """Outcome of one benchmark scale."""
+
+    label: str = Field(description="Scale label, e.g. 10k")
+    dataset: SyntheticDataset = Field(description="Synthetic data used")
+    profile: RunProfile = Field(description="Profiling report of the run")
+    report_files: List[Path] = Field(default_factory=list, description="Written report files")
+    regressions: List[str] = Field(default_factory=list, description="Stages slower than the baseline")
+
+
+def format_profile_table(profile: RunProfile) -> str:
+    """Render a run profile as a Markdown timing/memory/throughput table.
+
+    Args:
+        profile: Run profile
+
+    Returns:
+        Markdown table, one row per stage (nested stages indented)
+    """
+    depth: Dict[str, int] = {}
+    lines = [
+        "| Stage | Seconds | SQL s | Embed s | Records | Rows/s | MB written | MB/s | Peak RSS MB | DuckDB MB |",
+        "|---|---:|---:|---:|---:|---:|---:|---:|---:|---:|",
+    ]
+    for stage in profile.stages:
+        level = depth.get(stage.parent, -1) + 1 if stage.parent else 0
+        depth[stage.name] = level
+        mb_written = stage.bytes_written / (1024 * 1024)
+        mb_per_second = mb_written / stage.duration_seconds if stage.duration_seconds > 0 else 0.0
+        lines.append(
+            f"| {'  ' * level}{stage.name} | {stage.duration_seconds:.2f} | {stage.sql_seconds:.2f} | "
+            f"{stage.embedding_seconds:.2f} | {stage.output_records:,} | {stage.rows_per_second:,.0f} | "
+            f"{mb_written:.1f} | {mb_per_second:.1f} | {stage.peak_rss_mb:.0f} | {stage.duckdb_memory_mb:.0f} |"
+        )
+    return "\n".join(lines)
+
+
+def format_scaling_table(results: List[BenchmarkResult]) -> str:
+    """Render top-level stage throughput across scales as a Markdown table.
+
+    Args:
+        results: Benchmark results, smallest scale first
+
+    Returns:
+        Markdown table with seconds and rows/sec per scale
+    """
+    stage_names: List[str] = []
+    for result in results:
+        for stage in result.profile.stages:
+            if stage.parent is None and stage.name not in stage_names:
+                stage_names.append(stage.name)
+
+    header = "| Stage | " + " | ".join(f"{r.label} s | {r.label} rows/s" for r in results) + " |"
+    lines = [header, "|---|" + "---:|---:|" * len(results)]
+    for name in stage_names:
+        cells = []
+        for result in results:
+            stage = next((s for s in result.profile.stages if s.name == name and s.parent is None), None)
+            cells.append(f"{stage.duration_seconds:.2f} | {stage.rows_per_second:,.0f}" if stage else "- | -")
+        lines.append(f"| {name} | " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+class BenchmarkRunner:
+    """Runs the pipeline on synthetic data and reports per-stage cost."""
+
+    def __init__(self, config: Optional[BenchmarkConfig] = None, settings: Optional[PipelineSettings] = None):
+        """Initialize runner.
+
+        Args:
+            config: Benchmark configuration
+            settings: Base pipeline settings (defaults if not provided)
+        """
+        self.config = config or BenchmarkConfig()
+        self.settings = settings or PipelineSettings()
+        self.logger = PipelineLogger.get_logger(self.__class__.__name__)
+
+    def _settings_for(self, dataset: SyntheticDataset, label: str) -> PipelineSettings:
+        """Pipeline settings for one benchmark scale."""
+        settings = dataset.apply_to(self.settings.model_copy(deep=True))
+        run_dir = self.config.work_dir / label
+
+        settings.data.sample_size = None
+        settings.embedding.provider = "hash"
+        settings.embedding.cache.enabled = False
+        settings.processing.incremental = False
+        settings.processing.profile = True
+        settings.output.parquet_enabled = True
+        settings.output.parquet_dir = str(run_dir / "parquet")
+        settings.output.profile_dir = str(self.config.work_dir / "reports")
+        return settings
+
+    @staticmethod
+    def elasticsearch_available(settings: PipelineSettings) -> bool:
+        """Whether the configured Elasticsearch answers a ping."""
+        try:
+            from squack_pipeline_v2.writers.elastic.base import ElasticsearchWriterBase
+            ElasticsearchWriterBase(DuckDBConnectionManager(), settings)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def neo4j_available(settings: PipelineSettings) -> bool:
+        """Whether the configured Neo4j accepts a connection."""
+        try:
+            from neo4j import GraphDatabase
+            neo4j = settings.output.neo4j
+            with GraphDatabase.driver(neo4j.uri, auth=(neo4j.username, neo4j.get_password() or "")) as driver:
+                driver.verify_connectivity()
+            return True
+        except Exception:
+            return False
+
+    def run(self, label: str, scale: int) -> BenchmarkResult:
+        """Benchmark one scale.
+
+        Args:
+            label: Scale label used in report names
+            scale: Number of properties
+
+        Returns:
+            Benchmark result
+        """
+        from squack_pipeline_v2.orchestration.pipeline import PipelineOrchestrator
+
+        dataset = SyntheticDataGenerator(
+            self.config.work_dir / label / "data", scale, seed=self.config.seed
+        ).generate()
+        settings = self._settings_for(dataset, label)
+
+        write_elasticsearch = self.config.elasticsearch
+        if write_elasticsearch is None:
+            write_elasticsearch = self.elasticsearch_available(settings)
+        write_neo4j = self.config.neo4j
+        if write_neo4j is None:
+            write_neo4j = self.neo4j_available(settings)
+        build_graph = {e.name for e in ENTITY_TYPES.all_entities()} <= set(self.config.entities)
+        settings.output.elasticsearch_enabled = write_elasticsearch
+        settings.output.neo4j.enabled = write_neo4j and build_graph
+
+        self.logger.info(
+            f"Benchmark {label}: {dataset.counts} "
+            f"(elasticsearch={write_elasticsearch}, neo4j={settings.output.neo4j.enabled})"
+        )
+
+        orchestrator = PipelineOrchestrator(settings)
+        try:
+            tasks = [
+                task
+                for task in orchestrator.bronze_tasks() + orchestrator.silver_tasks() + orchestrator.gold_tasks()
+                if task.entity_type in self.config.entities
+            ]
+            orchestrator.run_tasks(tasks)
+
+            if build_graph:
+                orchestrator.run_graph_builder()
+            else:
+                self.logger.info("Skipping graph builder: it needs every entity")
+
+            orchestrator.run_writers(
+                write_parquet=True,
+                write_elasticsearch=write_elasticsearch,
+                write_neo4j=settings.output.neo4j.enabled
+            )
+
+            profile = orchestrator.profiler.report().model_copy(
+                update={"pipeline_id": f"benchmark_{label}"}
+            )
+        finally:
+            # The DuckDB connection stays open for the next scale
+            set_profiler(None)
+
+        report_dir = self.config.work_dir / "reports"
+        json_path, parquet_path = profile.write(report_dir)
+        table_path = report_dir / f"benchmark_{label}.md"
+        table_path.write_text(f"# Benchmark {label}\n\n{format_profile_table(profile)}\n")
+
+        return BenchmarkResult(
+            label=label,
+            dataset=dataset,
+            profile=profile,
+            report_files=[json_path, parquet_path, table_path],
+            regressions=self.compare_with_baseline(profile, label)
+        )
+
+    def compare_with_baseline(self, profile: RunProfile, label: str) -> List[str]:
+        """Regressions against the baseline report of the same scale.
+
+        Args:
+            profile: Current run profile
+            label: Scale label
+
+        Returns:
+            Regression messages (empty without a baseline)
+        """
+        if self.config.baseline_dir is None:
+            return []
+        baseline_path = self.config.baseline_dir / f"profile_benchmark_{label}.json"
+        if not baseline_path.exists():
+            self.logger.warning(f"No baseline for {label} at {baseline_path}")
+            return []
+        return compare_profiles(
+            RunProfile.load(baseline_path),
+            profile,
+            threshold=self.config.threshold,
+            min_seconds=self.config.min_seconds
+        )
@@ -69,7 +69,7 @@ class LocationBronzeIngester(BronzeIngester):
             relation = relation.limit(sample_size)
         
         # Create table from relation
-        relation.create(table_name)
+        self.connection_manager.create_table_from_relation(relation, table_name)
         
         # Get record count for metrics
         self.records_ingested = self.connection_manager.count_records(table_name)
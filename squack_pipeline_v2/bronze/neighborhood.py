@@ -84,11 +84,11 @@ class NeighborhoodBronzeIngester(BronzeIngester):
             
             if first_file:
                 # Create table from first file
-                relation.create(table_name)
+                self.connection_manager.create_table_from_relation(relation, table_name)
                 first_file = False
             else:
                 # Append to existing table
-                conn.execute(f"INSERT INTO {table_name} SELECT * FROM relation")
+                self.connection_manager.create_table_from_relation(relation, table_name, append=True)
             
             # Count records from this file
             file_count = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0] - total_records
@@ -101,7 +101,7 @@ class WikipediaBronzeIngester(BronzeIngester):
                 LEFT JOIN wiki_db.page_summaries ps ON a.pageid = ps.page_id
                 """
             
-            conn.execute(create_query)
+            self.connection_manager.execute(create_query)
             
             # Get record count for metrics
             self.records_ingested = self.connection_manager.count_records(table_name)
@@ -5,14 +5,17 @@ Key improvements:
 - Singleton pattern for connection reuse
 - SQL injection prevention via parameterized queries
 - Thread-safe operations
+- Per-thread cursors for pipeline stages that run concurrently
 """
 
 import duckdb
 import threading
+import time
 from pathlib import Path
 from typing import Optional, Any
 from contextlib import contextmanager
 
+from squack_pipeline_v2.core.profiling import PLAN_CAPTURE_PATTERN, VIEW_CAPTURE_PATTERN, get_profiler
 from squack_pipeline_v2.core.settings import DuckDBConfig
 
 
@@ -30,6 +33,7 @@ class DuckDBConnectionManager:
     _lock = threading.Lock()
     _connection: Optional[duckdb.DuckDBPyConnection] = None
     _initialized = False
+    _local = threading.local()  # Per-thread cursor set by cursor_scope()
     
     def __new__(cls, settings: DuckDBConfig = None):
         """Ensure singleton instance."""
@@ -54,10 +58,15 @@ class DuckDBConnectionManager:
         """Get or create DuckDB connection with proper configuration.
         
         Configuration is applied during connection creation for best performance.
+        Inside cursor_scope() the calling thread's own cursor is returned instead.
         
         Returns:
             Configured DuckDB connection
         """
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is not None:
+            return cursor
+        
         if self._connection is None:
             with self._lock:
                 if self._connection is None:
@@ -92,6 +101,27 @@ class DuckDBConnectionManager:
         """
         return self.connect()
     
+    @contextmanager
+    def cursor_scope(self):
+        """Route the calling thread's queries through its own cursor.
+        
+        A DuckDB connection must not be used from several threads at once.
+        Stages that run concurrently each open a cursor (a connection to the
+        same database) so every execute()/get_connection() call made by the
+        stage on this thread goes through it.
+        
+        Yields:
+            DuckDB cursor for this thread
+        """
+        previous = getattr(self._local, "cursor", None)
+        cursor = self.connect().cursor()
+        self._local.cursor = cursor
+        try:
+            yield cursor
+        finally:
+            self._local.cursor = previous
+            cursor.close()
+    
     @staticmethod
     def safe_identifier(name: str) -> str:
         """Safely quote an identifier for DuckDB SQL.
@@ -145,18 +175,101 @@ class DuckDBConnectionManager:
         """Execute a SQL query with optional parameters.
         
         Always use parameters for user-provided data to prevent SQL injection.
-        
+        In profile mode the statement is timed, CREATE TABLE ... AS and
+        INSERT INTO statements run through analyze_query() so their plan is
+        recorded, and a new view is scanned once to record its plan.
+
         Args:
             query: SQL query to execute
             parameters: Optional query parameters for safe interpolation
-            
+
         Returns:
             Query result relation
         """
         conn = self.connect()
-        if parameters:
-            return conn.execute(query, parameters)
-        return conn.execute(query)
+        profiler = get_profiler()
+        if profiler is None:
+            if parameters:
+                return conn.execute(query, parameters)
+            return conn.execute(query)
+
+        start = time.perf_counter()
+        if not parameters and profiler.capture_plans and PLAN_CAPTURE_PATTERN.match(query):
+            plan = "\n".join(str(row[-1]) for row in self.analyze_query(query))
+            profiler.record_query(query, time.perf_counter() - start, plan)
+            return conn
+
+        result = conn.execute(query, parameters) if parameters else conn.execute(query)
+        profiler.record_query(query, time.perf_counter() - start)
+        view = VIEW_CAPTURE_PATTERN.match(query)
+        if view:
+            self.record_view_plan(view.group("name"))
+        return result
+
+    def record_view_plan(self, view_name: str) -> None:
+        """Record the plan of a view in profile mode.
+
+        Creating a view runs no query, so the view is scanned once with
+        EXPLAIN ANALYZE and the plan is charged to the current stage.
+
+        Args:
+            view_name: View to scan
+        """
+        profiler = get_profiler()
+        if profiler is None or not profiler.capture_plans:
+            return
+        query = f"SELECT * FROM {view_name}"
+        start = time.perf_counter()
+        plan = "\n".join(str(row[-1]) for row in self.analyze_query(query))
+        profiler.record_query(query, time.perf_counter() - start, plan)
+
+    def create_table_from_relation(
+        self,
+        relation: duckdb.DuckDBPyRelation,
+        table_name: str,
+        append: bool = False
+    ) -> None:
+        """Materialize a Relation API relation as a table.
+
+        The relation is exposed as a short-lived view and copied with
+        CREATE TABLE ... AS (or INSERT INTO when appending) through
+        execute(), so the statement is profiled like any SQL stage.
+
+        Args:
+            relation: Relation to materialize
+            table_name: Table to create, or to append to
+            append: Insert into an existing table instead of creating it
+        """
+        source = f"{table_name}_relation"
+        relation.create_view(source)
+        try:
+            if append:
+                self.execute(f"INSERT INTO {table_name} SELECT * FROM {source}")
+            else:
+                self.execute(f"CREATE TABLE {table_name} AS SELECT * FROM {source}")
+        finally:
+            self.drop_view(source)
+
+    def create_view_from_relation(self, relation: duckdb.DuckDBPyRelation, view_name: str) -> None:
+        """Create a view from a Relation API relation.
+
+        Args:
+            relation: Relation defining the view
+            view_name: View to create
+        """
+        relation.create_view(view_name)
+        self.record_view_plan(view_name)
+
+    def memory_usage_bytes(self) -> int:
+        """Memory currently held by DuckDB (buffer manager) in bytes.
+
+        Returns:
+            Sum of duckdb_memory() usage
+        """
+        result = self.connect().execute(
+            "SELECT COALESCE(SUM(memory_usage_bytes), 0) FROM duckdb_memory()"
+        ).fetchone()
+        return int(result[0]) if result else 0
     
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists.
@@ -290,7 +403,7 @@ class DuckDBConnectionManager:
         
         # Create table from relation
         self.drop_table(table_name)
-        relation.create(table_name)
+        self.create_table_from_relation(relation, table_name)
     
     def analyze_query(self, query: str) -> list:
         """Analyze query performance using EXPLAIN ANALYZE.
@@ -301,8 +414,9 @@ class DuckDBConnectionManager:
         Returns:
             Query execution plan with timing
         """
-        # EXPLAIN is a meta-command, safe to use directly
-        return self.execute(f"EXPLAIN ANALYZE {query}").fetchall()
+        # EXPLAIN is a meta-command, safe to use directly. EXPLAIN ANALYZE
+        # executes the statement, so CREATE TABLE ... AS creates the table.
+        return self.connect().execute(f"EXPLAIN ANALYZE {query}").fetchall()
     
     def get_query_plan(self, query: str) -> list:
         """Get query execution plan using EXPLAIN.
@@ -6,6 +6,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from squack_pipeline_v2.core.profiling import profile_stage
+
 
 class PipelineLogger:
     """Centralized logging for the pipeline."""
@@ -170,7 +172,8 @@ def log_stage(stage_name: str):
             start_time = time.time()
             
             try:
-                result = func(*args, **kwargs)
+                with profile_stage(stage_name):
+                    result = func(*args, **kwargs)
                 elapsed = time.time() - start_time
                 
                 logger.info(f"{'='*60}")
@@ -0,0 +1,372 @@
+"""Per-stage profiling for pipeline runs.
+
+PROFILING ARCHITECTURE:
+=======================
+
+With --profile every stage is recorded in a StageProfile: each DAG task
+(bronze.property, silver.wikipedia, ...), each log_stage-decorated step and
+each writer sink. A StageProfile holds:
+
+- wall time, and within it SQL time (DuckDBConnectionManager.execute) and
+  embedding API time (SilverTransformer.generate_embeddings)
+- the EXPLAIN ANALYZE output of every CREATE TABLE ... AS and INSERT INTO
+  statement, which is executed through DuckDBConnectionManager.analyze_query
+  in profile mode; Bronze reads and Silver tables built with the Relation API
+  go through the same path (create_table_from_relation)
+- for Gold views, which run no query when created, the EXPLAIN ANALYZE
+  output of a full scan of the view right after CREATE VIEW
+- peak process RSS and DuckDB buffer memory when the stage ends
+- input/output records, rows/sec and bytes written to the sink
+
+Stages nest per thread, so a writer stage contains its log_stage sub-steps.
+SQL and embedding time are charged to the innermost open stage of the
+calling thread.
+
+The run report (RunProfile) is written twice. The JSON file includes the
+plans and is meant for diffing. The Parquet file has one row per stage and
+is meant for querying. compare_profiles() lists the stages that got slower
+than a threshold between two reports.
+
+KEY DESIGN DECISIONS:
+--------------------
+1. **Off By Default**: Without an active profiler the hooks cost one
+   attribute lookup
+2. **Process-Wide Memory**: Peak RSS is the process peak at stage end;
+   concurrent stages share it
+3. **Plans For Stage Statements Only**: Lookups and metadata queries only add
+   to SQL time; view plans cost one extra scan of the view in profile mode
+"""
+
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, computed_field
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Statements run through EXPLAIN ANALYZE in profile mode
+PLAN_CAPTURE_PATTERN = re.compile(
+    r"^\s*(CREATE\s+(OR\s+REPLACE\s+)?(TEMP\s+|TEMPORARY\s+)?TABLE\s+.+?\s+AS\s|INSERT\s+INTO\s)",
+    re.IGNORECASE | re.DOTALL
+)
+
+# Views whose plan is captured by scanning them once after creation
+VIEW_CAPTURE_PATTERN = re.compile(
+    r"^\s*CREATE\s+(OR\s+REPLACE\s+)?(TEMP\s+|TEMPORARY\s+)?VIEW\s+(?P<name>\S+)\s+AS\s",
+    re.IGNORECASE
+)
+
+_active_profiler: Optional["PipelineProfiler"] = None
+
+
+def get_profiler() -> Optional["PipelineProfiler"]:
+    """Profiler of the current run, or None when profiling is off."""
+    return _active_profiler
+
+
+def set_profiler(profiler: Optional["PipelineProfiler"]) -> None:
+    """Activate (or with None deactivate) profiling for the process."""
+    global _active_profiler
+    _active_profiler = profiler
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[Optional["StageProfile"]]:
+    """Record a stage when profiling is on.
+
+    Args:
+        name: Stage name
+
+    Yields:
+        The open StageProfile, or None when profiling is off
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        yield None
+        return
+    with profiler.stage(name) as stage:
+        yield stage
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the process in MB."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+class QueryProfile(BaseModel):
+    """A statement executed with EXPLAIN ANALYZE."""
+
+    sql: str = Field(description="Statement text")
+    duration_seconds: float = Field(ge=0, description="Execution time")
+    plan: str = Field(default="", description="EXPLAIN ANALYZE output")
+
+
+class StageProfile(BaseModel):
+    """Resource usage of one stage."""
+
+    name: str = Field(description="Stage name")
+    parent: Optional[str] = Field(default=None, description="Enclosing stage on the same thread")
+    thread: str = Field(description="Thread the stage ran on")
+    start_time: datetime = Field(description="Stage start")
+    end_time: Optional[datetime] = Field(default=None, description="Stage end")
+    status: str = Field(default="running", description="running, completed or failed")
+
+    sql_seconds: float = Field(default=0.0, ge=0, description="Time in DuckDB statements")
+    query_count: int = Field(default=0, ge=0, description="DuckDB statements executed")
+    embedding_seconds: float = Field(default=0.0, ge=0, description="Time in embedding calls")
+    embedding_texts: int = Field(default=0, ge=0, description="Texts sent for embedding")
+
+    input_records: int = Field(default=0, ge=0, description="Records read")
+    output_records: int = Field(default=0, ge=0, description="Records produced or written")
+    bytes_written: int = Field(default=0, ge=0, description="Bytes written to the sink")
+
+    peak_rss_mb: float = Field(default=0.0, ge=0, description="Process peak RSS at stage end")
+    duckdb_memory_mb: float = Field(default=0.0, ge=0, description="DuckDB memory in use at stage end")
+
+    queries: List[QueryProfile] = Field(default_factory=list, description="Analyzed statements")
+
+    @computed_field
+    @property
+    def duration_seconds(self) -> float:
+        """Wall time of the stage."""
+        if self.end_time is None:
+            return 0.0
+        return (self.end_time - self.start_time).total_seconds()
+
+    @computed_field
+    @property
+    def rows_per_second(self) -> float:
+        """Output records per second of wall time."""
+        if self.duration_seconds > 0:
+            return self.output_records / self.duration_seconds
+        return 0.0
+
+
+class RunProfile(BaseModel):
+    """Profiling report of one pipeline run."""
+
+    pipeline_id: str = Field(description="Pipeline run identifier")
+    start_time: datetime = Field(description="Profiling start")
+    end_time: Optional[datetime] = Field(default=None, description="Report time")
+    stages: List[StageProfile] = Field(default_factory=list, description="Stages in start order")
+
+    def durations(self) -> Dict[str, float]:
+        """Stage durations keyed by name; repeated names get a #n suffix."""
+        durations: Dict[str, float] = {}
+        for stage in self.stages:
+            key = stage.name
+            occurrence = 1
+            while key in durations:
+                occurrence += 1
+                key = f"{stage.name}#{occurrence}"
+            durations[key] = stage.duration_seconds
+        return durations
+
+    def write(self, output_dir: Path) -> Tuple[Path, Path]:
+        """Write the report as JSON (with plans) and Parquet (one row per stage).
+
+        Args:
+            output_dir: Directory for the report files
+
+        Returns:
+            Tuple of (JSON path, Parquet path)
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        json_path = output_dir / f"profile_{self.pipeline_id}.json"
+        parquet_path = output_dir / f"profile_{self.pipeline_id}.parquet"
+
+        json_path.write_text(self.model_dump_json(indent=2))
+
+        rows = [
+            {"pipeline_id": self.pipeline_id, **stage.model_dump(exclude={"queries"}), "analyzed_queries": len(stage.queries)}
+            for stage in self.stages
+        ]
+        pq.write_table(pa.Table.from_pylist(rows), parquet_path)
+
+        return json_path, parquet_path
+
+    @classmethod
+    def load(cls, path: Path) -> "RunProfile":
+        """Load a JSON report written by write().
+
+        Args:
+            path: JSON report path
+
+        Returns:
+            Run profile
+        """
+        return cls.model_validate_json(Path(path).read_text())
+
+
+def compare_profiles(
+    baseline: RunProfile,
+    current: RunProfile,
+    threshold: float = 0.2,
+    min_seconds: float = 0.5
+) -> List[str]:
+    """List stages that got slower between two runs.
+
+    Args:
+        baseline: Earlier run
+        current: Run to check
+        threshold: Allowed relative slowdown (0.2 = 20%)
+        min_seconds: Ignore slowdowns smaller than this (noise floor)
+
+    Returns:
+        One message per regressed stage
+    """
+    before = baseline.durations()
+    regressions = []
+    for name, seconds in current.durations().items():
+        previous = before.get(name)
+        if previous is None:
+            continue
+        if seconds - previous >= min_seconds and seconds > previous * (1 + threshold):
+            regressions.append(
+                f"{name}: {previous:.2f}s -> {seconds:.2f}s (+{(seconds / previous - 1) * 100 if previous else 100:.0f}%)"
+            )
+    return regressions
+
+
+class PipelineProfiler:
+    """Collects StageProfiles from all threads of a run."""
+
+    def __init__(
+        self,
+        pipeline_id: str,
+        memory_probe: Optional[Callable[[], int]] = None,
+        capture_plans: bool = True
+    ):
+        """Initialize profiler.
+
+        Args:
+            pipeline_id: Pipeline run identifier
+            memory_probe: Returns DuckDB memory usage in bytes
+            capture_plans: Run CREATE TABLE ... AS statements through EXPLAIN ANALYZE
+        """
+        self.pipeline_id = pipeline_id
+        self.memory_probe = memory_probe
+        self.capture_plans = capture_plans
+        self.start_time = datetime.now()
+        self._stages: List[StageProfile] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[StageProfile]:
+        """Open stages of the calling thread, innermost last."""
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def current(self) -> Optional[StageProfile]:
+        """Innermost open stage of the calling thread."""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageProfile]:
+        """Record a stage on the calling thread.
+
+        Args:
+            name: Stage name
+
+        Yields:
+            The open StageProfile (callers may set records and bytes)
+        """
+        stack = self._stack()
+        profile = StageProfile(
+            name=name,
+            parent=stack[-1].name if stack else None,
+            thread=threading.current_thread().name,
+            start_time=datetime.now()
+        )
+        with self._lock:
+            self._stages.append(profile)
+        stack.append(profile)
+
+        try:
+            yield profile
+            profile.status = "completed"
+        except BaseException:
+            profile.status = "failed"
+            raise
+        finally:
+            stack.pop()
+            profile.end_time = datetime.now()
+            profile.peak_rss_mb = round(peak_rss_mb(), 1)
+            if self.memory_probe is not None:
+                try:
+                    profile.duckdb_memory_mb = round(self.memory_probe() / (1024 * 1024), 1)
+                except Exception:
+                    pass
+
+    def record_query(self, sql: str, duration_seconds: float, plan: Optional[str] = None) -> None:
+        """Charge a DuckDB statement to the current stage.
+
+        Args:
+            sql: Statement text
+            duration_seconds: Execution time
+            plan: EXPLAIN ANALYZE output, if captured
+        """
+        stage = self.current()
+        if stage is None:
+            return
+        stage.sql_seconds += duration_seconds
+        stage.query_count += 1
+        if plan is not None:
+            stage.queries.append(QueryProfile(sql=sql.strip(), duration_seconds=duration_seconds, plan=plan))
+
+    def record_embedding(self, duration_seconds: float, texts: int) -> None:
+        """Charge an embedding call to the current stage.
+
+        Args:
+            duration_seconds: Time spent waiting for embeddings
+            texts: Number of texts embedded
+        """
+        stage = self.current()
+        if stage is None:
+            return
+        stage.embedding_seconds += duration_seconds
+        stage.embedding_texts += texts
+
+    @contextmanager
+    def time_embedding(self, texts: int) -> Iterator[None]:
+        """Time an embedding call and charge it to the current stage.
+
+        Args:
+            texts: Number of texts embedded
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_embedding(time.perf_counter() - start, texts)
+
+    def report(self) -> RunProfile:
+        """Snapshot of all stages recorded so far."""
+        with self._lock:
+            stages = [stage.model_copy() for stage in self._stages]
+        return RunProfile(
+            pipeline_id=self.pipeline_id,
+            start_time=self.start_time,
+            end_time=datetime.now(),
+            stages=stages
+        )
@@ -3,7 +3,7 @@
 import os
 import yaml
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
@@ -40,6 +40,14 @@ class DuckDBConfig(BaseModel):
     database_file: str = Field(default="squack_pipeline_v2/output/pipeline_v2.duckdb")
 
 
+class EmbeddingCacheConfig(BaseModel):
+    """Persistent embedding cache configuration."""
+    enabled: bool = Field(default=True)
+    database_file: str = Field(default="squack_pipeline_v2/cache/embedding_cache.duckdb")
+    max_entries: int = Field(default=1_000_000, ge=0, description="Entries kept after LRU eviction")
+    max_age_days: Optional[int] = Field(default=90, ge=0, description="Evict entries unused for this many days")
+
+
 class EmbeddingConfig(BaseModel):
     """Embedding configuration."""
     provider: str = Field(default="voyage")
@@ -48,13 +56,23 @@ class EmbeddingConfig(BaseModel):
     ollama_base_url: str = Field(default="http://localhost:11434")
     ollama_model: str = Field(default="nomic-embed-text")
     gemini_model: str = Field(default="models/embedding-001")
+    local_model: str = Field(default="sentence-transformers/all-MiniLM-L6-v2")
+    local_batch_size: int = Field(default=32, ge=1, description="Texts per forward pass for the local provider")
+    local_num_threads: Optional[int] = Field(default=None, ge=1, description="torch intra-op threads for the local provider")
+    max_concurrency: int = Field(default=4, ge=1, description="Embedding batches kept in flight")
+    requests_per_minute: Optional[int] = Field(default=None, ge=1, description="Provider request rate limit")
+    tokens_per_minute: Optional[int] = Field(default=None, ge=1, description="Provider token rate limit (estimated)")
+    max_retries: int = Field(default=5, ge=0, description="Retries per batch on 429/5xx")
+    cache: EmbeddingCacheConfig = Field(default_factory=EmbeddingCacheConfig)
 
 
 class ProcessingConfig(BaseModel):
     """Processing configuration."""
     batch_size: int = Field(default=50)
     embedding_batch_size: int = Field(default=100, description="Batch size for embedding generation to prevent memory issues")
-    max_workers: int = Field(default=2)
+    max_workers: int = Field(default=4, ge=1, description="Pipeline tasks (entity, layer) run concurrently")
+    incremental: bool = Field(default=False, description="Only process records changed since the last successful run")
+    profile: bool = Field(default=False, description="Record per-stage SQL, embedding, memory and throughput profiles")
     show_progress: bool = Field(default=True)
     rate_limit_delay: float = Field(default=0.1)
 
@@ -65,6 +83,20 @@ class ElasticsearchConfig(BaseModel):
     port: int = Field(default=9200)
     bulk_size: int = Field(default=500)
     timeout: int = Field(default=30)
+    bulk_max_bytes: int = Field(default=10 * 1024 * 1024, ge=1, description="Maximum bulk request size in bytes")
+    thread_count: int = Field(default=4, ge=1, description="Concurrent bulk requests per index (1 = streaming_bulk)")
+    validate_documents: bool = Field(default=True, description="Validate every document through Pydantic")
+    schema_check_rows: int = Field(default=100, ge=1, description="Rows validated before trusting the schema when validate_documents is off")
+    optimize_bulk_load: bool = Field(default=True, description="Disable refresh and replicas during full loads")
+
+
+class SimilarToConfig(BaseModel):
+    """Precomputed SIMILAR_TO kNN relationships between properties."""
+    enabled: bool = Field(default=True)
+    k: int = Field(default=10, ge=1, description="Similar properties stored per property")
+    min_score: Optional[float] = Field(default=None, ge=-1.0, le=1.0, description="Drop neighbours below this cosine similarity")
+    partition_by: Optional[Literal["city", "price_band"]] = Field(default=None, description="Only link properties in the same city or price band")
+    block_size: int = Field(default=1024, ge=1, description="Rows per blocked matrix multiply (block_size x N float32 in memory)")
 
 
 class Neo4jConfig(BaseModel):
@@ -73,6 +105,15 @@ class Neo4jConfig(BaseModel):
     uri: str = Field(default="bolt://localhost:7687")
     username: str = Field(default="neo4j")
     database: str = Field(default="neo4j")
+    chunk_size: int = Field(default=5000, ge=1, description="Rows per UNWIND transaction")
+    max_workers: int = Field(default=4, ge=1, description="Node labels/relationship types written concurrently")
+    max_retry_time: float = Field(default=30.0, ge=0, description="Seconds to retry transient errors per chunk")
+    load_mode: Literal["merge", "create", "admin_import"] = Field(
+        default="merge",
+        description="merge: incremental-safe MERGE; create: CREATE into an empty database; admin_import: write neo4j-admin import files"
+    )
+    import_dir: str = Field(default="output/neo4j_import", description="Directory for neo4j-admin import files")
+    similar_to: SimilarToConfig = Field(default_factory=SimilarToConfig)
     
     def get_password(self) -> Optional[str]:
         """Get Neo4j password from environment."""
@@ -83,6 +124,7 @@ class OutputConfig(BaseModel):
     """Output configuration."""
     parquet_enabled: bool = Field(default=True)
     parquet_dir: str = Field(default="output/parquet")
+    profile_dir: str = Field(default="output/profiles", description="Directory for profiling run reports")
     elasticsearch_enabled: bool = Field(default=False)
     elasticsearch: ElasticsearchConfig = Field(default_factory=ElasticsearchConfig)
     neo4j: Neo4jConfig = Field(default_factory=Neo4jConfig)
@@ -163,4 +205,8 @@ class PipelineSettings(BaseSettings):
             return self.embedding.ollama_model
         elif self.embedding.provider == "gemini":
             return self.embedding.gemini_model
+        elif self.embedding.provider == "local":
+            return self.embedding.local_model
+        elif self.embedding.provider == "hash":
+            return "feature-hash"
         return "unknown"
\ No newline at end of file
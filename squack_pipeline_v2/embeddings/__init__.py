@@ -10,13 +10,25 @@ Following DuckDB best practices:
 from squack_pipeline_v2.embeddings.providers import (
     VoyageProvider,
     OpenAIProvider,
+    OllamaProvider,
+    LocalProvider,
+    HashProvider,
     EmbeddingProvider,
     create_provider
 )
+from squack_pipeline_v2.embeddings.scheduler import ScheduledEmbeddingProvider, TokenBucket
+from squack_pipeline_v2.embeddings.cache import EmbeddingCache, EmbeddingCacheStats
 
 __all__ = [
     "VoyageProvider", 
     "OpenAIProvider",
+    "OllamaProvider",
+    "LocalProvider",
+    "HashProvider",
     "EmbeddingProvider",
-    "create_provider"
+    "create_provider",
+    "ScheduledEmbeddingProvider",
+    "TokenBucket",
+    "EmbeddingCache",
+    "EmbeddingCacheStats"
 ]
\ No newline at end of file
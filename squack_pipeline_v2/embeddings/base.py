@@ -4,7 +4,7 @@ Uses Pydantic models for API validation only, following DuckDB best practices.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -28,6 +28,20 @@ class EmbeddingResponse(BaseModel):
     token_count: int = Field(default=0, description="Total tokens processed")
 
 
+class EmbeddingAPIError(RuntimeError):
+    """Embedding API call failed, optionally with an HTTP status code."""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        """Initialize error.
+        
+        Args:
+            message: Error message
+            status_code: HTTP status returned by the provider, if any
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers.
     
@@ -35,6 +49,9 @@ class EmbeddingProvider(ABC):
     Pydantic models are used only for API validation.
     """
     
+    # Short provider identifier, part of the embedding cache key
+    provider_name: str = "custom"
+    
     def __init__(self, api_key: str, model_name: str, dimension: int):
         """Initialize provider.
         
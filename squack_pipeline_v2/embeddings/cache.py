@@ -0,0 +1,275 @@
+"""Persistent content-addressed embedding cache.
+
+EMBEDDING CACHE ARCHITECTURE:
+=============================
+
+Every pipeline run rebuilds the DuckDB database from scratch, but most
+embedding texts do not change between runs. The cache lives in its own
+DuckDB file (outside the pipeline database) and stores one vector per
+
+    (provider, model, dimension, sha256(embedding_text))
+
+so only texts that were never embedded with the same provider/model are
+sent to the provider API.
+
+KEY DESIGN DECISIONS:
+--------------------
+1. **Content Addressing**: The key is a hash of the exact embedding_text, so
+   any change to the text (or its composition in the Silver SQL) is a miss
+2. **Set-Based Lookups**: Hashes are registered as an Arrow table and joined
+   against the cache table - no per-text queries
+3. **LRU + Age Eviction**: last_used_at is touched on every hit; prune()
+   drops entries unused for max_age_days, then the least recently used
+   entries above max_entries
+4. **Counters**: hits/misses are tracked per run and reported through
+   PipelineMetrics
+"""
+
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import duckdb
+import pyarrow as pa
+from pydantic import BaseModel, Field, ConfigDict
+
+from squack_pipeline_v2.core.logging import PipelineLogger
+from squack_pipeline_v2.core.settings import EmbeddingCacheConfig
+from squack_pipeline_v2.embeddings.base import EmbeddingProvider, EmbeddingResponse
+
+
+CACHE_TABLE = "embedding_cache"
+
+
+class EmbeddingCacheStats(BaseModel):
+    """Hit/miss counters for an embedding cache."""
+
+    model_config = ConfigDict(frozen=True)
+
+    hits: int = Field(default=0, ge=0, description="Texts served from the cache")
+    misses: int = Field(default=0, ge=0, description="Texts sent to the provider")
+    entries: int = Field(default=0, ge=0, description="Entries currently stored")
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+def hash_text(text: str) -> str:
+    """Content hash used as the cache key for an embedding text.
+
+    Args:
+        text: Embedding text
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """DuckDB-backed cache of embedding vectors keyed by text content."""
+
+    def __init__(self, config: EmbeddingCacheConfig):
+        """Initialize the cache.
+
+        Args:
+            config: Cache configuration (file location, size and age limits)
+        """
+        self.config = config
+        self.logger = PipelineLogger.get_logger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._connection: Optional[duckdb.DuckDBPyConnection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def connect(self) -> duckdb.DuckDBPyConnection:
+        """Open the cache database, creating the table on first use.
+
+        Returns:
+            DuckDB connection to the cache file
+        """
+        if self._connection is None:
+            cache_path = Path(self.config.database_file)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = duckdb.connect(str(cache_path))
+            self._connection.execute(f"""
+                CREATE TABLE IF NOT EXISTS {CACHE_TABLE} (
+                    provider VARCHAR NOT NULL,
+                    model VARCHAR NOT NULL,
+                    dimension INTEGER NOT NULL,
+                    text_hash VARCHAR NOT NULL,
+                    embedding FLOAT[] NOT NULL,
+                    created_at TIMESTAMP NOT NULL,
+                    last_used_at TIMESTAMP NOT NULL,
+                    PRIMARY KEY (provider, model, dimension, text_hash)
+                )
+            """)
+        return self._connection
+
+    def close(self) -> None:
+        """Close the cache database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def generate_embeddings(self, provider: EmbeddingProvider, texts: List[str]) -> EmbeddingResponse:
+        """Return embeddings for texts, calling the provider only for cache misses.
+
+        Args:
+            provider: Embedding provider used for misses
+            texts: Texts to embed
+
+        Returns:
+            EmbeddingResponse with one vector per input text, in input order
+        """
+        hashes = [hash_text(text) for text in texts]
+
+        with self._lock:
+            cached = self._lookup(provider, hashes)
+
+        # Deduplicate misses so repeated texts are embedded once
+        miss_texts: Dict[str, str] = {}
+        for text, text_hash in zip(texts, hashes):
+            if text_hash not in cached and text_hash not in miss_texts:
+                miss_texts[text_hash] = text
+
+        token_count = 0
+        if miss_texts:
+            response = provider.generate_embeddings(list(miss_texts.values()))
+            token_count = response.token_count
+            generated = dict(zip(miss_texts.keys(), response.embeddings))
+            with self._lock:
+                self._store(provider, generated)
+            cached.update(generated)
+
+        hit_count = len(texts) - sum(1 for h in hashes if h in miss_texts)
+        # Silver stages share one cache across threads
+        with self._lock:
+            self.hits += hit_count
+            self.misses += len(texts) - hit_count
+        self.logger.info(
+            f"Embedding cache: {hit_count} hits, {len(texts) - hit_count} misses "
+            f"({len(miss_texts)} unique texts sent to provider)"
+        )
+
+        return EmbeddingResponse(
+            embeddings=[cached[text_hash] for text_hash in hashes],
+            model_name=provider.model_name,
+            dimension=provider.dimension,
+            token_count=token_count
+        )
+
+    def _lookup(self, provider: EmbeddingProvider, hashes: List[str]) -> Dict[str, List[float]]:
+        """Fetch cached vectors for hashes and mark them as recently used.
+
+        Args:
+            provider: Provider whose (name, model, dimension) scope is searched
+            hashes: Text hashes to look up
+
+        Returns:
+            Mapping of text hash to vector for every hit
+        """
+        if not hashes:
+            return {}
+
+        conn = self.connect()
+        conn.register("cache_lookup", pa.table({"text_hash": pa.array(sorted(set(hashes)))}))
+        try:
+            scope = (provider.provider_name, provider.model_name, provider.dimension)
+            rows = conn.execute(f"""
+                SELECT c.text_hash, c.embedding
+                FROM {CACHE_TABLE} c
+                JOIN cache_lookup l ON c.text_hash = l.text_hash
+                WHERE c.provider = ? AND c.model = ? AND c.dimension = ?
+            """, scope).fetchall()
+
+            if rows:
+                conn.execute(f"""
+                    UPDATE {CACHE_TABLE} SET last_used_at = ?
+                    WHERE provider = ? AND model = ? AND dimension = ?
+                    AND text_hash IN (SELECT text_hash FROM cache_lookup)
+                """, (datetime.now(), *scope))
+        finally:
+            conn.unregister("cache_lookup")
+
+        return {text_hash: list(embedding) for text_hash, embedding in rows}
+
+    def _store(self, provider: EmbeddingProvider, vectors: Dict[str, List[float]]) -> None:
+        """Insert newly generated vectors.
+
+        Args:
+            provider: Provider that generated the vectors
+            vectors: Mapping of text hash to vector
+        """
+        now = datetime.now()
+        conn = self.connect()
+        conn.register("cache_insert", pa.table({
+            "text_hash": pa.array(list(vectors.keys())),
+            "embedding": pa.array(list(vectors.values()), type=pa.list_(pa.float32())),
+        }))
+        try:
+            conn.execute(f"""
+                INSERT OR REPLACE INTO {CACHE_TABLE}
+                SELECT ?, ?, ?, text_hash, embedding, ?, ?
+                FROM cache_insert
+            """, (provider.provider_name, provider.model_name, provider.dimension, now, now))
+        finally:
+            conn.unregister("cache_insert")
+
+    def prune(self) -> int:
+        """Evict stale and least recently used entries.
+
+        Entries not used within max_age_days are removed first; if more than
+        max_entries remain, the least recently used ones are removed.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            conn = self.connect()
+            before = self._count(conn)
+
+            if self.config.max_age_days is not None:
+                cutoff = datetime.now() - timedelta(days=self.config.max_age_days)
+                conn.execute(f"DELETE FROM {CACHE_TABLE} WHERE last_used_at < ?", (cutoff,))
+
+            conn.execute(f"""
+                DELETE FROM {CACHE_TABLE}
+                WHERE (provider, model, dimension, text_hash) IN (
+                    SELECT provider, model, dimension, text_hash
+                    FROM {CACHE_TABLE}
+                    ORDER BY last_used_at DESC
+                    OFFSET ?
+                )
+            """, (self.config.max_entries,))
+
+            removed = before - self._count(conn)
+
+        if removed:
+            self.logger.info(f"Pruned {removed} embedding cache entries")
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self.connect().execute(f"DELETE FROM {CACHE_TABLE}")
+
+    def get_stats(self) -> EmbeddingCacheStats:
+        """Get hit/miss counters for this run and the current cache size.
+
+        Returns:
+            Cache statistics
+        """
+        with self._lock:
+            entries = self._count(self.connect())
+        return EmbeddingCacheStats(hits=self.hits, misses=self.misses, entries=entries)
+
+    @staticmethod
+    def _count(conn: duckdb.DuckDBPyConnection) -> int:
+        """Count stored entries."""
+        return conn.execute(f"SELECT COUNT(*) FROM {CACHE_TABLE}").fetchone()[0]
@@ -22,6 +22,9 @@ KEY DESIGN DECISIONS:
    - Voyage: 10 texts per batch (API recommendation for optimal performance)
    - OpenAI: 100 texts per batch (supports larger batches efficiently)
    - Ollama: 1 text at a time (local model processing)
+   - Local: length-sorted, dynamically padded batches run in-process
+   - Batches are kept in flight concurrently by ScheduledEmbeddingProvider
+     (see scheduler.py), which create_provider applies to every provider
 
 TOKENIZATION DETAILS BY PROVIDER:
 ---------------------------------
@@ -47,6 +50,21 @@ OLLAMA (LOCAL):
 - **Special Tokens**: Model-specific
 - **Dimension**: 768 for nomic-embed-text
 
+LOCAL (IN-PROCESS CPU):
+- **Tokenizer**: HuggingFace tokenizer shipped with the sentence-transformers model
+- **Context Window**: Model max_seq_length (256 for all-MiniLM-L6-v2)
+- **Truncation**: Client-side by the tokenizer
+- **Special Tokens**: [CLS]/[SEP] added by the tokenizer
+- **Dimension**: 384 for all-MiniLM-L6-v2
+- **No Network**: Runs on air-gapped nodes once the model is in the local cache
+
+HASH (DETERMINISTIC, OFFLINE):
+- **Tokenizer**: Lowercased word tokens (regex \\w+)
+- **Model**: Signed feature hashing of tokens into a fixed-size vector
+- **Dimension**: 384 by default
+- **Use**: Benchmarks and tests - same text always gives the same vector,
+  texts sharing words are similar, no model download or network
+
 EMBEDDING GENERATION FLOW:
 -------------------------
 1. Text received from Silver layer transformers (already concatenated)
@@ -55,7 +73,7 @@ EMBEDDING GENERATION FLOW:
 4. Provider tokenizes text internally
 5. Tokens converted to embeddings by model
 6. Dense vectors returned to caller
-7. Vectors stored in DuckDB as DOUBLE[] arrays
+7. Vectors stored in DuckDB as fixed FLOAT[dim] arrays
 
 NO PRE-PROCESSING:
 -----------------
@@ -72,12 +90,17 @@ Following DuckDB best practices:
 """
 
 from typing import List, Optional
+import hashlib
 import logging
+import re
+import numpy as np
 from pydantic import BaseModel, Field
 from squack_pipeline_v2.embeddings.base import (
+    EmbeddingAPIError,
     EmbeddingProvider,
     EmbeddingResponse
 )
+from squack_pipeline_v2.embeddings.scheduler import ScheduledEmbeddingProvider
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +128,8 @@ class VoyageProvider(EmbeddingProvider):
     - No LlamaIndex preprocessing - text sent directly to API
     """
     
+    provider_name = "voyage"
+    
     def __init__(self, api_key: str, model_name: str, dimension: int):
         """Initialize Voyage provider.
         
@@ -182,6 +207,8 @@ class OpenAIProvider(EmbeddingProvider):
     - No client-side chunking or LlamaIndex usage
     """
     
+    provider_name = "openai"
+    
     def __init__(self, api_key: str, model_name: str, dimension: int):
         """Initialize OpenAI provider.
         
@@ -254,6 +281,8 @@ class OllamaProvider(EmbeddingProvider):
     - No LlamaIndex or pre-processing required
     """
     
+    provider_name = "ollama"
+    
     def __init__(self, model_name: str, dimension: int, base_url: str):
         """Initialize Ollama provider.
         
@@ -264,6 +293,14 @@ class OllamaProvider(EmbeddingProvider):
         """
         super().__init__(api_key="", model_name=model_name, dimension=dimension)
         self.base_url = base_url
+        self._session: Optional[object] = None
+    
+    def _get_session(self):
+        """Lazy load a keep-alive HTTP session shared by concurrent requests."""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
     
     def generate_embeddings(self, texts: List[str]) -> EmbeddingResponse:
         """Generate embeddings using local Ollama.
@@ -281,16 +318,14 @@ class OllamaProvider(EmbeddingProvider):
         Returns:
             EmbeddingResponse with embeddings
         """
-        import requests
-        import json
-        
         request = self.validate_request(texts)
+        session = self._get_session()
         embeddings = []
         
         # Ollama processes one at a time - no batch support
         # Each model has its own tokenizer (nomic uses SentencePiece)
         for text in request.texts:
-            response = requests.post(
+            response = session.post(
                 f"{self.base_url}/api/embeddings",
                 json={
                     "model": request.model_name,
@@ -302,7 +337,10 @@ class OllamaProvider(EmbeddingProvider):
                 result = response.json()
                 embeddings.append(result["embedding"])
             else:
-                raise RuntimeError(f"Ollama error: {response.text}")
+                raise EmbeddingAPIError(
+                    f"Ollama error: {response.text}",
+                    status_code=response.status_code
+                )
         
         return EmbeddingResponse(
             embeddings=embeddings,
@@ -316,7 +354,201 @@ class OllamaProvider(EmbeddingProvider):
         return 1  # Process one at a time for local model
 
 
-def create_provider(provider_type: str, api_key: str = "", model_name: str = "", base_url: str = None) -> EmbeddingProvider:
+class LocalProvider(EmbeddingProvider):
+    """In-process CPU embedding provider using sentence-transformers.
+    
+    TOKENIZATION:
+    - Uses the HuggingFace tokenizer bundled with the model
+    - Tokenization happens in-process - no server or API involved
+    - Texts longer than max_seq_length are truncated by the tokenizer
+    
+    BATCHING:
+    - Texts are sorted by length so each batch holds similar-length texts
+    - Each batch is padded only to its own longest text (dynamic padding)
+    - Vectors are returned in the original input order
+    - torch intra-op threads are capped at num_threads
+    - Weights are loaded from safetensors, which are memory-mapped
+    """
+    
+    provider_name = "local"
+    
+    def __init__(
+        self,
+        model_name: str,
+        dimension: Optional[int] = None,
+        batch_size: int = 32,
+        num_threads: Optional[int] = None,
+        normalize: bool = True
+    ):
+        """Initialize local provider.
+        
+        Args:
+            model_name: sentence-transformers model name or local path
+            dimension: Embedding dimension (read from the model if None)
+            batch_size: Texts per forward pass
+            num_threads: torch intra-op threads (torch default if None)
+            normalize: L2-normalize vectors
+        """
+        super().__init__(api_key="", model_name=model_name, dimension=dimension or 0)
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+        self.normalize = normalize
+        self._model: Optional[object] = None
+        
+        if dimension is None:
+            self.dimension = self._get_model().get_sentence_embedding_dimension()
+    
+    def _get_model(self):
+        """Lazy load the sentence-transformers model on CPU."""
+        if self._model is None:
+            try:
+                import torch
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError("sentence-transformers package not installed")
+            
+            if self.num_threads:
+                torch.set_num_threads(self.num_threads)
+            
+            # low_cpu_mem_usage loads safetensors weights via mmap instead of
+            # materializing a second copy in memory
+            self._model = SentenceTransformer(
+                self.model_name,
+                device="cpu",
+                model_kwargs={"low_cpu_mem_usage": True}
+            )
+        return self._model
+    
+    def generate_embeddings(self, texts: List[str]) -> EmbeddingResponse:
+        """Generate embeddings in-process.
+        
+        TOKENIZATION PROCESS:
+        1. Texts sorted by length and split into batches
+        2. Each batch tokenized and padded to its longest text
+        3. Forward pass on CPU, mean pooling to one vector per text
+        4. Vectors placed back in input order
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            EmbeddingResponse with embeddings
+        """
+        request = self.validate_request(texts)
+        model = self._get_model()
+        
+        # Longest first, so the first batch surfaces memory problems early
+        order = sorted(range(len(request.texts)), key=lambda i: len(request.texts[i]), reverse=True)
+        embeddings: List[Optional[List[float]]] = [None] * len(request.texts)
+        
+        for start in range(0, len(order), self.batch_size):
+            batch_indices = order[start:start + self.batch_size]
+            vectors = model.encode(
+                [request.texts[i] for i in batch_indices],
+                batch_size=len(batch_indices),
+                convert_to_numpy=True,
+                normalize_embeddings=self.normalize,
+                show_progress_bar=False
+            )
+            for i, vector in zip(batch_indices, vectors):
+                embeddings[i] = vector.tolist()
+        
+        return EmbeddingResponse(
+            embeddings=embeddings,
+            model_name=self.model_name,
+            dimension=self.dimension,
+            token_count=0  # Token counts are not tracked locally
+        )
+    
+    def get_batch_size(self) -> int:
+        """Get recommended batch size for local inference.
+        
+        Chunks handed over by the scheduler are several forward passes
+        long, so length sorting has enough texts to group.
+        """
+        return self.batch_size * 16
+
+
+class HashProvider(EmbeddingProvider):
+    """Deterministic offline provider using signed feature hashing.
+    
+    Each lowercased word token is hashed (blake2b) to a vector slot and a
+    sign; a text's vector is the L2-normalized sum of its tokens. Vectors are
+    stable across runs and machines, so benchmarks and cache tests measure
+    the pipeline rather than a model.
+    """
+    
+    provider_name = "hash"
+    
+    TOKEN_PATTERN = re.compile(r"\w+")
+    
+    def __init__(self, model_name: str = "feature-hash", dimension: int = 384):
+        """Initialize hash provider.
+        
+        Args:
+            model_name: Name recorded with the vectors
+            dimension: Embedding dimension
+        """
+        super().__init__(api_key="", model_name=model_name, dimension=dimension)
+        self._slots: dict = {}
+    
+    def _slot(self, token: str) -> int:
+        """Signed vector slot of a token (index + 1, negative for -1)."""
+        slot = self._slots.get(token)
+        if slot is None:
+            digest = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+            index = (digest >> 1) % self.dimension + 1
+            slot = -index if digest & 1 else index
+            self._slots[token] = slot
+        return slot
+    
+    def generate_embeddings(self, texts: List[str]) -> EmbeddingResponse:
+        """Generate feature-hashed embeddings.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            EmbeddingResponse with unit-length embeddings (zero for empty texts)
+        """
+        request = self.validate_request(texts)
+        vectors = np.zeros((len(request.texts), self.dimension), dtype=np.float32)
+        token_count = 0
+        
+        for row, text in enumerate(request.texts):
+            slots = [self._slot(token) for token in self.TOKEN_PATTERN.findall(text.lower())]
+            token_count += len(slots)
+            if slots:
+                slots = np.asarray(slots)
+                np.add.at(vectors[row], np.abs(slots) - 1, np.sign(slots).astype(np.float32))
+        
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=vectors, where=norms > 0)
+        
+        return EmbeddingResponse(
+            embeddings=vectors.tolist(),
+            model_name=self.model_name,
+            dimension=self.dimension,
+            token_count=token_count
+        )
+    
+    def get_batch_size(self) -> int:
+        """Get recommended batch size for hashing (pure CPU, no requests)."""
+        return 1000
+
+
+def create_provider(
+    provider_type: str,
+    api_key: str = "",
+    model_name: str = "",
+    base_url: str = None,
+    max_concurrency: int = 4,
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+    max_retries: int = 5,
+    local_batch_size: int = 32,
+    local_num_threads: Optional[int] = None
+) -> EmbeddingProvider:
     """Factory function to create embedding providers.
     
     IMPORTANT ARCHITECTURE NOTES:
@@ -325,32 +557,50 @@ def create_provider(provider_type: str, api_key: str = "", model_name: str = "",
     - Text is sent directly to providers without pre-processing
     - No text chunking - providers handle long texts via truncation
     - Embeddings are generated in batches for efficiency
+    - Batches run concurrently behind request/token rate limits with
+      jittered retry on 429/5xx (ScheduledEmbeddingProvider)
     
     TOKENIZER SUMMARY BY PROVIDER:
     - Voyage: Proprietary tokenizer, 16k token limit
     - OpenAI: tiktoken (cl100k_base), 8k token limit  
     - Ollama: Model-specific (e.g., SentencePiece), varies by model
+    - Local: HuggingFace tokenizer of the sentence-transformers model
+    - Hash: Lowercased word tokens, no model
     
     Args:
-        provider_type: Type of provider (voyage, openai, ollama)
+        provider_type: Type of provider (voyage, openai, ollama, local, hash)
         api_key: API key if required
         model_name: Model name to use
         base_url: Base URL for Ollama provider
+        max_concurrency: Batches kept in flight at once
+        requests_per_minute: Optional request rate limit
+        tokens_per_minute: Optional estimated token rate limit
+        max_retries: Retries per batch for rate-limit and server errors
+        local_batch_size: Texts per forward pass for the local provider
+        local_num_threads: torch intra-op threads for the local provider
         
     Returns:
-        EmbeddingProvider instance
+        EmbeddingProvider instance wrapped in the concurrent scheduler
     """
     # Default dimensions for each provider/model
     default_dimensions = {
         "voyage": {"voyage-3": 1024},
         "openai": {"text-embedding-3-small": 1536, "text-embedding-3-large": 3072},
-        "ollama": {"nomic-embed-text": 768}
+        "ollama": {"nomic-embed-text": 768},
+        "local": {
+            "sentence-transformers/all-MiniLM-L6-v2": 384,
+            "BAAI/bge-small-en-v1.5": 384,
+            "BAAI/bge-base-en-v1.5": 768
+        },
+        "hash": {"feature-hash": 384}
     }
     
     providers = {
         "voyage": VoyageProvider,
         "openai": OpenAIProvider,
-        "ollama": OllamaProvider
+        "ollama": OllamaProvider,
+        "local": LocalProvider,
+        "hash": HashProvider
     }
     
     if provider_type not in providers:
@@ -363,14 +613,38 @@ def create_provider(provider_type: str, api_key: str = "", model_name: str = "",
     dimension = provider_dims.get(model_name, 1024)  # fallback to 1024
     
     if provider_type == "ollama":
-        return provider_class(
+        provider = provider_class(
             model_name=model_name or "nomic-embed-text", 
             dimension=dimension,
             base_url=base_url or "http://localhost:11434"
         )
+    elif provider_type == "local":
+        model_name = model_name or "sentence-transformers/all-MiniLM-L6-v2"
+        provider = provider_class(
+            model_name=model_name,
+            dimension=provider_dims.get(model_name),  # read from model if unknown
+            batch_size=local_batch_size,
+            num_threads=local_num_threads
+        )
+        # The model already uses every intra-op thread; concurrent batches
+        # would only contend for the same cores
+        max_concurrency = 1
+    elif provider_type == "hash":
+        model_name = model_name or "feature-hash"
+        provider = provider_class(model_name=model_name, dimension=provider_dims.get(model_name, 384))
+        max_concurrency = 1
     else:
-        return provider_class(
+        provider = provider_class(
             api_key=api_key, 
             model_name=model_name, 
             dimension=dimension
-        )
\ No newline at end of file
+        )
+    
+    # Every provider gets concurrent, rate-limited batch scheduling
+    return ScheduledEmbeddingProvider(
+        provider,
+        max_concurrency=max_concurrency,
+        requests_per_minute=requests_per_minute,
+        tokens_per_minute=tokens_per_minute,
+        max_retries=max_retries
+    )
\ No newline at end of file
@@ -0,0 +1,216 @@
+"""Concurrent, rate-limited scheduling of embedding requests.
+
+EMBEDDING SCHEDULER ARCHITECTURE:
+=================================
+
+Providers expose a single blocking generate_embeddings() call and a
+recommended batch size (Voyage: 10, OpenAI: 100, Ollama: 1). Sending those
+batches one after another leaves the pipeline waiting on network round
+trips. ScheduledEmbeddingProvider wraps any provider and:
+
+1. **Splits** the texts into provider-sized batches
+2. **Keeps N batches in flight** on a thread pool
+3. **Rate limits** with token buckets for requests/min and tokens/min
+4. **Retries** 429 and 5xx responses with jittered exponential backoff
+5. **Reassembles** the vectors in the original input order
+
+The wrapper is itself an EmbeddingProvider, so Silver transformers and the
+embedding cache use it transparently (create_provider returns it).
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from squack_pipeline_v2.core.logging import PipelineLogger
+from squack_pipeline_v2.embeddings.base import EmbeddingProvider, EmbeddingResponse
+
+
+# HTTP statuses worth retrying: rate limited or transient server errors
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def get_status_code(error: Exception) -> Optional[int]:
+    """Extract the HTTP status from a provider client exception.
+
+    Voyage errors expose ``http_status``, OpenAI errors ``status_code`` and
+    requests errors carry a ``response``.
+
+    Args:
+        error: Exception raised by a provider
+
+    Returns:
+        HTTP status code, or None if the error has none
+    """
+    for attribute in ("status_code", "http_status"):
+        status = getattr(error, attribute, None)
+        if isinstance(status, int):
+            return status
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def estimate_tokens(texts: List[str]) -> int:
+    """Cheap token estimate used for tokens/min budgeting (~4 chars per token).
+
+    Args:
+        texts: Texts in a batch
+
+    Returns:
+        Estimated token count
+    """
+    return sum(len(text) // 4 + 1 for text in texts)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at rate_per_minute."""
+
+    def __init__(self, rate_per_minute: int):
+        """Initialize a full bucket.
+
+        Args:
+            rate_per_minute: Bucket capacity and refill rate per minute
+        """
+        self.capacity = float(rate_per_minute)
+        self.refill_per_second = rate_per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: int = 1) -> float:
+        """Block until amount tokens are available, then take them.
+
+        Requests larger than the capacity wait for a full bucket.
+
+        Args:
+            amount: Tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.refill_per_second
+                )
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) / self.refill_per_second
+            time.sleep(delay)
+            waited += delay
+
+
+class ScheduledEmbeddingProvider(EmbeddingProvider):
+    """Provider wrapper that runs batches concurrently behind rate limits."""
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = 5,
+        backoff_base_seconds: float = 1.0,
+        backoff_max_seconds: float = 60.0
+    ):
+        """Wrap a provider.
+
+        Args:
+            provider: Provider that performs the actual API calls
+            max_concurrency: Batches kept in flight at once
+            requests_per_minute: Optional request rate limit
+            tokens_per_minute: Optional (estimated) token rate limit
+            max_retries: Retries per batch for 429/5xx responses
+            backoff_base_seconds: First retry delay before jitter
+            backoff_max_seconds: Upper bound on a single retry delay
+        """
+        super().__init__(provider.api_key, provider.model_name, provider.dimension)
+        self.provider = provider
+        self.provider_name = provider.provider_name
+        self.max_concurrency = max(1, max_concurrency)
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.logger = PipelineLogger.get_logger(self.__class__.__name__)
+
+    def generate_embeddings(self, texts: List[str]) -> EmbeddingResponse:
+        """Embed texts in concurrent provider-sized batches.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            EmbeddingResponse with vectors in input order
+        """
+        batch_size = max(1, self.provider.get_batch_size())
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+
+        if len(batches) <= 1 or self.max_concurrency == 1:
+            responses = [self._run_batch(batch) for batch in batches]
+        else:
+            workers = min(self.max_concurrency, len(batches))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embedding") as executor:
+                # map() yields results in submission order
+                responses = list(executor.map(self._run_batch, batches))
+
+        embeddings = [vector for response in responses for vector in response.embeddings]
+        self.logger.info(
+            f"Embedded {len(texts)} texts in {len(batches)} batches "
+            f"(concurrency {min(self.max_concurrency, max(1, len(batches)))})"
+        )
+
+        return EmbeddingResponse(
+            embeddings=embeddings,
+            model_name=self.model_name,
+            dimension=self.dimension,
+            token_count=sum(response.token_count for response in responses)
+        )
+
+    def _run_batch(self, batch: List[str]) -> EmbeddingResponse:
+        """Send one batch, waiting on rate limits and retrying transient errors.
+
+        Args:
+            batch: Texts in this batch
+
+        Returns:
+            Provider response for the batch
+        """
+        attempt = 0
+        while True:
+            if self.request_bucket:
+                self.request_bucket.acquire(1)
+            if self.token_bucket:
+                self.token_bucket.acquire(estimate_tokens(batch))
+
+            try:
+                return self.provider.generate_embeddings(batch)
+            except Exception as e:
+                status = get_status_code(e)
+                if status not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+                    raise
+
+                # Full jitter: uniform over [0, min(cap, base * 2^attempt)]
+                delay = random.uniform(
+                    0, min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** attempt)
+                )
+                attempt += 1
+                self.logger.warning(
+                    f"Embedding batch failed with HTTP {status}; "
+                    f"retry {attempt}/{self.max_retries} in {delay:.2f}s"
+                )
+                time.sleep(delay)
+
+    def get_batch_size(self) -> int:
+        """Batch size of the wrapped provider."""
+        return self.provider.get_batch_size()
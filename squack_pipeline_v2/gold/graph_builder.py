@@ -4,12 +4,16 @@ This module creates graph node and relationship tables in the Gold layer
 using DuckDB's native SQL capabilities. All changes are additive.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+import numpy as np
+import pyarrow as pa
 from pydantic import BaseModel, Field, ConfigDict
 
 from squack_pipeline_v2.core.connection import DuckDBConnectionManager
 from squack_pipeline_v2.core.logging import PipelineLogger, log_stage
+from squack_pipeline_v2.core.settings import SimilarToConfig
+from squack_pipeline_v2.gold.similarity import top_k_similar
 
 
 class NodeTableDefinition(BaseModel):
@@ -54,13 +58,19 @@ class GoldGraphBuilder:
     without modifying existing Gold tables.
     """
     
-    def __init__(self, connection_manager: DuckDBConnectionManager):
+    def __init__(
+        self,
+        connection_manager: DuckDBConnectionManager,
+        similar_to: Optional[SimilarToConfig] = None
+    ):
         """Initialize graph builder.
         
         Args:
             connection_manager: DuckDB connection manager
+            similar_to: Precomputed SIMILAR_TO configuration
         """
         self.connection_manager = connection_manager
+        self.similar_to = similar_to or SimilarToConfig()
         self.logger = PipelineLogger.get_logger(self.__class__.__name__)
     
     @log_stage("Graph Builder: Property nodes")
@@ -892,6 +902,85 @@ class GoldGraphBuilder:
         
         return table_name
     
+    @log_stage("Graph Builder: SIMILAR_TO relationships")
+    def build_similar_to_relationships(self) -> str:
+        """Build SIMILAR_TO relationships (Property -> Property).
+        
+        Each property is linked to its k most similar properties by cosine
+        similarity of the embeddings in gold_graph_properties, computed with
+        blocked matrix multiplies (see gold/similarity.py). The score is kept
+        as the relationship weight, with the neighbour's rank.
+        
+        Returns:
+            Name of the created table
+        """
+        table_name = "gold_graph_rel_similar_to"
+        config = self.similar_to
+        
+        self.connection_manager.execute(f"DROP TABLE IF EXISTS {table_name}")
+        
+        # Partition label per property; price bands come from IN_PRICE_RANGE
+        group_sql = {"city": "p.city", "price_band": "r.to_id"}.get(config.partition_by, "NULL")
+        price_band_join = (
+            "LEFT JOIN gold_graph_rel_in_price_range r ON r.from_id = 'property:' || p.listing_id"
+            if config.partition_by == "price_band" else ""
+        )
+        
+        # All vectors must share one dimension to form a matrix
+        embeddings = self.connection_manager.execute(f"""
+        SELECT 
+            p.listing_id,
+            {group_sql} as similarity_group,
+            p.embedding::FLOAT[] as embedding
+        FROM gold_graph_properties p
+        {price_band_join}
+        WHERE p.embedding IS NOT NULL
+        AND len(p.embedding::FLOAT[]) = (
+            SELECT max(len(embedding::FLOAT[])) FROM gold_graph_properties
+        )
+        ORDER BY p.listing_id
+        """).to_arrow_table()
+        
+        listing_ids = np.array(embeddings.column("listing_id").to_pylist(), dtype=object)
+        values = np.asarray(embeddings.column("embedding").combine_chunks().flatten(), dtype=np.float32)
+        matrix = values.reshape(len(listing_ids), len(values) // max(len(listing_ids), 1))
+        groups = embeddings.column("similarity_group").to_pylist() if config.partition_by else None
+        
+        source, target, score, rank = top_k_similar(
+            matrix, config.k, config.block_size, groups, config.min_score
+        )
+        
+        pairs = pa.table({
+            "source_id": pa.array(listing_ids[source].tolist(), type=pa.string()),
+            "target_id": pa.array(listing_ids[target].tolist(), type=pa.string()),
+            "score": pa.array(score, type=pa.float32()),
+            "rank": pa.array(rank, type=pa.int32()),
+        })
+        
+        conn = self.connection_manager.get_connection()
+        conn.register("similar_to_pairs", pairs)
+        try:
+            self.connection_manager.execute(f"""
+            CREATE TABLE {table_name} AS
+            SELECT 
+                'property:' || source_id as from_id,
+                'property:' || target_id as to_id,
+                'SIMILAR_TO' as relationship_type,
+                CAST(score AS DOUBLE) as weight,
+                rank
+            FROM similar_to_pairs
+            """)
+        finally:
+            conn.unregister("similar_to_pairs")
+        
+        count = self.connection_manager.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        self.logger.info(
+            f"Created {table_name}: {count} SIMILAR_TO relationships "
+            f"({len(listing_ids)} properties with embeddings, k={config.k})"
+        )
+        
+        return table_name
+    
     @log_stage("Graph Builder: Build all")
     def build_all_graph_tables(self) -> GraphBuildMetadata:
         """Build all graph node and relationship tables.
@@ -942,6 +1031,10 @@ class GoldGraphBuilder:
         # Geographic hierarchy relationships from location data
         metadata.relationship_tables.append(self.build_geographic_hierarchy_relationships())
         
+        # Precomputed embedding similarity (after IN_PRICE_RANGE, used for price bands)
+        if self.similar_to.enabled:
+            metadata.relationship_tables.append(self.build_similar_to_relationships())
+        
         # Calculate totals
         for table in metadata.node_tables:
             try:
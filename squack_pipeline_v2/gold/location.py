@@ -34,8 +34,6 @@ class LocationGoldEnricher(GoldEnricher):
             input_table: Silver input table
             output_table: Gold output view
         """
-        conn = self.connection_manager.get_connection()
-        
         # Create enriched view with all hierarchy data
         query = f"""
         CREATE VIEW {output_table} AS
@@ -80,7 +78,7 @@ class LocationGoldEnricher(GoldEnricher):
         FROM {input_table}
         """
         
-        conn.execute(query)
+        self.connection_manager.execute(query)
         
         self.enrichments_applied.append("hierarchical_ids")
         self.enrichments_applied.append("graph_node_ids")
@@ -161,7 +161,7 @@ class NeighborhoodGoldEnricher(GoldEnricher):
         """)
         
         # Create view using Relation API
-        filtered.create_view(output_table)
+        self.connection_manager.create_view_from_relation(filtered, output_table)
         
         # Track enrichments applied
         self.enrichments_applied.extend([
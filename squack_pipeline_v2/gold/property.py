@@ -144,7 +144,7 @@ class PropertyGoldEnricher(GoldEnricher):
         """)
         
         # Create view using Relation API
-        filtered.create_view(output_table)
+        self.connection_manager.create_view_from_relation(filtered, output_table)
         
         # Track enrichments applied
         self.enrichments_applied.extend([
@@ -227,7 +227,7 @@ class WikipediaGoldEnricher(GoldEnricher):
         
         # Deduplicate by page_id - keep the record with the highest article_quality_score
         # This handles the duplicate page_ids in the source data
-        conn.execute(f"""
+        self.connection_manager.execute(f"""
             CREATE TABLE {output_table} AS
             WITH ranked AS (
                 SELECT *, 
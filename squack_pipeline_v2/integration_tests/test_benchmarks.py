@@ -0,0 +1,95 @@
+"""Integration tests for the synthetic-scale benchmarks.
+
+Tests that the generator writes deterministic sources the Bronze layer
+accepts, that the hash provider is stable, and that a small benchmark run
+produces a profile report that can be compared against a baseline.
+"""
+
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+from squack_pipeline_v2.benchmarks import (
+    BenchmarkConfig,
+    BenchmarkRunner,
+    SyntheticDataGenerator,
+    format_profile_table,
+    parse_scale,
+)
+from squack_pipeline_v2.core.connection import DuckDBConnectionManager
+from squack_pipeline_v2.core.profiling import compare_profiles
+from squack_pipeline_v2.core.settings import PipelineSettings
+from squack_pipeline_v2.embeddings.providers import HashProvider
+
+
+def test_parse_scale():
+    """Named scales and plain numbers are accepted."""
+    assert parse_scale("10k") == 10_000
+    assert parse_scale("1M") == 1_000_000
+    assert parse_scale("2500") == 2500
+    with pytest.raises(ValueError):
+        parse_scale("huge")
+
+
+def test_generator_is_deterministic(tmp_path):
+    """Same scale and seed give identical files and the expected counts."""
+    first = SyntheticDataGenerator(tmp_path / "a", 200, seed=7).generate()
+    second = SyntheticDataGenerator(tmp_path / "b", 200, seed=7).generate()
+
+    assert first.counts["property"] == 200
+    assert first.counts["neighborhood"] == 5
+    assert first.counts == second.counts
+    assert first.properties_file.read_text() == second.properties_file.read_text()
+
+    properties = json.loads(first.properties_file.read_text())
+    assert len({p["listing_id"] for p in properties}) == 200
+
+    with sqlite3.connect(first.wikipedia_db) as conn:
+        articles = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+    assert articles == first.counts["wikipedia"]
+
+
+def test_hash_provider_is_deterministic():
+    """Equal texts map to equal unit vectors; different texts do not."""
+    provider = HashProvider()
+    first, second, other = provider.generate_embeddings(
+        ["Victorian home near the park", "Victorian home near the park", "Modern condo downtown"]
+    ).embeddings
+
+    assert len(first) == provider.dimension
+    assert first == second
+    assert first != other
+    assert np.linalg.norm(first) == pytest.approx(1.0)
+
+
+def test_benchmark_run_writes_report(tmp_path):
+    """A tiny run profiles every task and compares cleanly with itself."""
+    settings = PipelineSettings()
+    settings.duckdb.database_file = ":memory:"
+    DuckDBConnectionManager(settings.duckdb)
+
+    runner = BenchmarkRunner(
+        BenchmarkConfig(
+            work_dir=tmp_path,
+            entities=["property", "neighborhood", "location"],
+            elasticsearch=False,
+            neo4j=False
+        ),
+        settings
+    )
+    result = runner.run("tiny", 200)
+
+    names = [stage.name for stage in result.profile.stages]
+    for name in ("bronze.property", "silver.property", "gold.property", "writer.parquet"):
+        assert name in names
+    assert "bronze.wikipedia" not in names
+    assert all(path.exists() for path in result.report_files)
+
+    silver = next(s for s in result.profile.stages if s.name == "Silver: Property Transformation")
+    assert silver.embedding_texts == 200
+
+    table = format_profile_table(result.profile)
+    assert table.count("\n") == len(result.profile.stages) + 1
+    assert compare_profiles(result.profile, result.profile) == []
@@ -1,15 +1,24 @@
 """Integration tests for the new modular Elasticsearch writer."""
 
+import duckdb
 import pytest
-from unittest.mock import Mock, MagicMock, patch
-from datetime import datetime, date
+from typing import ClassVar
+from unittest.mock import MagicMock, patch
 
 from squack_pipeline_v2.core.connection import DuckDBConnectionManager
 from squack_pipeline_v2.core.settings import PipelineSettings, DuckDBConfig
 from squack_pipeline_v2.writers.elastic import ElasticsearchWriter
-from squack_pipeline_v2.writers.elastic.property import PropertyDocument, transform_property
-from squack_pipeline_v2.writers.elastic.neighborhood import NeighborhoodDocument, transform_neighborhood
-from squack_pipeline_v2.writers.elastic.wikipedia import WikipediaDocument, transform_wikipedia
+from squack_pipeline_v2.writers.elastic.base import document_query
+from squack_pipeline_v2.writers.elastic.property import PropertyDocument, PROPERTY_DOCUMENT_FIELDS
+from squack_pipeline_v2.writers.elastic.neighborhood import NeighborhoodDocument, NEIGHBORHOOD_DOCUMENT_FIELDS
+from squack_pipeline_v2.writers.elastic.wikipedia import WikipediaDocument, WIKIPEDIA_DOCUMENT_FIELDS
+
+
+def fetch_document(connection_manager, table_name, document_fields, document_model, id_field):
+    """Build the single document of a Gold table in DuckDB and parse it."""
+    query = document_query(f"SELECT * FROM {table_name}", document_fields, id_field)
+    doc_id, source = connection_manager.execute(query, ('test-model',)).fetchone()
+    return doc_id, document_model.model_validate_json(source)
 
 
 class TestElasticsearchWriter:
@@ -30,13 +39,13 @@ class TestElasticsearchWriter:
         """Set up test data in DuckDB."""
         conn = connection_manager.get_connection()
         
-        # Drop tables/views if they exist
-        conn.execute("DROP VIEW IF EXISTS gold_properties")
-        conn.execute("DROP TABLE IF EXISTS gold_properties")
-        conn.execute("DROP VIEW IF EXISTS gold_neighborhoods")
-        conn.execute("DROP TABLE IF EXISTS gold_neighborhoods")
-        conn.execute("DROP VIEW IF EXISTS gold_wikipedia")
-        conn.execute("DROP TABLE IF EXISTS gold_wikipedia")
+        # Drop tables/views if they exist (DROP VIEW fails on a table and vice versa)
+        for name in ("gold_properties", "gold_neighborhoods", "gold_wikipedia"):
+            for kind in ("VIEW", "TABLE"):
+                try:
+                    conn.execute(f"DROP {kind} IF EXISTS {name}")
+                except duckdb.CatalogException:
+                    pass
         
         # Create gold_properties table
         conn.execute("""
@@ -110,6 +119,11 @@ class TestElasticsearchWriter:
                 'high' as article_quality,
                 'San Francisco' as city,
                 'CA' as state,
+                ['nbh-1']::VARCHAR[] as neighborhood_ids,
+                ['Downtown']::VARCHAR[] as neighborhood_names,
+                'Downtown' as primary_neighborhood_name,
+                1 as neighborhood_count,
+                true as has_neighborhood_association,
                 NOW() as last_updated,
                 ARRAY[0.7, 0.8, 0.9]::FLOAT[] as embedding_vector,
                 NOW() as embedding_generated_at
@@ -117,44 +131,14 @@ class TestElasticsearchWriter:
         
         return connection_manager
     
-    def test_property_transformation(self):
+    def test_property_transformation(self, setup_test_data):
         """Test property document transformation."""
-        record = {
-            'listing_id': 'prop-1',
-            'neighborhood_id': 'nbh-1',
-            'price': 500000.0,
-            'bedrooms': 3,
-            'bathrooms': 2.5,
-            'square_feet': 2000,
-            'property_type': 'single_family',
-            'year_built': 2020,
-            'lot_size': 5000,
-            'address': {
-                'street': '123 Main St',
-                'city': 'San Francisco',
-                'state': 'CA',
-                'zip_code': '94105',
-                'location': [-122.4, 37.7]
-            },
-            'price_per_sqft': 250.0,
-            'parking': {'spaces': 2, 'type': 'garage'},
-            'description': 'Beautiful home',
-            'features': ['hardwood floors', 'updated kitchen'],
-            'amenities': ['pool', 'gym'],
-            'status': 'active',
-            'search_tags': ['luxury', 'downtown'],
-            'listing_date': date(2024, 1, 1),
-            'days_on_market': 30,
-            'virtual_tour_url': 'https://example.com/tour',
-            'images': ['https://example.com/img1.jpg'],
-            'embedding_vector': (0.1, 0.2, 0.3),
-            'embedding_generated_at': datetime.now()
-        }
-        
-        # Transform to PropertyDocument
-        doc = transform_property(record, 'test-model')
+        doc_id, doc = fetch_document(
+            setup_test_data, 'gold_properties', PROPERTY_DOCUMENT_FIELDS, PropertyDocument, 'listing_id'
+        )
         
         # Verify transformation
+        assert doc_id == 'prop-1'
         assert doc.listing_id == 'prop-1'
         assert doc.price == 500000.0
         assert doc.bedrooms == 3
@@ -163,77 +147,54 @@ class TestElasticsearchWriter:
         assert doc.address.location.lon == -122.4
         assert doc.parking.spaces == 2
         assert doc.parking.type == 'garage'
-        assert doc.embedding == [0.1, 0.2, 0.3]  # Tuple converted to list
+        assert doc.embedding == pytest.approx([0.1, 0.2, 0.3])  # FLOAT[] converted to list
+        assert doc.embedding_dimension == 3
         assert doc.listing_date == '2024-01-01'  # Date converted to string
         assert doc.embedding_model == 'test-model'
         
-    def test_neighborhood_transformation(self):
+    def test_neighborhood_transformation(self, setup_test_data):
         """Test neighborhood document transformation."""
-        record = {
-            'neighborhood_id': 'nbh-1',
-            'name': 'Downtown',
-            'city': 'San Francisco',
-            'state': 'CA',
-            'population': 50000,
-            'walkability_score': 95.0,
-            'school_rating': 8.5,
-            'overall_livability_score': 85.0,
-            'center_latitude': 37.7,
-            'center_longitude': -122.4,
-            'description': 'Urban downtown area',
-            'amenities': ['restaurants', 'shops'],
-            'lifestyle_tags': ['urban', 'walkable'],
-            'demographics': {'median_age': 35},
-            'wikipedia_correlations': None,
-            'embedding_vector': (0.4, 0.5, 0.6),
-            'embedding_generated_at': datetime.now()
-        }
-        
-        # Transform to NeighborhoodDocument
-        doc = transform_neighborhood(record, 'test-model')
+        doc_id, doc = fetch_document(
+            setup_test_data, 'gold_neighborhoods', NEIGHBORHOOD_DOCUMENT_FIELDS,
+            NeighborhoodDocument, 'neighborhood_id'
+        )
         
         # Verify transformation
-        assert doc.neighborhood_id == 'nbh-1'
+        assert doc_id == 'nbh-1'
         assert doc.name == 'Downtown'
         assert doc.location.lat == 37.7
         assert doc.location.lon == -122.4
-        assert doc.embedding == [0.4, 0.5, 0.6]  # Tuple converted to list
+        assert doc.demographics == {'median_age': 35}
+        assert doc.wikipedia_correlations == {}  # NULL becomes an empty object
+        assert doc.embedding == pytest.approx([0.4, 0.5, 0.6])
         assert doc.embedding_model == 'test-model'
         
-    def test_wikipedia_transformation(self):
+    def test_wikipedia_transformation(self, setup_test_data):
         """Test Wikipedia document transformation."""
-        record = {
-            'page_id': 12345,
-            'title': 'San Francisco',
-            'url': 'https://en.wikipedia.org/wiki/San_Francisco',
-            'article_filename': 'san_francisco.json',
-            'long_summary': 'San Francisco is a city...',
-            'short_summary': 'SF is a major city',
-            'content_length': 10000,
-            'content_loaded': True,
-            'content_loaded_at': datetime.now(),
-            'categories': '["History", "Geography"]',
-            'key_topics': ['technology', 'tourism'],
-            'relevance_score': 0.95,
-            'article_quality_score': 0.9,
-            'article_quality': 'high',
-            'city': 'San Francisco',
-            'state': 'CA',
-            'last_updated': datetime.now(),
-            'embedding_vector': (0.7, 0.8, 0.9),
-            'embedding_generated_at': datetime.now()
-        }
-        
-        # Transform to WikipediaDocument
-        doc = transform_wikipedia(record, 'test-model')
+        doc_id, doc = fetch_document(
+            setup_test_data, 'gold_wikipedia', WIKIPEDIA_DOCUMENT_FIELDS, WikipediaDocument, 'page_id'
+        )
         
         # Verify transformation
+        assert doc_id == '12345'
         assert doc.page_id == '12345'  # Int converted to string
         assert doc.title == 'San Francisco'
         assert doc.categories == ['History', 'Geography']  # JSON parsed
-        assert doc.embedding == [0.7, 0.8, 0.9]  # Tuple converted to list
+        assert doc.neighborhood_ids == ['nbh-1']
+        assert doc.has_neighborhood_association
+        assert doc.embedding == pytest.approx([0.7, 0.8, 0.9])
         assert doc.embedding_model == 'test-model'
     
+    def test_wikipedia_categories_fallback(self, setup_test_data):
+        """Categories that are not a JSON array are split on commas."""
+        setup_test_data.execute("UPDATE gold_wikipedia SET categories = 'History, Geography,'")
+        
+        _, doc = fetch_document(
+            setup_test_data, 'gold_wikipedia', WIKIPEDIA_DOCUMENT_FIELDS, WikipediaDocument, 'page_id'
+        )
+        
+        assert doc.categories == ['History', 'Geography']
+    
     @patch('squack_pipeline_v2.writers.elastic.base.Elasticsearch')
     def test_elasticsearch_writer_initialization(self, mock_es, settings, connection_manager):
         """Test ElasticsearchWriter initialization."""
@@ -251,7 +212,7 @@ class TestElasticsearchWriter:
         assert writer.wikipedia_writer is not None
         assert writer.documents_indexed == 0
     
-    @patch('squack_pipeline_v2.writers.elastic.base.bulk')
+    @patch('squack_pipeline_v2.writers.elastic.base.parallel_bulk')
     @patch('squack_pipeline_v2.writers.elastic.base.Elasticsearch')
     def test_index_all(self, mock_es, mock_bulk, settings, setup_test_data):
         """Test indexing all entity types."""
@@ -260,8 +221,13 @@ class TestElasticsearchWriter:
         mock_es_instance.ping.return_value = True
         mock_es.return_value = mock_es_instance
         
-        # Mock bulk indexing to return success
-        mock_bulk.return_value = (1, [])  # 1 success, no failures
+        # Mock bulk indexing to report success for every action
+        sent = []
+        def fake_parallel_bulk(client, actions, **kwargs):
+            for action in actions:
+                sent.append(action)
+                yield True, {}
+        mock_bulk.side_effect = fake_parallel_bulk
         
         # Create writer
         writer = ElasticsearchWriter(setup_test_data, settings)
@@ -277,6 +243,9 @@ class TestElasticsearchWriter:
         
         # Verify bulk was called (3 times, once for each entity type)
         assert mock_bulk.call_count == 3
+        
+        # Sources are pre-serialized JSON
+        assert sent and all(isinstance(action['_source'], bytes) for action in sent)
     
     def test_duckdb_streaming(self, setup_test_data):
         """Test that DuckDB streaming with fetchmany works correctly."""
@@ -339,4 +308,63 @@ class TestElasticsearchWriter:
         assert UnifiedWriter is not None
         
         # Verify unified writer is the exported one
-        assert ElasticsearchWriter == UnifiedWriter
\ No newline at end of file
+        assert ElasticsearchWriter == UnifiedWriter
+    
+    @patch('squack_pipeline_v2.writers.elastic.base.Elasticsearch')
+    def test_validation_skipped_after_schema_check(self, mock_es, settings, connection_manager):
+        """With validate_documents off only the first rows go through Pydantic."""
+        from squack_pipeline_v2.writers.elastic.base import ElasticsearchWriterBase
+        
+        mock_es.return_value.ping.return_value = True
+        settings.output.elasticsearch.validate_documents = False
+        settings.output.elasticsearch.schema_check_rows = 2
+        writer = ElasticsearchWriterBase(connection_manager, settings)
+        
+        class CountingDocument(NeighborhoodDocument):
+            validated: ClassVar[int] = 0
+            
+            @classmethod
+            def model_validate_json(cls, *args, **kwargs):
+                cls.validated += 1
+                return super().model_validate_json(*args, **kwargs)
+        
+        reader = connection_manager.execute("""
+            SELECT 'nbh-' || i AS _id, to_json(struct_pack(
+                neighborhood_id := 'nbh-' || i, name := 'Name ' || i, city := 'SF', state := 'CA',
+                location := struct_pack(lat := 37.7, lon := -122.4),
+                walkability_score := CAST(i AS DOUBLE)
+            )) AS _source
+            FROM range(5) t(i)
+        """).fetch_record_batch(2)
+        counters = {"validation_errors": 0, "bytes": 0}
+        actions = list(writer._generate_actions(reader, "neighborhoods", CountingDocument, counters))
+        
+        assert CountingDocument.validated == 2
+        assert counters["validation_errors"] == 0
+        assert [action['_id'] for action in actions] == [f"nbh-{i}" for i in range(5)]
+        assert counters["bytes"] == sum(len(action['_source']) for action in actions)
+        assert b'"walkability_score":4.0' in actions[4]['_source']
+    
+    @patch('squack_pipeline_v2.writers.elastic.base.Elasticsearch')
+    def test_bulk_load_settings_restored(self, mock_es, settings, connection_manager):
+        """Refresh and replicas are disabled during the load and restored after."""
+        from squack_pipeline_v2.writers.elastic.base import ElasticsearchWriterBase
+        
+        client = mock_es.return_value
+        client.ping.return_value = True
+        client.indices.exists.return_value = True
+        client.indices.get_settings.return_value = {
+            "properties": {"settings": {"index": {"number_of_replicas": "1"}}}
+        }
+        writer = ElasticsearchWriterBase(connection_manager, settings)
+        
+        with pytest.raises(RuntimeError):
+            with writer._bulk_load_settings("properties"):
+                raise RuntimeError("load failed")
+        
+        calls = [call.kwargs['settings'] for call in client.indices.put_settings.call_args_list]
+        assert calls == [
+            {"index": {"refresh_interval": "-1", "number_of_replicas": 0}},
+            {"index": {"refresh_interval": None, "number_of_replicas": "1"}},
+        ]
+        client.indices.refresh.assert_called_once_with(index="properties")
@@ -0,0 +1,122 @@
+"""Integration tests for the persistent embedding cache.
+
+Tests that only cache misses reach the provider, that results keep input
+order, and that LRU/age eviction keeps the cache within its limits.
+"""
+
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from squack_pipeline_v2.core.settings import EmbeddingCacheConfig
+from squack_pipeline_v2.embeddings.base import EmbeddingResponse
+from squack_pipeline_v2.embeddings.cache import EmbeddingCache, CACHE_TABLE
+from squack_pipeline_v2.integration_tests.test_utils import MockEmbeddingProvider
+
+
+class RecordingEmbeddingProvider(MockEmbeddingProvider):
+    """Mock provider that records every text it is asked to embed."""
+
+    def __init__(self):
+        super().__init__()
+        self.requested: List[str] = []
+
+    def generate_embeddings(self, texts: List[str]) -> EmbeddingResponse:
+        self.requested.extend(texts)
+        return super().generate_embeddings(texts)
+
+
+class TestEmbeddingCache:
+    """Test EmbeddingCache lookups, persistence and eviction."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Cache configuration backed by a temporary file."""
+        return EmbeddingCacheConfig(database_file=str(tmp_path / "embedding_cache.duckdb"))
+
+    def test_only_misses_reach_provider(self, config):
+        """Second call with overlapping texts only embeds the new text."""
+        cache = EmbeddingCache(config)
+        provider = RecordingEmbeddingProvider()
+
+        first = cache.generate_embeddings(provider, ["a house", "a condo"])
+        second = cache.generate_embeddings(provider, ["a condo", "a loft", "a house"])
+
+        assert provider.requested == ["a house", "a condo", "a loft"]
+        assert second.embeddings[0] == pytest.approx(first.embeddings[1])
+        assert second.embeddings[2] == pytest.approx(first.embeddings[0])
+
+        stats = cache.get_stats()
+        assert stats.hits == 2
+        assert stats.misses == 3
+        assert stats.entries == 3
+        cache.close()
+
+    def test_duplicate_texts_embedded_once(self, config):
+        """Repeated texts in one call are sent to the provider once."""
+        cache = EmbeddingCache(config)
+        provider = RecordingEmbeddingProvider()
+
+        response = cache.generate_embeddings(provider, ["same", "same", "other"])
+
+        assert provider.requested == ["same", "other"]
+        assert len(response.embeddings) == 3
+        assert response.embeddings[0] == response.embeddings[1]
+        cache.close()
+
+    def test_cache_persists_across_instances(self, config):
+        """A new cache over the same file serves previously embedded texts."""
+        cache = EmbeddingCache(config)
+        cache.generate_embeddings(RecordingEmbeddingProvider(), ["persisted text"])
+        cache.close()
+
+        provider = RecordingEmbeddingProvider()
+        reopened = EmbeddingCache(config)
+        reopened.generate_embeddings(provider, ["persisted text"])
+
+        assert provider.requested == []
+        assert reopened.get_stats().hits == 1
+        reopened.close()
+
+    def test_model_is_part_of_key(self, config):
+        """Vectors from a different model are not reused."""
+        cache = EmbeddingCache(config)
+        cache.generate_embeddings(RecordingEmbeddingProvider(), ["text"])
+
+        other_model = RecordingEmbeddingProvider()
+        other_model.model_name = "other_model"
+        cache.generate_embeddings(other_model, ["text"])
+
+        assert other_model.requested == ["text"]
+        cache.close()
+
+    def test_prune_applies_age_and_size_limits(self, tmp_path):
+        """Stale entries are evicted first, then least recently used ones."""
+        config = EmbeddingCacheConfig(
+            database_file=str(tmp_path / "embedding_cache.duckdb"),
+            max_entries=2,
+            max_age_days=30
+        )
+        cache = EmbeddingCache(config)
+        cache.generate_embeddings(RecordingEmbeddingProvider(), ["old", "a", "b", "c"])
+
+        conn = cache.connect()
+        conn.execute(
+            f"UPDATE {CACHE_TABLE} SET last_used_at = ? WHERE embedding[2] = 0.0",
+            (datetime.now() - timedelta(days=60),)
+        )
+        conn.execute(
+            f"UPDATE {CACHE_TABLE} SET last_used_at = last_used_at - INTERVAL 1 DAY "
+            f"WHERE embedding[2] > 0.005 AND embedding[2] < 0.015"
+        )
+
+        removed = cache.prune()
+
+        assert removed == 2
+        assert cache.get_stats().entries == 2
+
+        provider = RecordingEmbeddingProvider()
+        cache.generate_embeddings(provider, ["old", "a", "b", "c"])
+        assert provider.requested == ["old", "a"]
+        cache.close()
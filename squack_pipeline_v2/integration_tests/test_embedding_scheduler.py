@@ -0,0 +1,148 @@
+"""Integration tests for the concurrent embedding scheduler.
+
+Runs OllamaProvider against a local fake HTTP embedding server to verify
+that batches run concurrently, come back in input order, and that 429s are
+retried while client errors are not.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from squack_pipeline_v2.embeddings.base import EmbeddingAPIError
+from squack_pipeline_v2.embeddings.providers import OllamaProvider, create_provider
+from squack_pipeline_v2.embeddings.scheduler import ScheduledEmbeddingProvider, TokenBucket
+
+
+class FakeEmbeddingServer:
+    """Local stand-in for the Ollama /api/embeddings endpoint.
+
+    - Embedding is [len(prompt), index encoded in the prompt]
+    - Prompts starting with "throttle" get one 429 before succeeding
+    - Prompts starting with "bad" always get a 400
+    """
+
+    def __init__(self, latency_seconds: float = 0.05):
+        self.latency_seconds = latency_seconds
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.throttled = set()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                prompt = body["prompt"]
+                with server.lock:
+                    server.requests += 1
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    time.sleep(server.latency_seconds)
+                    if prompt.startswith("bad"):
+                        self._reply(400, {"error": "bad request"})
+                    elif prompt.startswith("throttle") and prompt not in server.throttled:
+                        server.throttled.add(prompt)
+                        self._reply(429, {"error": "rate limited"})
+                    else:
+                        index = float(prompt.rsplit(" ", 1)[-1])
+                        self._reply(200, {"embedding": [float(len(prompt)), index]})
+                finally:
+                    with server.lock:
+                        server.in_flight -= 1
+
+            def _reply(self, status, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestEmbeddingScheduler:
+    """Test ScheduledEmbeddingProvider against a fake HTTP provider."""
+
+    @pytest.fixture
+    def server(self):
+        """Running fake embedding server."""
+        with FakeEmbeddingServer() as server:
+            yield server
+
+    def _scheduled(self, server, **kwargs) -> ScheduledEmbeddingProvider:
+        provider = OllamaProvider(model_name="fake", dimension=2, base_url=server.url)
+        return ScheduledEmbeddingProvider(provider, backoff_base_seconds=0.01, **kwargs)
+
+    def test_results_in_input_order_with_concurrency(self, server):
+        """Batches run in parallel but vectors line up with the inputs."""
+        scheduler = self._scheduled(server, max_concurrency=8)
+        texts = [f"text {i}" for i in range(40)]
+
+        response = scheduler.generate_embeddings(texts)
+
+        assert [vector[1] for vector in response.embeddings] == [float(i) for i in range(40)]
+        assert server.max_in_flight > 1
+        assert server.requests == 40
+
+    def test_rate_limited_batches_are_retried(self, server):
+        """A 429 is retried with backoff and the batch still succeeds."""
+        scheduler = self._scheduled(server, max_concurrency=4)
+        texts = ["throttle 0", "text 1", "throttle 2"]
+
+        response = scheduler.generate_embeddings(texts)
+
+        assert [vector[1] for vector in response.embeddings] == [0.0, 1.0, 2.0]
+        assert server.requests == 5
+
+    def test_client_errors_are_not_retried(self, server):
+        """A 400 surfaces immediately as EmbeddingAPIError."""
+        scheduler = self._scheduled(server, max_concurrency=1)
+
+        with pytest.raises(EmbeddingAPIError) as error:
+            scheduler.generate_embeddings(["bad 0"])
+
+        assert error.value.status_code == 400
+        assert server.requests == 1
+
+    def test_create_provider_wraps_in_scheduler(self, server):
+        """create_provider returns a scheduled provider transparently."""
+        provider = create_provider("ollama", model_name="fake", base_url=server.url, max_concurrency=3)
+
+        assert isinstance(provider, ScheduledEmbeddingProvider)
+        assert provider.provider_name == "ollama"
+        assert provider.max_concurrency == 3
+        assert len(provider.generate_embeddings(["text 0", "text 1"]).embeddings) == 2
+
+
+def test_token_bucket_blocks_when_empty():
+    """Once the bucket is drained, acquire waits for the refill."""
+    bucket = TokenBucket(rate_per_minute=6000)  # 100 tokens per second
+    assert bucket.acquire(6000) == 0.0
+
+    start = time.monotonic()
+    bucket.acquire(20)
+    assert time.monotonic() - start >= 0.15
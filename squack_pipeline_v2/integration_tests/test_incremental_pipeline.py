@@ -0,0 +1,116 @@
+"""Integration tests for incremental (change data capture) runs.
+
+Tests that Bronze fingerprints classify inserts, updates and deletes, that
+fingerprints only move forward on commit, and that a Silver merge embeds
+just the changed rows.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from squack_pipeline_v2.bronze.property import PropertyBronzeIngester
+from squack_pipeline_v2.core.change_data import ChangeDetector
+from squack_pipeline_v2.core.connection import DuckDBConnectionManager
+from squack_pipeline_v2.core.settings import PipelineSettings
+from squack_pipeline_v2.integration_tests.test_embedding_cache import RecordingEmbeddingProvider
+from squack_pipeline_v2.silver.property import PropertySilverTransformer
+
+
+class TestChangeDetector:
+    """Test Bronze fingerprinting and diffing."""
+
+    @pytest.fixture
+    def connection_manager(self):
+        """Create connection manager."""
+        settings = PipelineSettings()
+        settings.duckdb.database_file = ":memory:"
+        return DuckDBConnectionManager(settings.duckdb)
+
+    def _load(self, connection_manager, rows):
+        """Replace the test Bronze table with (listing_id, description) rows."""
+        values = ", ".join(f"('{listing_id}', '{description}')" for listing_id, description in rows)
+        connection_manager.execute(
+            f"CREATE OR REPLACE TABLE cdc_test_bronze AS "
+            f"SELECT * FROM (VALUES {values}) AS t(listing_id, description)"
+        )
+
+    def test_detects_inserts_updates_and_deletes(self, connection_manager):
+        """Second run classifies every id against the committed fingerprints."""
+        detector = ChangeDetector(connection_manager)
+
+        self._load(connection_manager, [("a", "old"), ("b", "same"), ("c", "gone")])
+        first = detector.detect("property", "cdc_test_bronze")
+        assert first.inserted == 3
+        detector.commit(first)
+
+        self._load(connection_manager, [("a", "new"), ("b", "same"), ("d", "added")])
+        second = detector.detect("property", "cdc_test_bronze")
+
+        assert (second.inserted, second.updated, second.deleted, second.unchanged) == (1, 1, 1, 1)
+        assert detector.get_ids(second, "insert") == ["d"]
+        assert detector.get_ids(second, "update") == ["a"]
+        assert detector.get_ids(second, "delete") == ["c"]
+
+    def test_uncommitted_changes_are_detected_again(self, connection_manager):
+        """Without a commit (failed run) the same changes show up next time."""
+        detector = ChangeDetector(connection_manager)
+
+        self._load(connection_manager, [("a", "x")])
+        detector.commit(detector.detect("property", "cdc_test_bronze"))
+
+        self._load(connection_manager, [("a", "y")])
+        assert detector.detect("property", "cdc_test_bronze").updated == 1
+        change_set = detector.detect("property", "cdc_test_bronze")
+        assert change_set.updated == 1
+
+        detector.commit(change_set)
+        assert detector.detect("property", "cdc_test_bronze").total_changes == 0
+
+
+def test_silver_merge_embeds_only_changed_rows():
+    """An incremental Silver run re-embeds updated rows and drops deleted ones."""
+    property_file = Path("real_estate_data/properties_sf.json")
+    if not property_file.exists():
+        pytest.skip(f"{property_file} not found")
+
+    settings = PipelineSettings()
+    settings.duckdb.database_file = ":memory:"
+    conn_manager = DuckDBConnectionManager(settings.duckdb)
+    detector = ChangeDetector(conn_manager)
+
+    PropertyBronzeIngester(settings, conn_manager).ingest(
+        table_name="cdc_bronze_properties",
+        file_path=property_file,
+        sample_size=10
+    )
+    provider = RecordingEmbeddingProvider()
+    transformer = PropertySilverTransformer(settings, conn_manager, provider)
+
+    # Full first run
+    transformer.transform("cdc_bronze_properties", "cdc_silver_properties")
+    detector.commit(detector.detect("property", "cdc_bronze_properties"))
+    assert len(provider.requested) == 10
+
+    # Change one description and remove one listing
+    listing_ids = [row[0] for row in conn_manager.execute(
+        "SELECT listing_id FROM cdc_bronze_properties ORDER BY listing_id"
+    ).fetchall()]
+    conn_manager.execute(
+        "UPDATE cdc_bronze_properties SET description = 'Freshly renovated' WHERE listing_id = ?",
+        (listing_ids[0],)
+    )
+    conn_manager.execute("DELETE FROM cdc_bronze_properties WHERE listing_id = ?", (listing_ids[1],))
+
+    provider.requested.clear()
+    changes = detector.detect("property", "cdc_bronze_properties")
+    transformer.transform("cdc_bronze_properties", "cdc_silver_properties", changes=changes)
+
+    assert len(provider.requested) == 1
+    assert "Freshly renovated" in provider.requested[0]
+    assert conn_manager.count_records("cdc_silver_properties") == 9
+    description = conn_manager.execute(
+        "SELECT description FROM cdc_silver_properties WHERE listing_id = ?",
+        (listing_ids[0],)
+    ).fetchone()[0]
+    assert description == "Freshly renovated"
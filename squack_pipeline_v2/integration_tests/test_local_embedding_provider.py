@@ -0,0 +1,59 @@
+"""Integration tests for the in-process local embedding provider.
+
+A stub model stands in for sentence-transformers so batching and ordering
+can be verified without downloading weights.
+"""
+
+from typing import List
+
+import numpy as np
+
+from squack_pipeline_v2.embeddings.providers import LocalProvider, create_provider
+
+
+class StubSentenceModel:
+    """Records batches and returns [len(text), 1.0] for each text."""
+
+    def __init__(self):
+        self.batches: List[List[str]] = []
+
+    def encode(self, texts, batch_size, convert_to_numpy, normalize_embeddings, show_progress_bar):
+        self.batches.append(list(texts))
+        return np.array([[float(len(text)), 1.0] for text in texts], dtype=np.float32)
+
+
+class TestLocalProvider:
+    """Test LocalProvider batching."""
+
+    def _provider(self, batch_size: int) -> LocalProvider:
+        provider = LocalProvider(model_name="stub", dimension=2, batch_size=batch_size)
+        provider._model = StubSentenceModel()
+        return provider
+
+    def test_batches_are_length_sorted(self):
+        """Each forward pass holds texts of similar length."""
+        provider = self._provider(batch_size=2)
+        texts = ["a", "aaaa", "aa", "aaaaa", "aaa"]
+
+        provider.generate_embeddings(texts)
+
+        assert provider._model.batches == [["aaaaa", "aaaa"], ["aaa", "aa"], ["a"]]
+
+    def test_vectors_in_input_order(self):
+        """Sorting for batching does not change the output order."""
+        provider = self._provider(batch_size=2)
+        texts = ["aaa", "a", "aaaaa", "aa"]
+
+        response = provider.generate_embeddings(texts)
+
+        assert [vector[0] for vector in response.embeddings] == [3.0, 1.0, 5.0, 2.0]
+        assert response.dimension == 2
+
+    def test_create_provider_runs_local_serially(self):
+        """The local model is not run on concurrent scheduler threads."""
+        provider = create_provider("local", max_concurrency=8, local_batch_size=4)
+
+        assert provider.provider_name == "local"
+        assert provider.dimension == 384
+        assert provider.max_concurrency == 1
+        assert provider.get_batch_size() == 64
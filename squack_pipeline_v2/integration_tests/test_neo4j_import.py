@@ -0,0 +1,96 @@
+"""Integration tests for the neo4j-admin import file exporter."""
+
+import csv
+
+import pytest
+
+from squack_pipeline_v2.core.connection import DuckDBConnectionManager
+from squack_pipeline_v2.core.settings import DuckDBConfig
+from squack_pipeline_v2.writers.neo4j_import import Neo4jImportExporter, neo4j_import_type
+
+
+class TestNeo4jImportExporter:
+    """Test typed headers, ID spaces and relationship files."""
+
+    @pytest.fixture
+    def connection_manager(self):
+        """In-memory database with a small property/neighborhood graph."""
+        manager = DuckDBConnectionManager(DuckDBConfig(database_file=":memory:"))
+
+        # The in-memory database is shared; start from an empty graph
+        for (table,) in manager.execute(
+            "SELECT table_name FROM information_schema.tables WHERE table_name LIKE 'gold_graph_%' AND table_type = 'BASE TABLE'"
+        ).fetchall():
+            manager.drop_table(table)
+
+        manager.execute("""
+            CREATE OR REPLACE TABLE gold_graph_properties AS
+            SELECT
+                'p' || i AS listing_id,
+                CAST(i * 1000 AS DECIMAL(12, 2)) AS price,
+                CAST(i AS INTEGER) AS bedrooms,
+                ['pool', 'garage'] AS features,
+                'property:p' || i AS graph_node_id
+            FROM range(4) t(i)
+        """)
+        manager.execute("""
+            CREATE OR REPLACE TABLE gold_graph_neighborhoods AS
+            SELECT 'n' || i AS neighborhood_id, 'neighborhood:n' || i AS graph_node_id
+            FROM range(2) t(i)
+        """)
+        manager.execute("""
+            CREATE OR REPLACE TABLE gold_graph_rel_located_in AS
+            SELECT 'property:p' || (i % 4) AS from_id, 'neighborhood:n' || (i % 2) AS to_id,
+                   'LOCATED_IN' AS relationship_type
+            FROM range(6) t(i)
+        """)
+        manager.execute("""
+            CREATE OR REPLACE TABLE gold_graph_rel_similar_to AS
+            SELECT 'property:p0' AS from_id, 'property:p1' AS to_id, 'SIMILAR_TO' AS relationship_type,
+                   0.9 AS weight, 1 AS rank
+        """)
+        return manager
+
+    def test_type_mapping(self):
+        """DuckDB types map to neo4j-admin header types."""
+        assert neo4j_import_type("BIGINT") == "long"
+        assert neo4j_import_type("DECIMAL(12,2)") == "double"
+        assert neo4j_import_type("VARCHAR[]") == "string[]"
+        assert neo4j_import_type("FLOAT[1024]") == "double[]"
+        assert neo4j_import_type("STRUCT(a INTEGER)") == "string"
+        assert neo4j_import_type("TIMESTAMP") == "localdatetime"
+
+    def test_export_all(self, connection_manager, tmp_path):
+        """Nodes get typed headers with an ID space per label."""
+        manifest = Neo4jImportExporter(connection_manager, tmp_path).export_all()
+
+        assert [f.name for f in manifest.node_files] == ["Property", "Neighborhood"]
+        assert manifest.total_nodes == 6
+
+        header = (tmp_path / "Property_header.csv").read_text().strip().split(",")
+        assert header == [
+            "graph_node_id:ID(Property)", "listing_id:string", "price:double",
+            "bedrooms:long", "features:string[]"
+        ]
+        with open(tmp_path / "Property.csv") as f:
+            rows = list(csv.reader(f))
+        assert rows[1] == ["property:p1", "p1", "1000.0", "1", "pool;garage"]
+
+    def test_relationships_are_deduplicated(self, connection_manager, tmp_path):
+        """Relationship files use endpoint ID spaces and one row per pair."""
+        manifest = Neo4jImportExporter(connection_manager, tmp_path).export_all()
+
+        by_type = {f.name: f for f in manifest.relationship_files}
+        # 6 rows, but only 4 distinct property -> neighborhood pairs
+        assert by_type["LOCATED_IN"].records == 4
+        assert (tmp_path / "located_in_header.csv").read_text().strip() == (
+            ":START_ID(Property),:END_ID(Neighborhood)"
+        )
+        assert (tmp_path / "similar_to_header.csv").read_text().strip() == (
+            ":START_ID(Property),:END_ID(Property),score:double,rank:long"
+        )
+
+        command = manifest.command
+        assert command[:4] == ["neo4j-admin", "database", "import", "full"]
+        assert any(arg.startswith("--relationships=LOCATED_IN=") for arg in command)
+        assert (tmp_path / "import_command.sh").exists()
@@ -0,0 +1,188 @@
+"""Integration tests for the chunked, parallel Neo4j writer.
+
+Neo4j itself is replaced by a fake driver recording every transaction, so
+the tests cover chunking, per-chunk metrics and write ordering only.
+"""
+
+import re
+import threading
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from squack_pipeline_v2.core.connection import DuckDBConnectionManager
+from squack_pipeline_v2.core.settings import DuckDBConfig
+from squack_pipeline_v2.writers.neo4j import Neo4jConfig, Neo4jWriter
+
+
+class FakeCounters:
+    """Summary counters of one fake transaction."""
+
+    def __init__(self, cypher, size):
+        is_relationship = "-[:" in cypher
+        self.nodes_created = 0 if is_relationship else size
+        self.properties_set = 0 if is_relationship else size
+        self.relationships_created = size if is_relationship else 0
+
+
+class FakeDriver:
+    """Driver stand-in recording (target, size, start, end) per transaction."""
+
+    def __init__(self, delay=0.0, has_nodes=False):
+        self.delay = delay
+        self.has_nodes = has_nodes
+        self.statements = []
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def session(self, **kwargs):
+        return FakeSession(self)
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Session running managed transactions against the fake driver."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def run(self, cypher, **parameters):
+        return FakeResult(cypher, 0, {"has_nodes": self.driver.has_nodes})
+
+    def execute_write(self, work, *args):
+        return work(FakeTransaction(self.driver), *args)
+
+
+class FakeTransaction:
+    """Transaction recording the statement target and chunk size."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def run(self, cypher, parameters):
+        records = next(iter(parameters.values()))
+        target = re.search(r"(?:MERGE|CREATE) \(\w+\)-\[:(\w+)\]|(?:MERGE|CREATE) \(\w+:(\w+)", cypher)
+        start = datetime.now()
+        time.sleep(self.driver.delay)
+        with self.driver.lock:
+            self.driver.statements.append(cypher)
+            self.driver.calls.append((target.group(1) or target.group(2), len(records), start, datetime.now()))
+        return FakeResult(cypher, len(records))
+
+
+class FakeResult:
+    """Result whose summary carries fake counters."""
+
+    def __init__(self, cypher, size, record=None):
+        self.counters = FakeCounters(cypher, size)
+        self.record = record
+
+    def consume(self):
+        return self
+
+    def single(self):
+        return self.record
+
+
+class TestNeo4jWriter:
+    """Test chunked streaming and write ordering."""
+
+    @pytest.fixture
+    def connection_manager(self):
+        """In-memory database with a small property/neighborhood graph."""
+        manager = DuckDBConnectionManager(DuckDBConfig(database_file=":memory:"))
+
+        # The in-memory database is shared; start from an empty graph
+        for (table,) in manager.execute(
+            "SELECT table_name FROM information_schema.tables WHERE table_name LIKE 'gold_graph_%' AND table_type = 'BASE TABLE'"
+        ).fetchall():
+            manager.drop_table(table)
+
+        manager.execute("""
+            CREATE OR REPLACE TABLE gold_graph_properties AS
+            SELECT 'p' || i AS listing_id, CAST(i * 1000 AS DECIMAL(12, 2)) AS price
+            FROM range(12) t(i)
+        """)
+        manager.execute("""
+            CREATE OR REPLACE TABLE gold_graph_neighborhoods AS
+            SELECT 'n' || i AS neighborhood_id FROM range(3) t(i)
+        """)
+        manager.execute("""
+            CREATE OR REPLACE TABLE gold_graph_rel_located_in AS
+            SELECT 'property:p' || i AS from_id, 'neighborhood:n' || (i % 3) AS to_id
+            FROM range(12) t(i)
+        """)
+        return manager
+
+    def _writer(self, connection_manager, driver, chunk_size=5, create_only=False):
+        with patch("squack_pipeline_v2.writers.neo4j.GraphDatabase.driver", return_value=driver):
+            return Neo4jWriter(
+                Neo4jConfig(
+                    uri="bolt://fake", password="", chunk_size=chunk_size, max_workers=4,
+                    create_only=create_only
+                ),
+                connection_manager
+            )
+
+    def test_tables_are_written_in_chunks(self, connection_manager):
+        """Each chunk is its own transaction and has its own metrics."""
+        driver = FakeDriver()
+        writer = self._writer(connection_manager, driver)
+
+        result = writer.write_property_nodes()
+
+        assert [size for _, size, _, _ in driver.calls] == [5, 5, 2]
+        assert result.records_read == 12
+        assert result.nodes_created == 12
+        assert [chunk.records for chunk in result.chunk_results] == [5, 5, 2]
+        assert [chunk.chunk_index for chunk in result.chunk_results] == [0, 1, 2]
+
+    def test_relationships_wait_for_endpoint_labels(self, connection_manager):
+        """LOCATED_IN starts after both Property and Neighborhood are written."""
+        driver = FakeDriver(delay=0.05)
+        writer = self._writer(connection_manager, driver)
+
+        node_results, relationship_results = writer.write_graph()
+
+        assert [r.entity_type for r in node_results] == ["Property", "Neighborhood"]
+        assert relationship_results[0].relationships_created == 12
+
+        node_end = max(end for target, _, _, end in driver.calls if target in ("Property", "Neighborhood"))
+        rel_start = min(start for target, _, start, _ in driver.calls if target == "LOCATED_IN")
+        assert rel_start >= node_end
+
+        # Labels overlap: Neighborhood starts before the last Property chunk ends
+        neighborhood_start = min(start for target, _, start, _ in driver.calls if target == "Neighborhood")
+        property_end = max(end for target, _, _, end in driver.calls if target == "Property")
+        assert neighborhood_start < property_end
+
+    def test_create_only_skips_merge(self, connection_manager):
+        """Initial loads CREATE nodes and de-duplicated relationships."""
+        connection_manager.execute("""
+            INSERT INTO gold_graph_rel_located_in VALUES ('property:p0', 'neighborhood:n0')
+        """)
+        driver = FakeDriver()
+        writer = self._writer(connection_manager, driver, chunk_size=100, create_only=True)
+
+        node_results, relationship_results = writer.write_graph()
+
+        assert all("MERGE" not in cypher for cypher in driver.statements)
+        assert sum(r.nodes_created for r in node_results) == 15
+        assert relationship_results[0].records_read == 12
+
+    def test_create_only_refuses_populated_database(self, connection_manager):
+        """CREATE would duplicate nodes already in the graph."""
+        writer = self._writer(connection_manager, FakeDriver(has_nodes=True), create_only=True)
+
+        with pytest.raises(ValueError, match="empty database"):
+            writer.write_all()
@@ -0,0 +1,162 @@
+"""Integration tests for per-stage profiling.
+
+Tests that SQL and embedding time are charged to the innermost stage, that
+plans are captured for CREATE TABLE ... AS, Relation API reads and views, and
+that run reports round-trip and can be compared.
+"""
+
+from datetime import datetime, timedelta
+
+import pyarrow.parquet as pq
+import pytest
+
+from squack_pipeline_v2.core.connection import DuckDBConnectionManager
+from squack_pipeline_v2.core.profiling import (
+    PipelineProfiler, RunProfile, StageProfile, compare_profiles, profile_stage, set_profiler
+)
+from squack_pipeline_v2.core.settings import DuckDBConfig, PipelineSettings
+from squack_pipeline_v2.silver.property import PropertySilverTransformer
+from squack_pipeline_v2.integration_tests.test_utils import MockEmbeddingProvider
+
+
+class TestPipelineProfiler:
+    """Test stage attribution and plan capture."""
+
+    @pytest.fixture
+    def profiler(self):
+        """Active profiler, deactivated after the test."""
+        manager = DuckDBConnectionManager(DuckDBConfig(database_file=":memory:"))
+        profiler = PipelineProfiler("test", memory_probe=manager.memory_usage_bytes)
+        set_profiler(profiler)
+        yield profiler
+        set_profiler(None)
+
+    def test_queries_are_charged_to_innermost_stage(self, profiler):
+        """Nested stages keep their own SQL and embedding counters."""
+        manager = DuckDBConnectionManager()
+
+        with profile_stage("outer"):
+            manager.execute("SELECT 1").fetchall()
+            with profile_stage("inner") as inner:
+                manager.execute("SELECT 2").fetchall()
+                profiler.record_embedding(0.25, texts=3)
+                inner.output_records = 10
+
+        outer, inner = profiler.report().stages
+        assert (outer.name, inner.name, inner.parent) == ("outer", "inner", "outer")
+        assert outer.query_count == 1 and inner.query_count == 1
+        assert (inner.embedding_seconds, inner.embedding_texts) == (0.25, 3)
+        assert outer.embedding_seconds == 0
+        assert inner.status == "completed" and inner.end_time is not None
+        assert inner.peak_rss_mb > 0
+
+    def test_create_table_as_captures_plan(self, profiler):
+        """CREATE TABLE ... AS runs through EXPLAIN ANALYZE and still creates the table."""
+        manager = DuckDBConnectionManager()
+        manager.drop_table("profiling_test")
+
+        with profile_stage("silver.test"):
+            manager.execute("CREATE TABLE profiling_test AS SELECT range AS id FROM range(100)")
+
+        assert manager.count_records("profiling_test") == 100
+        stage = profiler.report().stages[0]
+        assert len(stage.queries) == 1
+        assert "profiling_test" in stage.queries[0].sql
+        assert stage.queries[0].plan
+
+    def test_relation_reads_capture_plans(self, profiler):
+        """Relation API tables (Bronze reads) are created and appended through EXPLAIN ANALYZE."""
+        manager = DuckDBConnectionManager()
+        manager.drop_table("profiling_relation")
+        relation = manager.get_connection().sql("SELECT range AS id FROM range(50)")
+
+        with profile_stage("bronze.test"):
+            manager.create_table_from_relation(relation, "profiling_relation")
+            manager.create_table_from_relation(relation, "profiling_relation", append=True)
+
+        assert manager.count_records("profiling_relation") == 100
+        assert not manager.table_exists("profiling_relation_relation")
+        stage = profiler.report().stages[0]
+        assert [q.sql.split()[0] for q in stage.queries] == ["CREATE", "INSERT"]
+        assert all(q.plan for q in stage.queries)
+        manager.drop_table("profiling_relation")
+
+    def test_view_plan_is_captured(self, profiler):
+        """A new view is scanned once so its plan is recorded."""
+        manager = DuckDBConnectionManager()
+        manager.drop_view("profiling_view")
+
+        with profile_stage("gold.test"):
+            manager.execute("CREATE VIEW profiling_view AS SELECT range AS id FROM range(10)")
+
+        stage = profiler.report().stages[0]
+        assert [q.sql for q in stage.queries] == ["SELECT * FROM profiling_view"]
+        assert stage.queries[0].plan
+        assert stage.query_count == 2
+        manager.drop_view("profiling_view")
+
+    def test_silver_embeddings_are_timed(self, profiler):
+        """Embedding calls of a Silver transformer are charged to the current stage."""
+        transformer = PropertySilverTransformer(
+            PipelineSettings(), DuckDBConnectionManager(), MockEmbeddingProvider()
+        )
+
+        with profile_stage("silver.property"):
+            response = transformer.generate_embeddings(["one", "two"])
+
+        stage = profiler.report().stages[0]
+        assert len(response.embeddings) == 2
+        assert stage.embedding_texts == 2
+        assert stage.embedding_seconds > 0
+
+    def test_failed_stage_is_recorded(self, profiler):
+        """An exception marks the stage failed and propagates."""
+        with pytest.raises(RuntimeError):
+            with profile_stage("broken"):
+                raise RuntimeError("boom")
+
+        assert profiler.report().stages[0].status == "failed"
+
+    def test_inactive_profiler_yields_none(self):
+        """Without a profiler stages are not recorded."""
+        with profile_stage("ignored") as stage:
+            assert stage is None
+
+
+def _run(durations):
+    """Run profile with one completed stage per (name, seconds)."""
+    start = datetime(2025, 1, 1)
+    return RunProfile(
+        pipeline_id="run",
+        start_time=start,
+        stages=[
+            StageProfile(
+                name=name, thread="main", start_time=start,
+                end_time=start + timedelta(seconds=seconds), output_records=100
+            )
+            for name, seconds in durations
+        ]
+    )
+
+
+def test_report_round_trip(tmp_path):
+    """JSON reloads to the same report; Parquet has one row per stage."""
+    report = _run([("bronze.property", 2.0), ("writer.parquet", 1.0)])
+
+    json_path, parquet_path = report.write(tmp_path)
+
+    assert RunProfile.load(json_path) == report
+    table = pq.read_table(parquet_path)
+    assert table.column("name").to_pylist() == ["bronze.property", "writer.parquet"]
+    assert table.column("rows_per_second").to_pylist() == [50.0, 100.0]
+
+
+def test_compare_profiles_flags_slow_stages():
+    """Only slowdowns above both the ratio and the noise floor are reported."""
+    baseline = _run([("silver.property", 10.0), ("gold.property", 1.0), ("writer.neo4j", 5.0)])
+    current = _run([("silver.property", 13.0), ("gold.property", 1.4), ("writer.neo4j", 5.5)])
+
+    regressions = compare_profiles(baseline, current, threshold=0.2, min_seconds=0.5)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("silver.property")
@@ -0,0 +1,93 @@
+"""Integration test for how embeddings reach Silver tables.
+
+Vectors are registered as an Arrow FixedSizeList view and joined back by
+entity id; the Silver column must be a FLOAT[dim] array holding the vector
+generated for that row's own embedding text.
+"""
+
+import zlib
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from squack_pipeline_v2.core.settings import PipelineSettings
+from squack_pipeline_v2.core.connection import DuckDBConnectionManager
+from squack_pipeline_v2.embeddings.base import EmbeddingResponse
+from squack_pipeline_v2.bronze.property import PropertyBronzeIngester
+from squack_pipeline_v2.silver.property import PropertySilverTransformer
+from squack_pipeline_v2.integration_tests.test_utils import MockEmbeddingProvider
+
+
+PROPERTY_FILE = Path("real_estate_data/properties_sf.json")
+DIMENSION = 4
+
+
+def stub_vector(text: str) -> List[float]:
+    """Vector derived from the text alone, exact in float32."""
+    return [float(len(text)), float(zlib.crc32(text.encode()) % 1000), 0.5, -1.0]
+
+
+class TextKeyedEmbeddingProvider(MockEmbeddingProvider):
+    """Stub provider whose vectors identify the text they came from."""
+
+    def __init__(self):
+        super().__init__()
+        self.dimension = DIMENSION
+
+    def generate_embeddings(self, texts: List[str]) -> EmbeddingResponse:
+        return EmbeddingResponse(
+            embeddings=[stub_vector(text) for text in texts],
+            model_name=self.model_name,
+            dimension=self.dimension,
+            token_count=0
+        )
+
+
+@pytest.fixture
+def connection_manager():
+    """In-memory DuckDB with a small Bronze property table."""
+    if not PROPERTY_FILE.exists():
+        pytest.skip(f"{PROPERTY_FILE} not found")
+
+    settings = PipelineSettings()
+    manager = DuckDBConnectionManager(settings.duckdb)
+    PropertyBronzeIngester(settings, manager).ingest(
+        table_name="test_bronze_embeddings",
+        file_path=PROPERTY_FILE,
+        sample_size=8
+    )
+    yield manager
+    manager.drop_table("test_bronze_embeddings")
+    manager.drop_table("test_silver_embeddings")
+
+
+def test_silver_embeddings_are_float_arrays_joined_by_id(connection_manager):
+    """embedding_vector is FLOAT[dim] and matches each row's own text."""
+    transformer = PropertySilverTransformer(
+        PipelineSettings(), connection_manager, TextKeyedEmbeddingProvider()
+    )
+    result = transformer.transform(
+        input_table="test_bronze_embeddings",
+        output_table="test_silver_embeddings"
+    )
+    assert result.output_count > 0
+
+    column_types = {
+        name: column_type
+        for name, column_type, *_ in connection_manager.get_connection().execute(
+            "DESCRIBE test_silver_embeddings"
+        ).fetchall()
+    }
+    assert column_types["embedding_vector"] == f"FLOAT[{DIMENSION}]"
+
+    rows = connection_manager.execute("""
+        SELECT listing_id, embedding_text, embedding_vector
+        FROM test_silver_embeddings
+        ORDER BY listing_id
+    """).fetchall()
+    assert len(rows) == result.output_count
+    assert len({text for _, text, _ in rows}) == len(rows)
+    for listing_id, text, vector in rows:
+        assert vector is not None, f"{listing_id} lost its embedding in the join"
+        assert list(vector) == stub_vector(text), f"{listing_id} got another row's embedding"
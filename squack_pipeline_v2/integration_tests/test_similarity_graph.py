@@ -0,0 +1,82 @@
+"""Integration tests for the precomputed SIMILAR_TO kNN graph tables."""
+
+import numpy as np
+import pytest
+
+from squack_pipeline_v2.core.connection import DuckDBConnectionManager
+from squack_pipeline_v2.core.settings import DuckDBConfig, SimilarToConfig
+from squack_pipeline_v2.gold.graph_builder import GoldGraphBuilder
+from squack_pipeline_v2.gold.similarity import top_k_similar
+
+
+class TestTopKSimilar:
+    """Test blocked top-k similarity against a full similarity matrix."""
+
+    def test_matches_full_matrix(self):
+        """Blocked multiplies find the same neighbours, best first."""
+        rng = np.random.default_rng(7)
+        vectors = rng.standard_normal((200, 16)).astype(np.float32)
+
+        source, target, score, rank = top_k_similar(vectors, k=4, block_size=32)
+
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        similarity = normalized @ normalized.T
+        np.fill_diagonal(similarity, -np.inf)
+        for row in range(200):
+            expected = np.argsort(-similarity[row])[:4]
+            assert target[source == row].tolist() == expected.tolist()
+        assert rank[:4].tolist() == [1, 2, 3, 4]
+        assert np.all(np.diff(score[source == 0]) <= 0)
+
+    def test_groups_and_zero_vectors(self):
+        """Neighbours share a group; zero vectors are never linked."""
+        vectors = np.array([[1, 0], [0.9, 0.1], [0.8, 0.2], [1, 0.05], [0, 0]], dtype=np.float32)
+        groups = ["sf", "pc", "sf", "pc", "sf"]
+
+        source, target, _, _ = top_k_similar(vectors, k=3, groups=groups)
+
+        assert sorted(zip(source.tolist(), target.tolist())) == [(0, 2), (1, 3), (2, 0), (3, 1)]
+
+    def test_min_score(self):
+        """Neighbours below min_score are dropped."""
+        vectors = np.array([[1, 0], [0.99, 0.01], [0, 1]], dtype=np.float32)
+
+        source, target, score, _ = top_k_similar(vectors, k=2, min_score=0.5)
+
+        assert sorted(zip(source.tolist(), target.tolist())) == [(0, 1), (1, 0)]
+        assert np.all(score >= 0.5)
+
+
+class TestSimilarToTable:
+    """Test the SIMILAR_TO relationship table built from Gold embeddings."""
+
+    @pytest.fixture
+    def connection_manager(self):
+        """In-memory database with embedded properties in two cities."""
+        manager = DuckDBConnectionManager(DuckDBConfig(database_file=":memory:"))
+        manager.execute("""
+            CREATE OR REPLACE TABLE gold_graph_properties AS
+            SELECT
+                'p' || i AS listing_id,
+                CASE WHEN i % 2 = 0 THEN 'San Francisco' ELSE 'Park City' END AS city,
+                [cos(i * 0.3)::FLOAT, sin(i * 0.3)::FLOAT, 0.1::FLOAT]::FLOAT[3] AS embedding
+            FROM range(10) t(i)
+        """)
+        return manager
+
+    def test_build_similar_to_relationships(self, connection_manager):
+        """Every property gets k weighted, ranked neighbours in its city."""
+        builder = GoldGraphBuilder(connection_manager, SimilarToConfig(k=2, partition_by="city"))
+
+        table_name = builder.build_similar_to_relationships()
+
+        rows = connection_manager.execute(f"""
+            SELECT from_id, to_id, relationship_type, weight, rank
+            FROM {table_name} ORDER BY from_id, rank
+        """).fetchall()
+        assert len(rows) == 20
+        assert rows[0][:3] == ("property:p0", "property:p2", "SIMILAR_TO")
+        assert rows[0][4] == 1
+        assert rows[0][3] >= rows[1][3]
+        # Same city only: even ids link to even ids
+        assert all(int(from_id[-1]) % 2 == int(to_id[-1]) % 2 for from_id, to_id, *_ in rows)
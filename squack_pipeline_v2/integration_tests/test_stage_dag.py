@@ -0,0 +1,158 @@
+"""Integration tests for the dependency-aware stage scheduler.
+
+Tests that independent tasks overlap on separate DuckDB cursors, that
+dependent tasks wait for their inputs, and that failures stop the graph.
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from squack_pipeline_v2.core.connection import DuckDBConnectionManager
+from squack_pipeline_v2.core.settings import PipelineSettings
+from squack_pipeline_v2.models.pipeline.metrics import PipelineMetrics, StageMetrics, TaskMetrics
+from squack_pipeline_v2.orchestration.dag import PipelineDAG, PipelineTask
+from squack_pipeline_v2.orchestration.pipeline import PipelineOrchestrator
+
+
+class TestPipelineDAG:
+    """Test PipelineDAG scheduling."""
+
+    @pytest.fixture
+    def connection_manager(self):
+        """Create connection manager."""
+        settings = PipelineSettings()
+        settings.duckdb.database_file = ":memory:"
+        return DuckDBConnectionManager(settings.duckdb)
+
+    def _create_table_task(self, connection_manager, name, inputs=(), delay=0.0, log=None):
+        """Task creating dag_<name> with one row per row of its inputs (or one row)."""
+        def run() -> StageMetrics:
+            start_time = datetime.now()
+            if log is not None:
+                log.append((name, id(connection_manager.get_connection())))
+            time.sleep(delay)
+            source = " UNION ALL ".join(f"SELECT * FROM dag_{table}" for table in inputs) or "SELECT 1 AS id"
+            connection_manager.execute(f"CREATE OR REPLACE TABLE dag_{name} AS {source}")
+            count = connection_manager.count_records(f"dag_{name}")
+            return StageMetrics(
+                stage_name="test",
+                input_records=count,
+                output_records=count,
+                dropped_records=0,
+                start_time=start_time,
+                end_time=datetime.now()
+            )
+
+        return PipelineTask(
+            "test", name,
+            inputs=[f"dag_{table}" for table in inputs],
+            output=f"dag_{name}",
+            run=run
+        )
+
+    def test_independent_tasks_overlap_on_separate_cursors(self, connection_manager):
+        """Independent tasks run at the same time, each on its own cursor."""
+        log = []
+        tasks = [
+            self._create_table_task(connection_manager, name, delay=0.3, log=log)
+            for name in ("a", "b", "c")
+        ]
+
+        start = time.monotonic()
+        results = PipelineDAG(connection_manager, max_workers=3).run(tasks)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.8
+        assert len({cursor for _, cursor in log}) == 3
+        assert all(results[f"test.{name}"].output_records == 1 for name in ("a", "b", "c"))
+
+    def test_dependent_tasks_wait_for_inputs(self, connection_manager):
+        """A task starts only after the tasks producing its inputs finish."""
+        tasks = [
+            self._create_table_task(connection_manager, "joined", inputs=("left", "right")),
+            self._create_table_task(connection_manager, "left", delay=0.1),
+            self._create_table_task(connection_manager, "right", delay=0.2),
+        ]
+        dag = PipelineDAG(connection_manager, max_workers=3)
+
+        results = dag.run(tasks)
+
+        timings = {task.task_name: task for task in dag.task_metrics}
+        assert results["test.joined"].output_records == 2
+        assert timings["test.joined"].depends_on == ["test.left", "test.right"]
+        assert timings["test.joined"].start_time >= timings["test.right"].end_time
+
+    def test_failure_stops_dependents(self, connection_manager):
+        """Tasks depending on a failed task never start; the error is raised."""
+        ran = []
+
+        def fail() -> StageMetrics:
+            raise RuntimeError("bronze failed")
+
+        def dependent() -> StageMetrics:
+            ran.append("dependent")
+            raise AssertionError("should not run")
+
+        tasks = [
+            PipelineTask("test", "source", inputs=[], output="dag_source", run=fail),
+            PipelineTask("test", "dependent", inputs=["dag_source"], output="dag_dependent", run=dependent),
+        ]
+
+        with pytest.raises(RuntimeError, match="bronze failed"):
+            PipelineDAG(connection_manager).run(tasks)
+        assert ran == []
+
+    def test_cycle_is_rejected(self, connection_manager):
+        """Cyclic declarations fail before anything runs."""
+        tasks = [
+            self._create_table_task(connection_manager, "x", inputs=("y",)),
+            self._create_table_task(connection_manager, "y", inputs=("x",)),
+        ]
+
+        with pytest.raises(ValueError, match="cycle"):
+            PipelineDAG(connection_manager).run(tasks)
+
+
+def test_critical_path_follows_dependencies():
+    """critical_path_seconds is the longest dependent chain, not the sum."""
+    start = datetime(2026, 1, 1)
+
+    def task(name, seconds, depends_on=()):
+        return TaskMetrics(
+            task_name=name, layer=name.split(".")[0], entity_type=name.split(".")[1],
+            depends_on=list(depends_on),
+            start_time=start, end_time=start + timedelta(seconds=seconds)
+        )
+
+    metrics = PipelineMetrics(
+        pipeline_id="test",
+        start_time=start,
+        task_metrics=[
+            task("bronze.a", 1),
+            task("bronze.b", 4),
+            task("silver.a", 2, ["bronze.a"]),
+            task("silver.b", 1, ["bronze.b", "silver.a"]),
+        ]
+    )
+
+    assert metrics.critical_path_seconds == pytest.approx(5.0)
+
+
+def test_skipped_layers_are_dropped_from_the_graph():
+    """--skip-* layers are left out of the one Bronze/Silver/Gold graph."""
+    settings = PipelineSettings()
+    settings.duckdb.database_file = ":memory:"
+    settings.embedding.cache.enabled = False
+    orchestrator = PipelineOrchestrator(settings)
+
+    all_layers = {task.layer for task in orchestrator.medallion_tasks()}
+    without_bronze = orchestrator.medallion_tasks(skip_layers=["bronze"])
+    gold_only = orchestrator.medallion_tasks(skip_layers=["bronze", "silver"])
+
+    assert all_layers == {"bronze", "silver", "gold"}
+    assert {task.layer for task in without_bronze} == {"silver", "gold"}
+    assert {task.layer for task in gold_only} == {"gold"}
+    with pytest.raises(ValueError, match="Unknown layers"):
+        orchestrator.medallion_tasks(skip_layers=["platinum"])
@@ -4,6 +4,7 @@ from squack_pipeline_v2.models.pipeline.metrics import (
     StageMetrics,
     EntityMetrics,
     PipelineMetrics,
+    TaskMetrics,
 )
 from squack_pipeline_v2.models.pipeline.context import (
     ProcessingResult,
@@ -13,5 +14,6 @@ __all__ = [
     "StageMetrics",
     "EntityMetrics", 
     "PipelineMetrics",
+    "TaskMetrics",
     "ProcessingResult",
 ]
\ No newline at end of file
@@ -91,6 +91,25 @@ class EntityMetrics(BaseModel):
         return duration
 
 
+class TaskMetrics(BaseModel):
+    """Timing of one (entity, layer) task run by the stage scheduler."""
+    
+    model_config = ConfigDict(frozen=True)
+    
+    task_name: str = Field(description="Task name, e.g. silver.property")
+    layer: str = Field(description="Medallion layer")
+    entity_type: str = Field(description="Entity type")
+    depends_on: list[str] = Field(default_factory=list, description="Tasks this task waited for")
+    start_time: datetime = Field(description="Task start time")
+    end_time: datetime = Field(description="Task end time")
+    
+    @computed_field
+    @property
+    def duration_seconds(self) -> float:
+        """Calculate task duration in seconds."""
+        return (self.end_time - self.start_time).total_seconds()
+
+
 class PipelineMetrics(BaseModel):
     """Overall pipeline execution metrics."""
     
@@ -110,6 +129,17 @@ class PipelineMetrics(BaseModel):
     total_output_records: int = Field(default=0, ge=0, description="Total output records")
     total_embeddings: int = Field(default=0, ge=0, description="Total embeddings generated")
     
+    # Embedding cache
+    embedding_cache_hits: int = Field(default=0, ge=0, description="Embeddings served from the cache")
+    embedding_cache_misses: int = Field(default=0, ge=0, description="Embeddings requested from the provider")
+    
+    # Stage scheduler
+    task_metrics: list[TaskMetrics] = Field(default_factory=list, description="Per-task timings")
+    
+    # Change data capture
+    incremental: bool = Field(default=False, description="Run processed only changed records")
+    changed_records: int = Field(default=0, ge=0, description="Inserted, updated and deleted source records")
+    
     # Status
     status: str = Field(default="running", description="Pipeline status")
     error_messages: list[str] = Field(default_factory=list, description="Error messages")
@@ -128,6 +158,33 @@ class PipelineMetrics(BaseModel):
         """Check if pipeline completed successfully."""
         return self.status == "completed" and len(self.error_messages) == 0
     
+    @computed_field
+    @property
+    def embedding_cache_hit_rate(self) -> float:
+        """Fraction of embedding texts served from the cache."""
+        total = self.embedding_cache_hits + self.embedding_cache_misses
+        if total > 0:
+            return self.embedding_cache_hits / total
+        return 0.0
+    
+    @computed_field
+    @property
+    def critical_path_seconds(self) -> float:
+        """Longest chain of dependent task durations (lower bound on wall clock)."""
+        by_name = {task.task_name: task for task in self.task_metrics}
+        finish: dict[str, float] = {}
+        
+        def path_seconds(name: str) -> float:
+            if name not in finish:
+                task = by_name[name]
+                finish[name] = task.duration_seconds + max(
+                    (path_seconds(dep) for dep in task.depends_on if dep in by_name),
+                    default=0.0
+                )
+            return finish[name]
+        
+        return max((path_seconds(name) for name in by_name), default=0.0)
+    
     @computed_field
     @property
     def entities_processed(self) -> list[str]:
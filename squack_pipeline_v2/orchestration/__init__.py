@@ -4,6 +4,7 @@ Coordinates the entire medallion architecture pipeline:
 Bronze → Silver → Gold → Embeddings → Writers
 """
 
+from squack_pipeline_v2.orchestration.dag import PipelineDAG, PipelineTask
 from squack_pipeline_v2.orchestration.pipeline import PipelineOrchestrator
 
-__all__ = ["PipelineOrchestrator"]
+__all__ = ["PipelineOrchestrator", "PipelineDAG", "PipelineTask"]
@@ -0,0 +1,204 @@
+"""Dependency-aware parallel execution of pipeline stages.
+
+STAGE SCHEDULER ARCHITECTURE:
+=============================
+
+Each (entity, layer) step of the medallion pipeline is a PipelineTask that
+declares the tables it reads and the table it writes. A task becomes ready
+once every task producing one of its inputs has finished, so independent
+steps overlap:
+
+    bronze.property   bronze.neighborhood   bronze.wikipedia   bronze.location
+          |                   |                    |                  |
+    silver.property           |                    |           silver.location
+          |            silver.neighborhood <-------+------------------+
+          |                   |                    |
+          |                   +-----------> silver.wikipedia
+          v                   v                    v
+    gold.property      gold.neighborhood     gold.wikipedia    gold.location
+
+KEY DESIGN DECISIONS:
+--------------------
+1. **Table Dependencies**: Edges are derived from declared input/output
+   tables; inputs no task produces (e.g. Silver tables when only Gold runs)
+   are assumed to exist already
+2. **Cursor Per Task**: Tasks run inside DuckDBConnectionManager.cursor_scope(),
+   so concurrent stages never share a DuckDB connection
+3. **Fail Fast**: After the first failure no new tasks start; running tasks
+   finish and the error is re-raised
+4. **Timings**: Every task records a TaskMetrics entry for PipelineMetrics
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from squack_pipeline_v2.core.connection import DuckDBConnectionManager
+from squack_pipeline_v2.core.logging import PipelineLogger
+from squack_pipeline_v2.core.profiling import profile_stage
+from squack_pipeline_v2.models.pipeline.metrics import StageMetrics, TaskMetrics
+
+
+class PipelineTask:
+    """One (entity, layer) step with declared input and output tables."""
+
+    def __init__(
+        self,
+        layer: str,
+        entity_type: str,
+        inputs: List[str],
+        output: str,
+        run: Callable[[], StageMetrics]
+    ):
+        """Initialize task.
+
+        Args:
+            layer: Medallion layer (bronze, silver, gold)
+            entity_type: Entity type name
+            inputs: Tables the task reads
+            output: Table or view the task writes
+            run: Callable performing the step and returning its metrics
+        """
+        self.layer = layer
+        self.entity_type = entity_type
+        self.inputs = inputs
+        self.output = output
+        self.run = run
+
+    @property
+    def name(self) -> str:
+        """Task name, e.g. silver.property."""
+        return f"{self.layer}.{self.entity_type}"
+
+
+class PipelineDAG:
+    """Runs PipelineTasks on a thread pool as soon as their inputs are ready."""
+
+    def __init__(self, connection_manager: DuckDBConnectionManager, max_workers: int = 4):
+        """Initialize executor.
+
+        Args:
+            connection_manager: Connection manager providing per-task cursors
+            max_workers: Tasks run at the same time
+        """
+        self.connection_manager = connection_manager
+        self.max_workers = max(1, max_workers)
+        self.task_metrics: List[TaskMetrics] = []
+        self.logger = PipelineLogger.get_logger(self.__class__.__name__)
+
+    def resolve_dependencies(self, tasks: List[PipelineTask]) -> Dict[str, List[str]]:
+        """Map each task to the tasks producing its inputs.
+
+        Args:
+            tasks: Tasks to schedule
+
+        Returns:
+            Task name to names of the tasks it depends on
+        """
+        producers = {task.output: task.name for task in tasks}
+        dependencies = {
+            task.name: [producers[table] for table in task.inputs if table in producers]
+            for task in tasks
+        }
+
+        # Reject cycles up front instead of deadlocking
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle involving task {name}")
+            visiting.add(name)
+            for dependency in dependencies[name]:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in dependencies:
+            visit(name)
+
+        return dependencies
+
+    def run(self, tasks: List[PipelineTask]) -> Dict[str, StageMetrics]:
+        """Run tasks respecting dependencies.
+
+        Per-task timings of the run are left in task_metrics.
+
+        Args:
+            tasks: Tasks to run
+
+        Returns:
+            Task name to the stage metrics returned by the task
+        """
+        by_name = {task.name: task for task in tasks}
+        dependencies = self.resolve_dependencies(tasks)
+
+        # Open the shared connection once before tasks derive cursors from it
+        self.connection_manager.connect()
+        pending = dict(dependencies)
+        results: Dict[str, StageMetrics] = {}
+        timings: Dict[str, TaskMetrics] = {}
+        running: Dict[Future, str] = {}
+        error: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage") as executor:
+            while pending or running:
+                if error is None:
+                    ready = [
+                        name for name, deps in pending.items()
+                        if all(dep in timings for dep in deps)
+                    ]
+                    for name in ready:
+                        del pending[name]
+                        running[executor.submit(self._run_task, by_name[name])] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        stage_metrics, start_time, end_time = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Task {name} failed: {e}")
+                        error = error or e
+                        continue
+
+                    task = by_name[name]
+                    results[name] = stage_metrics
+                    timings[name] = TaskMetrics(
+                        task_name=name,
+                        layer=task.layer,
+                        entity_type=task.entity_type,
+                        depends_on=dependencies[name],
+                        start_time=start_time,
+                        end_time=end_time
+                    )
+                    self.logger.info(
+                        f"Task {name} finished in {timings[name].duration_seconds:.2f}s"
+                    )
+
+        self.task_metrics = list(timings.values())
+        if error is not None:
+            raise error
+
+        return results
+
+    def _run_task(self, task: PipelineTask):
+        """Run one task on its own DuckDB cursor.
+
+        Args:
+            task: Task to run
+
+        Returns:
+            Tuple of (stage metrics, start time, end time)
+        """
+        with self.connection_manager.cursor_scope(), profile_stage(task.name) as profile:
+            start_time = datetime.now()
+            stage_metrics = task.run()
+            if profile is not None:
+                profile.input_records = stage_metrics.input_records
+                profile.output_records = stage_metrics.output_records
+            return stage_metrics, start_time, datetime.now()
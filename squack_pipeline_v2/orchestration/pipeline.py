@@ -6,17 +6,32 @@ Coordinates the flow:
 3. Gold: Enrich and compute metrics
 4. Embeddings: Generate vectors
 5. Writers: Export to Parquet/Elasticsearch
+
+Bronze, Silver and Gold steps are (entity, layer) tasks run by PipelineDAG,
+so independent steps overlap instead of running one after another.
+
+Every Bronze ingestion is fingerprinted (core/change_data.py). With
+processing.incremental enabled, Silver and the Elasticsearch/Neo4j writers
+only process the records that changed since the last successful run.
+
+With processing.profile enabled every task and writer is recorded by a
+PipelineProfiler (core/profiling.py) and write_profile() saves the run report.
 """
 
-from typing import Dict, Any, Optional
+from typing import Collection, Dict, Any, List, Optional
 from pathlib import Path
 import logging
 from datetime import datetime
+from squack_pipeline_v2.core.change_data import CDC_ENTITY_KEYS, ChangeDetector, ChangeSet
 from squack_pipeline_v2.core.connection import DuckDBConnectionManager as ConnectionManager
 from squack_pipeline_v2.core.settings import PipelineSettings
 from squack_pipeline_v2.core.logging import log_stage, setup_logging
+from squack_pipeline_v2.core.profiling import PipelineProfiler, RunProfile, profile_stage, set_profiler
 from squack_pipeline_v2.core.table_names import ENTITY_TYPES, EntityType
-from squack_pipeline_v2.models.pipeline.metrics import PipelineMetrics, EntityMetrics, StageMetrics
+from squack_pipeline_v2.models.pipeline.metrics import (
+    PipelineMetrics, EntityMetrics, StageMetrics, TaskMetrics
+)
+from squack_pipeline_v2.orchestration.dag import PipelineDAG, PipelineTask
 
 # Bronze layer
 from squack_pipeline_v2.bronze.property import PropertyBronzeIngester
@@ -38,6 +53,7 @@ from squack_pipeline_v2.gold.location import LocationGoldEnricher
 
 # Embeddings
 from squack_pipeline_v2.embeddings.providers import create_provider
+from squack_pipeline_v2.embeddings.cache import EmbeddingCache
 
 # Writers
 from squack_pipeline_v2.writers.parquet import ParquetWriter
@@ -72,8 +88,28 @@ class PipelineOrchestrator:
         # Initialize embedding provider once at startup
         self.embedding_provider = self._initialize_embedding_provider()
         
+        # Persistent embedding cache survives across runs (separate DuckDB file)
+        self.embedding_cache = (
+            EmbeddingCache(self.settings.embedding.cache)
+            if self.settings.embedding.cache.enabled else None
+        )
+        
+        # Change data capture - change sets of this run by entity type
+        self.change_detector = ChangeDetector(self.connection_manager)
+        self.change_sets: Dict[str, ChangeSet] = {}
+        
+        # Per-stage profiling (--profile)
+        self.profiler: Optional[PipelineProfiler] = None
+        if self.settings.processing.profile:
+            self.profiler = PipelineProfiler(
+                self.pipeline_id,
+                memory_probe=self.connection_manager.memory_usage_bytes
+            )
+            set_profiler(self.profiler)
+        
         # Track metrics
         self.metrics = {}
+        self.task_metrics: List[TaskMetrics] = []
     
     def _initialize_embedding_provider(self) -> Optional['EmbeddingProvider']:
         """Initialize embedding provider once at startup.
@@ -96,7 +132,13 @@ class PipelineOrchestrator:
                 provider_type=provider_type,
                 api_key=api_key,
                 model_name=self.settings.get_model_name(),
-                base_url=self.settings.embedding.ollama_base_url if provider_type == "ollama" else None
+                base_url=self.settings.embedding.ollama_base_url if provider_type == "ollama" else None,
+                max_concurrency=self.settings.embedding.max_concurrency,
+                requests_per_minute=self.settings.embedding.requests_per_minute,
+                tokens_per_minute=self.settings.embedding.tokens_per_minute,
+                max_retries=self.settings.embedding.max_retries,
+                local_batch_size=self.settings.embedding.local_batch_size,
+                local_num_threads=self.settings.embedding.local_num_threads
             )
             logger.info(f"Embedding provider initialized: {provider_type}")
             return provider
@@ -104,210 +146,336 @@ class PipelineOrchestrator:
             logger.error(f"Failed to initialize embedding provider: {e}")
             return None
     
-    @log_stage("Pipeline: Run Bronze Layer")
-    def run_bronze_layer(
-        self,
-        sample_size: Optional[int] = None
-    ) -> Dict[str, EntityMetrics]:
-        """Run Bronze layer ingestion for all entities.
+    def _bronze_task(self, entity: EntityType, ingester_class, sample_size: Optional[int]) -> PipelineTask:
+        """Build the Bronze ingestion task for an entity.
         
         Args:
+            entity: Entity type
+            ingester_class: Bronze ingester class for the entity
             sample_size: Optional sample size for testing
             
         Returns:
-            Bronze layer metrics
+            Pipeline task
         """
-        metrics = {}
-        
-        # Property ingestion
-        entity = ENTITY_TYPES.property
-        ingester = PropertyBronzeIngester(self.settings, self.connection_manager)
-        start_time = datetime.now()
-        
-        ingester.ingest(
-            table_name=entity.bronze_table,
-            sample_size=sample_size
-        )
-        
-        end_time = datetime.now()
-        
-        metrics[entity.name] = EntityMetrics(
-            entity_type=entity.name,
-            bronze_metrics=StageMetrics(
-                stage_name="bronze",
-                input_records=ingester.records_ingested,
-                output_records=ingester.records_ingested,
-                dropped_records=0,
-                start_time=start_time,
-                end_time=end_time
+        def run() -> StageMetrics:
+            ingester = ingester_class(self.settings, self.connection_manager)
+            start_time = datetime.now()
+            
+            ingester.ingest(
+                table_name=entity.bronze_table,
+                sample_size=sample_size
             )
-        )
-        
-        # Neighborhood ingestion
-        entity = ENTITY_TYPES.neighborhood
-        ingester = NeighborhoodBronzeIngester(self.settings, self.connection_manager)
-        start_time = datetime.now()
-        
-        ingester.ingest(
-            table_name=entity.bronze_table,
-            sample_size=sample_size
-        )
-        
-        end_time = datetime.now()
-        
-        metrics[entity.name] = EntityMetrics(
-            entity_type=entity.name,
-            bronze_metrics=StageMetrics(
+            
+            # Fingerprint keyed entities so the next run can diff against them
+            if entity.name in CDC_ENTITY_KEYS:
+                self.change_sets[entity.name] = self.change_detector.detect(
+                    entity.name, entity.bronze_table
+                )
+            
+            return StageMetrics(
                 stage_name="bronze",
                 input_records=ingester.records_ingested,
                 output_records=ingester.records_ingested,
                 dropped_records=0,
                 start_time=start_time,
-                end_time=end_time
+                end_time=datetime.now()
             )
-        )
-        
-        # Wikipedia ingestion
-        entity = ENTITY_TYPES.wikipedia
-        ingester = WikipediaBronzeIngester(self.settings, self.connection_manager)
-        start_time = datetime.now()
         
-        ingester.ingest(
-            table_name=entity.bronze_table,
-            sample_size=sample_size
-        )
-        
-        end_time = datetime.now()
+        return PipelineTask("bronze", entity.name, inputs=[], output=entity.bronze_table, run=run)
+    
+    def _silver_task(self, entity: EntityType, transformer_factory, inputs: List[str]) -> PipelineTask:
+        """Build the Silver transformation task for an entity.
         
-        metrics[entity.name] = EntityMetrics(
-            entity_type=entity.name,
-            bronze_metrics=StageMetrics(
-                stage_name="bronze",
-                input_records=ingester.records_ingested,
-                output_records=ingester.records_ingested,
+        Args:
+            entity: Entity type
+            transformer_factory: Callable returning the Silver transformer
+            inputs: Tables the transformation reads besides its Bronze table
+            
+        Returns:
+            Pipeline task
+        """
+        def run() -> StageMetrics:
+            transformer = transformer_factory()
+            start_time = datetime.now()
+            
+            metadata = transformer.transform(
+                entity.bronze_table,
+                entity.silver_table,
+                changes=self.get_changes(entity.name)
+            )
+            
+            end_time = datetime.now()
+            
+            return StageMetrics(
+                stage_name="silver",
+                input_records=metadata.input_count,
+                output_records=metadata.output_count,
                 dropped_records=0,
                 start_time=start_time,
                 end_time=end_time
             )
-        )
-        
-        # Location ingestion
-        entity = ENTITY_TYPES.location
-        ingester = LocationBronzeIngester(self.settings, self.connection_manager)
-        start_time = datetime.now()
         
-        ingester.ingest(
-            table_name=entity.bronze_table,
-            sample_size=sample_size
+        return PipelineTask(
+            "silver", entity.name,
+            inputs=[entity.bronze_table, *inputs],
+            output=entity.silver_table,
+            run=run
         )
+    
+    def _gold_task(self, entity: EntityType, enricher_class, inputs: List[str]) -> PipelineTask:
+        """Build the Gold enrichment task for an entity.
         
-        end_time = datetime.now()
-        
-        metrics[entity.name] = EntityMetrics(
-            entity_type=entity.name,
-            bronze_metrics=StageMetrics(
-                stage_name="bronze",
-                input_records=ingester.records_ingested,
-                output_records=ingester.records_ingested,
+        Args:
+            entity: Entity type
+            enricher_class: Gold enricher class for the entity
+            inputs: Tables the enrichment reads besides its Silver table
+            
+        Returns:
+            Pipeline task
+        """
+        def run() -> StageMetrics:
+            enricher = enricher_class(self.settings, self.connection_manager)
+            start_time = datetime.now()
+            
+            metadata = enricher.enrich(entity.silver_table, entity.gold_table)
+            
+            end_time = datetime.now()
+            
+            return StageMetrics(
+                stage_name="gold",
+                input_records=metadata.input_count,
+                output_records=metadata.output_count,
                 dropped_records=0,
                 start_time=start_time,
                 end_time=end_time
             )
-        )
         
-        return metrics
+        return PipelineTask(
+            "gold", entity.name,
+            inputs=[entity.silver_table, *inputs],
+            output=entity.gold_table,
+            run=run
+        )
     
-    @log_stage("Pipeline: Run Silver Layer")
-    def run_silver_layer(self) -> Dict[str, StageMetrics]:
-        """Run Silver layer transformations for all entities.
+    @property
+    def incremental(self) -> bool:
+        """Whether downstream steps only process changed records."""
+        return self.settings.processing.incremental
+    
+    def get_changes(self, entity_type: str) -> Optional[ChangeSet]:
+        """Change set to apply for an entity in incremental mode.
+        
+        Args:
+            entity_type: Entity type name
             
         Returns:
-            Silver layer metrics
+            Change set, or None when the entity is processed in full
         """
-        metrics = {}
-        
-        # Location transformation (MUST BE FIRST - neighborhoods depend on it)
-        entity = ENTITY_TYPES.location
-        transformer = LocationSilverTransformer(self.settings, self.connection_manager)
-        start_time = datetime.now()
-        
-        transformer.transform(entity.bronze_table, entity.silver_table)
-        
-        end_time = datetime.now()
-        
-        count = self.connection_manager.count_records(entity.silver_table)
+        if not self.incremental:
+            return None
+        return self.change_sets.get(entity_type)
+    
+    def commit_changes(self) -> None:
+        """Store this run's fingerprints as the baseline for the next run.
         
-        metrics[entity.name] = StageMetrics(
-            stage_name="silver",
-            input_records=count,
-            output_records=count,
-            dropped_records=0,
-            start_time=start_time,
-            end_time=end_time
-        )
+        Call only after every step of the run succeeded.
+        """
+        for change_set in self.change_sets.values():
+            self.change_detector.commit(change_set)
+    
+    def bronze_tasks(self, sample_size: Optional[int] = None) -> List[PipelineTask]:
+        """Bronze ingestion tasks - all sources are independent.
         
-        # Property transformation
-        entity = ENTITY_TYPES.property
-        transformer = PropertySilverTransformer(self.settings, self.connection_manager, self.embedding_provider)
-        start_time = datetime.now()
+        Args:
+            sample_size: Optional sample size for testing
+            
+        Returns:
+            Bronze tasks
+        """
+        return [
+            self._bronze_task(ENTITY_TYPES.property, PropertyBronzeIngester, sample_size),
+            self._bronze_task(ENTITY_TYPES.neighborhood, NeighborhoodBronzeIngester, sample_size),
+            self._bronze_task(ENTITY_TYPES.wikipedia, WikipediaBronzeIngester, sample_size),
+            self._bronze_task(ENTITY_TYPES.location, LocationBronzeIngester, sample_size),
+        ]
+    
+    def silver_tasks(self) -> List[PipelineTask]:
+        """Silver transformation tasks.
         
-        transformer.transform(entity.bronze_table, entity.silver_table)
+        Neighborhoods join silver_locations and Wikipedia joins
+        silver_neighborhoods; properties and locations are independent.
         
-        end_time = datetime.now()
+        Returns:
+            Silver tasks
+        """
+        def embedding_transformer(transformer_class):
+            return lambda: transformer_class(
+                self.settings, self.connection_manager, self.embedding_provider, self.embedding_cache
+            )
         
-        # Get record count
-        count = self.connection_manager.count_records(entity.silver_table)
+        return [
+            self._silver_task(
+                ENTITY_TYPES.location,
+                lambda: LocationSilverTransformer(self.settings, self.connection_manager),
+                inputs=[]
+            ),
+            self._silver_task(
+                ENTITY_TYPES.property,
+                embedding_transformer(PropertySilverTransformer),
+                inputs=[]
+            ),
+            self._silver_task(
+                ENTITY_TYPES.neighborhood,
+                embedding_transformer(NeighborhoodSilverTransformer),
+                inputs=[ENTITY_TYPES.location.silver_table]
+            ),
+            self._silver_task(
+                ENTITY_TYPES.wikipedia,
+                embedding_transformer(WikipediaSilverTransformer),
+                inputs=[ENTITY_TYPES.neighborhood.silver_table]
+            ),
+        ]
+    
+    def gold_tasks(self) -> List[PipelineTask]:
+        """Gold enrichment tasks.
         
-        metrics[entity.name] = StageMetrics(
-            stage_name="silver",
-            input_records=count,  # Approximate
-            output_records=count,
-            dropped_records=0,
-            start_time=start_time,
-            end_time=end_time
-        )
+        Gold properties join silver_neighborhoods; the others only read
+        their own Silver table.
         
-        # Neighborhood transformation (depends on locations)
-        entity = ENTITY_TYPES.neighborhood
-        transformer = NeighborhoodSilverTransformer(self.settings, self.connection_manager, self.embedding_provider)
-        start_time = datetime.now()
+        Returns:
+            Gold tasks
+        """
+        return [
+            self._gold_task(ENTITY_TYPES.location, LocationGoldEnricher, inputs=[]),
+            self._gold_task(
+                ENTITY_TYPES.property,
+                PropertyGoldEnricher,
+                inputs=[ENTITY_TYPES.neighborhood.silver_table]
+            ),
+            self._gold_task(ENTITY_TYPES.neighborhood, NeighborhoodGoldEnricher, inputs=[]),
+            self._gold_task(ENTITY_TYPES.wikipedia, WikipediaGoldEnricher, inputs=[]),
+        ]
+    
+    def medallion_tasks(
+        self,
+        sample_size: Optional[int] = None,
+        skip_layers: Collection[str] = ()
+    ) -> List[PipelineTask]:
+        """Bronze, Silver and Gold tasks as one graph.
         
-        transformer.transform(entity.bronze_table, entity.silver_table)
+        Skipped layers are dropped from the graph; tasks of the remaining
+        layers then read the tables a previous run left behind.
         
-        end_time = datetime.now()
+        Args:
+            sample_size: Optional sample size for testing
+            skip_layers: Layers to leave out (bronze, silver, gold)
+            
+        Returns:
+            Tasks of the layers to run
+        """
+        layers = {
+            "bronze": lambda: self.bronze_tasks(sample_size),
+            "silver": self.silver_tasks,
+            "gold": self.gold_tasks,
+        }
+        unknown = set(skip_layers) - set(layers)
+        if unknown:
+            raise ValueError(f"Unknown layers: {', '.join(sorted(unknown))}")
+        return [
+            task
+            for layer, build_tasks in layers.items()
+            if layer not in skip_layers
+            for task in build_tasks()
+        ]
+    
+    @log_stage("Pipeline: Run Medallion Layers")
+    def run_medallion_layers(
+        self,
+        sample_size: Optional[int] = None,
+        skip_layers: Collection[str] = ()
+    ) -> Dict[str, StageMetrics]:
+        """Run Bronze, Silver and Gold as one task graph.
         
-        count = self.connection_manager.count_records(entity.silver_table)
+        Running the layers together lets e.g. Wikipedia Silver overlap
+        property Silver instead of waiting for every Bronze task.
         
-        metrics[entity.name] = StageMetrics(
-            stage_name="silver",
-            input_records=count,
-            output_records=count,
-            dropped_records=0,
-            start_time=start_time,
-            end_time=end_time
-        )
+        Args:
+            sample_size: Optional sample size for testing
+            skip_layers: Layers to leave out (bronze, silver, gold)
+            
+        Returns:
+            Task name (layer.entity) to stage metrics
+        """
+        results = self.run_tasks(self.medallion_tasks(sample_size, skip_layers))
         
-        # Wikipedia transformation
-        entity = ENTITY_TYPES.wikipedia
-        transformer = WikipediaSilverTransformer(self.settings, self.connection_manager, self.embedding_provider)
-        start_time = datetime.now()
+        # Keep the persistent embedding cache within its size/age limits
+        if "silver" not in skip_layers:
+            self.prune_embedding_cache()
         
-        transformer.transform(entity.bronze_table, entity.silver_table)
+        return results
+    
+    def run_tasks(self, tasks: List[PipelineTask]) -> Dict[str, StageMetrics]:
+        """Run tasks on the stage scheduler and record their timings.
         
-        end_time = datetime.now()
+        Args:
+            tasks: Pipeline tasks
+            
+        Returns:
+            Task name (layer.entity) to stage metrics
+        """
+        dag = PipelineDAG(self.connection_manager, max_workers=self.settings.processing.max_workers)
+        try:
+            return dag.run(tasks)
+        finally:
+            self.task_metrics.extend(dag.task_metrics)
+    
+    @staticmethod
+    def _layer_metrics(results: Dict[str, StageMetrics], layer: str) -> Dict[str, StageMetrics]:
+        """Select one layer's metrics keyed by entity name."""
+        prefix = f"{layer}."
+        return {
+            name[len(prefix):]: metrics
+            for name, metrics in results.items()
+            if name.startswith(prefix)
+        }
+    
+    @staticmethod
+    def _bronze_entity_metrics(bronze: Dict[str, StageMetrics]) -> Dict[str, EntityMetrics]:
+        """Wrap Bronze stage metrics into entity metrics."""
+        return {
+            entity_type: EntityMetrics(entity_type=entity_type, bronze_metrics=metrics)
+            for entity_type, metrics in bronze.items()
+        }
+    
+    @log_stage("Pipeline: Run Bronze Layer")
+    def run_bronze_layer(
+        self,
+        sample_size: Optional[int] = None
+    ) -> Dict[str, EntityMetrics]:
+        """Run Bronze layer ingestion for all entities.
         
-        count = self.connection_manager.count_records(entity.silver_table)
+        Args:
+            sample_size: Optional sample size for testing
+            
+        Returns:
+            Bronze layer metrics
+        """
+        results = self.run_tasks(self.bronze_tasks(sample_size))
+        return self._bronze_entity_metrics(self._layer_metrics(results, "bronze"))
+    
+    @log_stage("Pipeline: Run Silver Layer")
+    def run_silver_layer(self) -> Dict[str, StageMetrics]:
+        """Run Silver layer transformations for all entities.
+            
+        Returns:
+            Silver layer metrics
+        """
+        results = self.run_tasks(self.silver_tasks())
         
-        metrics[entity.name] = StageMetrics(
-            stage_name="silver",
-            input_records=count,
-            output_records=count,
-            dropped_records=0,
-            start_time=start_time,
-            end_time=end_time
-        )
+        # Keep the persistent embedding cache within its size/age limits
+        self.prune_embedding_cache()
         
-        return metrics
+        return self._layer_metrics(results, "silver")
     
     @log_stage("Pipeline: Run Gold Layer")
     def run_gold_layer(self) -> Dict[str, StageMetrics]:
@@ -316,101 +484,8 @@ class PipelineOrchestrator:
         Returns:
             Gold layer metrics
         """
-        metrics = {}
-        
-        # Location enrichment (MUST BE FIRST - properties and neighborhoods depend on it)
-        entity = ENTITY_TYPES.location
-        enricher = LocationGoldEnricher(
-            self.settings, 
-            self.connection_manager
-        )
-        start_time = datetime.now()
-        
-        enricher.enrich(entity.silver_table, entity.gold_table)
-        
-        end_time = datetime.now()
-        
-        count = self.connection_manager.count_records(entity.gold_table)
-        
-        metrics[entity.name] = StageMetrics(
-            stage_name="gold",
-            input_records=count,
-            output_records=count,
-            dropped_records=0,
-            start_time=start_time,
-            end_time=end_time
-        )
-        
-        # Property enrichment
-        entity = ENTITY_TYPES.property
-        enricher = PropertyGoldEnricher(
-            self.settings, 
-            self.connection_manager
-        )
-        start_time = datetime.now()
-        
-        enricher.enrich(entity.silver_table, entity.gold_table)
-        
-        end_time = datetime.now()
-        
-        count = self.connection_manager.count_records(entity.gold_table)
-        
-        metrics[entity.name] = StageMetrics(
-            stage_name="gold",
-            input_records=count,
-            output_records=count,
-            dropped_records=0,
-            start_time=start_time,
-            end_time=end_time
-        )
-        
-        # Neighborhood enrichment
-        entity = ENTITY_TYPES.neighborhood
-        enricher = NeighborhoodGoldEnricher(
-            self.settings, 
-            self.connection_manager
-        )
-        start_time = datetime.now()
-        
-        enricher.enrich(entity.silver_table, entity.gold_table)
-        
-        end_time = datetime.now()
-        
-        count = self.connection_manager.count_records(entity.gold_table)
-        
-        metrics[entity.name] = StageMetrics(
-            stage_name="gold",
-            input_records=count,
-            output_records=count,
-            dropped_records=0,
-            start_time=start_time,
-            end_time=end_time
-        )
-        
-        # Wikipedia enrichment
-        entity = ENTITY_TYPES.wikipedia
-        enricher = WikipediaGoldEnricher(
-            self.settings, 
-            self.connection_manager
-        )
-        start_time = datetime.now()
-        
-        enricher.enrich(entity.silver_table, entity.gold_table)
-        
-        end_time = datetime.now()
-        
-        count = self.connection_manager.count_records(entity.gold_table)
-        
-        metrics[entity.name] = StageMetrics(
-            stage_name="gold",
-            input_records=count,
-            output_records=count,
-            dropped_records=0,
-            start_time=start_time,
-            end_time=end_time
-        )
-        
-        return metrics
+        results = self.run_tasks(self.gold_tasks())
+        return self._layer_metrics(results, "gold")
     
     # Embeddings are now generated in Silver layer, no separate step needed
     
@@ -419,7 +494,7 @@ class PipelineOrchestrator:
         """Build graph-specific tables for Neo4j export."""
         from squack_pipeline_v2.gold.graph_builder import GoldGraphBuilder
         
-        graph_builder = GoldGraphBuilder(self.connection_manager)
+        graph_builder = GoldGraphBuilder(self.connection_manager, self.settings.output.neo4j.similar_to)
         
         # Build all graph tables using the comprehensive method
         metadata = graph_builder.build_all_graph_tables()
@@ -451,44 +526,103 @@ class PipelineOrchestrator:
         
         # Parquet export
         if write_parquet and self.settings.output.parquet_enabled:
-            writer = ParquetWriter(
-                self.connection_manager,
-                Path(self.settings.output.parquet_dir)
-            )
-            stats["parquet"] = writer.export_all_layers()
+            with profile_stage("writer.parquet") as profile:
+                writer = ParquetWriter(
+                    self.connection_manager,
+                    Path(self.settings.output.parquet_dir)
+                )
+                stats["parquet"] = writer.export_all_layers()
+                if profile is not None:
+                    files = [f for layer in stats["parquet"].values() for f in layer]
+                    profile.output_records = sum(f["records"] for f in files)
+                    profile.bytes_written = sum(f["bytes"] for f in files)
         
         # Elasticsearch export
         if write_elasticsearch or self.settings.output.elasticsearch_enabled:
-            writer = ElasticsearchWriter(
-                self.connection_manager,
-                self.settings
-            )
-            stats["elasticsearch"] = writer.index_all()
+            with profile_stage("writer.elasticsearch") as profile:
+                writer = ElasticsearchWriter(
+                    self.connection_manager,
+                    self.settings
+                )
+                stats["elasticsearch"] = writer.index_all(
+                    changes=self.change_sets if self.incremental else None
+                )
+                if profile is not None:
+                    entities = stats["elasticsearch"]["entities"].values()
+                    profile.output_records = stats["elasticsearch"]["total_indexed"]
+                    profile.bytes_written = sum(e.get("bytes", 0) for e in entities)
         
         # Neo4j export
         if write_neo4j or self.settings.output.neo4j.enabled:
-            from squack_pipeline_v2.writers.neo4j import Neo4jWriter, Neo4jConfig
-            
-            neo4j_config = Neo4jConfig(
-                uri=self.settings.output.neo4j.uri,
-                username=self.settings.output.neo4j.username,
-                password=self.settings.output.neo4j.get_password() or ""
-            )
+            load_mode = self.settings.output.neo4j.load_mode
+            if self.incremental and load_mode != "merge":
+                # Initial-load modes would duplicate what is already in the graph
+                logger.warning(f"Neo4j load_mode {load_mode} ignored in incremental mode; using merge")
+                load_mode = "merge"
             
-            writer = Neo4jWriter(neo4j_config, self.connection_manager)
-            
-            # Write all data using the comprehensive method
-            write_metadata = writer.write_all()
-            
-            stats["neo4j"] = {
-                "total_nodes": write_metadata.total_nodes,
-                "total_relationships": write_metadata.total_relationships,
-                "node_types": len(write_metadata.node_results),
-                "relationship_types": len(write_metadata.relationship_results),
-                "duration_seconds": write_metadata.total_duration_seconds
-            }
+            if load_mode == "admin_import":
+                with profile_stage("writer.neo4j_import") as profile:
+                    from squack_pipeline_v2.writers.neo4j_import import Neo4jImportExporter
+                    
+                    exporter = Neo4jImportExporter(
+                        self.connection_manager,
+                        Path(self.settings.output.neo4j.import_dir),
+                        database=self.settings.output.neo4j.database
+                    )
+                    manifest = exporter.export_all()
+                    
+                    stats["neo4j"] = {
+                        "total_nodes": manifest.total_nodes,
+                        "total_relationships": manifest.total_relationships,
+                        "node_types": len(manifest.node_files),
+                        "relationship_types": len(manifest.relationship_files),
+                        "duration_seconds": manifest.duration_seconds,
+                        "import_dir": manifest.output_dir,
+                        "import_command": manifest.command
+                    }
+                    if profile is not None:
+                        profile.output_records = manifest.total_nodes + manifest.total_relationships
+                        profile.bytes_written = sum(f.bytes for f in [*manifest.node_files, *manifest.relationship_files])
+                return stats
             
-            writer.close()
+            with profile_stage("writer.neo4j") as profile:
+                from squack_pipeline_v2.writers.neo4j import Neo4jWriter, Neo4jConfig
+                
+                neo4j_config = Neo4jConfig(
+                    uri=self.settings.output.neo4j.uri,
+                    username=self.settings.output.neo4j.username,
+                    password=self.settings.output.neo4j.get_password() or "",
+                    database=self.settings.output.neo4j.database,
+                    chunk_size=self.settings.output.neo4j.chunk_size,
+                    max_workers=self.settings.output.neo4j.max_workers,
+                    max_retry_time=self.settings.output.neo4j.max_retry_time,
+                    create_only=load_mode == "create"
+                )
+                
+                writer = Neo4jWriter(
+                    neo4j_config,
+                    self.connection_manager,
+                    changes=self.change_sets if self.incremental else None
+                )
+                
+                # Write all data using the comprehensive method
+                write_metadata = writer.write_all()
+                
+                stats["neo4j"] = {
+                    "total_nodes": write_metadata.total_nodes,
+                    "total_relationships": write_metadata.total_relationships,
+                    "nodes_deleted": write_metadata.nodes_deleted,
+                    "node_types": len(write_metadata.node_results),
+                    "relationship_types": len(write_metadata.relationship_results),
+                    "duration_seconds": write_metadata.total_duration_seconds,
+                    "chunks": len(write_metadata.chunk_results),
+                    "records_per_second": write_metadata.records_per_second
+                }
+                
+                writer.close()
+                if profile is not None:
+                    profile.output_records = write_metadata.total_nodes + write_metadata.total_relationships
+                    profile.bytes_written = write_metadata.bytes_written
         
         return stats
     
@@ -516,21 +650,17 @@ class PipelineOrchestrator:
         logger.info(f"Starting pipeline run: {self.pipeline_id}")
         
         try:
-            # Bronze layer
-            logger.info("Running Bronze layer...")
-            bronze_metrics = self.run_bronze_layer(sample_size)
+            logger.info("Running Bronze, Silver and Gold layers...")
+            results = self.run_medallion_layers(sample_size)
+            
+            bronze_metrics = self._bronze_entity_metrics(self._layer_metrics(results, "bronze"))
+            silver_metrics = self._layer_metrics(results, "silver")
+            gold_metrics = self._layer_metrics(results, "gold")
+            
             bronze_total = sum(m.bronze_metrics.output_records for m in bronze_metrics.values())
             logger.info(f"Bronze complete: {bronze_total:,} total records ingested")
-            
-            # Silver layer
-            logger.info("Running Silver layer...")
-            silver_metrics = self.run_silver_layer()
             silver_total = sum(m.output_records for m in silver_metrics.values())
             logger.info(f"Silver complete: {silver_total:,} total records transformed")
-            
-            # Gold layer
-            logger.info("Running Gold layer...")
-            gold_metrics = self.run_gold_layer()
             gold_total = sum(m.output_records for m in gold_metrics.values())
             logger.info(f"Gold complete: {gold_total:,} total records enriched")
             
@@ -570,8 +700,14 @@ class PipelineOrchestrator:
                 if write_neo4j and "neo4j" in writer_stats:
                     logger.info(f"Neo4j: {writer_stats['neo4j'].get('total_nodes', 0)} nodes, {writer_stats['neo4j'].get('total_relationships', 0)} relationships written")
             
+            # Everything succeeded - move the change baseline forward
+            self.commit_changes()
+            
             pipeline_end = datetime.now()
             
+            # Embedding cache counters
+            cache_stats = self.embedding_cache.get_stats() if self.embedding_cache else None
+            
             # Create pipeline metrics
             metrics = PipelineMetrics(
                 pipeline_id=self.pipeline_id,
@@ -580,10 +716,16 @@ class PipelineOrchestrator:
                 property_metrics=bronze_metrics.get("property"),
                 neighborhood_metrics=bronze_metrics.get("neighborhood"),
                 wikipedia_metrics=bronze_metrics.get("wikipedia"),
+                embedding_cache_hits=cache_stats.hits if cache_stats else 0,
+                embedding_cache_misses=cache_stats.misses if cache_stats else 0,
+                task_metrics=self.task_metrics,
+                incremental=self.incremental,
+                changed_records=sum(c.total_changes for c in self.change_sets.values()),
                 status="completed"
             )
             
             logger.info(f"Pipeline completed successfully in {metrics.duration}")
+            logger.info(f"Critical path of layer tasks: {metrics.critical_path_seconds:.2f}s")
             
             return metrics
             
@@ -594,6 +736,7 @@ class PipelineOrchestrator:
                 pipeline_id=self.pipeline_id,
                 start_time=pipeline_start,
                 end_time=datetime.now(),
+                task_metrics=self.task_metrics,
                 status="failed",
                 error_messages=[str(e)]
             )
@@ -620,6 +763,34 @@ class PipelineOrchestrator:
         
         return stats
     
+    def prune_embedding_cache(self) -> int:
+        """Apply LRU/age eviction to the persistent embedding cache.
+        
+        Returns:
+            Number of cache entries removed
+        """
+        if self.embedding_cache is None:
+            return 0
+        return self.embedding_cache.prune()
+    
+    def write_profile(self) -> Optional[RunProfile]:
+        """Write the profiling report of this run (JSON and Parquet).
+        
+        Returns:
+            The run profile, or None when profiling is off
+        """
+        if self.profiler is None:
+            return None
+        
+        report = self.profiler.report()
+        json_path, parquet_path = report.write(Path(self.settings.output.profile_dir))
+        logger.info(f"Profile written to {json_path} and {parquet_path}")
+        return report
+    
     def cleanup(self):
         """Clean up resources."""
+        if self.profiler is not None:
+            set_profiler(None)
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
         self.connection_manager.close()
\ No newline at end of file
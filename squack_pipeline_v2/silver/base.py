@@ -24,8 +24,10 @@ KEY COMPONENTS:
    - Batch sizes vary by provider (Voyage: 10, OpenAI: 100, Ollama: 1)
    - All texts for an entity type are processed together for efficiency
 
-4. **Vector Storage**: Generated embeddings are stored as DOUBLE[] arrays in DuckDB
+4. **Vector Storage**: Generated embeddings are stored as fixed FLOAT[dim] arrays in DuckDB
    - Embedding dimension varies by model (Voyage-3: 1024, OpenAI: 1536, Ollama: 768)
+   - Vectors are handed to DuckDB as an Arrow table backed by a contiguous float32
+     NumPy buffer - no SQL text is built per row
    - Timestamp tracking for when embeddings were generated
 
 TOKENIZATION DETAILS:
@@ -46,22 +48,38 @@ EMBEDDING GENERATION FLOW:
    - Neighborhoods: description | name | population
    - Wikipedia: title | long_summary (NEW: replaced extract for 3-4x more content)
 3. Extract listing_ids/entity_ids and embedding_texts from DuckDB
-4. Send texts to embedding provider API in batches
+4. Look texts up in the persistent embedding cache (keyed by provider, model,
+   dimension and sha256 of the text); send only misses to the provider API
 5. Receive embedding vectors from provider
-6. Create temporary table with embeddings in DuckDB
+6. Register ids and vectors as an Arrow-backed DuckDB view (zero-copy)
 7. Join embeddings back to main data using entity IDs
 8. Store final result with embedded vectors
+
+INCREMENTAL MODE:
+----------------
+With a ChangeSet (see core/change_data.py) only inserted/updated Bronze rows
+are copied to <bronze>_delta and run through the same transformation into
+<silver>_delta. Changed and deleted ids are then removed from the Silver
+table and the delta rows appended, so only changed texts reach the
+embedding provider.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextlib import contextmanager, nullcontext
+from typing import Any, Iterator, List, Optional, Sequence
 from pydantic import BaseModel, Field, ConfigDict
 import duckdb
+import numpy as np
+import pyarrow as pa
 from datetime import datetime
 
+from squack_pipeline_v2.core.change_data import ChangeSet
 from squack_pipeline_v2.core.connection import DuckDBConnectionManager
 from squack_pipeline_v2.core.logging import PipelineLogger, log_execution_time
+from squack_pipeline_v2.core.profiling import get_profiler
 from squack_pipeline_v2.core.settings import PipelineSettings
+from squack_pipeline_v2.embeddings.base import EmbeddingResponse
+from squack_pipeline_v2.embeddings.cache import EmbeddingCache
 from squack_pipeline_v2.embeddings.providers import EmbeddingProvider
 
 
@@ -81,26 +99,40 @@ class SilverMetadata(BaseModel):
 class SilverTransformer(ABC):
     """Base class for Silver layer data transformation."""
     
-    def __init__(self, settings: PipelineSettings, connection_manager: DuckDBConnectionManager, embedding_provider: Optional[EmbeddingProvider] = None):
+    def __init__(
+        self,
+        settings: PipelineSettings,
+        connection_manager: DuckDBConnectionManager,
+        embedding_provider: Optional[EmbeddingProvider] = None,
+        embedding_cache: Optional[EmbeddingCache] = None
+    ):
         """Initialize the Silver transformer.
         
         Args:
             settings: Pipeline configuration settings
             connection_manager: DuckDB connection manager
             embedding_provider: Optional embedding provider for generating vectors
+            embedding_cache: Optional persistent cache consulted before the provider
         """
         self.settings = settings
         self.connection_manager = connection_manager
         self.embedding_provider = embedding_provider
+        self.embedding_cache = embedding_cache
         self.logger = PipelineLogger.get_logger(self.__class__.__name__)
     
     @log_execution_time
-    def transform(self, input_table: str, output_table: str) -> SilverMetadata:
+    def transform(
+        self,
+        input_table: str,
+        output_table: str,
+        changes: Optional[ChangeSet] = None
+    ) -> SilverMetadata:
         """Transform Bronze data to Silver standard.
         
         Args:
             input_table: Name of Bronze input table
             output_table: Name for Silver output table
+            changes: Optional change set; only changed ids are reprocessed
             
         Returns:
             Metadata about the transformation
@@ -115,11 +147,14 @@ class SilverTransformer(ABC):
         
         input_count = self.connection_manager.count_records(input_table)
         
-        # Drop output table if exists
-        self.connection_manager.drop_table(output_table)
-        
-        # Apply transformations with embeddings in single operation
-        self._apply_transformations(input_table, output_table)
+        if changes is not None and self.connection_manager.table_exists(output_table):
+            self._apply_changes(input_table, output_table, changes)
+        else:
+            # Drop output table if exists
+            self.connection_manager.drop_table(output_table)
+            
+            # Apply transformations with embeddings in single operation
+            self._apply_transformations(input_table, output_table)
         
         # Get output count
         output_count = self.connection_manager.count_records(output_table)
@@ -143,6 +178,44 @@ class SilverTransformer(ABC):
         
         return metadata
     
+    def _apply_changes(self, input_table: str, output_table: str, changes: ChangeSet) -> None:
+        """Merge only changed Bronze rows into an existing Silver table.
+        
+        Args:
+            input_table: Name of Bronze input table
+            output_table: Name of existing Silver output table
+            changes: Change set for this entity
+        """
+        delta_input = self._validate_table_name(f"{input_table}_delta")
+        delta_output = self._validate_table_name(f"{output_table}_delta")
+        safe_source_key = DuckDBConnectionManager.safe_identifier(changes.source_key)
+        safe_target_key = DuckDBConnectionManager.safe_identifier(changes.target_key)
+        
+        self.connection_manager.create_table_as(
+            delta_input,
+            f"SELECT * FROM {input_table} WHERE {changes.id_filter(safe_source_key)}"
+        )
+        self.connection_manager.drop_table(delta_output)
+        
+        try:
+            # Same transformation (and embedding) as a full run, on the delta only
+            self._apply_transformations(delta_input, delta_output)
+            
+            with self.connection_manager.transaction() as conn:
+                conn.execute(
+                    f"DELETE FROM {output_table} "
+                    f"WHERE {changes.id_filter(safe_target_key, include_deletes=True)}"
+                )
+                conn.execute(f"INSERT INTO {output_table} BY NAME SELECT * FROM {delta_output}")
+        finally:
+            self.connection_manager.drop_table(delta_input)
+            self.connection_manager.drop_table(delta_output)
+        
+        self.logger.info(
+            f"Incremental merge into {output_table}: {changes.inserted} inserted, "
+            f"{changes.updated} updated, {changes.deleted} deleted"
+        )
+    
     def _validate_table_name(self, name: str) -> str:
         """Validate table name at boundary (DuckDB best practice).
         
@@ -179,6 +252,63 @@ class SilverTransformer(ABC):
         """
         pass
     
+    def generate_embeddings(self, texts: List[str]) -> EmbeddingResponse:
+        """Generate embeddings, serving unchanged texts from the embedding cache.
+        
+        Args:
+            texts: Embedding texts
+            
+        Returns:
+            EmbeddingResponse with one vector per text, in input order
+        """
+        profiler = get_profiler()
+        timer = profiler.time_embedding(len(texts)) if profiler is not None else nullcontext()
+        with timer:
+            if self.embedding_cache is None:
+                return self.embedding_provider.generate_embeddings(texts)
+            return self.embedding_cache.generate_embeddings(self.embedding_provider, texts)
+    
+    @contextmanager
+    def embedding_view(
+        self,
+        view_name: str,
+        id_column: str,
+        ids: Sequence[Any],
+        embeddings: List[List[float]]
+    ) -> Iterator[str]:
+        """Expose entity ids and vectors to DuckDB as a columnar view.
+        
+        The vectors are packed into one contiguous float32 NumPy buffer and
+        registered as an Arrow table with a FixedSizeList column, which DuckDB
+        scans in place as a FLOAT[dim] array. No SQL text is built per row.
+        The view is unregistered when the context exits.
+        
+        Args:
+            view_name: Name to register the view under
+            id_column: Name of the entity id column (e.g. listing_id)
+            ids: Entity ids, aligned with embeddings
+            embeddings: Embedding vectors, one per id
+            
+        Yields:
+            The registered view name
+        """
+        dimension = len(embeddings[0]) if embeddings else self.embedding_provider.dimension
+        vectors = np.asarray(embeddings, dtype=np.float32).reshape(len(ids), dimension)
+        
+        # Flat float32 values -> FixedSizeList (zero-copy over the NumPy buffer)
+        vector_column = pa.FixedSizeListArray.from_arrays(pa.array(vectors.reshape(-1)), dimension)
+        embedding_table = pa.table({
+            id_column: pa.array(list(ids)),
+            "embedding_vector": vector_column,
+        })
+        
+        conn = self.connection_manager.get_connection()
+        conn.register(view_name, embedding_table)
+        try:
+            yield view_name
+        finally:
+            conn.unregister(view_name)
+    
     def standardize_nulls(self, table_name: str, columns: list[str]) -> None:
         """Standardize null values in specified columns.
         
@@ -227,7 +357,7 @@ class SilverTransformer(ABC):
         
         # Use Relation API to execute and create table
         result = conn.sql(dedup_sql)
-        result.create(output_table)
+        self.connection_manager.create_table_from_relation(result, output_table)
     
     def validate(self, table_name: str) -> bool:
         """Validate the transformed data.
@@ -146,6 +146,6 @@ class LocationSilverTransformer(SilverTransformer):
         """)
         
         # Create the table in a single operation
-        transformed.create(output_table)
+        self.connection_manager.create_table_from_relation(transformed, output_table)
         
         self.logger.info(f"Location silver transformation complete: {output_table}")
\ No newline at end of file
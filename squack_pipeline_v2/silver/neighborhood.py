@@ -49,11 +49,11 @@ This transformer also performs a LEFT JOIN with silver_locations table to:
 
 EMBEDDING GENERATION PROCESS:
 -----------------------------
-1. SQL projection creates embedding_text using CONCAT_WS with pipe delimiter (lines 97-101)
-2. Neighborhood IDs and texts extracted from DuckDB (lines 105-110)
-3. Texts sent to embedding provider in batches (line 112)
-4. Vectors stored as DOUBLE[] arrays with generation timestamp (lines 114-132)
-5. Embeddings joined back via neighborhood_id (lines 135-160)
+1. SQL projection creates embedding_text using CONCAT_WS with pipe delimiter
+2. Neighborhood IDs and texts extracted from DuckDB
+3. Texts sent to embedding provider in batches
+4. Vectors registered as an Arrow-backed FLOAT[dim] view
+5. Embeddings joined back via neighborhood_id
 
 TOKENIZATION NOTES:
 ------------------
@@ -181,58 +181,55 @@ class NeighborhoodSilverTransformer(SilverTransformer):
         texts = [row[1] for row in embedding_rows]  # Pipe-delimited text for each neighborhood
         
         # STEP 3: Generate embeddings via external provider API
-        # Generate embeddings using List[str] interface
+        # Unchanged texts are served from the embedding cache; only misses hit the API
         # Provider performs: tokenization → encoding → dense vector generation
         # No LlamaIndex involvement - direct API embedding generation
-        embedding_response = self.embedding_provider.generate_embeddings(texts)
+        embedding_response = self.generate_embeddings(texts)
         
-        # Create temporary table with embeddings
         current_timestamp = datetime.now()
         
-        # Build VALUES clause for embedding data
-        values_clause = []
-        for nid, text, embedding in zip(neighborhood_ids, texts, embedding_response.embeddings):
-            # Escape single quotes in text
-            escaped_text = text.replace("'", "''") if text else ''
-            # Format embedding vector as array literal
-            embedding_str = '[' + ','.join(str(v) for v in embedding) + ']'
-            values_clause.append(f"('{nid}', '{escaped_text}', {embedding_str}::DOUBLE[], TIMESTAMP '{current_timestamp}')")
-        
-        # Create final table with embeddings using CTEs - no temporary tables
-        conn.execute(f"""
-            CREATE TABLE {output_table} AS
-            WITH transformed_data AS (
-                {transformed.sql_query()}
-            ),
-            embedding_data AS (
-                SELECT * FROM (
-                    VALUES {','.join(values_clause)}
-                ) AS t(neighborhood_id, embedding_text, embedding_vector, embedding_generated_at)
-            )
-            SELECT 
-                t.neighborhood_id,
-                t.name,
-                t.city,
-                t.state,
-                t.county,
-                t.city_id,
-                t.county_id,
-                t.state_id,
-                t.location,
-                t.population,
-                t.walkability_score,
-                t.school_rating,
-                t.demographics,
-                t.description,
-                t.amenities,
-                t.lifestyle_tags,
-                t.wikipedia_page_id,
-                t.wikipedia_correlations,
-                e.embedding_text,
-                e.embedding_vector,
-                e.embedding_generated_at
-            FROM transformed_data t
-            LEFT JOIN embedding_data e ON t.neighborhood_id = e.neighborhood_id
-        """)
+        # STEP 4: Expose ids and vectors to DuckDB as a columnar FLOAT[dim] view
+        # No per-row SQL text - DuckDB scans the Arrow buffer directly
+        with self.embedding_view(
+            "neighborhood_embeddings", "neighborhood_id", neighborhood_ids, embedding_response.embeddings
+        ) as embedding_view:
+            # Create final table with embeddings using CTEs - no temporary tables
+            self.connection_manager.execute(f"""
+                CREATE TABLE {output_table} AS
+                WITH transformed_data AS (
+                    {transformed.sql_query()}
+                ),
+                embedding_data AS (
+                    SELECT
+                        neighborhood_id,
+                        embedding_vector,
+                        TIMESTAMP '{current_timestamp}' as embedding_generated_at
+                    FROM {embedding_view}
+                )
+                SELECT 
+                    t.neighborhood_id,
+                    t.name,
+                    t.city,
+                    t.state,
+                    t.county,
+                    t.city_id,
+                    t.county_id,
+                    t.state_id,
+                    t.location,
+                    t.population,
+                    t.walkability_score,
+                    t.school_rating,
+                    t.demographics,
+                    t.description,
+                    t.amenities,
+                    t.lifestyle_tags,
+                    t.wikipedia_page_id,
+                    t.wikipedia_correlations,
+                    t.embedding_text,
+                    e.embedding_vector,
+                    e.embedding_generated_at
+                FROM transformed_data t
+                LEFT JOIN embedding_data e ON t.neighborhood_id = e.neighborhood_id
+            """)
         
         self.logger.info(f"Transformed neighborhoods from {input_table} to {output_table}")
\ No newline at end of file
@@ -51,11 +51,11 @@ FIELDS INTENTIONALLY EXCLUDED FROM EMBEDDINGS:
 
 EMBEDDING GENERATION PROCESS:
 -----------------------------
-1. SQL projection creates embedding_text using CONCAT_WS (lines 80-86)
-2. Text extracted from DuckDB along with listing_ids (lines 90-95)
-3. Texts sent to embedding provider API (line 97)
-4. Resulting vectors stored as DOUBLE[] arrays with timestamps (lines 99-117)
-5. Embeddings joined back to property data via listing_id (lines 120-153)
+1. SQL projection creates embedding_text using CONCAT_WS
+2. Text extracted from DuckDB along with listing_ids
+3. Texts sent to embedding provider API
+4. Resulting vectors registered as an Arrow-backed FLOAT[dim] view
+5. Embeddings joined back to property data via listing_id
 
 TOKENIZATION NOTE:
 -----------------
@@ -167,65 +167,62 @@ class PropertySilverTransformer(SilverTransformer):
         texts = [row[1] for row in embedding_rows]  # Concatenated text for each property
         
         # STEP 3: Generate embeddings via external provider
-        # Generate embeddings using List[str] interface
+        # Unchanged texts are served from the embedding cache; only misses hit the API
         # Provider handles: tokenization → encoding → vector generation
         # No LlamaIndex or pre-chunking - direct API call with full texts
-        embedding_response = self.embedding_provider.generate_embeddings(texts)
+        embedding_response = self.generate_embeddings(texts)
         
-        # Create temporary table with embeddings
         current_timestamp = datetime.now()
         
-        # Build VALUES clause for embedding data
-        values_clause = []
-        for lid, text, embedding in zip(listing_ids, texts, embedding_response.embeddings):
-            # Escape single quotes in text
-            escaped_text = text.replace("'", "''") if text else ''
-            # Format embedding vector as array literal
-            embedding_str = '[' + ','.join(str(v) for v in embedding) + ']'
-            values_clause.append(f"('{lid}', '{escaped_text}', {embedding_str}::DOUBLE[], TIMESTAMP '{current_timestamp}')")
-        
-        # Create final table with embeddings using CTEs - no temporary tables
-        conn.execute(f"""
-            CREATE TABLE {output_table} AS
-            WITH transformed_data AS (
-                {transformed.sql_query()}
-            ),
-            embedding_data AS (
-                SELECT * FROM (
-                    VALUES {','.join(values_clause)}
-                ) AS t(listing_id, embedding_text, embedding_vector, embedding_generated_at)
-            )
-            SELECT 
-                t.listing_id,
-                t.neighborhood_id,
-                t.bedrooms,
-                t.bathrooms,
-                t.square_feet,
-                t.property_type,
-                t.year_built,
-                t.lot_size,
-                t.garage_spaces,
-                t.price,
-                t.price_per_sqft,
-                t.address,
-                t.description,
-                t.features,
-                t.listing_date,
-                t.days_on_market,
-                t.virtual_tour_url,
-                t.images,
-                t.price_history,
-                t.market_trends,
-                t.buyer_persona,
-                t.viewing_statistics,
-                t.buyer_demographics,
-                t.nearby_amenities,
-                t.future_enhancements,
-                e.embedding_text,
-                e.embedding_vector,
-                e.embedding_generated_at
-            FROM transformed_data t
-            LEFT JOIN embedding_data e ON t.listing_id = e.listing_id
-        """)
+        # STEP 4: Expose ids and vectors to DuckDB as a columnar FLOAT[dim] view
+        # No per-row SQL text - DuckDB scans the Arrow buffer directly
+        with self.embedding_view(
+            "property_embeddings", "listing_id", listing_ids, embedding_response.embeddings
+        ) as embedding_view:
+            # Create final table with embeddings using CTEs - no temporary tables
+            self.connection_manager.execute(f"""
+                CREATE TABLE {output_table} AS
+                WITH transformed_data AS (
+                    {transformed.sql_query()}
+                ),
+                embedding_data AS (
+                    SELECT
+                        listing_id,
+                        embedding_vector,
+                        TIMESTAMP '{current_timestamp}' as embedding_generated_at
+                    FROM {embedding_view}
+                )
+                SELECT 
+                    t.listing_id,
+                    t.neighborhood_id,
+                    t.bedrooms,
+                    t.bathrooms,
+                    t.square_feet,
+                    t.property_type,
+                    t.year_built,
+                    t.lot_size,
+                    t.garage_spaces,
+                    t.price,
+                    t.price_per_sqft,
+                    t.address,
+                    t.description,
+                    t.features,
+                    t.listing_date,
+                    t.days_on_market,
+                    t.virtual_tour_url,
+                    t.images,
+                    t.price_history,
+                    t.market_trends,
+                    t.buyer_persona,
+                    t.viewing_statistics,
+                    t.buyer_demographics,
+                    t.nearby_amenities,
+                    t.future_enhancements,
+                    t.embedding_text,
+                    e.embedding_vector,
+                    e.embedding_generated_at
+                FROM transformed_data t
+                LEFT JOIN embedding_data e ON t.listing_id = e.listing_id
+            """)
         
         self.logger.info(f"Transformed properties from {input_table} to {output_table}")
\ No newline at end of file
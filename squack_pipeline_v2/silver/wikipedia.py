@@ -34,7 +34,7 @@ class WikipediaSilverTransformer(SilverTransformer):
         """Apply Wikipedia transformations using DuckDB best practices.
         
         Complete cutover implementation:
-        - No temporary tables - use CTEs and VALUES
+        - No temporary tables - use CTEs over a columnar embedding view
         - Always include neighborhood fields
         - Single CREATE TABLE operation
         - No compatibility checks
@@ -111,7 +111,7 @@ class WikipediaSilverTransformer(SilverTransformer):
                     short_summary VARCHAR,
                     long_summary VARCHAR,
                     embedding_text VARCHAR,
-                    embedding_vector DOUBLE[],
+                    embedding_vector FLOAT[{self.embedding_provider.dimension}],
                     embedding_generated_at TIMESTAMP,
                     neighborhood_ids VARCHAR[],
                     neighborhood_names VARCHAR[],
@@ -124,7 +124,8 @@ class WikipediaSilverTransformer(SilverTransformer):
         self.logger.info(f"Processing {total_count} Wikipedia articles for embeddings")
         
         # Generate embeddings in batches
-        embeddings = []
+        page_ids = []
+        vectors = []
         batch_size = 100
         current_timestamp = datetime.now().isoformat()
         
@@ -134,62 +135,21 @@ class WikipediaSilverTransformer(SilverTransformer):
             
             self.logger.info(f"Generating embeddings for batch {i//batch_size + 1} ({batch_end}/{total_count} articles)")
             
-            texts_to_embed = []
-            indices_to_embed = []
-            
-            for idx, row in batch.iterrows():
-                # ALWAYS generate embeddings for Wikipedia articles
-                # The embedding_text is title + long_summary which should always exist
-                text = row.get('embedding_text', '')
-                texts_to_embed.append(str(text))
-                indices_to_embed.append(idx)
+            # ALWAYS generate embeddings for Wikipedia articles
+            # The embedding_text is title + long_summary which should always exist
+            texts_to_embed = [str(text) for text in batch['embedding_text']]
             
             # Always generate embeddings - no conditional needed
             # Wikipedia articles MUST have embeddings for search to work
             try:
-                response = self.embedding_provider.generate_embeddings(texts_to_embed)
-                for j, idx in enumerate(indices_to_embed):
-                    page_id = wiki_data.loc[idx, 'page_id']
-                    vector = response.embeddings[j]
-                    embeddings.append({
-                        'page_id': page_id,
-                        'vector': vector,
-                        'timestamp': current_timestamp
-                    })
+                response = self.generate_embeddings(texts_to_embed)
+                page_ids.extend(batch['page_id'].tolist())
+                vectors.extend(response.embeddings)
             except Exception as e:
                 self.logger.error(f"Critical error generating embeddings for batch: {e}")
                 raise RuntimeError(f"Failed to generate embeddings for Wikipedia articles: {e}")
         
-        self.logger.info(f"Generated {len(embeddings)} embeddings")
-        
-        # Build embedding VALUES clause
-        embedding_rows = []
-        for emb in embeddings:
-            vector_str = 'ARRAY[' + ','.join(str(v) for v in emb['vector']) + ']::DOUBLE[]'
-            embedding_rows.append(f"({emb['page_id']}, {vector_str}, TIMESTAMP '{emb['timestamp']}')")
-        
-        if embedding_rows:
-            embedding_values = ',\n                '.join(embedding_rows)
-            embeddings_cte = f"""
-                embeddings AS (
-                    SELECT 
-                        page_id,
-                        embedding_vector,
-                        embedding_generated_at
-                    FROM (VALUES 
-                        {embedding_values}
-                    ) AS e(page_id, embedding_vector, embedding_generated_at)
-                )"""
-        else:
-            # No embeddings - create empty CTE
-            embeddings_cte = """
-                embeddings AS (
-                    SELECT 
-                        NULL::INTEGER as page_id,
-                        NULL::DOUBLE[] as embedding_vector,
-                        NULL::TIMESTAMP as embedding_generated_at
-                    WHERE FALSE
-                )"""
+        self.logger.info(f"Generated {len(vectors)} embeddings")
         
         # Check if silver_neighborhoods table exists
         table_exists = conn.execute("""
@@ -222,47 +182,57 @@ class WikipediaSilverTransformer(SilverTransformer):
                     WHERE FALSE
                 )"""
         
-        # Create final table with all CTEs - no temporary tables
-        conn.execute(f"""
-            CREATE TABLE {output_table} AS
-            WITH transformed_data AS (
-                {transformation_sql}
-            ),
-            {embeddings_cte},
-            {neighborhoods_cte}
-            SELECT 
-                t.id,
-                t.page_id,
-                t.location_id,
-                t.title,
-                t.url,
-                t.categories,
-                t.latitude,
-                t.longitude,
-                t.city,
-                t.county,
-                t.state,
-                t.relevance_score,
-                t.depth,
-                t.crawled_at,
-                t.html_file,
-                t.file_hash,
-                t.image_url,
-                t.links_count,
-                t.infobox_data,
-                t.short_summary,
-                t.long_summary,
-                t.embedding_text,
-                e.embedding_vector,
-                e.embedding_generated_at,
-                COALESCE(n.neighborhood_ids, ARRAY[]::VARCHAR[]) as neighborhood_ids,
-                COALESCE(n.neighborhood_names, ARRAY[]::VARCHAR[]) as neighborhood_names,
-                n.primary_neighborhood_name
-            FROM transformed_data t
-            LEFT JOIN embeddings e ON t.page_id = e.page_id
-            LEFT JOIN neighborhoods n ON t.page_id = n.page_id
-            ORDER BY t.page_id
-        """)
+        # Columnar FLOAT[dim] view over the vectors - no VALUES literal per article
+        with self.embedding_view(
+            "wikipedia_embeddings", "page_id", page_ids, vectors
+        ) as embedding_view:
+            # Create final table with all CTEs - no temporary tables
+            self.connection_manager.execute(f"""
+                CREATE TABLE {output_table} AS
+                WITH transformed_data AS (
+                    {transformation_sql}
+                ),
+                embeddings AS (
+                    SELECT
+                        page_id,
+                        embedding_vector,
+                        TIMESTAMP '{current_timestamp}' as embedding_generated_at
+                    FROM {embedding_view}
+                ),
+                {neighborhoods_cte}
+                SELECT 
+                    t.id,
+                    t.page_id,
+                    t.location_id,
+                    t.title,
+                    t.url,
+                    t.categories,
+                    t.latitude,
+                    t.longitude,
+                    t.city,
+                    t.county,
+                    t.state,
+                    t.relevance_score,
+                    t.depth,
+                    t.crawled_at,
+                    t.html_file,
+                    t.file_hash,
+                    t.image_url,
+                    t.links_count,
+                    t.infobox_data,
+                    t.short_summary,
+                    t.long_summary,
+                    t.embedding_text,
+                    e.embedding_vector,
+                    e.embedding_generated_at,
+                    COALESCE(n.neighborhood_ids, ARRAY[]::VARCHAR[]) as neighborhood_ids,
+                    COALESCE(n.neighborhood_names, ARRAY[]::VARCHAR[]) as neighborhood_names,
+                    n.primary_neighborhood_name
+                FROM transformed_data t
+                LEFT JOIN embeddings e ON t.page_id = e.page_id
+                LEFT JOIN neighborhoods n ON t.page_id = n.page_id
+                ORDER BY t.page_id
+            """)
         
         # Log statistics
         output_count = conn.execute(f"SELECT COUNT(*) FROM {output_table}").fetchone()[0]
@@ -1,13 +1,26 @@
-"""Base Elasticsearch writer with common indexing logic."""
+"""Base Elasticsearch writer with common indexing logic.
+
+Each writer declares its document as a struct_pack() field list over the
+Gold columns. DuckDB builds and serializes every document with to_json(),
+and the bulk actions are read straight from the _id and _source columns of
+the Arrow record batches as raw JSON bytes - no per-row dicts or models.
+The Pydantic document models only validate the JSON of the first rows (or
+every row with validate_documents). Bulk requests are sized by document
+count and bytes and sent concurrently (parallel_bulk), with refresh and
+replicas disabled on the index for the duration of a full load.
+"""
 
 import os
 import logging
-from typing import Dict, Any, List, Callable
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, Iterator, Optional, Type
 from datetime import datetime
-from pydantic import BaseModel
+import pyarrow as pa
+from pydantic import BaseModel, ValidationError
 from elasticsearch import Elasticsearch
-from elasticsearch.helpers import bulk
+from elasticsearch.helpers import bulk, parallel_bulk, streaming_bulk
 
+from squack_pipeline_v2.core.change_data import ChangeSet
 from squack_pipeline_v2.core.connection import DuckDBConnectionManager
 from squack_pipeline_v2.core.logging import log_stage
 from squack_pipeline_v2.core.settings import PipelineSettings
@@ -15,6 +28,45 @@ from squack_pipeline_v2.core.settings import PipelineSettings
 logger = logging.getLogger(__name__)
 
 
+def iso_timestamp_sql(column: str, default: Optional[str] = "current_timestamp") -> str:
+    """SQL rendering a timestamp column as ISO 8601 text for Elasticsearch.
+    
+    Args:
+        column: Timestamp column or expression
+        default: Expression used when the column is NULL (None keeps NULL)
+        
+    Returns:
+        SQL expression
+    """
+    value = f"COALESCE({column}, {default})" if default else column
+    return f"strftime(CAST({value} AS TIMESTAMP), '%Y-%m-%dT%H:%M:%S.%f')"
+
+
+def document_query(source_query: str, document_fields: str, id_field: str) -> str:
+    """Query returning one (_id, _source JSON) row per source row.
+    
+    The embedding model name is the query's only parameter.
+    
+    Args:
+        source_query: Query over the Gold table
+        document_fields: struct_pack() field list of the document
+        id_field: Source column used as document ID
+        
+    Returns:
+        SQL query
+    """
+    return f"""
+        SELECT
+            CAST({id_field} AS VARCHAR) AS _id,
+            to_json(struct_pack(
+                {document_fields},
+                embedding_model := CAST(? AS VARCHAR),
+                indexed_at := {iso_timestamp_sql("current_timestamp", default=None)}
+            )) AS _source
+        FROM ({source_query}) AS source
+    """
+
+
 class ElasticsearchWriterBase:
     """Base Elasticsearch writer with common functionality."""
     
@@ -64,98 +116,167 @@ class ElasticsearchWriterBase:
         
         return es
     
+    @contextmanager
+    def _bulk_load_settings(self, index_name: str):
+        """Disable refresh and replicas on an existing index while loading.
+        
+        The original settings are restored and the index refreshed afterwards,
+        even if the load fails. Failing to change settings never fails the load.
+        
+        Args:
+            index_name: Target Elasticsearch index
+        """
+        original = None
+        try:
+            if self.es_client.indices.exists(index=index_name):
+                current = self.es_client.indices.get_settings(index=index_name)
+                index_settings = current[index_name]["settings"]["index"]
+                original = {
+                    "refresh_interval": index_settings.get("refresh_interval"),
+                    "number_of_replicas": index_settings.get("number_of_replicas")
+                }
+                self.es_client.indices.put_settings(
+                    index=index_name,
+                    settings={"index": {"refresh_interval": "-1", "number_of_replicas": 0}}
+                )
+                logger.info(f"Disabled refresh and replicas on {index_name} for bulk load")
+        except Exception as e:
+            logger.warning(f"Could not apply bulk load settings to {index_name}: {e}")
+            original = None
+        
+        try:
+            yield
+        finally:
+            if original is not None:
+                try:
+                    # None resets refresh_interval to the cluster default
+                    self.es_client.indices.put_settings(index=index_name, settings={"index": original})
+                    self.es_client.indices.refresh(index=index_name)
+                    logger.info(f"Restored refresh and replicas on {index_name}")
+                except Exception as e:
+                    logger.error(f"Could not restore settings of {index_name}: {e}")
+    
+    def _generate_actions(
+        self,
+        reader: Any,
+        index_name: str,
+        document_model: Type[BaseModel],
+        counters: Dict[str, int]
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream bulk index actions from (_id, _source) record batches.
+        
+        Every document's JSON is validated against its Pydantic model unless
+        validate_documents is off, in which case only the first
+        schema_check_rows rows are; any validation error in that window keeps
+        validation on for the rest of the load.
+        
+        Args:
+            reader: Arrow RecordBatchReader over a document_query()
+            index_name: Target Elasticsearch index
+            document_model: Pydantic model the documents must satisfy
+            counters: Updated in place with validation_errors and bytes
+            
+        Yields:
+            Bulk actions whose _source is already JSON bytes
+        """
+        validate_all = self.config.validate_documents
+        checked_rows = 0
+        schema_trusted = False
+        
+        for batch in reader:
+            ids = batch.column("_id").to_pylist()
+            sources = batch.column("_source").cast(pa.binary()).to_pylist()
+            for doc_id, source in zip(ids, sources):
+                if validate_all or not schema_trusted:
+                    try:
+                        document_model.model_validate_json(source)
+                    except ValidationError as e:
+                        logger.error(f"Validation error for document {doc_id}: {e}")
+                        counters["validation_errors"] += 1
+                        validate_all = True
+                        continue
+                    
+                    if not schema_trusted:
+                        checked_rows += 1
+                        schema_trusted = checked_rows >= self.config.schema_check_rows
+                
+                counters["bytes"] += len(source)
+                yield {"_index": index_name, "_id": doc_id, "_source": source}
+    
     @log_stage("Elasticsearch: Index documents")
     def _index_documents(
         self,
         query: str,
         index_name: str,
-        transform: Callable[[Dict[str, Any]], BaseModel],
+        document_fields: str,
+        document_model: Type[BaseModel],
         id_field: str,
-        batch_size: int = 100
+        batch_size: int = 100,
+        changes: Optional[ChangeSet] = None
     ) -> Dict[str, Any]:
-        """Generic document indexing with transformation.
+        """Generic document indexing, with documents built in DuckDB.
+        
+        Bulk requests are cut at batch_size documents or bulk_max_bytes,
+        whichever comes first, and sent by thread_count concurrent workers.
         
         Args:
             query: DuckDB query to fetch data
             index_name: Target Elasticsearch index
-            transform: Function to transform row dict to Pydantic model
+            document_fields: struct_pack() field list building the document
+            document_model: Pydantic model used to validate documents
             id_field: Field to use as document ID
-            batch_size: Number of documents per batch
+            batch_size: Maximum number of documents per bulk request
+            changes: Optional change set; only changed documents are upserted
+                and deleted ids are removed from the index
             
         Returns:
             Indexing statistics
         """
-        # Execute query once and stream results
-        results = self.connection_manager.execute(query)
-        
-        # Get column names for dict conversion
-        columns = [desc[0] for desc in results.description]
+        deleted = 0
+        if changes is not None:
+            safe_key = DuckDBConnectionManager.safe_identifier(changes.target_key)
+            query = f"SELECT * FROM ({query}) AS source WHERE {changes.id_filter(safe_key)}"
+            deleted = self._delete_documents(index_name, changes)
         
         logger.info(f"Starting indexing to {index_name}")
         
         indexed = 0
         errors = 0
-        validation_errors = 0
+        counters = {"validation_errors": 0, "bytes": 0}
         start_time = datetime.now()
         
-        while True:
-            # Fetch batch using DuckDB's efficient fetchmany
-            rows = results.fetchmany(batch_size)
-            
-            if not rows:
-                break
-            
-            # Convert to dictionaries
-            batch_data = [dict(zip(columns, row)) for row in rows]
-            
-            # Transform and prepare for bulk indexing
-            actions = []
-            
-            for record in batch_data:
-                try:
-                    # Transform using Pydantic model
-                    document = transform(record)
-                    
-                    # Serialize to dict
-                    doc = document.model_dump(exclude_none=True)
-                    
-                    # Create bulk action
-                    action = {
-                        "_index": index_name,
-                        "_id": doc[id_field],
-                        "_source": doc
-                    }
-                    actions.append(action)
-                    
-                except Exception as e:
-                    logger.error(f"Validation error for {id_field}={record.get(id_field, 'unknown')}: {e}")
-                    validation_errors += 1
-            
-            # Bulk index
-            if actions:
-                try:
-                    result = bulk(
-                        self.es_client,
-                        actions,
-                        raise_on_error=False,
-                        raise_on_exception=False,
-                        stats_only=False
-                    )
-                    success_count = result[0]
-                    failures = result[1]
-                    
-                    indexed += success_count
-                    if failures:
-                        errors += len(failures)
-                        for failure in failures[:3]:  # Log first 3 failures
-                            logger.error(f"Indexing failure: {failure}")
-                        
-                except Exception as e:
-                    logger.error(f"Bulk indexing error: {e}")
-                    errors += len(actions)
+        # Execute query once and stream Arrow record batches of serialized documents
+        reader = self.connection_manager.execute(
+            document_query(query, document_fields, id_field), (self.embedding_model,)
+        ).fetch_record_batch(batch_size)
+        actions = self._generate_actions(reader, index_name, document_model, counters)
+        bulk_options = {
+            "chunk_size": batch_size,
+            "max_chunk_bytes": self.config.bulk_max_bytes,
+            "raise_on_error": False,
+            "raise_on_exception": False
+        }
+        
+        # Full loads run without refresh/replicas; incremental updates are small
+        optimize = self.config.optimize_bulk_load and changes is None
+        with self._bulk_load_settings(index_name) if optimize else nullcontext():
+            if self.config.thread_count > 1:
+                results = parallel_bulk(
+                    self.es_client, actions, thread_count=self.config.thread_count, **bulk_options
+                )
+            else:
+                results = streaming_bulk(self.es_client, actions, **bulk_options)
             
-            if indexed > 0 and indexed % 1000 == 0:
-                logger.info(f"Indexed {indexed} documents to {index_name}")
+            for ok, info in results:
+                if ok:
+                    indexed += 1
+                else:
+                    errors += 1
+                    if errors <= 3:  # Log first 3 failures
+                        logger.error(f"Indexing failure: {info}")
+                
+                if indexed > 0 and indexed % 1000 == 0:
+                    logger.info(f"Indexed {indexed} documents to {index_name}")
         
         duration = (datetime.now() - start_time).total_seconds()
         self.documents_indexed += indexed
@@ -164,11 +285,48 @@ class ElasticsearchWriterBase:
             "index": index_name,
             "indexed": indexed,
             "errors": errors,
-            "validation_errors": validation_errors,
+            "validation_errors": counters["validation_errors"],
+            "deleted": deleted,
+            "bytes": counters["bytes"],
             "duration_seconds": round(duration, 2),
-            "docs_per_second": round(indexed / duration) if duration > 0 else 0
+            "docs_per_second": round(indexed / duration) if duration > 0 else 0,
+            "bytes_per_second": round(counters["bytes"] / duration) if duration > 0 else 0
         }
         
-        logger.info(f"Completed indexing to {index_name}: {indexed} documents indexed")
+        logger.info(
+            f"Completed indexing to {index_name}: {indexed} documents indexed "
+            f"({stats['docs_per_second']:,} docs/s, {stats['bytes_per_second'] / 1_000_000:.1f} MB/s)"
+        )
+        
+        return stats
+    
+    def _delete_documents(self, index_name: str, changes: ChangeSet) -> int:
+        """Delete documents whose source records were deleted.
+        
+        Args:
+            index_name: Target Elasticsearch index
+            changes: Change set listing deleted ids
+            
+        Returns:
+            Number of documents deleted
+        """
+        rows = self.connection_manager.execute(
+            f"SELECT entity_id FROM {changes.changes_table} WHERE change_type = 'delete'"
+        ).fetchall()
+        if not rows:
+            return 0
         
-        return stats
\ No newline at end of file
+        actions = [
+            {"_op_type": "delete", "_index": index_name, "_id": row[0]}
+            for row in rows
+        ]
+        # Missing documents (404) are fine - they are already gone
+        success_count, _ = bulk(
+            self.es_client,
+            actions,
+            raise_on_error=False,
+            raise_on_exception=False,
+            stats_only=False
+        )
+        logger.info(f"Deleted {success_count} documents from {index_name}")
+        return success_count
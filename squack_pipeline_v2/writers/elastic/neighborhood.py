@@ -1,12 +1,13 @@
 """Neighborhood writer for Elasticsearch."""
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
-from squack_pipeline_v2.writers.elastic.base import ElasticsearchWriterBase
+from squack_pipeline_v2.writers.elastic.base import ElasticsearchWriterBase, iso_timestamp_sql
 from squack_pipeline_v2.writers.elastic.property import GeoPoint  # Reuse from property module
+from squack_pipeline_v2.core.change_data import ChangeSet
 from squack_pipeline_v2.core.connection import DuckDBConnectionManager
 from squack_pipeline_v2.core.logging import log_stage
 
@@ -53,68 +54,32 @@ class NeighborhoodDocument(BaseModel):
 
 
 # ============================================================================
-# TRANSFORMATION FUNCTION
+# DOCUMENT FIELDS
 # ============================================================================
 
-def transform_neighborhood(record: Dict[str, Any], embedding_model: str) -> NeighborhoodDocument:
-    """Transform DuckDB neighborhood record to Elasticsearch document.
-    
-    Args:
-        record: Raw dictionary from DuckDB query
-        embedding_model: Name of the embedding model used
-        
-    Returns:
-        NeighborhoodDocument ready for Elasticsearch
-    """
-    # Build GeoPoint from center coordinates
-    location = GeoPoint(
-        lat=record.get('center_latitude', 0.0) or 0.0,
-        lon=record.get('center_longitude', 0.0) or 0.0
-    )
-    
-    # Convert embedding to list for Elasticsearch
-    embedding_vector = record.get('embedding_vector', [])
-    embedding_list = list(embedding_vector) if embedding_vector else []
-    
-    # Get embedding timestamp
-    embedded_at = record.get('embedding_generated_at') or datetime.now()
-    
-    # Handle demographics JSON from DuckDB
-    import json
-    demographics_raw = record.get('demographics', {})
-    try:
-        demographics = json.loads(demographics_raw) if demographics_raw else {}
-    except (TypeError, json.JSONDecodeError):
-        demographics = demographics_raw or {}
-    
-    # Handle wikipedia_correlations JSON from DuckDB
-    correlations_raw = record.get('wikipedia_correlations')
-    try:
-        wikipedia_correlations = json.loads(correlations_raw) if correlations_raw else {}
-    except (TypeError, json.JSONDecodeError):
-        wikipedia_correlations = correlations_raw or {}
-    
-    # Create NeighborhoodDocument - let Pydantic handle validation
-    return NeighborhoodDocument(
-        neighborhood_id=record.get('neighborhood_id', ''),
-        name=record.get('name', ''),
-        city=record.get('city', ''),
-        state=record.get('state', ''),
-        population=record.get('population', 0) or 0,  # Handle None without int()
-        walkability_score=record.get('walkability_score', 0.0) or 0.0,
-        school_rating=record.get('school_rating', 0.0) or 0.0,
-        overall_livability_score=record.get('overall_livability_score', 0.0) or 0.0,
-        location=location,
-        description=record.get('description', ''),
-        amenities=record.get('amenities', []) or [],
-        lifestyle_tags=record.get('lifestyle_tags', []) or [],
-        demographics=demographics,
-        wikipedia_correlations=wikipedia_correlations,
-        embedding=embedding_list,
-        embedding_model=embedding_model,
-        embedding_dimension=len(embedding_list),
-        embedded_at=embedded_at
-    )
+# struct_pack() fields building a NeighborhoodDocument from a gold_neighborhoods row
+NEIGHBORHOOD_DOCUMENT_FIELDS = f"""
+    neighborhood_id := CAST(neighborhood_id AS VARCHAR),
+    name := COALESCE(CAST(name AS VARCHAR), ''),
+    city := COALESCE(CAST(city AS VARCHAR), ''),
+    state := COALESCE(CAST(state AS VARCHAR), ''),
+    population := COALESCE(CAST(population AS INTEGER), 0),
+    walkability_score := COALESCE(CAST(walkability_score AS DOUBLE), 0.0),
+    school_rating := COALESCE(CAST(school_rating AS DOUBLE), 0.0),
+    overall_livability_score := COALESCE(CAST(overall_livability_score AS DOUBLE), 0.0),
+    location := struct_pack(
+        lat := COALESCE(CAST(center_latitude AS DOUBLE), 0.0),
+        lon := COALESCE(CAST(center_longitude AS DOUBLE), 0.0)
+    ),
+    description := COALESCE(CAST(description AS VARCHAR), ''),
+    amenities := COALESCE(amenities, []),
+    lifestyle_tags := COALESCE(lifestyle_tags, []),
+    demographics := COALESCE(CAST(demographics AS JSON), '{{}}'::JSON),
+    wikipedia_correlations := COALESCE(CAST(wikipedia_correlations AS JSON), '{{}}'::JSON),
+    embedding := COALESCE(CAST(embedding_vector AS DOUBLE[]), []),
+    embedding_dimension := COALESCE(len(embedding_vector), 0),
+    embedded_at := {iso_timestamp_sql("embedding_generated_at")}
+"""
 
 
 # ============================================================================
@@ -129,7 +94,8 @@ class NeighborhoodWriter(ElasticsearchWriterBase):
         self,
         table_name: str = "gold_neighborhoods",
         index_name: str = "neighborhoods",
-        batch_size: int = 100
+        batch_size: int = 100,
+        changes: Optional[ChangeSet] = None
     ) -> Dict[str, Any]:
         """Index neighborhoods to Elasticsearch.
         
@@ -137,20 +103,19 @@ class NeighborhoodWriter(ElasticsearchWriterBase):
             table_name: DuckDB table containing neighborhoods
             index_name: Target Elasticsearch index
             batch_size: Number of documents per batch
+            changes: Optional change set for incremental indexing
             
         Returns:
             Indexing statistics
         """
         query = f"SELECT * FROM {DuckDBConnectionManager.safe_identifier(table_name)}"
         
-        # Create transform function with embedded model name
-        def transform(record: Dict[str, Any]) -> NeighborhoodDocument:
-            return transform_neighborhood(record, self.embedding_model)
-        
         return self._index_documents(
             query=query,
             index_name=index_name,
-            transform=transform,
+            document_fields=NEIGHBORHOOD_DOCUMENT_FIELDS,
+            document_model=NeighborhoodDocument,
             id_field="neighborhood_id",
-            batch_size=batch_size
+            batch_size=batch_size,
+            changes=changes
         )
\ No newline at end of file
@@ -1,11 +1,12 @@
 """Property writer for Elasticsearch."""
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
-from squack_pipeline_v2.writers.elastic.base import ElasticsearchWriterBase
+from squack_pipeline_v2.writers.elastic.base import ElasticsearchWriterBase, iso_timestamp_sql
+from squack_pipeline_v2.core.change_data import ChangeSet
 from squack_pipeline_v2.core.connection import DuckDBConnectionManager
 from squack_pipeline_v2.core.logging import log_stage
 
@@ -83,106 +84,48 @@ class PropertyDocument(BaseModel):
 
 
 # ============================================================================
-# TRANSFORMATION FUNCTION
+# DOCUMENT FIELDS
 # ============================================================================
 
-def transform_property(record: Dict[str, Any], embedding_model: str) -> PropertyDocument:
-    """Transform DuckDB property record to Elasticsearch document.
-    
-    Args:
-        record: Raw dictionary from DuckDB query
-        embedding_model: Name of the embedding model used
-        
-    Returns:
-        PropertyDocument ready for Elasticsearch
-    """
-    # Extract and transform address data
-    # DuckDB returns JSON as string, need to parse it
-    import json
-    address_raw = record.get('address', {})
-    try:
-        # Try to parse as JSON string first (from DuckDB)
-        address_data = json.loads(address_raw) if address_raw else {}
-    except (TypeError, json.JSONDecodeError):
-        # Already a dict (from direct Python call)
-        address_data = address_raw or {}
-    location_array = address_data.get('location', [0, 0])
-    
-    # Build GeoPoint from location array [lon, lat]
-    geo_point = GeoPoint(
-        lat=location_array[1] if len(location_array) > 1 else 0.0,
-        lon=location_array[0] if len(location_array) > 0 else 0.0
-    )
-    
-    # Build AddressInfo
-    address = AddressInfo(
-        street=address_data.get('street', ''),
-        city=address_data.get('city', ''),
-        state=address_data.get('state', ''),
-        zip_code=address_data.get('zip_code', ''),
-        location=geo_point
-    )
-    
-    # Build ParkingInfo
-    # DuckDB returns JSON as string, need to parse it
-    parking_raw = record.get('parking', {})
-    try:
-        # Try to parse as JSON string first (from DuckDB)
-        parking_data = json.loads(parking_raw) if parking_raw else {}
-    except (TypeError, json.JSONDecodeError):
-        # Already a dict (from direct Python call)
-        parking_data = parking_raw or {}
-    parking = ParkingInfo(
-        spaces=parking_data.get('spaces', 0),
-        type=parking_data.get('type', 'none')
-    )
-    
-    # Convert date to ISO string if present
-    listing_date_str = ""
-    listing_date_raw = record.get('listing_date')
-    if listing_date_raw:
-        # DuckDB returns date objects which have isoformat
-        try:
-            listing_date_str = listing_date_raw.isoformat()
-        except AttributeError:
-            listing_date_str = str(listing_date_raw)
-    
-    # Convert embedding to list for Elasticsearch
-    embedding_vector = record.get('embedding_vector', [])
-    embedding_list = list(embedding_vector) if embedding_vector else []
-    
-    # Get embedding timestamp
-    embedded_at = record.get('embedding_generated_at')
-    if not embedded_at:
-        embedded_at = datetime.now()
-    
-    # Create PropertyDocument - let Pydantic handle validation
-    return PropertyDocument(
-        listing_id=record.get('listing_id', ''),
-        neighborhood_id=record.get('neighborhood_id', ''),
-        price=record.get('price', 0.0) or 0.0,
-        bedrooms=record.get('bedrooms', 0) or 0,
-        bathrooms=record.get('bathrooms', 0.0) or 0.0,
-        square_feet=record.get('square_feet', 0) or 0,
-        property_type=record.get('property_type', ''),
-        year_built=record.get('year_built', 0) or 0,
-        lot_size=record.get('lot_size', 0) or 0,
-        address=address,
-        price_per_sqft=record.get('price_per_sqft', 0.0) or 0.0,
-        parking=parking,
-        description=record.get('description', ''),
-        features=record.get('features', []) or [],
-        status=record.get('status', 'active') or 'active',
-        search_tags=record.get('search_tags', []) or [],
-        listing_date=listing_date_str,
-        days_on_market=record.get('days_on_market', 0) or 0,
-        virtual_tour_url=record.get('virtual_tour_url', ''),
-        images=record.get('images', []) or [],
-        embedding=embedding_list,
-        embedding_model=embedding_model,
-        embedding_dimension=len(embedding_list),
-        embedded_at=embedded_at
-    )
+# struct_pack() fields building a PropertyDocument from a gold_properties row.
+# address and parking arrive as STRUCT or JSON; address.location is [lon, lat].
+PROPERTY_DOCUMENT_FIELDS = f"""
+    listing_id := CAST(listing_id AS VARCHAR),
+    neighborhood_id := COALESCE(CAST(neighborhood_id AS VARCHAR), ''),
+    price := COALESCE(CAST(price AS DOUBLE), 0.0),
+    bedrooms := COALESCE(CAST(bedrooms AS INTEGER), 0),
+    bathrooms := COALESCE(CAST(bathrooms AS DOUBLE), 0.0),
+    square_feet := COALESCE(CAST(square_feet AS INTEGER), 0),
+    property_type := CAST(property_type AS VARCHAR),
+    year_built := COALESCE(CAST(year_built AS INTEGER), 0),
+    lot_size := COALESCE(CAST(lot_size AS INTEGER), 0),
+    address := struct_pack(
+        street := COALESCE(CAST(address AS JSON) ->> '$.street', ''),
+        city := COALESCE(CAST(address AS JSON) ->> '$.city', ''),
+        state := COALESCE(CAST(address AS JSON) ->> '$.state', ''),
+        zip_code := COALESCE(CAST(address AS JSON) ->> '$.zip_code', ''),
+        location := struct_pack(
+            lat := COALESCE(CAST(CAST(address AS JSON) ->> '$.location[1]' AS DOUBLE), 0.0),
+            lon := COALESCE(CAST(CAST(address AS JSON) ->> '$.location[0]' AS DOUBLE), 0.0)
+        )
+    ),
+    price_per_sqft := COALESCE(CAST(price_per_sqft AS DOUBLE), 0.0),
+    parking := struct_pack(
+        spaces := COALESCE(CAST(CAST(parking AS JSON) ->> '$.spaces' AS INTEGER), 0),
+        type := COALESCE(CAST(parking AS JSON) ->> '$.type', 'none')
+    ),
+    description := COALESCE(CAST(description AS VARCHAR), ''),
+    features := COALESCE(features, []),
+    status := COALESCE(status, 'active'),
+    search_tags := COALESCE(search_tags, []),
+    listing_date := COALESCE(CAST(listing_date AS VARCHAR), ''),
+    days_on_market := COALESCE(CAST(days_on_market AS INTEGER), 0),
+    virtual_tour_url := COALESCE(CAST(virtual_tour_url AS VARCHAR), ''),
+    images := COALESCE(images, []),
+    embedding := COALESCE(CAST(embedding_vector AS DOUBLE[]), []),
+    embedding_dimension := COALESCE(len(embedding_vector), 0),
+    embedded_at := {iso_timestamp_sql("embedding_generated_at")}
+"""
 
 
 # ============================================================================
@@ -197,7 +140,8 @@ class PropertyWriter(ElasticsearchWriterBase):
         self,
         table_name: str = "gold_properties",
         index_name: str = "properties",
-        batch_size: int = 100
+        batch_size: int = 100,
+        changes: Optional[ChangeSet] = None
     ) -> Dict[str, Any]:
         """Index properties to Elasticsearch.
         
@@ -205,20 +149,19 @@ class PropertyWriter(ElasticsearchWriterBase):
             table_name: DuckDB table containing properties
             index_name: Target Elasticsearch index
             batch_size: Number of documents per batch
+            changes: Optional change set for incremental indexing
             
         Returns:
             Indexing statistics
         """
         query = f"SELECT * FROM {DuckDBConnectionManager.safe_identifier(table_name)}"
         
-        # Create transform function with embedded model name
-        def transform(record: Dict[str, Any]) -> PropertyDocument:
-            return transform_property(record, self.embedding_model)
-        
         return self._index_documents(
             query=query,
             index_name=index_name,
-            transform=transform,
+            document_fields=PROPERTY_DOCUMENT_FIELDS,
+            document_model=PropertyDocument,
             id_field="listing_id",
-            batch_size=batch_size
+            batch_size=batch_size,
+            changes=changes
         )
\ No newline at end of file
@@ -1,12 +1,12 @@
 """Wikipedia writer for Elasticsearch."""
 
-import json
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
-from squack_pipeline_v2.writers.elastic.base import ElasticsearchWriterBase
+from squack_pipeline_v2.writers.elastic.base import ElasticsearchWriterBase, iso_timestamp_sql
+from squack_pipeline_v2.core.change_data import ChangeSet
 from squack_pipeline_v2.core.connection import DuckDBConnectionManager
 from squack_pipeline_v2.core.logging import log_stage
 
@@ -61,96 +61,49 @@ class WikipediaDocument(BaseModel):
 
 
 # ============================================================================
-# TRANSFORMATION FUNCTION
+# DOCUMENT FIELDS
 # ============================================================================
 
-def transform_wikipedia(record: Dict[str, Any], embedding_model: str) -> WikipediaDocument:
-    """Transform DuckDB Wikipedia record to Elasticsearch document.
-    
-    Data types from gold_wikipedia:
-    - categories: VARCHAR (JSON string)
-    - key_topics: VARCHAR[] (array)
-    - neighborhood_ids: VARCHAR[] (array)
-    - neighborhood_names: VARCHAR[] (array)
-    - embedding_vector: DOUBLE[] (returned as tuple from DuckDB)
-    
-    Args:
-        record: Raw dictionary from DuckDB query
-        embedding_model: Name of the embedding model used
-        
-    Returns:
-        WikipediaDocument ready for Elasticsearch
-    """
-    # Parse categories from JSON string (categories is VARCHAR in Gold layer)
-    categories = []
-    categories_raw = record.get('categories')
-    if categories_raw:
-        try:
-            # Categories is stored as JSON string in Gold layer
-            categories = json.loads(categories_raw) or []
-        except (json.JSONDecodeError, TypeError, ValueError):
-            # Fallback for malformed JSON - split on comma
-            categories = [c.strip() for c in categories_raw.split(',') if c.strip()]
-    
-    # Convert embedding to list for Elasticsearch
-    # DuckDB returns DOUBLE[] arrays - ensure it's a list for ES
-    embedding_vector = record.get('embedding_vector', [])
-    embedding_list = list(embedding_vector) if embedding_vector else []
-    
-    # Get embedding timestamp - should always exist for Wikipedia
-    embedded_at = record.get('embedding_generated_at')
-    if not embedded_at:
-        raise ValueError(f"Missing embedding_generated_at for page_id {record.get('page_id')}")
-    
-    # Handle nullable datetime fields with defaults
-    content_loaded_at = record.get('content_loaded_at') or datetime.now()
-    last_updated = record.get('last_updated') or datetime.now()
-    
-    # Extract neighborhood fields - these are VARCHAR[] arrays from Gold layer
-    # DuckDB returns arrays as lists, None if NULL
-    neighborhood_ids = record.get('neighborhood_ids', []) or []
-    neighborhood_names = record.get('neighborhood_names', []) or []
-    primary_neighborhood_name = record.get('primary_neighborhood_name', '') or ''
-    neighborhood_count = record.get('neighborhood_count', 0) or 0
-    has_neighborhood_association = record.get('has_neighborhood_association', False) or False
-    
-    # key_topics is VARCHAR[] array from Gold layer
-    # DuckDB returns it as a list, None if NULL
-    key_topics = record.get('key_topics', []) or []
-    
-    # Create WikipediaDocument - let Pydantic handle validation
-    # page_id needs string conversion as ES requires string IDs
-    page_id_value = record.get('page_id')
-    page_id_str = f"{page_id_value}" if page_id_value is not None else ""
-    
-    return WikipediaDocument(
-        page_id=page_id_str,  # ES requires string IDs
-        title=record.get('title', '') or '',
-        url=record.get('url', '') or '',
-        article_filename=record.get('article_filename', '') or '',
-        long_summary=record.get('long_summary', '') or '',
-        short_summary=record.get('short_summary', '') or '',
-        content_length=record.get('content_length', 0) or 0,
-        content_loaded=record.get('content_loaded', False) or False,
-        content_loaded_at=content_loaded_at,
-        city=record.get('city', '') or '',
-        state=record.get('state', '') or '',
-        neighborhood_ids=neighborhood_ids,
-        neighborhood_names=neighborhood_names,
-        primary_neighborhood_name=primary_neighborhood_name,
-        neighborhood_count=neighborhood_count,
-        has_neighborhood_association=has_neighborhood_association,
-        categories=categories,
-        key_topics=key_topics,
-        relevance_score=record.get('relevance_score', 0.0) or 0.0,
-        article_quality_score=record.get('article_quality_score', 0.0) or 0.0,
-        article_quality=record.get('article_quality', '') or '',
-        last_updated=last_updated,
-        embedding=embedding_list,
-        embedding_model=embedding_model,
-        embedding_dimension=len(embedding_list),
-        embedded_at=embedded_at
-    )
+# struct_pack() fields building a WikipediaDocument from a gold_wikipedia row.
+# categories is a JSON array string, falling back to a comma-separated list;
+# embedded_at stays NULL when missing so validation rejects the document.
+WIKIPEDIA_DOCUMENT_FIELDS = f"""
+    page_id := COALESCE(CAST(page_id AS VARCHAR), ''),
+    title := COALESCE(CAST(title AS VARCHAR), ''),
+    url := COALESCE(CAST(url AS VARCHAR), ''),
+    article_filename := COALESCE(CAST(article_filename AS VARCHAR), ''),
+    long_summary := COALESCE(CAST(long_summary AS VARCHAR), ''),
+    short_summary := COALESCE(CAST(short_summary AS VARCHAR), ''),
+    content_length := COALESCE(CAST(content_length AS INTEGER), 0),
+    content_loaded := COALESCE(CAST(content_loaded AS BOOLEAN), false),
+    content_loaded_at := {iso_timestamp_sql("content_loaded_at")},
+    city := COALESCE(CAST(city AS VARCHAR), ''),
+    state := COALESCE(CAST(state AS VARCHAR), ''),
+    neighborhood_ids := COALESCE(neighborhood_ids, []),
+    neighborhood_names := COALESCE(neighborhood_names, []),
+    primary_neighborhood_name := COALESCE(CAST(primary_neighborhood_name AS VARCHAR), ''),
+    neighborhood_count := COALESCE(CAST(neighborhood_count AS INTEGER), 0),
+    has_neighborhood_association := COALESCE(CAST(has_neighborhood_association AS BOOLEAN), false),
+    categories := COALESCE(
+        CASE
+            WHEN json_valid(categories) AND json_type(categories) = 'ARRAY'
+                THEN from_json(categories, '["VARCHAR"]')
+            ELSE list_filter(
+                list_transform(string_split(COALESCE(categories, ''), ','), c -> trim(c)),
+                c -> c <> ''
+            )
+        END,
+        []
+    ),
+    key_topics := COALESCE(key_topics, []),
+    relevance_score := COALESCE(CAST(relevance_score AS DOUBLE), 0.0),
+    article_quality_score := COALESCE(CAST(article_quality_score AS DOUBLE), 0.0),
+    article_quality := COALESCE(CAST(article_quality AS VARCHAR), ''),
+    last_updated := {iso_timestamp_sql("last_updated")},
+    embedding := COALESCE(CAST(embedding_vector AS DOUBLE[]), []),
+    embedding_dimension := COALESCE(len(embedding_vector), 0),
+    embedded_at := {iso_timestamp_sql("embedding_generated_at", default=None)}
+"""
 
 
 # ============================================================================
@@ -165,7 +118,8 @@ class WikipediaWriter(ElasticsearchWriterBase):
         self,
         table_name: str = "gold_wikipedia",
         index_name: str = "wikipedia",
-        batch_size: int = 50
+        batch_size: int = 50,
+        changes: Optional[ChangeSet] = None
     ) -> Dict[str, Any]:
         """Index Wikipedia articles to Elasticsearch.
         
@@ -173,20 +127,19 @@ class WikipediaWriter(ElasticsearchWriterBase):
             table_name: DuckDB table containing Wikipedia articles
             index_name: Target Elasticsearch index
             batch_size: Number of documents per batch (smaller due to larger docs)
+            changes: Optional change set for incremental indexing
             
         Returns:
             Indexing statistics
         """
         query = f"SELECT * FROM {DuckDBConnectionManager.safe_identifier(table_name)}"
         
-        # Create transform function with embedded model name
-        def transform(record: Dict[str, Any]) -> WikipediaDocument:
-            return transform_wikipedia(record, self.embedding_model)
-        
         return self._index_documents(
             query=query,
             index_name=index_name,
-            transform=transform,
+            document_fields=WIKIPEDIA_DOCUMENT_FIELDS,
+            document_model=WikipediaDocument,
             id_field="page_id",
-            batch_size=batch_size
+            batch_size=batch_size,
+            changes=changes
         )
\ No newline at end of file
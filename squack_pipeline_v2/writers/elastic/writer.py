@@ -1,11 +1,12 @@
 """Unified Elasticsearch writer for all entity types."""
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from squack_pipeline_v2.writers.elastic.property import PropertyWriter
 from squack_pipeline_v2.writers.elastic.neighborhood import NeighborhoodWriter
 from squack_pipeline_v2.writers.elastic.wikipedia import WikipediaWriter
+from squack_pipeline_v2.core.change_data import ChangeSet
 from squack_pipeline_v2.core.connection import DuckDBConnectionManager
 from squack_pipeline_v2.core.logging import log_stage
 from squack_pipeline_v2.core.settings import PipelineSettings
@@ -43,7 +44,8 @@ class ElasticsearchWriter:
         self,
         table_name: str = "gold_properties",
         index_name: str = "properties",
-        batch_size: int = 100
+        batch_size: int = 100,
+        changes: Optional[ChangeSet] = None
     ) -> Dict[str, Any]:
         """Index properties to Elasticsearch.
         
@@ -51,11 +53,12 @@ class ElasticsearchWriter:
             table_name: DuckDB table containing properties
             index_name: Target Elasticsearch index
             batch_size: Number of documents per batch
+            changes: Optional change set for incremental indexing
             
         Returns:
             Indexing statistics
         """
-        stats = self.property_writer.index_properties(table_name, index_name, batch_size)
+        stats = self.property_writer.index_properties(table_name, index_name, batch_size, changes)
         self.documents_indexed += stats.get('indexed', 0)
         return stats
     
@@ -64,7 +67,8 @@ class ElasticsearchWriter:
         self,
         table_name: str = "gold_neighborhoods",
         index_name: str = "neighborhoods",
-        batch_size: int = 100
+        batch_size: int = 100,
+        changes: Optional[ChangeSet] = None
     ) -> Dict[str, Any]:
         """Index neighborhoods to Elasticsearch.
         
@@ -72,11 +76,12 @@ class ElasticsearchWriter:
             table_name: DuckDB table containing neighborhoods
             index_name: Target Elasticsearch index
             batch_size: Number of documents per batch
+            changes: Optional change set for incremental indexing
             
         Returns:
             Indexing statistics
         """
-        stats = self.neighborhood_writer.index_neighborhoods(table_name, index_name, batch_size)
+        stats = self.neighborhood_writer.index_neighborhoods(table_name, index_name, batch_size, changes)
         self.documents_indexed += stats.get('indexed', 0)
         return stats
     
@@ -85,7 +90,8 @@ class ElasticsearchWriter:
         self,
         table_name: str = "gold_wikipedia",
         index_name: str = "wikipedia",
-        batch_size: int = 50
+        batch_size: int = 50,
+        changes: Optional[ChangeSet] = None
     ) -> Dict[str, Any]:
         """Index Wikipedia articles to Elasticsearch.
         
@@ -93,35 +99,41 @@ class ElasticsearchWriter:
             table_name: DuckDB table containing Wikipedia articles
             index_name: Target Elasticsearch index
             batch_size: Number of documents per batch
+            changes: Optional change set for incremental indexing
             
         Returns:
             Indexing statistics
         """
-        stats = self.wikipedia_writer.index_wikipedia(table_name, index_name, batch_size)
+        stats = self.wikipedia_writer.index_wikipedia(table_name, index_name, batch_size, changes)
         self.documents_indexed += stats.get('indexed', 0)
         return stats
     
     @log_stage("Elasticsearch: Index all entities")
-    def index_all(self) -> Dict[str, Any]:
+    def index_all(self, changes: Optional[Dict[str, ChangeSet]] = None) -> Dict[str, Any]:
         """Index all entity types to Elasticsearch.
         
+        Args:
+            changes: Optional change sets by entity type; when given, only
+                changed documents are upserted and deleted ones removed
+        
         Returns:
             Combined indexing statistics
         """
         stats = {}
+        changes = changes or {}
         
         # Define tables to index
         tables = [
-            ("gold_properties", "properties", self.index_properties),
-            ("gold_neighborhoods", "neighborhoods", self.index_neighborhoods),
-            ("gold_wikipedia", "wikipedia", self.index_wikipedia)
+            ("gold_properties", "properties", "property", self.index_properties),
+            ("gold_neighborhoods", "neighborhoods", "neighborhood", self.index_neighborhoods),
+            ("gold_wikipedia", "wikipedia", "wikipedia", self.index_wikipedia)
         ]
         
         # Index each table if it exists
-        for table_name, index_name, index_method in tables:
+        for table_name, index_name, entity_type, index_method in tables:
             if self.connection_manager.table_exists(table_name):
                 logger.info(f"Indexing {table_name} to {index_name}")
-                stats[index_name] = index_method()
+                stats[index_name] = index_method(changes=changes.get(entity_type))
             else:
                 logger.warning(f"Table {table_name} does not exist, skipping")
         
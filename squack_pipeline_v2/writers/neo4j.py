@@ -8,15 +8,104 @@ Following DuckDB best practices:
 - No pandas usage - uses native DuckDB iteration
 - Direct memory-efficient access
 - Batch processing for large datasets
+
+Tables are streamed from DuckDB with fetchmany() in chunks of
+Neo4jConfig.chunk_size rows; each chunk is one UNWIND in a managed write
+transaction, retried by the driver on transient errors (deadlocks, leader
+switches). Node labels are written concurrently, each on its own Neo4j
+session and DuckDB cursor, and a relationship type starts as soon as the
+labels at both of its ends are written.
+
+In incremental mode (change sets from core/change_data.py) only nodes and
+outgoing relationships of changed Property/Neighborhood/Wikipedia ids are
+written; deleted ids are DETACH DELETEd and updated ids lose their outgoing
+relationships before they are rewritten. Shared dimension nodes (cities,
+features, ...) are small and always MERGEd in full.
+
+With create_only (initial loads into an empty database) every MERGE is
+swapped for CREATE, skipping the lookup each MERGE does before writing;
+relationship rows are de-duplicated in DuckDB instead. For very large initial
+loads, writers/neo4j_import.py exports files for neo4j-admin instead of Bolt.
+
+In profile mode each chunk also records its size as JSON-encoded UNWIND
+parameters, which the run profile reports as the bytes written to Neo4j
+(Bolt itself does not expose bytes sent).
+
+Every completed write bumps the graph version on the (:GraphMetadata) node,
+which read-side query caches use to drop results for the previous graph.
 """
 
-from typing import Dict, Any, List, Iterator, Tuple
+import re
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Any, List, Iterator, Optional, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict
-from neo4j import GraphDatabase, Driver, Session
+import orjson
+from pydantic import BaseModel, Field, ConfigDict, computed_field
+from neo4j import GraphDatabase, Driver, ManagedTransaction, Session
 
+from squack_pipeline_v2.core.change_data import ChangeSet
 from squack_pipeline_v2.core.connection import DuckDBConnectionManager
 from squack_pipeline_v2.core.logging import PipelineLogger, log_stage
+from squack_pipeline_v2.core.profiling import get_profiler
+
+
+# Tables filtered to changed ids in incremental mode:
+# table -> (entity type, SQL expression yielding the entity id)
+INCREMENTAL_TABLE_KEYS: Dict[str, Tuple[str, str]] = {
+    "gold_graph_properties": ("property", "listing_id"),
+    "gold_graph_neighborhoods": ("neighborhood", "neighborhood_id"),
+    "gold_graph_wikipedia": ("wikipedia", "wikipedia_id"),
+    "gold_graph_rel_located_in": ("property", "REPLACE(from_id, 'property:', '')"),
+    "gold_graph_rel_has_feature": ("property", "REPLACE(from_id, 'property:', '')"),
+    "gold_graph_rel_of_type": ("property", "REPLACE(from_id, 'property:', '')"),
+    "gold_graph_rel_in_price_range": ("property", "REPLACE(from_id, 'property:', '')"),
+    "gold_graph_rel_in_zip_code": ("property", "REPLACE(from_id, 'property:', '')"),
+    "gold_graph_rel_part_of": ("neighborhood", "REPLACE(from_id, 'neighborhood:', '')"),
+    "gold_graph_rel_in_county": ("neighborhood", "REPLACE(from_id, 'neighborhood:', '')"),
+    "gold_graph_rel_describes": ("wikipedia", "REPLACE(from_id, 'wikipedia:', '')"),
+    "gold_graph_rel_similar_to": ("property", "REPLACE(from_id, 'property:', '')"),
+}
+
+# Relationship writer -> node labels that must be written first
+RELATIONSHIP_ENDPOINTS: Dict[str, Tuple[str, ...]] = {
+    "write_located_in_relationships": ("Property", "Neighborhood"),
+    "write_has_feature_relationships": ("Property", "Feature"),
+    "write_part_of_relationships": ("Neighborhood", "City"),
+    "write_in_county_relationships": ("Neighborhood", "County"),
+    "write_describes_relationships": ("Wikipedia", "Neighborhood"),
+    "write_of_type_relationships": ("Property", "PropertyType"),
+    "write_in_price_range_relationships": ("Property", "PriceRange"),
+    "write_in_zip_code_relationships": ("Property", "ZipCode"),
+    "write_neighborhood_in_zip_relationships": ("Neighborhood", "ZipCode"),
+    "write_geographic_hierarchy_relationships": ("Neighborhood", "City", "County", "State"),
+    "write_similar_to_relationships": ("Property",),
+}
+
+# Graph version counter read by result caches (graph_real_estate.queries.query_cache)
+BUMP_GRAPH_VERSION_QUERY = """
+MERGE (m:GraphMetadata {key: 'graph'})
+SET m.version = coalesce(m.version, 0) + 1,
+    m.revision = randomUUID(),
+    m.updated_at = datetime()
+RETURN m.version as version
+"""
+
+# MERGE clauses swapped for CREATE in create_only mode
+MERGE_CLAUSE_PATTERN = re.compile(r"\bMERGE\b")
+
+# Any node other than the graph version counter makes a database non-empty
+NON_EMPTY_DATABASE_QUERY = """
+MATCH (n) WHERE NOT n:GraphMetadata
+RETURN count(n) > 0 AS has_nodes
+LIMIT 1
+"""
+
+# Entity type -> (node label, id property)
+ENTITY_NODE_KEYS: Dict[str, Tuple[str, str]] = {
+    "property": ("Property", "listing_id"),
+    "neighborhood": ("Neighborhood", "neighborhood_id"),
+    "wikipedia": ("Wikipedia", "wikipedia_id"),
+}
 
 
 class Neo4jConfig(BaseModel):
@@ -28,6 +117,40 @@ class Neo4jConfig(BaseModel):
     username: str = Field(default="neo4j", description="Neo4j username")
     password: str = Field(description="Neo4j password")
     database: str = Field(default="neo4j", description="Database name")
+    chunk_size: int = Field(default=5000, ge=1, description="Rows per UNWIND transaction")
+    max_workers: int = Field(default=4, ge=1, description="Node labels/relationship types written concurrently")
+    max_retry_time: float = Field(default=30.0, ge=0, description="Seconds to retry transient errors per chunk")
+    create_only: bool = Field(default=False, description="CREATE instead of MERGE; initial loads into an empty database")
+
+
+class ChunkWriteResult(BaseModel):
+    """Throughput of one chunk written to Neo4j."""
+    
+    model_config = ConfigDict(frozen=True)
+    
+    table_name: str = Field(description="Source table name")
+    chunk_index: int = Field(description="Position of the chunk in the table")
+    records: int = Field(description="Records in the chunk")
+    duration_seconds: float = Field(description="Time taken, including retries")
+    bytes: int = Field(default=0, description="JSON size of the chunk parameters (profile mode only)")
+    
+    @computed_field
+    @property
+    def records_per_second(self) -> float:
+        """Write throughput of the chunk."""
+        if self.duration_seconds > 0:
+            return self.records / self.duration_seconds
+        return 0.0
+
+
+class TableWriteStats(BaseModel):
+    """Summed counters of all chunks written from one table."""
+    
+    records_read: int = Field(default=0, description="Records read from DuckDB")
+    nodes_created: int = Field(default=0, description="Nodes created in Neo4j")
+    properties_set: int = Field(default=0, description="Properties set in Neo4j")
+    relationships_created: int = Field(default=0, description="Relationships created")
+    chunks: List[ChunkWriteResult] = Field(default_factory=list)
 
 
 class NodeWriteResult(BaseModel):
@@ -41,6 +164,7 @@ class NodeWriteResult(BaseModel):
     nodes_created: int = Field(description="Nodes created in Neo4j")
     properties_set: int = Field(description="Properties set in Neo4j")
     duration_seconds: float = Field(description="Time taken")
+    chunk_results: List[ChunkWriteResult] = Field(default_factory=list)
 
 
 class RelationshipWriteResult(BaseModel):
@@ -53,6 +177,7 @@ class RelationshipWriteResult(BaseModel):
     records_read: int = Field(description="Records read from DuckDB")
     relationships_created: int = Field(description="Relationships created")
     duration_seconds: float = Field(description="Time taken")
+    chunk_results: List[ChunkWriteResult] = Field(default_factory=list)
 
 
 class Neo4jWriteMetadata(BaseModel):
@@ -67,7 +192,28 @@ class Neo4jWriteMetadata(BaseModel):
     relationship_results: List[RelationshipWriteResult] = Field(default_factory=list)
     total_nodes: int = Field(default=0, description="Total nodes written")
     total_relationships: int = Field(default=0, description="Total relationships written")
+    nodes_deleted: int = Field(default=0, description="Nodes deleted for removed source records")
     constraints_created: List[str] = Field(default_factory=list)
+    graph_version: Optional[int] = Field(default=None, description="Graph version after the write")
+    
+    @property
+    def chunk_results(self) -> List[ChunkWriteResult]:
+        """Per-chunk throughput of every node and relationship write."""
+        results = [*self.node_results, *self.relationship_results]
+        return [chunk for result in results for chunk in result.chunk_results]
+    
+    @property
+    def bytes_written(self) -> int:
+        """Parameter bytes sent over all chunks (measured in profile mode)."""
+        return sum(chunk.bytes for chunk in self.chunk_results)
+    
+    @property
+    def records_per_second(self) -> float:
+        """Records written per second over the whole write."""
+        if self.total_duration_seconds <= 0:
+            return 0.0
+        records = sum(chunk.records for chunk in self.chunk_results)
+        return records / self.total_duration_seconds
 
 
 class Neo4jWriter:
@@ -83,29 +229,36 @@ class Neo4jWriter:
     - Transaction management with session scope
     - CAST decimal types in SQL to avoid runtime conversion
     
+    - Chunked UNWIND transactions streamed from DuckDB (chunk_size)
+    - Managed write transactions retried on transient errors
+    - Concurrent writers, one session each, from the driver's connection pool
+    
     Future Improvements for Production:
-    - Add batch processing with configurable batch size
-    - Implement retry logic for transient failures  
-    - Add transaction batching for large datasets
     - Consider using apoc.periodic.iterate for very large imports
     """
     
     def __init__(
         self,
         config: Neo4jConfig,
-        connection_manager: DuckDBConnectionManager
+        connection_manager: DuckDBConnectionManager,
+        changes: Optional[Dict[str, ChangeSet]] = None
     ):
         """Initialize Neo4j writer.
         
         Args:
             config: Neo4j configuration
             connection_manager: DuckDB connection manager
+            changes: Optional change sets by entity type for incremental writes
         """
+        if config.create_only and changes is not None:
+            raise ValueError("create_only is for initial loads; incremental writes must MERGE")
         self.config = config
         self.connection_manager = connection_manager
+        self.changes = changes
         self.driver = GraphDatabase.driver(
             config.uri,
-            auth=(config.username, config.password)
+            auth=(config.username, config.password),
+            max_transaction_retry_time=config.max_retry_time
         )
         self.logger = PipelineLogger.get_logger(self.__class__.__name__)
     
@@ -156,17 +309,24 @@ class Neo4jWriter:
         
         return constraints
     
-    def _get_records_from_table(self, table_name: str) -> List[Dict[str, Any]]:
-        """Get all records from a DuckDB table.
+    def _iter_record_chunks(
+        self,
+        table_name: str,
+        where: Optional[str] = None,
+        distinct: bool = False
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream records from a DuckDB table in chunks.
         
         Neo4j best practice: Cast DECIMAL types to DOUBLE in SQL to avoid
         type conversion issues and improve performance.
         
         Args:
             table_name: Name of the table
+            where: Optional extra SQL predicate
+            distinct: Drop duplicate rows
             
-        Returns:
-            List of records as dictionaries
+        Yields:
+            Up to chunk_size records as dictionaries
         """
         conn = self.connection_manager.get_connection()
         safe_table = DuckDBConnectionManager.safe_identifier(table_name)
@@ -187,16 +347,150 @@ class Neo4jWriter:
                 select_columns.append(col_name)
         
         # Execute query with type casting
-        query = f"SELECT {', '.join(select_columns)} FROM {safe_table}"
+        predicates = [p for p in (self._change_filter(table_name), where) if p]
+        query = f"SELECT {'DISTINCT ' if distinct else ''}{', '.join(select_columns)} FROM {safe_table}"
+        if predicates:
+            query += " WHERE " + " AND ".join(f"({p})" for p in predicates)
         result = conn.execute(query)
         
-        # Convert to list of dicts for Neo4j
+        # Convert each chunk to a list of dicts for Neo4j
         columns = [desc[0] for desc in result.description]
-        records = []
-        for row in result.fetchall():
-            records.append(dict(zip(columns, row)))
+        while True:
+            rows = result.fetchmany(self.config.chunk_size)
+            if not rows:
+                break
+            yield [dict(zip(columns, row)) for row in rows]
+    
+    def _write_chunks(
+        self,
+        table_name: str,
+        cypher: str,
+        parameter: str,
+        where: Optional[str] = None
+    ) -> TableWriteStats:
+        """Write a table chunk by chunk, one managed transaction per chunk.
+        
+        Args:
+            table_name: Source table name
+            cypher: UNWIND statement reading the chunk from $<parameter>
+            parameter: Name of the list parameter in the statement
+            where: Optional extra SQL predicate
+            
+        Returns:
+            Counters summed over all chunks
+        """
+        # Without MERGE nothing de-duplicates relationships in Neo4j
+        distinct = False
+        if self.config.create_only:
+            cypher = MERGE_CLAUSE_PATTERN.sub("CREATE", cypher)
+            distinct = parameter == "rels"
+        
+        def write_chunk(tx: ManagedTransaction, records: List[Dict[str, Any]]):
+            return tx.run(cypher, {parameter: records}).consume().counters
+        
+        measure_bytes = get_profiler() is not None
+        stats = TableWriteStats()
+        with self.driver.session() as session:
+            for chunk_index, records in enumerate(self._iter_record_chunks(table_name, where, distinct)):
+                chunk_bytes = len(orjson.dumps(records, default=str)) if measure_bytes else 0
+                chunk_start = datetime.now()
+                counters = session.execute_write(write_chunk, records)
+                
+                stats.records_read += len(records)
+                stats.nodes_created += counters.nodes_created
+                stats.properties_set += counters.properties_set
+                stats.relationships_created += counters.relationships_created
+                stats.chunks.append(ChunkWriteResult(
+                    table_name=table_name,
+                    chunk_index=chunk_index,
+                    records=len(records),
+                    duration_seconds=(datetime.now() - chunk_start).total_seconds(),
+                    bytes=chunk_bytes
+                ))
+        
+        return stats
+    
+    def _change_filter(self, table_name: str) -> str:
+        """Predicate restricting a table to changed ids in incremental mode.
+        
+        Args:
+            table_name: Graph table name
+            
+        Returns:
+            SQL predicate, or an empty string to read the whole table
+        """
+        if self.changes is None or table_name not in INCREMENTAL_TABLE_KEYS:
+            return ""
+        entity_type, id_sql = INCREMENTAL_TABLE_KEYS[table_name]
+        change_set = self.changes.get(entity_type)
+        if change_set is None:
+            return ""
+        return change_set.id_filter(id_sql)
+    
+    @log_stage("Neo4j: Apply deletions")
+    def apply_deletions(self) -> int:
+        """Remove deleted entities and stale links of updated ones.
+        
+        Deleted ids are DETACH DELETEd. Updated ids lose their outgoing
+        relationships, which are rewritten from the current graph tables.
+        
+        Returns:
+            Number of nodes deleted
+        """
+        if not self.changes:
+            return 0
+        
+        nodes_deleted = 0
+        with self.driver.session() as session:
+            for entity_type, change_set in self.changes.items():
+                if entity_type not in ENTITY_NODE_KEYS:
+                    continue
+                label, id_property = ENTITY_NODE_KEYS[entity_type]
+                rows = self.connection_manager.execute(
+                    f"SELECT entity_id, change_type FROM {change_set.changes_table} "
+                    f"WHERE change_type IN ('update', 'delete')"
+                ).fetchall()
+                deleted_ids = [entity_id for entity_id, change_type in rows if change_type == "delete"]
+                updated_ids = [entity_id for entity_id, change_type in rows if change_type == "update"]
+                
+                # Ids are compared as strings (Wikipedia ids are integers in Neo4j)
+                if deleted_ids:
+                    summary = session.run(
+                        f"MATCH (n:{label}) WHERE toString(n.{id_property}) IN $ids DETACH DELETE n",
+                        ids=deleted_ids
+                    ).consume()
+                    nodes_deleted += summary.counters.nodes_deleted
+                if updated_ids:
+                    session.run(
+                        f"MATCH (n:{label})-[r]->() WHERE toString(n.{id_property}) IN $ids DELETE r",
+                        ids=updated_ids
+                    ).consume()
+        
+        self.logger.info(f"Deleted {nodes_deleted} nodes for removed source records")
+        return nodes_deleted
+    
+    def ensure_empty_database(self) -> None:
+        """Refuse a create_only load into a database that already has nodes.
         
-        return records
+        Raises:
+            ValueError: If the database holds nodes other than GraphMetadata
+        """
+        with self.driver.session() as session:
+            record = session.run(NON_EMPTY_DATABASE_QUERY).single()
+        if record is not None and record["has_nodes"]:
+            raise ValueError(
+                "create_only needs an empty database; use the MERGE path (create_only=False) for updates"
+            )
+    
+    def bump_graph_version(self) -> int:
+        """Mark the graph as changed so cached query results are invalidated.
+        
+        Returns:
+            New graph version
+        """
+        with self.driver.session() as session:
+            record = session.execute_write(lambda tx: tx.run(BUMP_GRAPH_VERSION_QUERY).single())
+        return record["version"]
     
     # ============= NODE WRITERS =============
     
@@ -217,27 +511,24 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $nodes AS node
         MERGE (p:Property {listing_id: node.listing_id})
         SET p += node
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, nodes=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "nodes")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return NodeWriteResult(
             entity_type="Property",
             table_name=table_name,
-            records_read=len(records),
-            nodes_created=summary.counters.nodes_created,
-            properties_set=summary.counters.properties_set,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            nodes_created=stats.nodes_created,
+            properties_set=stats.properties_set,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write Neighborhood nodes")
@@ -257,27 +548,24 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $nodes AS node
         MERGE (n:Neighborhood {neighborhood_id: node.neighborhood_id})
         SET n += node
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, nodes=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "nodes")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return NodeWriteResult(
             entity_type="Neighborhood",
             table_name=table_name,
-            records_read=len(records),
-            nodes_created=summary.counters.nodes_created,
-            properties_set=summary.counters.properties_set,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            nodes_created=stats.nodes_created,
+            properties_set=stats.properties_set,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write Wikipedia nodes")
@@ -297,27 +585,24 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $nodes AS node
         MERGE (w:Wikipedia {wikipedia_id: node.wikipedia_id})
         SET w += node
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, nodes=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "nodes")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return NodeWriteResult(
             entity_type="Wikipedia",
             table_name=table_name,
-            records_read=len(records),
-            nodes_created=summary.counters.nodes_created,
-            properties_set=summary.counters.properties_set,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            nodes_created=stats.nodes_created,
+            properties_set=stats.properties_set,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write Feature nodes")
@@ -337,27 +622,24 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $nodes AS node
         MERGE (f:Feature {feature_id: node.feature_id})
         SET f += node
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, nodes=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "nodes")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return NodeWriteResult(
             entity_type="Feature",
             table_name=table_name,
-            records_read=len(records),
-            nodes_created=summary.counters.nodes_created,
-            properties_set=summary.counters.properties_set,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            nodes_created=stats.nodes_created,
+            properties_set=stats.properties_set,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write City nodes")
@@ -377,27 +659,24 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $nodes AS node
         MERGE (c:City {city_id: node.city_id})
         SET c += node
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, nodes=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "nodes")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return NodeWriteResult(
             entity_type="City",
             table_name=table_name,
-            records_read=len(records),
-            nodes_created=summary.counters.nodes_created,
-            properties_set=summary.counters.properties_set,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            nodes_created=stats.nodes_created,
+            properties_set=stats.properties_set,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write State nodes")
@@ -417,27 +696,24 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $nodes AS node
         MERGE (s:State {state_id: node.state_id})
         SET s += node
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, nodes=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "nodes")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return NodeWriteResult(
             entity_type="State",
             table_name=table_name,
-            records_read=len(records),
-            nodes_created=summary.counters.nodes_created,
-            properties_set=summary.counters.properties_set,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            nodes_created=stats.nodes_created,
+            properties_set=stats.properties_set,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write ZipCode nodes")
@@ -457,27 +733,24 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $nodes AS node
         MERGE (z:ZipCode {zip_code_id: node.zip_code_id})
         SET z += node
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, nodes=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "nodes")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return NodeWriteResult(
             entity_type="ZipCode",
             table_name=table_name,
-            records_read=len(records),
-            nodes_created=summary.counters.nodes_created,
-            properties_set=summary.counters.properties_set,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            nodes_created=stats.nodes_created,
+            properties_set=stats.properties_set,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write County nodes")
@@ -497,27 +770,24 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $nodes AS node
         MERGE (c:County {county_id: node.county_id})
         SET c += node
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, nodes=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "nodes")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return NodeWriteResult(
             entity_type="County",
             table_name=table_name,
-            records_read=len(records),
-            nodes_created=summary.counters.nodes_created,
-            properties_set=summary.counters.properties_set,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            nodes_created=stats.nodes_created,
+            properties_set=stats.properties_set,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write PropertyType nodes")
@@ -537,27 +807,24 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $nodes AS node
         MERGE (pt:PropertyType {property_type_id: node.property_type_id})
         SET pt += node
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, nodes=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "nodes")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return NodeWriteResult(
             entity_type="PropertyType",
             table_name=table_name,
-            records_read=len(records),
-            nodes_created=summary.counters.nodes_created,
-            properties_set=summary.counters.properties_set,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            nodes_created=stats.nodes_created,
+            properties_set=stats.properties_set,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write PriceRange nodes")
@@ -577,27 +844,24 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $nodes AS node
         MERGE (pr:PriceRange {price_range_id: node.price_range_id})
         SET pr += node
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, nodes=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "nodes")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return NodeWriteResult(
             entity_type="PriceRange",
             table_name=table_name,
-            records_read=len(records),
-            nodes_created=summary.counters.nodes_created,
-            properties_set=summary.counters.properties_set,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            nodes_created=stats.nodes_created,
+            properties_set=stats.properties_set,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     # ============= RELATIONSHIP WRITERS =============
@@ -618,8 +882,6 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $rels AS rel
         MATCH (p:Property {listing_id: REPLACE(rel.from_id, 'property:', '')})
@@ -627,18 +889,17 @@ class Neo4jWriter:
         MERGE (p)-[:LOCATED_IN]->(n)
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, rels=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "rels")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return RelationshipWriteResult(
             relationship_type="LOCATED_IN",
             table_name=table_name,
-            records_read=len(records),
-            relationships_created=summary.counters.relationships_created,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            relationships_created=stats.relationships_created,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write HAS_FEATURE relationships")
@@ -657,8 +918,6 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $rels AS rel
         MATCH (p:Property {listing_id: REPLACE(rel.from_id, 'property:', '')})
@@ -666,18 +925,17 @@ class Neo4jWriter:
         MERGE (p)-[:HAS_FEATURE]->(f)
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, rels=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "rels")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return RelationshipWriteResult(
             relationship_type="HAS_FEATURE",
             table_name=table_name,
-            records_read=len(records),
-            relationships_created=summary.counters.relationships_created,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            relationships_created=stats.relationships_created,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write PART_OF relationships")
@@ -696,8 +954,6 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $rels AS rel
         MATCH (n:Neighborhood {neighborhood_id: rel.from_id})
@@ -705,18 +961,17 @@ class Neo4jWriter:
         MERGE (n)-[:PART_OF]->(c)
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, rels=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "rels")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return RelationshipWriteResult(
             relationship_type="PART_OF",
             table_name=table_name,
-            records_read=len(records),
-            relationships_created=summary.counters.relationships_created,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            relationships_created=stats.relationships_created,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write IN_COUNTY relationships")
@@ -735,8 +990,6 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $rels AS rel
         MATCH (n:Neighborhood {neighborhood_id: rel.from_id})
@@ -744,18 +997,17 @@ class Neo4jWriter:
         MERGE (n)-[:IN_COUNTY]->(c)
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, rels=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "rels")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return RelationshipWriteResult(
             relationship_type="IN_COUNTY",
             table_name=table_name,
-            records_read=len(records),
-            relationships_created=summary.counters.relationships_created,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            relationships_created=stats.relationships_created,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write DESCRIBES relationships")
@@ -774,8 +1026,6 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $rels AS rel
         MATCH (w:Wikipedia {wikipedia_id: rel.from_id})
@@ -783,18 +1033,17 @@ class Neo4jWriter:
         MERGE (w)-[:DESCRIBES]->(n)
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, rels=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "rels")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return RelationshipWriteResult(
             relationship_type="DESCRIBES",
             table_name=table_name,
-            records_read=len(records),
-            relationships_created=summary.counters.relationships_created,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            relationships_created=stats.relationships_created,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write OF_TYPE relationships")
@@ -813,8 +1062,6 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $rels AS rel
         MATCH (p:Property {listing_id: REPLACE(rel.from_id, 'property:', '')})
@@ -822,18 +1069,17 @@ class Neo4jWriter:
         MERGE (p)-[:OF_TYPE]->(pt)
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, rels=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "rels")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return RelationshipWriteResult(
             relationship_type="OF_TYPE",
             table_name=table_name,
-            records_read=len(records),
-            relationships_created=summary.counters.relationships_created,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            relationships_created=stats.relationships_created,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write IN_PRICE_RANGE relationships")
@@ -852,8 +1098,6 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $rels AS rel
         MATCH (p:Property {listing_id: REPLACE(rel.from_id, 'property:', '')})
@@ -861,18 +1105,17 @@ class Neo4jWriter:
         MERGE (p)-[:IN_PRICE_RANGE]->(pr)
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, rels=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "rels")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return RelationshipWriteResult(
             relationship_type="IN_PRICE_RANGE",
             table_name=table_name,
-            records_read=len(records),
-            relationships_created=summary.counters.relationships_created,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            relationships_created=stats.relationships_created,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write geographic hierarchy relationships")
@@ -894,33 +1137,35 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         # Write relationships dynamically based on relationship_type
+        records_read = 0
         total_created = 0
-        with self.driver.session() as session:
-            for rel_type in ['IN_CITY', 'IN_COUNTY', 'IN_STATE']:
-                type_records = [r for r in records if r['relationship_type'] == rel_type]
-                if type_records:
-                    cypher = f"""
-                    UNWIND $rels AS rel
-                    MATCH (from {{graph_node_id: rel.from_id}})
-                    MATCH (to {{graph_node_id: rel.to_id}})
-                    MERGE (from)-[:{rel_type}]->(to)
-                    """
-                    result = session.run(cypher, rels=type_records)
-                    summary = result.consume()
-                    total_created += summary.counters.relationships_created
-                    self.logger.info(f"Created {summary.counters.relationships_created} {rel_type} relationships")
+        chunks = []
+        for rel_type in ['IN_CITY', 'IN_COUNTY', 'IN_STATE']:
+            cypher = f"""
+            UNWIND $rels AS rel
+            MATCH (from {{graph_node_id: rel.from_id}})
+            MATCH (to {{graph_node_id: rel.to_id}})
+            MERGE (from)-[:{rel_type}]->(to)
+            """
+            stats = self._write_chunks(
+                table_name, cypher, "rels",
+                where=f"relationship_type = '{rel_type}'"
+            )
+            records_read += stats.records_read
+            total_created += stats.relationships_created
+            chunks.extend(stats.chunks)
+            self.logger.info(f"Created {stats.relationships_created} {rel_type} relationships")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return RelationshipWriteResult(
             relationship_type="GEOGRAPHIC_HIERARCHY",
             table_name=table_name,
-            records_read=len(records),
+            records_read=records_read,
             relationships_created=total_created,
-            duration_seconds=duration
+            duration_seconds=duration,
+            chunk_results=chunks
         )
     
     @log_stage("Neo4j: Write IN_ZIP_CODE relationships")
@@ -939,8 +1184,6 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $rels AS rel
         MATCH (p:Property {graph_node_id: rel.from_id})
@@ -948,18 +1191,17 @@ class Neo4jWriter:
         MERGE (p)-[:IN_ZIP_CODE]->(z)
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, rels=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "rels")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return RelationshipWriteResult(
             relationship_type="IN_ZIP_CODE",
             table_name=table_name,
-            records_read=len(records),
-            relationships_created=summary.counters.relationships_created,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            relationships_created=stats.relationships_created,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     @log_stage("Neo4j: Write IN_ZIP_CODE relationships")
@@ -978,8 +1220,6 @@ class Neo4jWriter:
                 duration_seconds=0.0
             )
         
-        records = self._get_records_from_table(table_name)
-        
         cypher = """
         UNWIND $rels AS rel
         MATCH (n:Neighborhood {graph_node_id: rel.from_id})
@@ -987,90 +1227,213 @@ class Neo4jWriter:
         MERGE (n)-[:IN_ZIP_CODE]->(z)
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, rels=records)
-            summary = result.consume()
+        stats = self._write_chunks(table_name, cypher, "rels")
         
         duration = (datetime.now() - start_time).total_seconds()
         
         return RelationshipWriteResult(
             relationship_type="IN_ZIP_CODE",
             table_name=table_name,
-            records_read=len(records),
-            relationships_created=summary.counters.relationships_created,
-            duration_seconds=duration
+            records_read=stats.records_read,
+            relationships_created=stats.relationships_created,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
+        )
+    
+    @log_stage("Neo4j: Write SIMILAR_TO relationships")
+    def write_similar_to_relationships(self) -> RelationshipWriteResult:
+        """Write precomputed SIMILAR_TO relationships (Property -> Property)."""
+        table_name = "gold_graph_rel_similar_to"
+        start_time = datetime.now()
+        
+        if not self.connection_manager.table_exists(table_name):
+            self.logger.warning(f"Table {table_name} does not exist")
+            return RelationshipWriteResult(
+                relationship_type="SIMILAR_TO",
+                table_name=table_name,
+                records_read=0,
+                relationships_created=0,
+                duration_seconds=0.0
+            )
+        
+        cypher = """
+        UNWIND $rels AS rel
+        MATCH (p:Property {listing_id: REPLACE(rel.from_id, 'property:', '')})
+        MATCH (s:Property {listing_id: REPLACE(rel.to_id, 'property:', '')})
+        MERGE (p)-[r:SIMILAR_TO]->(s)
+        SET r.score = rel.weight, r.rank = rel.rank
+        """
+        
+        stats = self._write_chunks(table_name, cypher, "rels")
+        
+        duration = (datetime.now() - start_time).total_seconds()
+        
+        return RelationshipWriteResult(
+            relationship_type="SIMILAR_TO",
+            table_name=table_name,
+            records_read=stats.records_read,
+            relationships_created=stats.relationships_created,
+            duration_seconds=duration,
+            chunk_results=stats.chunks
         )
     
     # ============= ORCHESTRATION METHODS =============
     
+    def _node_writers(self) -> Dict[str, Callable[[], NodeWriteResult]]:
+        """Node writers by label, core entities first."""
+        return {
+            "Property": self.write_property_nodes,
+            "Neighborhood": self.write_neighborhood_nodes,
+            "Wikipedia": self.write_wikipedia_nodes,
+            "Feature": self.write_feature_nodes,
+            "City": self.write_city_nodes,
+            "State": self.write_state_nodes,
+            "ZipCode": self.write_zip_code_nodes,
+            "County": self.write_county_nodes,
+            "PropertyType": self.write_property_type_nodes,
+            "PriceRange": self.write_price_range_nodes
+        }
+    
+    def _relationship_writers(self) -> Dict[str, Callable[[], RelationshipWriteResult]]:
+        """Relationship writers by method name."""
+        return {name: getattr(self, name) for name in RELATIONSHIP_ENDPOINTS}
+    
+    def _run_writers(
+        self,
+        writers: Dict[str, Callable[[], Any]],
+        depends_on: Dict[str, Tuple[str, ...]]
+    ) -> Dict[str, Any]:
+        """Run writers concurrently, each once the writers it depends on finished.
+        
+        Every writer gets its own DuckDB cursor and Neo4j session. After the
+        first failure no new writers start and the error is re-raised.
+        
+        Args:
+            writers: Writers by name
+            depends_on: Names each writer waits for (unknown names are ignored)
+            
+        Returns:
+            Writer results by name
+        """
+        def run(writer: Callable[[], Any]) -> Any:
+            with self.connection_manager.cursor_scope():
+                return writer()
+        
+        # Open the shared DuckDB connection once before deriving cursors
+        self.connection_manager.connect()
+        pending = {
+            name: [dep for dep in depends_on.get(name, ()) if dep in writers]
+            for name in writers
+        }
+        results: Dict[str, Any] = {}
+        running: Dict[Future, str] = {}
+        error: Optional[BaseException] = None
+        
+        with ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix="neo4j") as executor:
+            while pending or running:
+                if error is None:
+                    ready = [name for name, deps in pending.items() if all(dep in results for dep in deps)]
+                    for name in ready:
+                        del pending[name]
+                        running[executor.submit(run, writers[name])] = name
+                
+                if not running:
+                    break
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Neo4j writer {name} failed: {e}")
+                        error = error or e
+        
+        if error is not None:
+            raise error
+        
+        # Keep declaration order regardless of completion order
+        return {name: results[name] for name in writers}
+    
+    def _log_node_result(self, result: NodeWriteResult) -> None:
+        """Log one node write result."""
+        self.logger.info(
+            f"Wrote {result.nodes_created} {result.entity_type} nodes "
+            f"from {result.records_read} records in {len(result.chunk_results)} chunks"
+        )
+    
+    def _log_relationship_result(self, result: RelationshipWriteResult) -> None:
+        """Log one relationship write result."""
+        self.logger.info(
+            f"Wrote {result.relationships_created} {result.relationship_type} relationships "
+            f"from {result.records_read} records in {len(result.chunk_results)} chunks"
+        )
+    
     @log_stage("Neo4j: Write all nodes")
     def write_all_nodes(self) -> List[NodeWriteResult]:
-        """Write all node types to Neo4j.
+        """Write all node types to Neo4j, labels in parallel.
         
         Returns:
             List of node write results
         """
         results = []
-        
-        # Write nodes in order (core entities first)
-        node_writers = [
-            self.write_property_nodes,
-            self.write_neighborhood_nodes,
-            self.write_wikipedia_nodes,
-            self.write_feature_nodes,
-            self.write_city_nodes,
-            self.write_state_nodes,
-            self.write_zip_code_nodes,
-            self.write_county_nodes,
-            self.write_property_type_nodes,
-            self.write_price_range_nodes
-        ]
-        
-        for writer in node_writers:
-            result = writer()
+        for result in self._run_writers(self._node_writers(), {}).values():
             if result.records_read > 0:
                 results.append(result)
-                self.logger.info(
-                    f"Wrote {result.nodes_created} {result.entity_type} nodes "
-                    f"from {result.records_read} records"
-                )
+                self._log_node_result(result)
         
         return results
     
     @log_stage("Neo4j: Write all relationships")
     def write_all_relationships(self) -> List[RelationshipWriteResult]:
-        """Write all relationship types to Neo4j.
+        """Write all relationship types to Neo4j, types in parallel.
+        
+        Expects the nodes to be written already.
         
         Returns:
             List of relationship write results
         """
+        # Relationship types only depend on their endpoint labels, which are
+        # written already, so _run_writers drops them and all types start at once
         results = []
-        
-        # Write relationships
-        relationship_writers = [
-            self.write_located_in_relationships,
-            self.write_has_feature_relationships,
-            self.write_part_of_relationships,
-            self.write_in_county_relationships,
-            self.write_describes_relationships,
-            self.write_of_type_relationships,
-            self.write_in_price_range_relationships,
-            self.write_in_zip_code_relationships,
-            self.write_neighborhood_in_zip_relationships,
-            self.write_geographic_hierarchy_relationships
-        ]
-        
-        for writer in relationship_writers:
-            result = writer()
+        for result in self._run_writers(self._relationship_writers(), RELATIONSHIP_ENDPOINTS).values():
             if result.records_read > 0:
                 results.append(result)
-                self.logger.info(
-                    f"Wrote {result.relationships_created} {result.relationship_type} relationships "
-                    f"from {result.records_read} records"
-                )
+                self._log_relationship_result(result)
         
         return results
     
+    @log_stage("Neo4j: Write nodes and relationships")
+    def write_graph(self) -> Tuple[List[NodeWriteResult], List[RelationshipWriteResult]]:
+        """Write nodes and relationships as one dependency graph.
+        
+        A relationship type starts as soon as its endpoint labels are
+        written, overlapping with the remaining node labels.
+        
+        Returns:
+            Tuple of (node results, relationship results)
+        """
+        node_writers = self._node_writers()
+        relationship_writers = self._relationship_writers()
+        results = self._run_writers(
+            {**node_writers, **relationship_writers},
+            RELATIONSHIP_ENDPOINTS
+        )
+        
+        node_results = []
+        for name in node_writers:
+            if results[name].records_read > 0:
+                node_results.append(results[name])
+                self._log_node_result(results[name])
+        
+        relationship_results = []
+        for name in relationship_writers:
+            if results[name].records_read > 0:
+                relationship_results.append(results[name])
+                self._log_relationship_result(results[name])
+        
+        return node_results, relationship_results
+    
     @log_stage("Neo4j: Write all data")
     def write_all(self) -> Neo4jWriteMetadata:
         """Write all nodes and relationships to Neo4j.
@@ -1085,23 +1448,31 @@ class Neo4jWriter:
             self.logger.info("Creating constraints...")
             metadata.constraints_created = self.create_constraints()
             
-            # Write all nodes
-            self.logger.info("Writing nodes...")
-            metadata.node_results = self.write_all_nodes()
-            metadata.total_nodes = sum(r.nodes_created for r in metadata.node_results)
+            # Initial load: CREATE would duplicate anything already there
+            if self.config.create_only:
+                self.ensure_empty_database()
+            
+            # Incremental mode: drop deleted nodes and stale relationships
+            metadata.nodes_deleted = self.apply_deletions()
             
-            # Write all relationships
-            self.logger.info("Writing relationships...")
-            metadata.relationship_results = self.write_all_relationships()
+            # Write nodes and relationships (relationships after their endpoints)
+            self.logger.info("Writing nodes and relationships...")
+            metadata.node_results, metadata.relationship_results = self.write_graph()
+            metadata.total_nodes = sum(r.nodes_created for r in metadata.node_results)
             metadata.total_relationships = sum(r.relationships_created for r in metadata.relationship_results)
             
+            # Invalidate query results cached for the previous graph
+            metadata.graph_version = self.bump_graph_version()
+            
             # Set completion time
             metadata.end_time = datetime.now()
             metadata.total_duration_seconds = (metadata.end_time - metadata.start_time).total_seconds()
             
             self.logger.info(
                 f"Neo4j write complete: {metadata.total_nodes} nodes, "
-                f"{metadata.total_relationships} relationships in {metadata.total_duration_seconds:.2f}s"
+                f"{metadata.total_relationships} relationships in {metadata.total_duration_seconds:.2f}s "
+                f"({metadata.records_per_second:,.0f} records/s over {len(metadata.chunk_results)} chunks), "
+                f"graph version {metadata.graph_version}"
             )
             
         except Exception as e:
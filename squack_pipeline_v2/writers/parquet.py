@@ -90,6 +90,7 @@ class ParquetWriter:
         return {
             "table": table_name,
             "records": record_count,
+            "bytes": file_size,
             "size_mb": round(file_size / (1024 * 1024), 2),
             "compression": compression
         }
@@ -164,6 +165,7 @@ class ParquetWriter:
                         results[layer].append({
                             "table": table,
                             "records": record_count,
+                            "bytes": file_size,
                             "size_mb": round(file_size / (1024 * 1024), 2)
                         })
                         